@@ -1,12 +1,60 @@
+import importlib as _importlib
+
 from UPA.consts import *
+from UPA.fields import *
 from UPA.message import *
+from UPA.template import *
+from UPA.capture import *
+from UPA.dispatcher import *
+from UPA.requestpool import *
+from UPA.tracing import *
+from UPA.metrics import *
 from UPA.ufeapi_pb2 import *
 from UPA.ufeedclient import *
-from UPA.ufe_py_fields_fix40 import *
-from UPA.ufe_py_fields_fix41 import *
-from UPA.ufe_py_fields_fix42 import *
-from UPA.ufe_py_fields_fix43 import *
-from UPA.ufe_py_fields_fix44 import *
-from UPA.ufe_py_fields_fix50 import *
-from UPA.ufe_py_fields_fix50sp1 import *
-from UPA.ufe_py_fields_fix50sp2 import *
+from UPA.asyncufeedclient import *
+
+
+class _LazyFields:
+    """FIX variant fields namespace, imports generated fields module on first attribute access
+    and caches accessed attributes so following accesses are plain attribute lookups"""
+    def __init__(self, module: str, name: str):
+        self._module = module
+        self._name = name
+        self._fields = None
+
+    def _load(self) -> FieldDictionary:
+        if self._fields is None:
+            self._fields = getattr(_importlib.import_module(self._module), self._name)
+        return self._fields
+
+    def __getattr__(self, item):
+        if item.startswith("__"):
+            raise AttributeError(item)
+        val = getattr(self._load(), item)
+        self.__dict__[item] = val
+        return val
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __len__(self):
+        return len(self._load())
+
+    def __contains__(self, key):
+        return key in self._load()
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __repr__(self):
+        return f"<{self._name} from {self._module}>"
+
+
+FIX40_Fields = _LazyFields("UPA.ufe_py_fields_fix40", "FIX40_Fields")
+FIX41_Fields = _LazyFields("UPA.ufe_py_fields_fix41", "FIX41_Fields")
+FIX42_Fields = _LazyFields("UPA.ufe_py_fields_fix42", "FIX42_Fields")
+FIX43_Fields = _LazyFields("UPA.ufe_py_fields_fix43", "FIX43_Fields")
+FIX44_Fields = _LazyFields("UPA.ufe_py_fields_fix44", "FIX44_Fields")
+FIX50_Fields = _LazyFields("UPA.ufe_py_fields_fix50", "FIX50_Fields")
+FIX50SP1_Fields = _LazyFields("UPA.ufe_py_fields_fix50sp1", "FIX50SP1_Fields")
+FIX50SP2_Fields = _LazyFields("UPA.ufe_py_fields_fix50sp2", "FIX50SP2_Fields")
@@ -0,0 +1,367 @@
+# --------------------------------------------------------------------------------------------
+#    ____                      __      ____
+#   /\  _`\   __             /'_ `\   /\  _`\
+#   \ \ \L\_\/\_\    __  _  /\ \L\ \  \ \ \L\ \ _ __    ___
+#    \ \  _\/\/\ \  /\ \/'\ \/_> _ <_  \ \ ,__//\`'__\ / __`\
+#     \ \ \/  \ \ \ \/>  </   /\ \L\ \  \ \ \/ \ \ \/ /\ \L\ \
+#      \ \_\   \ \_\ /\_/\_\  \ \____/   \ \_\  \ \_\ \ \____/
+#       \/_/    \/_/ \//\/_/   \/___/     \/_/   \/_/  \/___/
+#
+#                     Universal FIX Engine
+#
+# Copyright (C) 2017-19 Fix8 Market Technologies Pty Ltd (ABN 29 167 027 198)
+# All Rights Reserved. [http://www.fix8mt.com] <heretohelp@fix8mt.com>
+#
+# THIS FILE IS PROPRIETARY AND  CONFIDENTIAL. NO PART OF THIS FILE MAY BE REPRODUCED,  STORED
+# IN A RETRIEVAL SYSTEM,  OR TRANSMITTED, IN ANY FORM OR ANY MEANS,  ELECTRONIC, PHOTOSTATIC,
+# RECORDED OR OTHERWISE, WITHOUT THE PRIOR AND  EXPRESS WRITTEN  PERMISSION  OF  FIX8  MARKET
+# TECHNOLOGIES PTY LTD.
+#
+# --------------------------------------------------------------------------------------------
+import asyncio
+import inspect
+import itertools
+import logging
+from collections import OrderedDict
+from typing import AsyncIterator, Optional, Iterable
+
+import zmq
+import zmq.asyncio
+
+from UPA.consts import *
+from UPA.message import *
+from UPA.ufeedclient import _Session, _unbind
+
+
+class AsyncUFEedClient:
+    """The AsyncUFEedClient object is the asyncio counterpart of UFEedClient. Requests, responses, publishing and
+    subscriptions all run on the caller's event loop, no threads are created.
+
+    Sample:
+        async with AsyncUFEedClient() as uc:
+            rep = await uc.request(login)
+            async for msg in uc.subscribe():
+                ...
+
+    Raises:
+        LookupError: If there is an attempt to make a request before a login session ID has been established
+                     a LookupError will be thrown.
+
+    Returns:
+        AsyncUFEedClient: The AsyncUFEedClient object.
+    """
+
+    # prepares connection strings, sockets and session_id
+    def __init__(self, connection_string_dict=None, request_timeout: Optional[float] = None, echo_seq: bool = False):
+        if connection_string_dict is None:
+            connection_string_dict = {}
+        self.__cs = self.__set_connection_strings(connection_string_dict)
+        self.__pub_topic: bytes = self.__cs[PUBLISHER_TOPIC].encode()
+        self.__context = zmq.asyncio.Context()
+        self.__dealer_socket: Optional[zmq.asyncio.Socket] = None
+        self.__pub_socket: Optional[zmq.asyncio.Socket] = None
+        self.__dealer_task: Optional[asyncio.Task] = None
+        self.__rep_task: Optional[asyncio.Task] = None
+        self.__seq = itertools.count(1)
+        self.__pending: OrderedDict = OrderedDict()  # seq -> (asyncio.Future, Message.Builder) of requests in flight
+        self.__echo_seq = echo_seq  # responder echoes request seq, so requests may be pipelined
+        self.__request_lock: Optional[asyncio.Lock] = None  # keeps one request in flight unless echo_seq
+        self.request_timeout: Optional[float] = request_timeout  # default seconds to wait for a response
+        self.__session = _Session()
+        self.started = False
+        self.req_handlers: List[Callable[[Message], None]] = []
+        self.rep_handlers: List[Callable[[Message], Message]] = []
+
+    def __str__(self):
+        """When cast to a str object, AsyncUFEedClient serialises its connection string details.
+
+        Returns:
+            str: connection strings
+        """
+        return ",".join(("{}={}".format(*i) for i in self.__cs.items()))
+
+    async def __aenter__(self) -> "AsyncUFEedClient":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+
+    # prepares dictionary of connection strings (protected)
+    @staticmethod
+    def __set_connection_strings(d: {str, str}) -> {str, str}:
+        return {key: d.get(key, default) for key, default in (
+            (SUBSCRIBER, SUBSCRIBER_DEFAULT),
+            (REQUESTER, REQUESTER_DEFAULT),
+            (PUBLISHER, PUBLISHER_DEFAULT),
+            (RESPONDER, RESPONDER_DEFAULT),
+            (SUBSCRIBER_TOPIC, SUBSCRIBER_TOPIC_DEFAULT),
+            (REQUESTER_TOPIC, REQUESTER_TOPIC_DEFAULT),
+            (PUBLISHER_TOPIC, PUBLISHER_TOPIC_DEFAULT),
+            (RESPONDER_TOPIC, RESPONDER_TOPIC_DEFAULT))}
+
+    # creates DEALER socket and its reader task, the socket is closed when the task is done (protected)
+    def __start_dealer(self) -> None:
+        sock = self.__context.socket(zmq.DEALER)
+        sock.connect(self.__cs[REQUESTER])
+        self.__dealer_socket = sock
+        self.__dealer_task = asyncio.ensure_future(self.__poll_dealer(sock))
+        self.__dealer_task.add_done_callback(lambda task: self.__on_dealer_done(task, sock))
+
+    # fails requests in flight if the DEALER reader task died, the next request starts a new one (protected)
+    def __on_dealer_done(self, task: asyncio.Task, sock: zmq.asyncio.Socket) -> None:
+        sock.close(linger=0)
+        if task is not self.__dealer_task:  # stopped or reset
+            return
+        error = task.exception() if not task.cancelled() else None
+        logging.error("DEALER requester failed", exc_info=error)
+        self.__dealer_task = self.__dealer_socket = None
+        self.__fail_pending(ConnectionAbortedError(f"DEALER requester failed: {error}"))
+
+    # closes DEALER socket with a timed out or cancelled request in flight and fails the other requests in flight,
+    # their responses are discarded together with the socket (protected)
+    def __reset_dealer(self) -> None:
+        task, self.__dealer_task, self.__dealer_socket = self.__dealer_task, None, None
+        if task is not None:
+            task.cancel()
+        self.__fail_pending(ConnectionResetError("request abandoned by DEALER socket reset after a timeout"))
+
+    # fails all requests in flight with error (protected)
+    def __fail_pending(self, error: Exception) -> None:
+        pending, self.__pending = self.__pending, OrderedDict()
+        for fut, _ in pending.values():
+            if not fut.done():
+                fut.set_exception(error)
+
+    # DEALER socket reader task (protected)
+    async def __poll_dealer(self, sock: zmq.asyncio.Socket) -> None:
+        while True:
+            self.__on_dealer_response((await sock.recv_multipart())[-1])
+
+    # resolves the request a DEALER response belongs to: by seq if echo_seq, otherwise the single request in flight.
+    # Responses that cannot be correlated are logged and discarded, a malformed response fails its request if it is
+    # known (protected)
+    def __on_dealer_response(self, response: bytes) -> None:
+        wm = WireMessage()
+        parse_error: Optional[Exception] = None
+        try:
+            wm.ParseFromString(response)
+        except Exception as e:
+            parse_error = e
+        if self.__echo_seq:
+            seq = wm.seq if parse_error is None else None
+        else:
+            seq = next(iter(self.__pending), None)
+        entry = self.__pending.pop(seq, None)
+        if entry is None:
+            logging.error(f"discarded response matching no outstanding request: seq {wm.seq}, error {parse_error}")
+            return
+        fut, msg = entry
+        if fut.done():
+            return
+        if parse_error is not None:
+            fut.set_exception(parse_error)
+            return
+        try:
+            res = self.__session.process_response(msg, wm, self.req_handlers)
+        except Exception as e:
+            fut.set_exception(e)
+        else:
+            fut.set_result(res)
+
+    # sends request over DEALER socket and waits for its response, a request still in flight when it is cancelled
+    # or timed out resets the DEALER socket (protected)
+    async def __exchange(self, msg: Message.Builder, wms: bytes) -> Message:
+        if self.__dealer_task is None:
+            self.__start_dealer()
+        seq = next(self.__seq) & 0xffffffff or next(self.__seq)  # seq is uint32, 0 means unset
+        fut = asyncio.get_running_loop().create_future()
+        self.__pending[seq] = (fut, msg)
+        try:
+            # appended seq overrides any seq already set in the message
+            await self.__dealer_socket.send_multipart((b"", self.__cs[REQUESTER_TOPIC].encode(), wms + WireMessage(seq=seq).SerializeToString()))
+            return await fut
+        finally:
+            if self.__pending.pop(seq, None) is not None:
+                self.__reset_dealer()
+
+    # serializes requests unless echo_seq, as responses can only be correlated to the single request in flight (protected)
+    async def __request(self, msg: Message.Builder, wms: bytes) -> Message:
+        if self.__echo_seq:
+            return await self.__exchange(msg, wms)
+        async with self.__request_lock:
+            return await self.__exchange(msg, wms)
+
+    # responder task, handlers may be plain functions or coroutine functions. Waits for the previous responder
+    # task to unbind the REP socket (protected)
+    async def __poll_responder(self, previous: Optional[asyncio.Task]) -> None:
+        if previous is not None:
+            await asyncio.wait((previous,))
+        rep_socket = self.__context.socket(zmq.REP)
+        rep_socket.bind(self.__cs[RESPONDER])
+        try:
+            while True:
+                msg = await rep_socket.recv_multipart()
+                if msg[0].decode('utf-8') != self.__cs[RESPONDER_TOPIC]:
+                    await rep_socket.send_multipart(("".encode(), "TOPIC UNKNOWN".encode()))
+                    continue
+                wm = WireMessage()
+                wm.ParseFromString(msg[1])
+                msg2: Optional[Message] = None
+                for f in self.rep_handlers:
+                    msg2 = f(self.create_message(wm).build())
+                    if inspect.isawaitable(msg2):
+                        msg2 = await msg2
+                await rep_socket.send_multipart((self.__cs[RESPONDER_TOPIC].encode(), msg2.wire_message.SerializeToString()))
+        finally:
+            # waits on a monitor socket, off the event loop
+            shadow = zmq.Socket(zmq.Context.shadow(self.__context), shadow=rep_socket.underlying)
+            await asyncio.get_running_loop().run_in_executor(None, _unbind, shadow)
+            rep_socket.close(linger=0)
+
+    def create_message(self, wm: WireMessage = None) -> Message.Builder:
+        """Factory function to create a SysMessage or FIXMessage.
+
+        Args:
+            wm (WireMessage, optional): optional WireMessage object to create a Message.Builder from
+
+        Returns:
+            Message.Builder: message builder to build the message
+        """
+        return Message.Builder(wm)
+
+    async def publish(self, msg: Message.Builder) -> None:
+        """Publishes Messages to UFEedClient subscribers.
+
+        Args:
+            msg (Message.Builder): Message to be published.
+        """
+        await self.__pub_socket.send_multipart((self.__pub_topic, msg.serialize()))
+
+    async def publish_many(self, msgs: Iterable[Message.Builder]) -> int:
+        """Publishes a batch of Messages to UFEedClient subscribers.
+
+        Args:
+            msgs (Iterable[Message.Builder]): Messages to be published.
+
+        Returns:
+            int: number of published messages
+        """
+        frames = [msg.serialize() for msg in msgs]
+        for wms in frames:
+            await self.__pub_socket.send_multipart((self.__pub_topic, wms), copy=False)
+        return len(frames)
+
+    async def request(self, msg: Message.Builder, timeout: Optional[float] = None) -> Message:
+        """Sends a request to the UFEGW and waits for the response. Requests are stamped with a unique WireMessage
+        seq. If the client was created with echo_seq=True, any number of requests may be in flight at once and
+        responses are correlated by seq. Otherwise concurrently awaited requests are sent one at a time, as the UFEGW
+        does not echo seq, and each response belongs to the single request in flight.
+
+        Args:
+            msg (Message.Builder): Message to be sent via request.
+            timeout (float, optional): seconds from the call to wait for the response, defaults to request_timeout.
+                                       A timed out or cancelled request in flight resets the DEALER socket, other
+                                       requests in flight then fail with ConnectionResetError.
+
+        Raises:
+            ConnectionError: If the client is not started.
+            LookupError: If there is an attempt to make a request before a login session ID has been established
+                         a LookupError will be thrown.
+            asyncio.TimeoutError: If there is no response within timeout.
+
+        Returns:
+            Message: Message received via response.
+        """
+        if not self.started:
+            raise ConnectionError("AsyncUFEedClient is not started")
+        wms = self.__session.prepare_request(msg)
+        timeout = self.request_timeout if timeout is None else timeout
+        return await (self.__request(msg, wms) if timeout is None else asyncio.wait_for(self.__request(msg, wms), timeout))
+
+    async def subscribe(self, name=None, long_name=None, service_id=None, sub_service_id=None,
+                        msg_type=None) -> AsyncIterator[Message]:
+        """Subscribes to UFEGW broadcasts. Every call opens its own SUB socket, so each iterator receives all
+        broadcasts; the socket is closed when the iteration stops. Optional filters are checked against the
+        broadcast header before it is parsed.
+
+        Args:
+            name (str or collection of str, optional): accepted message names
+            long_name (str or collection of str, optional): accepted message long names
+            service_id (int or collection of int, optional): accepted service ids
+            sub_service_id (int or collection of int, optional): accepted subservice ids
+            msg_type (int or collection of int, optional): accepted MsgType values
+
+        Returns:
+            AsyncIterator[Message]: broadcast Messages
+        """
+        flt = WireHeader.Filter(name, long_name, service_id, sub_service_id, msg_type)
+        sub_socket = self.__context.socket(zmq.SUB)
+        sub_socket.setsockopt(zmq.SUBSCRIBE, self.__cs[SUBSCRIBER_TOPIC].encode())
+        sub_socket.connect(self.__cs[SUBSCRIBER])
+        try:
+            while True:
+                frames = await sub_socket.recv_multipart()
+                if flt and not flt.matches(WireHeader.parse(frames[1])):
+                    continue
+                wm = WireMessage()
+                wm.ParseFromString(frames[1])
+                yield self.create_message(wm).build()
+        finally:
+            sub_socket.close(linger=0)
+
+    async def start(self, rep_func=None) -> None:
+        """The start() coroutine must be awaited in order for the AsyncUFEedClient to begin interaction with the UFEGW.
+
+        Args:
+            rep_func (def()): The response Message handling function or coroutine function. Defaults to None.
+        """
+        if self.__context.closed:  # terminated by stop()
+            self.__context = zmq.asyncio.Context()
+        self.__request_lock = asyncio.Lock()
+        self.__start_dealer()  # start REQ
+        self.__pub_socket = self.__context.socket(zmq.PUB)
+        self.__pub_socket.bind(self.__cs[PUBLISHER])  # start PUB
+        self.started = True
+        if rep_func is not None:
+            self.add_rep_handler(rep_func)
+
+    async def stop(self, do_not_send_logout=False) -> None:
+        """ Stops AsyncUFEedClient and cleans up taken resources: sockets, tasks, etc. Terminates the ZMQ context,
+        subscribe() iterators still running are cancelled """
+        if not self.started:
+            return
+        if not do_not_send_logout and self.__session.id:
+            await self.request(self.create_message()
+                               .set_long_name("logout")
+                               .set_type(MsgType.st_system)
+                               .set_service_id(UFE_CMD_LOGOUT)
+                               .add_field(UFE_CMD, Message.Status(UFE_CMD_LOGOUT)))
+        tasks = [task for task in (self.__rep_task, self.__dealer_task) if task is not None]
+        self.__rep_task = self.__dealer_task = self.__dealer_socket = None
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks)
+        self.__pub_socket.close(linger=0)
+        self.__pub_socket = None
+        self.__fail_pending(ConnectionAbortedError("AsyncUFEedClient stopped before response was received"))
+        self.__session.set_id(None)
+        self.__context.destroy(linger=0)
+        self.started = False
+
+    def add_req_handler(self, req_func: Callable[[Message], None]):
+        self.req_handlers.append(req_func)
+
+    def remove_req_handler(self, req_func: Callable[[Message], None]):
+        self.req_handlers.remove(req_func)
+
+    def add_rep_handler(self, rep_func: Callable[[Message], Message]):
+        self.rep_handlers.append(rep_func)
+        if len(self.rep_handlers) == 1:
+            self.__rep_task = asyncio.ensure_future(self.__poll_responder(self.__rep_task))  # REP on the event loop
+
+    def remove_rep_handler(self, rep_func: Callable[[Message], Message]):
+        self.rep_handlers.remove(rep_func)
+        if len(self.rep_handlers) == 0 and self.__rep_task is not None:
+            self.__rep_task.cancel()  # awaited by the next responder task or stop()
@@ -0,0 +1,242 @@
+# --------------------------------------------------------------------------------------------
+#    ____                      __      ____
+#   /\  _`\   __             /'_ `\   /\  _`\
+#   \ \ \L\_\/\_\    __  _  /\ \L\ \  \ \ \L\ \ _ __    ___
+#    \ \  _\/\/\ \  /\ \/'\ \/_> _ <_  \ \ ,__//\`'__\ / __`\
+#     \ \ \/  \ \ \ \/>  </   /\ \L\ \  \ \ \/ \ \ \/ /\ \L\ \
+#      \ \_\   \ \_\ /\_/\_\  \ \____/   \ \_\  \ \_\ \ \____/
+#       \/_/    \/_/ \//\/_/   \/___/     \/_/   \/_/  \/___/
+#
+#                     Universal FIX Engine
+#
+# Copyright (C) 2017-19 Fix8 Market Technologies Pty Ltd (ABN 29 167 027 198)
+# All Rights Reserved. [http://www.fix8mt.com] <heretohelp@fix8mt.com>
+#
+# THIS FILE IS PROPRIETARY AND  CONFIDENTIAL. NO PART OF THIS FILE MAY BE REPRODUCED,  STORED
+# IN A RETRIEVAL SYSTEM,  OR TRANSMITTED, IN ANY FORM OR ANY MEANS,  ELECTRONIC, PHOTOSTATIC,
+# RECORDED OR OTHERWISE, WITHOUT THE PRIOR AND  EXPRESS WRITTEN  PERMISSION  OF  FIX8  MARKET
+# TECHNOLOGIES PTY LTD.
+#
+# --------------------------------------------------------------------------------------------
+import glob
+import mmap
+import os
+import struct
+import time
+from typing import Callable, Iterator, List, Optional, Tuple
+
+import zmq
+
+from UPA.consts import SUBSCRIBER_TOPIC_DEFAULT
+
+_RECORD = struct.Struct("<qI")  # receive timestamp ns, frame length
+_TIMESTAMP = struct.Struct("<q")  # record timestamp, written last
+_LENGTH = struct.Struct("<I")  # record frame length
+_INDEX = struct.Struct("<qII")  # receive timestamp ns, segment number, record offset
+_SEGMENT = "capture-{:06d}.seg"
+_INDEX_FILE = "capture.idx"
+
+
+class CaptureWriter:
+    """
+    Appends raw broadcast frames with nanosecond receive timestamps to memory mapped segment files in a capture
+    directory, plus an index of (timestamp, segment, offset) entries for seeking by time. Segments are
+    preallocated to segment_size and trimmed to their used size when complete, a zero timestamp marks the end
+    of a segment still being written. An existing capture is appended to with new segments.
+    Sample:
+        uc.start_capture("captures/today")
+        ...
+        uc.stop_capture()
+    """
+
+    def __init__(self, path: str, segment_size: int = 64 << 20):
+        """ Creates writer
+            Args:
+                path (str): capture directory, created if missing
+                segment_size (int): preallocated segment size in bytes
+        """
+        os.makedirs(path, exist_ok=True)
+        self._path = path
+        self._segment_size = segment_size
+        self._segment = len(glob.glob(os.path.join(path, "capture-*.seg"))) - 1
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._offset = 0
+        self._index = open(os.path.join(path, _INDEX_FILE), "ab")
+        self.records = 0
+        self.bytes = 0
+
+    def _next_segment(self, size: int) -> None:
+        self._close_segment()
+        self._segment += 1
+        self._file = open(os.path.join(self._path, _SEGMENT.format(self._segment)), "w+b")
+        self._file.truncate(size)
+        self._mmap = mmap.mmap(self._file.fileno(), size)
+        self._offset = 0
+
+    def _close_segment(self) -> None:
+        if self._mmap is not None:
+            self._mmap.flush()
+            self._mmap.close()
+            self._file.truncate(self._offset)
+            self._file.close()
+            self._mmap = self._file = None
+
+    def append(self, data: bytes, timestamp_ns: Optional[int] = None) -> None:
+        """ Appends frame
+            Args:
+                data (bytes): serialized WireMessage
+                timestamp_ns (int, optional): receive time in ns since epoch, defaults to now
+        """
+        if self._index is None:
+            raise ValueError("capture is closed")
+        ts = time.time_ns() if timestamp_ns is None else timestamp_ns
+        if ts <= 0:
+            raise ValueError(f"invalid timestamp {ts}")  # zero marks the end of a segment
+        end = self._offset + _RECORD.size + len(data)
+        if self._mmap is None or end > len(self._mmap):
+            self._next_segment(max(self._segment_size, _RECORD.size + len(data)))
+            end = _RECORD.size + len(data)
+        # frame and length are written before the timestamp, so a reader of the segment being written
+        # stops at the zero timestamp until the record is complete
+        self._mmap[self._offset + _RECORD.size:end] = data
+        _LENGTH.pack_into(self._mmap, self._offset + _TIMESTAMP.size, len(data))
+        _TIMESTAMP.pack_into(self._mmap, self._offset, ts)
+        self._index.write(_INDEX.pack(ts, self._segment, self._offset))
+        self._offset = end
+        self.records += 1
+        self.bytes += len(data)
+
+    def flush(self) -> None:
+        """ Flushes current segment and index to disk """
+        if self._mmap is not None:
+            self._mmap.flush()
+        if self._index is not None:
+            self._index.flush()
+
+    def close(self) -> None:
+        """ Completes current segment and closes capture """
+        self._close_segment()
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class CaptureReader:
+    """
+    Reads a capture written by CaptureWriter and replays it to a callable, e.g. UFEedClient subscriber handlers
+    (see UFEedClient.replay_capture), or a local PUB socket, at recorded speed or as fast as possible.
+    Sample:
+        reader = CaptureReader("captures/today")
+        reader.publish("tcp://*:55745", speed=1.0)  # UFEedClients subscribe to it as to the UFEGW
+    """
+
+    def __init__(self, path: str):
+        """ Opens capture
+            Args:
+                path (str): capture directory
+        """
+        if not os.path.isdir(path):
+            raise FileNotFoundError(f"no capture in {path}")
+        self._path = path
+        index_path = os.path.join(path, _INDEX_FILE)
+        self._index_size = os.path.getsize(index_path) // _INDEX.size if os.path.isfile(index_path) else 0
+        self._index_path = index_path
+
+    def __len__(self) -> int:
+        """ Returns: number of indexed records """
+        return self._index_size
+
+    # returns (segment, offset) of the first record received at or after start_ns (protected)
+    def _seek(self, start_ns: int) -> Tuple[int, int]:
+        with open(self._index_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as index:
+            lo, hi = 0, len(index) // _INDEX.size
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if _INDEX.unpack_from(index, mid * _INDEX.size)[0] < start_ns:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            if lo == len(index) // _INDEX.size:
+                return 1 << 32, 0  # past the last record
+            _, segment, offset = _INDEX.unpack_from(index, lo * _INDEX.size)
+            return segment, offset
+
+    def records(self, start_ns: Optional[int] = None, end_ns: Optional[int] = None) -> Iterator[Tuple[int, bytes]]:
+        """ Iterates records in capture order
+            Args:
+                start_ns (int, optional): skip records received before, found via the index
+                end_ns (int, optional): stop at records received after
+            Returns:
+                Iterator[Tuple[int, bytes]]: (receive timestamp ns, serialized WireMessage)
+        """
+        first_segment, offset = (0, 0) if start_ns is None or not self._index_size else self._seek(start_ns)
+        for name in sorted(glob.glob(os.path.join(self._path, "capture-*.seg"))):
+            segment = int(os.path.basename(name)[8:-4])
+            if segment < first_segment or not os.path.getsize(name):
+                continue
+            pos = offset if segment == first_segment else 0
+            with open(name, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                while pos + _RECORD.size <= len(mm):
+                    ts, size = _RECORD.unpack_from(mm, pos)
+                    if ts == 0:
+                        break  # preallocated space of a segment being written
+                    if end_ns is not None and ts > end_ns:
+                        return
+                    pos += _RECORD.size
+                    yield ts, mm[pos:pos + size]
+                    pos += size
+
+    def replay(self, target: Callable[[bytes], None], speed: Optional[float] = None, start_ns: Optional[int] = None,
+               end_ns: Optional[int] = None) -> int:
+        """ Replays records to target on the calling thread
+            Args:
+                target (Callable[[bytes], None]): called with every serialized WireMessage
+                speed (float, optional): 1.0 keeps recorded gaps, 2.0 replays twice as fast, None as fast as possible
+                start_ns (int, optional): skip records received before
+                end_ns (int, optional): stop at records received after
+            Returns:
+                int: number of replayed records
+        """
+        count = 0
+        first_ts = start = 0
+        for ts, data in self.records(start_ns, end_ns):
+            if speed:
+                if not count:
+                    first_ts, start = ts, time.perf_counter_ns()
+                else:
+                    delay = (ts - first_ts) / speed - (time.perf_counter_ns() - start)
+                    if delay > 0:
+                        time.sleep(delay / 1e9)
+            target(data)
+            count += 1
+        return count
+
+    def publish(self, endpoint: str, topic: bytes = SUBSCRIBER_TOPIC_DEFAULT.encode(), speed: Optional[float] = None,
+                start_ns: Optional[int] = None, end_ns: Optional[int] = None, settle: float = 0.5) -> int:
+        """ Replays records through a PUB socket bound to endpoint, as the UFEGW publishes them
+            Args:
+                endpoint (str): endpoint to bind
+                topic (bytes): topic frame, subscribers' SUBSCRIBER_TOPIC
+                speed (float, optional): 1.0 keeps recorded gaps, None as fast as possible
+                start_ns (int, optional): skip records received before
+                end_ns (int, optional): stop at records received after
+                settle (float): seconds to wait for subscribers to connect before publishing
+            Returns:
+                int: number of published records
+        """
+        context = zmq.Context.instance()
+        pub_socket = context.socket(zmq.PUB)
+        pub_socket.set_hwm(0)
+        pub_socket.bind(endpoint)
+        try:
+            time.sleep(settle)
+            return self.replay(lambda data: pub_socket.send_multipart((topic, data), copy=False), speed, start_ns, end_ns)
+        finally:
+            pub_socket.close(linger=-1)
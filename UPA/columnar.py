@@ -0,0 +1,244 @@
+# --------------------------------------------------------------------------------------------
+#    ____                      __      ____
+#   /\  _`\   __             /'_ `\   /\  _`\
+#   \ \ \L\_\/\_\    __  _  /\ \L\ \  \ \ \L\ \ _ __    ___
+#    \ \  _\/\/\ \  /\ \/'\ \/_> _ <_  \ \ ,__//\`'__\ / __`\
+#     \ \ \/  \ \ \ \/>  </   /\ \L\ \  \ \ \/ \ \ \/ /\ \L\ \
+#      \ \_\   \ \_\ /\_/\_\  \ \____/   \ \_\  \ \_\ \ \____/
+#       \/_/    \/_/ \//\/_/   \/___/     \/_/   \/_/  \/___/
+#
+#                     Universal FIX Engine
+#
+# Copyright (C) 2017-19 Fix8 Market Technologies Pty Ltd (ABN 29 167 027 198)
+# All Rights Reserved. [http://www.fix8mt.com] <heretohelp@fix8mt.com>
+#
+# THIS FILE IS PROPRIETARY AND  CONFIDENTIAL. NO PART OF THIS FILE MAY BE REPRODUCED,  STORED
+# IN A RETRIEVAL SYSTEM,  OR TRANSMITTED, IN ANY FORM OR ANY MEANS,  ELECTRONIC, PHOTOSTATIC,
+# RECORDED OR OTHERWISE, WITHOUT THE PRIOR AND  EXPRESS WRITTEN  PERMISSION  OF  FIX8  MARKET
+# TECHNOLOGIES PTY LTD.
+#
+# --------------------------------------------------------------------------------------------
+import struct
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from UPA.message import *
+from UPA.message import _read_varint
+
+_unpack_double = struct.Struct("<d").unpack_from
+
+
+# converts double to int64 column value, truncating towards zero (protected)
+def _double_to_int(fval: float) -> int:
+    val = int(fval)  # raises for nan and inf
+    if not -(1 << 63) <= val < (1 << 63):
+        raise OverflowError(f"{fval} out of int64 range")
+    return val
+
+
+class BatchDecoder:
+    """
+    Decodes batches of serialized WireMessages straight into typed NumPy columns, one column per schema field,
+    without building Message objects. Each message is scanned once for all schema tags, so the cost does not
+    grow with a field_value() call per tag. Only top level fields are decoded, groups are skipped, the first
+    field with a tag wins. Absent fields, and fields whose type does not fit the column kind (e.g. a string field
+    in a FLOAT64 column), are marked invalid in Batch.valid.
+    Sample:
+        decoder = BatchDecoder([BatchDecoder.Column(fix50.Symbol.tag, BatchDecoder.STRING, "symbol"),
+                                BatchDecoder.Column(fix50.LastPx.tag, BatchDecoder.FLOAT64, "px"),
+                                BatchDecoder.Column(fix50.LastQty.tag, BatchDecoder.FLOAT64, "qty"),
+                                BatchDecoder.Column(fix50.TransactTime.tag, BatchDecoder.DATETIME, "time")],
+                               header=("seq",), filter=WireHeader.Filter(long_name="ExecutionReport"))
+        batch = decoder.decode(frames)
+        vwap = (batch["px"] * batch["qty"]).sum() / batch["qty"].sum()
+        table = batch.to_arrow()
+    """
+    # column kinds and their dtypes
+    INT64 = "int64"
+    FLOAT64 = "float64"
+    BOOL = "bool"
+    STRING = "str"
+    BYTES = "bytes"
+    DATETIME = "datetime64[ns]"
+    KINDS = {INT64: np.int64, FLOAT64: np.float64, BOOL: np.bool_, STRING: object, BYTES: object,
+             DATETIME: "datetime64[ns]"}
+    # values of absent fields
+    _MISSING = {INT64: 0, FLOAT64: float("nan"), BOOL: False, STRING: None, BYTES: None, DATETIME: np.iinfo(np.int64).min}
+    # field types each column kind accepts and their converters of raw (tag, type, ival, fval, bval, sval) fields
+    _CONVERTERS = {
+        INT64: {FieldType.ft_int: lambda f: f[2], FieldType.ft_status: lambda f: f[2],
+                FieldType.ft_time: lambda f: f[2], FieldType.ft_double: lambda f: _double_to_int(f[3])},
+        FLOAT64: {FieldType.ft_double: lambda f: f[3], FieldType.ft_int: lambda f: float(f[2])},
+        BOOL: {FieldType.ft_bool: lambda f: bool(f[4])},
+        STRING: {FieldType.ft_string: lambda f: f[5].decode("utf-8"), FieldType.ft_char: lambda f: f[5].decode("utf-8")},
+        BYTES: {FieldType.ft_string: lambda f: f[5], FieldType.ft_char: lambda f: f[5], FieldType.ft_uuid: lambda f: f[5]},
+        DATETIME: {FieldType.ft_time: lambda f: f[2]}}
+
+    class Column:
+        """ Schema column: field tag, kind and column name (the tag by default) """
+        def __init__(self, tag: int, kind: str, name: Optional[str] = None):
+            if kind not in BatchDecoder.KINDS:
+                raise ValueError(f"unknown column kind {kind}")
+            self.tag = tag
+            self.kind = kind
+            self.name = str(tag) if name is None else name
+
+    class Batch:
+        """ Decoded batch: columns and validity masks by column name """
+        def __init__(self, columns: Dict[str, np.ndarray], valid: Dict[str, np.ndarray], size: int):
+            self.columns = columns
+            self.valid = valid
+            self._size = size
+
+        def __len__(self):
+            return self._size
+
+        def __getitem__(self, name: str) -> np.ndarray:
+            return self.columns[name]
+
+        def to_arrow(self):
+            """ Converts batch to pyarrow Table, absent fields become nulls. Requires pyarrow
+            Returns:
+                pyarrow.Table: table with batch columns """
+            import pyarrow as pa
+            return pa.table({name: pa.array(col, mask=~self.valid[name]) if name in self.valid else pa.array(col)
+                             for name, col in self.columns.items()})
+
+    HEADER = WireHeader.__slots__
+
+    def __init__(self, columns: Sequence["BatchDecoder.Column"], header: Sequence[str] = (),
+                 filter: Optional[WireHeader.Filter] = None):
+        """ Creates decoder
+        Args:
+            columns (Sequence[BatchDecoder.Column]): field columns to decode
+            header (Sequence[str]): header columns to decode, names from BatchDecoder.HEADER
+            filter (WireHeader.Filter, optional): decode only messages whose header matches """
+        names = [c.name for c in columns] + list(header)
+        if len(set(names)) != len(names):
+            raise ValueError("duplicate column names")
+        for name in header:
+            if name not in BatchDecoder.HEADER:
+                raise ValueError(f"unknown header column {name}")
+        self.columns = tuple(columns)
+        self.header = tuple(header)
+        self.filter = filter if filter else None
+        # tag -> column indices, several columns may decode the same tag as different kinds
+        self._by_tag: Dict[int, List[int]] = {}
+        for i, c in enumerate(self.columns):
+            self._by_tag.setdefault(c.tag, []).append(i)
+
+    def decode(self, frames: Iterable[bytes]) -> "BatchDecoder.Batch":
+        """ Decodes serialized WireMessages, e.g. raw broadcast frames or CaptureReader.records() data
+        Args:
+            frames (Iterable[bytes]): serialized WireMessages
+        Returns:
+            BatchDecoder.Batch: one row per decoded message """
+        ncols = len(self.columns)
+        values: List[list] = [[] for _ in range(ncols)]
+        valid: List[bytearray] = [bytearray() for _ in range(ncols)]
+        headers: List[list] = [[] for _ in self.header]
+        missing = [BatchDecoder._MISSING[c.kind] for c in self.columns]
+        converters = [BatchDecoder._CONVERTERS[c.kind] for c in self.columns]
+        by_tag, flt, header = self._by_tag, self.filter, self.header
+        size = 0
+        for data in frames:
+            if flt is not None or header:
+                hdr = WireHeader.parse(data)
+                if flt is not None and not flt.matches(hdr):
+                    continue
+                for col, name in zip(headers, header):
+                    col.append(getattr(hdr, name))
+            row = [None] * ncols
+            found = 0
+            pos, end = 0, len(data)
+            while pos < end and found < ncols:
+                key, pos = _read_varint(data, pos)
+                wire_type = key & 7
+                if wire_type == 0:
+                    _, pos = _read_varint(data, pos)
+                elif wire_type == 2:
+                    fsize, pos = _read_varint(data, pos)
+                    if key >> 3 == 7:
+                        field = BatchDecoder._scan_field(data, pos, pos + fsize, by_tag)
+                        if field is not None:
+                            for i in by_tag[field[0]]:
+                                if row[i] is None:
+                                    row[i] = field
+                                    found += 1
+                    pos += fsize
+                elif wire_type == 1:
+                    pos += 8
+                elif wire_type == 5:
+                    pos += 4
+                else:
+                    break
+            for i in range(ncols):
+                field = row[i]
+                convert = converters[i].get(field[1]) if field is not None else None
+                if convert is not None:
+                    try:
+                        values[i].append(convert(field))
+                        valid[i].append(1)
+                        continue
+                    except (ValueError, OverflowError):  # invalid utf-8, nan or out of range double
+                        pass
+                values[i].append(missing[i])
+                valid[i].append(0)
+            size += 1
+        columns: Dict[str, np.ndarray] = {}
+        masks: Dict[str, np.ndarray] = {}
+        for c, vals, ok in zip(self.columns, values, valid):
+            if c.kind == BatchDecoder.DATETIME:
+                columns[c.name] = np.array(vals, dtype=np.int64).view("datetime64[ns]")
+            elif c.kind in (BatchDecoder.STRING, BatchDecoder.BYTES):
+                col = np.empty(size, dtype=object)
+                col[:] = vals
+                columns[c.name] = col
+            else:
+                columns[c.name] = np.array(vals, dtype=BatchDecoder.KINDS[c.kind])
+            masks[c.name] = np.frombuffer(bytes(ok), dtype=np.bool_)
+        for name, vals in zip(header, headers):
+            columns[name] = np.array(vals, dtype=object if name in ("name", "long_name") else np.int64)
+        return BatchDecoder.Batch(columns, masks, size)
+
+    # decodes serialized UFEField at data[pos:end] into (tag, type, ival, fval, bval, sval) if its tag is wanted,
+    # None otherwise or if it is a group (protected)
+    @staticmethod
+    def _scan_field(data: bytes, pos: int, end: int, wanted: dict) -> Optional[tuple]:
+        ftype = tag = ival = bval = 0
+        fval = 0.
+        sval = b""
+        while pos < end:
+            key, pos = _read_varint(data, pos)
+            field_no, wire_type = key >> 3, key & 7
+            if wire_type == 0:
+                val, pos = _read_varint(data, pos)
+                # protobuf serializers write fields in field number order, type(2) and tag(3) precede values(4-8)
+                if field_no == 2:
+                    ftype = val
+                elif field_no == 3:
+                    if val not in wanted:
+                        return None
+                    tag = val
+                elif field_no == 4:
+                    ival = val - (1 << 64) if val >= (1 << 63) else val
+                elif field_no == 6:
+                    bval = val
+            elif wire_type == 1:
+                if field_no == 5:
+                    fval = _unpack_double(data, pos)[0]
+                pos += 8
+            elif wire_type == 2:
+                size, pos = _read_varint(data, pos)
+                if field_no == 7:
+                    sval = data[pos:pos + size]
+                elif field_no == 8:
+                    return None
+                pos += size
+            elif wire_type == 5:
+                pos += 4
+            else:
+                break
+        # proto3 omits default values, including tag 0 of fields nobody asks for
+        return (tag, ftype, ival, fval, bval, sval) if tag in wanted else None
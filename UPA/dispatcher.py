@@ -0,0 +1,367 @@
+# --------------------------------------------------------------------------------------------
+#    ____                      __      ____
+#   /\  _`\   __             /'_ `\   /\  _`\
+#   \ \ \L\_\/\_\    __  _  /\ \L\ \  \ \ \L\ \ _ __    ___
+#    \ \  _\/\/\ \  /\ \/'\ \/_> _ <_  \ \ ,__//\`'__\ / __`\
+#     \ \ \/  \ \ \ \/>  </   /\ \L\ \  \ \ \/ \ \ \/ /\ \L\ \
+#      \ \_\   \ \_\ /\_/\_\  \ \____/   \ \_\  \ \_\ \ \____/
+#       \/_/    \/_/ \//\/_/   \/___/     \/_/   \/_/  \/___/
+#
+#                     Universal FIX Engine
+#
+# Copyright (C) 2017-19 Fix8 Market Technologies Pty Ltd (ABN 29 167 027 198)
+# All Rights Reserved. [http://www.fix8mt.com] <heretohelp@fix8mt.com>
+#
+# THIS FILE IS PROPRIETARY AND  CONFIDENTIAL. NO PART OF THIS FILE MAY BE REPRODUCED,  STORED
+# IN A RETRIEVAL SYSTEM,  OR TRANSMITTED, IN ANY FORM OR ANY MEANS,  ELECTRONIC, PHOTOSTATIC,
+# RECORDED OR OTHERWISE, WITHOUT THE PRIOR AND  EXPRESS WRITTEN  PERMISSION  OF  FIX8  MARKET
+# TECHNOLOGIES PTY LTD.
+#
+# --------------------------------------------------------------------------------------------
+import logging
+import multiprocessing
+import os
+import pickle
+import queue
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, Future
+from typing import Callable, Dict, Hashable, List, Optional, Sequence
+
+import zmq
+from zmq.utils.monitor import recv_monitor_message
+
+from UPA.message import Message, WireHeader
+from UPA.ufeapi_pb2 import WireMessage
+
+
+# runs subscriber handlers in a worker process (protected)
+def _process_dispatch(handlers: Sequence[Callable[[Message], None]], wms: bytes) -> None:
+    wm = WireMessage()
+    wm.ParseFromString(wms)
+    for f in handlers:
+        f(Message(wm))
+
+
+class SubscriberDispatcher:
+    """
+    Dispatches subscriber messages to a pool of worker lanes so that slow handlers do not stall the subscriber socket.
+    Messages are assigned to lanes by key, every lane runs its messages in order, so ordering is preserved per key
+    while independent keys are spread across workers. Each lane has a bounded queue: when it is full the subscriber
+    thread either waits (block=True) or drops the message (block=False), both are reported by stats().
+    Sample:
+        uc.set_sub_dispatcher(SubscriberDispatcher(workers=4, key=SubscriberDispatcher.by_tag(COMMON_CLORDID)))
+    """
+
+    @staticmethod
+    def by_service_id(msg: Message) -> Hashable:
+        """ Key function: orders messages per service id """
+        return msg.service_id
+
+    @staticmethod
+    def by_tag(tag: int) -> Callable[[Message], Hashable]:
+        """ Key function factory: orders messages per value of the given tag, e.g. ClOrdID """
+        return lambda msg: msg[tag]
+
+    class _ThreadLane:
+        """ Worker thread with bounded queue """
+        def __init__(self, dispatcher: "SubscriberDispatcher", queue_size: int):
+            self._dispatcher = dispatcher
+            self._queue: queue.Queue = queue.Queue(queue_size)
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+        def _run(self) -> None:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                handlers, wm = item
+                for f in handlers:
+                    try:
+                        f(Message(wm))
+                    except Exception as e:
+                        self._dispatcher._on_error(e)
+
+        def submit(self, handlers: Sequence[Callable[[Message], None]], wm: WireMessage, block: bool) -> bool:
+            try:
+                self._queue.put((handlers, wm), block)
+                return True
+            except queue.Full:
+                return False
+
+        @property
+        def depth(self) -> int:
+            return self._queue.qsize()
+
+        def shutdown(self) -> None:
+            self._queue.put(None)
+            self._thread.join()
+
+    class _ProcessLane:
+        """ Single worker process with bounded number of outstanding messages, handlers must be picklable """
+        def __init__(self, dispatcher: "SubscriberDispatcher", queue_size: int):
+            self._dispatcher = dispatcher
+            self._executor = ProcessPoolExecutor(max_workers=1)
+            self._slots = threading.BoundedSemaphore(queue_size)
+            self._queue_size = queue_size
+            self._depth = 0
+            self._lock = threading.Lock()
+
+        def _done(self, fut: Future) -> None:
+            with self._lock:
+                self._depth -= 1
+            self._slots.release()
+            if fut.exception() is not None:
+                self._dispatcher._on_error(fut.exception())
+
+        def submit(self, handlers: Sequence[Callable[[Message], None]], wm: WireMessage, block: bool) -> bool:
+            if not self._slots.acquire(block):
+                return False
+            with self._lock:
+                self._depth += 1
+            self._executor.submit(_process_dispatch, tuple(handlers), wm.SerializeToString()).add_done_callback(self._done)
+            return True
+
+        @property
+        def depth(self) -> int:
+            return self._depth
+
+        def shutdown(self) -> None:
+            self._executor.shutdown(wait=True)
+
+    def __init__(self, workers: int = 4, key: Callable[[Message], Hashable] = None, queue_size: int = 10000,
+                 block: bool = True, processes: bool = False):
+        """Creates dispatcher and starts its workers
+        Args:
+            workers (int): number of worker lanes
+            key (Callable[[Message], Hashable], optional): ordering key function, defaults to by_service_id
+            queue_size (int): maximum number of queued messages per lane
+            block (bool): wait for a free queue slot if True, otherwise drop the message
+            processes (bool): run handlers in worker processes instead of threads """
+        self._key: Callable[[Message], Hashable] = key if key is not None else SubscriberDispatcher.by_service_id
+        self._block: bool = block
+        lane = SubscriberDispatcher._ProcessLane if processes else SubscriberDispatcher._ThreadLane
+        self._lanes: List = [lane(self, queue_size) for _ in range(workers)]
+        self._lock = threading.Lock()
+        self._dispatched: int = 0
+        self._dropped: int = 0
+        self._blocked: int = 0
+        self._blocked_ns: int = 0
+        self._errors: int = 0
+        self._max_depth: int = 0
+
+    def _on_error(self, e: BaseException) -> None:
+        logging.error("subscriber handler failed", exc_info=e)
+        with self._lock:
+            self._errors += 1
+
+    def dispatch(self, handlers: Sequence[Callable[[Message], None]], wm: WireMessage) -> bool:
+        """Queues message to the lane selected by its key
+        Args:
+            handlers (Sequence[Callable[[Message], None]]): subscriber handlers to call
+            wm (WireMessage): received message
+        Returns:
+            True if queued, False if dropped """
+        lane = self._lanes[hash(self._key(Message(wm))) % len(self._lanes)]
+        queued = lane.submit(handlers, wm, False)
+        if not queued and self._block:
+            start = time.perf_counter_ns()
+            queued = lane.submit(handlers, wm, True)
+            self._blocked += 1
+            self._blocked_ns += time.perf_counter_ns() - start
+        if queued:
+            self._dispatched += 1
+            depth = lane.depth
+            if depth > self._max_depth:
+                self._max_depth = depth
+        else:
+            self._dropped += 1
+        return queued
+
+    def stats(self) -> dict:
+        """ Returns: dispatch and backpressure counters, current queue depth per lane """
+        return {"dispatched": self._dispatched,
+                "dropped": self._dropped,
+                "blocked": self._blocked,
+                "blocked_time_ns": self._blocked_ns,
+                "errors": self._errors,
+                "max_queue_depth": self._max_depth,
+                "queue_depth": [lane.depth for lane in self._lanes]}
+
+    def shutdown(self) -> None:
+        """ Waits for queued messages to be handled and stops workers """
+        for lane in self._lanes:
+            lane.shutdown()
+
+
+# receives raw broadcasts from a ShardedDispatcher and runs subscriber handlers in a worker process. Frames are
+# [b"H", pickled handlers], [b"M", handler indices, serialized WireMessage] or [b"S"] to stop (protected)
+def _shard_worker(endpoint: str) -> None:
+    context = zmq.Context()
+    pull_socket = context.socket(zmq.PULL)
+    pull_socket.connect(endpoint)
+    handlers: Sequence[Callable[[Message], None]] = ()
+    while True:
+        frames = pull_socket.recv_multipart()
+        if frames[0] == b"S":
+            break
+        if frames[0] == b"H":
+            handlers = pickle.loads(frames[1])
+            continue
+        wm = WireMessage()
+        wm.ParseFromString(frames[2])
+        for i in frames[1]:
+            try:
+                handlers[i](Message(wm))
+            except Exception as e:
+                logging.error("subscriber handler failed", exc_info=e)
+    pull_socket.close(linger=0)
+    context.term()
+
+
+class ShardedDispatcher:
+    """
+    Forwards raw broadcasts to worker processes, so that parsing, remapping and handlers of CPU heavy subscribers
+    scale across cores instead of sharing the GIL with the subscriber thread. The subscriber thread only extracts
+    the shard key from the serialized message (see WireHeader.field_value) and pushes the frame to the worker
+    process owning the key over ipc (or loopback tcp), so ordering is preserved per key. Workers run the
+    subscriber handlers of the client, which must be picklable (e.g. module level functions), and log their
+    failures. When a worker queue reaches queue_size the subscriber thread either waits (block=True) or drops the
+    message (block=False), both are reported by stats().
+    Sample:
+        uc.set_sub_dispatcher(ShardedDispatcher(workers=4, key=ShardedDispatcher.by_tag(COMMON_SYMBOL)))
+    """
+
+    @staticmethod
+    def by_service_id(data: bytes) -> Hashable:
+        """ Key function: shards messages per service id """
+        return WireHeader.parse(data).service_id
+
+    @staticmethod
+    def by_tag(tag: int) -> Callable[[bytes], Hashable]:
+        """ Key function factory: shards messages per value of the given tag, e.g. Symbol or ClOrdID """
+        return lambda data: WireHeader.field_value(data, tag)
+
+    def __init__(self, workers: int = 4, key: Callable[[bytes], Hashable] = None, queue_size: int = 10000,
+                 block: bool = True, transport: str = "ipc", start_timeout: float = 30.):
+        """Creates dispatcher, starts worker processes and waits for them to connect
+        Args:
+            workers (int): number of worker processes
+            key (Callable[[bytes], Hashable], optional): shard key of serialized WireMessage, defaults to by_service_id
+            queue_size (int): high-water mark of queued messages per worker
+            block (bool): wait for a free queue slot if True, otherwise drop the message
+            transport (str): "ipc" or "tcp" (loopback, e.g. where ipc is not available)
+            start_timeout (float): seconds to wait for workers to connect
+        Raises:
+            TimeoutError: if workers do not connect within start_timeout """
+        if workers <= 0:
+            raise ValueError(f"invalid number of workers {workers}")
+        self._key: Callable[[bytes], Hashable] = key if key is not None else ShardedDispatcher.by_service_id
+        self._block: bool = block
+        self._context = zmq.Context()
+        self._sockets: List[zmq.Socket] = []
+        self._processes: List[multiprocessing.Process] = []
+        self._ipc_paths: List[str] = []
+        self._handlers: List[Callable[[Message], None]] = []
+        self._index: Dict[Callable[[Message], None], Optional[int]] = {}  # None marks unpicklable handlers
+        self._dispatched: int = 0
+        self._dropped: int = 0
+        self._blocked: int = 0
+        self._blocked_ns: int = 0
+        self._errors: int = 0
+        # spawned workers do not inherit zmq contexts and sockets of this process
+        mp = multiprocessing.get_context("spawn")
+        try:
+            for i in range(workers):
+                sock = self._context.socket(zmq.PUSH)
+                sock.set_hwm(queue_size)
+                if transport == "ipc":
+                    path = os.path.join(tempfile.gettempdir(), f"ufeedclient-shard-{os.getpid()}-{id(self)}-{i}")
+                    sock.bind(f"ipc://{path}")
+                    self._ipc_paths.append(path)
+                elif transport == "tcp":
+                    sock.bind_to_random_port("tcp://127.0.0.1")
+                else:
+                    raise ValueError(f"invalid transport {transport}")
+                self._sockets.append(sock)
+                monitor = sock.get_monitor_socket(zmq.EVENT_HANDSHAKE_SUCCEEDED)
+                process = mp.Process(target=_shard_worker, args=(sock.get(zmq.LAST_ENDPOINT).decode(),), daemon=True)
+                process.start()
+                self._processes.append(process)
+                try:
+                    if not monitor.poll(int(start_timeout * 1000)):
+                        raise TimeoutError(f"shard worker {i} did not connect within {start_timeout}s")
+                    recv_monitor_message(monitor)
+                finally:
+                    sock.disable_monitor()
+                    monitor.close(linger=0)
+        except BaseException:
+            self.shutdown()
+            raise
+
+    # assigns handler index and sends all handlers to workers, None if handler cannot be pickled (protected)
+    def _register(self, handler: Callable[[Message], None]) -> Optional[int]:
+        try:
+            if len(self._handlers) == 255:
+                raise ValueError("too many subscriber handlers")
+            pickled = pickle.dumps(tuple(self._handlers + [handler]))
+        except Exception as e:
+            logging.error("subscriber handler cannot be sent to shard workers", exc_info=e)
+            self._index[handler] = None
+            self._errors += 1
+            return None
+        self._handlers.append(handler)
+        for sock in self._sockets:
+            sock.send_multipart((b"H", pickled))
+        self._index[handler] = len(self._handlers) - 1
+        return self._index[handler]
+
+    def dispatch(self, handlers: Sequence[Callable[[Message], None]], data: bytes) -> bool:
+        """Forwards serialized message to the worker selected by its key
+        Args:
+            handlers (Sequence[Callable[[Message], None]]): subscriber handlers to call
+            data (bytes): serialized WireMessage as received
+        Returns:
+            True if queued, False if dropped """
+        index = self._index
+        indices = bytes(i for i in (index[f] if f in index else self._register(f) for f in handlers) if i is not None)
+        sock = self._sockets[hash(self._key(data)) % len(self._sockets)]
+        frames = (b"M", indices, data)
+        try:
+            sock.send_multipart(frames, zmq.NOBLOCK, copy=False)
+        except zmq.Again:
+            if not self._block:
+                self._dropped += 1
+                return False
+            start = time.perf_counter_ns()
+            sock.send_multipart(frames, copy=False)
+            self._blocked += 1
+            self._blocked_ns += time.perf_counter_ns() - start
+        self._dispatched += 1
+        return True
+
+    def stats(self) -> dict:
+        """ Returns: dispatch and backpressure counters, unpicklable handler errors, worker liveness """
+        return {"dispatched": self._dispatched,
+                "dropped": self._dropped,
+                "blocked": self._blocked,
+                "blocked_time_ns": self._blocked_ns,
+                "errors": self._errors,
+                "alive": [p.is_alive() for p in self._processes]}
+
+    def shutdown(self) -> None:
+        """ Waits for queued messages to be handled and stops worker processes """
+        for sock, process in zip(self._sockets, self._processes):
+            if process.is_alive():
+                sock.send(b"S")
+        for process in self._processes:
+            process.join()
+        for sock in self._sockets:
+            sock.close(linger=0)
+        for path in self._ipc_paths:
+            if os.path.exists(path):
+                os.remove(path)
+        self._sockets, self._processes, self._ipc_paths = [], [], []
+        self._context.term()
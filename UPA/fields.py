@@ -0,0 +1,127 @@
+# --------------------------------------------------------------------------------------------
+#    ____                      __      ____
+#   /\  _`\   __             /'_ `\   /\  _`\
+#   \ \ \L\_\/\_\    __  _  /\ \L\ \  \ \ \L\ \ _ __    ___
+#    \ \  _\/\/\ \  /\ \/'\ \/_> _ <_  \ \ ,__//\`'__\ / __`\
+#     \ \ \/  \ \ \ \/>  </   /\ \L\ \  \ \ \/ \ \ \/ /\ \L\ \
+#      \ \_\   \ \_\ /\_/\_\  \ \____/   \ \_\  \ \_\ \ \____/
+#       \/_/    \/_/ \//\/_/   \/___/     \/_/   \/_/  \/___/
+#
+#                     Universal FIX Engine
+#
+# Copyright (C) 2017-19 Fix8 Market Technologies Pty Ltd (ABN 29 167 027 198)
+# All Rights Reserved. [http://www.fix8mt.com] <heretohelp@fix8mt.com>
+#
+# THIS FILE IS PROPRIETARY AND  CONFIDENTIAL. NO PART OF THIS FILE MAY BE REPRODUCED,  STORED
+# IN A RETRIEVAL SYSTEM,  OR TRANSMITTED, IN ANY FORM OR ANY MEANS,  ELECTRONIC, PHOTOSTATIC,
+# RECORDED OR OTHERWISE, WITHOUT THE PRIOR AND  EXPRESS WRITTEN  PERMISSION  OF  FIX8  MARKET
+# TECHNOLOGIES PTY LTD.
+#
+# --------------------------------------------------------------------------------------------
+from typing import Dict, Iterator, Optional, Sequence, Tuple, Union
+
+FieldRow = Tuple[int, str, str, Sequence[Tuple[str, Union[int, str]]]]
+
+
+class FieldDictionary:
+    """FIX variant fields dictionary backed by a table of (tag, name, type, enums) rows.
+    Field descriptors are created on first access and cached, so attribute access like
+    FIX50SP2_Fields.Side.BUY keeps working without a class object per field"""
+
+    class Field:
+        """FIX field descriptor: tag, name, FIX type and enum values accessible as attributes"""
+        __slots__ = ("tag", "name", "type", "_values", "_names")
+
+        def __init__(self, tag: int, name: str, type: str, enums: Sequence[Tuple[str, Union[int, str]]]):
+            self.tag: int = tag
+            self.name: str = name
+            self.type: str = type
+            self._values: Dict[str, Union[int, str]] = dict(enums)
+            self._names: Optional[Dict[Union[int, str], str]] = None
+
+        def __getattr__(self, item):
+            if item not in FieldDictionary.Field.__slots__:
+                try:
+                    return self._values[item]
+                except KeyError:
+                    pass
+            raise AttributeError(f"{self.name} has no attribute '{item}'")
+
+        def __dir__(self):
+            return [*FieldDictionary.Field.__slots__[:3], *self._values]
+
+        def __repr__(self):
+            return f"{self.name}({self.tag}): {self.type}"
+
+        @property
+        def values(self) -> Dict[str, Union[int, str]]:
+            """Returns: dictionary of enum names to enum values"""
+            return self._values
+
+        def value_name(self, value: Union[int, str]) -> Optional[str]:
+            """Returns enum name of a value
+            Args:
+                value (Union[int, str]): enum value
+            Returns: enum name or None when value is not enumerated
+            """
+            if self._names is None:
+                self._names = {v: k for k, v in reversed(self._values.items())}
+            return self._names.get(value)
+
+    def __init__(self, version: str, table: Sequence[FieldRow]):
+        self.version: str = version
+        self._table: Sequence[FieldRow] = table
+        self._by_tag: Dict[int, int] = {row[0]: i for i, row in enumerate(table)}
+        self._by_name: Dict[str, int] = {row[1]: i for i, row in enumerate(table)}
+
+    def __getattr__(self, item):
+        idx = self._by_name.get(item) if item not in ("_table", "_by_tag", "_by_name") else None
+        if idx is None:
+            raise AttributeError(f"{self.version} has no field '{item}'")
+        fld = FieldDictionary.Field(*self._table[idx])
+        self.__dict__[item] = fld
+        return fld
+
+    def __dir__(self):
+        return [*object.__dir__(self), *self._by_name]
+
+    def __repr__(self):
+        return f"{self.version} fields ({len(self._table)})"
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __contains__(self, key: Union[int, str]) -> bool:
+        return key in (self._by_tag if isinstance(key, int) else self._by_name)
+
+    def __iter__(self) -> Iterator["FieldDictionary.Field"]:
+        return (getattr(self, row[1]) for row in self._table)
+
+    def field(self, key: Union[int, str]) -> Optional["FieldDictionary.Field"]:
+        """Returns field descriptor by tag or name
+        Args:
+            key (Union[int, str]): field tag or name
+        Returns: field descriptor or None when not found
+        """
+        idx = self._by_tag.get(key) if isinstance(key, int) else self._by_name.get(key)
+        return getattr(self, self._table[idx][1]) if idx is not None else None
+
+    def tag_name(self, tag: int) -> Optional[str]:
+        """Returns: field name of a tag or None when not found"""
+        idx = self._by_tag.get(tag)
+        return self._table[idx][1] if idx is not None else None
+
+    def name_tag(self, name: str) -> Optional[int]:
+        """Returns: field tag of a name or None when not found"""
+        idx = self._by_name.get(name)
+        return self._table[idx][0] if idx is not None else None
+
+    def value_name(self, tag: int, value: Union[int, str]) -> Optional[str]:
+        """Returns enum name of a field value
+        Args:
+            tag (int): field tag
+            value (Union[int, str]): field value
+        Returns: enum name or None when tag or value is not found
+        """
+        fld = self.field(tag)
+        return fld.value_name(value) if fld is not None else None
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+#--------------------------------------------------------------------------------------------
+#    ____                      __      ____
+#   /\  _`\   __             /'_ `\   /\  _`\
+#   \ \ \L\_\/\_\    __  _  /\ \L\ \  \ \ \L\ \ _ __    ___
+#    \ \  _\/\/\ \  /\ \/'\ \/_> _ <_  \ \ ,__//\`'__\ / __`\
+#     \ \ \/  \ \ \ \/>  </   /\ \L\ \  \ \ \/ \ \ \/ /\ \L\ \
+#      \ \_\   \ \_\ /\_/\_\  \ \____/   \ \_\  \ \_\ \ \____/
+#       \/_/    \/_/ \//\/_/   \/___/     \/_/   \/_/  \/___/
+#
+#                     Universal FIX Engine
+#
+# Copyright (C) 2017-19 Fix8 Market Technologies Pty Ltd (ABN 29 167 027 198)
+# All Rights Reserved. [http://www.fix8mt.com] <heretohelp@fix8mt.com>
+#
+# THIS FILE IS PROPRIETARY AND  CONFIDENTIAL. NO PART OF THIS FILE MAY BE REPRODUCED,  STORED
+# IN A RETRIEVAL SYSTEM,  OR TRANSMITTED, IN ANY FORM OR ANY MEANS,  ELECTRONIC, PHOTOSTATIC,
+# RECORDED OR OTHERWISE, WITHOUT THE PRIOR AND  EXPRESS WRITTEN  PERMISSION  OF  FIX8  MARKET
+# TECHNOLOGIES PTY LTD.
+#
+#--------------------------------------------------------------------------------------------
+import argparse
+import ast
+import datetime
+import os
+import re
+
+
+def parse(lines):
+    """Parses f8c ufe_py_fields output: returns (license, class name, [(tag, name, type, [(enum, value)])])"""
+    license_lines, cls, rows, ftype = [], None, [], ""
+    in_license = False
+    for line in lines:
+        if line.startswith('"""'):
+            license_lines.append(line)
+            in_license = not in_license
+            continue
+        if in_license:
+            license_lines.append(line)
+            continue
+        #eg. class FIX44_Fields:
+        cls_line = re.match(r"class (\w+):", line)
+        if cls_line:
+            cls = cls_line.group(1)
+            continue
+        #eg.     # Side(54): CHAR
+        comment_line = re.match(r"    # \w+\(\d+\):\s*(\w+)", line)
+        if comment_line:
+            ftype = comment_line.group(1)
+            continue
+        #eg.     class Side:
+        field_line = re.match(r"    class (\w+):", line)
+        if field_line:
+            rows.append([None, field_line.group(1), ftype, []])
+            ftype = ""
+            continue
+        #eg.         tag: int = 54
+        tag_line = re.match(r"        tag: int = (\d+)", line)
+        if tag_line:
+            rows[-1][0] = int(tag_line.group(1))
+            continue
+        #eg.         BUY: str = '1'
+        enum_line = re.match(r"        (\w+): (?:int|str) = (.*)$", line)
+        if enum_line:
+            rows[-1][3].append((enum_line.group(1), ast.literal_eval(enum_line.group(2).strip())))
+    return "".join(license_lines), cls, rows
+
+
+def write(of, license, cls, rows, source):
+    of.write(license)
+    of.write(f"\n# Autogenerated on {datetime.datetime.now()} by {os.path.basename(__file__)} from {source}\n")
+    of.write("# DO NOT EDIT!\n\n")
+    of.write("from UPA.fields import FieldDictionary\n\n")
+    of.write(f"{cls} = FieldDictionary(\"{cls[:-len('_Fields')]}\", (\n")
+    for tag, name, ftype, enums in rows:
+        of.write(f"    ({tag}, {name!r}, {ftype!r}, ({''.join(f'({n!r}, {v!r}), ' for n, v in enums).rstrip(' ')})),\n")
+    of.write("))\n")
+
+
+def main():
+    #CLI Parsing
+    parser = argparse.ArgumentParser(description="Generates table backed FIX fields dictionaries for Python UFEedclient "
+                                                 "from f8c ufe_py_fields template output.")
+    parser.add_argument("files", nargs="+", help="specify f8c ufe_py_fields output files (ufe_py_fields_fix*.py)")
+    parser.add_argument("--output-dir", default=".", help="specify output directory, file names are preserved")
+    args = parser.parse_args()
+
+    for path in args.files:
+        with open(path, "r") as f:
+            license, cls, rows = parse(f)
+        if cls is None or not rows:
+            raise ValueError(f"{path} is not a f8c ufe_py_fields output file")
+        with open(os.path.join(args.output_dir, os.path.basename(path)), "w") as of:
+            write(of, license, cls, rows, os.path.basename(path))
+
+
+if __name__ == '__main__':
+    main()
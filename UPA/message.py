@@ -18,11 +18,13 @@
 # TECHNOLOGIES PTY LTD.
 #
 # --------------------------------------------------------------------------------------------
+import struct
 import uuid
-from typing import Callable, Union, List
+from typing import Callable, Union, List, Dict, Optional, Tuple
 from datetime import datetime
 
 from UPA.consts import UFE_FLOAT_PRECISION, UFE_OK
+from UPA.fields import FieldDictionary
 from UPA.ufeapi_pb2 import WireMessage, UFEField
 
 
@@ -70,6 +72,169 @@ class Epoch:
     time_factor = 1000000000.0
 
 
+def _read_varint(data: bytes, pos: int) -> (int, int):
+    result = shift = 0
+    while True:
+        b = data[pos]
+        pos += 1
+        result |= (b & 0x7f) << shift
+        if not b & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _write_varint(val: int) -> bytes:
+    if val < 0:
+        val += 1 << 64  # int32/int64 negatives are encoded as 10 byte two's complement
+    out = bytearray()
+    while val > 0x7f:
+        out.append((val & 0x7f) | 0x80)
+        val >>= 7
+    out.append(val)
+    return bytes(out)
+
+
+class WireHeader:
+    """
+    WireMessage header (name, long name, seq, type, service id and subservice id) decoded from a serialized
+    WireMessage without parsing its fields. Used to filter messages before the full parse.
+    """
+    __slots__ = ("name", "long_name", "seq", "type", "service_id", "sub_service_id")
+
+    def __init__(self):
+        self.name: str = ""
+        self.long_name: str = ""
+        self.seq: int = 0
+        self.type: int = 0
+        self.service_id: int = 0
+        self.sub_service_id: int = 0
+
+    @staticmethod
+    def parse(data: bytes) -> "WireHeader":
+        """ Decodes header from serialized WireMessage
+        Args:
+            data (bytes): serialized WireMessage
+        Returns:
+            decoded header, absent members keep their proto3 defaults """
+        hdr = WireHeader()
+        pos, end = 0, len(data)
+        while pos < end:
+            key, pos = _read_varint(data, pos)
+            field_no, wire_type = key >> 3, key & 7
+            # protobuf serializers write fields in field number order, header members precede repeated fields(7)
+            if field_no > 6:
+                break
+            if wire_type == 0:
+                val, pos = _read_varint(data, pos)
+                if field_no == 3:
+                    hdr.seq = val
+                elif field_no == 4:
+                    hdr.type = val
+                elif field_no == 5:
+                    hdr.service_id = val - (1 << 64) if val >= (1 << 63) else val
+                elif field_no == 6:
+                    hdr.sub_service_id = val - (1 << 64) if val >= (1 << 63) else val
+            elif wire_type == 2:
+                size, pos = _read_varint(data, pos)
+                if field_no == 1:
+                    hdr.name = data[pos:pos + size].decode('utf-8')
+                elif field_no == 2:
+                    hdr.long_name = data[pos:pos + size].decode('utf-8')
+                pos += size
+            else:
+                break
+        return hdr
+
+    @staticmethod
+    def field_value(data: bytes, tag: int):
+        """ Finds top level field by tag in serialized WireMessage without parsing the message, e.g. to shard
+            broadcasts by symbol or ClOrdID
+        Args:
+            data (bytes): serialized WireMessage
+            tag (int): field tag
+        Returns:
+            raw value of the first field with tag: int for ival and bval, float for fval, bytes for sval;
+            None if absent, a group or holding a default (omitted) value """
+        pos, end = 0, len(data)
+        while pos < end:
+            key, pos = _read_varint(data, pos)
+            wire_type = key & 7
+            if wire_type == 0:
+                _, pos = _read_varint(data, pos)
+            elif wire_type == 2:
+                size, pos = _read_varint(data, pos)
+                if key >> 3 == 7:
+                    found, val = WireHeader._ufe_field_value(data, pos, pos + size, tag)
+                    if found:
+                        return val
+                pos += size
+            elif wire_type == 1:
+                pos += 8
+            elif wire_type == 5:
+                pos += 4
+            else:
+                break
+        return None
+
+    # decodes value of serialized UFEField at data[pos:end] if it has tag, returns (found, value) (protected)
+    @staticmethod
+    def _ufe_field_value(data: bytes, pos: int, end: int, tag: int) -> (bool, object):
+        matched = False
+        ftype = 0
+        while pos < end:
+            key, pos = _read_varint(data, pos)
+            field_no, wire_type = key >> 3, key & 7
+            if wire_type == 0:
+                val, pos = _read_varint(data, pos)
+                # protobuf serializers write fields in field number order, type(2) and tag(3) precede values(4-8)
+                if field_no == 2:
+                    ftype = val
+                elif field_no == 3:
+                    if val != tag:
+                        return False, None
+                    matched = True
+                elif field_no == 4 and ftype != UFEField.ft_double:  # ival of doubles holds their precision
+                    return True, val - (1 << 64) if val >= (1 << 63) else val
+                elif field_no == 6:
+                    return True, val
+            elif wire_type == 1:
+                if field_no == 5:
+                    return True, struct.unpack_from("<d", data, pos)[0]
+                pos += 8
+            elif wire_type == 2:
+                size, pos = _read_varint(data, pos)
+                if field_no == 7:
+                    return True, data[pos:pos + size]
+                if field_no == 8:
+                    return True, None
+                pos += size
+            elif wire_type == 5:
+                pos += 4
+            else:
+                break
+        # proto3 omits default values, a matched field without value field holds the default
+        return matched, None
+
+    class Filter:
+        """ Declarative header filter, each criterion is either a single value or a collection of accepted values.
+            Omitted criteria match any value """
+        def __init__(self, name=None, long_name=None, service_id=None, sub_service_id=None, msg_type=None):
+            self.criteria = tuple((attr, frozenset(val) if isinstance(val, (list, tuple, set, frozenset)) else frozenset((val,)))
+                                  for attr, val in (("name", name), ("long_name", long_name), ("service_id", service_id),
+                                                    ("sub_service_id", sub_service_id), ("type", msg_type))
+                                  if val is not None)
+
+        def __bool__(self):
+            return len(self.criteria) != 0
+
+        def matches(self, hdr: "WireHeader") -> bool:
+            """ Returns: True if header satisfies all criteria """
+            for attr, accepted in self.criteria:
+                if getattr(hdr, attr) not in accepted:
+                    return False
+            return True
+
+
 class Message:
     """
     Messages contain the System and Business information to facilitate interaction between the UFEedClient and the UFEGW.
@@ -272,30 +437,40 @@ class Message:
             fld = self._wm.fields.add()
             fld.tag = tag
             fld.location = loc
-            if type(val) == str:
-                fld.sval = str(val).encode()
-                fld.type = FieldType.ft_string
-            elif type(val) == int:
-                fld.ival = val
-                fld.type = FieldType.ft_int
-            elif type(val) == bool:
-                fld.bval = val
-                fld.type = FieldType.ft_bool
-            elif type(val) == float:
-                fld.fval = val
-                fld.type = FieldType.ft_double
-                fld.ival = precision
-            elif type(val) == datetime:
-                fld.ival = (int)((val - Epoch.epoch).total_seconds() * Epoch.time_factor)
-                fld.type = FieldType.ft_time
-            elif type(val) == Message.Status:
-                fld.ival = val.status
-                fld.type = FieldType.ft_status
-            elif type(val) == uuid.UUID:
-                fld.sval = val.bytes
-                fld.type = FieldType.ft_uuid
+            encoder = Message.Builder._encoders.get(type(val))
+            if encoder is None:
+                encoder = Message.Builder._resolve_encoder(type(val))
+            if encoder is not None:
+                encoder(fld, val, precision)
             return self
 
+        # encoders by exact value type, see register_encoder()
+        _encoders: Dict[type, Callable[[UFEField, object, int], None]] = {}
+
+        @staticmethod
+        def _resolve_encoder(typ: type) -> Optional[Callable[[UFEField, object, int], None]]:
+            # subclass of a registered type, e.g. numpy.float64, resolved once and cached
+            for base in typ.__mro__[1:]:
+                encoder = Message.Builder._encoders.get(base)
+                if encoder is not None:
+                    Message.Builder._encoders[typ] = encoder
+                    return encoder
+            return None
+
+        @staticmethod
+        def register_encoder(typ: type, encoder: Callable[[UFEField, object, int], None]) -> None:
+            """Registers add_field() encoder for a value type. Encoder sets field value and type.
+            Sample:
+                def encode_decimal(fld: UFEField, val: Decimal, precision: int):
+                    fld.fval = float(val)
+                    fld.ival = precision
+                    fld.type = FieldType.ft_double
+                Message.Builder.register_encoder(Decimal, encode_decimal)
+            Args:
+                typ (type): value type, subclasses of typ are encoded with the same encoder unless registered separately
+                encoder (Callable[[UFEField, object, int], None]): function of (field, value, float precision) """
+            Message.Builder._encoders[typ] = encoder
+
         def add_fields(self, fields: [(int, object, int)]) -> "Message.Builder":
             """Adds a list of fields (tags, values and locations) to the Message.
             Args:
@@ -340,23 +515,34 @@ class Message:
             wm = grp_ref.ref.mval.add()
             return Message.Builder(wm)
 
+        def serialize(self) -> bytes:
+            """ Returns: serialized underlying WireMessage """
+            return self._wm.SerializeToString()
+
         def build(self) -> "Message":
             """ Builds message with remapped fields and groups
             Returns: built message"""
             return Message(self._wm)
 
-        def print(self) -> str:
-            return Message.Builder.print_wm(self._wm)
+        def print(self, fields: FieldDictionary = None) -> str:
+            return Message.Builder.print_wm(self._wm, fields=fields)
 
         @staticmethod
-        def print_wm(wm: WireMessage, depth: int = 0) -> str:
+        def print_wm(wm: WireMessage, depth: int = 0, fields: FieldDictionary = None) -> str:
+            """ Pretty prints wire message
+            Args:
+                wm (WireMessage): wire message to print
+                depth (int): indentation depth
+                fields (FieldDictionary): optional FIX variant fields to print field and enum names with
+            Returns: printed message"""
             ret: str = f"{'   ' * depth}srvc_id={wm.service_id} subsrvc_id={wm.subservice_id} type={wm.type}" \
                        f"{f' msg={wm.name}' if len(wm.name) != 0 else ''}" \
                        f"{f' ({wm.longname})' if len(wm.longname) != 0 else ''}" \
                        f" seq={wm.seq}\n"
             f: UFEField
             for f in wm.fields:
-                ret += f"{'   ' * (1 + depth)}{f.tag} ("
+                fld = fields.field(f.tag) if fields is not None else None
+                ret += f"{'   ' * (1 + depth)}{f.tag}{f' {fld.name}' if fld is not None else ''} ("
                 if f.location == Location.fl_header:
                     ret += "hdr"
                 elif f.location == Location.fl_body:
@@ -369,11 +555,13 @@ class Message:
                     ret += "unknown"
                 ret += f"): "
                 if f.type == FieldType.ft_msg:
-                    ret += ''.join([Message.Builder.print_wm(wm1, depth + 1) for wm1 in f.mval])
+                    ret += ''.join([Message.Builder.print_wm(wm1, depth + 1, fields) for wm1 in f.mval])
                 elif f.type == FieldType.ft_double:
                     ret += f"{Message.field_value(f)} ({f.ival})\n"
                 else:
-                    ret += f"{Message.field_value(f)}\n"
+                    val = Message.field_value(f)
+                    name = fld.value_name(val) if fld is not None and fld.values else None
+                    ret += f"{val}{f' ({name})' if name is not None else ''}\n"
             return ret
 
         def __str__(self):
@@ -381,19 +569,21 @@ class Message:
 
     def __init__(self, wm: WireMessage = None):
         self._wm: WireMessage = wm if wm is not None else WireMessage()
-        self._fields: {int, UFEField} = {}
-        self._groups: {int, [Message]} = {}
-        self._remap()
+        # (fields, groups) mapped on first access, see _remap(). A single attribute, so that threads sharing
+        # the message never see fields of one mapping with groups of another or not yet set
+        self._mapped: Optional[Tuple[Dict[int, UFEField], Dict[int, List[Message]]]] = None
 
     @property
     def fields(self):
         """ Returns: mapped message fields """
-        return self._fields
+        mapped = self._mapped
+        return (mapped if mapped is not None else self._remap())[0]
 
     @property
     def groups(self):
         """ Returns: mapped message groups """
-        return self._groups
+        mapped = self._mapped
+        return (mapped if mapped is not None else self._remap())[1]
 
     @property
     def wire_message(self) -> WireMessage:
@@ -407,54 +597,64 @@ class Message:
              fld (UFEField): field to extract value from
         Returns:
              filed or group value if found otherwise None """
-        if fld is not None:
-            if type(fld) == UFEField:
-                if fld.type == FieldType.ft_int:
-                    return fld.ival
-                elif fld.type == FieldType.ft_bool:
-                    return fld.bval
-                elif fld.type == FieldType.ft_double:
-                    return fld.fval
-                elif fld.type == FieldType.ft_time:
-                    return datetime.utcfromtimestamp(fld.ival / Epoch.time_factor)
-                elif fld.type in (FieldType.ft_string, FieldType.ft_char):
-                    return fld.sval.decode('utf-8')
-                elif fld.type == FieldType.ft_status:
-                    return Message.Status(fld.ival)
-                elif fld.type == FieldType.ft_uuid:
-                    return uuid.UUID(bytes=fld.sval)
+        if fld is not None and type(fld) == UFEField:
+            decoder = Message._decoders.get(fld.type)
+            if decoder is not None:
+                return decoder(fld)
         return None
 
+    # decoders by FieldType, see register_decoder()
+    _decoders: Dict[int, Callable[[UFEField], object]] = {}
+
+    @staticmethod
+    def register_decoder(field_type: int, decoder: Callable[[UFEField], object]) -> None:
+        """Registers field_value() decoder for a field type, replacing the default one
+        Args:
+            field_type (int): FieldType value
+            decoder (Callable[[UFEField], object]): function of field returning its value """
+        Message._decoders[field_type] = decoder
+
     def __getitem__(self, tag: int) -> Union[str, int, bool, float, datetime, "Message.Status", uuid.UUID, List["Message"], None]:
         """ Field or group getter
         Args:
              tag (int): tag to get field or group for
         Returns:
              filed or group value if found otherwise None """
-        fld = self._fields.get(tag, None)
+        mapped = self._mapped
+        fields, groups = mapped if mapped is not None else self._remap()
+        fld = fields.get(tag, None)
         if fld is not None:
             return self.field_value(fld)
-        grp = self._groups.get(tag, None)
+        grp = groups.get(tag, None)
         if grp is not None and type(grp) == list:
             return grp
         return None
 
-    def _remap_field(self, fld: UFEField):
+    @staticmethod
+    def _remap_field(fld: UFEField, fields: Dict[int, UFEField], groups: Dict[int, List["Message"]]):
         if fld.type == FieldType.ft_msg:
-            if fld.tag not in self._groups:
-                self._groups[fld.tag] = []
-            grp = self._groups[fld.tag]
+            if fld.tag not in groups:
+                groups[fld.tag] = []
+            grp = groups[fld.tag]
             for wm in fld.mval:
                 grp.append(Message(wm))
         else:
-            self._fields[fld.tag] = fld
+            fields[fld.tag] = fld
 
-    def _remap(self):
+    def _remap(self) -> Tuple[Dict[int, UFEField], Dict[int, List["Message"]]]:
+        """ Maps fields and groups of the underlying WireMessage. Called on first fields, groups or [] access,
+        so messages that are only inspected by name, type or service id are never mapped
+        Returns:
+            (fields, groups) mapping """
+        fields: Dict[int, UFEField] = {}
+        groups: Dict[int, List[Message]] = {}
         for fld in self._wm.fields:
-            self._remap_field(fld)
+            self._remap_field(fld, fields, groups)
+        self._mapped = fields, groups
+        return self._mapped
 
-    def print(self) -> str:
-        return Message.Builder.print_wm(self._wm)
+    def print(self, fields: FieldDictionary = None) -> str:
+        return Message.Builder.print_wm(self._wm, fields=fields)
 
     def __str__(self):
         # pretty printer
@@ -497,6 +697,64 @@ class Message:
         return Message.Builder(self._wm)
 
 
+def _encode_str(fld: UFEField, val: str, precision: int) -> None:
+    fld.sval = val.encode()
+    fld.type = FieldType.ft_string
+
+
+def _encode_int(fld: UFEField, val: int, precision: int) -> None:
+    fld.ival = val
+    fld.type = FieldType.ft_int
+
+
+def _encode_bool(fld: UFEField, val: bool, precision: int) -> None:
+    fld.bval = val
+    fld.type = FieldType.ft_bool
+
+
+def _encode_float(fld: UFEField, val: float, precision: int) -> None:
+    fld.fval = val
+    fld.type = FieldType.ft_double
+    fld.ival = precision
+
+
+def _encode_datetime(fld: UFEField, val: datetime, precision: int) -> None:
+    fld.ival = (int)((val - Epoch.epoch).total_seconds() * Epoch.time_factor)
+    fld.type = FieldType.ft_time
+
+
+def _encode_status(fld: UFEField, val: Message.Status, precision: int) -> None:
+    fld.ival = val.status
+    fld.type = FieldType.ft_status
+
+
+def _encode_uuid(fld: UFEField, val: uuid.UUID, precision: int) -> None:
+    fld.sval = val.bytes
+    fld.type = FieldType.ft_uuid
+
+
+Message.Builder._encoders.update({
+    str: _encode_str,
+    int: _encode_int,
+    bool: _encode_bool,
+    float: _encode_float,
+    datetime: _encode_datetime,
+    Message.Status: _encode_status,
+    uuid.UUID: _encode_uuid,
+})
+
+Message._decoders.update({
+    FieldType.ft_int: lambda fld: fld.ival,
+    FieldType.ft_bool: lambda fld: fld.bval,
+    FieldType.ft_double: lambda fld: fld.fval,
+    FieldType.ft_time: lambda fld: datetime.utcfromtimestamp(fld.ival / Epoch.time_factor),
+    FieldType.ft_string: lambda fld: fld.sval.decode('utf-8'),
+    FieldType.ft_char: lambda fld: fld.sval.decode('utf-8'),
+    FieldType.ft_status: lambda fld: Message.Status(fld.ival),
+    FieldType.ft_uuid: lambda fld: uuid.UUID(bytes=fld.sval),
+})
+
+
 class SysMessage(Message):
     """ System message type """
     class Builder(Message.Builder):
@@ -0,0 +1,214 @@
+# --------------------------------------------------------------------------------------------
+#    ____                      __      ____
+#   /\  _`\   __             /'_ `\   /\  _`\
+#   \ \ \L\_\/\_\    __  _  /\ \L\ \  \ \ \L\ \ _ __    ___
+#    \ \  _\/\/\ \  /\ \/'\ \/_> _ <_  \ \ ,__//\`'__\ / __`\
+#     \ \ \/  \ \ \ \/>  </   /\ \L\ \  \ \ \/ \ \ \/ /\ \L\ \
+#      \ \_\   \ \_\ /\_/\_\  \ \____/   \ \_\  \ \_\ \ \____/
+#       \/_/    \/_/ \//\/_/   \/___/     \/_/   \/_/  \/___/
+#
+#                     Universal FIX Engine
+#
+# Copyright (C) 2017-19 Fix8 Market Technologies Pty Ltd (ABN 29 167 027 198)
+# All Rights Reserved. [http://www.fix8mt.com] <heretohelp@fix8mt.com>
+#
+# THIS FILE IS PROPRIETARY AND  CONFIDENTIAL. NO PART OF THIS FILE MAY BE REPRODUCED,  STORED
+# IN A RETRIEVAL SYSTEM,  OR TRANSMITTED, IN ANY FORM OR ANY MEANS,  ELECTRONIC, PHOTOSTATIC,
+# RECORDED OR OTHERWISE, WITHOUT THE PRIOR AND  EXPRESS WRITTEN  PERMISSION  OF  FIX8  MARKET
+# TECHNOLOGIES PTY LTD.
+#
+# --------------------------------------------------------------------------------------------
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional
+
+
+class Histogram:
+    """
+    HDR-style log-linear histogram of non-negative integer values (nanoseconds). Values below 2^precision are
+    counted exactly, larger values in 2^(precision - 1) buckets per power of two, so the relative error of
+    reported percentiles stays below 2^(1 - precision). Recording is a few integer operations and a list
+    increment without locks; a concurrent writer may rarely lose a count, which is acceptable for monitoring.
+    """
+
+    def __init__(self, precision: int = 5, max_value: int = 1 << 40):
+        """ Creates histogram
+            Args:
+                precision (int): sub bucket bits, 5 gives about 6% relative error
+                max_value (int): values above are counted in the last bucket, defaults to ~18 minutes in ns
+        """
+        self._bits = precision
+        self._sub = 1 << precision
+        self._half = self._sub >> 1
+        self._counts: List[int] = [0] * (self._index(max_value) + 1)
+        self._last = len(self._counts) - 1
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def _index(self, value: int) -> int:
+        if value < self._sub:
+            return value
+        shift = value.bit_length() - self._bits
+        return shift * self._half + (value >> shift)
+
+    def _upper(self, index: int) -> int:
+        if index < self._sub:
+            return index
+        shift = index // self._half - 1
+        return ((index - shift * self._half + 1) << shift) - 1
+
+    def record(self, value: int) -> None:
+        """ Records value
+            Args:
+                value (int): non-negative value, e.g. latency in nanoseconds
+        """
+        index = self._index(value) if value > 0 else 0
+        self._counts[index if index < self._last else self._last] += 1
+        if not self.count or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def percentile(self, q: float) -> int:
+        """ Returns highest value equivalent to the q-th percentile, 0 if empty
+            Args:
+                q (float): percentile 0-100
+        """
+        if not self.count:
+            return 0
+        rank = max(1, int(self.count * q / 100 + 0.5))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                return min(self._upper(index), self.max)
+        return self.max
+
+    def reset(self) -> None:
+        """ Drops all recorded values """
+        self._counts = [0] * len(self._counts)
+        self.count = self.total = self.min = self.max = 0
+
+    def snapshot(self) -> Dict[str, int]:
+        """ Returns: count, sum, min, mean, p50, p90, p99, p999 and max """
+        return {"count": self.count, "sum": self.total, "min": self.min,
+                "mean": self.total // self.count if self.count else 0,
+                "p50": self.percentile(50), "p90": self.percentile(90), "p99": self.percentile(99),
+                "p999": self.percentile(99.9), "max": self.max}
+
+
+class Metrics:
+    """
+    Counters and latency histograms kept by UFEedClient, see UFEedClient.stats(). Counters are plain integer
+    attributes incremented in place; histograms record nanoseconds.
+    """
+
+    COUNTERS = ("requests_sent", "replies_received", "request_errors", "broadcasts_received", "broadcasts_filtered",
+                "broadcasts_dropped", "messages_published", "bytes_in", "bytes_out")
+    HISTOGRAMS = ("request_rtt_ns", "parse_ns", "handler_ns")
+    HELP = {"requests_sent": "Requests sent to the UFEGW",
+            "replies_received": "Responses received from the UFEGW",
+            "request_errors": "Requests failed or timed out",
+            "broadcasts_received": "Broadcasts received by the subscriber",
+            "broadcasts_filtered": "Broadcasts dropped by subscriber filters before parsing",
+            "broadcasts_dropped": "Broadcasts dropped by a full subscriber dispatcher",
+            "messages_published": "Messages published",
+            "bytes_in": "Bytes received in responses and broadcasts",
+            "bytes_out": "Bytes sent in requests and published messages",
+            "request_rtt_ns": "Request round trip time",
+            "parse_ns": "Broadcast parse time",
+            "handler_ns": "Subscriber handler time, including lazy field remapping, or dispatch time"}
+
+    def __init__(self):
+        for name in self.COUNTERS:
+            setattr(self, name, 0)
+        for name in self.HISTOGRAMS:
+            setattr(self, name, Histogram())
+        self.gauges: Dict[str, Callable[[], int]] = {}
+
+    def reset(self) -> None:
+        """ Resets counters and histograms """
+        for name in self.COUNTERS:
+            setattr(self, name, 0)
+        for name in self.HISTOGRAMS:
+            getattr(self, name).reset()
+
+    def snapshot(self) -> Dict[str, object]:
+        """ Returns: counter values, gauge values and histogram snapshots by name """
+        res: Dict[str, object] = {name: getattr(self, name) for name in self.COUNTERS}
+        res.update({name: gauge() for name, gauge in self.gauges.items()})
+        res.update({name: getattr(self, name).snapshot() for name in self.HISTOGRAMS})
+        return res
+
+    def prometheus(self, prefix: str = "ufeedclient") -> str:
+        """ Renders metrics in Prometheus text exposition format, histograms as summaries in seconds
+            Args:
+                prefix (str): metric name prefix
+            Returns:
+                str: exposition text
+        """
+        lines = []
+        for name in self.COUNTERS:
+            lines += [f"# HELP {prefix}_{name}_total {self.HELP[name]}", f"# TYPE {prefix}_{name}_total counter",
+                      f"{prefix}_{name}_total {getattr(self, name)}"]
+        for name, gauge in self.gauges.items():
+            lines += [f"# TYPE {prefix}_{name} gauge", f"{prefix}_{name} {gauge()}"]
+        for name in self.HISTOGRAMS:
+            hist: Histogram = getattr(self, name)
+            metric = f"{prefix}_{name[:-3]}_seconds"
+            lines += [f"# HELP {metric} {self.HELP[name]}", f"# TYPE {metric} summary"]
+            for q in (0.5, 0.9, 0.99, 0.999):
+                lines.append(f'{metric}{{quantile="{q}"}} {hist.percentile(q * 100) / 1e9:.9f}')
+            lines += [f"{metric}_sum {hist.total / 1e9:.9f}", f"{metric}_count {hist.count}"]
+        return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """
+    Local HTTP endpoint serving Prometheus text format on every GET path from a daemon thread.
+    Sample:
+        server = uc.start_metrics_server(9464)
+        # curl http://127.0.0.1:9464/metrics
+    """
+
+    def __init__(self, render: Callable[[], str], port: int = 0, host: str = "127.0.0.1"):
+        """ Creates and starts server
+            Args:
+                render (Callable[[], str]): returns exposition text
+                port (int): TCP port, 0 picks a free one
+                host (str): interface to listen on, local only by default
+        """
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server: Optional[ThreadingHTTPServer] = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def port(self) -> int:
+        """ Returns: listening TCP port """
+        return self._server.server_address[1]
+
+    def close(self) -> None:
+        """ Stops server """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
@@ -0,0 +1,199 @@
+# --------------------------------------------------------------------------------------------
+#    ____                      __      ____
+#   /\  _`\   __             /'_ `\   /\  _`\
+#   \ \ \L\_\/\_\    __  _  /\ \L\ \  \ \ \L\ \ _ __    ___
+#    \ \  _\/\/\ \  /\ \/'\ \/_> _ <_  \ \ ,__//\`'__\ / __`\
+#     \ \ \/  \ \ \ \/>  </   /\ \L\ \  \ \ \/ \ \ \/ /\ \L\ \
+#      \ \_\   \ \_\ /\_/\_\  \ \____/   \ \_\  \ \_\ \ \____/
+#       \/_/    \/_/ \//\/_/   \/___/     \/_/   \/_/  \/___/
+#
+#                     Universal FIX Engine
+#
+# Copyright (C) 2017-19 Fix8 Market Technologies Pty Ltd (ABN 29 167 027 198)
+# All Rights Reserved. [http://www.fix8mt.com] <heretohelp@fix8mt.com>
+#
+# THIS FILE IS PROPRIETARY AND  CONFIDENTIAL. NO PART OF THIS FILE MAY BE REPRODUCED,  STORED
+# IN A RETRIEVAL SYSTEM,  OR TRANSMITTED, IN ANY FORM OR ANY MEANS,  ELECTRONIC, PHOTOSTATIC,
+# RECORDED OR OTHERWISE, WITHOUT THE PRIOR AND  EXPRESS WRITTEN  PERMISSION  OF  FIX8  MARKET
+# TECHNOLOGIES PTY LTD.
+#
+# --------------------------------------------------------------------------------------------
+import threading
+import time
+from typing import Callable, List, Optional
+
+import zmq
+
+from UPA.message import Message
+from UPA.metrics import Metrics
+from UPA.ufeapi_pb2 import WireMessage
+
+
+class RequestPool:
+    """
+    Thread-safe pool of REQ sockets sharing one zmq.Context and session token of an UFEedClient.
+    Every request() takes a free socket, so up to size requests from different threads run at once
+    instead of serialising on the single UFEedClient REQ socket. A socket that fails mid request is
+    replaced, so the REQ state machine of the other sockets is never affected.
+    Sample:
+        pool = uc.create_request_pool(4)
+        rep = pool.request(uc.create_message().set_long_name("NOS")...)
+    """
+
+    def __init__(self, size: int, socket_factory: Callable[[], zmq.Socket], topic: bytes,
+                 prepare: Callable[[Message.Builder], bytes], process: Callable[[Message.Builder, WireMessage], Message],
+                 timeout: Optional[float] = None, metrics: Optional[Metrics] = None):
+        """ Creates request pool
+            Args:
+                size (int): number of REQ sockets
+                socket_factory (Callable[[], zmq.Socket]): creates connected REQ socket
+                topic (bytes): requester topic
+                prepare (Callable[[Message.Builder], bytes]): serialises request with session token
+                process (Callable[[Message.Builder, WireMessage], Message]): processes response
+                timeout (float, optional): default seconds to wait for a free socket and the response, None waits forever
+                metrics (Metrics, optional): metrics the request round trips are recorded into, e.g. of the client
+        """
+        if size <= 0:
+            raise ValueError(f"invalid pool size {size}")
+        self._socket_factory = socket_factory
+        self._topic = topic
+        self._prepare = prepare
+        self._process = process
+        self._timeout = timeout
+        self._metrics = metrics
+        self._cond = threading.Condition()
+        self._free: List[zmq.Socket] = [socket_factory() for _ in range(size)]
+        self._size = size
+        self._closed = False
+        self._start_ns = time.perf_counter_ns()
+        self._requests = 0
+        self._errors = 0
+        self._timeouts = 0
+        self._waits = 0
+        self._wait_ns = 0
+        self._max_wait_ns = 0
+        self._busy_ns = 0
+        self._max_in_use = 0
+
+    @property
+    def size(self) -> int:
+        """ Returns: number of REQ sockets """
+        return self._size
+
+    @property
+    def closed(self) -> bool:
+        """ Returns: True if the pool is closed """
+        return self._closed
+
+    @property
+    def in_use(self) -> int:
+        """ Returns: number of REQ sockets currently serving requests, 0 once the pool is closed """
+        return self._size - len(self._free) if not self._closed else 0
+
+    def _acquire(self, timeout: Optional[float]) -> zmq.Socket:
+        with self._cond:
+            if not self._free and not self._closed:
+                start = time.perf_counter_ns()
+                if not self._cond.wait_for(lambda: self._free or self._closed, timeout):
+                    raise TimeoutError(f"no free request socket within {timeout}s")
+                waited = time.perf_counter_ns() - start
+                self._waits += 1
+                self._wait_ns += waited
+                self._max_wait_ns = max(self._max_wait_ns, waited)
+            if self._closed:
+                raise ConnectionAbortedError("request pool is closed")
+            sock = self._free.pop()
+            self._max_in_use = max(self._max_in_use, self.in_use)
+            return sock
+
+    def _release(self, sock: Optional[zmq.Socket], busy_ns: int, failed: bool, timed_out: bool,
+                 bytes_out: int, bytes_in: int) -> None:
+        with self._cond:
+            self._requests += 1
+            self._busy_ns += busy_ns
+            self._timeouts += timed_out
+            metrics = self._metrics
+            if metrics is not None:  # under the pool lock, so concurrent pool requests are all counted
+                metrics.requests_sent += bytes_out > 0
+                metrics.bytes_out += bytes_out
+                if failed:
+                    metrics.request_errors += 1
+                else:
+                    metrics.replies_received += 1
+                    metrics.bytes_in += bytes_in
+                    metrics.request_rtt_ns.record(busy_ns)
+            if failed:
+                self._errors += not timed_out
+                sock.close(linger=0)
+                sock = self._socket_factory() if not self._closed else None
+            if sock is not None:
+                if self._closed:
+                    sock.close(linger=0)
+                else:
+                    self._free.append(sock)
+            self._cond.notify()
+
+    def request(self, msg: Message.Builder, timeout: Optional[float] = None) -> Message:
+        """ Sends request over a free REQ socket and waits for the response.
+            Args:
+                msg (Message.Builder): Message to be sent via request
+                timeout (float, optional): seconds to wait for a free socket and the response, defaults to pool timeout
+            Raises:
+                LookupError: If there is an attempt to make a request before a login session ID has been established
+                TimeoutError: If no socket becomes free or no response arrives within timeout,
+                              the socket of a timed out request is replaced
+                ConnectionAbortedError: If the pool is closed
+            Returns:
+                Message: Message received via response
+        """
+        wms = self._prepare(msg)
+        timeout = self._timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        sock = self._acquire(timeout)
+        start = time.perf_counter_ns()
+        failed, timed_out, sent, response = True, False, False, b""
+        try:
+            sock.send_multipart((self._topic, wms))
+            sent = True
+            if deadline is not None and not sock.poll(max(0, int((deadline - time.monotonic()) * 1000)), zmq.POLLIN):
+                timed_out = True
+                raise TimeoutError(f"no response within {timeout}s")
+            response = sock.recv_multipart()[1]
+            failed = False
+        finally:
+            self._release(sock, time.perf_counter_ns() - start, failed, timed_out, len(wms) if sent else 0, len(response))
+        wm = WireMessage()
+        wm.ParseFromString(response)
+        return self._process(msg, wm)
+
+    def stats(self) -> dict:
+        """ Returns: pool size, socket usage, wait time and utilisation counters.
+            utilisation is the share of pool socket time spent serving requests since the pool creation """
+        with self._cond:
+            elapsed = time.perf_counter_ns() - self._start_ns
+            return {"size": self._size,
+                    "in_use": self.in_use,
+                    "max_in_use": self._max_in_use,
+                    "requests": self._requests,
+                    "errors": self._errors,
+                    "timeouts": self._timeouts,
+                    "waits": self._waits,
+                    "wait_time_ns": self._wait_ns,
+                    "max_wait_time_ns": self._max_wait_ns,
+                    "busy_time_ns": self._busy_ns,
+                    "utilisation": self._busy_ns / (elapsed * self._size) if elapsed else 0.0}
+
+    def close(self) -> None:
+        """ Closes free sockets, sockets in use are closed when their requests complete """
+        with self._cond:
+            self._closed = True
+            for sock in self._free:
+                sock.close(linger=0)
+            self._free.clear()
+            self._cond.notify_all()
+
+    def __enter__(self) -> "RequestPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
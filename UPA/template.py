@@ -0,0 +1,191 @@
+# --------------------------------------------------------------------------------------------
+#    ____                      __      ____
+#   /\  _`\   __             /'_ `\   /\  _`\
+#   \ \ \L\_\/\_\    __  _  /\ \L\ \  \ \ \L\ \ _ __    ___
+#    \ \  _\/\/\ \  /\ \/'\ \/_> _ <_  \ \ ,__//\`'__\ / __`\
+#     \ \ \/  \ \ \ \/>  </   /\ \L\ \  \ \ \/ \ \ \/ /\ \L\ \
+#      \ \_\   \ \_\ /\_/\_\  \ \____/   \ \_\  \ \_\ \ \____/
+#       \/_/    \/_/ \//\/_/   \/___/     \/_/   \/_/  \/___/
+#
+#                     Universal FIX Engine
+#
+# Copyright (C) 2017-19 Fix8 Market Technologies Pty Ltd (ABN 29 167 027 198)
+# All Rights Reserved. [http://www.fix8mt.com] <heretohelp@fix8mt.com>
+#
+# THIS FILE IS PROPRIETARY AND  CONFIDENTIAL. NO PART OF THIS FILE MAY BE REPRODUCED,  STORED
+# IN A RETRIEVAL SYSTEM,  OR TRANSMITTED, IN ANY FORM OR ANY MEANS,  ELECTRONIC, PHOTOSTATIC,
+# RECORDED OR OTHERWISE, WITHOUT THE PRIOR AND  EXPRESS WRITTEN  PERMISSION  OF  FIX8  MARKET
+# TECHNOLOGIES PTY LTD.
+#
+# --------------------------------------------------------------------------------------------
+import struct
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence
+
+from UPA.message import Message, FieldType, Epoch, _write_varint
+from UPA.ufeapi_pb2 import WireMessage, UFEField
+
+_FIELDS_KEY = b"\x3a"  # WireMessage.fields(7), length delimited
+_IVAL_KEY = b"\x20"  # UFEField.ival(4), varint
+_FVAL_KEY = b"\x29"  # UFEField.fval(5), 64-bit
+_BVAL_KEY = b"\x30"  # UFEField.bval(6), varint
+_SVAL_KEY = b"\x3a"  # UFEField.sval(7), length delimited
+_double = struct.Struct("<d").pack
+
+
+def _encode_ival(val: int) -> bytes:
+    return _IVAL_KEY + _write_varint(val)
+
+
+def _encode_sval(val: bytes) -> bytes:
+    return _SVAL_KEY + _write_varint(len(val)) + val
+
+
+def _encode_time(val) -> bytes:
+    if type(val) == datetime:
+        val = (int)((val - Epoch.epoch).total_seconds() * Epoch.time_factor)
+    return _encode_ival(val)
+
+
+def _encode_status(val) -> bytes:
+    return _encode_ival(val.status if type(val) == Message.Status else val)
+
+
+def _encode_string(val) -> bytes:
+    return _encode_sval(val.encode() if type(val) == str else val)
+
+
+def _double_encoder(precision: int) -> Callable[[float], bytes]:
+    ival = _encode_ival(precision) if precision else b""
+    return lambda val: ival + _FVAL_KEY + _double(val)
+
+
+def _encode_bool(val: bool) -> bytes:
+    return _BVAL_KEY + (b"\x01" if val else b"\x00")
+
+
+def _encode_uuid(val) -> bytes:
+    return _encode_sval(val if type(val) == bytes else val.bytes)
+
+
+class MessageTemplate:
+    """
+    Precompiled message skeleton for repeatedly sent messages of the same shape. The skeleton (header and static
+    fields) is serialized once, only the values of variable fields are encoded for every message and spliced
+    into the pre-serialized buffer at their original positions.
+    Sample:
+        nos = MessageTemplate(NewOrderSingle.Builder(price=0., symbol="BHP", quantity=0., order_type='1', side='0',
+                                                     time_in_force='2', cl_ord_id="")
+                              .set_long_name("NewOrderSingle").set_name("D").set_service_id(6),
+                              (COMMON_PRICE, COMMON_ORDERQTY, COMMON_CLORDID))
+        uc.request(nos.stamp(10.25, 100., "Ord01"))
+    """
+
+    class Stamp(Message.Builder):
+        """ Message builder stamped from template. Holds the serialized message and parses it into WireMessage only
+            when the WireMessage is accessed, e.g. to add more fields """
+        def __init__(self, data: bytes, service_id: int):
+            self._data: Optional[bytes] = data
+            self._service_id: int = service_id
+            self._parsed: Optional[WireMessage] = None
+
+        @property
+        def _wm(self) -> WireMessage:
+            if self._parsed is None:
+                self._parsed = WireMessage()
+                self._parsed.ParseFromString(self._data)
+                self._data = None
+            return self._parsed
+
+        @property
+        def service_id(self) -> int:
+            """ Returns: underlying WireMessage service id"""
+            return self._service_id if self._parsed is None else self._parsed.service_id
+
+        @service_id.setter
+        def service_id(self, service_id: int) -> None:
+            """ Sets underlying WireMessage object service id """
+            self._wm.service_id = service_id
+
+        def serialize(self) -> bytes:
+            """ Returns: serialized underlying WireMessage """
+            return self._data if self._parsed is None else self._parsed.SerializeToString()
+
+    # value encoders by field type, values are accepted as for Message.Builder.add_field()
+    _encoders: Dict[int, Callable[[object], bytes]] = {
+        FieldType.ft_int: _encode_ival,
+        FieldType.ft_time: _encode_time,
+        FieldType.ft_status: _encode_status,
+        FieldType.ft_string: _encode_string,
+        FieldType.ft_char: _encode_string,
+        FieldType.ft_bool: _encode_bool,
+        FieldType.ft_uuid: _encode_uuid,
+    }
+
+    def __init__(self, msg: Message.Builder, variable_tags: Sequence[int]):
+        """Compiles template from a sample message
+        Args:
+            msg (Message.Builder): sample message, fields with variable tags define location and type of variable values
+            variable_tags (Sequence[int]): top level tags whose values are passed to stamp(), in argument order
+        Raises:
+            KeyError: if a variable tag is not present in the sample message
+            ValueError: if a variable tag is repeated or refers to a group or a field of unknown type """
+        if len(set(variable_tags)) != len(variable_tags):
+            raise ValueError(f"duplicate variable tags {variable_tags}")
+        wm = msg.wire_message
+        header = WireMessage()
+        header.CopyFrom(wm)
+        del header.fields[:]
+        self._service_id: int = wm.service_id
+        segments: List[bytes] = []
+        slots: Dict[int, (int, bytes, Callable[[object], bytes])] = {}  # tag -> (slot index, field prefix, encoder)
+        current = bytearray(header.SerializeToString())
+        fld: UFEField
+        for fld in wm.fields:
+            if fld.tag not in variable_tags or fld.tag in slots:
+                data = fld.SerializeToString()
+                current += _FIELDS_KEY + _write_varint(len(data)) + data
+                continue
+            if fld.type == FieldType.ft_double:
+                encoder = _double_encoder(fld.ival)
+            elif fld.type in MessageTemplate._encoders:
+                encoder = MessageTemplate._encoders[fld.type]
+            else:
+                raise ValueError(f"tag {fld.tag} of type {fld.type} can not be variable")
+            prefix = UFEField(location=fld.location, type=fld.type, tag=fld.tag).SerializeToString()
+            slots[fld.tag] = (len(segments), prefix, encoder)
+            segments.append(bytes(current))
+            current = bytearray()
+        segments.append(bytes(current))
+        missing = [tag for tag in variable_tags if tag not in slots]
+        if missing:
+            raise KeyError(f"variable tags {missing} not found in template message")
+        self._segments: List[bytes] = segments
+        # (slot index, prefix, encoder) in variable_tags order
+        self._slots: List = [slots[tag] for tag in variable_tags]
+
+    def serialize(self, *values) -> bytes:
+        """Serializes message with given variable values
+        Args:
+            values: variable field values in variable_tags order
+        Raises:
+            ValueError: if the number of values does not match the number of variable tags
+        Returns:
+            serialized WireMessage """
+        if len(values) != len(self._slots):
+            raise ValueError(f"expected {len(self._slots)} variable values, got {len(values)}")
+        parts = list(self._segments)
+        for (index, prefix, encoder), val in zip(self._slots, values):
+            data = prefix + encoder(val)
+            parts[index] += _FIELDS_KEY + _write_varint(len(data)) + data
+        return b"".join(parts)
+
+    def stamp(self, *values) -> "MessageTemplate.Stamp":
+        """Creates message builder with given variable values
+        Args:
+            values: variable field values in variable_tags order
+        Raises:
+            ValueError: if the number of values does not match the number of variable tags
+        Returns:
+            message builder that can be sent via UFEedClient request() or publish() """
+        return MessageTemplate.Stamp(self.serialize(*values), self._service_id)
@@ -0,0 +1,245 @@
+# --------------------------------------------------------------------------------------------
+#    ____                      __      ____
+#   /\  _`\   __             /'_ `\   /\  _`\
+#   \ \ \L\_\/\_\    __  _  /\ \L\ \  \ \ \L\ \ _ __    ___
+#    \ \  _\/\/\ \  /\ \/'\ \/_> _ <_  \ \ ,__//\`'__\ / __`\
+#     \ \ \/  \ \ \ \/>  </   /\ \L\ \  \ \ \/ \ \ \/ /\ \L\ \
+#      \ \_\   \ \_\ /\_/\_\  \ \____/   \ \_\  \ \_\ \ \____/
+#       \/_/    \/_/ \//\/_/   \/___/     \/_/   \/_/  \/___/
+#
+#                     Universal FIX Engine
+#
+# Copyright (C) 2017-19 Fix8 Market Technologies Pty Ltd (ABN 29 167 027 198)
+# All Rights Reserved. [http://www.fix8mt.com] <heretohelp@fix8mt.com>
+#
+# THIS FILE IS PROPRIETARY AND  CONFIDENTIAL. NO PART OF THIS FILE MAY BE REPRODUCED,  STORED
+# IN A RETRIEVAL SYSTEM,  OR TRANSMITTED, IN ANY FORM OR ANY MEANS,  ELECTRONIC, PHOTOSTATIC,
+# RECORDED OR OTHERWISE, WITHOUT THE PRIOR AND  EXPRESS WRITTEN  PERMISSION  OF  FIX8  MARKET
+# TECHNOLOGIES PTY LTD.
+#
+# --------------------------------------------------------------------------------------------
+import functools
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+_logger = logging.getLogger("UPA")
+
+
+class Tracer:
+    """
+    Level-gated instrumentation of UPA calls. Every traced function counts its calls and times every
+    sample_rate-th of them with time.perf_counter_ns(); at LOG level start and end of every call, sampled or not,
+    are also logged at INFO to the "UPA" logger. When the level is OFF a traced function only adds its wrapper
+    call and a level check, no timer is looked up and no clock is read.
+    Configured at runtime with configure(), initial configuration is taken from UPA_TRACE (off, stats, log)
+    and UPA_TRACE_SAMPLE environment variables.
+    Sample:
+        tracer.configure(Tracer.STATS, sample_rate=100)
+        ...
+        print(tracer.report())
+    """
+    OFF = 0
+    STATS = 1
+    LOG = 2
+
+    LEVELS = {"off": OFF, "stats": STATS, "log": LOG}
+
+    class Timer:
+        """ Call counter and sampled latency statistics of a traced function or span """
+        __slots__ = ("name", "calls", "sampled", "total_ns", "min_ns", "max_ns", "_lock")
+
+        def __init__(self, name: str):
+            self.name = name
+            self._lock = threading.Lock()
+            self.calls = 0
+            self.sampled = 0
+            self.total_ns = 0
+            self.min_ns = 0
+            self.max_ns = 0
+
+        def tick(self) -> int:
+            """ Counts call
+                Returns:
+                    int: number of calls before this one
+            """
+            with self._lock:
+                calls = self.calls
+                self.calls = calls + 1
+            return calls
+
+        def record(self, elapsed_ns: int) -> None:
+            """ Records sampled latency
+                Args:
+                    elapsed_ns (int): latency in nanoseconds
+            """
+            with self._lock:
+                self.sampled += 1
+                self.total_ns += elapsed_ns
+                if self.sampled == 1 or elapsed_ns < self.min_ns:
+                    self.min_ns = elapsed_ns
+                if elapsed_ns > self.max_ns:
+                    self.max_ns = elapsed_ns
+
+        def stats(self) -> Dict[str, int]:
+            """ Returns: calls, sampled, total_ns, mean_ns, min_ns and max_ns """
+            with self._lock:
+                return {"calls": self.calls, "sampled": self.sampled, "total_ns": self.total_ns,
+                        "mean_ns": self.total_ns // self.sampled if self.sampled else 0,
+                        "min_ns": self.min_ns, "max_ns": self.max_ns}
+
+    class Span:
+        """ Times a block of code, created by Tracer.span() """
+        __slots__ = ("_tracer", "_timer", "_start_ns")
+
+        def __init__(self, tracer: "Tracer", timer: "Tracer.Timer"):
+            self._tracer = tracer
+            self._timer = timer
+            self._start_ns = 0
+
+        def __enter__(self):
+            if self._timer.tick() % self._tracer.sample_rate == 0:
+                self._start_ns = time.perf_counter_ns()
+            return self
+
+        def __exit__(self, exc_type, exc_val, exc_tb):
+            if self._start_ns:
+                self._timer.record(time.perf_counter_ns() - self._start_ns)
+            return False
+
+    class _NullSpan:
+        """ Span used when tracing is off """
+        __slots__ = ()
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc_val, exc_tb):
+            return False
+
+    _NULL_SPAN = _NullSpan()
+
+    def __init__(self, level: int = OFF, sample_rate: int = 1):
+        """ Creates tracer
+            Args:
+                level (int): OFF, STATS or LOG
+                sample_rate (int): time every sample_rate-th call
+        """
+        self.level = self.OFF
+        self.sample_rate = 1
+        self._timers: Dict[str, Tracer.Timer] = {}
+        self._lock = threading.Lock()
+        self.configure(level, sample_rate)
+
+    @property
+    def enabled(self) -> bool:
+        """ Returns: True when counters and timers are collected """
+        return self.level != self.OFF
+
+    def configure(self, level: Optional[int] = None, sample_rate: Optional[int] = None) -> None:
+        """ Reconfigures tracer at runtime
+            Args:
+                level (int or str, optional): OFF, STATS, LOG or their names; unchanged if None
+                sample_rate (int, optional): time every sample_rate-th call; unchanged if None
+        """
+        if level is not None:
+            if isinstance(level, str):
+                if level.lower() not in self.LEVELS:
+                    raise ValueError(f"invalid trace level {level}")
+                level = self.LEVELS[level.lower()]
+            if level not in self.LEVELS.values():
+                raise ValueError(f"invalid trace level {level}")
+            self.level = level
+        if sample_rate is not None:
+            if sample_rate <= 0:
+                raise ValueError(f"invalid sample rate {sample_rate}")
+            self.sample_rate = sample_rate
+
+    def timer(self, name: str) -> "Tracer.Timer":
+        """ Returns timer, creates it on first use
+            Args:
+                name (str): timer name
+            Returns:
+                Tracer.Timer: timer
+        """
+        timer = self._timers.get(name)
+        if timer is None:
+            with self._lock:
+                timer = self._timers.setdefault(name, Tracer.Timer(name))
+        return timer
+
+    def span(self, name: str):
+        """ Returns context manager timing its block into the name timer, a no-op when tracing is off
+            Args:
+                name (str): timer name
+        """
+        if self.level == self.OFF:
+            return self._NULL_SPAN
+        return Tracer.Span(self, self.timer(name))
+
+    def record(self, name: str, elapsed_ns: int) -> None:
+        """ Records externally measured latency (e.g. an asynchronous request round trip)
+            Args:
+                name (str): timer name
+                elapsed_ns (int): latency in nanoseconds
+        """
+        if self.level != self.OFF:
+            timer = self.timer(name)
+            timer.tick()
+            timer.record(elapsed_ns)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """ Returns: timer name to timer stats of every timer with calls """
+        with self._lock:
+            timers = list(self._timers.values())
+        return {t.name: t.stats() for t in timers if t.calls}
+
+    def report(self) -> str:
+        """ Returns: stats formatted as a table, latencies in microseconds """
+        lines = [f"{'name':<48} {'calls':>10} {'sampled':>10} {'mean':>10} {'min':>10} {'max':>10}"]
+        for name, s in sorted(self.stats().items()):
+            lines.append(f"{name:<48} {s['calls']:>10} {s['sampled']:>10} {s['mean_ns'] / 1e3:>10.1f} "
+                         f"{s['min_ns'] / 1e3:>10.1f} {s['max_ns'] / 1e3:>10.1f}")
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """ Drops all collected stats """
+        with self._lock:
+            self._timers.clear()
+
+    def traced(self, func: Callable) -> Callable:
+        """ Decorator counting and timing calls of func under its qualified name
+            Args:
+                func (Callable): function to trace
+            Returns:
+                Callable: wrapper
+        """
+        name = getattr(func, "__qualname__", func.__name__)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self.level:
+                return func(*args, **kwargs)
+            log = self.level == self.LOG
+            if log:
+                _logger.info("%s START", name)
+            timer = self.timer(name)
+            try:
+                if timer.tick() % self.sample_rate:
+                    return func(*args, **kwargs)
+                start = time.perf_counter_ns()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    timer.record(time.perf_counter_ns() - start)
+            finally:
+                if log:
+                    _logger.info("%s END", name)
+
+        return wrapper
+
+
+tracer = Tracer(os.environ.get("UPA_TRACE", "off"), int(os.environ.get("UPA_TRACE_SAMPLE", "1")))
+traced = tracer.traced
@@ -18,3865 +18,667 @@ RECORDED OR OTHERWISE, WITHOUT THE PRIOR AND  EXPRESS WRITTEN  PERMISSION  OF  F
 TECHNOLOGIES PTY LTD.
 """
 
-# Autogenerated on 2019-09-03 12:58:12.164864
-# /home/sergey/src/f8/fix8pro/compiler/py/f8c/f8c.py --template ufe_java_fields ufe_cpp_fields ufe_cs_fields ufe_py_fields --output-dir ./generated --schema-dir /home/sergey/src/f8/fix8pro/schema/xml FIX50SP2 FIX42 FIX44 FIX40 FIX41 FIX43 FIX50 FIX50SP1
+# Autogenerated on 2026-10-18 15:52:52.745239 by fields_gen.py from ufe_py_fields_fix43.py
 # DO NOT EDIT!
-# 4 spaces instead of tab is required
 
-class FIX43_Fields:
-
-    # Account(1): STRING
-    class Account:
-        tag: int = 1
-
-    # AdvId(2): STRING
-    class AdvId:
-        tag: int = 2
-
-    # AdvRefID(3): STRING
-    class AdvRefID:
-        tag: int = 3
-
-    # AdvSide(4): CHAR
-    class AdvSide:
-        tag: int = 4
-        BUY: str = 'B'
-        SELL: str = 'S'
-        CROSS: str = 'X'
-        TRADE: str = 'T'
-
-    # AdvTransType(5): STRING
-    class AdvTransType:
-        tag: int = 5
-        NEW: str = "N"
-        CANCEL: str = "C"
-        REPLACE: str = "R"
-
-    # AvgPx(6): PRICE
-    class AvgPx:
-        tag: int = 6
-
-    # BeginSeqNo(7): SEQNUM
-    class BeginSeqNo:
-        tag: int = 7
-
-    # BeginString(8): STRING
-    class BeginString:
-        tag: int = 8
-
-    # BodyLength(9): LENGTH
-    class BodyLength:
-        tag: int = 9
-
-    # CheckSum(10): STRING
-    class CheckSum:
-        tag: int = 10
-
-    # ClOrdID(11): STRING
-    class ClOrdID:
-        tag: int = 11
-
-    # Commission(12): AMT
-    class Commission:
-        tag: int = 12
-
-    # CommType(13): CHAR
-    class CommType:
-        tag: int = 13
-        PER_BOND: str = '6'
-        PER_SHARE: str = '1'
-        PERCENTAGE: str = '2'
-        ABSOLUTE: str = '3'
-        _5: str = '5'
-        _4: str = '4'
-
-    # CumQty(14): QTY
-    class CumQty:
-        tag: int = 14
-
-    # Currency(15): CURRENCY
-    class Currency:
-        tag: int = 15
-
-    # EndSeqNo(16): SEQNUM
-    class EndSeqNo:
-        tag: int = 16
-
-    # ExecID(17): STRING
-    class ExecID:
-        tag: int = 17
-
-    # ExecInst(18): MULTIPLEVALUESTRING
-    class ExecInst:
-        tag: int = 18
-        TRYTOSTOP: str = "Y"
-        MIDPRCPEG: str = "M"
-        MARKPEG: str = "P"
-        CANCELONSYSFAIL: str = "Q"
-        PRIMPEG: str = "R"
-        SUSPEND: str = "S"
-        CUSTDISPINST: str = "U"
-        NETTING: str = "V"
-        PEGVWAP: str = "W"
-        TRADEALONG: str = "X"
-        PERCVOL: str = "D"
-        STAYOFFER: str = "0"
-        WORK: str = "2"
-        OVERDAY: str = "4"
-        HELD: str = "5"
-        PARTNOTINIT: str = "6"
-        STRICTSCALE: str = "7"
-        TRYTOSCALE: str = "8"
-        STAYBID: str = "9"
-        NOCROSS: str = "A"
-        OPENPEG: str = "O"
-        CALLFIRST: str = "C"
-        NONNEGO: str = "N"
-        DNI: str = "E"
-        DNR: str = "F"
-        AON: str = "G"
-        RESTATEONSYSFAIL: str = "H"
-        INSTITONLY: str = "I"
-        RESTATEONTRADINGHALT: str = "J"
-        CANCELONTRADINGHALT: str = "K"
-        LASTPEG: str = "L"
-        GOALONG: str = "3"
-        OKCROSS: str = "B"
-        NOTHELD: str = "1"
-
-    # ExecRefID(19): STRING
-    class ExecRefID:
-        tag: int = 19
-
-    # ExecTransType(20): CHAR
-    class ExecTransType:
-        tag: int = 20
-        CANCEL: str = '1'
-        NEW: str = '0'
-        STATUS: str = '3'
-        CORRECT: str = '2'
-
-    # HandlInst(21): CHAR
-    class HandlInst:
-        tag: int = 21
-        AUTOMATED_EXECUTION_ORDER_PRIVATE_NO_BROKER_INTERVENTION: str = '1'
-        AUTOMATED_EXECUTION_ORDER_PUBLIC_BROKER_INTERVENTION_OK: str = '2'
-        MANUAL_ORDER_BEST_EXECUTION: str = '3'
-
-    # SecurityIDSource(22): STRING
-    class SecurityIDSource:
-        tag: int = 22
-        SICOVAM: str = "E"
-        SEDOL: str = "2"
-        CUSIP: str = "1"
-        QUIK: str = "3"
-        BELGIAN: str = "F"
-        VALOREN: str = "D"
-        DUTCH: str = "C"
-        WERTPAPIER: str = "B"
-        BLOOMBERG_SYMBOL: str = "A"
-        CONSOLIDATED_TAPE_ASSOCIATION: str = "9"
-        EXCHANGE_SYMBOL: str = "8"
-        ISO_COUNTRY_CODE: str = "7"
-        ISO_CURRENCY_CODE: str = "6"
-        RIC_CODE: str = "5"
-        ISIN_NUMBER: str = "4"
-        COMMON: str = "G"
-
-    # IOIid(23): STRING
-    class IOIid:
-        tag: int = 23
-
-    # IOIOthSvc(24): CHAR
-    class IOIOthSvc:
-        tag: int = 24
-
-    # IOIQltyInd(25): CHAR
-    class IOIQltyInd:
-        tag: int = 25
-        MEDIUM: str = 'M'
-        HIGH: str = 'H'
-        LOW: str = 'L'
-
-    # IOIRefID(26): STRING
-    class IOIRefID:
-        tag: int = 26
-
-    # IOIQty(27): STRING
-    class IOIQty:
-        tag: int = 27
-        LARGE: str = "L"
-        MEDIUM: str = "M"
-        SMALL: str = "S"
-
-    # IOITransType(28): CHAR
-    class IOITransType:
-        tag: int = 28
-        CANCEL: str = 'C'
-        NEW: str = 'N'
-        REPLACE: str = 'R'
-
-    # LastCapacity(29): CHAR
-    class LastCapacity:
-        tag: int = 29
-        PRINCIPAL: str = '4'
-        CROSS_AS_PRINCIPAL: str = '3'
-        AGENT: str = '1'
-        CROSS_AS_AGENT: str = '2'
-
-    # LastMkt(30): EXCHANGE
-    class LastMkt:
-        tag: int = 30
-
-    # LastPx(31): PRICE
-    class LastPx:
-        tag: int = 31
-
-    # LastQty(32): QTY
-    class LastQty:
-        tag: int = 32
-
-    # LinesOfText(33): NUMINGROUP
-    class LinesOfText:
-        tag: int = 33
-
-    # MsgSeqNum(34): SEQNUM
-    class MsgSeqNum:
-        tag: int = 34
-
-    # MsgType(35): STRING
-    class MsgType:
-        tag: int = 35
-        LIST_STRIKE_PRICE: str = "m"
-        BID_RESPONSE: str = "l"
-        BID_REQUEST: str = "k"
-        BUSINESS_MESSAGE_REJECT: str = "j"
-        MASS_QUOTE: str = "i"
-        TRADING_SESSION_STATUS: str = "h"
-        ORDER_MASS_CANCEL_REQUEST: str = "q"
-        TRADE_CAPTURE_REPORT: str = "AE"
-        REGISTRATION_INSTRUCTIONS: str = "o"
-        DERIVATIVE_SECURITY_LIST_REQUEST: str = "z"
-        QUOTE_STATUS_REPORT: str = "AI"
-        RFQ_REQUEST: str = "AH"
-        QUOTE_REQUEST_REJECT: str = "AG"
-        ORDER_MASS_STATUS_REQUEST: str = "AF"
-        XML_MESSAGE: str = "n"
-        TRADE_CAPTURE_REPORT_REQUEST: str = "AD"
-        TRADING_SESSION_STATUS_REQUEST: str = "g"
-        MULTILEG_ORDER_CANCEL_REPLACE: str = "AC"
-        DERIVATIVE_SECURITY_LIST: str = "AA"
-        ORDER_MASS_CANCEL_REPORT: str = "r"
-        SECURITY_LIST: str = "y"
-        SECURITY_LIST_REQUEST: str = "x"
-        SECURITY_TYPES: str = "w"
-        SECURITY_TYPE_REQUEST: str = "v"
-        CROSS_ORDER_CANCEL_REQUEST: str = "u"
-        CROSS_ORDER_CANCEL_REPLACE_REQUEST: str = "t"
-        NEW_ORDER_s: str = "s"
-        NEW_ORDER_AB: str = "AB"
-        ORDER_CANCEL_REJECT: str = "9"
-        ADVERTISEMENT: str = "7"
-        LIST_STATUS_REQUEST: str = "M"
-        ORDER_LIST: str = "E"
-        ORDER_SINGLE: str = "D"
-        EMAIL: str = "C"
-        NEWS: str = "B"
-        LOGON: str = "A"
-        LIST_STATUS: str = "N"
-        SECURITY_STATUS: str = "f"
-        ALLOCATION_ACK: str = "P"
-        EXECUTION_REPORT: str = "8"
-        HEARTBEAT: str = "0"
-        TEST_REQUEST: str = "1"
-        RESEND_REQUEST: str = "2"
-        REJECT: str = "3"
-        SEQUENCE_RESET: str = "4"
-        LOGOUT: str = "5"
-        INDICATION_OF_INTEREST: str = "6"
-        ORDER_CANCEL_REPLACE_REQUEST: str = "G"
-        LIST_CANCEL_REQUEST: str = "K"
-        SECURITY_STATUS_REQUEST: str = "e"
-        SECURITY_DEFINITION: str = "d"
-        SECURITY_DEFINITION_REQUEST: str = "c"
-        MASS_QUOTE_ACKNOWLEDGEMENT: str = "b"
-        QUOTE_STATUS_REQUEST: str = "a"
-        QUOTE_CANCEL: str = "Z"
-        MARKET_DATA_REQUEST_REJECT: str = "Y"
-        ORDER_CANCEL_REQUEST: str = "F"
-        ALLOCATION: str = "J"
-        REGISTRATION_INSTRUCTIONS_RESPONSE: str = "p"
-        LIST_EXECUTE: str = "L"
-        MARKET_DATA_INCREMENTAL_REFRESH: str = "X"
-        MARKET_DATA_SNAPSHOT_FULL_REFRESH: str = "W"
-        MARKET_DATA_REQUEST: str = "V"
-        SETTLEMENT_INSTRUCTIONS: str = "T"
-        QUOTE: str = "S"
-        QUOTE_REQUEST: str = "R"
-        DONT_KNOW_TRADE: str = "Q"
-        ORDER_STATUS_REQUEST: str = "H"
-
-    # NewSeqNo(36): SEQNUM
-    class NewSeqNo:
-        tag: int = 36
-
-    # OrderID(37): STRING
-    class OrderID:
-        tag: int = 37
-
-    # OrderQty(38): QTY
-    class OrderQty:
-        tag: int = 38
-
-    # OrdStatus(39): CHAR
-    class OrdStatus:
-        tag: int = 39
-        NEW: str = '0'
-        PARTIALLY_FILLED: str = '1'
-        REPLACED: str = '5'
-        FILLED: str = '2'
-        PENDING_CANCEL: str = '6'
-        STOPPED: str = '7'
-        REJECTED: str = '8'
-        SUSPENDED: str = '9'
-        PENDING_NEW: str = 'A'
-        CALCULATED: str = 'B'
-        EXPIRED: str = 'C'
-        ACCEPTED_FOR_BIDDING: str = 'D'
-        PENDING_REPLACE: str = 'E'
-        DONE_FOR_DAY: str = '3'
-        CANCELED: str = '4'
-
-    # OrdType(40): CHAR
-    class OrdType:
-        tag: int = 40
-        PREVIOUSLY_QUOTED: str = 'D'
-        LIMIT: str = '2'
-        STOP: str = '3'
-        STOP_LIMIT: str = '4'
-        MARKET_ON_CLOSE: str = '5'
-        WITH_OR_WITHOUT: str = '6'
-        LIMIT_OR_BETTER: str = '7'
-        LIMIT_WITH_OR_WITHOUT: str = '8'
-        ON_BASIS: str = '9'
-        ON_CLOSE: str = 'A'
-        MARKET: str = '1'
-        FOREX_C: str = 'C'
-        FOREX_F: str = 'F'
-        PREVIOUSLY_INDICATED: str = 'E'
-        FOREX_G: str = 'G'
-        FUNARI: str = 'I'
-        MARKET_IF_TOUCHED: str = 'J'
-        MARKET_WITH_LEFTOVER_AS_LIMIT: str = 'K'
-        PREVIOUS_FUND_VALUATION_POINT: str = 'L'
-        NEXT_FUND_VALUATION_POINT: str = 'M'
-        PEGGED: str = 'P'
-        LIMIT_ON_CLOSE: str = 'B'
-        FOREX_H: str = 'H'
-
-    # OrigClOrdID(41): STRING
-    class OrigClOrdID:
-        tag: int = 41
-
-    # OrigTime(42): UTCTIMESTAMP
-    class OrigTime:
-        tag: int = 42
-
-    # PossDupFlag(43): BOOLEAN
-    class PossDupFlag:
-        tag: int = 43
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # Price(44): PRICE
-    class Price:
-        tag: int = 44
-
-    # RefSeqNum(45): SEQNUM
-    class RefSeqNum:
-        tag: int = 45
-
-    # RelatdSym(46): STRING
-    class RelatdSym:
-        tag: int = 46
-
-    # Rule80A(47): CHAR
-    class Rule80A:
-        tag: int = 47
-        PROGRAM_ORDER_NON_INDEX_ARB_FOR_OTHER_MEMBER: str = 'N'
-        SHORT_EXEMPT_TRANSACTION_B: str = 'B'
-        PROGRAM_ORDER_INDEX_ARB_FOR_MEMBER_FIRM_ORG: str = 'D'
-        SHORT_EXEMPT_TRANSACTION_FOR_PRINCIPAL: str = 'E'
-        SHORT_EXEMPT_TRANSACTION_F: str = 'F'
-        SHORT_EXEMPT_TRANSACTION_H: str = 'H'
-        INDIVIDUAL_INVESTOR_SINGLE_ORDER: str = 'I'
-        PROGRAM_ORDER_INDEX_ARB_FOR_INDIVIDUAL_CUSTOMER: str = 'J'
-        PROGRAM_ORDER_NON_INDEX_ARB_FOR_INDIVIDUAL_CUSTOMER: str = 'K'
-        PROGRAM_ORDER_INDEX_ARB_FOR_OTHER_MEMBER: str = 'M'
-        AGENCY_SINGLE_ORDER: str = 'A'
-        PROPRIETARY_TRANSACTIONS_FOR_COMPETING_MARKET_MAKER_THAT_IS_AFFILIATED_WITH_THE_CLEARING_MEMBER: str = 'O'
-        PRINCIPAL: str = 'P'
-        TRANSACTIONS_FOR_THE_ACCOUNT_OF_A_NON_MEMBER_COMPETING_MARKET_MAKER: str = 'R'
-        SPECIALIST_TRADES: str = 'S'
-        TRANSACTIONS_FOR_THE_ACCOUNT_OF_AN_UNAFFILIATED_MEMBERS_COMPETING_MARKET_MAKER: str = 'T'
-        PROGRAM_ORDER_INDEX_ARB_FOR_OTHER_AGENCY: str = 'U'
-        ALL_OTHER_ORDERS_AS_AGENT_FOR_OTHER_MEMBER: str = 'W'
-        SHORT_EXEMPT_TRANSACTION_FOR_MEMBER_COMPETING_MARKET_MAKER_NOT_AFFILIATED_WITH_THE_FIRM_CLEARING_THE_TRADE: str = 'X'
-        PROGRAM_ORDER_NON_INDEX_ARB_FOR_OTHER_AGENCY: str = 'Y'
-        SHORT_EXEMPT_TRANSACTION_FOR_NON_MEMBER_COMPETING_MARKET_MAKER: str = 'Z'
-        SHORT_EXEMPT_TRANSACTION_FOR_MEMBER_COMPETING_MARKET_MAKER_AFFILIATED_WITH_THE_FIRM_CLEARING_THE_TRADE: str = 'L'
-        PROGRAM_ORDER_NON_INDEX_ARB_FOR_MEMBER_FIRM_ORG: str = 'C'
-
-    # SecurityID(48): STRING
-    class SecurityID:
-        tag: int = 48
-
-    # SenderCompID(49): STRING
-    class SenderCompID:
-        tag: int = 49
-
-    # SenderSubID(50): STRING
-    class SenderSubID:
-        tag: int = 50
-
-    # SendingDate(51): LOCALMKTDATE
-    class SendingDate:
-        tag: int = 51
-
-    # SendingTime(52): UTCTIMESTAMP
-    class SendingTime:
-        tag: int = 52
-
-    # Quantity(53): QTY
-    class Quantity:
-        tag: int = 53
-
-    # Side(54): CHAR
-    class Side:
-        tag: int = 54
-        SELL_SHORT_EXEMPT: str = '6'
-        AS_DEFINED: str = 'B'
-        OPPOSITE: str = 'C'
-        CROSS: str = '8'
-        CROSS_SHORT: str = '9'
-        BUY: str = '1'
-        SELL: str = '2'
-        BUY_MINUS: str = '3'
-        SELL_PLUS: str = '4'
-        CROSS_SHORT_EXEMPT: str = 'A'
-        SELL_SHORT: str = '5'
-        UNDISCLOSED: str = '7'
-
-    # Symbol(55): STRING
-    class Symbol:
-        tag: int = 55
-
-    # TargetCompID(56): STRING
-    class TargetCompID:
-        tag: int = 56
-
-    # TargetSubID(57): STRING
-    class TargetSubID:
-        tag: int = 57
-
-    # Text(58): STRING
-    class Text:
-        tag: int = 58
-
-    # TimeInForce(59): CHAR
-    class TimeInForce:
-        tag: int = 59
-        AT_THE_CLOSE: str = '7'
-        DAY: str = '0'
-        GOOD_TILL_CANCEL: str = '1'
-        AT_THE_OPENING: str = '2'
-        IMMEDIATE_OR_CANCEL: str = '3'
-        FILL_OR_KILL: str = '4'
-        GOOD_TILL_CROSSING: str = '5'
-        GOOD_TILL_DATE: str = '6'
-
-    # TransactTime(60): UTCTIMESTAMP
-    class TransactTime:
-        tag: int = 60
-
-    # Urgency(61): CHAR
-    class Urgency:
-        tag: int = 61
-        FLASH: str = '1'
-        BACKGROUND: str = '2'
-        NORMAL: str = '0'
-
-    # ValidUntilTime(62): UTCTIMESTAMP
-    class ValidUntilTime:
-        tag: int = 62
-
-    # SettlmntTyp(63): CHAR
-    class SettlmntTyp:
-        tag: int = 63
-        T_PLUS_4: str = '5'
-        T_PLUS_1: str = 'A'
-        FUTURE: str = '6'
-        T_PLUS_2: str = '3'
-        NEXT_DAY: str = '2'
-        SELLERS_OPTION: str = '8'
-        CASH: str = '1'
-        WHEN_AND_IF_ISSUED: str = '7'
-        REGULAR: str = '0'
-        T_PLUS_5: str = '9'
-        T_PLUS_3: str = '4'
-
-    # FutSettDate(64): LOCALMKTDATE
-    class FutSettDate:
-        tag: int = 64
-
-    # SymbolSfx(65): STRING
-    class SymbolSfx:
-        tag: int = 65
-
-    # ListID(66): STRING
-    class ListID:
-        tag: int = 66
-
-    # ListSeqNo(67): INT
-    class ListSeqNo:
-        tag: int = 67
-
-    # TotNoOrders(68): INT
-    class TotNoOrders:
-        tag: int = 68
-
-    # ListExecInst(69): STRING
-    class ListExecInst:
-        tag: int = 69
-
-    # AllocID(70): STRING
-    class AllocID:
-        tag: int = 70
-
-    # AllocTransType(71): CHAR
-    class AllocTransType:
-        tag: int = 71
-        CALCULATED_WITHOUT_PRELIMINARY: str = '5'
-        CALCULATED: str = '4'
-        PRELIMINARY: str = '3'
-        CANCEL: str = '2'
-        REPLACE: str = '1'
-        NEW: str = '0'
-
-    # RefAllocID(72): STRING
-    class RefAllocID:
-        tag: int = 72
-
-    # NoOrders(73): NUMINGROUP
-    class NoOrders:
-        tag: int = 73
-
-    # AvgPrxPrecision(74): INT
-    class AvgPrxPrecision:
-        tag: int = 74
-
-    # TradeDate(75): LOCALMKTDATE
-    class TradeDate:
-        tag: int = 75
-
-    # ExecBroker(76): STRING
-    class ExecBroker:
-        tag: int = 76
-
-    # PositionEffect(77): CHAR
-    class PositionEffect:
-        tag: int = 77
-        FIFO: str = 'F'
-        ROLLED: str = 'R'
-        CLOSE: str = 'C'
-        OPEN: str = 'O'
-
-    # NoAllocs(78): NUMINGROUP
-    class NoAllocs:
-        tag: int = 78
-
-    # AllocAccount(79): STRING
-    class AllocAccount:
-        tag: int = 79
-
-    # AllocQty(80): QTY
-    class AllocQty:
-        tag: int = 80
-
-    # ProcessCode(81): CHAR
-    class ProcessCode:
-        tag: int = 81
-        PLAN_SPONSOR: str = '6'
-        REGULAR: str = '0'
-        SOFT_DOLLAR: str = '1'
-        STEP_IN: str = '2'
-        STEP_OUT: str = '3'
-        SOFT_DOLLAR_STEP_IN: str = '4'
-        SOFT_DOLLAR_STEP_OUT: str = '5'
-
-    # NoRpts(82): NUMINGROUP
-    class NoRpts:
-        tag: int = 82
-
-    # RptSeq(83): INT
-    class RptSeq:
-        tag: int = 83
-
-    # CxlQty(84): QTY
-    class CxlQty:
-        tag: int = 84
-
-    # NoDlvyInst(85): INT
-    class NoDlvyInst:
-        tag: int = 85
-
-    # DlvyInst(86): STRING
-    class DlvyInst:
-        tag: int = 86
-
-    # AllocStatus(87): INT
-    class AllocStatus:
-        tag: int = 87
-        REJECTED: int = 1
-        PARTIAL_ACCEPT: int = 2
-        RECEIVED: int = 3
-        ACCEPTED: int = 0
-
-    # AllocRejCode(88): INT
-    class AllocRejCode:
-        tag: int = 88
-        UNKNOWN_ACCOUNT: int = 0
-        UNKNOWN_LISTID: int = 6
-        UNKNOWN_EXECUTING_BROKER_MNEMONIC: int = 3
-        UNKNOWN_ORDERID: int = 5
-        OTHER: int = 7
-        COMMISSION_DIFFERENCE: int = 4
-        INCORRECT_QUANTITY: int = 1
-        INCORRECT_AVERAGE_PRICE: int = 2
-
-    # Signature(89): DATA
-    class Signature:
-        tag: int = 89
-
-    # SecureDataLen(90): LENGTH
-    class SecureDataLen:
-        tag: int = 90
-
-    # SecureData(91): DATA
-    class SecureData:
-        tag: int = 91
-
-    # BrokerOfCredit(92): STRING
-    class BrokerOfCredit:
-        tag: int = 92
-
-    # SignatureLength(93): LENGTH
-    class SignatureLength:
-        tag: int = 93
-
-    # EmailType(94): CHAR
-    class EmailType:
-        tag: int = 94
-        NEW: str = '0'
-        REPLY: str = '1'
-        ADMIN_REPLY: str = '2'
-
-    # RawDataLength(95): LENGTH
-    class RawDataLength:
-        tag: int = 95
-
-    # RawData(96): DATA
-    class RawData:
-        tag: int = 96
-
-    # PossResend(97): BOOLEAN
-    class PossResend:
-        tag: int = 97
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # EncryptMethod(98): INT
-    class EncryptMethod:
-        tag: int = 98
-        DES: int = 2
-        PEM_DES_MD5: int = 6
-        PGP_DES_MD5: int = 5
-        PKCS_DES: int = 3
-        NONE: int = 0
-        PKCS: int = 1
-        PGP_DES: int = 4
-
-    # StopPx(99): PRICE
-    class StopPx:
-        tag: int = 99
-
-    # ExDestination(100): EXCHANGE
-    class ExDestination:
-        tag: int = 100
-
-    # CxlRejReason(102): INT
-    class CxlRejReason:
-        tag: int = 102
-        UNKNOWN_ORDER: int = 1
-        TOO_LATE_TO_CANCEL: int = 0
-        DUPLICATE_CLORDID_RECEIVED: int = 6
-        ORIGORDMODTIME_DID_NOT_MATCH_LAST_TRANSACTTIME_OF_ORDER: int = 5
-        UNABLE_TO_PROCESS_ORDER_MASS_CANCEL_REQUEST: int = 4
-        ORDER_ALREADY_IN_PENDING_CANCEL_OR_PENDING_REPLACE_STATUS: int = 3
-        BROKER: int = 2
-
-    # OrdRejReason(103): INT
-    class OrdRejReason:
-        tag: int = 103
-        EXCHANGE_CLOSED: int = 2
-        UNKNOWN_SYMBOL: int = 1
-        ORDER_EXCEEDS_LIMIT: int = 3
-        TOO_LATE_TO_ENTER: int = 4
-        UNKNOWN_ORDER: int = 5
-        DUPLICATE_OF_A_VERBALLY_COMMUNICATED_ORDER: int = 7
-        TRADE_ALONG_REQUIRED: int = 9
-        INVALID_INVESTOR_ID: int = 10
-        DUPLICATE_ORDER: int = 6
-        UNSUPPORTED_ORDER_CHARACTERISTIC: int = 11
-        SURVEILLENCE_OPTION: int = 12
-        BROKER: int = 0
-        STALE_ORDER: int = 8
-
-    # IOIQualifier(104): CHAR
-    class IOIQualifier:
-        tag: int = 104
-        AT_THE_OPEN: str = 'O'
-        CROSSING_OPPORTUNITY: str = 'X'
-        INDICATION: str = 'W'
-        VERSUS: str = 'V'
-        THROUGH_THE_DAY: str = 'T'
-        PORTFOLIO_SHOWN: str = 'S'
-        READY_TO_TRADE: str = 'R'
-        ALL_OR_NONE: str = 'A'
-        TAKING_A_POSITION: str = 'P'
-        MORE_BEHIND: str = 'M'
-        LIMIT: str = 'L'
-        IN_TOUCH_WITH: str = 'I'
-        VWAP: str = 'D'
-        AT_THE_CLOSE: str = 'C'
-        MARKET_ON_CLOSE: str = 'B'
-        AT_THE_MARKET: str = 'Q'
-        AT_THE_MIDPOINT: str = 'Y'
-        PRE_OPEN: str = 'Z'
-
-    # WaveNo(105): STRING
-    class WaveNo:
-        tag: int = 105
-
-    # Issuer(106): STRING
-    class Issuer:
-        tag: int = 106
-
-    # SecurityDesc(107): STRING
-    class SecurityDesc:
-        tag: int = 107
-
-    # HeartBtInt(108): INT
-    class HeartBtInt:
-        tag: int = 108
-
-    # ClientID(109): STRING
-    class ClientID:
-        tag: int = 109
-
-    # MinQty(110): QTY
-    class MinQty:
-        tag: int = 110
-
-    # MaxFloor(111): QTY
-    class MaxFloor:
-        tag: int = 111
-
-    # TestReqID(112): STRING
-    class TestReqID:
-        tag: int = 112
-
-    # ReportToExch(113): BOOLEAN
-    class ReportToExch:
-        tag: int = 113
-        YES: str = 'Y'
-        NO: str = 'N'
-
-    # LocateReqd(114): BOOLEAN
-    class LocateReqd:
-        tag: int = 114
-        YES: str = 'Y'
-        NO: str = 'N'
-
-    # OnBehalfOfCompID(115): STRING
-    class OnBehalfOfCompID:
-        tag: int = 115
-
-    # OnBehalfOfSubID(116): STRING
-    class OnBehalfOfSubID:
-        tag: int = 116
-
-    # QuoteID(117): STRING
-    class QuoteID:
-        tag: int = 117
-
-    # NetMoney(118): AMT
-    class NetMoney:
-        tag: int = 118
-
-    # SettlCurrAmt(119): AMT
-    class SettlCurrAmt:
-        tag: int = 119
-
-    # SettlCurrency(120): CURRENCY
-    class SettlCurrency:
-        tag: int = 120
-
-    # ForexReq(121): BOOLEAN
-    class ForexReq:
-        tag: int = 121
-        YES: str = 'Y'
-        NO: str = 'N'
-
-    # OrigSendingTime(122): UTCTIMESTAMP
-    class OrigSendingTime:
-        tag: int = 122
-
-    # GapFillFlag(123): BOOLEAN
-    class GapFillFlag:
-        tag: int = 123
-        YES: str = 'Y'
-        NO: str = 'N'
-
-    # NoExecs(124): NUMINGROUP
-    class NoExecs:
-        tag: int = 124
-
-    # CxlType(125): CHAR
-    class CxlType:
-        tag: int = 125
-
-    # ExpireTime(126): UTCTIMESTAMP
-    class ExpireTime:
-        tag: int = 126
-
-    # DKReason(127): CHAR
-    class DKReason:
-        tag: int = 127
-        WRONG_SIDE: str = 'B'
-        QUANTITY_EXCEEDS_ORDER: str = 'C'
-        NO_MATCHING_ORDER: str = 'D'
-        PRICE_EXCEEDS_LIMIT: str = 'E'
-        OTHER: str = 'Z'
-        UNKNOWN_SYMBOL: str = 'A'
-
-    # DeliverToCompID(128): STRING
-    class DeliverToCompID:
-        tag: int = 128
-
-    # DeliverToSubID(129): STRING
-    class DeliverToSubID:
-        tag: int = 129
-
-    # IOINaturalFlag(130): BOOLEAN
-    class IOINaturalFlag:
-        tag: int = 130
-        YES: str = 'Y'
-        NO: str = 'N'
-
-    # QuoteReqID(131): STRING
-    class QuoteReqID:
-        tag: int = 131
-
-    # BidPx(132): PRICE
-    class BidPx:
-        tag: int = 132
-
-    # OfferPx(133): PRICE
-    class OfferPx:
-        tag: int = 133
-
-    # BidSize(134): QTY
-    class BidSize:
-        tag: int = 134
-
-    # OfferSize(135): QTY
-    class OfferSize:
-        tag: int = 135
-
-    # NoMiscFees(136): NUMINGROUP
-    class NoMiscFees:
-        tag: int = 136
-
-    # MiscFeeAmt(137): AMT
-    class MiscFeeAmt:
-        tag: int = 137
-
-    # MiscFeeCurr(138): CURRENCY
-    class MiscFeeCurr:
-        tag: int = 138
-
-    # MiscFeeType(139): CHAR
-    class MiscFeeType:
-        tag: int = 139
-        LOCAL_COMMISSION: str = '3'
-        EXCHANGE_FEES: str = '4'
-        STAMP: str = '5'
-        LEVY: str = '6'
-        OTHER: str = '7'
-        MARKUP: str = '8'
-        CONSUMPTION_TAX: str = '9'
-        REGULATORY: str = '1'
-        TAX: str = '2'
-
-    # PrevClosePx(140): PRICE
-    class PrevClosePx:
-        tag: int = 140
-
-    # ResetSeqNumFlag(141): BOOLEAN
-    class ResetSeqNumFlag:
-        tag: int = 141
-        YES: str = 'Y'
-        NO: str = 'N'
-
-    # SenderLocationID(142): STRING
-    class SenderLocationID:
-        tag: int = 142
-
-    # TargetLocationID(143): STRING
-    class TargetLocationID:
-        tag: int = 143
-
-    # OnBehalfOfLocationID(144): STRING
-    class OnBehalfOfLocationID:
-        tag: int = 144
-
-    # DeliverToLocationID(145): STRING
-    class DeliverToLocationID:
-        tag: int = 145
-
-    # NoRelatedSym(146): NUMINGROUP
-    class NoRelatedSym:
-        tag: int = 146
-
-    # Subject(147): STRING
-    class Subject:
-        tag: int = 147
-
-    # Headline(148): STRING
-    class Headline:
-        tag: int = 148
-
-    # URLLink(149): STRING
-    class URLLink:
-        tag: int = 149
-
-    # ExecType(150): CHAR
-    class ExecType:
-        tag: int = 150
-        PENDING_CANCEL: str = '6'
-        NEW: str = '0'
-        PARTIAL_FILL: str = '1'
-        FILL: str = '2'
-        CANCELED: str = '4'
-        REPLACE: str = '5'
-        REJECTED: str = '8'
-        SUSPENDED: str = '9'
-        PENDING_NEW: str = 'A'
-        CALCULATED: str = 'B'
-        EXPIRED: str = 'C'
-        RESTATED: str = 'D'
-        PENDING_REPLACE: str = 'E'
-        TRADE: str = 'F'
-        TRADE_CORRECT: str = 'G'
-        TRADE_CANCEL: str = 'H'
-        ORDER_STATUS: str = 'I'
-        DONE_FOR_DAY: str = '3'
-        STOPPED: str = '7'
-
-    # LeavesQty(151): QTY
-    class LeavesQty:
-        tag: int = 151
-
-    # CashOrderQty(152): QTY
-    class CashOrderQty:
-        tag: int = 152
-
-    # AllocAvgPx(153): PRICE
-    class AllocAvgPx:
-        tag: int = 153
-
-    # AllocNetMoney(154): AMT
-    class AllocNetMoney:
-        tag: int = 154
-
-    # SettlCurrFxRate(155): FLOAT
-    class SettlCurrFxRate:
-        tag: int = 155
-
-    # SettlCurrFxRateCalc(156): CHAR
-    class SettlCurrFxRateCalc:
-        tag: int = 156
-        DIVIDE: str = 'D'
-        MULTIPLY: str = 'M'
-
-    # NumDaysInterest(157): INT
-    class NumDaysInterest:
-        tag: int = 157
-
-    # AccruedInterestRate(158): PERCENTAGE
-    class AccruedInterestRate:
-        tag: int = 158
-
-    # AccruedInterestAmt(159): AMT
-    class AccruedInterestAmt:
-        tag: int = 159
-
-    # SettlInstMode(160): CHAR
-    class SettlInstMode:
-        tag: int = 160
-        DEFAULT: str = '0'
-        SPECIFIC_ORDER_FOR_A_SINGLE_ACCOUNT: str = '4'
-        SPECIFIC_ALLOCATION_ACCOUNT_STANDING: str = '3'
-        STANDING_INSTRUCTIONS_PROVIDED: str = '1'
-        SPECIFIC_ALLOCATION_ACCOUNT_OVERRIDING: str = '2'
-
-    # AllocText(161): STRING
-    class AllocText:
-        tag: int = 161
-
-    # SettlInstID(162): STRING
-    class SettlInstID:
-        tag: int = 162
-
-    # SettlInstTransType(163): CHAR
-    class SettlInstTransType:
-        tag: int = 163
-        NEW: str = 'N'
-        REPLACE: str = 'R'
-        CANCEL: str = 'C'
-
-    # EmailThreadID(164): STRING
-    class EmailThreadID:
-        tag: int = 164
-
-    # SettlInstSource(165): CHAR
-    class SettlInstSource:
-        tag: int = 165
-        INSTITUTIONS_INSTRUCTIONS: str = '2'
-        INVESTOR: str = '3'
-        BROKERS_INSTRUCTIONS: str = '1'
-
-    # SettlLocation(166): STRING
-    class SettlLocation:
-        tag: int = 166
-        FEDERAL_BOOK_ENTRY: str = "FED"
-        LOCAL_MARKET_SETTLE_LOCATION: str = "ISO Country Code"
-        PHYSICAL: str = "PNY"
-        EUROCLEAR: str = "EUR"
-        DEPOSITORY_TRUST_COMPANY: str = "DTC"
-        CEDEL: str = "CED"
-        PARTICIPANT_TRUST_COMPANY: str = "PTC"
-
-    # SecurityType(167): STRING
-    class SecurityType:
-        tag: int = 167
-        COMMERCIAL_PAPER: str = "CP"
-        VARIABLE_RATE_DEMAND_NOTE: str = "VRDN"
-        PLAZOS_FIJOS: str = "PZFJ"
-        PROMISSORY_NOTE: str = "PN"
-        OVERNIGHT: str = "ONITE"
-        MEDIUM_TERM_NOTES: str = "MTN"
-        TAX_EXEMPT_COMMERCIAL_PAPER: str = "TECP"
-        AMENDED_RESTATED: str = "AMENDED"
-        BRIDGE_LOAN: str = "BRIDGE"
-        LETTER_OF_CREDIT: str = "LOFC"
-        SWING_LINE_FACILITY: str = "SWING"
-        DEBTOR_IN_POSSESSION: str = "DINP"
-        DEFAULTED: str = "DEFLTED"
-        WITHDRAWN: str = "WITHDRN"
-        LIQUIDITY_NOTE: str = "LQN"
-        MATURED: str = "MATURED"
-        DEPOSIT_NOTES: str = "DN"
-        RETIRED: str = "RETIRED"
-        BANKERS_ACCEPTANCE: str = "BA"
-        BANK_NOTES: str = "BN"
-        BILL_OF_EXCHANGES: str = "BOX"
-        CERTIFICATE_OF_DEPOSIT: str = "CD"
-        CALL_LOANS: str = "CL"
-        REPLACED: str = "REPLACD"
-        MANDATORY_TENDER: str = "MT"
-        REVOLVER_TERM_LOAN: str = "RVLVTRM"
-        MORTGAGE_PRIVATE_PLACEMENT: str = "MPP"
-        SHORT_TERM_LOAN_NOTE: str = "STN"
-        MISCELLANEOUS_PASS_THROUGH: str = "MPT"
-        TO_BE_ANNOUNCED: str = "TBA"
-        OTHER_ANTICIPATION_NOTES_BAN_GAN_ETC: str = "AN"
-        MORTGAGE_INTEREST_ONLY: str = "MIO"
-        CERTIFICATE_OF_PARTICIPATION: str = "COFP"
-        MORTGAGE_BACKED_SECURITIES: str = "MBS"
-        REVENUE_BONDS: str = "REV"
-        SPECIAL_ASSESSMENT: str = "SPCLA"
-        SPECIAL_OBLIGATION: str = "SPCLO"
-        SPECIAL_TAX: str = "SPCLT"
-        TAX_ANTICIPATION_NOTE: str = "TAN"
-        TAX_ALLOCATION: str = "TAXA"
-        CERTIFICATE_OF_OBLIGATION: str = "COFO"
-        TIME_DEPOSIT: str = "TD"
-        GENERAL_OBLIGATION_BONDS: str = "GO"
-        WILDCARD_ENTRY: str = "?"
-        WARRANT: str = "WAR"
-        MUTUAL_FUND: str = "MF"
-        MULTI_LEG_INSTRUMENT: str = "MLEG"
-        TAX_REVENUE_ANTICIPATION_NOTE: str = "TRAN"
-        MORTGAGE_PRINCIPAL_ONLY: str = "MPO"
-        REPURCHASE_AGREEMENT: str = "RP"
-        NO_SECURITY_TYPE: str = "NONE"
-        EXTENDED_COMM_NOTE: str = "XCN"
-        AGENCY_POOLS: str = "POOL"
-        ASSET_BACKED_SECURITIES: str = "ABS"
-        CORP_MORTGAGE_BACKED_SECURITIES: str = "CMBS"
-        COLLATERALIZED_MORTGAGE_OBLIGATION: str = "CMO"
-        IOETTE_MORTGAGE: str = "IET"
-        REVERSE_REPURCHASE_AGREEMENT: str = "RVRP"
-        FOREIGN_EXCHANGE_CONTRACT: str = "FOR"
-        REVENUE_ANTICIPATION_NOTE: str = "RAN"
-        REVOLVER_LOAN: str = "RVLV"
-        FEDERAL_AGENCY_COUPON: str = "FAC"
-        FEDERAL_AGENCY_DISCOUNT_NOTE: str = "FADN"
-        PRIVATE_EXPORT_FUNDING: str = "PEF"
-        CORPORATE_BOND: str = "CORP"
-        CORPORATE_PRIVATE_PLACEMENT: str = "CPP"
-        CONVERTIBLE_BOND: str = "CB"
-        DUAL_CURRENCY: str = "DUAL"
-        INDEXED_LINKED: str = "XLINKD"
-        YANKEE_CORPORATE_BOND: str = "YANK"
-        COMMON_STOCK: str = "CS"
-        PREFERRED_STOCK: str = "PS"
-        BRADY_BOND: str = "BRADY"
-        US_TREASURY_BOND: str = "TBOND"
-        INTEREST_STRIP_FROM_ANY_BOND_OR_NOTE: str = "TINT"
-        TREASURY_INFLATION_PROTECTED_SECURITIES: str = "TIPS"
-        PRINCIPAL_STRIP_OF_A_CALLABLE_BOND_OR_NOTE: str = "TCAL"
-        PRINCIPAL_STRIP_FROM_A_NON_CALLABLE_BOND_OR_NOTE: str = "TPRN"
-        US_TREASURY_NOTE_BOND: str = "UST"
-        US_TREASURY_BILL: str = "USTB"
-        TERM_LOAN: str = "TERM"
-        STRUCTURED_NOTES: str = "STRUCT"
-
-    # EffectiveTime(168): UTCTIMESTAMP
-    class EffectiveTime:
-        tag: int = 168
-
-    # StandInstDbType(169): INT
-    class StandInstDbType:
-        tag: int = 169
-        OTHER: int = 0
-        DTC_SID: int = 1
-        A_GLOBAL_CUSTODIAN: int = 3
-        THOMSON_ALERT: int = 2
-
-    # StandInstDbName(170): STRING
-    class StandInstDbName:
-        tag: int = 170
-
-    # StandInstDbID(171): STRING
-    class StandInstDbID:
-        tag: int = 171
-
-    # SettlDeliveryType(172): INT
-    class SettlDeliveryType:
-        tag: int = 172
-        FREE: int = 1
-        VERSUS_PAYMENT: int = 0
-
-    # SettlDepositoryCode(173): STRING
-    class SettlDepositoryCode:
-        tag: int = 173
-
-    # SettlBrkrCode(174): STRING
-    class SettlBrkrCode:
-        tag: int = 174
-
-    # SettlInstCode(175): STRING
-    class SettlInstCode:
-        tag: int = 175
-
-    # SecuritySettlAgentName(176): STRING
-    class SecuritySettlAgentName:
-        tag: int = 176
-
-    # SecuritySettlAgentCode(177): STRING
-    class SecuritySettlAgentCode:
-        tag: int = 177
-
-    # SecuritySettlAgentAcctNum(178): STRING
-    class SecuritySettlAgentAcctNum:
-        tag: int = 178
-
-    # SecuritySettlAgentAcctName(179): STRING
-    class SecuritySettlAgentAcctName:
-        tag: int = 179
-
-    # SecuritySettlAgentContactName(180): STRING
-    class SecuritySettlAgentContactName:
-        tag: int = 180
-
-    # SecuritySettlAgentContactPhone(181): STRING
-    class SecuritySettlAgentContactPhone:
-        tag: int = 181
-
-    # CashSettlAgentName(182): STRING
-    class CashSettlAgentName:
-        tag: int = 182
-
-    # CashSettlAgentCode(183): STRING
-    class CashSettlAgentCode:
-        tag: int = 183
-
-    # CashSettlAgentAcctNum(184): STRING
-    class CashSettlAgentAcctNum:
-        tag: int = 184
-
-    # CashSettlAgentAcctName(185): STRING
-    class CashSettlAgentAcctName:
-        tag: int = 185
-
-    # CashSettlAgentContactName(186): STRING
-    class CashSettlAgentContactName:
-        tag: int = 186
-
-    # CashSettlAgentContactPhone(187): STRING
-    class CashSettlAgentContactPhone:
-        tag: int = 187
-
-    # BidSpotRate(188): PRICE
-    class BidSpotRate:
-        tag: int = 188
-
-    # BidForwardPoints(189): PRICEOFFSET
-    class BidForwardPoints:
-        tag: int = 189
-
-    # OfferSpotRate(190): PRICE
-    class OfferSpotRate:
-        tag: int = 190
-
-    # OfferForwardPoints(191): PRICEOFFSET
-    class OfferForwardPoints:
-        tag: int = 191
-
-    # OrderQty2(192): QTY
-    class OrderQty2:
-        tag: int = 192
-
-    # FutSettDate2(193): LOCALMKTDATE
-    class FutSettDate2:
-        tag: int = 193
-
-    # LastSpotRate(194): PRICE
-    class LastSpotRate:
-        tag: int = 194
-
-    # LastForwardPoints(195): PRICEOFFSET
-    class LastForwardPoints:
-        tag: int = 195
-
-    # AllocLinkID(196): STRING
-    class AllocLinkID:
-        tag: int = 196
-
-    # AllocLinkType(197): INT
-    class AllocLinkType:
-        tag: int = 197
-        F_X_NETTING: int = 0
-        F_X_SWAP: int = 1
-
-    # SecondaryOrderID(198): STRING
-    class SecondaryOrderID:
-        tag: int = 198
-
-    # NoIOIQualifiers(199): NUMINGROUP
-    class NoIOIQualifiers:
-        tag: int = 199
-
-    # MaturityMonthYear(200): MONTHYEAR
-    class MaturityMonthYear:
-        tag: int = 200
-
-    # PutOrCall(201): INT
-    class PutOrCall:
-        tag: int = 201
-        PUT: int = 0
-        CALL: int = 1
-
-    # StrikePrice(202): PRICE
-    class StrikePrice:
-        tag: int = 202
-
-    # CoveredOrUncovered(203): INT
-    class CoveredOrUncovered:
-        tag: int = 203
-        UNCOVERED: int = 1
-        COVERED: int = 0
-
-    # CustomerOrFirm(204): INT
-    class CustomerOrFirm:
-        tag: int = 204
-        CUSTOMER: int = 0
-        FIRM: int = 1
-
-    # MaturityDay(205): DAYOFMONTH
-    class MaturityDay:
-        tag: int = 205
-
-    # OptAttribute(206): CHAR
-    class OptAttribute:
-        tag: int = 206
-
-    # SecurityExchange(207): EXCHANGE
-    class SecurityExchange:
-        tag: int = 207
-
-    # NotifyBrokerOfCredit(208): BOOLEAN
-    class NotifyBrokerOfCredit:
-        tag: int = 208
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # AllocHandlInst(209): INT
-    class AllocHandlInst:
-        tag: int = 209
-        FORWARD_AND_MATCH: int = 3
-        FORWARD: int = 2
-        MATCH: int = 1
-
-    # MaxShow(210): QTY
-    class MaxShow:
-        tag: int = 210
-
-    # PegDifference(211): PRICEOFFSET
-    class PegDifference:
-        tag: int = 211
-
-    # XmlDataLen(212): LENGTH
-    class XmlDataLen:
-        tag: int = 212
-
-    # XmlData(213): DATA
-    class XmlData:
-        tag: int = 213
-
-    # SettlInstRefID(214): STRING
-    class SettlInstRefID:
-        tag: int = 214
-
-    # NoRoutingIDs(215): NUMINGROUP
-    class NoRoutingIDs:
-        tag: int = 215
-
-    # RoutingType(216): INT
-    class RoutingType:
-        tag: int = 216
-        TARGET_FIRM: int = 1
-        TARGET_LIST: int = 2
-        BLOCK_FIRM: int = 3
-        BLOCK_LIST: int = 4
-
-    # RoutingID(217): STRING
-    class RoutingID:
-        tag: int = 217
-
-    # Spread(218): PRICEOFFSET
-    class Spread:
-        tag: int = 218
-
-    # Benchmark(219): CHAR
-    class Benchmark:
-        tag: int = 219
-        OLD_10: str = '5'
-        CURVE: str = '1'
-        _5_YR: str = '2'
-        _10_YR: str = '4'
-        _30_YR: str = '6'
-        OLD_30: str = '7'
-        _3_MO_LIBOR: str = '8'
-        _6_MO_LIBOR: str = '9'
-        OLD_5: str = '3'
-
-    # BenchmarkCurveCurrency(220): CURRENCY
-    class BenchmarkCurveCurrency:
-        tag: int = 220
-
-    # BenchmarkCurveName(221): STRING
-    class BenchmarkCurveName:
-        tag: int = 221
-        SWAP: str = "SWAP"
-        LIBID: str = "LIBID"
-        OTHER: str = "OTHER"
-        TREASURY: str = "Treasury"
-        EURIBOR: str = "Euribor"
-        PFANDBRIEFE: str = "Pfandbriefe"
-        FUTURESWAP: str = "FutureSWAP"
-        MUNIAAA: str = "MuniAAA"
-        LIBOR: str = "LIBOR"
-
-    # BenchmarkCurvePoint(222): STRING
-    class BenchmarkCurvePoint:
-        tag: int = 222
-
-    # CouponRate(223): PERCENTAGE
-    class CouponRate:
-        tag: int = 223
-
-    # CouponPaymentDate(224): UTCDATE
-    class CouponPaymentDate:
-        tag: int = 224
-
-    # IssueDate(225): UTCDATE
-    class IssueDate:
-        tag: int = 225
-
-    # RepurchaseTerm(226): INT
-    class RepurchaseTerm:
-        tag: int = 226
-
-    # RepurchaseRate(227): PERCENTAGE
-    class RepurchaseRate:
-        tag: int = 227
-
-    # Factor(228): FLOAT
-    class Factor:
-        tag: int = 228
-
-    # TradeOriginationDate(229): UTCDATE
-    class TradeOriginationDate:
-        tag: int = 229
-
-    # ExDate(230): UTCDATE
-    class ExDate:
-        tag: int = 230
-
-    # ContractMultiplier(231): FLOAT
-    class ContractMultiplier:
-        tag: int = 231
-
-    # NoStipulations(232): NUMINGROUP
-    class NoStipulations:
-        tag: int = 232
-
-    # StipulationType(233): STRING
-    class StipulationType:
-        tag: int = 233
-        ABSOLUTE_PREPAYMENT_SPEED: str = "ABS"
-        WEIGHTED_AVERAGE_LOAN_AGE: str = "WALA"
-        WEIGHTED_AVERAGE_MATURITY: str = "WAM"
-        CONSTANT_PREPAYMENT_RATE: str = "CPR"
-        FINAL_CPR_OF_HOME_EQUITY_PREPAYMENT_CURVE: str = "HEP"
-        WEIGHTED_AVERAGE_LIFE: str = "WAL"
-        OF_MANUFACTURED_HOUSING_PREPAYMENT_CURVE: str = "MHP"
-        SINGLE_MONTHLY_MORTALITY: str = "SMM"
-        MONTHLY_PREPAYMENT_RATE: str = "MPR"
-        OF_BMA_PREPAYMENT_CURVE: str = "PSA"
-        OF_PROSPECTUS_PREPAYMENT_CURVE: str = "PPC"
-        CONSTANT_PREPAYMENT_PENALTY: str = "CPP"
-        LOT_VARIANCE: str = "LOTVAR"
-        CONSTANT_PREPAYMENT_YIELD: str = "CPY"
-        WEIGHTED_AVERAGE_COUPON: str = "WAC"
-        YEAR_OF_ISSUE: str = "ISSUE"
-        MATURITY_YEAR: str = "MAT"
-        NUMBER_OF_PIECES: str = "PIECES"
-        POOLS_MAXIMUM: str = "PMAX"
-        POOLS_PER_MILLION: str = "PPM"
-        POOLS_PER_LOT: str = "PPL"
-        POOLS_PER_TRADE: str = "PPT"
-        PRODUCTION_YEAR: str = "PROD"
-        TRADE_VARIANCE: str = "TRDVAR"
-        GEOGRAPHICS: str = "GEOG"
-
-    # StipulationValue(234): STRING
-    class StipulationValue:
-        tag: int = 234
-
-    # YieldType(235): STRING
-    class YieldType:
-        tag: int = 235
-        TRUE_YIELD_THE_YIELD_CALCULATED_WITH_COUPON_DATES_MOVED_FROM_A_WEEKEND_OR_HOLIDAY_TO_THE_NEXT_VALID_SETTLEMENT_DATE: str = "TRUE"
-        PREVIOUS_CLOSE_YIELD_THE_YIELD_OF_A_BOND_BASED_ON_THE_CLOSING_PRICE_1_DAY_AGO: str = "PREVCLOSE"
-        YIELD_TO_LONGEST_AVERAGE: str = "LONGEST"
-        YIELD_TO_LONGEST_AVERAGE_LIFE_THE_YIELD_ASSUMING_ONLY_MANDATORY_SINKS_ARE_TAKEN_THIS_RESULTS_IN_A_LOWER_PAYDOWN_OF_DEBT_THE_YIELD_IS_THEN_CALCULATED_TO_THE_FINAL_PAYMENT_DATE: str = "LONGAVGLIFE"
-        YIELD_TO_MATURITY_THE_YIELD_OF_A_BOND_TO_ITS_MATURITY_DATE: str = "MATURITY"
-        MARK_TO_MARKET_YIELD_AN_ADJUSTMENT_IN_THE_VALUATION_OF_A_SECURITIES_PORTFOLIO_TO_REFLECT_THE_CURRENT_MARKET_VALUES_OF_THE_RESPECTIVE_SECURITIES_IN_THE_PORTFOLIO: str = "MARK"
-        OPEN_AVERAGE_YIELD_THE_AVERAGE_YIELD_OF_THE_RESPECTIVE_SECURITIES_IN_THE_PORTFOLIO: str = "OPENAVG"
-        YIELD_TO_NEXT_PUT_THE_YIELD_TO_THE_DATE_AT_WHICH_THE_BOND_HOLDER_CAN_NEXT_PUT_THE_BOND_TO_THE_ISSUER: str = "PUT"
-        PROCEEDS_YIELD_THE_CD_EQUIVALENT_YIELD_WHEN_THE_REMAINING_TIME_TO_MATURITY_IS_LESS_THAN_TWO_YEARS: str = "PROCEEDS"
-        SEMI_ANNUAL_YIELD_THE_YIELD_OF_A_BOND_WHOSE_COUPON_PAYMENTS_ARE_REINVESTED_SEMI_ANNUALLY: str = "SEMIANNUAL"
-        YIELD_TO_SHORTEST_AVERAGE_LIFE_SAME_AS_AVGLIFE_ABOVE: str = "SHORTAVGLIFE"
-        YIELD_TO_SHORTEST_AVERAGE: str = "SHORTEST"
-        SIMPLE_YIELD_THE_YIELD_OF_A_BOND_ASSUMING_NO_REINVESTMENT_OF_COUPON_PAYMENTS: str = "SIMPLE"
-        YIELD_TO_TENDER_DATE_THE_YIELD_ON_A_MUNICIPAL_BOND_TO_ITS_MANDATORY_TENDER_DATE: str = "TENDER"
-        YIELD_VALUE_OF_1_32_THE_AMOUNT_THAT_THE_YIELD_WILL_CHANGE_FOR_A_1_32ND_CHANGE_IN_PRICE: str = "VALUE1/32"
-        YIELD_TO_WORST_CONVENTION_THE_LOWEST_YIELD_TO_ALL_POSSIBLE_REDEMPTION_DATE_SCENARIOS: str = "WORST"
-        TAX_EQUIVALENT_YIELD_THE_AFTER_TAX_YIELD_GROSSED_UP_BY_THE_MAXIMUM_FEDERAL_TAX_RATE_OF_396_FOR_COMPARISON_TO_TAXABLE_YIELDS: str = "TAXEQUIV"
-        ANNUAL_YIELD_THE_ANNUAL_INTEREST_OR_DIVIDEND_INCOME_AN_INVESTMENT_EARNS_EXPRESSED_AS_A_PERCENTAGE_OF_THE_INVESTMENTS_TOTAL_VALUE: str = "ANNUAL"
-        CLOSING_YIELD_MOST_RECENT_YEAR_THE_YIELD_OF_A_BOND_BASED_ON_THE_CLOSING_PRICE_AS_OF_THE_MOST_RECENT_YEARS_END: str = "LASTYEAR"
-        YIELD_TO_NEXT_REFUND: str = "NEXTREFUND"
-        AFTER_TAX_YIELD: str = "AFTERTAX"
-        YIELD_AT_ISSUE: str = "ATISSUE"
-        YIELD_TO_AVERAGE_LIFE_THE_YIELD_ASSUMING_THAT_ALL_SINKS: str = "AVGLIFE"
-        YIELD_TO_AVERAGE_MATURITY: str = "AVGMATURITY"
-        BOOK_YIELD_THE_YIELD_OF_A_SECURITY_CALCULATED_BY_USING_ITS_BOOK_VALUE_INSTEAD_OF_THE_CURRENT_MARKET_PRICE_THIS_TERM_IS_TYPICALLY_USED_IN_THE_US_DOMESTIC_MARKET: str = "BOOK"
-        YIELD_TO_NEXT_CALL_THE_YIELD_OF_A_BOND_TO_THE_NEXT_POSSIBLE_CALL_DATE: str = "CALL"
-        YIELD_CHANGE_SINCE_CLOSE_THE_CHANGE_IN_THE_YIELD_SINCE_THE_PREVIOUS_DAYS_CLOSING_YIELD: str = "CHANGE"
-        COMPOUND_YIELD_THE_YIELD_OF_CERTAIN_JAPANESE_BONDS_BASED_ON_ITS_PRICE_CERTAIN_JAPANESE_BONDS_HAVE_IRREGULAR_FIRST_OR_LAST_COUPONS_AND_THE_YIELD_IS_CALCULATED_COMPOUND_FOR_THESE_IRREGULAR_PERIODS: str = "COMPOUND"
-        CURRENT_YIELD_ANNUAL_INTEREST_ON_A_BOND_DIVIDED_BY_THE_MARKET_VALUE_THE_ACTUAL_INCOME_RATE_OF_RETURN_AS_OPPOSED_TO_THE_COUPON_RATE_EXPRESSED_AS_A_PERCENTAGE: str = "CURRENT"
-        TRUE_GROSS_YIELD_YIELD_CALCULATED_USING_THE_PRICE_INCLUDING_ACCRUED_INTEREST_WHERE_COUPON_DATES_ARE_MOVED_FROM_HOLIDAYS_AND_WEEKENDS_TO_THE_NEXT_TRADING_DAY: str = "GROSS"
-        GOVERNMENT_EQUIVALENT_YIELD_ASK_YIELD_BASED_ON_SEMI_ANNUAL_COUPONS_COMPOUNDING_IN_ALL_PERIODS_AND_ACTUAL_ACTUAL_CALENDAR: str = "GOVTEQUIV"
-        YIELD_WITH_INFLATION_ASSUMPTION_BASED_ON_PRICE_THE_RETURN_AN_INVESTOR_WOULD_REQUIRE_ON_A_NORMAL_BOND_THAT_WOULD_MAKE_THE_REAL_RETURN_EQUAL_TO_THAT_OF_THE_INFLATION_INDEXED_BOND_ASSUMING_A_CONSTANT_INFLATION_RATE: str = "INFLATION"
-        INVERSE_FLOATER_BOND_YIELD_INVERSE_FLOATER_SEMI_ANNUAL_BOND_EQUIVALENT_RATE: str = "INVERSEFLOATER"
-        CLOSING_YIELD_MOST_RECENT_QUARTER_THE_YIELD_OF_A_BOND_BASED_ON_THE_CLOSING_PRICE_AS_OF_THE_MOST_RECENT_QUARTERS_END: str = "LASTQUARTER"
-        MOST_RECENT_CLOSING_YIELD_THE_LAST_AVAILABLE_YIELD_STORED_IN_HISTORY_COMPUTED_USING_PRICE: str = "LASTCLOSE"
-        CLOSING_YIELD_MOST_RECENT_MONTH_THE_YIELD_OF_A_BOND_BASED_ON_THE_CLOSING_PRICE_AS_OF_THE_MOST_RECENT_MONTHS_END: str = "LASTMONTH"
-        CLOSING_YIELD_THE_YIELD_OF_A_BOND_BASED_ON_THE_CLOSING_PRICE: str = "CLOSE"
-
-    # Yield(236): PERCENTAGE
-    class Yield:
-        tag: int = 236
-
-    # TotalTakedown(237): AMT
-    class TotalTakedown:
-        tag: int = 237
-
-    # Concession(238): AMT
-    class Concession:
-        tag: int = 238
-
-    # RepoCollateralSecurityType(239): INT
-    class RepoCollateralSecurityType:
-        tag: int = 239
-
-    # RedemptionDate(240): UTCDATE
-    class RedemptionDate:
-        tag: int = 240
-
-    # UnderlyingCouponPaymentDate(241): UTCDATE
-    class UnderlyingCouponPaymentDate:
-        tag: int = 241
-
-    # UnderlyingIssueDate(242): UTCDATE
-    class UnderlyingIssueDate:
-        tag: int = 242
-
-    # UnderlyingRepoCollateralSecurityType(243): INT
-    class UnderlyingRepoCollateralSecurityType:
-        tag: int = 243
-
-    # UnderlyingRepurchaseTerm(244): INT
-    class UnderlyingRepurchaseTerm:
-        tag: int = 244
-
-    # UnderlyingRepurchaseRate(245): PERCENTAGE
-    class UnderlyingRepurchaseRate:
-        tag: int = 245
-
-    # UnderlyingFactor(246): FLOAT
-    class UnderlyingFactor:
-        tag: int = 246
-
-    # UnderlyingRedemptionDate(247): UTCDATE
-    class UnderlyingRedemptionDate:
-        tag: int = 247
-
-    # LegCouponPaymentDate(248): UTCDATE
-    class LegCouponPaymentDate:
-        tag: int = 248
-
-    # LegIssueDate(249): UTCDATE
-    class LegIssueDate:
-        tag: int = 249
-
-    # LegRepoCollateralSecurityType(250): INT
-    class LegRepoCollateralSecurityType:
-        tag: int = 250
-
-    # LegRepurchaseTerm(251): INT
-    class LegRepurchaseTerm:
-        tag: int = 251
-
-    # LegRepurchaseRate(252): PERCENTAGE
-    class LegRepurchaseRate:
-        tag: int = 252
-
-    # LegFactor(253): FLOAT
-    class LegFactor:
-        tag: int = 253
-
-    # LegRedemptionDate(254): UTCDATE
-    class LegRedemptionDate:
-        tag: int = 254
-
-    # CreditRating(255): STRING
-    class CreditRating:
-        tag: int = 255
-
-    # UnderlyingCreditRating(256): STRING
-    class UnderlyingCreditRating:
-        tag: int = 256
-
-    # LegCreditRating(257): STRING
-    class LegCreditRating:
-        tag: int = 257
-
-    # TradedFlatSwitch(258): BOOLEAN
-    class TradedFlatSwitch:
-        tag: int = 258
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # BasisFeatureDate(259): UTCDATE
-    class BasisFeatureDate:
-        tag: int = 259
-
-    # BasisFeaturePrice(260): PRICE
-    class BasisFeaturePrice:
-        tag: int = 260
-
-    # MDReqID(262): STRING
-    class MDReqID:
-        tag: int = 262
-
-    # SubscriptionRequestType(263): CHAR
-    class SubscriptionRequestType:
-        tag: int = 263
-        SNAPSHOT_PLUS_UPDATES: str = '1'
-        DISABLE_PREVIOUS_SNAPSHOT_PLUS_UPDATE_REQUEST: str = '2'
-        SNAPSHOT: str = '0'
-
-    # MarketDepth(264): INT
-    class MarketDepth:
-        tag: int = 264
-
-    # MDUpdateType(265): INT
-    class MDUpdateType:
-        tag: int = 265
-        FULL_REFRESH: int = 0
-        INCREMENTAL_REFRESH: int = 1
-
-    # AggregatedBook(266): BOOLEAN
-    class AggregatedBook:
-        tag: int = 266
-        YES: str = 'Y'
-        NO: str = 'N'
-
-    # NoMDEntryTypes(267): NUMINGROUP
-    class NoMDEntryTypes:
-        tag: int = 267
-
-    # NoMDEntries(268): NUMINGROUP
-    class NoMDEntries:
-        tag: int = 268
-
-    # MDEntryType(269): CHAR
-    class MDEntryType:
-        tag: int = 269
-        TRADING_SESSION_HIGH_PRICE: str = '7'
-        OFFER: str = '1'
-        IMBALANCE: str = 'A'
-        TRADING_SESSION_VWAP_PRICE: str = '9'
-        TRADING_SESSION_LOW_PRICE: str = '8'
-        CLOSING_PRICE: str = '5'
-        OPENING_PRICE: str = '4'
-        BID: str = '0'
-        TRADE: str = '2'
-        INDEX_VALUE: str = '3'
-        SETTLEMENT_PRICE: str = '6'
-
-    # MDEntryPx(270): PRICE
-    class MDEntryPx:
-        tag: int = 270
-
-    # MDEntrySize(271): QTY
-    class MDEntrySize:
-        tag: int = 271
-
-    # MDEntryDate(272): UTCDATE
-    class MDEntryDate:
-        tag: int = 272
-
-    # MDEntryTime(273): UTCTIMEONLY
-    class MDEntryTime:
-        tag: int = 273
-
-    # TickDirection(274): CHAR
-    class TickDirection:
-        tag: int = 274
-        PLUS_TICK: str = '0'
-        ZERO_PLUS_TICK: str = '1'
-        MINUS_TICK: str = '2'
-        ZERO_MINUS_TICK: str = '3'
-
-    # MDMkt(275): EXCHANGE
-    class MDMkt:
-        tag: int = 275
-
-    # QuoteCondition(276): MULTIPLEVALUESTRING
-    class QuoteCondition:
-        tag: int = 276
-        LOCKED: str = "E"
-        NON_FIRM: str = "I"
-        FAST_TRADING: str = "H"
-        CROSSED: str = "F"
-        CONSOLIDATED_BEST: str = "D"
-        EXCHANGE_BEST: str = "C"
-        CLOSED: str = "B"
-        OPEN: str = "A"
-        DEPTH: str = "G"
-
-    # TradeCondition(277): MULTIPLEVALUESTRING
-    class TradeCondition:
-        tag: int = 277
-        NEXT_DAY_TRADE: str = "J"
-        OPENED: str = "K"
-        SELLER: str = "L"
-        AVERAGE_PRICE_TRADE: str = "B"
-        SOLD: str = "M"
-        RULE_155_TRADE: str = "H"
-        STOPPED_STOCK: str = "N"
-        IMBALANCE_MORE_BUYERS: str = "P"
-        IMBALANCE_MORE_SELLERS: str = "Q"
-        OPENING_PRICE: str = "R"
-        SOLD_LAST: str = "I"
-        CASH: str = "A"
-        CASH_TRADE: str = "C"
-        OPENING: str = "E"
-        INTRADAY_TRADE_DETAIL: str = "F"
-        RULE_127_TRADE: str = "G"
-        NEXT_DAY: str = "D"
-
-    # MDEntryID(278): STRING
-    class MDEntryID:
-        tag: int = 278
-
-    # MDUpdateAction(279): CHAR
-    class MDUpdateAction:
-        tag: int = 279
-        NEW: str = '0'
-        CHANGE: str = '1'
-        DELETE: str = '2'
-
-    # MDEntryRefID(280): STRING
-    class MDEntryRefID:
-        tag: int = 280
-
-    # MDReqRejReason(281): CHAR
-    class MDReqRejReason:
-        tag: int = 281
-        UNSUPPORTED_AGGREGATEDBOOK: str = '7'
-        DUPLICATE_MDREQID: str = '1'
-        UNSUPPORTED_MDIMPLICITDELETE: str = 'C'
-        UNSUPPORTED_OPENCLOSESETTLEFLAG: str = 'B'
-        UNSUPPORTED_SCOPE: str = 'A'
-        UNSUPPORTED_TRADINGSESSIONID: str = '9'
-        UNSUPPORTED_MDENTRYTYPE: str = '8'
-        UNSUPPORTED_MDUPDATETYPE: str = '6'
-        UNSUPPORTED_MARKETDEPTH: str = '5'
-        UNSUPPORTED_SUBSCRIPTIONREQUESTTYPE: str = '4'
-        INSUFFICIENT_BANDWIDTH: str = '2'
-        UNKNOWN_SYMBOL: str = '0'
-        INSUFFICIENT_PERMISSIONS: str = '3'
-
-    # MDEntryOriginator(282): STRING
-    class MDEntryOriginator:
-        tag: int = 282
-
-    # LocationID(283): STRING
-    class LocationID:
-        tag: int = 283
-
-    # DeskID(284): STRING
-    class DeskID:
-        tag: int = 284
-
-    # DeleteReason(285): CHAR
-    class DeleteReason:
-        tag: int = 285
-        CANCELATION: str = '0'
-        ERROR: str = '1'
-
-    # OpenCloseSettleFlag(286): MULTIPLEVALUESTRING
-    class OpenCloseSettleFlag:
-        tag: int = 286
-        SESSION_OPEN: str = "1"
-        DELIVERY_SETTLEMENT_PRICE: str = "2"
-        EXPECTED_PRICE: str = "3"
-        PRICE_FROM_PREVIOUS_BUSINESS_DAY: str = "4"
-        DAILY_OPEN: str = "0"
-
-    # SellerDays(287): INT
-    class SellerDays:
-        tag: int = 287
-
-    # MDEntryBuyer(288): STRING
-    class MDEntryBuyer:
-        tag: int = 288
-
-    # MDEntrySeller(289): STRING
-    class MDEntrySeller:
-        tag: int = 289
-
-    # MDEntryPositionNo(290): INT
-    class MDEntryPositionNo:
-        tag: int = 290
-
-    # FinancialStatus(291): MULTIPLEVALUESTRING
-    class FinancialStatus:
-        tag: int = 291
-        BANKRUPT: str = "1"
-        PENDING_DELISTING: str = "2"
-
-    # CorporateAction(292): MULTIPLEVALUESTRING
-    class CorporateAction:
-        tag: int = 292
-        EX_DISTRIBUTION: str = "B"
-        EX_INTEREST: str = "E"
-        EX_RIGHTS: str = "C"
-        EX_DIVIDEND: str = "A"
-        NEW: str = "D"
-
-    # DefBidSize(293): QTY
-    class DefBidSize:
-        tag: int = 293
-
-    # DefOfferSize(294): QTY
-    class DefOfferSize:
-        tag: int = 294
-
-    # NoQuoteEntries(295): NUMINGROUP
-    class NoQuoteEntries:
-        tag: int = 295
-
-    # NoQuoteSets(296): NUMINGROUP
-    class NoQuoteSets:
-        tag: int = 296
-
-    # QuoteStatus(297): INT
-    class QuoteStatus:
-        tag: int = 297
-        REMOVED_FROM_MARKET: int = 6
-        CANCELED_FOR_SYMBOL: int = 1
-        PENDING: int = 10
-        QUOTE_NOT_FOUND: int = 9
-        QUERY: int = 8
-        EXPIRED: int = 7
-        REJECTED: int = 5
-        CANCELED_ALL: int = 4
-        CANCELED_FOR_UNDERLYING: int = 3
-        CANCELED_FOR_SECURITY_TYPE: int = 2
-        ACCEPTED: int = 0
-
-    # QuoteCancelType(298): INT
-    class QuoteCancelType:
-        tag: int = 298
-        CANCEL_ALL_QUOTES: int = 4
-        CANCEL_FOR_SECURITY_TYPE: int = 2
-        CANCEL_FOR_SYMBOL: int = 1
-        CANCEL_FOR_UNDERLYING_SYMBOL: int = 3
-
-    # QuoteEntryID(299): STRING
-    class QuoteEntryID:
-        tag: int = 299
-
-    # QuoteRejectReason(300): INT
-    class QuoteRejectReason:
-        tag: int = 300
-        NOT_AUTHORIZED_TO_QUOTE_SECURITY: int = 9
-        UNKNOWN_SYMBOL: int = 1
-        EXCHANGE: int = 2
-        QUOTE_REQUEST_EXCEEDS_LIMIT: int = 3
-        TOO_LATE_TO_ENTER: int = 4
-        UNKNOWN_QUOTE: int = 5
-        DUPLICATE_QUOTE: int = 6
-        INVALID_BID_ASK_SPREAD: int = 7
-        INVALID_PRICE: int = 8
-
-    # QuoteResponseLevel(301): INT
-    class QuoteResponseLevel:
-        tag: int = 301
-        ACKNOWLEDGE_ONLY_NEGATIVE_OR_ERRONEOUS_QUOTES: int = 1
-        NO_ACKNOWLEDGEMENT: int = 0
-        ACKNOWLEDGE_EACH_QUOTE_MESSAGES: int = 2
-
-    # QuoteSetID(302): STRING
-    class QuoteSetID:
-        tag: int = 302
-
-    # QuoteRequestType(303): INT
-    class QuoteRequestType:
-        tag: int = 303
-        AUTOMATIC: int = 2
-        MANUAL: int = 1
-
-    # TotQuoteEntries(304): INT
-    class TotQuoteEntries:
-        tag: int = 304
-
-    # UnderlyingSecurityIDSource(305): STRING
-    class UnderlyingSecurityIDSource:
-        tag: int = 305
-
-    # UnderlyingIssuer(306): STRING
-    class UnderlyingIssuer:
-        tag: int = 306
-
-    # UnderlyingSecurityDesc(307): STRING
-    class UnderlyingSecurityDesc:
-        tag: int = 307
-
-    # UnderlyingSecurityExchange(308): EXCHANGE
-    class UnderlyingSecurityExchange:
-        tag: int = 308
-
-    # UnderlyingSecurityID(309): STRING
-    class UnderlyingSecurityID:
-        tag: int = 309
-
-    # UnderlyingSecurityType(310): STRING
-    class UnderlyingSecurityType:
-        tag: int = 310
-
-    # UnderlyingSymbol(311): STRING
-    class UnderlyingSymbol:
-        tag: int = 311
-
-    # UnderlyingSymbolSfx(312): STRING
-    class UnderlyingSymbolSfx:
-        tag: int = 312
-
-    # UnderlyingMaturityMonthYear(313): MONTHYEAR
-    class UnderlyingMaturityMonthYear:
-        tag: int = 313
-
-    # UnderlyingMaturityDay(314): DAYOFMONTH
-    class UnderlyingMaturityDay:
-        tag: int = 314
-
-    # UnderlyingPutOrCall(315): INT
-    class UnderlyingPutOrCall:
-        tag: int = 315
-
-    # UnderlyingStrikePrice(316): PRICE
-    class UnderlyingStrikePrice:
-        tag: int = 316
-
-    # UnderlyingOptAttribute(317): CHAR
-    class UnderlyingOptAttribute:
-        tag: int = 317
-
-    # UnderlyingCurrency(318): CURRENCY
-    class UnderlyingCurrency:
-        tag: int = 318
-
-    # RatioQty(319): QUANTITY
-    class RatioQty:
-        tag: int = 319
-
-    # SecurityReqID(320): STRING
-    class SecurityReqID:
-        tag: int = 320
-
-    # SecurityRequestType(321): INT
-    class SecurityRequestType:
-        tag: int = 321
-        REQUEST_SECURITY_IDENTITY_AND_SPECIFICATIONS: int = 0
-        REQUEST_SECURITY_IDENTITY_FOR_THE_SPECIFICATIONS_PROVIDED: int = 1
-        REQUEST_LIST_SECURITY_TYPES: int = 2
-        REQUEST_LIST_SECURITIES: int = 3
-
-    # SecurityResponseID(322): STRING
-    class SecurityResponseID:
-        tag: int = 322
-
-    # SecurityResponseType(323): INT
-    class SecurityResponseType:
-        tag: int = 323
-        REJECT_SECURITY_PROPOSAL: int = 5
-        ACCEPT_SECURITY_PROPOSAL_AS_IS: int = 1
-        CAN_NOT_MATCH_SELECTION_CRITERIA: int = 6
-        ACCEPT_SECURITY_PROPOSAL_WITH_REVISIONS_AS_INDICATED_IN_THE_MESSAGE: int = 2
-        LIST_OF_SECURITIES_RETURNED_PER_REQUEST: int = 4
-        LIST_OF_SECURITY_TYPES_RETURNED_PER_REQUEST: int = 3
-
-    # SecurityStatusReqID(324): STRING
-    class SecurityStatusReqID:
-        tag: int = 324
-
-    # UnsolicitedIndicator(325): BOOLEAN
-    class UnsolicitedIndicator:
-        tag: int = 325
-        YES: str = 'Y'
-        NO: str = 'N'
-
-    # SecurityTradingStatus(326): INT
-    class SecurityTradingStatus:
-        tag: int = 326
-        UNKNOWN_OR_INVALID: int = 20
-        NO_MARKET_ON_CLOSE_IMBALANCE: int = 13
-        ITS_PRE_OPENING: int = 14
-        NEW_PRICE_INDICATION: int = 15
-        TRADE_DISSEMINATION_TIME: int = 16
-        READY_TO_TRADE: int = 17
-        NOT_TRADED_ON_THIS_MARKET: int = 19
-        OPENING_ROTATION: int = 22
-        PRE_OPEN: int = 21
-        NO_MARKET_IMBALANCE: int = 12
-        NOT_AVAILABLE_FOR_TRADING: int = 18
-        MARKET_ON_CLOSE_IMBALANCE_SELL: int = 10
-        MARKET_ON_CLOSE_IMBALANCE_BUY: int = 9
-        MARKET_IMBALANCE_SELL: int = 8
-        MARKET_IMBALANCE_BUY: int = 7
-        TRADING_RANGE_INDICATION: int = 6
-        PRICE_INDICATION: int = 5
-        NO_OPEN_NO_RESUME: int = 4
-        RESUME: int = 3
-        OPENING_DELAY: int = 1
-        TRADING_HALT: int = 2
-        _11: int = 11
-        FAST_MARKET: int = 23
-
-    # HaltReasonChar(327): CHAR
-    class HaltReasonChar:
-        tag: int = 327
-        EQUIPMENT_CHANGEOVER: str = 'X'
-        ADDITIONAL_INFORMATION: str = 'M'
-        ORDER_INFLUX: str = 'E'
-        NEWS_PENDING: str = 'P'
-        ORDER_IMBALANCE: str = 'I'
-        NEWS_DISSEMINATION: str = 'D'
-
-    # InViewOfCommon(328): BOOLEAN
-    class InViewOfCommon:
-        tag: int = 328
-        YES: str = 'Y'
-        NO: str = 'N'
-
-    # DueToRelated(329): BOOLEAN
-    class DueToRelated:
-        tag: int = 329
-        YES: str = 'Y'
-        NO: str = 'N'
-
-    # BuyVolume(330): QTY
-    class BuyVolume:
-        tag: int = 330
-
-    # SellVolume(331): QTY
-    class SellVolume:
-        tag: int = 331
-
-    # HighPx(332): PRICE
-    class HighPx:
-        tag: int = 332
-
-    # LowPx(333): PRICE
-    class LowPx:
-        tag: int = 333
-
-    # Adjustment(334): INT
-    class Adjustment:
-        tag: int = 334
-        CANCEL: int = 1
-        ERROR: int = 2
-        CORRECTION: int = 3
-
-    # TradSesReqID(335): STRING
-    class TradSesReqID:
-        tag: int = 335
-
-    # TradingSessionID(336): STRING
-    class TradingSessionID:
-        tag: int = 336
-
-    # ContraTrader(337): STRING
-    class ContraTrader:
-        tag: int = 337
-
-    # TradSesMethod(338): INT
-    class TradSesMethod:
-        tag: int = 338
-        TWO_PARTY: int = 3
-        ELECTRONIC: int = 1
-        OPEN_OUTCRY: int = 2
-
-    # TradSesMode(339): INT
-    class TradSesMode:
-        tag: int = 339
-        PRODUCTION: int = 3
-        TESTING: int = 1
-        SIMULATED: int = 2
-
-    # TradSesStatus(340): INT
-    class TradSesStatus:
-        tag: int = 340
-        PRE_CLOSE: int = 5
-        REQUEST_REJECTED: int = 6
-        PRE_OPEN: int = 4
-        CLOSED: int = 3
-        OPEN: int = 2
-        HALTED: int = 1
-        UNKNOWN: int = 0
-
-    # TradSesStartTime(341): UTCTIMESTAMP
-    class TradSesStartTime:
-        tag: int = 341
-
-    # TradSesOpenTime(342): UTCTIMESTAMP
-    class TradSesOpenTime:
-        tag: int = 342
-
-    # TradSesPreCloseTime(343): UTCTIMESTAMP
-    class TradSesPreCloseTime:
-        tag: int = 343
-
-    # TradSesCloseTime(344): UTCTIMESTAMP
-    class TradSesCloseTime:
-        tag: int = 344
-
-    # TradSesEndTime(345): UTCTIMESTAMP
-    class TradSesEndTime:
-        tag: int = 345
-
-    # NumberOfOrders(346): INT
-    class NumberOfOrders:
-        tag: int = 346
-
-    # MessageEncoding(347): STRING
-    class MessageEncoding:
-        tag: int = 347
-        UTF_8: str = "UTF-8"
-        ISO_2022_JP: str = "ISO-2022-JP"
-        EUC_JP: str = "EUC-JP"
-        SHIFT_JIS: str = "SHIFT_JIS"
-
-    # EncodedIssuerLen(348): LENGTH
-    class EncodedIssuerLen:
-        tag: int = 348
-
-    # EncodedIssuer(349): DATA
-    class EncodedIssuer:
-        tag: int = 349
-
-    # EncodedSecurityDescLen(350): LENGTH
-    class EncodedSecurityDescLen:
-        tag: int = 350
-
-    # EncodedSecurityDesc(351): DATA
-    class EncodedSecurityDesc:
-        tag: int = 351
-
-    # EncodedListExecInstLen(352): LENGTH
-    class EncodedListExecInstLen:
-        tag: int = 352
-
-    # EncodedListExecInst(353): DATA
-    class EncodedListExecInst:
-        tag: int = 353
-
-    # EncodedTextLen(354): LENGTH
-    class EncodedTextLen:
-        tag: int = 354
-
-    # EncodedText(355): DATA
-    class EncodedText:
-        tag: int = 355
-
-    # EncodedSubjectLen(356): LENGTH
-    class EncodedSubjectLen:
-        tag: int = 356
-
-    # EncodedSubject(357): DATA
-    class EncodedSubject:
-        tag: int = 357
-
-    # EncodedHeadlineLen(358): LENGTH
-    class EncodedHeadlineLen:
-        tag: int = 358
-
-    # EncodedHeadline(359): DATA
-    class EncodedHeadline:
-        tag: int = 359
-
-    # EncodedAllocTextLen(360): LENGTH
-    class EncodedAllocTextLen:
-        tag: int = 360
-
-    # EncodedAllocText(361): DATA
-    class EncodedAllocText:
-        tag: int = 361
-
-    # EncodedUnderlyingIssuerLen(362): LENGTH
-    class EncodedUnderlyingIssuerLen:
-        tag: int = 362
-
-    # EncodedUnderlyingIssuer(363): DATA
-    class EncodedUnderlyingIssuer:
-        tag: int = 363
-
-    # EncodedUnderlyingSecurityDescLen(364): LENGTH
-    class EncodedUnderlyingSecurityDescLen:
-        tag: int = 364
-
-    # EncodedUnderlyingSecurityDesc(365): DATA
-    class EncodedUnderlyingSecurityDesc:
-        tag: int = 365
-
-    # AllocPrice(366): PRICE
-    class AllocPrice:
-        tag: int = 366
-
-    # QuoteSetValidUntilTime(367): UTCTIMESTAMP
-    class QuoteSetValidUntilTime:
-        tag: int = 367
-
-    # QuoteEntryRejectReason(368): INT
-    class QuoteEntryRejectReason:
-        tag: int = 368
-        UNKNOWN_QUOTE: int = 5
-        NOT_AUTHORIZED_TO_QUOTE_SECURITY: int = 9
-        INVALID_PRICE: int = 8
-        DUPLICATE_QUOTE: int = 6
-        TOO_LATE_TO_ENTER: int = 4
-        QUOTE_EXCEEDS_LIMIT: int = 3
-        EXCHANGE: int = 2
-        UNKNOWN_SYMBOL: int = 1
-        INVALID_BID_ASK_SPREAD: int = 7
-
-    # LastMsgSeqNumProcessed(369): SEQNUM
-    class LastMsgSeqNumProcessed:
-        tag: int = 369
-
-    # OnBehalfOfSendingTime(370): UTCTIMESTAMP
-    class OnBehalfOfSendingTime:
-        tag: int = 370
-
-    # RefTagID(371): INT
-    class RefTagID:
-        tag: int = 371
-
-    # RefMsgType(372): STRING
-    class RefMsgType:
-        tag: int = 372
-
-    # SessionRejectReason(373): INT
-    class SessionRejectReason:
-        tag: int = 373
-        XML_VALIDATION_ERROR: int = 12
-        NON_DATA_VALUE_INCLUDES_FIELD_DELIMITER: int = 17
-        INCORRECT_NUMINGROUP_COUNT_FOR_REPEATING_GROUP: int = 16
-        REPEATING_GROUP_FIELDS_OUT_OF_ORDER: int = 15
-        TAG_SPECIFIED_OUT_OF_REQUIRED_ORDER: int = 14
-        INVALID_MSGTYPE: int = 11
-        INVALID_TAG_NUMBER: int = 0
-        COMPID_PROBLEM: int = 9
-        SIGNATURE_PROBLEM: int = 8
-        DECRYPTION_PROBLEM: int = 7
-        INCORRECT_DATA_FORMAT_FOR_VALUE: int = 6
-        VALUE_IS_INCORRECT: int = 5
-        TAG_SPECIFIED_WITHOUT_A_VALUE: int = 4
-        UNDEFINED_TAG: int = 3
-        SENDINGTIME_ACCURACY_PROBLEM: int = 10
-        TAG_APPEARS_MORE_THAN_ONCE: int = 13
-        TAG_NOT_DEFINED_FOR_THIS_MESSAGE_TYPE: int = 2
-        REQUIRED_TAG_MISSING: int = 1
-
-    # BidRequestTransType(374): CHAR
-    class BidRequestTransType:
-        tag: int = 374
-        NEW: str = 'N'
-        CANCEL: str = 'C'
-
-    # ContraBroker(375): STRING
-    class ContraBroker:
-        tag: int = 375
-
-    # ComplianceID(376): STRING
-    class ComplianceID:
-        tag: int = 376
-
-    # SolicitedFlag(377): BOOLEAN
-    class SolicitedFlag:
-        tag: int = 377
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # ExecRestatementReason(378): INT
-    class ExecRestatementReason:
-        tag: int = 378
-        CANCEL_ON_SYSTEM_FAILURE: int = 7
-        GT_CORPORATE_ACTION: int = 0
-        MARKET: int = 8
-        CANCEL_ON_TRADING_HALT: int = 6
-        PARTIAL_DECLINE_OF_ORDERQTY: int = 5
-        BROKER_OPTION: int = 4
-        REPRICING_OF_ORDER: int = 3
-        GT_RENEWAL: int = 1
-        VERBAL_CHANGE: int = 2
-
-    # BusinessRejectRefID(379): STRING
-    class BusinessRejectRefID:
-        tag: int = 379
-
-    # BusinessRejectReason(380): INT
-    class BusinessRejectReason:
-        tag: int = 380
-        UNSUPPORTED_MESSAGE_TYPE: int = 3
-        DELIVERTO_FIRM_NOT_AVAILABLE_AT_THIS_TIME: int = 7
-        APPLICATION_NOT_AVAILABLE: int = 4
-        NOT_AUTHORIZED: int = 6
-        OTHER: int = 0
-        CONDITIONALLY_REQUIRED_FIELD_MISSING: int = 5
-        UNKOWN_ID: int = 1
-        UNKNOWN_SECURITY: int = 2
-
-    # GrossTradeAmt(381): AMT
-    class GrossTradeAmt:
-        tag: int = 381
-
-    # NoContraBrokers(382): NUMINGROUP
-    class NoContraBrokers:
-        tag: int = 382
-
-    # MaxMessageSize(383): LENGTH
-    class MaxMessageSize:
-        tag: int = 383
-
-    # NoMsgTypes(384): NUMINGROUP
-    class NoMsgTypes:
-        tag: int = 384
-
-    # MsgDirection(385): CHAR
-    class MsgDirection:
-        tag: int = 385
-        SEND: str = 'S'
-        RECEIVE: str = 'R'
-
-    # NoTradingSessions(386): NUMINGROUP
-    class NoTradingSessions:
-        tag: int = 386
-
-    # TotalVolumeTraded(387): QTY
-    class TotalVolumeTraded:
-        tag: int = 387
-
-    # DiscretionInst(388): CHAR
-    class DiscretionInst:
-        tag: int = 388
-        RELATED_TO_DISPLAYED_PRICE: str = '0'
-        RELATED_TO_MARKET_PRICE: str = '1'
-        RELATED_TO_PRIMARY_PRICE: str = '2'
-        RELATED_TO_LOCAL_PRIMARY_PRICE: str = '3'
-        RELATED_TO_MIDPOINT_PRICE: str = '4'
-        RELATED_TO_LAST_TRADE_PRICE: str = '5'
-
-    # DiscretionOffset(389): PRICEOFFSET
-    class DiscretionOffset:
-        tag: int = 389
-
-    # BidID(390): STRING
-    class BidID:
-        tag: int = 390
-
-    # ClientBidID(391): STRING
-    class ClientBidID:
-        tag: int = 391
-
-    # ListName(392): STRING
-    class ListName:
-        tag: int = 392
-
-    # TotalNumSecurities(393): INT
-    class TotalNumSecurities:
-        tag: int = 393
-
-    # BidType(394): INT
-    class BidType:
-        tag: int = 394
-        NON_DISCLOSED_STYLE: int = 1
-        DISCLOSED_STYLE: int = 2
-        NO_BIDDING_PROCESS: int = 3
-
-    # NumTickets(395): INT
-    class NumTickets:
-        tag: int = 395
-
-    # SideValue1(396): AMT
-    class SideValue1:
-        tag: int = 396
-
-    # SideValue2(397): AMT
-    class SideValue2:
-        tag: int = 397
-
-    # NoBidDescriptors(398): NUMINGROUP
-    class NoBidDescriptors:
-        tag: int = 398
-
-    # BidDescriptorType(399): INT
-    class BidDescriptorType:
-        tag: int = 399
-        INDEX: int = 3
-        COUNTRY: int = 2
-        SECTOR: int = 1
-
-    # BidDescriptor(400): STRING
-    class BidDescriptor:
-        tag: int = 400
-
-    # SideValueInd(401): INT
-    class SideValueInd:
-        tag: int = 401
-        SIDEVALUE1: int = 1
-        SIDEVALUE_2: int = 2
-
-    # LiquidityPctLow(402): PERCENTAGE
-    class LiquidityPctLow:
-        tag: int = 402
-
-    # LiquidityPctHigh(403): PERCENTAGE
-    class LiquidityPctHigh:
-        tag: int = 403
-
-    # LiquidityValue(404): AMT
-    class LiquidityValue:
-        tag: int = 404
-
-    # EFPTrackingError(405): PERCENTAGE
-    class EFPTrackingError:
-        tag: int = 405
-
-    # FairValue(406): AMT
-    class FairValue:
-        tag: int = 406
-
-    # OutsideIndexPct(407): PERCENTAGE
-    class OutsideIndexPct:
-        tag: int = 407
-
-    # ValueOfFutures(408): AMT
-    class ValueOfFutures:
-        tag: int = 408
-
-    # LiquidityIndType(409): INT
-    class LiquidityIndType:
-        tag: int = 409
-        NORMAL_MARKET_SIZE: int = 3
-        OTHER: int = 4
-        _20_DAY_MOVING_AVERAGE: int = 2
-        _5DAY_MOVING_AVERAGE: int = 1
-
-    # WtAverageLiquidity(410): PERCENTAGE
-    class WtAverageLiquidity:
-        tag: int = 410
-
-    # ExchangeForPhysical(411): BOOLEAN
-    class ExchangeForPhysical:
-        tag: int = 411
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # OutMainCntryUIndex(412): AMT
-    class OutMainCntryUIndex:
-        tag: int = 412
-
-    # CrossPercent(413): PERCENTAGE
-    class CrossPercent:
-        tag: int = 413
-
-    # ProgRptReqs(414): INT
-    class ProgRptReqs:
-        tag: int = 414
-        REAL_TIME_EXECUTION_REPORTS: int = 3
-        SELLSIDE_PERIODICALLY_SENDS_STATUS_USING_LISTSTATUS_PERIOD_OPTIONALLY_SPECIFIED_IN_PROGRESSPERIOD: int = 2
-        BUYSIDE_EXPLICITLY_REQUESTS_STATUS_USING_STATUSREQUEST: int = 1
-
-    # ProgPeriodInterval(415): INT
-    class ProgPeriodInterval:
-        tag: int = 415
-
-    # IncTaxInd(416): INT
-    class IncTaxInd:
-        tag: int = 416
-        GROSS: int = 2
-        NET: int = 1
-
-    # NumBidders(417): INT
-    class NumBidders:
-        tag: int = 417
-
-    # TradeType(418): CHAR
-    class TradeType:
-        tag: int = 418
-        VWAP_GUARANTEE: str = 'G'
-        AGENCY: str = 'A'
-        GUARANTEED_CLOSE: str = 'J'
-        RISK_TRADE: str = 'R'
-
-    # BasisPxType(419): CHAR
-    class BasisPxType:
-        tag: int = 419
-        VWAP_THROUGH_AN_AFTERNOON_SESSION: str = '8'
-        OPEN: str = 'D'
-        OTHERS: str = 'Z'
-        STRIKE: str = 'C'
-        VWAP_THROUGH_AN_AFTERNOON_SESSION_EXCEPT_YORI: str = 'B'
-        VWAP_THROUGH_A_DAY_EXCEPT_YORI: str = '9'
-        VWAP_THROUGH_A_MORNING_SESSION: str = '7'
-        VWAP_THROUGH_A_DAY: str = '6'
-        SQ: str = '5'
-        CURRENT_PRICE: str = '4'
-        CLOSING_PRICE: str = '3'
-        CLOSING_PRICE_AT_MORNING_SESSION: str = '2'
-        VWAP_THROUGH_A_MORNING_SESSION_EXCEPT_YORI: str = 'A'
-
-    # NoBidComponents(420): NUMINGROUP
-    class NoBidComponents:
-        tag: int = 420
-
-    # Country(421): COUNTRY
-    class Country:
-        tag: int = 421
-
-    # TotNoStrikes(422): INT
-    class TotNoStrikes:
-        tag: int = 422
-
-    # PriceType(423): INT
-    class PriceType:
-        tag: int = 423
-        FIXED_AMOUNT: int = 3
-        PERCENTAGE: int = 1
-        DISCOUNT: int = 4
-        BASIS_POINTS_RELATIVE_TO_BENCHMARK: int = 6
-        TED_PRICE: int = 7
-        TED_YIELD: int = 8
-        PREMIUM: int = 5
-        PER_SHARE: int = 2
-
-    # DayOrderQty(424): QTY
-    class DayOrderQty:
-        tag: int = 424
-
-    # DayCumQty(425): QTY
-    class DayCumQty:
-        tag: int = 425
-
-    # DayAvgPx(426): PRICE
-    class DayAvgPx:
-        tag: int = 426
-
-    # GTBookingInst(427): INT
-    class GTBookingInst:
-        tag: int = 427
-        BOOK_OUT_ALL_TRADES_ON_DAY_OF_EXECUTION: int = 0
-        ACCUMULATE_UNTIL_VERBALLY_NOTIFIED_OTHERWISE: int = 2
-        ACCUMULATE_EXECUTIONS_UNTIL_ORDER_IS_FILLED_OR_EXPIRES: int = 1
-
-    # NoStrikes(428): NUMINGROUP
-    class NoStrikes:
-        tag: int = 428
-
-    # ListStatusType(429): INT
-    class ListStatusType:
-        tag: int = 429
-        ALERT: int = 6
-        EXECSTARTED: int = 4
-        TIMED: int = 3
-        RESPONSE: int = 2
-        ACK: int = 1
-        ALLDONE: int = 5
-
-    # NetGrossInd(430): INT
-    class NetGrossInd:
-        tag: int = 430
-        NET: int = 1
-        GROSS: int = 2
-
-    # ListOrderStatus(431): INT
-    class ListOrderStatus:
-        tag: int = 431
-        CANCELING: int = 4
-        EXECUTING: int = 3
-        REJECT: int = 7
-        ALL_DONE: int = 6
-        ALERT: int = 5
-        RECEIVEDFOREXECUTION: int = 2
-        INBIDDINGPROCESS: int = 1
-
-    # ExpireDate(432): LOCALMKTDATE
-    class ExpireDate:
-        tag: int = 432
-
-    # ListExecInstType(433): CHAR
-    class ListExecInstType:
-        tag: int = 433
-        EXCHANGE_SWITCH_CIV_ORDER_BUY_DRIVEN_CASH_WITHDRAW: str = '5'
-        EXCHANGE_SWITCH_CIV_ORDER_BUY_DRIVEN_CASH_TOP_UP: str = '4'
-        WAIT_FOR_EXECUTE_INSTRUCTION: str = '2'
-        IMMEDIATE: str = '1'
-        EXCHANGE_SWITCH_CIV_ORDER_SELL_DRIVEN: str = '3'
-
-    # CxlRejResponseTo(434): CHAR
-    class CxlRejResponseTo:
-        tag: int = 434
-        ORDER_CANCEL_REPLACE_REQUEST: str = '2'
-        ORDER_CANCEL_REQUEST: str = '1'
-
-    # UnderlyingCouponRate(435): PERCENTAGE
-    class UnderlyingCouponRate:
-        tag: int = 435
-
-    # UnderlyingContractMultiplier(436): FLOAT
-    class UnderlyingContractMultiplier:
-        tag: int = 436
-
-    # ContraTradeQty(437): QTY
-    class ContraTradeQty:
-        tag: int = 437
-
-    # ContraTradeTime(438): UTCTIMESTAMP
-    class ContraTradeTime:
-        tag: int = 438
-
-    # ClearingFirm(439): STRING
-    class ClearingFirm:
-        tag: int = 439
-
-    # ClearingAccount(440): STRING
-    class ClearingAccount:
-        tag: int = 440
-
-    # LiquidityNumSecurities(441): INT
-    class LiquidityNumSecurities:
-        tag: int = 441
-
-    # MultiLegReportingType(442): CHAR
-    class MultiLegReportingType:
-        tag: int = 442
-        SINGLE_SECURITY: str = '1'
-        INDIVIDUAL_LEG_OF_A_MULTI_LEG_SECURITY: str = '2'
-        MULTI_LEG_SECURITY: str = '3'
-
-    # StrikeTime(443): UTCTIMESTAMP
-    class StrikeTime:
-        tag: int = 443
-
-    # ListStatusText(444): STRING
-    class ListStatusText:
-        tag: int = 444
-
-    # EncodedListStatusTextLen(445): LENGTH
-    class EncodedListStatusTextLen:
-        tag: int = 445
-
-    # EncodedListStatusText(446): DATA
-    class EncodedListStatusText:
-        tag: int = 446
-
-    # PartyIDSource(447): CHAR
-    class PartyIDSource:
-        tag: int = 447
-        CHINESE_B_SHARE: str = '5'
-        US_EMPLOYER_IDENTIFICATION_NUMBER: str = '8'
-        AUSTRALIAN_TAX_FILE_NUMBER: str = 'A'
-        AUSTRALIAN_BUSINESS_NUMBER: str = '9'
-        ISO_COUNTRY_CODE: str = 'E'
-        BIC: str = 'B'
-        US_SOCIAL_SECURITY_NUMBER: str = '7'
-        PROPRIETARY_CUSTOM_CODE: str = 'D'
-        SETTLEMENT_ENTITY_LOCATION: str = 'F'
-        KOREAN_INVESTOR_ID: str = '1'
-        TAIWANESE_QUALIFIED_FOREIGN_INVESTOR_ID_QFII: str = '2'
-        TAIWANESE_TRADING_ACCOUNT: str = '3'
-        MALAYSIAN_CENTRAL_DEPOSITORY: str = '4'
-        UK_NATIONAL_INSURANCE_OR_PENSION_NUMBER: str = '6'
-        GENERALLY_ACCEPTED_MARKET_PARTICIPANT_IDENTIFIER: str = 'C'
-
-    # PartyID(448): STRING
-    class PartyID:
-        tag: int = 448
-
-    # TotalVolumeTradedDate(449): UTCDATE
-    class TotalVolumeTradedDate:
-        tag: int = 449
-
-    # TotalVolumeTradedTime(450): UTCTIMEONLY
-    class TotalVolumeTradedTime:
-        tag: int = 450
-
-    # NetChgPrevDay(451): PRICEOFFSET
-    class NetChgPrevDay:
-        tag: int = 451
-
-    # PartyRole(452): INT
-    class PartyRole:
-        tag: int = 452
-        CORRESPONDANT_CLEARING_FIRM: int = 15
-        CLIENT_ID: int = 3
-        UNDERLYING_CONTRA_FIRM: int = 20
-        SPONSORING_FIRM: int = 19
-        CONTRA_CLEARING_FIRM: int = 18
-        CONTRA_FIRM: int = 17
-        EXECUTING_SYSTEM: int = 16
-        ENTERING_FIRM: int = 7
-        EXECUTING_FIRM: int = 1
-        BROKER_OF_CREDIT: int = 2
-        INVESTOR_ID: int = 5
-        INTRODUCING_FIRM: int = 6
-        GIVEUP_CLEARING_FIRM: int = 14
-        LOCATE_LENDING_FIRM: int = 8
-        FUND_MANAGER_CLIENT_ID: int = 9
-        SETTLEMENT_LOCATION: int = 10
-        ORDER_ORIGINATION_TRADER: int = 11
-        EXECUTING_TRADER: int = 12
-        ORDER_ORIGINATION_FIRM: int = 13
-        CLEARING_FIRM: int = 4
-
-    # NoPartyIDs(453): NUMINGROUP
-    class NoPartyIDs:
-        tag: int = 453
-
-    # NoSecurityAltID(454): NUMINGROUP
-    class NoSecurityAltID:
-        tag: int = 454
-
-    # SecurityAltID(455): STRING
-    class SecurityAltID:
-        tag: int = 455
-
-    # SecurityAltIDSource(456): STRING
-    class SecurityAltIDSource:
-        tag: int = 456
-
-    # NoUnderlyingSecurityAltID(457): NUMINGROUP
-    class NoUnderlyingSecurityAltID:
-        tag: int = 457
-
-    # UnderlyingSecurityAltID(458): STRING
-    class UnderlyingSecurityAltID:
-        tag: int = 458
-
-    # UnderlyingSecurityAltIDSource(459): STRING
-    class UnderlyingSecurityAltIDSource:
-        tag: int = 459
-
-    # Product(460): INT 
-    class Product:
-        tag: int = 460
-        LOAN: str = "8"
-        OTHER: str = "12"
-        MUNICIPAL: str = "11"
-        AGENCY: str = "1"
-        CORPORATE: str = "3"
-        CURRENCY: str = "4"
-        COMMODITY: str = "2"
-        GOVERNMENT: str = "6"
-        MORTGAGE: str = "10"
-        INDEX: str = "7"
-        MONEYMARKET: str = "9"
-        EQUITY: str = "5"
-
-    # CFICode(461): STRING
-    class CFICode:
-        tag: int = 461
-
-    # UnderlyingProduct(462): INT
-    class UnderlyingProduct:
-        tag: int = 462
-
-    # UnderlyingCFICode(463): STRING
-    class UnderlyingCFICode:
-        tag: int = 463
-
-    # TestMessageIndicator(464): BOOLEAN
-    class TestMessageIndicator:
-        tag: int = 464
-        YES: str = 'Y'
-        NO: str = 'N'
-
-    # QuantityType(465): INT
-    class QuantityType:
-        tag: int = 465
-        CONTRACTS: int = 6
-        OTHER: int = 7
-        CURRENCY: int = 5
-        ORIGINALFACE: int = 4
-        CURRENTFACE: int = 3
-        BONDS: int = 2
-        SHARES: int = 1
-        PAR: int = 8
-
-    # BookingRefID(466): STRING
-    class BookingRefID:
-        tag: int = 466
-
-    # IndividualAllocID(467): STRING
-    class IndividualAllocID:
-        tag: int = 467
-
-    # RoundingDirection(468): CHAR
-    class RoundingDirection:
-        tag: int = 468
-        ROUND_TO_NEAREST: str = '0'
-        ROUND_DOWN: str = '1'
-        ROUND_UP: str = '2'
-
-    # RoundingModulus(469): FLOAT
-    class RoundingModulus:
-        tag: int = 469
-
-    # CountryOfIssue(470): COUNTRY
-    class CountryOfIssue:
-        tag: int = 470
-
-    # StateOrProvinceOfIssue(471): STRING
-    class StateOrProvinceOfIssue:
-        tag: int = 471
-
-    # LocaleOfIssue(472): STRING
-    class LocaleOfIssue:
-        tag: int = 472
-
-    # NoRegistDtls(473): NUMINGROUP
-    class NoRegistDtls:
-        tag: int = 473
-
-    # MailingDtls(474): STRING
-    class MailingDtls:
-        tag: int = 474
-
-    # InvestorCountryOfResidence(475): COUNTRY
-    class InvestorCountryOfResidence:
-        tag: int = 475
-
-    # PaymentRef(476): STRING
-    class PaymentRef:
-        tag: int = 476
-
-    # DistribPaymentMethod(477): INT
-    class DistribPaymentMethod:
-        tag: int = 477
-
-    # CashDistribCurr(478): CURRENCY
-    class CashDistribCurr:
-        tag: int = 478
-
-    # CommCurrency(479): CURRENCY
-    class CommCurrency:
-        tag: int = 479
-
-    # CancellationRights(480): CHAR
-    class CancellationRights:
-        tag: int = 480
-        NO_WAIVER_AGREEMENT: str = 'M'
-        NO_EXECUTION_ONLY: str = 'N'
-        YES: str = 'Y'
-        NO_INSTITUTIONAL: str = 'O'
-
-    # MoneyLaunderingStatus(481): CHAR
-    class MoneyLaunderingStatus:
-        tag: int = 481
-        EXEMPT_AUTHORISED_CREDIT_OR_FINANCIAL_INSTITUTION: str = '3'
-        EXEMPT_CLIENT_MONEY_TYPE_EXEMPTION: str = '2'
-        EXEMPT_BELOW_THE_LIMIT: str = '1'
-        PASSED: str = 'Y'
-        NOT_CHECKED: str = 'N'
-
-    # MailingInst(482): STRING
-    class MailingInst:
-        tag: int = 482
-
-    # TransBkdTime(483): UTCTIMESTAMP
-    class TransBkdTime:
-        tag: int = 483
-
-    # ExecPriceType(484): CHAR
-    class ExecPriceType:
-        tag: int = 484
-        SINGLE_PRICE: str = 'S'
-        OFFER_PRICE_MINUS_ADJUSTMENT_AMOUNT: str = 'Q'
-        OFFER_PRICE_MINUS_ADJUSTMENT: str = 'P'
-        OFFER_PRICE: str = 'O'
-        CREATION_PRICE_PLUS_ADJUSTMENT_AMOUNT: str = 'E'
-        CREATION_PRICE_PLUS_ADJUSTMENT: str = 'D'
-        CREATION_PRICE: str = 'C'
-        BID_PRICE: str = 'B'
-
-    # ExecPriceAdjustment(485): FLOAT
-    class ExecPriceAdjustment:
-        tag: int = 485
-
-    # DateOfBirth(486): LOCALMKTDATE
-    class DateOfBirth:
-        tag: int = 486
-
-    # TradeReportTransType(487): CHAR
-    class TradeReportTransType:
-        tag: int = 487
-        NEW: str = 'N'
-        REPLACE: str = 'R'
-        CANCEL: str = 'C'
-
-    # CardHolderName(488): STRING
-    class CardHolderName:
-        tag: int = 488
-
-    # CardNumber(489): STRING
-    class CardNumber:
-        tag: int = 489
-
-    # CardExpDate(490): LOCALMKTDATE
-    class CardExpDate:
-        tag: int = 490
-
-    # CardIssNo(491): STRING
-    class CardIssNo:
-        tag: int = 491
-
-    # PaymentMethod(492): INT
-    class PaymentMethod:
-        tag: int = 492
-        BPAY: int = 14
-        ACH_CREDIT: int = 13
-        ACH_DEBIT: int = 12
-        CREDIT_CARD: int = 11
-        DIRECT_CREDIT: int = 10
-        DIRECT_DEBIT: int = 9
-        DEBIT_CARD: int = 8
-        FEDWIRE: int = 7
-        HIGH_VALUE_CLEARING_SYSTEM: int = 15
-        EUROCLEAR: int = 3
-        TELEGRAPHIC_TRANSFER: int = 6
-        CLEARSTREAM: int = 4
-        CREST: int = 1
-        NSCC: int = 2
-        CHEQUE: int = 5
-
-    # RegistAcctType(493): STRING
-    class RegistAcctType:
-        tag: int = 493
-
-    # Designation(494): STRING
-    class Designation:
-        tag: int = 494
-
-    # TaxAdvantageType(495): INT
-    class TaxAdvantageType:
-        tag: int = 495
-        PROFIT_SHARING_PLAN: int = 19
-        EMPLOYER: int = 11
-        EMPLOYER_CURRENT_YEAR: int = 12
-        NON_FUND_PROTOTYPE_IRA: int = 13
-        NON_FUND_QUALIFIED_PLAN: int = 14
-        DEFINED_CONTRIBUTION_PLAN: int = 15
-        EMPLOYEE_CURRENT_YEAR: int = 10
-        INDIVIDUAL_RETIREMENT_ACCOUNT_ROLLOVER: int = 17
-        MINI_INSURANCE_ISA: int = 5
-        INDIVIDUAL_RETIREMENT_ACCOUNT: int = 16
-        EMPLOYEE: int = 9
-        ASSET_TRANSFER: int = 8
-        SELF_DIRECTED_IRA: int = 21
-        CURRENT_YEAR_PAYMENT: int = 6
-        _401K: int = 20
-        MINI_STOCKS_AND_SHARES_ISA: int = 4
-        MINI_CASH_ISA: int = 3
-        TESSA: int = 2
-        MAXI_ISA: int = 1
-        NONE_NOT_APPLICABLE: int = 0
-        PRIOR_YEAR_PAYMENT: int = 7
-        _457: int = 23
-        ROTH_IRA_24: int = 24
-        ROTH_IRA_25: int = 25
-        ROTH_CONVERSION_IRA_26: int = 26
-        ROTH_CONVERSION_IRA_27: int = 27
-        EDUCATION_IRA_28: int = 28
-        EDUCATION_IRA_29: int = 29
-        KEOGH: int = 18
-        _403: int = 22
-
-    # RegistRejReasonText(496): STRING
-    class RegistRejReasonText:
-        tag: int = 496
-
-    # FundRenewWaiv(497): CHAR
-    class FundRenewWaiv:
-        tag: int = 497
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # CashDistribAgentName(498): STRING
-    class CashDistribAgentName:
-        tag: int = 498
-
-    # CashDistribAgentCode(499): STRING
-    class CashDistribAgentCode:
-        tag: int = 499
-
-    # CashDistribAgentAcctNumber(500): STRING
-    class CashDistribAgentAcctNumber:
-        tag: int = 500
-
-    # CashDistribPayRef(501): STRING
-    class CashDistribPayRef:
-        tag: int = 501
-
-    # CashDistribAgentAcctName(502): STRING
-    class CashDistribAgentAcctName:
-        tag: int = 502
-
-    # CardStartDate(503): LOCALMKTDATE
-    class CardStartDate:
-        tag: int = 503
-
-    # PaymentDate(504): LOCALMKTDATE
-    class PaymentDate:
-        tag: int = 504
-
-    # PaymentRemitterID(505): STRING
-    class PaymentRemitterID:
-        tag: int = 505
-
-    # RegistStatus(506): CHAR
-    class RegistStatus:
-        tag: int = 506
-        ACCEPT: str = 'A'
-        REMINDER: str = 'N'
-        REJECT: str = 'R'
-        HELD: str = 'H'
-
-    # RegistRejReasonCode(507): INT
-    class RegistRejReasonCode:
-        tag: int = 507
-        INVALID_UNACCEPTABLE_NODISTRIBINSTNS: int = 13
-        INVALID_UNACCEPTABLE_CASH_DISTRIB_AGENT_CODE: int = 17
-        INVALID_UNACCEPTABLE_CASH_DISTRIB_AGENT_ACCT_NAME: int = 16
-        INVALID_UNACCEPTABLE_NO_REG_DETLS: int = 4
-        INVALID_UNACCEPTABLE_DISTRIB_PAYMENT_METHOD: int = 15
-        INVALID_UNACCEPTABLE_DISTRIB_PERCENTAGE: int = 14
-        INVALID_UNACCEPTABLE_OWNERSHIP_TYPE: int = 3
-        INVALID_UNACCEPTABLE_TAX_EXEMPT_TYPE: int = 2
-        INVALID_UNACCEPTABLE_INVESTOR_COUNTRY_OF_RESIDENCE: int = 12
-        INVALID_UNACCEPTABLE_DATE_OF_BIRTH: int = 11
-        INVALID_UNACCEPTABLE_INVESTOR_ID_SOURCE: int = 10
-        INVALID_UNACCEPTABLE_INVESTOR_ID: int = 9
-        INVALID_UNACCEPTABLE_MAILING_INST: int = 8
-        INVALID_UNACCEPTABLE_MAILING_DTLS: int = 7
-        INVALID_UNACCEPTABLE_REG_SEQ_NO: int = 5
-        INVALID_UNACCEPTABLE_ACCOUNT_TYPE: int = 1
-        INVALID_UNACCEPTABLE_CASH_DISTRIB_AGENT_ACCT_NUM: int = 18
-        INVALID_UNACCEPTABLE_REG_DTLS: int = 6
-
-    # RegistRefID(508): STRING
-    class RegistRefID:
-        tag: int = 508
-
-    # RegistDetls(509): STRING
-    class RegistDetls:
-        tag: int = 509
-
-    # NoDistribInsts(510): NUMINGROUP
-    class NoDistribInsts:
-        tag: int = 510
-
-    # RegistEmail(511): STRING
-    class RegistEmail:
-        tag: int = 511
-
-    # DistribPercentage(512): PERCENTAGE
-    class DistribPercentage:
-        tag: int = 512
-
-    # RegistID(513): STRING
-    class RegistID:
-        tag: int = 513
-
-    # RegistTransType(514): CHAR
-    class RegistTransType:
-        tag: int = 514
-        CANCEL: str = '2'
-        NEW: str = '0'
-        REPLACE: str = '1'
-
-    # ExecValuationPoint(515): UTCTIMESTAMP
-    class ExecValuationPoint:
-        tag: int = 515
-
-    # OrderPercent(516): PERCENTAGE
-    class OrderPercent:
-        tag: int = 516
-
-    # OwnershipType(517): CHAR
-    class OwnershipType:
-        tag: int = 517
-
-    # NoContAmts(518): NUMINGROUP
-    class NoContAmts:
-        tag: int = 518
-
-    # ContAmtType(519): INT
-    class ContAmtType:
-        tag: int = 519
-        NET_SETTLEMENT_AMOUNT: int = 15
-        COMMISSION_AMOUNT: int = 1
-        COMMISSION: int = 2
-        INITIAL_CHARGE_AMOUNT: int = 3
-        INITIAL_CHARGE: int = 4
-        DISCOUNT_AMOUNT: int = 5
-        DISCOUNT: int = 6
-        DILUTION_LEVY_AMOUNT: int = 7
-        DILUTION_LEVY: int = 8
-        EXIT_CHARGE_AMOUNT: int = 9
-        EXIT_CHARGE: int = 10
-        FUND_BASED_RENEWAL_COMMISSION: int = 11
-        PROJECTED_FUND_VALUE: int = 12
-        FUND_BASED_RENEWAL_COMMISSION_AMOUNT_14: int = 14
-        FUND_BASED_RENEWAL_COMMISSION_AMOUNT_13: int = 13
-
-    # ContAmtValue(520): FLOAT
-    class ContAmtValue:
-        tag: int = 520
-
-    # ContAmtCurr(521): CURRENCY
-    class ContAmtCurr:
-        tag: int = 521
-
-    # OwnerType(522): INT
-    class OwnerType:
-        tag: int = 522
-        COMPANY_TRUSTEE: int = 5
-        NOMINEE: int = 13
-        CORPORATE_BODY: int = 12
-        NON_PROFIT_ORGANIZATION: int = 11
-        NETWORKING_SUB_ACCOUNT: int = 10
-        FIDUCIARIES: int = 9
-        TRUSTS: int = 8
-        PENSION_PLAN: int = 6
-        INDIVIDUAL_TRUSTEE: int = 4
-        PUBLIC_COMPANY: int = 2
-        PRIVATE_COMPANY: int = 3
-        INDIVIDUAL_INVESTOR: int = 1
-        CUSTODIAN_UNDER_GIFTS_TO_MINORS_ACT: int = 7
-
-    # PartySubID(523): STRING
-    class PartySubID:
-        tag: int = 523
-
-    # NestedPartyID(524): STRING
-    class NestedPartyID:
-        tag: int = 524
-
-    # NestedPartyIDSource(525): CHAR
-    class NestedPartyIDSource:
-        tag: int = 525
-
-    # SecondaryClOrdID(526): STRING
-    class SecondaryClOrdID:
-        tag: int = 526
-
-    # SecondaryExecID(527): STRING
-    class SecondaryExecID:
-        tag: int = 527
-
-    # OrderCapacity(528): CHAR
-    class OrderCapacity:
-        tag: int = 528
-        RISKLESS_PRINCIPAL: str = 'R'
-        INDIVIDUAL: str = 'I'
-        PRINCIPAL: str = 'P'
-        AGENT_FOR_OTHER_MEMBER: str = 'W'
-        AGENCY: str = 'A'
-        PROPRIETARY: str = 'G'
-
-    # OrderRestrictions(529): MULTIPLEVALUESTRING
-    class OrderRestrictions:
-        tag: int = 529
-        FOREIGN_ENTITY: str = "7"
-        RISKLESS_ARBITRAGE: str = "A"
-        PROGRAM_TRADE: str = "1"
-        EXTERNAL_MARKET_PARTICIPANT: str = "8"
-        ACTING_AS_MARKET_MAKER_OR_SPECIALIST_IN_THE_UNDERLYING_SECURITY_OF_A_DERIVATIVE_SECURITY: str = "6"
-        ACTING_AS_MARKET_MAKER_OR_SPECIALIST_IN_THE_SECURITY: str = "5"
-        NON_INDEX_ARBITRAGE: str = "3"
-        INDEX_ARBITRAGE: str = "2"
-        COMPETING_MARKET_MAKER: str = "4"
-        EXTERNAL_INTER_CONNECTED_MARKET_LINKAGE: str = "9"
-
-    # MassCancelRequestType(530): CHAR
-    class MassCancelRequestType:
-        tag: int = 530
-        CANCEL_ORDERS_FOR_A_SECURITY: str = '1'
-        CANCEL_ALL_ORDERS: str = '7'
-        CANCEL_ORDERS_FOR_A_TRADING_SESSION: str = '6'
-        CANCEL_ORDERS_FOR_A_SECURITYTYPE: str = '5'
-        CANCEL_ORDERS_FOR_A_CFICODE: str = '4'
-        CANCEL_ORDERS_FOR_AN_UNDERLYING_SECURITY: str = '2'
-        CANCEL_ORDERS_FOR_A_PRODUCT: str = '3'
-
-    # MassCancelResponse(531): CHAR
-    class MassCancelResponse:
-        tag: int = 531
-        CANCEL_ORDERS_FOR_A_TRADING_SESSION: str = '6'
-        CANCEL_REQUEST_REJECTED: str = '0'
-        CANCEL_ALL_ORDERS: str = '7'
-        CANCEL_ORDERS_FOR_A_PRODUCT: str = '3'
-        CANCEL_ORDERS_FOR_A_SECURITYTYPE: str = '5'
-        CANCEL_ORDERS_FOR_A_CFICODE: str = '4'
-        CANCEL_ORDERS_FOR_A_SECURITY: str = '1'
-        CANCEL_ORDERS_FOR_AN_UNDERLYING_SECURITY: str = '2'
-
-    # MassCancelRejectReason(532): CHAR
-    class MassCancelRejectReason:
-        tag: int = 532
-        INVALID_OR_UNKNOWN_UNDERLYING: str = '2'
-        INVALID_OR_UNKNOWN_TRADING_SESSION: str = '6'
-        INVALID_OR_UNKNOWN_SECURITY_TYPE: str = '5'
-        INVALID_OR_UNKNOWN_PRODUCT: str = '3'
-        INVALID_OR_UNKNOWN_SECURITY: str = '1'
-        MASS_CANCEL_NOT_SUPPORTED: str = '0'
-        INVALID_OR_UNKNOWN_CFICODE: str = '4'
-
-    # TotalAffectedOrders(533): INT
-    class TotalAffectedOrders:
-        tag: int = 533
-
-    # NoAffectedOrders(534): INT
-    class NoAffectedOrders:
-        tag: int = 534
-
-    # AffectedOrderID(535): STRING
-    class AffectedOrderID:
-        tag: int = 535
-
-    # AffectedSecondaryOrderID(536): STRING
-    class AffectedSecondaryOrderID:
-        tag: int = 536
-
-    # QuoteType(537): INT
-    class QuoteType:
-        tag: int = 537
-        INDICATIVE: int = 0
-        TRADEABLE: int = 1
-        RESTRICTED_TRADEABLE: int = 2
-
-    # NestedPartyRole(538): INT
-    class NestedPartyRole:
-        tag: int = 538
-
-    # NoNestedPartyIDs(539): NUMINGROUP
-    class NoNestedPartyIDs:
-        tag: int = 539
-
-    # TotalAccruedInterestAmt(540): AMT
-    class TotalAccruedInterestAmt:
-        tag: int = 540
-
-    # MaturityDate(541): LOCALMKTDATE
-    class MaturityDate:
-        tag: int = 541
-
-    # UnderlyingMaturityDate(542): LOCALMKTDATE
-    class UnderlyingMaturityDate:
-        tag: int = 542
-
-    # InstrRegistry(543): STRING
-    class InstrRegistry:
-        tag: int = 543
-
-    # CashMargin(544): CHAR
-    class CashMargin:
-        tag: int = 544
-        MARGIN_OPEN: str = '2'
-        MARGIN_CLOSE: str = '3'
-        CASH: str = '1'
-
-    # NestedPartySubID(545): STRING
-    class NestedPartySubID:
-        tag: int = 545
-
-    # Scope(546): MULTIPLEVALUESTRING
-    class Scope:
-        tag: int = 546
-        LOCAL: str = "1"
-        NATIONAL: str = "2"
-        GLOBAL: str = "3"
-
-    # MDImplicitDelete(547): BOOLEAN
-    class MDImplicitDelete:
-        tag: int = 547
-        YES: str = 'Y'
-        NO: str = 'N'
-
-    # CrossID(548): STRING
-    class CrossID:
-        tag: int = 548
-
-    # CrossType(549): INT
-    class CrossType:
-        tag: int = 549
-        CROSS_TRADE_WHICH_IS_EXECUTED_COMPLETELY_OR_NOT_BOTH_SIDES_ARE_TREATED_IN_THE_SAME_MANNER_THIS_IS_EQUIVALENT_TO_AN_ALL_OR_NONE: int = 1
-        CROSS_TRADE_WHICH_IS_EXECUTED_PARTIALLY_AND_THE_REST_IS_CANCELLED_ONE_SIDE_IS_FULLY_EXECUTED_THE_OTHER_SIDE_IS_PARTIALLY_EXECUTED_WITH_THE_REMAINDER_BEING_CANCELLED_THIS_IS_EQUIVALENT_TO_AN_IMMEDIATE_OR_CANCEL_ON_THE_OTHER_SIDE: int = 2
-        CROSS_TRADE_WHICH_IS_PARTIALLY_EXECUTED_WITH_THE_UNFILLED_PORTIONS_REMAINING_ACTIVE_ONE_SIDE_OF_THE_CROSS_IS_FULLY_EXECUTED: int = 3
-        CROSS_TRADE_IS_EXECUTED_WITH_EXISTING_ORDERS_WITH_THE_SAME_PRICE: int = 4
-
-    # CrossPrioritization(550): INT
-    class CrossPrioritization:
-        tag: int = 550
-        SELLSIDE_PRIORITIZED: int = 2
-        NONE: int = 0
-        BUYSIDE_PRIORITIZED: int = 1
-
-    # OrigCrossID(551): STRING
-    class OrigCrossID:
-        tag: int = 551
-
-    # NoSides(552): NUMINGROUP
-    class NoSides:
-        tag: int = 552
-        ONE_SIDE: str = "1"
-        BOTH_SIDES: str = "2"
-
-    # Username(553): STRING
-    class Username:
-        tag: int = 553
-
-    # Password(554): STRING
-    class Password:
-        tag: int = 554
-
-    # NoLegs(555): NUMINGROUP
-    class NoLegs:
-        tag: int = 555
-
-    # LegCurrency(556): CURRENCY
-    class LegCurrency:
-        tag: int = 556
-
-    # TotalNumSecurityTypes(557): INT
-    class TotalNumSecurityTypes:
-        tag: int = 557
-
-    # NoSecurityTypes(558): NUMINGROUP
-    class NoSecurityTypes:
-        tag: int = 558
-
-    # SecurityListRequestType(559): INT
-    class SecurityListRequestType:
-        tag: int = 559
-        SECURITYTYPE_AND_OR_CFICODE: int = 1
-        PRODUCT: int = 2
-        TRADINGSESSIONID: int = 3
-        ALL_SECURITIES: int = 4
-        SYMBOL: int = 0
-
-    # SecurityRequestResult(560): INT
-    class SecurityRequestResult:
-        tag: int = 560
-        INSTRUMENT_DATA_TEMPORARILY_UNAVAILABLE: int = 4
-        VALID_REQUEST: int = 0
-        INVALID_OR_UNSUPPORTED_REQUEST: int = 1
-        REQUEST_FOR_INSTRUMENT_DATA_NOT_SUPPORTED: int = 5
-        NOT_AUTHORIZED_TO_RETRIEVE_INSTRUMENT_DATA: int = 3
-        NO_INSTRUMENTS_FOUND_THAT_MATCH_SELECTION_CRITERIA: int = 2
-
-    # RoundLot(561): QTY
-    class RoundLot:
-        tag: int = 561
-
-    # MinTradeVol(562): QTY
-    class MinTradeVol:
-        tag: int = 562
-
-    # MultiLegRptTypeReq(563): INT
-    class MultiLegRptTypeReq:
-        tag: int = 563
-
-    # LegPositionEffect(564): CHAR
-    class LegPositionEffect:
-        tag: int = 564
-
-    # LegCoveredOrUncovered(565): INT
-    class LegCoveredOrUncovered:
-        tag: int = 565
-
-    # LegPrice(566): PRICE
-    class LegPrice:
-        tag: int = 566
-
-    # TradSesStatusRejReason(567): INT
-    class TradSesStatusRejReason:
-        tag: int = 567
-        UNKNOWN_OR_INVALID_TRADINGSESSIONID: int = 1
-
-    # TradeRequestID(568): STRING
-    class TradeRequestID:
-        tag: int = 568
-
-    # TradeRequestType(569): INT
-    class TradeRequestType:
-        tag: int = 569
-        ADVISORIES_THAT_MATCH_CRITERIA: int = 4
-        UNREPORTED_TRADES_THAT_MATCH_CRITERIA: int = 3
-        UNMATCHED_TRADES_THAT_MATCH_CRITERIA: int = 2
-        MATCHED_TRADES_MATCHING_CRITERIA_PROVIDED_ON_REQUEST: int = 1
-        ALL_TRADES: int = 0
-
-    # PreviouslyReported(570): BOOLEAN
-    class PreviouslyReported:
-        tag: int = 570
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # TradeReportID(571): STRING
-    class TradeReportID:
-        tag: int = 571
-
-    # TradeReportRefID(572): STRING
-    class TradeReportRefID:
-        tag: int = 572
-
-    # MatchStatus(573): CHAR
-    class MatchStatus:
-        tag: int = 573
-        COMPARED_MATCHED_OR_AFFIRMED: str = '0'
-        UNCOMPARED_UNMATCHED_OR_UNAFFIRMED: str = '1'
-        ADVISORY_OR_ALERT: str = '2'
-
-    # MatchType(574): STRING
-    class MatchType:
-        tag: int = 574
-        SUMMARIZED_MATCH_USING_A1_TO_A5_EXACT_MATCH_CRITERIA_EXCEPT_QUANTITY_IS_SUMMARIZED_S5: str = "S5"
-        ACT_M1_MATCH: str = "M1"
-        ACT_M6_MATCH: str = "M6"
-        ACT_DEFAULT_AFTER_M2: str = "M5"
-        ACT_ACCEPTED_TRADE: str = "M3"
-        SUMMARIZED_MATCH_USING_A1_TO_A5_EXACT_MATCH_CRITERIA_EXCEPT_QUANTITY_IS_SUMMARIZED_S2: str = "S2"
-        SUMMARIZED_MATCH_USING_A1_TO_A5_EXACT_MATCH_CRITERIA_EXCEPT_QUANTITY_IS_SUMMARIZED_S3: str = "S3"
-        SUMMARIZED_MATCH_USING_A1_TO_A5_EXACT_MATCH_CRITERIA_EXCEPT_QUANTITY_IS_SUMMARIZED_S4: str = "S4"
-        ACT_M2_MATCH: str = "M2"
-        EXACT_MATCH_ON_TRADE_DATE_STOCK_SYMBOL_QUANTITY_PRICE_TRADE_TYPE_AND_SPECIAL_TRADE_INDICATOR_PLUS_FOUR_BADGES: str = "A2"
-        EXACT_MATCH_ON_TRADE_DATE_STOCK_SYMBOL_QUANTITY_PRICE_TRADE_TYPE_AND_SPECIAL_TRADE_INDICATOR_PLUS_TWO_BADGES_AND_EXECUTION_TIME: str = "A3"
-        EXACT_MATCH_ON_TRADE_DATE_STOCK_SYMBOL_QUANTITY_PRICE_TRADE_TYPE_AND: str = "A4"
-        COMPARED_RECORDS_RESULTING_FROM_STAMPED_ADVISORIES_OR_SPECIALIST: str = "AQ"
-        NON_ACT: str = "MT"
-        ACT_DEFAULT_TRADE: str = "M4"
-        EXACT_MATCH_ON_TRADE_DATE_STOCK_SYMBOL_QUANTITY_PRICE_TRADE_TYPE_AND_SPECIAL_TRADE_INDICATOR_PLUS_FOUR_BADGES_AND_EXECUTION_TIME: str = "A1"
-        SUMMARIZED_MATCH_USING_A1_TO_A5_EXACT_MATCH_CRITERIA_EXCEPT_QUANTITY_IS_SUMMARIZED_S1: str = "S1"
-        EXACT_MATCH_ON_TRADE_DATE_STOCK_SYMBOL_QUANTITY_PRICE_TRADE_TYPE_AND_SPECIAL_TRADE_INDICATOR_PLUS_EXECUTION_TIME: str = "A5"
-
-    # OddLot(575): BOOLEAN
-    class OddLot:
-        tag: int = 575
-
-    # NoClearingInstructions(576): INT
-    class NoClearingInstructions:
-        tag: int = 576
-
-    # ClearingInstruction(577): INT
-    class ClearingInstruction:
-        tag: int = 577
-        MANUAL_MODE: int = 8
-        MULTILATERAL_NETTING: int = 5
-        AUTOMATIC_POSTING_MODE: int = 9
-        BILATERAL_NETTING_ONLY: int = 2
-        CLEAR_AGAINST_CENTRAL_COUNTERPARTY: int = 6
-        AUTOMATIC_GIVE_UP_MODE: int = 10
-        SPECIAL_TRADE: int = 4
-        EX_CLEARING: int = 3
-        PROCESS_NORMALLY: int = 0
-        EXCLUDE_FROM_CENTRAL_COUNTERPARTY: int = 7
-        EXCLUDE_FROM_ALL_NETTING: int = 1
-
-    # TradeInputSource(578): STRING
-    class TradeInputSource:
-        tag: int = 578
-
-    # TradeInputDevice(579): STRING
-    class TradeInputDevice:
-        tag: int = 579
-
-    # NoDates(580): INT
-    class NoDates:
-        tag: int = 580
-
-    # AccountType(581): INT
-    class AccountType:
-        tag: int = 581
-        HOUSE_TRADER: int = 3
-        ACCOUNT_IS_HOUSE_TRADER_AND_IS_CROSS_MARGINED: int = 7
-        ACCOUNT_IS_CARRIED_ON_NON_CUSTOMER_SIDE_OF_BOOKS_AND_IS_CROSS_MARGINED: int = 6
-        FLOOR_TRADER: int = 4
-        ACCOUNT_IS_CARRIED_ON_NON_CUSTOMER_SIDE_OF_BOOKS: int = 2
-        ACCOUNT_IS_CARRIED_ON_CUSTOMER_SIDE_OF_BOOKS: int = 1
-        JOINT_BACKOFFICE_ACCOUNT: int = 8
-
-    # CustOrderCapacity(582): INT
-    class CustOrderCapacity:
-        tag: int = 582
-
-    # ClOrdLinkID(583): STRING
-    class ClOrdLinkID:
-        tag: int = 583
-
-    # MassStatusReqID(584): STRING
-    class MassStatusReqID:
-        tag: int = 584
-
-    # MassStatusReqType(585): INT
-    class MassStatusReqType:
-        tag: int = 585
-        STATUS_FOR_ORDERS_FOR_A_SECURITY: int = 1
-        STATUS_FOR_ORDERS_FOR_AN_UNDERLYING_SECURITY: int = 2
-        STATUS_FOR_ORDERS_FOR_A_PRODUCT: int = 3
-        STATUS_FOR_ORDERS_FOR_A_CFICODE: int = 4
-        STATUS_FOR_ORDERS_FOR_A_SECURITYTYPE: int = 5
-        STATUS_FOR_ORDERS_FOR_A_TRADING_SESSION: int = 6
-        STATUS_FOR_ORDERS_FOR_A_PARTYID: int = 8
-        STATUS_FOR_ALL_ORDERS: int = 7
-
-    # OrigOrdModTime(586): UTCTIMESTAMP
-    class OrigOrdModTime:
-        tag: int = 586
-
-    # LegSettlmntTyp(587): CHAR
-    class LegSettlmntTyp:
-        tag: int = 587
-
-    # LegFutSettDate(588): LOCALMKTDATE
-    class LegFutSettDate:
-        tag: int = 588
-
-    # DayBookingInst(589): CHAR
-    class DayBookingInst:
-        tag: int = 589
-        CAN_TRIGGER_BOOKING_WITHOUT_REFERENCE_TO_THE_ORDER_INITIATOR: str = '0'
-        SPEAK_WITH_ORDER_INITIATOR_BEFORE_BOOKING: str = '1'
-
-    # BookingUnit(590): CHAR
-    class BookingUnit:
-        tag: int = 590
-        AGGREGATE_PARTIAL_EXECUTIONS_ON_THIS_ORDER_AND_BOOK_ONE_TRADE_PER_ORDER: str = '1'
-        AGGREGATE_EXECUTIONS_FOR_THIS_SYMBOL_SIDE_AND_SETTLEMENT_DATE: str = '2'
-        EACH_PARTIAL_EXECUTION_IS_A_BOOKABLE_UNIT: str = '0'
-
-    # PreallocMethod(591): CHAR
-    class PreallocMethod:
-        tag: int = 591
-        PRO_RATA: str = '0'
-        DO_NOT_PRO_RATA_DISCUSS_FIRST: str = '1'
-
-    # UnderlyingCountryOfIssue(592): COUNTRY
-    class UnderlyingCountryOfIssue:
-        tag: int = 592
-
-    # UnderlyingStateOrProvinceOfIssue(593): STRING
-    class UnderlyingStateOrProvinceOfIssue:
-        tag: int = 593
-
-    # UnderlyingLocaleOfIssue(594): STRING
-    class UnderlyingLocaleOfIssue:
-        tag: int = 594
-
-    # UnderlyingInstrRegistry(595): STRING
-    class UnderlyingInstrRegistry:
-        tag: int = 595
-
-    # LegCountryOfIssue(596): COUNTRY
-    class LegCountryOfIssue:
-        tag: int = 596
-
-    # LegStateOrProvinceOfIssue(597): STRING
-    class LegStateOrProvinceOfIssue:
-        tag: int = 597
-
-    # LegLocaleOfIssue(598): STRING
-    class LegLocaleOfIssue:
-        tag: int = 598
-
-    # LegInstrRegistry(599): STRING
-    class LegInstrRegistry:
-        tag: int = 599
-
-    # LegSymbol(600): STRING
-    class LegSymbol:
-        tag: int = 600
-
-    # LegSymbolSfx(601): STRING
-    class LegSymbolSfx:
-        tag: int = 601
-
-    # LegSecurityID(602): STRING
-    class LegSecurityID:
-        tag: int = 602
-
-    # LegSecurityIDSource(603): STRING
-    class LegSecurityIDSource:
-        tag: int = 603
-
-    # NoLegSecurityAltID(604): STRING
-    class NoLegSecurityAltID:
-        tag: int = 604
-
-    # LegSecurityAltID(605): STRING
-    class LegSecurityAltID:
-        tag: int = 605
-
-    # LegSecurityAltIDSource(606): STRING
-    class LegSecurityAltIDSource:
-        tag: int = 606
-
-    # LegProduct(607): INT
-    class LegProduct:
-        tag: int = 607
-
-    # LegCFICode(608): STRING
-    class LegCFICode:
-        tag: int = 608
-
-    # LegSecurityType(609): STRING
-    class LegSecurityType:
-        tag: int = 609
-
-    # LegMaturityMonthYear(610): MONTHYEAR
-    class LegMaturityMonthYear:
-        tag: int = 610
-
-    # LegMaturityDate(611): LOCALMKTDATE
-    class LegMaturityDate:
-        tag: int = 611
-
-    # LegStrikePrice(612): PRICE
-    class LegStrikePrice:
-        tag: int = 612
-
-    # LegOptAttribute(613): CHAR
-    class LegOptAttribute:
-        tag: int = 613
-
-    # LegContractMultiplier(614): FLOAT
-    class LegContractMultiplier:
-        tag: int = 614
-
-    # LegCouponRate(615): PERCENTAGE
-    class LegCouponRate:
-        tag: int = 615
-
-    # LegSecurityExchange(616): EXCHANGE
-    class LegSecurityExchange:
-        tag: int = 616
-
-    # LegIssuer(617): STRING
-    class LegIssuer:
-        tag: int = 617
-
-    # EncodedLegIssuerLen(618): LENGTH
-    class EncodedLegIssuerLen:
-        tag: int = 618
-
-    # EncodedLegIssuer(619): DATA
-    class EncodedLegIssuer:
-        tag: int = 619
-
-    # LegSecurityDesc(620): STRING
-    class LegSecurityDesc:
-        tag: int = 620
-
-    # EncodedLegSecurityDescLen(621): LENGTH
-    class EncodedLegSecurityDescLen:
-        tag: int = 621
-
-    # EncodedLegSecurityDesc(622): DATA
-    class EncodedLegSecurityDesc:
-        tag: int = 622
-
-    # LegRatioQty(623): FLOAT
-    class LegRatioQty:
-        tag: int = 623
-
-    # LegSide(624): CHAR
-    class LegSide:
-        tag: int = 624
-
-    # TradingSessionSubID(625): STRING
-    class TradingSessionSubID:
-        tag: int = 625
-
-    # AllocType(626): INT
-    class AllocType:
-        tag: int = 626
-        BUYSIDE_READY_TO_BOOK_6: int = 6
-        BUYSIDE_PRELIMINARY: int = 2
-        SELLSIDE_CALCULATED_USING_PRELIMINARY: int = 3
-        BUYSIDE_READY_TO_BOOK_5: int = 5
-        BUYSIDE_CALCULATED: int = 1
-        SELLSIDE_CALCULATED_WITHOUT_PRELIMINARY: int = 4
-
-    # NoHops(627): NUMINGROUP
-    class NoHops:
-        tag: int = 627
-
-    # HopCompID(628): STRING
-    class HopCompID:
-        tag: int = 628
-
-    # HopSendingTime(629): UTCTIMESTAMP
-    class HopSendingTime:
-        tag: int = 629
-
-    # HopRefID(630): SEQNUM
-    class HopRefID:
-        tag: int = 630
-
-    # MidPx(631): PRICE
-    class MidPx:
-        tag: int = 631
-
-    # BidYield(632): PERCENTAGE
-    class BidYield:
-        tag: int = 632
-
-    # MidYield(633): PERCENTAGE
-    class MidYield:
-        tag: int = 633
-
-    # OfferYield(634): PERCENTAGE
-    class OfferYield:
-        tag: int = 634
-
-    # ClearingFeeIndicator(635): STRING
-    class ClearingFeeIndicator:
-        tag: int = 635
-        _106H_AND_106J_FIRMS: str = "H"
-        _5TH_YEAR_DELEGATE_TRADING_FOR_HIS_OWN_ACCOUNT: str = "5"
-        _4TH_YEAR_DELEGATE_TRADING_FOR_HIS_OWN_ACCOUNT: str = "4"
-        _3RD_YEAR_DELEGATE_TRADING_FOR_HIS_OWN_ACCOUNT: str = "3"
-        _2ND_YEAR_DELEGATE_TRADING_FOR_HIS_OWN_ACCOUNT: str = "2"
-        _1ST_YEAR_DELEGATE_TRADING_FOR_HIS_OWN_ACCOUNT: str = "1"
-        ALL_OTHER_OWNERSHIP_TYPES: str = "M"
-        GIM_IDEM_AND_COM_MEMBERSHIP_INTEREST_HOLDERS: str = "I"
-        _6TH_YEAR_AND_BEYOND_DELEGATE_TRADING_FOR_HIS_OWN_ACCOUNT: str = "9"
-        FULL_AND_ASSOCIATE_MEMBER_TRADING_FOR_OWN_ACCOUNT_AND_AS_FLOOR: str = "F"
-        EQUITY_MEMBER_AND_CLEARING_MEMBER: str = "E"
-        NON_MEMBER_AND_CUSTOMER: str = "C"
-        CBOE_MEMBER: str = "B"
-        LESSEE_AND_106F_EMPLOYEES: str = "L"
-
-    # WorkingIndicator(636): BOOLEAN
-    class WorkingIndicator:
-        tag: int = 636
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # LegLastPx(637): PRICE
-    class LegLastPx:
-        tag: int = 637
-
-    # PriorityIndicator(638): INT
-    class PriorityIndicator:
-        tag: int = 638
-        PRIORITY_UNCHANGED: int = 0
-        LOST_PRIORITY_AS_RESULT_OF_ORDER_CHANGE: int = 1
-
-    # PriceImprovement(639): PRICEOFFSET
-    class PriceImprovement:
-        tag: int = 639
-
-    # Price2(640): PRICE
-    class Price2:
-        tag: int = 640
-
-    # LastForwardPoints2(641): PRICEOFFSET
-    class LastForwardPoints2:
-        tag: int = 641
-
-    # BidForwardPoints2(642): PRICEOFFSET
-    class BidForwardPoints2:
-        tag: int = 642
-
-    # OfferForwardPoints2(643): PRICEOFFSET
-    class OfferForwardPoints2:
-        tag: int = 643
-
-    # RFQReqID(644): STRING
-    class RFQReqID:
-        tag: int = 644
-
-    # MktBidPx(645): PRICE
-    class MktBidPx:
-        tag: int = 645
-
-    # MktOfferPx(646): PRICE
-    class MktOfferPx:
-        tag: int = 646
-
-    # MinBidSize(647): QTY
-    class MinBidSize:
-        tag: int = 647
-
-    # MinOfferSize(648): QTY
-    class MinOfferSize:
-        tag: int = 648
-
-    # QuoteStatusReqID(649): STRING
-    class QuoteStatusReqID:
-        tag: int = 649
-
-    # LegalConfirm(650): BOOLEAN
-    class LegalConfirm:
-        tag: int = 650
-        YES: str = 'Y'
-        NO: str = 'N'
-
-    # UnderlyingLastPx(651): PRICE
-    class UnderlyingLastPx:
-        tag: int = 651
-
-    # UnderlyingLastQty(652): QTY
-    class UnderlyingLastQty:
-        tag: int = 652
-
-    # SecDefStatus(653): INT
-    class SecDefStatus:
-        tag: int = 653
-        REJECTED: int = 2
-        UNAUTHORIZED_REQUEST: int = 3
-        APPROVED: int = 1
-        PENDING_APPROVAL: int = 0
-        INVALID_DEFINITION_REQUEST: int = 4
-
-    # LegRefID(654): STRING
-    class LegRefID:
-        tag: int = 654
-
-    # ContraLegRefID(655): STRING
-    class ContraLegRefID:
-        tag: int = 655
-
-    # SettlCurrBidFxRate(656): FLOAT
-    class SettlCurrBidFxRate:
-        tag: int = 656
-
-    # SettlCurrOfferFxRate(657): FLOAT
-    class SettlCurrOfferFxRate:
-        tag: int = 657
-
-    # QuoteRequestRejectReason(658): INT
-    class QuoteRequestRejectReason:
-        tag: int = 658
-        UNKNOWN_SYMBOL: int = 1
-        EXCHANGE: int = 2
-        QUOTE_REQUEST_EXCEEDS_LIMIT: int = 3
-        TOO_LATE_TO_ENTER: int = 4
-        INVALID_PRICE: int = 5
-        NOT_AUTHORIZED_TO_REQUEST_QUOTE: int = 6
-
-    # SideComplianceID(659): STRING
-    class SideComplianceID:
-        tag: int = 659
+from UPA.fields import FieldDictionary
+
+FIX43_Fields = FieldDictionary("FIX43", (
+    (1, 'Account', 'STRING', ()),
+    (2, 'AdvId', 'STRING', ()),
+    (3, 'AdvRefID', 'STRING', ()),
+    (4, 'AdvSide', 'CHAR', (('BUY', 'B'), ('SELL', 'S'), ('CROSS', 'X'), ('TRADE', 'T'),)),
+    (5, 'AdvTransType', 'STRING', (('NEW', 'N'), ('CANCEL', 'C'), ('REPLACE', 'R'),)),
+    (6, 'AvgPx', 'PRICE', ()),
+    (7, 'BeginSeqNo', 'SEQNUM', ()),
+    (8, 'BeginString', 'STRING', ()),
+    (9, 'BodyLength', 'LENGTH', ()),
+    (10, 'CheckSum', 'STRING', ()),
+    (11, 'ClOrdID', 'STRING', ()),
+    (12, 'Commission', 'AMT', ()),
+    (13, 'CommType', 'CHAR', (('PER_BOND', '6'), ('PER_SHARE', '1'), ('PERCENTAGE', '2'), ('ABSOLUTE', '3'), ('_5', '5'), ('_4', '4'),)),
+    (14, 'CumQty', 'QTY', ()),
+    (15, 'Currency', 'CURRENCY', ()),
+    (16, 'EndSeqNo', 'SEQNUM', ()),
+    (17, 'ExecID', 'STRING', ()),
+    (18, 'ExecInst', 'MULTIPLEVALUESTRING', (('TRYTOSTOP', 'Y'), ('MIDPRCPEG', 'M'), ('MARKPEG', 'P'), ('CANCELONSYSFAIL', 'Q'), ('PRIMPEG', 'R'), ('SUSPEND', 'S'), ('CUSTDISPINST', 'U'), ('NETTING', 'V'), ('PEGVWAP', 'W'), ('TRADEALONG', 'X'), ('PERCVOL', 'D'), ('STAYOFFER', '0'), ('WORK', '2'), ('OVERDAY', '4'), ('HELD', '5'), ('PARTNOTINIT', '6'), ('STRICTSCALE', '7'), ('TRYTOSCALE', '8'), ('STAYBID', '9'), ('NOCROSS', 'A'), ('OPENPEG', 'O'), ('CALLFIRST', 'C'), ('NONNEGO', 'N'), ('DNI', 'E'), ('DNR', 'F'), ('AON', 'G'), ('RESTATEONSYSFAIL', 'H'), ('INSTITONLY', 'I'), ('RESTATEONTRADINGHALT', 'J'), ('CANCELONTRADINGHALT', 'K'), ('LASTPEG', 'L'), ('GOALONG', '3'), ('OKCROSS', 'B'), ('NOTHELD', '1'),)),
+    (19, 'ExecRefID', 'STRING', ()),
+    (20, 'ExecTransType', 'CHAR', (('CANCEL', '1'), ('NEW', '0'), ('STATUS', '3'), ('CORRECT', '2'),)),
+    (21, 'HandlInst', 'CHAR', (('AUTOMATED_EXECUTION_ORDER_PRIVATE_NO_BROKER_INTERVENTION', '1'), ('AUTOMATED_EXECUTION_ORDER_PUBLIC_BROKER_INTERVENTION_OK', '2'), ('MANUAL_ORDER_BEST_EXECUTION', '3'),)),
+    (22, 'SecurityIDSource', 'STRING', (('SICOVAM', 'E'), ('SEDOL', '2'), ('CUSIP', '1'), ('QUIK', '3'), ('BELGIAN', 'F'), ('VALOREN', 'D'), ('DUTCH', 'C'), ('WERTPAPIER', 'B'), ('BLOOMBERG_SYMBOL', 'A'), ('CONSOLIDATED_TAPE_ASSOCIATION', '9'), ('EXCHANGE_SYMBOL', '8'), ('ISO_COUNTRY_CODE', '7'), ('ISO_CURRENCY_CODE', '6'), ('RIC_CODE', '5'), ('ISIN_NUMBER', '4'), ('COMMON', 'G'),)),
+    (23, 'IOIid', 'STRING', ()),
+    (24, 'IOIOthSvc', 'CHAR', ()),
+    (25, 'IOIQltyInd', 'CHAR', (('MEDIUM', 'M'), ('HIGH', 'H'), ('LOW', 'L'),)),
+    (26, 'IOIRefID', 'STRING', ()),
+    (27, 'IOIQty', 'STRING', (('LARGE', 'L'), ('MEDIUM', 'M'), ('SMALL', 'S'),)),
+    (28, 'IOITransType', 'CHAR', (('CANCEL', 'C'), ('NEW', 'N'), ('REPLACE', 'R'),)),
+    (29, 'LastCapacity', 'CHAR', (('PRINCIPAL', '4'), ('CROSS_AS_PRINCIPAL', '3'), ('AGENT', '1'), ('CROSS_AS_AGENT', '2'),)),
+    (30, 'LastMkt', 'EXCHANGE', ()),
+    (31, 'LastPx', 'PRICE', ()),
+    (32, 'LastQty', 'QTY', ()),
+    (33, 'LinesOfText', 'NUMINGROUP', ()),
+    (34, 'MsgSeqNum', 'SEQNUM', ()),
+    (35, 'MsgType', 'STRING', (('LIST_STRIKE_PRICE', 'm'), ('BID_RESPONSE', 'l'), ('BID_REQUEST', 'k'), ('BUSINESS_MESSAGE_REJECT', 'j'), ('MASS_QUOTE', 'i'), ('TRADING_SESSION_STATUS', 'h'), ('ORDER_MASS_CANCEL_REQUEST', 'q'), ('TRADE_CAPTURE_REPORT', 'AE'), ('REGISTRATION_INSTRUCTIONS', 'o'), ('DERIVATIVE_SECURITY_LIST_REQUEST', 'z'), ('QUOTE_STATUS_REPORT', 'AI'), ('RFQ_REQUEST', 'AH'), ('QUOTE_REQUEST_REJECT', 'AG'), ('ORDER_MASS_STATUS_REQUEST', 'AF'), ('XML_MESSAGE', 'n'), ('TRADE_CAPTURE_REPORT_REQUEST', 'AD'), ('TRADING_SESSION_STATUS_REQUEST', 'g'), ('MULTILEG_ORDER_CANCEL_REPLACE', 'AC'), ('DERIVATIVE_SECURITY_LIST', 'AA'), ('ORDER_MASS_CANCEL_REPORT', 'r'), ('SECURITY_LIST', 'y'), ('SECURITY_LIST_REQUEST', 'x'), ('SECURITY_TYPES', 'w'), ('SECURITY_TYPE_REQUEST', 'v'), ('CROSS_ORDER_CANCEL_REQUEST', 'u'), ('CROSS_ORDER_CANCEL_REPLACE_REQUEST', 't'), ('NEW_ORDER_s', 's'), ('NEW_ORDER_AB', 'AB'), ('ORDER_CANCEL_REJECT', '9'), ('ADVERTISEMENT', '7'), ('LIST_STATUS_REQUEST', 'M'), ('ORDER_LIST', 'E'), ('ORDER_SINGLE', 'D'), ('EMAIL', 'C'), ('NEWS', 'B'), ('LOGON', 'A'), ('LIST_STATUS', 'N'), ('SECURITY_STATUS', 'f'), ('ALLOCATION_ACK', 'P'), ('EXECUTION_REPORT', '8'), ('HEARTBEAT', '0'), ('TEST_REQUEST', '1'), ('RESEND_REQUEST', '2'), ('REJECT', '3'), ('SEQUENCE_RESET', '4'), ('LOGOUT', '5'), ('INDICATION_OF_INTEREST', '6'), ('ORDER_CANCEL_REPLACE_REQUEST', 'G'), ('LIST_CANCEL_REQUEST', 'K'), ('SECURITY_STATUS_REQUEST', 'e'), ('SECURITY_DEFINITION', 'd'), ('SECURITY_DEFINITION_REQUEST', 'c'), ('MASS_QUOTE_ACKNOWLEDGEMENT', 'b'), ('QUOTE_STATUS_REQUEST', 'a'), ('QUOTE_CANCEL', 'Z'), ('MARKET_DATA_REQUEST_REJECT', 'Y'), ('ORDER_CANCEL_REQUEST', 'F'), ('ALLOCATION', 'J'), ('REGISTRATION_INSTRUCTIONS_RESPONSE', 'p'), ('LIST_EXECUTE', 'L'), ('MARKET_DATA_INCREMENTAL_REFRESH', 'X'), ('MARKET_DATA_SNAPSHOT_FULL_REFRESH', 'W'), ('MARKET_DATA_REQUEST', 'V'), ('SETTLEMENT_INSTRUCTIONS', 'T'), ('QUOTE', 'S'), ('QUOTE_REQUEST', 'R'), ('DONT_KNOW_TRADE', 'Q'), ('ORDER_STATUS_REQUEST', 'H'),)),
+    (36, 'NewSeqNo', 'SEQNUM', ()),
+    (37, 'OrderID', 'STRING', ()),
+    (38, 'OrderQty', 'QTY', ()),
+    (39, 'OrdStatus', 'CHAR', (('NEW', '0'), ('PARTIALLY_FILLED', '1'), ('REPLACED', '5'), ('FILLED', '2'), ('PENDING_CANCEL', '6'), ('STOPPED', '7'), ('REJECTED', '8'), ('SUSPENDED', '9'), ('PENDING_NEW', 'A'), ('CALCULATED', 'B'), ('EXPIRED', 'C'), ('ACCEPTED_FOR_BIDDING', 'D'), ('PENDING_REPLACE', 'E'), ('DONE_FOR_DAY', '3'), ('CANCELED', '4'),)),
+    (40, 'OrdType', 'CHAR', (('PREVIOUSLY_QUOTED', 'D'), ('LIMIT', '2'), ('STOP', '3'), ('STOP_LIMIT', '4'), ('MARKET_ON_CLOSE', '5'), ('WITH_OR_WITHOUT', '6'), ('LIMIT_OR_BETTER', '7'), ('LIMIT_WITH_OR_WITHOUT', '8'), ('ON_BASIS', '9'), ('ON_CLOSE', 'A'), ('MARKET', '1'), ('FOREX_C', 'C'), ('FOREX_F', 'F'), ('PREVIOUSLY_INDICATED', 'E'), ('FOREX_G', 'G'), ('FUNARI', 'I'), ('MARKET_IF_TOUCHED', 'J'), ('MARKET_WITH_LEFTOVER_AS_LIMIT', 'K'), ('PREVIOUS_FUND_VALUATION_POINT', 'L'), ('NEXT_FUND_VALUATION_POINT', 'M'), ('PEGGED', 'P'), ('LIMIT_ON_CLOSE', 'B'), ('FOREX_H', 'H'),)),
+    (41, 'OrigClOrdID', 'STRING', ()),
+    (42, 'OrigTime', 'UTCTIMESTAMP', ()),
+    (43, 'PossDupFlag', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (44, 'Price', 'PRICE', ()),
+    (45, 'RefSeqNum', 'SEQNUM', ()),
+    (46, 'RelatdSym', 'STRING', ()),
+    (47, 'Rule80A', 'CHAR', (('PROGRAM_ORDER_NON_INDEX_ARB_FOR_OTHER_MEMBER', 'N'), ('SHORT_EXEMPT_TRANSACTION_B', 'B'), ('PROGRAM_ORDER_INDEX_ARB_FOR_MEMBER_FIRM_ORG', 'D'), ('SHORT_EXEMPT_TRANSACTION_FOR_PRINCIPAL', 'E'), ('SHORT_EXEMPT_TRANSACTION_F', 'F'), ('SHORT_EXEMPT_TRANSACTION_H', 'H'), ('INDIVIDUAL_INVESTOR_SINGLE_ORDER', 'I'), ('PROGRAM_ORDER_INDEX_ARB_FOR_INDIVIDUAL_CUSTOMER', 'J'), ('PROGRAM_ORDER_NON_INDEX_ARB_FOR_INDIVIDUAL_CUSTOMER', 'K'), ('PROGRAM_ORDER_INDEX_ARB_FOR_OTHER_MEMBER', 'M'), ('AGENCY_SINGLE_ORDER', 'A'), ('PROPRIETARY_TRANSACTIONS_FOR_COMPETING_MARKET_MAKER_THAT_IS_AFFILIATED_WITH_THE_CLEARING_MEMBER', 'O'), ('PRINCIPAL', 'P'), ('TRANSACTIONS_FOR_THE_ACCOUNT_OF_A_NON_MEMBER_COMPETING_MARKET_MAKER', 'R'), ('SPECIALIST_TRADES', 'S'), ('TRANSACTIONS_FOR_THE_ACCOUNT_OF_AN_UNAFFILIATED_MEMBERS_COMPETING_MARKET_MAKER', 'T'), ('PROGRAM_ORDER_INDEX_ARB_FOR_OTHER_AGENCY', 'U'), ('ALL_OTHER_ORDERS_AS_AGENT_FOR_OTHER_MEMBER', 'W'), ('SHORT_EXEMPT_TRANSACTION_FOR_MEMBER_COMPETING_MARKET_MAKER_NOT_AFFILIATED_WITH_THE_FIRM_CLEARING_THE_TRADE', 'X'), ('PROGRAM_ORDER_NON_INDEX_ARB_FOR_OTHER_AGENCY', 'Y'), ('SHORT_EXEMPT_TRANSACTION_FOR_NON_MEMBER_COMPETING_MARKET_MAKER', 'Z'), ('SHORT_EXEMPT_TRANSACTION_FOR_MEMBER_COMPETING_MARKET_MAKER_AFFILIATED_WITH_THE_FIRM_CLEARING_THE_TRADE', 'L'), ('PROGRAM_ORDER_NON_INDEX_ARB_FOR_MEMBER_FIRM_ORG', 'C'),)),
+    (48, 'SecurityID', 'STRING', ()),
+    (49, 'SenderCompID', 'STRING', ()),
+    (50, 'SenderSubID', 'STRING', ()),
+    (51, 'SendingDate', 'LOCALMKTDATE', ()),
+    (52, 'SendingTime', 'UTCTIMESTAMP', ()),
+    (53, 'Quantity', 'QTY', ()),
+    (54, 'Side', 'CHAR', (('SELL_SHORT_EXEMPT', '6'), ('AS_DEFINED', 'B'), ('OPPOSITE', 'C'), ('CROSS', '8'), ('CROSS_SHORT', '9'), ('BUY', '1'), ('SELL', '2'), ('BUY_MINUS', '3'), ('SELL_PLUS', '4'), ('CROSS_SHORT_EXEMPT', 'A'), ('SELL_SHORT', '5'), ('UNDISCLOSED', '7'),)),
+    (55, 'Symbol', 'STRING', ()),
+    (56, 'TargetCompID', 'STRING', ()),
+    (57, 'TargetSubID', 'STRING', ()),
+    (58, 'Text', 'STRING', ()),
+    (59, 'TimeInForce', 'CHAR', (('AT_THE_CLOSE', '7'), ('DAY', '0'), ('GOOD_TILL_CANCEL', '1'), ('AT_THE_OPENING', '2'), ('IMMEDIATE_OR_CANCEL', '3'), ('FILL_OR_KILL', '4'), ('GOOD_TILL_CROSSING', '5'), ('GOOD_TILL_DATE', '6'),)),
+    (60, 'TransactTime', 'UTCTIMESTAMP', ()),
+    (61, 'Urgency', 'CHAR', (('FLASH', '1'), ('BACKGROUND', '2'), ('NORMAL', '0'),)),
+    (62, 'ValidUntilTime', 'UTCTIMESTAMP', ()),
+    (63, 'SettlmntTyp', 'CHAR', (('T_PLUS_4', '5'), ('T_PLUS_1', 'A'), ('FUTURE', '6'), ('T_PLUS_2', '3'), ('NEXT_DAY', '2'), ('SELLERS_OPTION', '8'), ('CASH', '1'), ('WHEN_AND_IF_ISSUED', '7'), ('REGULAR', '0'), ('T_PLUS_5', '9'), ('T_PLUS_3', '4'),)),
+    (64, 'FutSettDate', 'LOCALMKTDATE', ()),
+    (65, 'SymbolSfx', 'STRING', ()),
+    (66, 'ListID', 'STRING', ()),
+    (67, 'ListSeqNo', 'INT', ()),
+    (68, 'TotNoOrders', 'INT', ()),
+    (69, 'ListExecInst', 'STRING', ()),
+    (70, 'AllocID', 'STRING', ()),
+    (71, 'AllocTransType', 'CHAR', (('CALCULATED_WITHOUT_PRELIMINARY', '5'), ('CALCULATED', '4'), ('PRELIMINARY', '3'), ('CANCEL', '2'), ('REPLACE', '1'), ('NEW', '0'),)),
+    (72, 'RefAllocID', 'STRING', ()),
+    (73, 'NoOrders', 'NUMINGROUP', ()),
+    (74, 'AvgPrxPrecision', 'INT', ()),
+    (75, 'TradeDate', 'LOCALMKTDATE', ()),
+    (76, 'ExecBroker', 'STRING', ()),
+    (77, 'PositionEffect', 'CHAR', (('FIFO', 'F'), ('ROLLED', 'R'), ('CLOSE', 'C'), ('OPEN', 'O'),)),
+    (78, 'NoAllocs', 'NUMINGROUP', ()),
+    (79, 'AllocAccount', 'STRING', ()),
+    (80, 'AllocQty', 'QTY', ()),
+    (81, 'ProcessCode', 'CHAR', (('PLAN_SPONSOR', '6'), ('REGULAR', '0'), ('SOFT_DOLLAR', '1'), ('STEP_IN', '2'), ('STEP_OUT', '3'), ('SOFT_DOLLAR_STEP_IN', '4'), ('SOFT_DOLLAR_STEP_OUT', '5'),)),
+    (82, 'NoRpts', 'NUMINGROUP', ()),
+    (83, 'RptSeq', 'INT', ()),
+    (84, 'CxlQty', 'QTY', ()),
+    (85, 'NoDlvyInst', 'INT', ()),
+    (86, 'DlvyInst', 'STRING', ()),
+    (87, 'AllocStatus', 'INT', (('REJECTED', 1), ('PARTIAL_ACCEPT', 2), ('RECEIVED', 3), ('ACCEPTED', 0),)),
+    (88, 'AllocRejCode', 'INT', (('UNKNOWN_ACCOUNT', 0), ('UNKNOWN_LISTID', 6), ('UNKNOWN_EXECUTING_BROKER_MNEMONIC', 3), ('UNKNOWN_ORDERID', 5), ('OTHER', 7), ('COMMISSION_DIFFERENCE', 4), ('INCORRECT_QUANTITY', 1), ('INCORRECT_AVERAGE_PRICE', 2),)),
+    (89, 'Signature', 'DATA', ()),
+    (90, 'SecureDataLen', 'LENGTH', ()),
+    (91, 'SecureData', 'DATA', ()),
+    (92, 'BrokerOfCredit', 'STRING', ()),
+    (93, 'SignatureLength', 'LENGTH', ()),
+    (94, 'EmailType', 'CHAR', (('NEW', '0'), ('REPLY', '1'), ('ADMIN_REPLY', '2'),)),
+    (95, 'RawDataLength', 'LENGTH', ()),
+    (96, 'RawData', 'DATA', ()),
+    (97, 'PossResend', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (98, 'EncryptMethod', 'INT', (('DES', 2), ('PEM_DES_MD5', 6), ('PGP_DES_MD5', 5), ('PKCS_DES', 3), ('NONE', 0), ('PKCS', 1), ('PGP_DES', 4),)),
+    (99, 'StopPx', 'PRICE', ()),
+    (100, 'ExDestination', 'EXCHANGE', ()),
+    (102, 'CxlRejReason', 'INT', (('UNKNOWN_ORDER', 1), ('TOO_LATE_TO_CANCEL', 0), ('DUPLICATE_CLORDID_RECEIVED', 6), ('ORIGORDMODTIME_DID_NOT_MATCH_LAST_TRANSACTTIME_OF_ORDER', 5), ('UNABLE_TO_PROCESS_ORDER_MASS_CANCEL_REQUEST', 4), ('ORDER_ALREADY_IN_PENDING_CANCEL_OR_PENDING_REPLACE_STATUS', 3), ('BROKER', 2),)),
+    (103, 'OrdRejReason', 'INT', (('EXCHANGE_CLOSED', 2), ('UNKNOWN_SYMBOL', 1), ('ORDER_EXCEEDS_LIMIT', 3), ('TOO_LATE_TO_ENTER', 4), ('UNKNOWN_ORDER', 5), ('DUPLICATE_OF_A_VERBALLY_COMMUNICATED_ORDER', 7), ('TRADE_ALONG_REQUIRED', 9), ('INVALID_INVESTOR_ID', 10), ('DUPLICATE_ORDER', 6), ('UNSUPPORTED_ORDER_CHARACTERISTIC', 11), ('SURVEILLENCE_OPTION', 12), ('BROKER', 0), ('STALE_ORDER', 8),)),
+    (104, 'IOIQualifier', 'CHAR', (('AT_THE_OPEN', 'O'), ('CROSSING_OPPORTUNITY', 'X'), ('INDICATION', 'W'), ('VERSUS', 'V'), ('THROUGH_THE_DAY', 'T'), ('PORTFOLIO_SHOWN', 'S'), ('READY_TO_TRADE', 'R'), ('ALL_OR_NONE', 'A'), ('TAKING_A_POSITION', 'P'), ('MORE_BEHIND', 'M'), ('LIMIT', 'L'), ('IN_TOUCH_WITH', 'I'), ('VWAP', 'D'), ('AT_THE_CLOSE', 'C'), ('MARKET_ON_CLOSE', 'B'), ('AT_THE_MARKET', 'Q'), ('AT_THE_MIDPOINT', 'Y'), ('PRE_OPEN', 'Z'),)),
+    (105, 'WaveNo', 'STRING', ()),
+    (106, 'Issuer', 'STRING', ()),
+    (107, 'SecurityDesc', 'STRING', ()),
+    (108, 'HeartBtInt', 'INT', ()),
+    (109, 'ClientID', 'STRING', ()),
+    (110, 'MinQty', 'QTY', ()),
+    (111, 'MaxFloor', 'QTY', ()),
+    (112, 'TestReqID', 'STRING', ()),
+    (113, 'ReportToExch', 'BOOLEAN', (('YES', 'Y'), ('NO', 'N'),)),
+    (114, 'LocateReqd', 'BOOLEAN', (('YES', 'Y'), ('NO', 'N'),)),
+    (115, 'OnBehalfOfCompID', 'STRING', ()),
+    (116, 'OnBehalfOfSubID', 'STRING', ()),
+    (117, 'QuoteID', 'STRING', ()),
+    (118, 'NetMoney', 'AMT', ()),
+    (119, 'SettlCurrAmt', 'AMT', ()),
+    (120, 'SettlCurrency', 'CURRENCY', ()),
+    (121, 'ForexReq', 'BOOLEAN', (('YES', 'Y'), ('NO', 'N'),)),
+    (122, 'OrigSendingTime', 'UTCTIMESTAMP', ()),
+    (123, 'GapFillFlag', 'BOOLEAN', (('YES', 'Y'), ('NO', 'N'),)),
+    (124, 'NoExecs', 'NUMINGROUP', ()),
+    (125, 'CxlType', 'CHAR', ()),
+    (126, 'ExpireTime', 'UTCTIMESTAMP', ()),
+    (127, 'DKReason', 'CHAR', (('WRONG_SIDE', 'B'), ('QUANTITY_EXCEEDS_ORDER', 'C'), ('NO_MATCHING_ORDER', 'D'), ('PRICE_EXCEEDS_LIMIT', 'E'), ('OTHER', 'Z'), ('UNKNOWN_SYMBOL', 'A'),)),
+    (128, 'DeliverToCompID', 'STRING', ()),
+    (129, 'DeliverToSubID', 'STRING', ()),
+    (130, 'IOINaturalFlag', 'BOOLEAN', (('YES', 'Y'), ('NO', 'N'),)),
+    (131, 'QuoteReqID', 'STRING', ()),
+    (132, 'BidPx', 'PRICE', ()),
+    (133, 'OfferPx', 'PRICE', ()),
+    (134, 'BidSize', 'QTY', ()),
+    (135, 'OfferSize', 'QTY', ()),
+    (136, 'NoMiscFees', 'NUMINGROUP', ()),
+    (137, 'MiscFeeAmt', 'AMT', ()),
+    (138, 'MiscFeeCurr', 'CURRENCY', ()),
+    (139, 'MiscFeeType', 'CHAR', (('LOCAL_COMMISSION', '3'), ('EXCHANGE_FEES', '4'), ('STAMP', '5'), ('LEVY', '6'), ('OTHER', '7'), ('MARKUP', '8'), ('CONSUMPTION_TAX', '9'), ('REGULATORY', '1'), ('TAX', '2'),)),
+    (140, 'PrevClosePx', 'PRICE', ()),
+    (141, 'ResetSeqNumFlag', 'BOOLEAN', (('YES', 'Y'), ('NO', 'N'),)),
+    (142, 'SenderLocationID', 'STRING', ()),
+    (143, 'TargetLocationID', 'STRING', ()),
+    (144, 'OnBehalfOfLocationID', 'STRING', ()),
+    (145, 'DeliverToLocationID', 'STRING', ()),
+    (146, 'NoRelatedSym', 'NUMINGROUP', ()),
+    (147, 'Subject', 'STRING', ()),
+    (148, 'Headline', 'STRING', ()),
+    (149, 'URLLink', 'STRING', ()),
+    (150, 'ExecType', 'CHAR', (('PENDING_CANCEL', '6'), ('NEW', '0'), ('PARTIAL_FILL', '1'), ('FILL', '2'), ('CANCELED', '4'), ('REPLACE', '5'), ('REJECTED', '8'), ('SUSPENDED', '9'), ('PENDING_NEW', 'A'), ('CALCULATED', 'B'), ('EXPIRED', 'C'), ('RESTATED', 'D'), ('PENDING_REPLACE', 'E'), ('TRADE', 'F'), ('TRADE_CORRECT', 'G'), ('TRADE_CANCEL', 'H'), ('ORDER_STATUS', 'I'), ('DONE_FOR_DAY', '3'), ('STOPPED', '7'),)),
+    (151, 'LeavesQty', 'QTY', ()),
+    (152, 'CashOrderQty', 'QTY', ()),
+    (153, 'AllocAvgPx', 'PRICE', ()),
+    (154, 'AllocNetMoney', 'AMT', ()),
+    (155, 'SettlCurrFxRate', 'FLOAT', ()),
+    (156, 'SettlCurrFxRateCalc', 'CHAR', (('DIVIDE', 'D'), ('MULTIPLY', 'M'),)),
+    (157, 'NumDaysInterest', 'INT', ()),
+    (158, 'AccruedInterestRate', 'PERCENTAGE', ()),
+    (159, 'AccruedInterestAmt', 'AMT', ()),
+    (160, 'SettlInstMode', 'CHAR', (('DEFAULT', '0'), ('SPECIFIC_ORDER_FOR_A_SINGLE_ACCOUNT', '4'), ('SPECIFIC_ALLOCATION_ACCOUNT_STANDING', '3'), ('STANDING_INSTRUCTIONS_PROVIDED', '1'), ('SPECIFIC_ALLOCATION_ACCOUNT_OVERRIDING', '2'),)),
+    (161, 'AllocText', 'STRING', ()),
+    (162, 'SettlInstID', 'STRING', ()),
+    (163, 'SettlInstTransType', 'CHAR', (('NEW', 'N'), ('REPLACE', 'R'), ('CANCEL', 'C'),)),
+    (164, 'EmailThreadID', 'STRING', ()),
+    (165, 'SettlInstSource', 'CHAR', (('INSTITUTIONS_INSTRUCTIONS', '2'), ('INVESTOR', '3'), ('BROKERS_INSTRUCTIONS', '1'),)),
+    (166, 'SettlLocation', 'STRING', (('FEDERAL_BOOK_ENTRY', 'FED'), ('LOCAL_MARKET_SETTLE_LOCATION', 'ISO Country Code'), ('PHYSICAL', 'PNY'), ('EUROCLEAR', 'EUR'), ('DEPOSITORY_TRUST_COMPANY', 'DTC'), ('CEDEL', 'CED'), ('PARTICIPANT_TRUST_COMPANY', 'PTC'),)),
+    (167, 'SecurityType', 'STRING', (('COMMERCIAL_PAPER', 'CP'), ('VARIABLE_RATE_DEMAND_NOTE', 'VRDN'), ('PLAZOS_FIJOS', 'PZFJ'), ('PROMISSORY_NOTE', 'PN'), ('OVERNIGHT', 'ONITE'), ('MEDIUM_TERM_NOTES', 'MTN'), ('TAX_EXEMPT_COMMERCIAL_PAPER', 'TECP'), ('AMENDED_RESTATED', 'AMENDED'), ('BRIDGE_LOAN', 'BRIDGE'), ('LETTER_OF_CREDIT', 'LOFC'), ('SWING_LINE_FACILITY', 'SWING'), ('DEBTOR_IN_POSSESSION', 'DINP'), ('DEFAULTED', 'DEFLTED'), ('WITHDRAWN', 'WITHDRN'), ('LIQUIDITY_NOTE', 'LQN'), ('MATURED', 'MATURED'), ('DEPOSIT_NOTES', 'DN'), ('RETIRED', 'RETIRED'), ('BANKERS_ACCEPTANCE', 'BA'), ('BANK_NOTES', 'BN'), ('BILL_OF_EXCHANGES', 'BOX'), ('CERTIFICATE_OF_DEPOSIT', 'CD'), ('CALL_LOANS', 'CL'), ('REPLACED', 'REPLACD'), ('MANDATORY_TENDER', 'MT'), ('REVOLVER_TERM_LOAN', 'RVLVTRM'), ('MORTGAGE_PRIVATE_PLACEMENT', 'MPP'), ('SHORT_TERM_LOAN_NOTE', 'STN'), ('MISCELLANEOUS_PASS_THROUGH', 'MPT'), ('TO_BE_ANNOUNCED', 'TBA'), ('OTHER_ANTICIPATION_NOTES_BAN_GAN_ETC', 'AN'), ('MORTGAGE_INTEREST_ONLY', 'MIO'), ('CERTIFICATE_OF_PARTICIPATION', 'COFP'), ('MORTGAGE_BACKED_SECURITIES', 'MBS'), ('REVENUE_BONDS', 'REV'), ('SPECIAL_ASSESSMENT', 'SPCLA'), ('SPECIAL_OBLIGATION', 'SPCLO'), ('SPECIAL_TAX', 'SPCLT'), ('TAX_ANTICIPATION_NOTE', 'TAN'), ('TAX_ALLOCATION', 'TAXA'), ('CERTIFICATE_OF_OBLIGATION', 'COFO'), ('TIME_DEPOSIT', 'TD'), ('GENERAL_OBLIGATION_BONDS', 'GO'), ('WILDCARD_ENTRY', '?'), ('WARRANT', 'WAR'), ('MUTUAL_FUND', 'MF'), ('MULTI_LEG_INSTRUMENT', 'MLEG'), ('TAX_REVENUE_ANTICIPATION_NOTE', 'TRAN'), ('MORTGAGE_PRINCIPAL_ONLY', 'MPO'), ('REPURCHASE_AGREEMENT', 'RP'), ('NO_SECURITY_TYPE', 'NONE'), ('EXTENDED_COMM_NOTE', 'XCN'), ('AGENCY_POOLS', 'POOL'), ('ASSET_BACKED_SECURITIES', 'ABS'), ('CORP_MORTGAGE_BACKED_SECURITIES', 'CMBS'), ('COLLATERALIZED_MORTGAGE_OBLIGATION', 'CMO'), ('IOETTE_MORTGAGE', 'IET'), ('REVERSE_REPURCHASE_AGREEMENT', 'RVRP'), ('FOREIGN_EXCHANGE_CONTRACT', 'FOR'), ('REVENUE_ANTICIPATION_NOTE', 'RAN'), ('REVOLVER_LOAN', 'RVLV'), ('FEDERAL_AGENCY_COUPON', 'FAC'), ('FEDERAL_AGENCY_DISCOUNT_NOTE', 'FADN'), ('PRIVATE_EXPORT_FUNDING', 'PEF'), ('CORPORATE_BOND', 'CORP'), ('CORPORATE_PRIVATE_PLACEMENT', 'CPP'), ('CONVERTIBLE_BOND', 'CB'), ('DUAL_CURRENCY', 'DUAL'), ('INDEXED_LINKED', 'XLINKD'), ('YANKEE_CORPORATE_BOND', 'YANK'), ('COMMON_STOCK', 'CS'), ('PREFERRED_STOCK', 'PS'), ('BRADY_BOND', 'BRADY'), ('US_TREASURY_BOND', 'TBOND'), ('INTEREST_STRIP_FROM_ANY_BOND_OR_NOTE', 'TINT'), ('TREASURY_INFLATION_PROTECTED_SECURITIES', 'TIPS'), ('PRINCIPAL_STRIP_OF_A_CALLABLE_BOND_OR_NOTE', 'TCAL'), ('PRINCIPAL_STRIP_FROM_A_NON_CALLABLE_BOND_OR_NOTE', 'TPRN'), ('US_TREASURY_NOTE_BOND', 'UST'), ('US_TREASURY_BILL', 'USTB'), ('TERM_LOAN', 'TERM'), ('STRUCTURED_NOTES', 'STRUCT'),)),
+    (168, 'EffectiveTime', 'UTCTIMESTAMP', ()),
+    (169, 'StandInstDbType', 'INT', (('OTHER', 0), ('DTC_SID', 1), ('A_GLOBAL_CUSTODIAN', 3), ('THOMSON_ALERT', 2),)),
+    (170, 'StandInstDbName', 'STRING', ()),
+    (171, 'StandInstDbID', 'STRING', ()),
+    (172, 'SettlDeliveryType', 'INT', (('FREE', 1), ('VERSUS_PAYMENT', 0),)),
+    (173, 'SettlDepositoryCode', 'STRING', ()),
+    (174, 'SettlBrkrCode', 'STRING', ()),
+    (175, 'SettlInstCode', 'STRING', ()),
+    (176, 'SecuritySettlAgentName', 'STRING', ()),
+    (177, 'SecuritySettlAgentCode', 'STRING', ()),
+    (178, 'SecuritySettlAgentAcctNum', 'STRING', ()),
+    (179, 'SecuritySettlAgentAcctName', 'STRING', ()),
+    (180, 'SecuritySettlAgentContactName', 'STRING', ()),
+    (181, 'SecuritySettlAgentContactPhone', 'STRING', ()),
+    (182, 'CashSettlAgentName', 'STRING', ()),
+    (183, 'CashSettlAgentCode', 'STRING', ()),
+    (184, 'CashSettlAgentAcctNum', 'STRING', ()),
+    (185, 'CashSettlAgentAcctName', 'STRING', ()),
+    (186, 'CashSettlAgentContactName', 'STRING', ()),
+    (187, 'CashSettlAgentContactPhone', 'STRING', ()),
+    (188, 'BidSpotRate', 'PRICE', ()),
+    (189, 'BidForwardPoints', 'PRICEOFFSET', ()),
+    (190, 'OfferSpotRate', 'PRICE', ()),
+    (191, 'OfferForwardPoints', 'PRICEOFFSET', ()),
+    (192, 'OrderQty2', 'QTY', ()),
+    (193, 'FutSettDate2', 'LOCALMKTDATE', ()),
+    (194, 'LastSpotRate', 'PRICE', ()),
+    (195, 'LastForwardPoints', 'PRICEOFFSET', ()),
+    (196, 'AllocLinkID', 'STRING', ()),
+    (197, 'AllocLinkType', 'INT', (('F_X_NETTING', 0), ('F_X_SWAP', 1),)),
+    (198, 'SecondaryOrderID', 'STRING', ()),
+    (199, 'NoIOIQualifiers', 'NUMINGROUP', ()),
+    (200, 'MaturityMonthYear', 'MONTHYEAR', ()),
+    (201, 'PutOrCall', 'INT', (('PUT', 0), ('CALL', 1),)),
+    (202, 'StrikePrice', 'PRICE', ()),
+    (203, 'CoveredOrUncovered', 'INT', (('UNCOVERED', 1), ('COVERED', 0),)),
+    (204, 'CustomerOrFirm', 'INT', (('CUSTOMER', 0), ('FIRM', 1),)),
+    (205, 'MaturityDay', 'DAYOFMONTH', ()),
+    (206, 'OptAttribute', 'CHAR', ()),
+    (207, 'SecurityExchange', 'EXCHANGE', ()),
+    (208, 'NotifyBrokerOfCredit', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (209, 'AllocHandlInst', 'INT', (('FORWARD_AND_MATCH', 3), ('FORWARD', 2), ('MATCH', 1),)),
+    (210, 'MaxShow', 'QTY', ()),
+    (211, 'PegDifference', 'PRICEOFFSET', ()),
+    (212, 'XmlDataLen', 'LENGTH', ()),
+    (213, 'XmlData', 'DATA', ()),
+    (214, 'SettlInstRefID', 'STRING', ()),
+    (215, 'NoRoutingIDs', 'NUMINGROUP', ()),
+    (216, 'RoutingType', 'INT', (('TARGET_FIRM', 1), ('TARGET_LIST', 2), ('BLOCK_FIRM', 3), ('BLOCK_LIST', 4),)),
+    (217, 'RoutingID', 'STRING', ()),
+    (218, 'Spread', 'PRICEOFFSET', ()),
+    (219, 'Benchmark', 'CHAR', (('OLD_10', '5'), ('CURVE', '1'), ('_5_YR', '2'), ('_10_YR', '4'), ('_30_YR', '6'), ('OLD_30', '7'), ('_3_MO_LIBOR', '8'), ('_6_MO_LIBOR', '9'), ('OLD_5', '3'),)),
+    (220, 'BenchmarkCurveCurrency', 'CURRENCY', ()),
+    (221, 'BenchmarkCurveName', 'STRING', (('SWAP', 'SWAP'), ('LIBID', 'LIBID'), ('OTHER', 'OTHER'), ('TREASURY', 'Treasury'), ('EURIBOR', 'Euribor'), ('PFANDBRIEFE', 'Pfandbriefe'), ('FUTURESWAP', 'FutureSWAP'), ('MUNIAAA', 'MuniAAA'), ('LIBOR', 'LIBOR'),)),
+    (222, 'BenchmarkCurvePoint', 'STRING', ()),
+    (223, 'CouponRate', 'PERCENTAGE', ()),
+    (224, 'CouponPaymentDate', 'UTCDATE', ()),
+    (225, 'IssueDate', 'UTCDATE', ()),
+    (226, 'RepurchaseTerm', 'INT', ()),
+    (227, 'RepurchaseRate', 'PERCENTAGE', ()),
+    (228, 'Factor', 'FLOAT', ()),
+    (229, 'TradeOriginationDate', 'UTCDATE', ()),
+    (230, 'ExDate', 'UTCDATE', ()),
+    (231, 'ContractMultiplier', 'FLOAT', ()),
+    (232, 'NoStipulations', 'NUMINGROUP', ()),
+    (233, 'StipulationType', 'STRING', (('ABSOLUTE_PREPAYMENT_SPEED', 'ABS'), ('WEIGHTED_AVERAGE_LOAN_AGE', 'WALA'), ('WEIGHTED_AVERAGE_MATURITY', 'WAM'), ('CONSTANT_PREPAYMENT_RATE', 'CPR'), ('FINAL_CPR_OF_HOME_EQUITY_PREPAYMENT_CURVE', 'HEP'), ('WEIGHTED_AVERAGE_LIFE', 'WAL'), ('OF_MANUFACTURED_HOUSING_PREPAYMENT_CURVE', 'MHP'), ('SINGLE_MONTHLY_MORTALITY', 'SMM'), ('MONTHLY_PREPAYMENT_RATE', 'MPR'), ('OF_BMA_PREPAYMENT_CURVE', 'PSA'), ('OF_PROSPECTUS_PREPAYMENT_CURVE', 'PPC'), ('CONSTANT_PREPAYMENT_PENALTY', 'CPP'), ('LOT_VARIANCE', 'LOTVAR'), ('CONSTANT_PREPAYMENT_YIELD', 'CPY'), ('WEIGHTED_AVERAGE_COUPON', 'WAC'), ('YEAR_OF_ISSUE', 'ISSUE'), ('MATURITY_YEAR', 'MAT'), ('NUMBER_OF_PIECES', 'PIECES'), ('POOLS_MAXIMUM', 'PMAX'), ('POOLS_PER_MILLION', 'PPM'), ('POOLS_PER_LOT', 'PPL'), ('POOLS_PER_TRADE', 'PPT'), ('PRODUCTION_YEAR', 'PROD'), ('TRADE_VARIANCE', 'TRDVAR'), ('GEOGRAPHICS', 'GEOG'),)),
+    (234, 'StipulationValue', 'STRING', ()),
+    (235, 'YieldType', 'STRING', (('TRUE_YIELD_THE_YIELD_CALCULATED_WITH_COUPON_DATES_MOVED_FROM_A_WEEKEND_OR_HOLIDAY_TO_THE_NEXT_VALID_SETTLEMENT_DATE', 'TRUE'), ('PREVIOUS_CLOSE_YIELD_THE_YIELD_OF_A_BOND_BASED_ON_THE_CLOSING_PRICE_1_DAY_AGO', 'PREVCLOSE'), ('YIELD_TO_LONGEST_AVERAGE', 'LONGEST'), ('YIELD_TO_LONGEST_AVERAGE_LIFE_THE_YIELD_ASSUMING_ONLY_MANDATORY_SINKS_ARE_TAKEN_THIS_RESULTS_IN_A_LOWER_PAYDOWN_OF_DEBT_THE_YIELD_IS_THEN_CALCULATED_TO_THE_FINAL_PAYMENT_DATE', 'LONGAVGLIFE'), ('YIELD_TO_MATURITY_THE_YIELD_OF_A_BOND_TO_ITS_MATURITY_DATE', 'MATURITY'), ('MARK_TO_MARKET_YIELD_AN_ADJUSTMENT_IN_THE_VALUATION_OF_A_SECURITIES_PORTFOLIO_TO_REFLECT_THE_CURRENT_MARKET_VALUES_OF_THE_RESPECTIVE_SECURITIES_IN_THE_PORTFOLIO', 'MARK'), ('OPEN_AVERAGE_YIELD_THE_AVERAGE_YIELD_OF_THE_RESPECTIVE_SECURITIES_IN_THE_PORTFOLIO', 'OPENAVG'), ('YIELD_TO_NEXT_PUT_THE_YIELD_TO_THE_DATE_AT_WHICH_THE_BOND_HOLDER_CAN_NEXT_PUT_THE_BOND_TO_THE_ISSUER', 'PUT'), ('PROCEEDS_YIELD_THE_CD_EQUIVALENT_YIELD_WHEN_THE_REMAINING_TIME_TO_MATURITY_IS_LESS_THAN_TWO_YEARS', 'PROCEEDS'), ('SEMI_ANNUAL_YIELD_THE_YIELD_OF_A_BOND_WHOSE_COUPON_PAYMENTS_ARE_REINVESTED_SEMI_ANNUALLY', 'SEMIANNUAL'), ('YIELD_TO_SHORTEST_AVERAGE_LIFE_SAME_AS_AVGLIFE_ABOVE', 'SHORTAVGLIFE'), ('YIELD_TO_SHORTEST_AVERAGE', 'SHORTEST'), ('SIMPLE_YIELD_THE_YIELD_OF_A_BOND_ASSUMING_NO_REINVESTMENT_OF_COUPON_PAYMENTS', 'SIMPLE'), ('YIELD_TO_TENDER_DATE_THE_YIELD_ON_A_MUNICIPAL_BOND_TO_ITS_MANDATORY_TENDER_DATE', 'TENDER'), ('YIELD_VALUE_OF_1_32_THE_AMOUNT_THAT_THE_YIELD_WILL_CHANGE_FOR_A_1_32ND_CHANGE_IN_PRICE', 'VALUE1/32'), ('YIELD_TO_WORST_CONVENTION_THE_LOWEST_YIELD_TO_ALL_POSSIBLE_REDEMPTION_DATE_SCENARIOS', 'WORST'), ('TAX_EQUIVALENT_YIELD_THE_AFTER_TAX_YIELD_GROSSED_UP_BY_THE_MAXIMUM_FEDERAL_TAX_RATE_OF_396_FOR_COMPARISON_TO_TAXABLE_YIELDS', 'TAXEQUIV'), ('ANNUAL_YIELD_THE_ANNUAL_INTEREST_OR_DIVIDEND_INCOME_AN_INVESTMENT_EARNS_EXPRESSED_AS_A_PERCENTAGE_OF_THE_INVESTMENTS_TOTAL_VALUE', 'ANNUAL'), ('CLOSING_YIELD_MOST_RECENT_YEAR_THE_YIELD_OF_A_BOND_BASED_ON_THE_CLOSING_PRICE_AS_OF_THE_MOST_RECENT_YEARS_END', 'LASTYEAR'), ('YIELD_TO_NEXT_REFUND', 'NEXTREFUND'), ('AFTER_TAX_YIELD', 'AFTERTAX'), ('YIELD_AT_ISSUE', 'ATISSUE'), ('YIELD_TO_AVERAGE_LIFE_THE_YIELD_ASSUMING_THAT_ALL_SINKS', 'AVGLIFE'), ('YIELD_TO_AVERAGE_MATURITY', 'AVGMATURITY'), ('BOOK_YIELD_THE_YIELD_OF_A_SECURITY_CALCULATED_BY_USING_ITS_BOOK_VALUE_INSTEAD_OF_THE_CURRENT_MARKET_PRICE_THIS_TERM_IS_TYPICALLY_USED_IN_THE_US_DOMESTIC_MARKET', 'BOOK'), ('YIELD_TO_NEXT_CALL_THE_YIELD_OF_A_BOND_TO_THE_NEXT_POSSIBLE_CALL_DATE', 'CALL'), ('YIELD_CHANGE_SINCE_CLOSE_THE_CHANGE_IN_THE_YIELD_SINCE_THE_PREVIOUS_DAYS_CLOSING_YIELD', 'CHANGE'), ('COMPOUND_YIELD_THE_YIELD_OF_CERTAIN_JAPANESE_BONDS_BASED_ON_ITS_PRICE_CERTAIN_JAPANESE_BONDS_HAVE_IRREGULAR_FIRST_OR_LAST_COUPONS_AND_THE_YIELD_IS_CALCULATED_COMPOUND_FOR_THESE_IRREGULAR_PERIODS', 'COMPOUND'), ('CURRENT_YIELD_ANNUAL_INTEREST_ON_A_BOND_DIVIDED_BY_THE_MARKET_VALUE_THE_ACTUAL_INCOME_RATE_OF_RETURN_AS_OPPOSED_TO_THE_COUPON_RATE_EXPRESSED_AS_A_PERCENTAGE', 'CURRENT'), ('TRUE_GROSS_YIELD_YIELD_CALCULATED_USING_THE_PRICE_INCLUDING_ACCRUED_INTEREST_WHERE_COUPON_DATES_ARE_MOVED_FROM_HOLIDAYS_AND_WEEKENDS_TO_THE_NEXT_TRADING_DAY', 'GROSS'), ('GOVERNMENT_EQUIVALENT_YIELD_ASK_YIELD_BASED_ON_SEMI_ANNUAL_COUPONS_COMPOUNDING_IN_ALL_PERIODS_AND_ACTUAL_ACTUAL_CALENDAR', 'GOVTEQUIV'), ('YIELD_WITH_INFLATION_ASSUMPTION_BASED_ON_PRICE_THE_RETURN_AN_INVESTOR_WOULD_REQUIRE_ON_A_NORMAL_BOND_THAT_WOULD_MAKE_THE_REAL_RETURN_EQUAL_TO_THAT_OF_THE_INFLATION_INDEXED_BOND_ASSUMING_A_CONSTANT_INFLATION_RATE', 'INFLATION'), ('INVERSE_FLOATER_BOND_YIELD_INVERSE_FLOATER_SEMI_ANNUAL_BOND_EQUIVALENT_RATE', 'INVERSEFLOATER'), ('CLOSING_YIELD_MOST_RECENT_QUARTER_THE_YIELD_OF_A_BOND_BASED_ON_THE_CLOSING_PRICE_AS_OF_THE_MOST_RECENT_QUARTERS_END', 'LASTQUARTER'), ('MOST_RECENT_CLOSING_YIELD_THE_LAST_AVAILABLE_YIELD_STORED_IN_HISTORY_COMPUTED_USING_PRICE', 'LASTCLOSE'), ('CLOSING_YIELD_MOST_RECENT_MONTH_THE_YIELD_OF_A_BOND_BASED_ON_THE_CLOSING_PRICE_AS_OF_THE_MOST_RECENT_MONTHS_END', 'LASTMONTH'), ('CLOSING_YIELD_THE_YIELD_OF_A_BOND_BASED_ON_THE_CLOSING_PRICE', 'CLOSE'),)),
+    (236, 'Yield', 'PERCENTAGE', ()),
+    (237, 'TotalTakedown', 'AMT', ()),
+    (238, 'Concession', 'AMT', ()),
+    (239, 'RepoCollateralSecurityType', 'INT', ()),
+    (240, 'RedemptionDate', 'UTCDATE', ()),
+    (241, 'UnderlyingCouponPaymentDate', 'UTCDATE', ()),
+    (242, 'UnderlyingIssueDate', 'UTCDATE', ()),
+    (243, 'UnderlyingRepoCollateralSecurityType', 'INT', ()),
+    (244, 'UnderlyingRepurchaseTerm', 'INT', ()),
+    (245, 'UnderlyingRepurchaseRate', 'PERCENTAGE', ()),
+    (246, 'UnderlyingFactor', 'FLOAT', ()),
+    (247, 'UnderlyingRedemptionDate', 'UTCDATE', ()),
+    (248, 'LegCouponPaymentDate', 'UTCDATE', ()),
+    (249, 'LegIssueDate', 'UTCDATE', ()),
+    (250, 'LegRepoCollateralSecurityType', 'INT', ()),
+    (251, 'LegRepurchaseTerm', 'INT', ()),
+    (252, 'LegRepurchaseRate', 'PERCENTAGE', ()),
+    (253, 'LegFactor', 'FLOAT', ()),
+    (254, 'LegRedemptionDate', 'UTCDATE', ()),
+    (255, 'CreditRating', 'STRING', ()),
+    (256, 'UnderlyingCreditRating', 'STRING', ()),
+    (257, 'LegCreditRating', 'STRING', ()),
+    (258, 'TradedFlatSwitch', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (259, 'BasisFeatureDate', 'UTCDATE', ()),
+    (260, 'BasisFeaturePrice', 'PRICE', ()),
+    (262, 'MDReqID', 'STRING', ()),
+    (263, 'SubscriptionRequestType', 'CHAR', (('SNAPSHOT_PLUS_UPDATES', '1'), ('DISABLE_PREVIOUS_SNAPSHOT_PLUS_UPDATE_REQUEST', '2'), ('SNAPSHOT', '0'),)),
+    (264, 'MarketDepth', 'INT', ()),
+    (265, 'MDUpdateType', 'INT', (('FULL_REFRESH', 0), ('INCREMENTAL_REFRESH', 1),)),
+    (266, 'AggregatedBook', 'BOOLEAN', (('YES', 'Y'), ('NO', 'N'),)),
+    (267, 'NoMDEntryTypes', 'NUMINGROUP', ()),
+    (268, 'NoMDEntries', 'NUMINGROUP', ()),
+    (269, 'MDEntryType', 'CHAR', (('TRADING_SESSION_HIGH_PRICE', '7'), ('OFFER', '1'), ('IMBALANCE', 'A'), ('TRADING_SESSION_VWAP_PRICE', '9'), ('TRADING_SESSION_LOW_PRICE', '8'), ('CLOSING_PRICE', '5'), ('OPENING_PRICE', '4'), ('BID', '0'), ('TRADE', '2'), ('INDEX_VALUE', '3'), ('SETTLEMENT_PRICE', '6'),)),
+    (270, 'MDEntryPx', 'PRICE', ()),
+    (271, 'MDEntrySize', 'QTY', ()),
+    (272, 'MDEntryDate', 'UTCDATE', ()),
+    (273, 'MDEntryTime', 'UTCTIMEONLY', ()),
+    (274, 'TickDirection', 'CHAR', (('PLUS_TICK', '0'), ('ZERO_PLUS_TICK', '1'), ('MINUS_TICK', '2'), ('ZERO_MINUS_TICK', '3'),)),
+    (275, 'MDMkt', 'EXCHANGE', ()),
+    (276, 'QuoteCondition', 'MULTIPLEVALUESTRING', (('LOCKED', 'E'), ('NON_FIRM', 'I'), ('FAST_TRADING', 'H'), ('CROSSED', 'F'), ('CONSOLIDATED_BEST', 'D'), ('EXCHANGE_BEST', 'C'), ('CLOSED', 'B'), ('OPEN', 'A'), ('DEPTH', 'G'),)),
+    (277, 'TradeCondition', 'MULTIPLEVALUESTRING', (('NEXT_DAY_TRADE', 'J'), ('OPENED', 'K'), ('SELLER', 'L'), ('AVERAGE_PRICE_TRADE', 'B'), ('SOLD', 'M'), ('RULE_155_TRADE', 'H'), ('STOPPED_STOCK', 'N'), ('IMBALANCE_MORE_BUYERS', 'P'), ('IMBALANCE_MORE_SELLERS', 'Q'), ('OPENING_PRICE', 'R'), ('SOLD_LAST', 'I'), ('CASH', 'A'), ('CASH_TRADE', 'C'), ('OPENING', 'E'), ('INTRADAY_TRADE_DETAIL', 'F'), ('RULE_127_TRADE', 'G'), ('NEXT_DAY', 'D'),)),
+    (278, 'MDEntryID', 'STRING', ()),
+    (279, 'MDUpdateAction', 'CHAR', (('NEW', '0'), ('CHANGE', '1'), ('DELETE', '2'),)),
+    (280, 'MDEntryRefID', 'STRING', ()),
+    (281, 'MDReqRejReason', 'CHAR', (('UNSUPPORTED_AGGREGATEDBOOK', '7'), ('DUPLICATE_MDREQID', '1'), ('UNSUPPORTED_MDIMPLICITDELETE', 'C'), ('UNSUPPORTED_OPENCLOSESETTLEFLAG', 'B'), ('UNSUPPORTED_SCOPE', 'A'), ('UNSUPPORTED_TRADINGSESSIONID', '9'), ('UNSUPPORTED_MDENTRYTYPE', '8'), ('UNSUPPORTED_MDUPDATETYPE', '6'), ('UNSUPPORTED_MARKETDEPTH', '5'), ('UNSUPPORTED_SUBSCRIPTIONREQUESTTYPE', '4'), ('INSUFFICIENT_BANDWIDTH', '2'), ('UNKNOWN_SYMBOL', '0'), ('INSUFFICIENT_PERMISSIONS', '3'),)),
+    (282, 'MDEntryOriginator', 'STRING', ()),
+    (283, 'LocationID', 'STRING', ()),
+    (284, 'DeskID', 'STRING', ()),
+    (285, 'DeleteReason', 'CHAR', (('CANCELATION', '0'), ('ERROR', '1'),)),
+    (286, 'OpenCloseSettleFlag', 'MULTIPLEVALUESTRING', (('SESSION_OPEN', '1'), ('DELIVERY_SETTLEMENT_PRICE', '2'), ('EXPECTED_PRICE', '3'), ('PRICE_FROM_PREVIOUS_BUSINESS_DAY', '4'), ('DAILY_OPEN', '0'),)),
+    (287, 'SellerDays', 'INT', ()),
+    (288, 'MDEntryBuyer', 'STRING', ()),
+    (289, 'MDEntrySeller', 'STRING', ()),
+    (290, 'MDEntryPositionNo', 'INT', ()),
+    (291, 'FinancialStatus', 'MULTIPLEVALUESTRING', (('BANKRUPT', '1'), ('PENDING_DELISTING', '2'),)),
+    (292, 'CorporateAction', 'MULTIPLEVALUESTRING', (('EX_DISTRIBUTION', 'B'), ('EX_INTEREST', 'E'), ('EX_RIGHTS', 'C'), ('EX_DIVIDEND', 'A'), ('NEW', 'D'),)),
+    (293, 'DefBidSize', 'QTY', ()),
+    (294, 'DefOfferSize', 'QTY', ()),
+    (295, 'NoQuoteEntries', 'NUMINGROUP', ()),
+    (296, 'NoQuoteSets', 'NUMINGROUP', ()),
+    (297, 'QuoteStatus', 'INT', (('REMOVED_FROM_MARKET', 6), ('CANCELED_FOR_SYMBOL', 1), ('PENDING', 10), ('QUOTE_NOT_FOUND', 9), ('QUERY', 8), ('EXPIRED', 7), ('REJECTED', 5), ('CANCELED_ALL', 4), ('CANCELED_FOR_UNDERLYING', 3), ('CANCELED_FOR_SECURITY_TYPE', 2), ('ACCEPTED', 0),)),
+    (298, 'QuoteCancelType', 'INT', (('CANCEL_ALL_QUOTES', 4), ('CANCEL_FOR_SECURITY_TYPE', 2), ('CANCEL_FOR_SYMBOL', 1), ('CANCEL_FOR_UNDERLYING_SYMBOL', 3),)),
+    (299, 'QuoteEntryID', 'STRING', ()),
+    (300, 'QuoteRejectReason', 'INT', (('NOT_AUTHORIZED_TO_QUOTE_SECURITY', 9), ('UNKNOWN_SYMBOL', 1), ('EXCHANGE', 2), ('QUOTE_REQUEST_EXCEEDS_LIMIT', 3), ('TOO_LATE_TO_ENTER', 4), ('UNKNOWN_QUOTE', 5), ('DUPLICATE_QUOTE', 6), ('INVALID_BID_ASK_SPREAD', 7), ('INVALID_PRICE', 8),)),
+    (301, 'QuoteResponseLevel', 'INT', (('ACKNOWLEDGE_ONLY_NEGATIVE_OR_ERRONEOUS_QUOTES', 1), ('NO_ACKNOWLEDGEMENT', 0), ('ACKNOWLEDGE_EACH_QUOTE_MESSAGES', 2),)),
+    (302, 'QuoteSetID', 'STRING', ()),
+    (303, 'QuoteRequestType', 'INT', (('AUTOMATIC', 2), ('MANUAL', 1),)),
+    (304, 'TotQuoteEntries', 'INT', ()),
+    (305, 'UnderlyingSecurityIDSource', 'STRING', ()),
+    (306, 'UnderlyingIssuer', 'STRING', ()),
+    (307, 'UnderlyingSecurityDesc', 'STRING', ()),
+    (308, 'UnderlyingSecurityExchange', 'EXCHANGE', ()),
+    (309, 'UnderlyingSecurityID', 'STRING', ()),
+    (310, 'UnderlyingSecurityType', 'STRING', ()),
+    (311, 'UnderlyingSymbol', 'STRING', ()),
+    (312, 'UnderlyingSymbolSfx', 'STRING', ()),
+    (313, 'UnderlyingMaturityMonthYear', 'MONTHYEAR', ()),
+    (314, 'UnderlyingMaturityDay', 'DAYOFMONTH', ()),
+    (315, 'UnderlyingPutOrCall', 'INT', ()),
+    (316, 'UnderlyingStrikePrice', 'PRICE', ()),
+    (317, 'UnderlyingOptAttribute', 'CHAR', ()),
+    (318, 'UnderlyingCurrency', 'CURRENCY', ()),
+    (319, 'RatioQty', 'QUANTITY', ()),
+    (320, 'SecurityReqID', 'STRING', ()),
+    (321, 'SecurityRequestType', 'INT', (('REQUEST_SECURITY_IDENTITY_AND_SPECIFICATIONS', 0), ('REQUEST_SECURITY_IDENTITY_FOR_THE_SPECIFICATIONS_PROVIDED', 1), ('REQUEST_LIST_SECURITY_TYPES', 2), ('REQUEST_LIST_SECURITIES', 3),)),
+    (322, 'SecurityResponseID', 'STRING', ()),
+    (323, 'SecurityResponseType', 'INT', (('REJECT_SECURITY_PROPOSAL', 5), ('ACCEPT_SECURITY_PROPOSAL_AS_IS', 1), ('CAN_NOT_MATCH_SELECTION_CRITERIA', 6), ('ACCEPT_SECURITY_PROPOSAL_WITH_REVISIONS_AS_INDICATED_IN_THE_MESSAGE', 2), ('LIST_OF_SECURITIES_RETURNED_PER_REQUEST', 4), ('LIST_OF_SECURITY_TYPES_RETURNED_PER_REQUEST', 3),)),
+    (324, 'SecurityStatusReqID', 'STRING', ()),
+    (325, 'UnsolicitedIndicator', 'BOOLEAN', (('YES', 'Y'), ('NO', 'N'),)),
+    (326, 'SecurityTradingStatus', 'INT', (('UNKNOWN_OR_INVALID', 20), ('NO_MARKET_ON_CLOSE_IMBALANCE', 13), ('ITS_PRE_OPENING', 14), ('NEW_PRICE_INDICATION', 15), ('TRADE_DISSEMINATION_TIME', 16), ('READY_TO_TRADE', 17), ('NOT_TRADED_ON_THIS_MARKET', 19), ('OPENING_ROTATION', 22), ('PRE_OPEN', 21), ('NO_MARKET_IMBALANCE', 12), ('NOT_AVAILABLE_FOR_TRADING', 18), ('MARKET_ON_CLOSE_IMBALANCE_SELL', 10), ('MARKET_ON_CLOSE_IMBALANCE_BUY', 9), ('MARKET_IMBALANCE_SELL', 8), ('MARKET_IMBALANCE_BUY', 7), ('TRADING_RANGE_INDICATION', 6), ('PRICE_INDICATION', 5), ('NO_OPEN_NO_RESUME', 4), ('RESUME', 3), ('OPENING_DELAY', 1), ('TRADING_HALT', 2), ('_11', 11), ('FAST_MARKET', 23),)),
+    (327, 'HaltReasonChar', 'CHAR', (('EQUIPMENT_CHANGEOVER', 'X'), ('ADDITIONAL_INFORMATION', 'M'), ('ORDER_INFLUX', 'E'), ('NEWS_PENDING', 'P'), ('ORDER_IMBALANCE', 'I'), ('NEWS_DISSEMINATION', 'D'),)),
+    (328, 'InViewOfCommon', 'BOOLEAN', (('YES', 'Y'), ('NO', 'N'),)),
+    (329, 'DueToRelated', 'BOOLEAN', (('YES', 'Y'), ('NO', 'N'),)),
+    (330, 'BuyVolume', 'QTY', ()),
+    (331, 'SellVolume', 'QTY', ()),
+    (332, 'HighPx', 'PRICE', ()),
+    (333, 'LowPx', 'PRICE', ()),
+    (334, 'Adjustment', 'INT', (('CANCEL', 1), ('ERROR', 2), ('CORRECTION', 3),)),
+    (335, 'TradSesReqID', 'STRING', ()),
+    (336, 'TradingSessionID', 'STRING', ()),
+    (337, 'ContraTrader', 'STRING', ()),
+    (338, 'TradSesMethod', 'INT', (('TWO_PARTY', 3), ('ELECTRONIC', 1), ('OPEN_OUTCRY', 2),)),
+    (339, 'TradSesMode', 'INT', (('PRODUCTION', 3), ('TESTING', 1), ('SIMULATED', 2),)),
+    (340, 'TradSesStatus', 'INT', (('PRE_CLOSE', 5), ('REQUEST_REJECTED', 6), ('PRE_OPEN', 4), ('CLOSED', 3), ('OPEN', 2), ('HALTED', 1), ('UNKNOWN', 0),)),
+    (341, 'TradSesStartTime', 'UTCTIMESTAMP', ()),
+    (342, 'TradSesOpenTime', 'UTCTIMESTAMP', ()),
+    (343, 'TradSesPreCloseTime', 'UTCTIMESTAMP', ()),
+    (344, 'TradSesCloseTime', 'UTCTIMESTAMP', ()),
+    (345, 'TradSesEndTime', 'UTCTIMESTAMP', ()),
+    (346, 'NumberOfOrders', 'INT', ()),
+    (347, 'MessageEncoding', 'STRING', (('UTF_8', 'UTF-8'), ('ISO_2022_JP', 'ISO-2022-JP'), ('EUC_JP', 'EUC-JP'), ('SHIFT_JIS', 'SHIFT_JIS'),)),
+    (348, 'EncodedIssuerLen', 'LENGTH', ()),
+    (349, 'EncodedIssuer', 'DATA', ()),
+    (350, 'EncodedSecurityDescLen', 'LENGTH', ()),
+    (351, 'EncodedSecurityDesc', 'DATA', ()),
+    (352, 'EncodedListExecInstLen', 'LENGTH', ()),
+    (353, 'EncodedListExecInst', 'DATA', ()),
+    (354, 'EncodedTextLen', 'LENGTH', ()),
+    (355, 'EncodedText', 'DATA', ()),
+    (356, 'EncodedSubjectLen', 'LENGTH', ()),
+    (357, 'EncodedSubject', 'DATA', ()),
+    (358, 'EncodedHeadlineLen', 'LENGTH', ()),
+    (359, 'EncodedHeadline', 'DATA', ()),
+    (360, 'EncodedAllocTextLen', 'LENGTH', ()),
+    (361, 'EncodedAllocText', 'DATA', ()),
+    (362, 'EncodedUnderlyingIssuerLen', 'LENGTH', ()),
+    (363, 'EncodedUnderlyingIssuer', 'DATA', ()),
+    (364, 'EncodedUnderlyingSecurityDescLen', 'LENGTH', ()),
+    (365, 'EncodedUnderlyingSecurityDesc', 'DATA', ()),
+    (366, 'AllocPrice', 'PRICE', ()),
+    (367, 'QuoteSetValidUntilTime', 'UTCTIMESTAMP', ()),
+    (368, 'QuoteEntryRejectReason', 'INT', (('UNKNOWN_QUOTE', 5), ('NOT_AUTHORIZED_TO_QUOTE_SECURITY', 9), ('INVALID_PRICE', 8), ('DUPLICATE_QUOTE', 6), ('TOO_LATE_TO_ENTER', 4), ('QUOTE_EXCEEDS_LIMIT', 3), ('EXCHANGE', 2), ('UNKNOWN_SYMBOL', 1), ('INVALID_BID_ASK_SPREAD', 7),)),
+    (369, 'LastMsgSeqNumProcessed', 'SEQNUM', ()),
+    (370, 'OnBehalfOfSendingTime', 'UTCTIMESTAMP', ()),
+    (371, 'RefTagID', 'INT', ()),
+    (372, 'RefMsgType', 'STRING', ()),
+    (373, 'SessionRejectReason', 'INT', (('XML_VALIDATION_ERROR', 12), ('NON_DATA_VALUE_INCLUDES_FIELD_DELIMITER', 17), ('INCORRECT_NUMINGROUP_COUNT_FOR_REPEATING_GROUP', 16), ('REPEATING_GROUP_FIELDS_OUT_OF_ORDER', 15), ('TAG_SPECIFIED_OUT_OF_REQUIRED_ORDER', 14), ('INVALID_MSGTYPE', 11), ('INVALID_TAG_NUMBER', 0), ('COMPID_PROBLEM', 9), ('SIGNATURE_PROBLEM', 8), ('DECRYPTION_PROBLEM', 7), ('INCORRECT_DATA_FORMAT_FOR_VALUE', 6), ('VALUE_IS_INCORRECT', 5), ('TAG_SPECIFIED_WITHOUT_A_VALUE', 4), ('UNDEFINED_TAG', 3), ('SENDINGTIME_ACCURACY_PROBLEM', 10), ('TAG_APPEARS_MORE_THAN_ONCE', 13), ('TAG_NOT_DEFINED_FOR_THIS_MESSAGE_TYPE', 2), ('REQUIRED_TAG_MISSING', 1),)),
+    (374, 'BidRequestTransType', 'CHAR', (('NEW', 'N'), ('CANCEL', 'C'),)),
+    (375, 'ContraBroker', 'STRING', ()),
+    (376, 'ComplianceID', 'STRING', ()),
+    (377, 'SolicitedFlag', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (378, 'ExecRestatementReason', 'INT', (('CANCEL_ON_SYSTEM_FAILURE', 7), ('GT_CORPORATE_ACTION', 0), ('MARKET', 8), ('CANCEL_ON_TRADING_HALT', 6), ('PARTIAL_DECLINE_OF_ORDERQTY', 5), ('BROKER_OPTION', 4), ('REPRICING_OF_ORDER', 3), ('GT_RENEWAL', 1), ('VERBAL_CHANGE', 2),)),
+    (379, 'BusinessRejectRefID', 'STRING', ()),
+    (380, 'BusinessRejectReason', 'INT', (('UNSUPPORTED_MESSAGE_TYPE', 3), ('DELIVERTO_FIRM_NOT_AVAILABLE_AT_THIS_TIME', 7), ('APPLICATION_NOT_AVAILABLE', 4), ('NOT_AUTHORIZED', 6), ('OTHER', 0), ('CONDITIONALLY_REQUIRED_FIELD_MISSING', 5), ('UNKOWN_ID', 1), ('UNKNOWN_SECURITY', 2),)),
+    (381, 'GrossTradeAmt', 'AMT', ()),
+    (382, 'NoContraBrokers', 'NUMINGROUP', ()),
+    (383, 'MaxMessageSize', 'LENGTH', ()),
+    (384, 'NoMsgTypes', 'NUMINGROUP', ()),
+    (385, 'MsgDirection', 'CHAR', (('SEND', 'S'), ('RECEIVE', 'R'),)),
+    (386, 'NoTradingSessions', 'NUMINGROUP', ()),
+    (387, 'TotalVolumeTraded', 'QTY', ()),
+    (388, 'DiscretionInst', 'CHAR', (('RELATED_TO_DISPLAYED_PRICE', '0'), ('RELATED_TO_MARKET_PRICE', '1'), ('RELATED_TO_PRIMARY_PRICE', '2'), ('RELATED_TO_LOCAL_PRIMARY_PRICE', '3'), ('RELATED_TO_MIDPOINT_PRICE', '4'), ('RELATED_TO_LAST_TRADE_PRICE', '5'),)),
+    (389, 'DiscretionOffset', 'PRICEOFFSET', ()),
+    (390, 'BidID', 'STRING', ()),
+    (391, 'ClientBidID', 'STRING', ()),
+    (392, 'ListName', 'STRING', ()),
+    (393, 'TotalNumSecurities', 'INT', ()),
+    (394, 'BidType', 'INT', (('NON_DISCLOSED_STYLE', 1), ('DISCLOSED_STYLE', 2), ('NO_BIDDING_PROCESS', 3),)),
+    (395, 'NumTickets', 'INT', ()),
+    (396, 'SideValue1', 'AMT', ()),
+    (397, 'SideValue2', 'AMT', ()),
+    (398, 'NoBidDescriptors', 'NUMINGROUP', ()),
+    (399, 'BidDescriptorType', 'INT', (('INDEX', 3), ('COUNTRY', 2), ('SECTOR', 1),)),
+    (400, 'BidDescriptor', 'STRING', ()),
+    (401, 'SideValueInd', 'INT', (('SIDEVALUE1', 1), ('SIDEVALUE_2', 2),)),
+    (402, 'LiquidityPctLow', 'PERCENTAGE', ()),
+    (403, 'LiquidityPctHigh', 'PERCENTAGE', ()),
+    (404, 'LiquidityValue', 'AMT', ()),
+    (405, 'EFPTrackingError', 'PERCENTAGE', ()),
+    (406, 'FairValue', 'AMT', ()),
+    (407, 'OutsideIndexPct', 'PERCENTAGE', ()),
+    (408, 'ValueOfFutures', 'AMT', ()),
+    (409, 'LiquidityIndType', 'INT', (('NORMAL_MARKET_SIZE', 3), ('OTHER', 4), ('_20_DAY_MOVING_AVERAGE', 2), ('_5DAY_MOVING_AVERAGE', 1),)),
+    (410, 'WtAverageLiquidity', 'PERCENTAGE', ()),
+    (411, 'ExchangeForPhysical', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (412, 'OutMainCntryUIndex', 'AMT', ()),
+    (413, 'CrossPercent', 'PERCENTAGE', ()),
+    (414, 'ProgRptReqs', 'INT', (('REAL_TIME_EXECUTION_REPORTS', 3), ('SELLSIDE_PERIODICALLY_SENDS_STATUS_USING_LISTSTATUS_PERIOD_OPTIONALLY_SPECIFIED_IN_PROGRESSPERIOD', 2), ('BUYSIDE_EXPLICITLY_REQUESTS_STATUS_USING_STATUSREQUEST', 1),)),
+    (415, 'ProgPeriodInterval', 'INT', ()),
+    (416, 'IncTaxInd', 'INT', (('GROSS', 2), ('NET', 1),)),
+    (417, 'NumBidders', 'INT', ()),
+    (418, 'TradeType', 'CHAR', (('VWAP_GUARANTEE', 'G'), ('AGENCY', 'A'), ('GUARANTEED_CLOSE', 'J'), ('RISK_TRADE', 'R'),)),
+    (419, 'BasisPxType', 'CHAR', (('VWAP_THROUGH_AN_AFTERNOON_SESSION', '8'), ('OPEN', 'D'), ('OTHERS', 'Z'), ('STRIKE', 'C'), ('VWAP_THROUGH_AN_AFTERNOON_SESSION_EXCEPT_YORI', 'B'), ('VWAP_THROUGH_A_DAY_EXCEPT_YORI', '9'), ('VWAP_THROUGH_A_MORNING_SESSION', '7'), ('VWAP_THROUGH_A_DAY', '6'), ('SQ', '5'), ('CURRENT_PRICE', '4'), ('CLOSING_PRICE', '3'), ('CLOSING_PRICE_AT_MORNING_SESSION', '2'), ('VWAP_THROUGH_A_MORNING_SESSION_EXCEPT_YORI', 'A'),)),
+    (420, 'NoBidComponents', 'NUMINGROUP', ()),
+    (421, 'Country', 'COUNTRY', ()),
+    (422, 'TotNoStrikes', 'INT', ()),
+    (423, 'PriceType', 'INT', (('FIXED_AMOUNT', 3), ('PERCENTAGE', 1), ('DISCOUNT', 4), ('BASIS_POINTS_RELATIVE_TO_BENCHMARK', 6), ('TED_PRICE', 7), ('TED_YIELD', 8), ('PREMIUM', 5), ('PER_SHARE', 2),)),
+    (424, 'DayOrderQty', 'QTY', ()),
+    (425, 'DayCumQty', 'QTY', ()),
+    (426, 'DayAvgPx', 'PRICE', ()),
+    (427, 'GTBookingInst', 'INT', (('BOOK_OUT_ALL_TRADES_ON_DAY_OF_EXECUTION', 0), ('ACCUMULATE_UNTIL_VERBALLY_NOTIFIED_OTHERWISE', 2), ('ACCUMULATE_EXECUTIONS_UNTIL_ORDER_IS_FILLED_OR_EXPIRES', 1),)),
+    (428, 'NoStrikes', 'NUMINGROUP', ()),
+    (429, 'ListStatusType', 'INT', (('ALERT', 6), ('EXECSTARTED', 4), ('TIMED', 3), ('RESPONSE', 2), ('ACK', 1), ('ALLDONE', 5),)),
+    (430, 'NetGrossInd', 'INT', (('NET', 1), ('GROSS', 2),)),
+    (431, 'ListOrderStatus', 'INT', (('CANCELING', 4), ('EXECUTING', 3), ('REJECT', 7), ('ALL_DONE', 6), ('ALERT', 5), ('RECEIVEDFOREXECUTION', 2), ('INBIDDINGPROCESS', 1),)),
+    (432, 'ExpireDate', 'LOCALMKTDATE', ()),
+    (433, 'ListExecInstType', 'CHAR', (('EXCHANGE_SWITCH_CIV_ORDER_BUY_DRIVEN_CASH_WITHDRAW', '5'), ('EXCHANGE_SWITCH_CIV_ORDER_BUY_DRIVEN_CASH_TOP_UP', '4'), ('WAIT_FOR_EXECUTE_INSTRUCTION', '2'), ('IMMEDIATE', '1'), ('EXCHANGE_SWITCH_CIV_ORDER_SELL_DRIVEN', '3'),)),
+    (434, 'CxlRejResponseTo', 'CHAR', (('ORDER_CANCEL_REPLACE_REQUEST', '2'), ('ORDER_CANCEL_REQUEST', '1'),)),
+    (435, 'UnderlyingCouponRate', 'PERCENTAGE', ()),
+    (436, 'UnderlyingContractMultiplier', 'FLOAT', ()),
+    (437, 'ContraTradeQty', 'QTY', ()),
+    (438, 'ContraTradeTime', 'UTCTIMESTAMP', ()),
+    (439, 'ClearingFirm', 'STRING', ()),
+    (440, 'ClearingAccount', 'STRING', ()),
+    (441, 'LiquidityNumSecurities', 'INT', ()),
+    (442, 'MultiLegReportingType', 'CHAR', (('SINGLE_SECURITY', '1'), ('INDIVIDUAL_LEG_OF_A_MULTI_LEG_SECURITY', '2'), ('MULTI_LEG_SECURITY', '3'),)),
+    (443, 'StrikeTime', 'UTCTIMESTAMP', ()),
+    (444, 'ListStatusText', 'STRING', ()),
+    (445, 'EncodedListStatusTextLen', 'LENGTH', ()),
+    (446, 'EncodedListStatusText', 'DATA', ()),
+    (447, 'PartyIDSource', 'CHAR', (('CHINESE_B_SHARE', '5'), ('US_EMPLOYER_IDENTIFICATION_NUMBER', '8'), ('AUSTRALIAN_TAX_FILE_NUMBER', 'A'), ('AUSTRALIAN_BUSINESS_NUMBER', '9'), ('ISO_COUNTRY_CODE', 'E'), ('BIC', 'B'), ('US_SOCIAL_SECURITY_NUMBER', '7'), ('PROPRIETARY_CUSTOM_CODE', 'D'), ('SETTLEMENT_ENTITY_LOCATION', 'F'), ('KOREAN_INVESTOR_ID', '1'), ('TAIWANESE_QUALIFIED_FOREIGN_INVESTOR_ID_QFII', '2'), ('TAIWANESE_TRADING_ACCOUNT', '3'), ('MALAYSIAN_CENTRAL_DEPOSITORY', '4'), ('UK_NATIONAL_INSURANCE_OR_PENSION_NUMBER', '6'), ('GENERALLY_ACCEPTED_MARKET_PARTICIPANT_IDENTIFIER', 'C'),)),
+    (448, 'PartyID', 'STRING', ()),
+    (449, 'TotalVolumeTradedDate', 'UTCDATE', ()),
+    (450, 'TotalVolumeTradedTime', 'UTCTIMEONLY', ()),
+    (451, 'NetChgPrevDay', 'PRICEOFFSET', ()),
+    (452, 'PartyRole', 'INT', (('CORRESPONDANT_CLEARING_FIRM', 15), ('CLIENT_ID', 3), ('UNDERLYING_CONTRA_FIRM', 20), ('SPONSORING_FIRM', 19), ('CONTRA_CLEARING_FIRM', 18), ('CONTRA_FIRM', 17), ('EXECUTING_SYSTEM', 16), ('ENTERING_FIRM', 7), ('EXECUTING_FIRM', 1), ('BROKER_OF_CREDIT', 2), ('INVESTOR_ID', 5), ('INTRODUCING_FIRM', 6), ('GIVEUP_CLEARING_FIRM', 14), ('LOCATE_LENDING_FIRM', 8), ('FUND_MANAGER_CLIENT_ID', 9), ('SETTLEMENT_LOCATION', 10), ('ORDER_ORIGINATION_TRADER', 11), ('EXECUTING_TRADER', 12), ('ORDER_ORIGINATION_FIRM', 13), ('CLEARING_FIRM', 4),)),
+    (453, 'NoPartyIDs', 'NUMINGROUP', ()),
+    (454, 'NoSecurityAltID', 'NUMINGROUP', ()),
+    (455, 'SecurityAltID', 'STRING', ()),
+    (456, 'SecurityAltIDSource', 'STRING', ()),
+    (457, 'NoUnderlyingSecurityAltID', 'NUMINGROUP', ()),
+    (458, 'UnderlyingSecurityAltID', 'STRING', ()),
+    (459, 'UnderlyingSecurityAltIDSource', 'STRING', ()),
+    (460, 'Product', 'INT', (('LOAN', '8'), ('OTHER', '12'), ('MUNICIPAL', '11'), ('AGENCY', '1'), ('CORPORATE', '3'), ('CURRENCY', '4'), ('COMMODITY', '2'), ('GOVERNMENT', '6'), ('MORTGAGE', '10'), ('INDEX', '7'), ('MONEYMARKET', '9'), ('EQUITY', '5'),)),
+    (461, 'CFICode', 'STRING', ()),
+    (462, 'UnderlyingProduct', 'INT', ()),
+    (463, 'UnderlyingCFICode', 'STRING', ()),
+    (464, 'TestMessageIndicator', 'BOOLEAN', (('YES', 'Y'), ('NO', 'N'),)),
+    (465, 'QuantityType', 'INT', (('CONTRACTS', 6), ('OTHER', 7), ('CURRENCY', 5), ('ORIGINALFACE', 4), ('CURRENTFACE', 3), ('BONDS', 2), ('SHARES', 1), ('PAR', 8),)),
+    (466, 'BookingRefID', 'STRING', ()),
+    (467, 'IndividualAllocID', 'STRING', ()),
+    (468, 'RoundingDirection', 'CHAR', (('ROUND_TO_NEAREST', '0'), ('ROUND_DOWN', '1'), ('ROUND_UP', '2'),)),
+    (469, 'RoundingModulus', 'FLOAT', ()),
+    (470, 'CountryOfIssue', 'COUNTRY', ()),
+    (471, 'StateOrProvinceOfIssue', 'STRING', ()),
+    (472, 'LocaleOfIssue', 'STRING', ()),
+    (473, 'NoRegistDtls', 'NUMINGROUP', ()),
+    (474, 'MailingDtls', 'STRING', ()),
+    (475, 'InvestorCountryOfResidence', 'COUNTRY', ()),
+    (476, 'PaymentRef', 'STRING', ()),
+    (477, 'DistribPaymentMethod', 'INT', ()),
+    (478, 'CashDistribCurr', 'CURRENCY', ()),
+    (479, 'CommCurrency', 'CURRENCY', ()),
+    (480, 'CancellationRights', 'CHAR', (('NO_WAIVER_AGREEMENT', 'M'), ('NO_EXECUTION_ONLY', 'N'), ('YES', 'Y'), ('NO_INSTITUTIONAL', 'O'),)),
+    (481, 'MoneyLaunderingStatus', 'CHAR', (('EXEMPT_AUTHORISED_CREDIT_OR_FINANCIAL_INSTITUTION', '3'), ('EXEMPT_CLIENT_MONEY_TYPE_EXEMPTION', '2'), ('EXEMPT_BELOW_THE_LIMIT', '1'), ('PASSED', 'Y'), ('NOT_CHECKED', 'N'),)),
+    (482, 'MailingInst', 'STRING', ()),
+    (483, 'TransBkdTime', 'UTCTIMESTAMP', ()),
+    (484, 'ExecPriceType', 'CHAR', (('SINGLE_PRICE', 'S'), ('OFFER_PRICE_MINUS_ADJUSTMENT_AMOUNT', 'Q'), ('OFFER_PRICE_MINUS_ADJUSTMENT', 'P'), ('OFFER_PRICE', 'O'), ('CREATION_PRICE_PLUS_ADJUSTMENT_AMOUNT', 'E'), ('CREATION_PRICE_PLUS_ADJUSTMENT', 'D'), ('CREATION_PRICE', 'C'), ('BID_PRICE', 'B'),)),
+    (485, 'ExecPriceAdjustment', 'FLOAT', ()),
+    (486, 'DateOfBirth', 'LOCALMKTDATE', ()),
+    (487, 'TradeReportTransType', 'CHAR', (('NEW', 'N'), ('REPLACE', 'R'), ('CANCEL', 'C'),)),
+    (488, 'CardHolderName', 'STRING', ()),
+    (489, 'CardNumber', 'STRING', ()),
+    (490, 'CardExpDate', 'LOCALMKTDATE', ()),
+    (491, 'CardIssNo', 'STRING', ()),
+    (492, 'PaymentMethod', 'INT', (('BPAY', 14), ('ACH_CREDIT', 13), ('ACH_DEBIT', 12), ('CREDIT_CARD', 11), ('DIRECT_CREDIT', 10), ('DIRECT_DEBIT', 9), ('DEBIT_CARD', 8), ('FEDWIRE', 7), ('HIGH_VALUE_CLEARING_SYSTEM', 15), ('EUROCLEAR', 3), ('TELEGRAPHIC_TRANSFER', 6), ('CLEARSTREAM', 4), ('CREST', 1), ('NSCC', 2), ('CHEQUE', 5),)),
+    (493, 'RegistAcctType', 'STRING', ()),
+    (494, 'Designation', 'STRING', ()),
+    (495, 'TaxAdvantageType', 'INT', (('PROFIT_SHARING_PLAN', 19), ('EMPLOYER', 11), ('EMPLOYER_CURRENT_YEAR', 12), ('NON_FUND_PROTOTYPE_IRA', 13), ('NON_FUND_QUALIFIED_PLAN', 14), ('DEFINED_CONTRIBUTION_PLAN', 15), ('EMPLOYEE_CURRENT_YEAR', 10), ('INDIVIDUAL_RETIREMENT_ACCOUNT_ROLLOVER', 17), ('MINI_INSURANCE_ISA', 5), ('INDIVIDUAL_RETIREMENT_ACCOUNT', 16), ('EMPLOYEE', 9), ('ASSET_TRANSFER', 8), ('SELF_DIRECTED_IRA', 21), ('CURRENT_YEAR_PAYMENT', 6), ('_401K', 20), ('MINI_STOCKS_AND_SHARES_ISA', 4), ('MINI_CASH_ISA', 3), ('TESSA', 2), ('MAXI_ISA', 1), ('NONE_NOT_APPLICABLE', 0), ('PRIOR_YEAR_PAYMENT', 7), ('_457', 23), ('ROTH_IRA_24', 24), ('ROTH_IRA_25', 25), ('ROTH_CONVERSION_IRA_26', 26), ('ROTH_CONVERSION_IRA_27', 27), ('EDUCATION_IRA_28', 28), ('EDUCATION_IRA_29', 29), ('KEOGH', 18), ('_403', 22),)),
+    (496, 'RegistRejReasonText', 'STRING', ()),
+    (497, 'FundRenewWaiv', 'CHAR', (('NO', 'N'), ('YES', 'Y'),)),
+    (498, 'CashDistribAgentName', 'STRING', ()),
+    (499, 'CashDistribAgentCode', 'STRING', ()),
+    (500, 'CashDistribAgentAcctNumber', 'STRING', ()),
+    (501, 'CashDistribPayRef', 'STRING', ()),
+    (502, 'CashDistribAgentAcctName', 'STRING', ()),
+    (503, 'CardStartDate', 'LOCALMKTDATE', ()),
+    (504, 'PaymentDate', 'LOCALMKTDATE', ()),
+    (505, 'PaymentRemitterID', 'STRING', ()),
+    (506, 'RegistStatus', 'CHAR', (('ACCEPT', 'A'), ('REMINDER', 'N'), ('REJECT', 'R'), ('HELD', 'H'),)),
+    (507, 'RegistRejReasonCode', 'INT', (('INVALID_UNACCEPTABLE_NODISTRIBINSTNS', 13), ('INVALID_UNACCEPTABLE_CASH_DISTRIB_AGENT_CODE', 17), ('INVALID_UNACCEPTABLE_CASH_DISTRIB_AGENT_ACCT_NAME', 16), ('INVALID_UNACCEPTABLE_NO_REG_DETLS', 4), ('INVALID_UNACCEPTABLE_DISTRIB_PAYMENT_METHOD', 15), ('INVALID_UNACCEPTABLE_DISTRIB_PERCENTAGE', 14), ('INVALID_UNACCEPTABLE_OWNERSHIP_TYPE', 3), ('INVALID_UNACCEPTABLE_TAX_EXEMPT_TYPE', 2), ('INVALID_UNACCEPTABLE_INVESTOR_COUNTRY_OF_RESIDENCE', 12), ('INVALID_UNACCEPTABLE_DATE_OF_BIRTH', 11), ('INVALID_UNACCEPTABLE_INVESTOR_ID_SOURCE', 10), ('INVALID_UNACCEPTABLE_INVESTOR_ID', 9), ('INVALID_UNACCEPTABLE_MAILING_INST', 8), ('INVALID_UNACCEPTABLE_MAILING_DTLS', 7), ('INVALID_UNACCEPTABLE_REG_SEQ_NO', 5), ('INVALID_UNACCEPTABLE_ACCOUNT_TYPE', 1), ('INVALID_UNACCEPTABLE_CASH_DISTRIB_AGENT_ACCT_NUM', 18), ('INVALID_UNACCEPTABLE_REG_DTLS', 6),)),
+    (508, 'RegistRefID', 'STRING', ()),
+    (509, 'RegistDetls', 'STRING', ()),
+    (510, 'NoDistribInsts', 'NUMINGROUP', ()),
+    (511, 'RegistEmail', 'STRING', ()),
+    (512, 'DistribPercentage', 'PERCENTAGE', ()),
+    (513, 'RegistID', 'STRING', ()),
+    (514, 'RegistTransType', 'CHAR', (('CANCEL', '2'), ('NEW', '0'), ('REPLACE', '1'),)),
+    (515, 'ExecValuationPoint', 'UTCTIMESTAMP', ()),
+    (516, 'OrderPercent', 'PERCENTAGE', ()),
+    (517, 'OwnershipType', 'CHAR', ()),
+    (518, 'NoContAmts', 'NUMINGROUP', ()),
+    (519, 'ContAmtType', 'INT', (('NET_SETTLEMENT_AMOUNT', 15), ('COMMISSION_AMOUNT', 1), ('COMMISSION', 2), ('INITIAL_CHARGE_AMOUNT', 3), ('INITIAL_CHARGE', 4), ('DISCOUNT_AMOUNT', 5), ('DISCOUNT', 6), ('DILUTION_LEVY_AMOUNT', 7), ('DILUTION_LEVY', 8), ('EXIT_CHARGE_AMOUNT', 9), ('EXIT_CHARGE', 10), ('FUND_BASED_RENEWAL_COMMISSION', 11), ('PROJECTED_FUND_VALUE', 12), ('FUND_BASED_RENEWAL_COMMISSION_AMOUNT_14', 14), ('FUND_BASED_RENEWAL_COMMISSION_AMOUNT_13', 13),)),
+    (520, 'ContAmtValue', 'FLOAT', ()),
+    (521, 'ContAmtCurr', 'CURRENCY', ()),
+    (522, 'OwnerType', 'INT', (('COMPANY_TRUSTEE', 5), ('NOMINEE', 13), ('CORPORATE_BODY', 12), ('NON_PROFIT_ORGANIZATION', 11), ('NETWORKING_SUB_ACCOUNT', 10), ('FIDUCIARIES', 9), ('TRUSTS', 8), ('PENSION_PLAN', 6), ('INDIVIDUAL_TRUSTEE', 4), ('PUBLIC_COMPANY', 2), ('PRIVATE_COMPANY', 3), ('INDIVIDUAL_INVESTOR', 1), ('CUSTODIAN_UNDER_GIFTS_TO_MINORS_ACT', 7),)),
+    (523, 'PartySubID', 'STRING', ()),
+    (524, 'NestedPartyID', 'STRING', ()),
+    (525, 'NestedPartyIDSource', 'CHAR', ()),
+    (526, 'SecondaryClOrdID', 'STRING', ()),
+    (527, 'SecondaryExecID', 'STRING', ()),
+    (528, 'OrderCapacity', 'CHAR', (('RISKLESS_PRINCIPAL', 'R'), ('INDIVIDUAL', 'I'), ('PRINCIPAL', 'P'), ('AGENT_FOR_OTHER_MEMBER', 'W'), ('AGENCY', 'A'), ('PROPRIETARY', 'G'),)),
+    (529, 'OrderRestrictions', 'MULTIPLEVALUESTRING', (('FOREIGN_ENTITY', '7'), ('RISKLESS_ARBITRAGE', 'A'), ('PROGRAM_TRADE', '1'), ('EXTERNAL_MARKET_PARTICIPANT', '8'), ('ACTING_AS_MARKET_MAKER_OR_SPECIALIST_IN_THE_UNDERLYING_SECURITY_OF_A_DERIVATIVE_SECURITY', '6'), ('ACTING_AS_MARKET_MAKER_OR_SPECIALIST_IN_THE_SECURITY', '5'), ('NON_INDEX_ARBITRAGE', '3'), ('INDEX_ARBITRAGE', '2'), ('COMPETING_MARKET_MAKER', '4'), ('EXTERNAL_INTER_CONNECTED_MARKET_LINKAGE', '9'),)),
+    (530, 'MassCancelRequestType', 'CHAR', (('CANCEL_ORDERS_FOR_A_SECURITY', '1'), ('CANCEL_ALL_ORDERS', '7'), ('CANCEL_ORDERS_FOR_A_TRADING_SESSION', '6'), ('CANCEL_ORDERS_FOR_A_SECURITYTYPE', '5'), ('CANCEL_ORDERS_FOR_A_CFICODE', '4'), ('CANCEL_ORDERS_FOR_AN_UNDERLYING_SECURITY', '2'), ('CANCEL_ORDERS_FOR_A_PRODUCT', '3'),)),
+    (531, 'MassCancelResponse', 'CHAR', (('CANCEL_ORDERS_FOR_A_TRADING_SESSION', '6'), ('CANCEL_REQUEST_REJECTED', '0'), ('CANCEL_ALL_ORDERS', '7'), ('CANCEL_ORDERS_FOR_A_PRODUCT', '3'), ('CANCEL_ORDERS_FOR_A_SECURITYTYPE', '5'), ('CANCEL_ORDERS_FOR_A_CFICODE', '4'), ('CANCEL_ORDERS_FOR_A_SECURITY', '1'), ('CANCEL_ORDERS_FOR_AN_UNDERLYING_SECURITY', '2'),)),
+    (532, 'MassCancelRejectReason', 'CHAR', (('INVALID_OR_UNKNOWN_UNDERLYING', '2'), ('INVALID_OR_UNKNOWN_TRADING_SESSION', '6'), ('INVALID_OR_UNKNOWN_SECURITY_TYPE', '5'), ('INVALID_OR_UNKNOWN_PRODUCT', '3'), ('INVALID_OR_UNKNOWN_SECURITY', '1'), ('MASS_CANCEL_NOT_SUPPORTED', '0'), ('INVALID_OR_UNKNOWN_CFICODE', '4'),)),
+    (533, 'TotalAffectedOrders', 'INT', ()),
+    (534, 'NoAffectedOrders', 'INT', ()),
+    (535, 'AffectedOrderID', 'STRING', ()),
+    (536, 'AffectedSecondaryOrderID', 'STRING', ()),
+    (537, 'QuoteType', 'INT', (('INDICATIVE', 0), ('TRADEABLE', 1), ('RESTRICTED_TRADEABLE', 2),)),
+    (538, 'NestedPartyRole', 'INT', ()),
+    (539, 'NoNestedPartyIDs', 'NUMINGROUP', ()),
+    (540, 'TotalAccruedInterestAmt', 'AMT', ()),
+    (541, 'MaturityDate', 'LOCALMKTDATE', ()),
+    (542, 'UnderlyingMaturityDate', 'LOCALMKTDATE', ()),
+    (543, 'InstrRegistry', 'STRING', ()),
+    (544, 'CashMargin', 'CHAR', (('MARGIN_OPEN', '2'), ('MARGIN_CLOSE', '3'), ('CASH', '1'),)),
+    (545, 'NestedPartySubID', 'STRING', ()),
+    (546, 'Scope', 'MULTIPLEVALUESTRING', (('LOCAL', '1'), ('NATIONAL', '2'), ('GLOBAL', '3'),)),
+    (547, 'MDImplicitDelete', 'BOOLEAN', (('YES', 'Y'), ('NO', 'N'),)),
+    (548, 'CrossID', 'STRING', ()),
+    (549, 'CrossType', 'INT', (('CROSS_TRADE_WHICH_IS_EXECUTED_COMPLETELY_OR_NOT_BOTH_SIDES_ARE_TREATED_IN_THE_SAME_MANNER_THIS_IS_EQUIVALENT_TO_AN_ALL_OR_NONE', 1), ('CROSS_TRADE_WHICH_IS_EXECUTED_PARTIALLY_AND_THE_REST_IS_CANCELLED_ONE_SIDE_IS_FULLY_EXECUTED_THE_OTHER_SIDE_IS_PARTIALLY_EXECUTED_WITH_THE_REMAINDER_BEING_CANCELLED_THIS_IS_EQUIVALENT_TO_AN_IMMEDIATE_OR_CANCEL_ON_THE_OTHER_SIDE', 2), ('CROSS_TRADE_WHICH_IS_PARTIALLY_EXECUTED_WITH_THE_UNFILLED_PORTIONS_REMAINING_ACTIVE_ONE_SIDE_OF_THE_CROSS_IS_FULLY_EXECUTED', 3), ('CROSS_TRADE_IS_EXECUTED_WITH_EXISTING_ORDERS_WITH_THE_SAME_PRICE', 4),)),
+    (550, 'CrossPrioritization', 'INT', (('SELLSIDE_PRIORITIZED', 2), ('NONE', 0), ('BUYSIDE_PRIORITIZED', 1),)),
+    (551, 'OrigCrossID', 'STRING', ()),
+    (552, 'NoSides', 'NUMINGROUP', (('ONE_SIDE', '1'), ('BOTH_SIDES', '2'),)),
+    (553, 'Username', 'STRING', ()),
+    (554, 'Password', 'STRING', ()),
+    (555, 'NoLegs', 'NUMINGROUP', ()),
+    (556, 'LegCurrency', 'CURRENCY', ()),
+    (557, 'TotalNumSecurityTypes', 'INT', ()),
+    (558, 'NoSecurityTypes', 'NUMINGROUP', ()),
+    (559, 'SecurityListRequestType', 'INT', (('SECURITYTYPE_AND_OR_CFICODE', 1), ('PRODUCT', 2), ('TRADINGSESSIONID', 3), ('ALL_SECURITIES', 4), ('SYMBOL', 0),)),
+    (560, 'SecurityRequestResult', 'INT', (('INSTRUMENT_DATA_TEMPORARILY_UNAVAILABLE', 4), ('VALID_REQUEST', 0), ('INVALID_OR_UNSUPPORTED_REQUEST', 1), ('REQUEST_FOR_INSTRUMENT_DATA_NOT_SUPPORTED', 5), ('NOT_AUTHORIZED_TO_RETRIEVE_INSTRUMENT_DATA', 3), ('NO_INSTRUMENTS_FOUND_THAT_MATCH_SELECTION_CRITERIA', 2),)),
+    (561, 'RoundLot', 'QTY', ()),
+    (562, 'MinTradeVol', 'QTY', ()),
+    (563, 'MultiLegRptTypeReq', 'INT', ()),
+    (564, 'LegPositionEffect', 'CHAR', ()),
+    (565, 'LegCoveredOrUncovered', 'INT', ()),
+    (566, 'LegPrice', 'PRICE', ()),
+    (567, 'TradSesStatusRejReason', 'INT', (('UNKNOWN_OR_INVALID_TRADINGSESSIONID', 1),)),
+    (568, 'TradeRequestID', 'STRING', ()),
+    (569, 'TradeRequestType', 'INT', (('ADVISORIES_THAT_MATCH_CRITERIA', 4), ('UNREPORTED_TRADES_THAT_MATCH_CRITERIA', 3), ('UNMATCHED_TRADES_THAT_MATCH_CRITERIA', 2), ('MATCHED_TRADES_MATCHING_CRITERIA_PROVIDED_ON_REQUEST', 1), ('ALL_TRADES', 0),)),
+    (570, 'PreviouslyReported', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (571, 'TradeReportID', 'STRING', ()),
+    (572, 'TradeReportRefID', 'STRING', ()),
+    (573, 'MatchStatus', 'CHAR', (('COMPARED_MATCHED_OR_AFFIRMED', '0'), ('UNCOMPARED_UNMATCHED_OR_UNAFFIRMED', '1'), ('ADVISORY_OR_ALERT', '2'),)),
+    (574, 'MatchType', 'STRING', (('SUMMARIZED_MATCH_USING_A1_TO_A5_EXACT_MATCH_CRITERIA_EXCEPT_QUANTITY_IS_SUMMARIZED_S5', 'S5'), ('ACT_M1_MATCH', 'M1'), ('ACT_M6_MATCH', 'M6'), ('ACT_DEFAULT_AFTER_M2', 'M5'), ('ACT_ACCEPTED_TRADE', 'M3'), ('SUMMARIZED_MATCH_USING_A1_TO_A5_EXACT_MATCH_CRITERIA_EXCEPT_QUANTITY_IS_SUMMARIZED_S2', 'S2'), ('SUMMARIZED_MATCH_USING_A1_TO_A5_EXACT_MATCH_CRITERIA_EXCEPT_QUANTITY_IS_SUMMARIZED_S3', 'S3'), ('SUMMARIZED_MATCH_USING_A1_TO_A5_EXACT_MATCH_CRITERIA_EXCEPT_QUANTITY_IS_SUMMARIZED_S4', 'S4'), ('ACT_M2_MATCH', 'M2'), ('EXACT_MATCH_ON_TRADE_DATE_STOCK_SYMBOL_QUANTITY_PRICE_TRADE_TYPE_AND_SPECIAL_TRADE_INDICATOR_PLUS_FOUR_BADGES', 'A2'), ('EXACT_MATCH_ON_TRADE_DATE_STOCK_SYMBOL_QUANTITY_PRICE_TRADE_TYPE_AND_SPECIAL_TRADE_INDICATOR_PLUS_TWO_BADGES_AND_EXECUTION_TIME', 'A3'), ('EXACT_MATCH_ON_TRADE_DATE_STOCK_SYMBOL_QUANTITY_PRICE_TRADE_TYPE_AND', 'A4'), ('COMPARED_RECORDS_RESULTING_FROM_STAMPED_ADVISORIES_OR_SPECIALIST', 'AQ'), ('NON_ACT', 'MT'), ('ACT_DEFAULT_TRADE', 'M4'), ('EXACT_MATCH_ON_TRADE_DATE_STOCK_SYMBOL_QUANTITY_PRICE_TRADE_TYPE_AND_SPECIAL_TRADE_INDICATOR_PLUS_FOUR_BADGES_AND_EXECUTION_TIME', 'A1'), ('SUMMARIZED_MATCH_USING_A1_TO_A5_EXACT_MATCH_CRITERIA_EXCEPT_QUANTITY_IS_SUMMARIZED_S1', 'S1'), ('EXACT_MATCH_ON_TRADE_DATE_STOCK_SYMBOL_QUANTITY_PRICE_TRADE_TYPE_AND_SPECIAL_TRADE_INDICATOR_PLUS_EXECUTION_TIME', 'A5'),)),
+    (575, 'OddLot', 'BOOLEAN', ()),
+    (576, 'NoClearingInstructions', 'INT', ()),
+    (577, 'ClearingInstruction', 'INT', (('MANUAL_MODE', 8), ('MULTILATERAL_NETTING', 5), ('AUTOMATIC_POSTING_MODE', 9), ('BILATERAL_NETTING_ONLY', 2), ('CLEAR_AGAINST_CENTRAL_COUNTERPARTY', 6), ('AUTOMATIC_GIVE_UP_MODE', 10), ('SPECIAL_TRADE', 4), ('EX_CLEARING', 3), ('PROCESS_NORMALLY', 0), ('EXCLUDE_FROM_CENTRAL_COUNTERPARTY', 7), ('EXCLUDE_FROM_ALL_NETTING', 1),)),
+    (578, 'TradeInputSource', 'STRING', ()),
+    (579, 'TradeInputDevice', 'STRING', ()),
+    (580, 'NoDates', 'INT', ()),
+    (581, 'AccountType', 'INT', (('HOUSE_TRADER', 3), ('ACCOUNT_IS_HOUSE_TRADER_AND_IS_CROSS_MARGINED', 7), ('ACCOUNT_IS_CARRIED_ON_NON_CUSTOMER_SIDE_OF_BOOKS_AND_IS_CROSS_MARGINED', 6), ('FLOOR_TRADER', 4), ('ACCOUNT_IS_CARRIED_ON_NON_CUSTOMER_SIDE_OF_BOOKS', 2), ('ACCOUNT_IS_CARRIED_ON_CUSTOMER_SIDE_OF_BOOKS', 1), ('JOINT_BACKOFFICE_ACCOUNT', 8),)),
+    (582, 'CustOrderCapacity', 'INT', ()),
+    (583, 'ClOrdLinkID', 'STRING', ()),
+    (584, 'MassStatusReqID', 'STRING', ()),
+    (585, 'MassStatusReqType', 'INT', (('STATUS_FOR_ORDERS_FOR_A_SECURITY', 1), ('STATUS_FOR_ORDERS_FOR_AN_UNDERLYING_SECURITY', 2), ('STATUS_FOR_ORDERS_FOR_A_PRODUCT', 3), ('STATUS_FOR_ORDERS_FOR_A_CFICODE', 4), ('STATUS_FOR_ORDERS_FOR_A_SECURITYTYPE', 5), ('STATUS_FOR_ORDERS_FOR_A_TRADING_SESSION', 6), ('STATUS_FOR_ORDERS_FOR_A_PARTYID', 8), ('STATUS_FOR_ALL_ORDERS', 7),)),
+    (586, 'OrigOrdModTime', 'UTCTIMESTAMP', ()),
+    (587, 'LegSettlmntTyp', 'CHAR', ()),
+    (588, 'LegFutSettDate', 'LOCALMKTDATE', ()),
+    (589, 'DayBookingInst', 'CHAR', (('CAN_TRIGGER_BOOKING_WITHOUT_REFERENCE_TO_THE_ORDER_INITIATOR', '0'), ('SPEAK_WITH_ORDER_INITIATOR_BEFORE_BOOKING', '1'),)),
+    (590, 'BookingUnit', 'CHAR', (('AGGREGATE_PARTIAL_EXECUTIONS_ON_THIS_ORDER_AND_BOOK_ONE_TRADE_PER_ORDER', '1'), ('AGGREGATE_EXECUTIONS_FOR_THIS_SYMBOL_SIDE_AND_SETTLEMENT_DATE', '2'), ('EACH_PARTIAL_EXECUTION_IS_A_BOOKABLE_UNIT', '0'),)),
+    (591, 'PreallocMethod', 'CHAR', (('PRO_RATA', '0'), ('DO_NOT_PRO_RATA_DISCUSS_FIRST', '1'),)),
+    (592, 'UnderlyingCountryOfIssue', 'COUNTRY', ()),
+    (593, 'UnderlyingStateOrProvinceOfIssue', 'STRING', ()),
+    (594, 'UnderlyingLocaleOfIssue', 'STRING', ()),
+    (595, 'UnderlyingInstrRegistry', 'STRING', ()),
+    (596, 'LegCountryOfIssue', 'COUNTRY', ()),
+    (597, 'LegStateOrProvinceOfIssue', 'STRING', ()),
+    (598, 'LegLocaleOfIssue', 'STRING', ()),
+    (599, 'LegInstrRegistry', 'STRING', ()),
+    (600, 'LegSymbol', 'STRING', ()),
+    (601, 'LegSymbolSfx', 'STRING', ()),
+    (602, 'LegSecurityID', 'STRING', ()),
+    (603, 'LegSecurityIDSource', 'STRING', ()),
+    (604, 'NoLegSecurityAltID', 'STRING', ()),
+    (605, 'LegSecurityAltID', 'STRING', ()),
+    (606, 'LegSecurityAltIDSource', 'STRING', ()),
+    (607, 'LegProduct', 'INT', ()),
+    (608, 'LegCFICode', 'STRING', ()),
+    (609, 'LegSecurityType', 'STRING', ()),
+    (610, 'LegMaturityMonthYear', 'MONTHYEAR', ()),
+    (611, 'LegMaturityDate', 'LOCALMKTDATE', ()),
+    (612, 'LegStrikePrice', 'PRICE', ()),
+    (613, 'LegOptAttribute', 'CHAR', ()),
+    (614, 'LegContractMultiplier', 'FLOAT', ()),
+    (615, 'LegCouponRate', 'PERCENTAGE', ()),
+    (616, 'LegSecurityExchange', 'EXCHANGE', ()),
+    (617, 'LegIssuer', 'STRING', ()),
+    (618, 'EncodedLegIssuerLen', 'LENGTH', ()),
+    (619, 'EncodedLegIssuer', 'DATA', ()),
+    (620, 'LegSecurityDesc', 'STRING', ()),
+    (621, 'EncodedLegSecurityDescLen', 'LENGTH', ()),
+    (622, 'EncodedLegSecurityDesc', 'DATA', ()),
+    (623, 'LegRatioQty', 'FLOAT', ()),
+    (624, 'LegSide', 'CHAR', ()),
+    (625, 'TradingSessionSubID', 'STRING', ()),
+    (626, 'AllocType', 'INT', (('BUYSIDE_READY_TO_BOOK_6', 6), ('BUYSIDE_PRELIMINARY', 2), ('SELLSIDE_CALCULATED_USING_PRELIMINARY', 3), ('BUYSIDE_READY_TO_BOOK_5', 5), ('BUYSIDE_CALCULATED', 1), ('SELLSIDE_CALCULATED_WITHOUT_PRELIMINARY', 4),)),
+    (627, 'NoHops', 'NUMINGROUP', ()),
+    (628, 'HopCompID', 'STRING', ()),
+    (629, 'HopSendingTime', 'UTCTIMESTAMP', ()),
+    (630, 'HopRefID', 'SEQNUM', ()),
+    (631, 'MidPx', 'PRICE', ()),
+    (632, 'BidYield', 'PERCENTAGE', ()),
+    (633, 'MidYield', 'PERCENTAGE', ()),
+    (634, 'OfferYield', 'PERCENTAGE', ()),
+    (635, 'ClearingFeeIndicator', 'STRING', (('_106H_AND_106J_FIRMS', 'H'), ('_5TH_YEAR_DELEGATE_TRADING_FOR_HIS_OWN_ACCOUNT', '5'), ('_4TH_YEAR_DELEGATE_TRADING_FOR_HIS_OWN_ACCOUNT', '4'), ('_3RD_YEAR_DELEGATE_TRADING_FOR_HIS_OWN_ACCOUNT', '3'), ('_2ND_YEAR_DELEGATE_TRADING_FOR_HIS_OWN_ACCOUNT', '2'), ('_1ST_YEAR_DELEGATE_TRADING_FOR_HIS_OWN_ACCOUNT', '1'), ('ALL_OTHER_OWNERSHIP_TYPES', 'M'), ('GIM_IDEM_AND_COM_MEMBERSHIP_INTEREST_HOLDERS', 'I'), ('_6TH_YEAR_AND_BEYOND_DELEGATE_TRADING_FOR_HIS_OWN_ACCOUNT', '9'), ('FULL_AND_ASSOCIATE_MEMBER_TRADING_FOR_OWN_ACCOUNT_AND_AS_FLOOR', 'F'), ('EQUITY_MEMBER_AND_CLEARING_MEMBER', 'E'), ('NON_MEMBER_AND_CUSTOMER', 'C'), ('CBOE_MEMBER', 'B'), ('LESSEE_AND_106F_EMPLOYEES', 'L'),)),
+    (636, 'WorkingIndicator', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (637, 'LegLastPx', 'PRICE', ()),
+    (638, 'PriorityIndicator', 'INT', (('PRIORITY_UNCHANGED', 0), ('LOST_PRIORITY_AS_RESULT_OF_ORDER_CHANGE', 1),)),
+    (639, 'PriceImprovement', 'PRICEOFFSET', ()),
+    (640, 'Price2', 'PRICE', ()),
+    (641, 'LastForwardPoints2', 'PRICEOFFSET', ()),
+    (642, 'BidForwardPoints2', 'PRICEOFFSET', ()),
+    (643, 'OfferForwardPoints2', 'PRICEOFFSET', ()),
+    (644, 'RFQReqID', 'STRING', ()),
+    (645, 'MktBidPx', 'PRICE', ()),
+    (646, 'MktOfferPx', 'PRICE', ()),
+    (647, 'MinBidSize', 'QTY', ()),
+    (648, 'MinOfferSize', 'QTY', ()),
+    (649, 'QuoteStatusReqID', 'STRING', ()),
+    (650, 'LegalConfirm', 'BOOLEAN', (('YES', 'Y'), ('NO', 'N'),)),
+    (651, 'UnderlyingLastPx', 'PRICE', ()),
+    (652, 'UnderlyingLastQty', 'QTY', ()),
+    (653, 'SecDefStatus', 'INT', (('REJECTED', 2), ('UNAUTHORIZED_REQUEST', 3), ('APPROVED', 1), ('PENDING_APPROVAL', 0), ('INVALID_DEFINITION_REQUEST', 4),)),
+    (654, 'LegRefID', 'STRING', ()),
+    (655, 'ContraLegRefID', 'STRING', ()),
+    (656, 'SettlCurrBidFxRate', 'FLOAT', ()),
+    (657, 'SettlCurrOfferFxRate', 'FLOAT', ()),
+    (658, 'QuoteRequestRejectReason', 'INT', (('UNKNOWN_SYMBOL', 1), ('EXCHANGE', 2), ('QUOTE_REQUEST_EXCEEDS_LIMIT', 3), ('TOO_LATE_TO_ENTER', 4), ('INVALID_PRICE', 5), ('NOT_AUTHORIZED_TO_REQUEST_QUOTE', 6),)),
+    (659, 'SideComplianceID', 'STRING', ()),
+))
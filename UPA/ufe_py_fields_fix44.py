@@ -18,5644 +18,963 @@ RECORDED OR OTHERWISE, WITHOUT THE PRIOR AND  EXPRESS WRITTEN  PERMISSION  OF  F
 TECHNOLOGIES PTY LTD.
 """
 
-# Autogenerated on 2019-09-03 12:58:11.337252
-# /home/sergey/src/f8/fix8pro/compiler/py/f8c/f8c.py --template ufe_java_fields ufe_cpp_fields ufe_cs_fields ufe_py_fields --output-dir ./generated --schema-dir /home/sergey/src/f8/fix8pro/schema/xml FIX50SP2 FIX42 FIX44 FIX40 FIX41 FIX43 FIX50 FIX50SP1
+# Autogenerated on 2026-10-18 15:52:52.800355 by fields_gen.py from ufe_py_fields_fix44.py
 # DO NOT EDIT!
-# 4 spaces instead of tab is required
 
-class FIX44_Fields:
-
-    # Account(1): STRING
-    class Account:
-        tag: int = 1
-
-    # AdvId(2): STRING
-    class AdvId:
-        tag: int = 2
-
-    # AdvRefID(3): STRING
-    class AdvRefID:
-        tag: int = 3
-
-    # AdvSide(4): CHAR
-    class AdvSide:
-        tag: int = 4
-        BUY: str = 'B'
-        SELL: str = 'S'
-        TRADE: str = 'T'
-        CROSS: str = 'X'
-
-    # AdvTransType(5): STRING
-    class AdvTransType:
-        tag: int = 5
-        ADVCANCEL: str = "C"
-        ADVNEW: str = "N"
-        ADVREPLACE: str = "R"
-
-    # AvgPx(6): PRICE
-    class AvgPx:
-        tag: int = 6
-
-    # BeginSeqNo(7): SEQNUM
-    class BeginSeqNo:
-        tag: int = 7
-
-    # BeginString(8): STRING
-    class BeginString:
-        tag: int = 8
-
-    # BodyLength(9): LENGTH
-    class BodyLength:
-        tag: int = 9
-
-    # CheckSum(10): STRING
-    class CheckSum:
-        tag: int = 10
-
-    # ClOrdID(11): STRING
-    class ClOrdID:
-        tag: int = 11
-
-    # Commission(12): AMT
-    class Commission:
-        tag: int = 12
-
-    # CommType(13): CHAR
-    class CommType:
-        tag: int = 13
-        PER_UNIT: str = '1'
-        PERCENT: str = '2'
-        ABSOLUTE: str = '3'
-        PCTWAIVEDCSHDISC: str = '4'
-        PCTWAIVEDENUNITS: str = '5'
-        PERBOND: str = '6'
-
-    # CumQty(14): QTY
-    class CumQty:
-        tag: int = 14
-
-    # Currency(15): CURRENCY
-    class Currency:
-        tag: int = 15
-
-    # EndSeqNo(16): SEQNUM
-    class EndSeqNo:
-        tag: int = 16
-
-    # ExecID(17): STRING
-    class ExecID:
-        tag: int = 17
-
-    # ExecInst(18): MULTIPLESTRINGVALUE
-    class ExecInst:
-        tag: int = 18
-        STAYOFFER: str = "0"
-        NOTHELD: str = "1"
-        WORK: str = "2"
-        GOALONG: str = "3"
-        OVERDAY: str = "4"
-        HELD: str = "5"
-        PARTNOTINIT: str = "6"
-        STRICTSCALE: str = "7"
-        TRYTOSCALE: str = "8"
-        STAYBID: str = "9"
-        NOCROSS: str = "A"
-        TRAILSTOPPEG: str = "a"
-        OKCROSS: str = "B"
-        STRICTLIMIT: str = "b"
-        IGNOREPRICECHK: str = "c"
-        CALLFIRST: str = "C"
-        PEGTOLIMIT: str = "d"
-        PERCVOL: str = "D"
-        DNI: str = "E"
-        WORKTOSTRATEGY: str = "e"
-        DNR: str = "F"
-        AON: str = "G"
-        RESTATEONSYSFAIL: str = "H"
-        INSTITONLY: str = "I"
-        RESTATEONTRADINGHALT: str = "J"
-        CANCELONTRADINGHALT: str = "K"
-        LASTPEG: str = "L"
-        MIDPRCPEG: str = "M"
-        NONNEGO: str = "N"
-        OPENPEG: str = "O"
-        MARKPEG: str = "P"
-        CANCELONSYSFAIL: str = "Q"
-        PRIMPEG: str = "R"
-        SUSPEND: str = "S"
-        CUSTDISPINST: str = "U"
-        NETTING: str = "V"
-        PEGVWAP: str = "W"
-        TRADEALONG: str = "X"
-        TRYTOSTOP: str = "Y"
-        CXLIFNOTBEST: str = "Z"
-
-    # ExecRefID(19): STRING
-    class ExecRefID:
-        tag: int = 19
-
-    # ExecTransType(20): CHAR
-    class ExecTransType:
-        tag: int = 20
-        NEW: str = '0'
-        CANCEL: str = '1'
-        CORRECT: str = '2'
-        STATUS: str = '3'
-
-    # HandlInst(21): CHAR
-    class HandlInst:
-        tag: int = 21
-        AUTOEXECPRIV: str = '1'
-        AUTOEXECPUB: str = '2'
-        MANUAL: str = '3'
-
-    # SecurityIDSource(22): STRING
-    class SecurityIDSource:
-        tag: int = 22
-        CUSIP: str = "1"
-        SEDOL: str = "2"
-        QUIK: str = "3"
-        ISIN: str = "4"
-        RIC: str = "5"
-        ISOCURR: str = "6"
-        ISOCOUNTRY: str = "7"
-        EXCHSYMB: str = "8"
-        CTA: str = "9"
-        BLMBRG: str = "A"
-        WERTPAPIER: str = "B"
-        DUTCH: str = "C"
-        VALOREN: str = "D"
-        SICOVAM: str = "E"
-        BELGIAN: str = "F"
-        COMMON: str = "G"
-        CLEARINGHOUSE: str = "H"
-        FPML: str = "I"
-        OPTIONPRICEREPORTINGAUTHORITY: str = "J"
-
-    # IOIID(23): STRING
-    class IOIID:
-        tag: int = 23
-
-    # IOIOthSvc(24): CHAR
-    class IOIOthSvc:
-        tag: int = 24
-
-    # IOIQltyInd(25): CHAR
-    class IOIQltyInd:
-        tag: int = 25
-        HIGH: str = 'H'
-        LOW: str = 'L'
-        MEDIUM: str = 'M'
-
-    # IOIRefID(26): STRING
-    class IOIRefID:
-        tag: int = 26
-
-    # IOIQty(27): STRING
-    class IOIQty:
-        tag: int = 27
-
-    # IOITransType(28): CHAR
-    class IOITransType:
-        tag: int = 28
-        CANCEL: str = 'C'
-        NEW: str = 'N'
-        REPLACE: str = 'R'
-
-    # LastCapacity(29): CHAR
-    class LastCapacity:
-        tag: int = 29
-        A: str = '1'
-        XA: str = '2'
-        XP: str = '3'
-        P: str = '4'
-
-    # LastMkt(30): EXCHANGE
-    class LastMkt:
-        tag: int = 30
-
-    # LastPx(31): PRICE
-    class LastPx:
-        tag: int = 31
-
-    # LastQty(32): QTY
-    class LastQty:
-        tag: int = 32
-
-    # NoLinesOfText(33): NUMINGROUP
-    class NoLinesOfText:
-        tag: int = 33
-
-    # MsgSeqNum(34): SEQNUM
-    class MsgSeqNum:
-        tag: int = 34
-
-    # MsgType(35): STRING
-    class MsgType:
-        tag: int = 35
-        HEARTBEAT: str = "0"
-        TESTREQUEST: str = "1"
-        RESENDREQUEST: str = "2"
-        REJECT: str = "3"
-        SEQUENCERESET: str = "4"
-        LOGOUT: str = "5"
-        IOI: str = "6"
-        ADVERTISEMENT: str = "7"
-        EXECUTIONREPORT: str = "8"
-        ORDERCANCELREJECT: str = "9"
-        QUOTESTATUSREQUEST: str = "a"
-        LOGON: str = "A"
-        DERIVATIVESECURITYLIST: str = "AA"
-        NEWORDERMULTILEG: str = "AB"
-        MULTILEGORDERCANCELREPLACE: str = "AC"
-        TRADECAPTUREREPORTREQUEST: str = "AD"
-        TRADECAPTUREREPORT: str = "AE"
-        ORDERMASSSTATUSREQUEST: str = "AF"
-        QUOTEREQUESTREJECT: str = "AG"
-        RFQREQUEST: str = "AH"
-        QUOTESTATUSREPORT: str = "AI"
-        QUOTERESPONSE: str = "AJ"
-        CONFIRMATION: str = "AK"
-        POSITIONMAINTENANCEREQUEST: str = "AL"
-        POSITIONMAINTENANCEREPORT: str = "AM"
-        REQUESTFORPOSITIONS: str = "AN"
-        REQUESTFORPOSITIONSACK: str = "AO"
-        POSITIONREPORT: str = "AP"
-        TRADECAPTUREREPORTREQUESTACK: str = "AQ"
-        TRADECAPTUREREPORTACK: str = "AR"
-        ALLOCATIONREPORT: str = "AS"
-        ALLOCATIONREPORTACK: str = "AT"
-        CONFIRMATIONACK: str = "AU"
-        SETTLEMENTINSTRUCTIONREQUEST: str = "AV"
-        ASSIGNMENTREPORT: str = "AW"
-        COLLATERALREQUEST: str = "AX"
-        COLLATERALASSIGNMENT: str = "AY"
-        COLLATERALRESPONSE: str = "AZ"
-        NEWS: str = "B"
-        MASSQUOTEACKNOWLEDGEMENT: str = "b"
-        COLLATERALREPORT: str = "BA"
-        COLLATERALINQUIRY: str = "BB"
-        NETWORKCOUNTERPARTYSYSTEMSTATUSREQUEST: str = "BC"
-        NETWORKCOUNTERPARTYSYSTEMSTATUSRESPONSE: str = "BD"
-        USERREQUEST: str = "BE"
-        USERRESPONSE: str = "BF"
-        COLLATERALINQUIRYACK: str = "BG"
-        CONFIRMATIONREQUEST: str = "BH"
-        EMAIL: str = "C"
-        SECURITYDEFINITIONREQUEST: str = "c"
-        SECURITYDEFINITION: str = "d"
-        NEWORDERSINGLE: str = "D"
-        SECURITYSTATUSREQUEST: str = "e"
-        NEWORDERLIST: str = "E"
-        ORDERCANCELREQUEST: str = "F"
-        SECURITYSTATUS: str = "f"
-        ORDERCANCELREPLACEREQUEST: str = "G"
-        TRADINGSESSIONSTATUSREQUEST: str = "g"
-        ORDERSTATUSREQUEST: str = "H"
-        TRADINGSESSIONSTATUS: str = "h"
-        MASSQUOTE: str = "i"
-        BUSINESSMESSAGEREJECT: str = "j"
-        ALLOCATIONINSTRUCTION: str = "J"
-        BIDREQUEST: str = "k"
-        LISTCANCELREQUEST: str = "K"
-        BIDRESPONSE: str = "l"
-        LISTEXECUTE: str = "L"
-        LISTSTRIKEPRICE: str = "m"
-        LISTSTATUSREQUEST: str = "M"
-        XMLNONFIX: str = "n"
-        LISTSTATUS: str = "N"
-        REGISTRATIONINSTRUCTIONS: str = "o"
-        REGISTRATIONINSTRUCTIONSRESPONSE: str = "p"
-        ALLOCATIONINSTRUCTIONACK: str = "P"
-        ORDERMASSCANCELREQUEST: str = "q"
-        DONTKNOWTRADEDK: str = "Q"
-        QUOTEREQUEST: str = "R"
-        ORDERMASSCANCELREPORT: str = "r"
-        QUOTE: str = "S"
-        NEWORDERCROSS: str = "s"
-        SETTLEMENTINSTRUCTIONS: str = "T"
-        CROSSORDERCANCELREPLACEREQUEST: str = "t"
-        CROSSORDERCANCELREQUEST: str = "u"
-        MARKETDATAREQUEST: str = "V"
-        SECURITYTYPEREQUEST: str = "v"
-        SECURITYTYPES: str = "w"
-        MARKETDATASNAPSHOTFULLREFRESH: str = "W"
-        SECURITYLISTREQUEST: str = "x"
-        MARKETDATAINCREMENTALREFRESH: str = "X"
-        MARKETDATAREQUESTREJECT: str = "Y"
-        SECURITYLIST: str = "y"
-        QUOTECANCEL: str = "Z"
-        DERIVATIVESECURITYLISTREQUEST: str = "z"
-
-    # NewSeqNo(36): SEQNUM
-    class NewSeqNo:
-        tag: int = 36
-
-    # OrderID(37): STRING
-    class OrderID:
-        tag: int = 37
-
-    # OrderQty(38): QTY
-    class OrderQty:
-        tag: int = 38
-
-    # OrdStatus(39): CHAR
-    class OrdStatus:
-        tag: int = 39
-        NEW: str = '0'
-        PARTIAL: str = '1'
-        FILLED: str = '2'
-        DONE: str = '3'
-        CANCELED: str = '4'
-        PENDING_CANCEL: str = '6'
-        STOPPED: str = '7'
-        REJECTED: str = '8'
-        SUSPENDED: str = '9'
-        PENDINGNEW: str = 'A'
-        CALCULATED: str = 'B'
-        EXPIRED: str = 'C'
-        ACCEPTBIDDING: str = 'D'
-        PENDINGREP: str = 'E'
-
-    # OrdType(40): CHAR
-    class OrdType:
-        tag: int = 40
-        MARKET: str = '1'
-        LIMIT: str = '2'
-        STOP: str = '3'
-        STOPLIMIT: str = '4'
-        MARKETONCLOSE: str = '5'
-        WITHORWITHOUT: str = '6'
-        LIMITORBETTER: str = '7'
-        LIMITWITHORWITHOUT: str = '8'
-        ONBASIS: str = '9'
-        ONCLOSE: str = 'A'
-        LIMITONCLOSE: str = 'B'
-        FOREXMARKET: str = 'C'
-        PREVIOUSLYQUOTED: str = 'D'
-        PREVIOUSLYINDICATED: str = 'E'
-        FOREXLIMIT: str = 'F'
-        FOREXSWAP: str = 'G'
-        FOREXPREVIOUSLYQUOTED: str = 'H'
-        FUNARI: str = 'I'
-        MARKETIFTOUCHED: str = 'J'
-        MARKETWITHLEFTOVERLIMIT: str = 'K'
-        PREVIOUSFUNDVALUATIONPOINT: str = 'L'
-        NEXTFUNDVALUATIONPOINT: str = 'M'
-        PEGGED: str = 'P'
-
-    # OrigClOrdID(41): STRING
-    class OrigClOrdID:
-        tag: int = 41
-
-    # OrigTime(42): UTCTIMESTAMP
-    class OrigTime:
-        tag: int = 42
-
-    # PossDupFlag(43): BOOLEAN
-    class PossDupFlag:
-        tag: int = 43
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # Price(44): PRICE
-    class Price:
-        tag: int = 44
-
-    # RefSeqNum(45): SEQNUM
-    class RefSeqNum:
-        tag: int = 45
-
-    # RelatdSym(46): STRING
-    class RelatdSym:
-        tag: int = 46
-
-    # Rule80A(47): CHAR
-    class Rule80A:
-        tag: int = 47
-        AGENCYSINGLE: str = 'A'
-        SHTEXTRANA: str = 'B'
-        PRGNONINDEXARBMEM: str = 'C'
-        PRGINDEXARBMEM: str = 'D'
-        MARKETMAKER: str = 'E'
-        SHTEXTRANW: str = 'F'
-        SHTEXTRANI: str = 'H'
-        INVINESTOR: str = 'I'
-        PRGNONINDEXARBINV: str = 'J'
-        PRGINDEXARBINV: str = 'K'
-        SHTEXTRANMEM: str = 'L'
-        PRGNONINDEXARBOTHMEM: str = 'M'
-        PRGINDEXARBOTHMEM: str = 'N'
-        COMPETINGDEALER: str = 'O'
-        PRINCIPAL: str = 'P'
-        COMPDEALER1: str = 'R'
-        SPECIALIST: str = 'S'
-        COMPDEALER2: str = 'T'
-        PRGINDEXARBOTHAGN: str = 'U'
-        ALLOTHERAGN: str = 'W'
-        SHTEXTRANMEMWT: str = 'X'
-        PRGNONINDEXARBOTHAGN: str = 'Y'
-        SHTEXTRANNONMEM: str = 'Z'
-
-    # SecurityID(48): STRING
-    class SecurityID:
-        tag: int = 48
-
-    # SenderCompID(49): STRING
-    class SenderCompID:
-        tag: int = 49
-
-    # SenderSubID(50): STRING
-    class SenderSubID:
-        tag: int = 50
-
-    # SendingDate(51): LOCALMKTDATE
-    class SendingDate:
-        tag: int = 51
-
-    # SendingTime(52): UTCTIMESTAMP
-    class SendingTime:
-        tag: int = 52
-
-    # Quantity(53): QTY
-    class Quantity:
-        tag: int = 53
-
-    # Side(54): CHAR
-    class Side:
-        tag: int = 54
-        BUY: str = '1'
-        SELL: str = '2'
-        BUYMIN: str = '3'
-        SELLPLUS: str = '4'
-        SELLSHT: str = '5'
-        SELLSHTEX: str = '6'
-        UNDISC: str = '7'
-        CROSS: str = '8'
-        CROSSSHORT: str = '9'
-        CROSSSHORTEX: str = 'A'
-        ASDEFINED: str = 'B'
-        OPPOSITE: str = 'C'
-        SUBSCRIBE: str = 'D'
-        REDEEM: str = 'E'
-        LENDFINANCING: str = 'F'
-        BORROWFINANCING: str = 'G'
-
-    # Symbol(55): STRING
-    class Symbol:
-        tag: int = 55
-
-    # TargetCompID(56): STRING
-    class TargetCompID:
-        tag: int = 56
-
-    # TargetSubID(57): STRING
-    class TargetSubID:
-        tag: int = 57
-
-    # Text(58): STRING
-    class Text:
-        tag: int = 58
-
-    # TimeInForce(59): CHAR
-    class TimeInForce:
-        tag: int = 59
-        DAY: str = '0'
-        GOODTILLCANCEL: str = '1'
-        ATTHEOPENING: str = '2'
-        IMMEDIATEORCANCEL: str = '3'
-        FILLORKILL: str = '4'
-        GOODTILLCROSSING: str = '5'
-        GOODTILLDATE: str = '6'
-        ATTHECLOSE: str = '7'
-
-    # TransactTime(60): UTCTIMESTAMP
-    class TransactTime:
-        tag: int = 60
-
-    # Urgency(61): CHAR
-    class Urgency:
-        tag: int = 61
-        NORMAL: str = '0'
-        FLASH: str = '1'
-        BACKGROUND: str = '2'
-
-    # ValidUntilTime(62): UTCTIMESTAMP
-    class ValidUntilTime:
-        tag: int = 62
-
-    # SettlType(63): CHAR
-    class SettlType:
-        tag: int = 63
-        REGULAR: str = '0'
-        CASH: str = '1'
-        NEXTDAY: str = '2'
-        T2: str = '3'
-        T3: str = '4'
-        T4: str = '5'
-        FUTURE: str = '6'
-        WHENISSUED: str = '7'
-        T5: str = '8'
-        T1: str = '9'
-
-    # SettlDate(64): LOCALMKTDATE
-    class SettlDate:
-        tag: int = 64
-
-    # SymbolSfx(65): STRING
-    class SymbolSfx:
-        tag: int = 65
-        EUCPLUMPSUMINTEREST: str = "CD"
-        WHENISSUED: str = "WI"
-
-    # ListID(66): STRING
-    class ListID:
-        tag: int = 66
-
-    # ListSeqNo(67): INT
-    class ListSeqNo:
-        tag: int = 67
-
-    # TotNoOrders(68): INT
-    class TotNoOrders:
-        tag: int = 68
-
-    # ListExecInst(69): STRING
-    class ListExecInst:
-        tag: int = 69
-
-    # AllocID(70): STRING
-    class AllocID:
-        tag: int = 70
-
-    # AllocTransType(71): CHAR
-    class AllocTransType:
-        tag: int = 71
-        NEW: str = '0'
-        REPLACE: str = '1'
-        CANCEL: str = '2'
-        PRELIMINARY: str = '3'
-        CALCULATED: str = '4'
-        CALCULATEDWITHOUTPRELIMINARY: str = '5'
-
-    # RefAllocID(72): STRING
-    class RefAllocID:
-        tag: int = 72
-
-    # NoOrders(73): NUMINGROUP
-    class NoOrders:
-        tag: int = 73
-
-    # AvgPxPrecision(74): INT
-    class AvgPxPrecision:
-        tag: int = 74
-
-    # TradeDate(75): LOCALMKTDATE
-    class TradeDate:
-        tag: int = 75
-
-    # ExecBroker(76): STRING
-    class ExecBroker:
-        tag: int = 76
-
-    # PositionEffect(77): CHAR
-    class PositionEffect:
-        tag: int = 77
-        CLOSE: str = 'C'
-        FIFO: str = 'F'
-        OPEN: str = 'O'
-        ROLLED: str = 'R'
-
-    # NoAllocs(78): NUMINGROUP
-    class NoAllocs:
-        tag: int = 78
-
-    # AllocAccount(79): STRING
-    class AllocAccount:
-        tag: int = 79
-
-    # AllocQty(80): QTY
-    class AllocQty:
-        tag: int = 80
-
-    # ProcessCode(81): CHAR
-    class ProcessCode:
-        tag: int = 81
-        REGULAR: str = '0'
-        SOFTDOLLAR: str = '1'
-        STEPIN: str = '2'
-        STEPOUT: str = '3'
-        STEPINSOFT: str = '4'
-        STEPOUTSOFT: str = '5'
-        PLANSPONSOR: str = '6'
-
-    # NoRpts(82): INT
-    class NoRpts:
-        tag: int = 82
-
-    # RptSeq(83): INT
-    class RptSeq:
-        tag: int = 83
-
-    # CxlQty(84): QTY
-    class CxlQty:
-        tag: int = 84
-
-    # NoDlvyInst(85): NUMINGROUP
-    class NoDlvyInst:
-        tag: int = 85
-
-    # DlvyInst(86): STRING
-    class DlvyInst:
-        tag: int = 86
-
-    # AllocStatus(87): INT
-    class AllocStatus:
-        tag: int = 87
-        ACCEPTEDSUCCESSFULLYPROCESSED: int = 0
-        BLOCKLEVELREJECT: int = 1
-        ACCOUNTLEVELREJECT: int = 2
-        RECEIVEDRECEIVEDNOTYETPROCESSED: int = 3
-        INCOMPLETE: int = 4
-        REJECTEDBYINTERMEDIARY: int = 5
-
-    # AllocRejCode(88): INT
-    class AllocRejCode:
-        tag: int = 88
-        UNKNOWNACCT: int = 0
-        INCORRECTQTY: int = 1
-        UNKNOWNORSTALEEXECID: int = 10
-        MISMATCHEDDATA: int = 11
-        UNKNOWNCLORDID: int = 12
-        WAREHOUSEREQUESTREJECTED: int = 13
-        INCORRECTAVGPRC: int = 2
-        INCORRECTBRKMNC: int = 3
-        COMMDIFF: int = 4
-        UNKNOWNORDID: int = 5
-        UNKNOWNLISTID: int = 6
-        OTHER: int = 7
-        INCORRECTALLOCATEDQUANTITY: int = 8
-        CALCULATIONDIFFERENCE: int = 9
-
-    # Signature(89): DATA
-    class Signature:
-        tag: int = 89
-
-    # SecureDataLen(90): LENGTH
-    class SecureDataLen:
-        tag: int = 90
-
-    # SecureData(91): DATA
-    class SecureData:
-        tag: int = 91
-
-    # BrokerOfCredit(92): STRING
-    class BrokerOfCredit:
-        tag: int = 92
-
-    # SignatureLength(93): LENGTH
-    class SignatureLength:
-        tag: int = 93
-
-    # EmailType(94): CHAR
-    class EmailType:
-        tag: int = 94
-        NEW: str = '0'
-        REPLY: str = '1'
-        ADMINREPLY: str = '2'
-
-    # RawDataLength(95): LENGTH
-    class RawDataLength:
-        tag: int = 95
-
-    # RawData(96): DATA
-    class RawData:
-        tag: int = 96
-
-    # PossResend(97): BOOLEAN
-    class PossResend:
-        tag: int = 97
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # EncryptMethod(98): INT
-    class EncryptMethod:
-        tag: int = 98
-        NONEOTHER: int = 0
-        PKCSPROPRIETARY: int = 1
-        DESECBMODE: int = 2
-        PKCSDESPROPRIETARY: int = 3
-        PGPDESDEFUNCT: int = 4
-        PGPDESMD5SEEAPPNOTEONFIXWEBSITE: int = 5
-        PEMDESMD5SEEAPPNOTEONFIXWEBSITENAFORFIXMLNOTUSED: int = 6
-
-    # StopPx(99): PRICE
-    class StopPx:
-        tag: int = 99
-
-    # ExDestination(100): EXCHANGE
-    class ExDestination:
-        tag: int = 100
-
-    # CxlRejReason(102): INT
-    class CxlRejReason:
-        tag: int = 102
-        TOOLATE: int = 0
-        UNKNOWN: int = 1
-        BROKEROPT: int = 2
-        ALREADYPENDINGCXL: int = 3
-        UNABLETOPROCESS: int = 4
-        ORIGORDMODTIMEMISMATCH: int = 5
-        DUPCLORDID: int = 6
-        OTHER: int = 99
-
-    # OrdRejReason(103): INT
-    class OrdRejReason:
-        tag: int = 103
-        BROKEROPT: int = 0
-        UNKNOWNSYM: int = 1
-        INVINVID: int = 10
-        UNSUPPORDERCHAR: int = 11
-        SURVEILLENCE: int = 12
-        INCORRECTQUANTITY: int = 13
-        INCORRECTALLOCATEDQUANTITY: int = 14
-        UNKNOWNACCOUNTS: int = 15
-        EXCHCLOSED: int = 2
-        EXCEEDSLIM: int = 3
-        TOOLATE: int = 4
-        UNKNOWN: int = 5
-        DUPLICATE: int = 6
-        DUPLICATEVERBAL: int = 7
-        STALE: int = 8
-        TRADEALONGREQ: int = 9
-        OTHER: int = 99
-
-    # IOIQualifier(104): CHAR
-    class IOIQualifier:
-        tag: int = 104
-        AON: str = 'A'
-        MOC: str = 'B'
-        ATCLOSE: str = 'C'
-        VWAP: str = 'D'
-        INTOUCH: str = 'I'
-        LIMIT: str = 'L'
-        MOREBEHIND: str = 'M'
-        ATOPEN: str = 'O'
-        TAKEPOSITION: str = 'P'
-        ATMARKET: str = 'Q'
-        READYTRADE: str = 'R'
-        PORTSHOW: str = 'S'
-        THROUGHDAY: str = 'T'
-        VERSUS: str = 'V'
-        INDWRKAWAY: str = 'W'
-        CROSSOPP: str = 'X'
-        ATMID: str = 'Y'
-        PREOPEN: str = 'Z'
-
-    # WaveNo(105): STRING
-    class WaveNo:
-        tag: int = 105
-
-    # Issuer(106): STRING
-    class Issuer:
-        tag: int = 106
-
-    # SecurityDesc(107): STRING
-    class SecurityDesc:
-        tag: int = 107
-
-    # HeartBtInt(108): INT
-    class HeartBtInt:
-        tag: int = 108
-
-    # ClientID(109): STRING
-    class ClientID:
-        tag: int = 109
-
-    # MinQty(110): QTY
-    class MinQty:
-        tag: int = 110
-
-    # MaxFloor(111): QTY
-    class MaxFloor:
-        tag: int = 111
-
-    # TestReqID(112): STRING
-    class TestReqID:
-        tag: int = 112
-
-    # ReportToExch(113): BOOLEAN
-    class ReportToExch:
-        tag: int = 113
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # LocateReqd(114): BOOLEAN
-    class LocateReqd:
-        tag: int = 114
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # OnBehalfOfCompID(115): STRING
-    class OnBehalfOfCompID:
-        tag: int = 115
-
-    # OnBehalfOfSubID(116): STRING
-    class OnBehalfOfSubID:
-        tag: int = 116
-
-    # QuoteID(117): STRING
-    class QuoteID:
-        tag: int = 117
-
-    # NetMoney(118): AMT
-    class NetMoney:
-        tag: int = 118
-
-    # SettlCurrAmt(119): AMT
-    class SettlCurrAmt:
-        tag: int = 119
-
-    # SettlCurrency(120): CURRENCY
-    class SettlCurrency:
-        tag: int = 120
-
-    # ForexReq(121): BOOLEAN
-    class ForexReq:
-        tag: int = 121
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # OrigSendingTime(122): UTCTIMESTAMP
-    class OrigSendingTime:
-        tag: int = 122
-
-    # GapFillFlag(123): BOOLEAN
-    class GapFillFlag:
-        tag: int = 123
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # NoExecs(124): NUMINGROUP
-    class NoExecs:
-        tag: int = 124
-
-    # CxlType(125): CHAR
-    class CxlType:
-        tag: int = 125
-
-    # ExpireTime(126): UTCTIMESTAMP
-    class ExpireTime:
-        tag: int = 126
-
-    # DKReason(127): CHAR
-    class DKReason:
-        tag: int = 127
-        UNKNOWNSYMBOL: str = 'A'
-        WRONGSIDE: str = 'B'
-        QUANTITYEXCEEDSORDER: str = 'C'
-        NOMATCH: str = 'D'
-        PRICEEXCEEDSLIMIT: str = 'E'
-        CALCULATIONDIFFERENCE: str = 'F'
-        OTHER: str = 'Z'
-
-    # DeliverToCompID(128): STRING
-    class DeliverToCompID:
-        tag: int = 128
-
-    # DeliverToSubID(129): STRING
-    class DeliverToSubID:
-        tag: int = 129
-
-    # IOINaturalFlag(130): BOOLEAN
-    class IOINaturalFlag:
-        tag: int = 130
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # QuoteReqID(131): STRING
-    class QuoteReqID:
-        tag: int = 131
-
-    # BidPx(132): PRICE
-    class BidPx:
-        tag: int = 132
-
-    # OfferPx(133): PRICE
-    class OfferPx:
-        tag: int = 133
-
-    # BidSize(134): QTY
-    class BidSize:
-        tag: int = 134
-
-    # OfferSize(135): QTY
-    class OfferSize:
-        tag: int = 135
-
-    # NoMiscFees(136): NUMINGROUP
-    class NoMiscFees:
-        tag: int = 136
-
-    # MiscFeeAmt(137): AMT
-    class MiscFeeAmt:
-        tag: int = 137
-
-    # MiscFeeCurr(138): CURRENCY
-    class MiscFeeCurr:
-        tag: int = 138
-
-    # MiscFeeType(139): STRING
-    class MiscFeeType:
-        tag: int = 139
-        REG: str = "1"
-        TRANSACTION: str = "10"
-        CONVERSION: str = "11"
-        AGENT: str = "12"
-        TAX: str = "2"
-        LOCALCOMM: str = "3"
-        EXCHFEE: str = "4"
-        STAMP: str = "5"
-        LEVY: str = "6"
-        OTHER: str = "7"
-        MARKUP: str = "8"
-        CONSUMPTION: str = "9"
-
-    # PrevClosePx(140): PRICE
-    class PrevClosePx:
-        tag: int = 140
-
-    # ResetSeqNumFlag(141): BOOLEAN
-    class ResetSeqNumFlag:
-        tag: int = 141
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # SenderLocationID(142): STRING
-    class SenderLocationID:
-        tag: int = 142
-
-    # TargetLocationID(143): STRING
-    class TargetLocationID:
-        tag: int = 143
-
-    # OnBehalfOfLocationID(144): STRING
-    class OnBehalfOfLocationID:
-        tag: int = 144
-
-    # DeliverToLocationID(145): STRING
-    class DeliverToLocationID:
-        tag: int = 145
-
-    # NoRelatedSym(146): NUMINGROUP
-    class NoRelatedSym:
-        tag: int = 146
-
-    # Subject(147): STRING
-    class Subject:
-        tag: int = 147
-
-    # Headline(148): STRING
-    class Headline:
-        tag: int = 148
-
-    # URLLink(149): STRING
-    class URLLink:
-        tag: int = 149
-
-    # ExecType(150): CHAR
-    class ExecType:
-        tag: int = 150
-        NEW: str = '0'
-        DONE: str = '3'
-        CANCELED: str = '4'
-        REPLACED: str = '5'
-        PENDINGCXL: str = '6'
-        STOPPED: str = '7'
-        REJECTED: str = '8'
-        SUSPENDED: str = '9'
-        PENDINGNEW: str = 'A'
-        CALCULATED: str = 'B'
-        EXPIRED: str = 'C'
-        RESTATED: str = 'D'
-        PENDINGREPLACE: str = 'E'
-        TRADE: str = 'F'
-        TRADECORRECT: str = 'G'
-        TRADECANCEL: str = 'H'
-        ORDERSTATUS: str = 'I'
-
-    # LeavesQty(151): QTY
-    class LeavesQty:
-        tag: int = 151
-
-    # CashOrderQty(152): QTY
-    class CashOrderQty:
-        tag: int = 152
-
-    # AllocAvgPx(153): PRICE
-    class AllocAvgPx:
-        tag: int = 153
-
-    # AllocNetMoney(154): AMT
-    class AllocNetMoney:
-        tag: int = 154
-
-    # SettlCurrFxRate(155): FLOAT
-    class SettlCurrFxRate:
-        tag: int = 155
-
-    # SettlCurrFxRateCalc(156): CHAR
-    class SettlCurrFxRateCalc:
-        tag: int = 156
-        MULTIPLY: str = 'M'
-        DIVIDE: str = 'D'
-
-    # NumDaysInterest(157): INT
-    class NumDaysInterest:
-        tag: int = 157
-
-    # AccruedInterestRate(158): PERCENTAGE
-    class AccruedInterestRate:
-        tag: int = 158
-
-    # AccruedInterestAmt(159): AMT
-    class AccruedInterestAmt:
-        tag: int = 159
-
-    # SettlInstMode(160): CHAR
-    class SettlInstMode:
-        tag: int = 160
-        DEFAULT: str = '0'
-        SIPROVIDED: str = '1'
-        ACCOUNTOVERRIDING: str = '2'
-        ACCOUNTSTANDING: str = '3'
-        CIVORDERSINGLEACCT: str = '4'
-        REJECT: str = '5'
-
-    # AllocText(161): STRING
-    class AllocText:
-        tag: int = 161
-
-    # SettlInstID(162): STRING
-    class SettlInstID:
-        tag: int = 162
-
-    # SettlInstTransType(163): CHAR
-    class SettlInstTransType:
-        tag: int = 163
-        CANCEL: str = 'C'
-        NEW: str = 'N'
-        REPLACE: str = 'R'
-        RESTATE: str = 'T'
-
-    # EmailThreadID(164): STRING
-    class EmailThreadID:
-        tag: int = 164
-
-    # SettlInstSource(165): CHAR
-    class SettlInstSource:
-        tag: int = 165
-        BROKERINSTR: str = '1'
-        INSTINSTR: str = '2'
-        INVESTORCIV: str = '3'
-
-    # SettlLocation(166): STRING
-    class SettlLocation:
-        tag: int = 166
-        CEDEL: str = "CED"
-        DEPOSITORYTRUSTCOMPANY: str = "DTC"
-        EUROCLEAR: str = "EUR"
-        FEDERALBOOKENTRY: str = "FED"
-        LOCALMARKETSETTLELOCATION: str = "ISO_Country_Code"
-        PHYSICAL: str = "PNY"
-        PARTICIPANTTRUSTCOMPANY: str = "PTC"
-
-    # SecurityType(167): STRING
-    class SecurityType:
-        tag: int = 167
-        ASSETBACKEDSECURITIES: str = "ABS"
-        AMENDEDRESTATED: str = "AMENDED"
-        OTHERANTICIPATIONNOTESBANGANETC: str = "AN"
-        BANKERSACCEPTANCE: str = "BA"
-        BANKNOTES: str = "BN"
-        BILLOFEXCHANGES: str = "BOX"
-        BRADYBOND: str = "BRADY"
-        BRIDGELOAN: str = "BRIDGE"
-        BUYSELLBACK: str = "BUYSELL"
-        CONVERTIBLEBOND: str = "CB"
-        CERTIFICATEOFDEPOSIT: str = "CD"
-        CALLLOANS: str = "CL"
-        CORPMORTGAGEBACKEDSECURITIES: str = "CMBS"
-        COLLATERALIZEDMORTGAGEOBLIGATION: str = "CMO"
-        CERTIFICATEOFOBLIGATION: str = "COFO"
-        CERTIFICATEOFPARTICIPATION: str = "COFP"
-        CORPORATEBOND: str = "CORP"
-        COMMERCIALPAPER: str = "CP"
-        CORPORATEPRIVATEPLACEMENT: str = "CPP"
-        COMMONSTOCK: str = "CS"
-        DEFAULTED: str = "DEFLTED"
-        DEBTORINPOSSESSION: str = "DINP"
-        DEPOSITNOTES: str = "DN"
-        DUALCURRENCY: str = "DUAL"
-        EUROCERTIFICATEOFDEPOSIT: str = "EUCD"
-        EUROCORPORATEBOND: str = "EUCORP"
-        EUROCOMMERCIALPAPER: str = "EUCP"
-        EUROSOVEREIGNS: str = "EUSOV"
-        EUROSUPRANATIONALCOUPONS: str = "EUSUPRA"
-        FEDERALAGENCYCOUPON: str = "FAC"
-        FEDERALAGENCYDISCOUNTNOTE: str = "FADN"
-        FOREIGNEXCHANGECONTRACT: str = "FOR"
-        FORWARD: str = "FORWARD"
-        FUTURE: str = "FUT"
-        GENERALOBLIGATIONBONDS: str = "GO"
-        IOETTEMORTGAGE: str = "IET"
-        LETTEROFCREDIT: str = "LOFC"
-        LIQUIDITYNOTE: str = "LQN"
-        MATURED: str = "MATURED"
-        MORTGAGEBACKEDSECURITIES: str = "MBS"
-        MUTUALFUND: str = "MF"
-        MORTGAGEINTERESTONLY: str = "MIO"
-        MULTILEGINSTRUMENT: str = "MLEG"
-        MORTGAGEPRINCIPALONLY: str = "MPO"
-        MORTGAGEPRIVATEPLACEMENT: str = "MPP"
-        MISCELLANEOUSPASSTHROUGH: str = "MPT"
-        MANDATORYTENDER: str = "MT"
-        MEDIUMTERMNOTES: str = "MTN"
-        NOSECURITYTYPE: str = "NONE"
-        OVERNIGHT: str = "ONITE"
-        OPTION: str = "OPT"
-        PRIVATEEXPORTFUNDING: str = "PEF"
-        PFANDBRIEFE: str = "PFAND"
-        PROMISSORYNOTE: str = "PN"
-        PREFERREDSTOCK: str = "PS"
-        PLAZOSFIJOS: str = "PZFJ"
-        REVENUEANTICIPATIONNOTE: str = "RAN"
-        REPLACED: str = "REPLACD"
-        REPURCHASE: str = "REPO"
-        RETIRED: str = "RETIRED"
-        REVENUEBONDS: str = "REV"
-        REVOLVERLOAN: str = "RVLV"
-        REVOLVERTERMLOAN: str = "RVLVTRM"
-        SECURITIESLOAN: str = "SECLOAN"
-        SECURITIESPLEDGE: str = "SECPLEDGE"
-        SPECIALASSESSMENT: str = "SPCLA"
-        SPECIALOBLIGATION: str = "SPCLO"
-        SPECIALTAX: str = "SPCLT"
-        SHORTTERMLOANNOTE: str = "STN"
-        STRUCTUREDNOTES: str = "STRUCT"
-        USDSUPRANATIONALCOUPONS: str = "SUPRA"
-        SWINGLINEFACILITY: str = "SWING"
-        TAXANTICIPATIONNOTE: str = "TAN"
-        TAXALLOCATION: str = "TAXA"
-        TOBEANNOUNCED: str = "TBA"
-        USTREASURYBILL: str = "TBILL"
-        USTREASURYBOND: str = "TBOND"
-        PRINCIPALSTRIPOFACALLABLEBONDORNOTE: str = "TCAL"
-        TIMEDEPOSIT: str = "TD"
-        TAXEXEMPTCOMMERCIALPAPER: str = "TECP"
-        TERMLOAN: str = "TERM"
-        INTERESTSTRIPFROMANYBONDORNOTE: str = "TINT"
-        TREASURYINFLATIONPROTECTEDSECURITIES: str = "TIPS"
-        USTREASURYNOTE: str = "TNOTE"
-        PRINCIPALSTRIPFROMANONCALLABLEBONDORNOTE: str = "TPRN"
-        TAXREVENUEANTICIPATIONNOTE: str = "TRAN"
-        USTREASURYNOTEDEPRECATEDVALUEUSETNOTE: str = "UST"
-        USTREASURYBILLDEPRECATEDVALUEUSETBILL: str = "USTB"
-        VARIABLERATEDEMANDNOTE: str = "VRDN"
-        WARRANT: str = "WAR"
-        WITHDRAWN: str = "WITHDRN"
-        WILDCARDENTRY: str = "WLD"
-        EXTENDEDCOMMNOTE: str = "XCN"
-        INDEXEDLINKED: str = "XLINKD"
-        YANKEECORPORATEBOND: str = "YANK"
-        YANKEECERTIFICATEOFDEPOSIT: str = "YCD"
-
-    # EffectiveTime(168): UTCTIMESTAMP
-    class EffectiveTime:
-        tag: int = 168
-
-    # StandInstDbType(169): INT
-    class StandInstDbType:
-        tag: int = 169
-        OTHER: int = 0
-        SID: int = 1
-        ALERT: int = 2
-        CUSTODIAN: int = 3
-        ACCOUNTNET: int = 4
-
-    # StandInstDbName(170): STRING
-    class StandInstDbName:
-        tag: int = 170
-
-    # StandInstDbID(171): STRING
-    class StandInstDbID:
-        tag: int = 171
-
-    # SettlDeliveryType(172): INT
-    class SettlDeliveryType:
-        tag: int = 172
-
-    # SettlDepositoryCode(173): STRING
-    class SettlDepositoryCode:
-        tag: int = 173
-
-    # SettlBrkrCode(174): STRING
-    class SettlBrkrCode:
-        tag: int = 174
-
-    # SettlInstCode(175): STRING
-    class SettlInstCode:
-        tag: int = 175
-
-    # SecuritySettlAgentName(176): STRING
-    class SecuritySettlAgentName:
-        tag: int = 176
-
-    # SecuritySettlAgentCode(177): STRING
-    class SecuritySettlAgentCode:
-        tag: int = 177
-
-    # SecuritySettlAgentAcctNum(178): STRING
-    class SecuritySettlAgentAcctNum:
-        tag: int = 178
-
-    # SecuritySettlAgentAcctName(179): STRING
-    class SecuritySettlAgentAcctName:
-        tag: int = 179
-
-    # SecuritySettlAgentContactName(180): STRING
-    class SecuritySettlAgentContactName:
-        tag: int = 180
-
-    # SecuritySettlAgentContactPhone(181): STRING
-    class SecuritySettlAgentContactPhone:
-        tag: int = 181
-
-    # CashSettlAgentName(182): STRING
-    class CashSettlAgentName:
-        tag: int = 182
-
-    # CashSettlAgentCode(183): STRING
-    class CashSettlAgentCode:
-        tag: int = 183
-
-    # CashSettlAgentAcctNum(184): STRING
-    class CashSettlAgentAcctNum:
-        tag: int = 184
-
-    # CashSettlAgentAcctName(185): STRING
-    class CashSettlAgentAcctName:
-        tag: int = 185
-
-    # CashSettlAgentContactName(186): STRING
-    class CashSettlAgentContactName:
-        tag: int = 186
-
-    # CashSettlAgentContactPhone(187): STRING
-    class CashSettlAgentContactPhone:
-        tag: int = 187
-
-    # BidSpotRate(188): PRICE
-    class BidSpotRate:
-        tag: int = 188
-
-    # BidForwardPoints(189): PRICEOFFSET
-    class BidForwardPoints:
-        tag: int = 189
-
-    # OfferSpotRate(190): PRICE
-    class OfferSpotRate:
-        tag: int = 190
-
-    # OfferForwardPoints(191): PRICEOFFSET
-    class OfferForwardPoints:
-        tag: int = 191
-
-    # OrderQty2(192): QTY
-    class OrderQty2:
-        tag: int = 192
-
-    # SettlDate2(193): LOCALMKTDATE
-    class SettlDate2:
-        tag: int = 193
-
-    # LastSpotRate(194): PRICE
-    class LastSpotRate:
-        tag: int = 194
-
-    # LastForwardPoints(195): PRICEOFFSET
-    class LastForwardPoints:
-        tag: int = 195
-
-    # AllocLinkID(196): STRING
-    class AllocLinkID:
-        tag: int = 196
-
-    # AllocLinkType(197): INT
-    class AllocLinkType:
-        tag: int = 197
-        FXNETTING: int = 0
-        FXSWAP: int = 1
-
-    # SecondaryOrderID(198): STRING
-    class SecondaryOrderID:
-        tag: int = 198
-
-    # NoIOIQualifiers(199): NUMINGROUP
-    class NoIOIQualifiers:
-        tag: int = 199
-
-    # MaturityMonthYear(200): MONTHYEAR
-    class MaturityMonthYear:
-        tag: int = 200
-
-    # PutOrCall(201): INT
-    class PutOrCall:
-        tag: int = 201
-        PUT: int = 0
-        CALL: int = 1
-
-    # StrikePrice(202): PRICE
-    class StrikePrice:
-        tag: int = 202
-
-    # CoveredOrUncovered(203): INT
-    class CoveredOrUncovered:
-        tag: int = 203
-        COVERED: int = 0
-        UNCOVERED: int = 1
-
-    # CustomerOrFirm(204): INT
-    class CustomerOrFirm:
-        tag: int = 204
-        CUSTOMER: int = 0
-        FIRM: int = 1
-
-    # MaturityDay(205): DAYOFMONTH
-    class MaturityDay:
-        tag: int = 205
-
-    # OptAttribute(206): CHAR
-    class OptAttribute:
-        tag: int = 206
-
-    # SecurityExchange(207): EXCHANGE
-    class SecurityExchange:
-        tag: int = 207
-
-    # NotifyBrokerOfCredit(208): BOOLEAN
-    class NotifyBrokerOfCredit:
-        tag: int = 208
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # AllocHandlInst(209): INT
-    class AllocHandlInst:
-        tag: int = 209
-        MATCH: int = 1
-        FORWARD: int = 2
-        FORWARDMATCH: int = 3
-
-    # MaxShow(210): QTY
-    class MaxShow:
-        tag: int = 210
-
-    # PegOffsetValue(211): FLOAT
-    class PegOffsetValue:
-        tag: int = 211
-
-    # XmlDataLen(212): LENGTH
-    class XmlDataLen:
-        tag: int = 212
-
-    # XmlData(213): DATA
-    class XmlData:
-        tag: int = 213
-
-    # SettlInstRefID(214): STRING
-    class SettlInstRefID:
-        tag: int = 214
-
-    # NoRoutingIDs(215): NUMINGROUP
-    class NoRoutingIDs:
-        tag: int = 215
-
-    # RoutingType(216): INT
-    class RoutingType:
-        tag: int = 216
-        TARGETFIRM: int = 1
-        TARGETLIST: int = 2
-        BLOCKFIRM: int = 3
-        BLOCKLIST: int = 4
-
-    # RoutingID(217): STRING
-    class RoutingID:
-        tag: int = 217
-
-    # Spread(218): PRICEOFFSET
-    class Spread:
-        tag: int = 218
-
-    # Benchmark(219): CHAR
-    class Benchmark:
-        tag: int = 219
-        CURVE: str = '1'
-        _5YR: str = '2'
-        OLD5: str = '3'
-        _10YR: str = '4'
-        OLD10: str = '5'
-        _30YR: str = '6'
-        OLD30: str = '7'
-        _3MOLIBOR: str = '8'
-        _6MOLIBOR: str = '9'
-
-    # BenchmarkCurveCurrency(220): CURRENCY
-    class BenchmarkCurveCurrency:
-        tag: int = 220
-
-    # BenchmarkCurveName(221): STRING
-    class BenchmarkCurveName:
-        tag: int = 221
-        EONIA: str = "EONIA"
-        EUREPO: str = "EUREPO"
-        EURIBOR: str = "Euribor"
-        FUTURESWAP: str = "FutureSWAP"
-        LIBID: str = "LIBID"
-        LIBOR: str = "LIBOR"
-        MUNIAAA: str = "MuniAAA"
-        OTHER: str = "OTHER"
-        PFANDBRIEFE: str = "Pfandbriefe"
-        SONIA: str = "SONIA"
-        SWAP: str = "SWAP"
-        TREASURY: str = "Treasury"
-
-    # BenchmarkCurvePoint(222): STRING
-    class BenchmarkCurvePoint:
-        tag: int = 222
-
-    # CouponRate(223): PERCENTAGE
-    class CouponRate:
-        tag: int = 223
-
-    # CouponPaymentDate(224): LOCALMKTDATE
-    class CouponPaymentDate:
-        tag: int = 224
-
-    # IssueDate(225): LOCALMKTDATE
-    class IssueDate:
-        tag: int = 225
-
-    # RepurchaseTerm(226): INT
-    class RepurchaseTerm:
-        tag: int = 226
-
-    # RepurchaseRate(227): PERCENTAGE
-    class RepurchaseRate:
-        tag: int = 227
-
-    # Factor(228): FLOAT
-    class Factor:
-        tag: int = 228
-
-    # TradeOriginationDate(229): LOCALMKTDATE
-    class TradeOriginationDate:
-        tag: int = 229
-
-    # ExDate(230): LOCALMKTDATE
-    class ExDate:
-        tag: int = 230
-
-    # ContractMultiplier(231): FLOAT
-    class ContractMultiplier:
-        tag: int = 231
-
-    # NoStipulations(232): NUMINGROUP
-    class NoStipulations:
-        tag: int = 232
-
-    # StipulationType(233): STRING
-    class StipulationType:
-        tag: int = 233
-        ABSOLUTEPREPAYMENTSPEED: str = "ABS"
-        AMT: str = "AMT"
-        AUTOREINVESTMENTATRATEORBETTER: str = "AUTOREINV"
-        BANKQUALIFIED: str = "BANKQUAL"
-        BARGAINCONDITIONS: str = "BGNCON"
-        COUPONRANGE: str = "COUPON"
-        CONSTANTPREPAYMENTPENALTY: str = "CPP"
-        CONSTANTPREPAYMENTRATE: str = "CPR"
-        CONSTANTPREPAYMENTYIELD: str = "CPY"
-        ISOCURRENCYCODE: str = "CURRENCY"
-        CUSTOMSTARTENDDATE: str = "CUSTOMDATE"
-        GEOGRAPHICSANDRANGE: str = "GEOG"
-        VALUATIONDISCOUNT: str = "HAIRCUT"
-        FINALCPROFHOMEEQUITYPREPAYMENTCURVE: str = "HEP"
-        INSURED: str = "INSURED"
-        YEARORYEARMONTHOFISSUE: str = "ISSUE"
-        ISSUERSTICKER: str = "ISSUER"
-        ISSUESIZERANGE: str = "ISSUESIZE"
-        LOOKBACKDAYS: str = "LOOKBACK"
-        EXPLICITLOTIDENTIFIER: str = "LOT"
-        LOTVARIANCEVALUEINPERCENTMAXIMUMOVERORUNDERALLOCATIONALLOWED: str = "LOTVAR"
-        MATURITYYEARANDMONTH: str = "MAT"
-        MATURITYRANGE: str = "MATURITY"
-        MAXIMUMDENOMINATION: str = "MAXDNOM"
-        MAXIMUMSUBSTITUTIONSREPO: str = "MAXSUBS"
-        PERCENTOFMANUFACTUREDHOUSINGPREPAYMENTCURVE: str = "MHP"
-        MINIMUMDENOMINATION: str = "MINDNOM"
-        MINIMUMINCREMENT: str = "MININCR"
-        MINIMUMQUANTITY: str = "MINQTY"
-        MONTHLYPREPAYMENTRATE: str = "MPR"
-        PAYMENTFREQUENCYCALENDAR: str = "PAYFREQ"
-        NUMBEROFPIECES: str = "PIECES"
-        POOLSMAXIMUM: str = "PMAX"
-        POOLSMINIMUM: str = "PMIN"
-        PERCENTOFPROSPECTUSPREPAYMENTCURVE: str = "PPC"
-        POOLSPERLOT: str = "PPL"
-        POOLSPERMILLION: str = "PPM"
-        POOLSPERTRADE: str = "PPT"
-        PRICERANGE: str = "PRICE"
-        PRICINGFREQUENCY: str = "PRICEFREQ"
-        PRODUCTIONYEAR: str = "PROD"
-        CALLPROTECTION: str = "PROTECT"
-        PERCENTOFBMAPREPAYMENTCURVE: str = "PSA"
-        PURPOSE: str = "PURPOSE"
-        BENCHMARKPRICESOURCE: str = "PXSOURCE"
-        RATINGSOURCEANDRANGE: str = "RATING"
-        TYPEOFREDEMPTIONVALUESARE: str = "REDEMPTION"
-        RESTRICTED: str = "RESTRICTED"
-        MARKETSECTOR: str = "SECTOR"
-        SECURITYTYPEINCLUDEDOREXCLUDED: str = "SECTYPE"
-        SINGLEMONTHLYMORTALITY: str = "SMM"
-        STRUCTURE: str = "STRUCT"
-        SUBSTITUTIONSFREQUENCYREPO: str = "SUBSFREQ"
-        SUBSTITUTIONSLEFTREPO: str = "SUBSLEFT"
-        FREEFORMTEXT: str = "TEXT"
-        TRADEVARIANCEVALUEINPERCENTMAXIMUMOVERORUNDERALLOCATIONALLOWED: str = "TRDVAR"
-        WEIGHTEDAVERAGECOUPON: str = "WAC"
-        WEIGHTEDAVERAGELIFECOUPON: str = "WAL"
-        WEIGHTEDAVERAGELOANAGE: str = "WALA"
-        WEIGHTEDAVERAGEMATURITY: str = "WAM"
-        WHOLEPOOL: str = "WHOLE"
-        YIELDRANGE: str = "YIELD"
-
-    # StipulationValue(234): STRING
-    class StipulationValue:
-        tag: int = 234
-
-    # YieldType(235): STRING
-    class YieldType:
-        tag: int = 235
-        AFTERTAXYIELD: str = "AFTERTAX"
-        ANNUALYIELD: str = "ANNUAL"
-        YIELDATISSUE: str = "ATISSUE"
-        YIELDTOAVGMATURITY: str = "AVGMATURITY"
-        BOOKYIELD: str = "BOOK"
-        YIELDTONEXTCALL: str = "CALL"
-        YIELDCHANGESINCECLOSE: str = "CHANGE"
-        CLOSINGYIELD: str = "CLOSE"
-        COMPOUNDYIELD: str = "COMPOUND"
-        CURRENTYIELD: str = "CURRENT"
-        GVNTEQUIVALENTYIELD: str = "GOVTEQUIV"
-        TRUEGROSSYIELD: str = "GROSS"
-        YIELDINFLATIONASSUMPTION: str = "INFLATION"
-        INVFLOATERBONDYIELD: str = "INVERSEFLOATER"
-        MOSTRECENTCLOSINGYIELD: str = "LASTCLOSE"
-        CLOSINGYIELDMOSTRECENTMONTH: str = "LASTMONTH"
-        CLOSINGYIELDMOSTRECENTQUARTER: str = "LASTQUARTER"
-        CLOSINGYIELDMOSTRECENTYEAR: str = "LASTYEAR"
-        YIELDTOLONGESTAVERAGELIFE: str = "LONGAVGLIFE"
-        MARKTOMARKETYIELD: str = "MARK"
-        YIELDTOMATURITY: str = "MATURITY"
-        YIELDTONEXTREFUNDSINKING: str = "NEXTREFUND"
-        OPENAVERAGEYIELD: str = "OPENAVG"
-        PREVIOUSCLOSEYIELD: str = "PREVCLOSE"
-        PROCEEDSYIELD: str = "PROCEEDS"
-        YIELDTONEXTPUT: str = "PUT"
-        SEMI: str = "SEMIANNUAL"
-        YIELDTOSHORTESTAVERAGELIFE: str = "SHORTAVGLIFE"
-        SIMPLEYIELD: str = "SIMPLE"
-        TAXEQUIVALENTYIELD: str = "TAXEQUIV"
-        YIELDTOTENDERDATE: str = "TENDER"
-        TRUEYIELD: str = "TRUE"
-        YIELDVALUEOF132: str = "VALUE1_32"
-        YIELDTOWORSTCONVENTION: str = "WORST"
-
-    # Yield(236): PERCENTAGE
-    class Yield:
-        tag: int = 236
-
-    # TotalTakedown(237): AMT
-    class TotalTakedown:
-        tag: int = 237
-
-    # Concession(238): AMT
-    class Concession:
-        tag: int = 238
-
-    # RepoCollateralSecurityType(239): INT
-    class RepoCollateralSecurityType:
-        tag: int = 239
-
-    # RedemptionDate(240): LOCALMKTDATE
-    class RedemptionDate:
-        tag: int = 240
-
-    # UnderlyingCouponPaymentDate(241): LOCALMKTDATE
-    class UnderlyingCouponPaymentDate:
-        tag: int = 241
-
-    # UnderlyingIssueDate(242): LOCALMKTDATE
-    class UnderlyingIssueDate:
-        tag: int = 242
-
-    # UnderlyingRepoCollateralSecurityType(243): INT
-    class UnderlyingRepoCollateralSecurityType:
-        tag: int = 243
-
-    # UnderlyingRepurchaseTerm(244): INT
-    class UnderlyingRepurchaseTerm:
-        tag: int = 244
-
-    # UnderlyingRepurchaseRate(245): PERCENTAGE
-    class UnderlyingRepurchaseRate:
-        tag: int = 245
-
-    # UnderlyingFactor(246): FLOAT
-    class UnderlyingFactor:
-        tag: int = 246
-
-    # UnderlyingRedemptionDate(247): LOCALMKTDATE
-    class UnderlyingRedemptionDate:
-        tag: int = 247
-
-    # LegCouponPaymentDate(248): LOCALMKTDATE
-    class LegCouponPaymentDate:
-        tag: int = 248
-
-    # LegIssueDate(249): LOCALMKTDATE
-    class LegIssueDate:
-        tag: int = 249
-
-    # LegRepoCollateralSecurityType(250): INT
-    class LegRepoCollateralSecurityType:
-        tag: int = 250
-
-    # LegRepurchaseTerm(251): INT
-    class LegRepurchaseTerm:
-        tag: int = 251
-
-    # LegRepurchaseRate(252): PERCENTAGE
-    class LegRepurchaseRate:
-        tag: int = 252
-
-    # LegFactor(253): FLOAT
-    class LegFactor:
-        tag: int = 253
-
-    # LegRedemptionDate(254): LOCALMKTDATE
-    class LegRedemptionDate:
-        tag: int = 254
-
-    # CreditRating(255): STRING
-    class CreditRating:
-        tag: int = 255
-
-    # UnderlyingCreditRating(256): STRING
-    class UnderlyingCreditRating:
-        tag: int = 256
-
-    # LegCreditRating(257): STRING
-    class LegCreditRating:
-        tag: int = 257
-
-    # TradedFlatSwitch(258): BOOLEAN
-    class TradedFlatSwitch:
-        tag: int = 258
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # BasisFeatureDate(259): LOCALMKTDATE
-    class BasisFeatureDate:
-        tag: int = 259
-
-    # BasisFeaturePrice(260): PRICE
-    class BasisFeaturePrice:
-        tag: int = 260
-
-    # MDReqID(262): STRING
-    class MDReqID:
-        tag: int = 262
-
-    # SubscriptionRequestType(263): CHAR
-    class SubscriptionRequestType:
-        tag: int = 263
-        SNAPSHOT: str = '0'
-        SNAPSHOTUPDATE: str = '1'
-        UNSUBSCRIBE: str = '2'
-
-    # MarketDepth(264): INT
-    class MarketDepth:
-        tag: int = 264
-
-    # MDUpdateType(265): INT
-    class MDUpdateType:
-        tag: int = 265
-        FULL: int = 0
-        INCREMENTAL: int = 1
-
-    # AggregatedBook(266): BOOLEAN
-    class AggregatedBook:
-        tag: int = 266
-
-    # NoMDEntryTypes(267): NUMINGROUP
-    class NoMDEntryTypes:
-        tag: int = 267
-
-    # NoMDEntries(268): NUMINGROUP
-    class NoMDEntries:
-        tag: int = 268
-
-    # MDEntryType(269): CHAR
-    class MDEntryType:
-        tag: int = 269
-        BID: str = '0'
-        OFFER: str = '1'
-        TRADE: str = '2'
-        INDEXVALUE: str = '3'
-        OPENING: str = '4'
-        CLOSING: str = '5'
-        SETTLEMENT: str = '6'
-        TRADINGHIGH: str = '7'
-        TRADINGLOW: str = '8'
-        TRADINGVWAP: str = '9'
-        IMBALANCE: str = 'A'
-        TRADEVOLUME: str = 'B'
-        OPENINTEREST: str = 'C'
-
-    # MDEntryPx(270): PRICE
-    class MDEntryPx:
-        tag: int = 270
-
-    # MDEntrySize(271): QTY
-    class MDEntrySize:
-        tag: int = 271
-
-    # MDEntryDate(272): UTCDATEONLY
-    class MDEntryDate:
-        tag: int = 272
-
-    # MDEntryTime(273): UTCTIMEONLY
-    class MDEntryTime:
-        tag: int = 273
-
-    # TickDirection(274): CHAR
-    class TickDirection:
-        tag: int = 274
-        PLUS: str = '0'
-        ZEROPLUS: str = '1'
-        MINUS: str = '2'
-        ZEROMINUS: str = '3'
-
-    # MDMkt(275): EXCHANGE
-    class MDMkt:
-        tag: int = 275
-
-    # QuoteCondition(276): MULTIPLESTRINGVALUE
-    class QuoteCondition:
-        tag: int = 276
-        OPEN: str = "A"
-        CLOSED: str = "B"
-        EXCHBEST: str = "C"
-        CONSOLBEST: str = "D"
-        LOCKED: str = "E"
-        CROSSED: str = "F"
-        DEPTH: str = "G"
-        FAST: str = "H"
-        NONFIRM: str = "I"
-
-    # TradeCondition(277): MULTIPLESTRINGVALUE
-    class TradeCondition:
-        tag: int = 277
-        CASHMKT: str = "A"
-        AVGPX: str = "B"
-        CASHTRADE: str = "C"
-        NEXTDAY_D: str = "D"
-        OPENING: str = "E"
-        INTRADAY: str = "F"
-        RULE127: str = "G"
-        RULE155: str = "H"
-        SOLDLAST: str = "I"
-        NEXTDAY_J: str = "J"
-        OPENED: str = "K"
-        SELLER: str = "L"
-        SOLD: str = "M"
-        STOPPED: str = "N"
-        IMBALANCEMOREBUYERS: str = "P"
-        IMBALANCEMORESELLERS: str = "Q"
-        OPENINGPRICE: str = "R"
-
-    # MDEntryID(278): STRING
-    class MDEntryID:
-        tag: int = 278
-
-    # MDUpdateAction(279): CHAR
-    class MDUpdateAction:
-        tag: int = 279
-        NEW: str = '0'
-        CHANGE: str = '1'
-        DELETE: str = '2'
-
-    # MDEntryRefID(280): STRING
-    class MDEntryRefID:
-        tag: int = 280
-
-    # MDReqRejReason(281): CHAR
-    class MDReqRejReason:
-        tag: int = 281
-        UNKNOWNSYM: str = '0'
-        DUPID: str = '1'
-        INSBAND: str = '2'
-        INSPERM: str = '3'
-        UNSUPPSUB: str = '4'
-        UNSUPPMKTDEPTH: str = '5'
-        UNSUPPMDUPDATE: str = '6'
-        UNSUPPAGGBK: str = '7'
-        UNSUPPENTRY: str = '8'
-        UNSUPPTRDSESSIONID: str = '9'
-        UNSUPPSCOPE: str = 'A'
-        UNSUPPPOSITIONEFFECTSETTLEFLAG: str = 'B'
-        UNSUPPMDIMPLICITDELETE: str = 'C'
-
-    # MDEntryOriginator(282): STRING
-    class MDEntryOriginator:
-        tag: int = 282
-
-    # LocationID(283): STRING
-    class LocationID:
-        tag: int = 283
-
-    # DeskID(284): STRING
-    class DeskID:
-        tag: int = 284
-
-    # DeleteReason(285): CHAR
-    class DeleteReason:
-        tag: int = 285
-        CANCELTRADEBUST: str = '0'
-        ERROR: str = '1'
-
-    # OpenCloseSettlFlag(286): MULTIPLESTRINGVALUE
-    class OpenCloseSettlFlag:
-        tag: int = 286
-        DAILYOPEN: str = "0"
-        SESSIONOPEN: str = "1"
-        DELIVERYSETTLEMENT: str = "2"
-        EXPECTEDENTRY: str = "3"
-        ENTRYFROMPREVBUSINESSDAY: str = "4"
-        THEORETICALPRICE: str = "5"
-
-    # SellerDays(287): INT
-    class SellerDays:
-        tag: int = 287
-
-    # MDEntryBuyer(288): STRING
-    class MDEntryBuyer:
-        tag: int = 288
-
-    # MDEntrySeller(289): STRING
-    class MDEntrySeller:
-        tag: int = 289
-
-    # MDEntryPositionNo(290): INT
-    class MDEntryPositionNo:
-        tag: int = 290
-
-    # FinancialStatus(291): MULTIPLESTRINGVALUE
-    class FinancialStatus:
-        tag: int = 291
-        BANKRUPT: str = "1"
-        PENDINGDELISTING: str = "2"
-
-    # CorporateAction(292): MULTIPLESTRINGVALUE
-    class CorporateAction:
-        tag: int = 292
-        EXDIVIDEND: str = "A"
-        EXDIST: str = "B"
-        EXRIGHTS: str = "C"
-        NEW: str = "D"
-        EXINTEREST: str = "E"
-
-    # DefBidSize(293): QTY
-    class DefBidSize:
-        tag: int = 293
-
-    # DefOfferSize(294): QTY
-    class DefOfferSize:
-        tag: int = 294
-
-    # NoQuoteEntries(295): NUMINGROUP
-    class NoQuoteEntries:
-        tag: int = 295
-
-    # NoQuoteSets(296): NUMINGROUP
-    class NoQuoteSets:
-        tag: int = 296
-
-    # QuoteStatus(297): INT
-    class QuoteStatus:
-        tag: int = 297
-        ACCPT: int = 0
-        CXLSYM: int = 1
-        PENDING: int = 10
-        PASS: int = 11
-        LOCKEDMARKETWARNING: int = 12
-        CROSSMARKETWARNING: int = 13
-        CANCELEDDUETOLOCKMARKET: int = 14
-        CANCELEDDUETOCROSSMARKET: int = 15
-        CXLSECTYPE: int = 2
-        CXLUNDER: int = 3
-        CXLALL: int = 4
-        REJ: int = 5
-        REMOVED: int = 6
-        EXPIRED: int = 7
-        QUERY: int = 8
-        QUOTENOTFOUND: int = 9
-
-    # QuoteCancelType(298): INT
-    class QuoteCancelType:
-        tag: int = 298
-        CXLSYM: int = 1
-        CXLSECTYPE: int = 2
-        CXLUNDER: int = 3
-        CXLALL: int = 4
-
-    # QuoteEntryID(299): STRING
-    class QuoteEntryID:
-        tag: int = 299
-
-    # QuoteRejectReason(300): INT
-    class QuoteRejectReason:
-        tag: int = 300
-        UNKNSYM: int = 1
-        EXCHCLSD: int = 2
-        ORDEXLIM: int = 3
-        TOOLATE: int = 4
-        UNKNORD: int = 5
-        DUPORD: int = 6
-        INVSPREAD: int = 7
-        INVPX: int = 8
-        NOTAUTH: int = 9
-        OTHER: int = 99
-
-    # QuoteResponseLevel(301): INT
-    class QuoteResponseLevel:
-        tag: int = 301
-        NOACK: int = 0
-        ACKNEG: int = 1
-        ACKEACH: int = 2
-
-    # QuoteSetID(302): STRING
-    class QuoteSetID:
-        tag: int = 302
-
-    # QuoteRequestType(303): INT
-    class QuoteRequestType:
-        tag: int = 303
-        MAN: int = 1
-        AUTO: int = 2
-
-    # TotNoQuoteEntries(304): INT
-    class TotNoQuoteEntries:
-        tag: int = 304
-
-    # UnderlyingSecurityIDSource(305): STRING
-    class UnderlyingSecurityIDSource:
-        tag: int = 305
-
-    # UnderlyingIssuer(306): STRING
-    class UnderlyingIssuer:
-        tag: int = 306
-
-    # UnderlyingSecurityDesc(307): STRING
-    class UnderlyingSecurityDesc:
-        tag: int = 307
-
-    # UnderlyingSecurityExchange(308): EXCHANGE
-    class UnderlyingSecurityExchange:
-        tag: int = 308
-
-    # UnderlyingSecurityID(309): STRING
-    class UnderlyingSecurityID:
-        tag: int = 309
-
-    # UnderlyingSecurityType(310): STRING
-    class UnderlyingSecurityType:
-        tag: int = 310
-
-    # UnderlyingSymbol(311): STRING
-    class UnderlyingSymbol:
-        tag: int = 311
-
-    # UnderlyingSymbolSfx(312): STRING
-    class UnderlyingSymbolSfx:
-        tag: int = 312
-
-    # UnderlyingMaturityMonthYear(313): MONTHYEAR
-    class UnderlyingMaturityMonthYear:
-        tag: int = 313
-
-    # UnderlyingMaturityDay(314): DAYOFMONTH
-    class UnderlyingMaturityDay:
-        tag: int = 314
-
-    # UnderlyingPutOrCall(315): INT
-    class UnderlyingPutOrCall:
-        tag: int = 315
-
-    # UnderlyingStrikePrice(316): PRICE
-    class UnderlyingStrikePrice:
-        tag: int = 316
-
-    # UnderlyingOptAttribute(317): CHAR
-    class UnderlyingOptAttribute:
-        tag: int = 317
-
-    # UnderlyingCurrency(318): CURRENCY
-    class UnderlyingCurrency:
-        tag: int = 318
-
-    # RatioQty(319): QTY
-    class RatioQty:
-        tag: int = 319
-
-    # SecurityReqID(320): STRING
-    class SecurityReqID:
-        tag: int = 320
-
-    # SecurityRequestType(321): INT
-    class SecurityRequestType:
-        tag: int = 321
-        REQSECID: int = 0
-        REQSECIDPROV: int = 1
-        REQSECLISTTYPES: int = 2
-        REQSECLIST: int = 3
-
-    # SecurityResponseID(322): STRING
-    class SecurityResponseID:
-        tag: int = 322
-
-    # SecurityResponseType(323): INT
-    class SecurityResponseType:
-        tag: int = 323
-        ACCPTSECPROP: int = 1
-        ACCPTSECPROPREV: int = 2
-        SECLISTTYPESRET: int = 3
-        SECLISTRET: int = 4
-        REJSECPROP: int = 5
-        NOMATCH: int = 6
-
-    # SecurityStatusReqID(324): STRING
-    class SecurityStatusReqID:
-        tag: int = 324
-
-    # UnsolicitedIndicator(325): BOOLEAN
-    class UnsolicitedIndicator:
-        tag: int = 325
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # SecurityTradingStatus(326): INT
-    class SecurityTradingStatus:
-        tag: int = 326
-        OPENDELAY: int = 1
-        MKTONCLSIMBSELL: int = 10
-        NA: int = 11
-        NOMKTIMB: int = 12
-        NOMKTONCLSIMB: int = 13
-        ITSPREOPN: int = 14
-        NEWPXIND: int = 15
-        TRDDISTIME: int = 16
-        READY: int = 17
-        NOTAVAIL: int = 18
-        NOTTRADED: int = 19
-        TRDHALT: int = 2
-        UNKNOWN: int = 20
-        PRE_OPEN: int = 21
-        OPENINGROTATION: int = 22
-        FASTMARKET: int = 23
-        RESUME: int = 3
-        NOOPEN: int = 4
-        PXIND: int = 5
-        TRDRNGIND: int = 6
-        MKTIMBBUY: int = 7
-        MKTBALSELL: int = 8
-        MKTONCLSIMBBUY: int = 9
-
-    # HaltReasonChar(327): CHAR
-    class HaltReasonChar:
-        tag: int = 327
-        NEWSDISS: str = 'D'
-        ORDINFL: str = 'E'
-        ORDIMB: str = 'I'
-        ADDINFO: str = 'M'
-        NEWSPEND: str = 'P'
-        EQUIPCHANGE: str = 'X'
-
-    # InViewOfCommon(328): BOOLEAN
-    class InViewOfCommon:
-        tag: int = 328
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # DueToRelated(329): BOOLEAN
-    class DueToRelated:
-        tag: int = 329
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # BuyVolume(330): QTY
-    class BuyVolume:
-        tag: int = 330
-
-    # SellVolume(331): QTY
-    class SellVolume:
-        tag: int = 331
-
-    # HighPx(332): PRICE
-    class HighPx:
-        tag: int = 332
-
-    # LowPx(333): PRICE
-    class LowPx:
-        tag: int = 333
-
-    # Adjustment(334): INT
-    class Adjustment:
-        tag: int = 334
-        CANCEL: int = 1
-        ERROR: int = 2
-        CORRECTION: int = 3
-
-    # TradSesReqID(335): STRING
-    class TradSesReqID:
-        tag: int = 335
-
-    # TradingSessionID(336): STRING
-    class TradingSessionID:
-        tag: int = 336
-
-    # ContraTrader(337): STRING
-    class ContraTrader:
-        tag: int = 337
-
-    # TradSesMethod(338): INT
-    class TradSesMethod:
-        tag: int = 338
-        ELECTRONIC: int = 1
-        OPENOUTCRY: int = 2
-        TWOPARTY: int = 3
-
-    # TradSesMode(339): INT
-    class TradSesMode:
-        tag: int = 339
-        TESTING: int = 1
-        SIMULATED: int = 2
-        PRODUCTION: int = 3
-
-    # TradSesStatus(340): INT
-    class TradSesStatus:
-        tag: int = 340
-        UNKNOWN: int = 0
-        HALTED: int = 1
-        OPEN: int = 2
-        CLOSED: int = 3
-        PREOPEN: int = 4
-        PRECLOSE: int = 5
-        REQREJ: int = 6
-
-    # TradSesStartTime(341): UTCTIMESTAMP
-    class TradSesStartTime:
-        tag: int = 341
-
-    # TradSesOpenTime(342): UTCTIMESTAMP
-    class TradSesOpenTime:
-        tag: int = 342
-
-    # TradSesPreCloseTime(343): UTCTIMESTAMP
-    class TradSesPreCloseTime:
-        tag: int = 343
-
-    # TradSesCloseTime(344): UTCTIMESTAMP
-    class TradSesCloseTime:
-        tag: int = 344
-
-    # TradSesEndTime(345): UTCTIMESTAMP
-    class TradSesEndTime:
-        tag: int = 345
-
-    # NumberOfOrders(346): INT
-    class NumberOfOrders:
-        tag: int = 346
-
-    # MessageEncoding(347): STRING
-    class MessageEncoding:
-        tag: int = 347
-
-    # EncodedIssuerLen(348): LENGTH
-    class EncodedIssuerLen:
-        tag: int = 348
-
-    # EncodedIssuer(349): DATA
-    class EncodedIssuer:
-        tag: int = 349
-
-    # EncodedSecurityDescLen(350): LENGTH
-    class EncodedSecurityDescLen:
-        tag: int = 350
-
-    # EncodedSecurityDesc(351): DATA
-    class EncodedSecurityDesc:
-        tag: int = 351
-
-    # EncodedListExecInstLen(352): LENGTH
-    class EncodedListExecInstLen:
-        tag: int = 352
-
-    # EncodedListExecInst(353): DATA
-    class EncodedListExecInst:
-        tag: int = 353
-
-    # EncodedTextLen(354): LENGTH
-    class EncodedTextLen:
-        tag: int = 354
-
-    # EncodedText(355): DATA
-    class EncodedText:
-        tag: int = 355
-
-    # EncodedSubjectLen(356): LENGTH
-    class EncodedSubjectLen:
-        tag: int = 356
-
-    # EncodedSubject(357): DATA
-    class EncodedSubject:
-        tag: int = 357
-
-    # EncodedHeadlineLen(358): LENGTH
-    class EncodedHeadlineLen:
-        tag: int = 358
-
-    # EncodedHeadline(359): DATA
-    class EncodedHeadline:
-        tag: int = 359
-
-    # EncodedAllocTextLen(360): LENGTH
-    class EncodedAllocTextLen:
-        tag: int = 360
-
-    # EncodedAllocText(361): DATA
-    class EncodedAllocText:
-        tag: int = 361
-
-    # EncodedUnderlyingIssuerLen(362): LENGTH
-    class EncodedUnderlyingIssuerLen:
-        tag: int = 362
-
-    # EncodedUnderlyingIssuer(363): DATA
-    class EncodedUnderlyingIssuer:
-        tag: int = 363
-
-    # EncodedUnderlyingSecurityDescLen(364): LENGTH
-    class EncodedUnderlyingSecurityDescLen:
-        tag: int = 364
-
-    # EncodedUnderlyingSecurityDesc(365): DATA
-    class EncodedUnderlyingSecurityDesc:
-        tag: int = 365
-
-    # AllocPrice(366): PRICE
-    class AllocPrice:
-        tag: int = 366
-
-    # QuoteSetValidUntilTime(367): UTCTIMESTAMP
-    class QuoteSetValidUntilTime:
-        tag: int = 367
-
-    # QuoteEntryRejectReason(368): INT
-    class QuoteEntryRejectReason:
-        tag: int = 368
-        UNKNWNSYM: int = 1
-        EXCHCLSD: int = 2
-        ORDEXCLIM: int = 3
-        TOOLATE: int = 4
-        UNKNORD: int = 5
-        DUPORD: int = 6
-        INVBIDASK: int = 7
-        INVPX: int = 8
-        NOTAUTH: int = 9
-        OTHER: int = 99
-
-    # LastMsgSeqNumProcessed(369): SEQNUM
-    class LastMsgSeqNumProcessed:
-        tag: int = 369
-
-    # OnBehalfOfSendingTime(370): UTCTIMESTAMP
-    class OnBehalfOfSendingTime:
-        tag: int = 370
-
-    # RefTagID(371): INT
-    class RefTagID:
-        tag: int = 371
-
-    # RefMsgType(372): STRING
-    class RefMsgType:
-        tag: int = 372
-
-    # SessionRejectReason(373): INT
-    class SessionRejectReason:
-        tag: int = 373
-        INVALIDTAGNUMBER: int = 0
-        REQUIREDTAGMISSING: int = 1
-        SENDINGTIMEACCURACYPROBLEM: int = 10
-        INVALIDMSGTYPE: int = 11
-        XMLVALIDATIONERROR: int = 12
-        TAGAPPEARSMORETHANONCE: int = 13
-        TAGSPECIFIEDOUTOFREQUIREDORDER: int = 14
-        REPEATINGGROUPFIELDSOUTOFORDER: int = 15
-        INCORRECTNUMINGROUPCOUNTFORREPEATINGGROUP: int = 16
-        NONDATAVALUEINCLUDESFIELDDELIMITERSOHCHARACTER: int = 17
-        TAGNOTDEFINEDFORTHISMESSAGETYPE: int = 2
-        UNDEFINEDTAG: int = 3
-        TAGSPECIFIEDWITHOUTAVALUE: int = 4
-        VALUEISINCORRECTOUTOFRANGEFORTHISTAG: int = 5
-        INCORRECTDATAFORMATFORVALUE: int = 6
-        DECRYPTIONPROBLEM: int = 7
-        SIGNATUREPROBLEM: int = 8
-        COMPIDPROBLEM: int = 9
-        OTHER: int = 99
-
-    # BidRequestTransType(374): CHAR
-    class BidRequestTransType:
-        tag: int = 374
-        CANCEL: str = 'C'
-        NO: str = 'N'
-
-    # ContraBroker(375): STRING
-    class ContraBroker:
-        tag: int = 375
-
-    # ComplianceID(376): STRING
-    class ComplianceID:
-        tag: int = 376
-
-    # SolicitedFlag(377): BOOLEAN
-    class SolicitedFlag:
-        tag: int = 377
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # ExecRestatementReason(378): INT
-    class ExecRestatementReason:
-        tag: int = 378
-        GTCORPACT: int = 0
-        GTRENEW: int = 1
-        WAREHOUSERECAP: int = 10
-        VERBAL: int = 2
-        REPX: int = 3
-        BRKROPT: int = 4
-        PARTDEC: int = 5
-        CXLTRADINGHALT: int = 6
-        CXLSYSTEMFAILURE: int = 7
-        MRKTOPTION: int = 8
-        CANCELEDNOTBEST: int = 9
-        OTHER: int = 99
-
-    # BusinessRejectRefID(379): STRING
-    class BusinessRejectRefID:
-        tag: int = 379
-
-    # BusinessRejectReason(380): INT
-    class BusinessRejectReason:
-        tag: int = 380
-        OTHER: int = 0
-        UNKNID: int = 1
-        UNKNSEC: int = 2
-        UNKNMSGTYPE: int = 3
-        APPNA: int = 4
-        CONDFLDMISS: int = 5
-        NOTAUTH: int = 6
-        NODELIVTOFIRM: int = 7
-
-    # GrossTradeAmt(381): AMT
-    class GrossTradeAmt:
-        tag: int = 381
-
-    # NoContraBrokers(382): NUMINGROUP
-    class NoContraBrokers:
-        tag: int = 382
-
-    # MaxMessageSize(383): LENGTH
-    class MaxMessageSize:
-        tag: int = 383
-
-    # NoMsgTypes(384): NUMINGROUP
-    class NoMsgTypes:
-        tag: int = 384
-
-    # MsgDirection(385): CHAR
-    class MsgDirection:
-        tag: int = 385
-        RECEIVE: str = 'R'
-        SEND: str = 'S'
-
-    # NoTradingSessions(386): NUMINGROUP
-    class NoTradingSessions:
-        tag: int = 386
-
-    # TotalVolumeTraded(387): QTY
-    class TotalVolumeTraded:
-        tag: int = 387
-
-    # DiscretionInst(388): CHAR
-    class DiscretionInst:
-        tag: int = 388
-        RELDISPPX: str = '0'
-        RELMKTPX: str = '1'
-        RELPRIMPX: str = '2'
-        RELLOCPRIMPX: str = '3'
-        RELMIDPX: str = '4'
-        RELLSTPX: str = '5'
-        RELVWAP: str = '6'
-
-    # DiscretionOffsetValue(389): FLOAT
-    class DiscretionOffsetValue:
-        tag: int = 389
-
-    # BidID(390): STRING
-    class BidID:
-        tag: int = 390
-
-    # ClientBidID(391): STRING
-    class ClientBidID:
-        tag: int = 391
-
-    # ListName(392): STRING
-    class ListName:
-        tag: int = 392
-
-    # TotNoRelatedSym(393): INT
-    class TotNoRelatedSym:
-        tag: int = 393
-
-    # BidType(394): INT
-    class BidType:
-        tag: int = 394
-        NONDISC: int = 1
-        DISC: int = 2
-        NOBID: int = 3
-
-    # NumTickets(395): INT
-    class NumTickets:
-        tag: int = 395
-
-    # SideValue1(396): AMT
-    class SideValue1:
-        tag: int = 396
-
-    # SideValue2(397): AMT
-    class SideValue2:
-        tag: int = 397
-
-    # NoBidDescriptors(398): NUMINGROUP
-    class NoBidDescriptors:
-        tag: int = 398
-
-    # BidDescriptorType(399): INT
-    class BidDescriptorType:
-        tag: int = 399
-        SECTOR: int = 1
-        COUNTRY: int = 2
-        INDEX: int = 3
-
-    # BidDescriptor(400): STRING
-    class BidDescriptor:
-        tag: int = 400
-
-    # SideValueInd(401): INT
-    class SideValueInd:
-        tag: int = 401
-        SIDEVALUE1: int = 1
-        SIDEVALUE2: int = 2
-
-    # LiquidityPctLow(402): PERCENTAGE
-    class LiquidityPctLow:
-        tag: int = 402
-
-    # LiquidityPctHigh(403): PERCENTAGE
-    class LiquidityPctHigh:
-        tag: int = 403
-
-    # LiquidityValue(404): AMT
-    class LiquidityValue:
-        tag: int = 404
-
-    # EFPTrackingError(405): PERCENTAGE
-    class EFPTrackingError:
-        tag: int = 405
-
-    # FairValue(406): AMT
-    class FairValue:
-        tag: int = 406
-
-    # OutsideIndexPct(407): PERCENTAGE
-    class OutsideIndexPct:
-        tag: int = 407
-
-    # ValueOfFutures(408): AMT
-    class ValueOfFutures:
-        tag: int = 408
-
-    # LiquidityIndType(409): INT
-    class LiquidityIndType:
-        tag: int = 409
-        _5DAY: int = 1
-        _20DAY: int = 2
-        NORMAL: int = 3
-        OTHER: int = 4
-
-    # WtAverageLiquidity(410): PERCENTAGE
-    class WtAverageLiquidity:
-        tag: int = 410
-
-    # ExchangeForPhysical(411): BOOLEAN
-    class ExchangeForPhysical:
-        tag: int = 411
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # OutMainCntryUIndex(412): AMT
-    class OutMainCntryUIndex:
-        tag: int = 412
-
-    # CrossPercent(413): PERCENTAGE
-    class CrossPercent:
-        tag: int = 413
-
-    # ProgRptReqs(414): INT
-    class ProgRptReqs:
-        tag: int = 414
-        BUYSIDE: int = 1
-        SELLSIDE: int = 2
-        REALTIME: int = 3
-
-    # ProgPeriodInterval(415): INT
-    class ProgPeriodInterval:
-        tag: int = 415
-
-    # IncTaxInd(416): INT
-    class IncTaxInd:
-        tag: int = 416
-        NET: int = 1
-        GROSS: int = 2
-
-    # NumBidders(417): INT
-    class NumBidders:
-        tag: int = 417
-
-    # BidTradeType(418): CHAR
-    class BidTradeType:
-        tag: int = 418
-        AGENCY: str = 'A'
-        VWAPGUARANTEE: str = 'G'
-        GUARANTEEDCLOSE: str = 'J'
-        RISKTRADE: str = 'R'
-
-    # BasisPxType(419): CHAR
-    class BasisPxType:
-        tag: int = 419
-        CLSPXMORN: str = '2'
-        CLSPX: str = '3'
-        CURRPX: str = '4'
-        SQ: str = '5'
-        VWAPDAY: str = '6'
-        VWAPMORN: str = '7'
-        VWAPAFT: str = '8'
-        VWAPDAYXYORI: str = '9'
-        VWAPMORNXYORI: str = 'A'
-        VWAPAFTXYORI: str = 'B'
-        STRIKE: str = 'C'
-        OPEN: str = 'D'
-        OTHERS: str = 'Z'
-
-    # NoBidComponents(420): NUMINGROUP
-    class NoBidComponents:
-        tag: int = 420
-
-    # Country(421): COUNTRY
-    class Country:
-        tag: int = 421
-
-    # TotNoStrikes(422): INT
-    class TotNoStrikes:
-        tag: int = 422
-
-    # PriceType(423): INT
-    class PriceType:
-        tag: int = 423
-        PCT: int = 1
-        FIXEDCABINETTRADEPRICE: int = 10
-        VARIABLECABINETTRADEPRICE: int = 11
-        CPS: int = 2
-        ABS: int = 3
-        DISCOUNT: int = 4
-        PREMIUM: int = 5
-        SPREAD: int = 6
-        TEDPRICE: int = 7
-        TEDYIELD: int = 8
-        YIELD: int = 9
-
-    # DayOrderQty(424): QTY
-    class DayOrderQty:
-        tag: int = 424
-
-    # DayCumQty(425): QTY
-    class DayCumQty:
-        tag: int = 425
-
-    # DayAvgPx(426): PRICE
-    class DayAvgPx:
-        tag: int = 426
-
-    # GTBookingInst(427): INT
-    class GTBookingInst:
-        tag: int = 427
-        BOOKALL: int = 0
-        ACCUMUNTILFILL: int = 1
-        ACCUMUNTILNOTIFY: int = 2
-
-    # NoStrikes(428): NUMINGROUP
-    class NoStrikes:
-        tag: int = 428
-
-    # ListStatusType(429): INT
-    class ListStatusType:
-        tag: int = 429
-        ACK: int = 1
-        RESP: int = 2
-        TIMED: int = 3
-        EXECSTART: int = 4
-        ALLDONE: int = 5
-        ALERT: int = 6
-
-    # NetGrossInd(430): INT
-    class NetGrossInd:
-        tag: int = 430
-        NET: int = 1
-        GROSS: int = 2
-
-    # ListOrderStatus(431): INT
-    class ListOrderStatus:
-        tag: int = 431
-        INBIDPROC: int = 1
-        RECVFOREXEC: int = 2
-        EXEC: int = 3
-        CXL: int = 4
-        ALERT: int = 5
-        ALLDONE: int = 6
-        REJ: int = 7
-
-    # ExpireDate(432): LOCALMKTDATE
-    class ExpireDate:
-        tag: int = 432
-
-    # ListExecInstType(433): CHAR
-    class ListExecInstType:
-        tag: int = 433
-        IMMED: str = '1'
-        WAIT: str = '2'
-        EXCHCIVSELL: str = '3'
-        EXCHCIVBUYTOP: str = '4'
-        EXCHCIVBUYWD: str = '5'
-
-    # CxlRejResponseTo(434): CHAR
-    class CxlRejResponseTo:
-        tag: int = 434
-        ORDCXLREQ: str = '1'
-        ORDCXLREPREQ: str = '2'
-
-    # UnderlyingCouponRate(435): PERCENTAGE
-    class UnderlyingCouponRate:
-        tag: int = 435
-
-    # UnderlyingContractMultiplier(436): FLOAT
-    class UnderlyingContractMultiplier:
-        tag: int = 436
-
-    # ContraTradeQty(437): QTY
-    class ContraTradeQty:
-        tag: int = 437
-
-    # ContraTradeTime(438): UTCTIMESTAMP
-    class ContraTradeTime:
-        tag: int = 438
-
-    # ClearingFirm(439): STRING
-    class ClearingFirm:
-        tag: int = 439
-
-    # ClearingAccount(440): STRING
-    class ClearingAccount:
-        tag: int = 440
-
-    # LiquidityNumSecurities(441): INT
-    class LiquidityNumSecurities:
-        tag: int = 441
-
-    # MultiLegReportingType(442): CHAR
-    class MultiLegReportingType:
-        tag: int = 442
-        SINGLE: str = '1'
-        INDIVLEG: str = '2'
-        MULTILEG: str = '3'
-
-    # StrikeTime(443): UTCTIMESTAMP
-    class StrikeTime:
-        tag: int = 443
-
-    # ListStatusText(444): STRING
-    class ListStatusText:
-        tag: int = 444
-
-    # EncodedListStatusTextLen(445): LENGTH
-    class EncodedListStatusTextLen:
-        tag: int = 445
-
-    # EncodedListStatusText(446): DATA
-    class EncodedListStatusText:
-        tag: int = 446
-
-    # PartyIDSource(447): CHAR
-    class PartyIDSource:
-        tag: int = 447
-        KOREANINVESTORID: str = '1'
-        TAIWANESEQUALIFIED: str = '2'
-        TAIWANESETRADINGACCT: str = '3'
-        MCDNUMBER: str = '4'
-        CHINESEBSHARE: str = '5'
-        UKNATIONALINSPENNUMBER: str = '6'
-        USSOCIALSECURITY: str = '7'
-        USEMPLOYERIDNUMBER: str = '8'
-        AUSTRALIANBUSINESSNUMBER: str = '9'
-        AUSTRALIANTAXFILENUMBER: str = 'A'
-        BIC: str = 'B'
-        ACCPTMARKETPART: str = 'C'
-        PROPCODE: str = 'D'
-        ISOCODE: str = 'E'
-        SETTLENTLOC: str = 'F'
-        MIC: str = 'G'
-        CSDPARTCODE: str = 'H'
-        DIRECTEDDEFINEDISITC: str = 'I'
-
-    # PartyID(448): STRING
-    class PartyID:
-        tag: int = 448
-
-    # TotalVolumeTradedDate(449): UTCDATEONLY
-    class TotalVolumeTradedDate:
-        tag: int = 449
-
-    # TotalVolumeTradedTime(450): UTCTIMEONLY
-    class TotalVolumeTradedTime:
-        tag: int = 450
-
-    # NetChgPrevDay(451): PRICEOFFSET
-    class NetChgPrevDay:
-        tag: int = 451
-
-    # PartyRole(452): INT
-    class PartyRole:
-        tag: int = 452
-        EXECUTINGFIRM: int = 1
-        SETTLEMENTLOCATION: int = 10
-        INITIATINGTRADER: int = 11
-        EXECUTINGTRADER: int = 12
-        ORDERORIGINATOR: int = 13
-        GIVEUPCLEARINGFIRM: int = 14
-        CORRESPONDANTCLEARINGFIRM: int = 15
-        EXECUTINGSYSTEM: int = 16
-        CONTRAFIRM: int = 17
-        CONTRACLEARINGFIRM: int = 18
-        SPONSORINGFIRM: int = 19
-        BROKEROFCREDIT: int = 2
-        UNDRCONTRAFIRM: int = 20
-        CLEARINGORGANIZATION: int = 21
-        EXCHANGE: int = 22
-        CUSTOMERACCOUNT: int = 24
-        CORRESPONDENTCLEARINGORGANIZATION: int = 25
-        CORRESPONDENTBROKER: int = 26
-        BUYERSELLERRECEIVERDELIVERER: int = 27
-        CUSTODIAN: int = 28
-        INTERMEDIARY: int = 29
-        CLIENTID: int = 3
-        AGENT: int = 30
-        SUBCUSTODIAN: int = 31
-        BENEFICIARY: int = 32
-        INTERESTEDPARTY: int = 33
-        REGULATORYBODY: int = 34
-        LIQUIDITYPROVIDER: int = 35
-        ENTERINGTRADER: int = 36
-        CONTRATRADER: int = 37
-        POSITIONACCOUNT: int = 38
-        ALLOCENTITY: int = 39
-        CLEARINGFIRM: int = 4
-        INVESTORID: int = 5
-        INTRODUCINGFIRM: int = 6
-        ENTERINGFIRM: int = 7
-        LOCATELENDINGFIRM: int = 8
-        FUNDMANAGER: int = 9
-
-    # NoPartyIDs(453): NUMINGROUP
-    class NoPartyIDs:
-        tag: int = 453
-
-    # NoSecurityAltID(454): NUMINGROUP
-    class NoSecurityAltID:
-        tag: int = 454
-
-    # SecurityAltID(455): STRING
-    class SecurityAltID:
-        tag: int = 455
-
-    # SecurityAltIDSource(456): STRING
-    class SecurityAltIDSource:
-        tag: int = 456
-
-    # NoUnderlyingSecurityAltID(457): NUMINGROUP
-    class NoUnderlyingSecurityAltID:
-        tag: int = 457
-
-    # UnderlyingSecurityAltID(458): STRING
-    class UnderlyingSecurityAltID:
-        tag: int = 458
-
-    # UnderlyingSecurityAltIDSource(459): STRING
-    class UnderlyingSecurityAltIDSource:
-        tag: int = 459
-
-    # Product(460): INT
-    class Product:
-        tag: int = 460
-        AGENCY: int = 1
-        MORTGAGE: int = 10
-        MUNICIPAL: int = 11
-        OTHER: int = 12
-        FINANCING: int = 13
-        COMMODITY: int = 2
-        CORPORATE: int = 3
-        CURRENCY: int = 4
-        EQUITY: int = 5
-        GOVERNMENT: int = 6
-        INDEX: int = 7
-        LOAN: int = 8
-        MONEYMARKET: int = 9
-
-    # CFICode(461): STRING
-    class CFICode:
-        tag: int = 461
-
-    # UnderlyingProduct(462): INT
-    class UnderlyingProduct:
-        tag: int = 462
-
-    # UnderlyingCFICode(463): STRING
-    class UnderlyingCFICode:
-        tag: int = 463
-
-    # TestMessageIndicator(464): BOOLEAN
-    class TestMessageIndicator:
-        tag: int = 464
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # QuantityType(465): INT
-    class QuantityType:
-        tag: int = 465
-        SHARES: int = 1
-        BONDS: int = 2
-        CURRENTFACE: int = 3
-        ORIGINALFACE: int = 4
-        CURRENCY: int = 5
-        CONTRACTS: int = 6
-        OTHER: int = 7
-        PAR: int = 8
-
-    # BookingRefID(466): STRING
-    class BookingRefID:
-        tag: int = 466
-
-    # IndividualAllocID(467): STRING
-    class IndividualAllocID:
-        tag: int = 467
-
-    # RoundingDirection(468): CHAR
-    class RoundingDirection:
-        tag: int = 468
-        ROUNDNEAREST: str = '0'
-        ROUNDDOWN: str = '1'
-        ROUNDUP: str = '2'
-
-    # RoundingModulus(469): FLOAT
-    class RoundingModulus:
-        tag: int = 469
-
-    # CountryOfIssue(470): COUNTRY
-    class CountryOfIssue:
-        tag: int = 470
-
-    # StateOrProvinceOfIssue(471): STRING
-    class StateOrProvinceOfIssue:
-        tag: int = 471
-
-    # LocaleOfIssue(472): STRING
-    class LocaleOfIssue:
-        tag: int = 472
-
-    # NoRegistDtls(473): NUMINGROUP
-    class NoRegistDtls:
-        tag: int = 473
-
-    # MailingDtls(474): STRING
-    class MailingDtls:
-        tag: int = 474
-
-    # InvestorCountryOfResidence(475): COUNTRY
-    class InvestorCountryOfResidence:
-        tag: int = 475
-
-    # PaymentRef(476): STRING
-    class PaymentRef:
-        tag: int = 476
-
-    # DistribPaymentMethod(477): INT
-    class DistribPaymentMethod:
-        tag: int = 477
-        CREST: int = 1
-        BPAY: int = 10
-        HIGHVALUECLEARINGSYSTEMHVACS: int = 11
-        REINVESTINFUND: int = 12
-        NSCC: int = 2
-        EUROCLEAR: int = 3
-        CLEARSTREAM: int = 4
-        CHEQUE: int = 5
-        TELEGRAPHICTRANSFER: int = 6
-        FEDWIRE: int = 7
-        DIRECTCREDITBECSBACS: int = 8
-        ACHCREDIT: int = 9
-
-    # CashDistribCurr(478): CURRENCY
-    class CashDistribCurr:
-        tag: int = 478
-
-    # CommCurrency(479): CURRENCY
-    class CommCurrency:
-        tag: int = 479
-
-    # CancellationRights(480): CHAR
-    class CancellationRights:
-        tag: int = 480
-        NOWAIVER: str = 'M'
-        NOEXECONLY: str = 'N'
-        NOINSTIT: str = 'O'
-        YES: str = 'Y'
-
-    # MoneyLaunderingStatus(481): CHAR
-    class MoneyLaunderingStatus:
-        tag: int = 481
-        EXBELOWLIM: str = '1'
-        EXCLIENTMONEYTYPE: str = '2'
-        EXAUTHCREDIT: str = '3'
-        NOTCHECKED: str = 'N'
-        PASSED: str = 'Y'
-
-    # MailingInst(482): STRING
-    class MailingInst:
-        tag: int = 482
-
-    # TransBkdTime(483): UTCTIMESTAMP
-    class TransBkdTime:
-        tag: int = 483
-
-    # ExecPriceType(484): CHAR
-    class ExecPriceType:
-        tag: int = 484
-        BIDPRICE: str = 'B'
-        CREATIONPRICE: str = 'C'
-        CREATIONPRICEADJPCT: str = 'D'
-        CREATIONPRICEADJAMT: str = 'E'
-        OFFERPRICE: str = 'O'
-        OFFERPRICEMINUSADJPCT: str = 'P'
-        OFFERPRICEMINUSADJAMT: str = 'Q'
-        SINGLEPRICE: str = 'S'
-
-    # ExecPriceAdjustment(485): FLOAT
-    class ExecPriceAdjustment:
-        tag: int = 485
-
-    # DateOfBirth(486): LOCALMKTDATE
-    class DateOfBirth:
-        tag: int = 486
-
-    # TradeReportTransType(487): INT
-    class TradeReportTransType:
-        tag: int = 487
-        NEW: int = 0
-        CANCEL: int = 1
-        REPLACE: int = 2
-        RELEASE: int = 3
-        REVERSE: int = 4
-
-    # CardHolderName(488): STRING
-    class CardHolderName:
-        tag: int = 488
-
-    # CardNumber(489): STRING
-    class CardNumber:
-        tag: int = 489
-
-    # CardExpDate(490): LOCALMKTDATE
-    class CardExpDate:
-        tag: int = 490
-
-    # CardIssNum(491): STRING
-    class CardIssNum:
-        tag: int = 491
-
-    # PaymentMethod(492): INT
-    class PaymentMethod:
-        tag: int = 492
-        CREST: int = 1
-        DIRECTCREDITBECS: int = 10
-        CREDITCARD: int = 11
-        ACHDEBIT: int = 12
-        ACHCREDIT: int = 13
-        BPAY: int = 14
-        HIGHVALUECLEARINGSYSTEMHVACS: int = 15
-        NSCC: int = 2
-        EUROCLEAR: int = 3
-        CLEARSTREAM: int = 4
-        CHEQUE: int = 5
-        TELEGRAPHICTRANSFER: int = 6
-        FEDWIRE: int = 7
-        DEBITCARD: int = 8
-        DIRECTDEBITBECS: int = 9
-
-    # RegistAcctType(493): STRING
-    class RegistAcctType:
-        tag: int = 493
-
-    # Designation(494): STRING
-    class Designation:
-        tag: int = 494
-
-    # TaxAdvantageType(495): INT
-    class TaxAdvantageType:
-        tag: int = 495
-        NONE: int = 0
-        MAXIISAUK: int = 1
-        EMPLOYEECURRENTYEARUS: int = 10
-        EMPLOYERPRIORYEARUS: int = 11
-        EMPLOYERCURRENTYEARUS: int = 12
-        NONFUNDPROTOTYPEIRAUS: int = 13
-        NONFUNDQUALIFIEDPLANUS: int = 14
-        DEFINEDCONTRIBUTIONPLANUS: int = 15
-        INDIVIDUALRETIREMENTACCOUNTUS: int = 16
-        INDIVIDUALRETIREMENTACCOUNTROLLOVERUS: int = 17
-        KEOGHUS: int = 18
-        PROFITSHARINGPLANUS: int = 19
-        TESSAUK: int = 2
-        _401KUS: int = 20
-        SELFDIRECTEDIRAUS: int = 21
-        _403BUS: int = 22
-        _457US: int = 23
-        ROTHIRAFUNDPROTOTYPEUS: int = 24
-        ROTHIRANONPROTOTYPEUS: int = 25
-        ROTHCONVERSIONIRAFUNDPROTOTYPEUS: int = 26
-        ROTHCONVERSIONIRANONPROTOTYPEUS: int = 27
-        EDUCATIONIRAFUNDPROTOTYPEUS: int = 28
-        EDUCATIONIRANONPROTOTYPEUS: int = 29
-        MINICASHISAUK: int = 3
-        MINISTOCKSANDSHARESISAUK: int = 4
-        MINIINSURANCEISAUK: int = 5
-        CURRENTYEARPAYMENTUS: int = 6
-        PRIORYEARPAYMENTUS: int = 7
-        ASSETTRANSFERUS: int = 8
-        EMPLOYEEPRIORYEARUS: int = 9
-        OTHER: int = 999
-
-    # RegistRejReasonText(496): STRING
-    class RegistRejReasonText:
-        tag: int = 496
-
-    # FundRenewWaiv(497): CHAR
-    class FundRenewWaiv:
-        tag: int = 497
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # CashDistribAgentName(498): STRING
-    class CashDistribAgentName:
-        tag: int = 498
-
-    # CashDistribAgentCode(499): STRING
-    class CashDistribAgentCode:
-        tag: int = 499
-
-    # CashDistribAgentAcctNumber(500): STRING
-    class CashDistribAgentAcctNumber:
-        tag: int = 500
-
-    # CashDistribPayRef(501): STRING
-    class CashDistribPayRef:
-        tag: int = 501
-
-    # CashDistribAgentAcctName(502): STRING
-    class CashDistribAgentAcctName:
-        tag: int = 502
-
-    # CardStartDate(503): LOCALMKTDATE
-    class CardStartDate:
-        tag: int = 503
-
-    # PaymentDate(504): LOCALMKTDATE
-    class PaymentDate:
-        tag: int = 504
-
-    # PaymentRemitterID(505): STRING
-    class PaymentRemitterID:
-        tag: int = 505
-
-    # RegistStatus(506): CHAR
-    class RegistStatus:
-        tag: int = 506
-        ACCEPTED: str = 'A'
-        HELD: str = 'H'
-        REMINDER_IE_REGISTRATION_INSTRUCTIONS_ARE_STILL_OUTSTANDING: str = 'N'
-        REJECTED: str = 'R'
-
-    # RegistRejReasonCode(507): INT
-    class RegistRejReasonCode:
-        tag: int = 507
-        INVALIDACCOUNTTYPE: int = 1
-        INVALIDINVESTORIDSOURCE: int = 10
-        INVALIDDATEOFBIRTH: int = 11
-        INVALIDINVESTORCOUNTRYOFRESIDENCE: int = 12
-        INVALIDNODISTRIBINSTNS: int = 13
-        INVALIDDISTRIBPERCENTAGE: int = 14
-        INVALIDDISTRIBPAYMENTMETHOD: int = 15
-        INVALIDCASHDISTRIBAGENTACCTNAME: int = 16
-        INVALIDCASHDISTRIBAGENTCODE: int = 17
-        INVALIDCASHDISTRIBAGENTACCTNUM: int = 18
-        INVALIDTAXEXEMPTTYPE: int = 2
-        INVALIDOWNERSHIPTYPE: int = 3
-        INVALIDNOREGDETLS: int = 4
-        INVALIDREGSEQNO: int = 5
-        INVALIDREGDTLS: int = 6
-        INVALIDMAILINGDTLS: int = 7
-        INVALIDMAILINGINST: int = 8
-        INVALIDINVESTORID: int = 9
-        OTHER: int = 99
-
-    # RegistRefID(508): STRING
-    class RegistRefID:
-        tag: int = 508
-
-    # RegistDtls(509): STRING
-    class RegistDtls:
-        tag: int = 509
-
-    # NoDistribInsts(510): NUMINGROUP
-    class NoDistribInsts:
-        tag: int = 510
-
-    # RegistEmail(511): STRING
-    class RegistEmail:
-        tag: int = 511
-
-    # DistribPercentage(512): PERCENTAGE
-    class DistribPercentage:
-        tag: int = 512
-
-    # RegistID(513): STRING
-    class RegistID:
-        tag: int = 513
-
-    # RegistTransType(514): CHAR
-    class RegistTransType:
-        tag: int = 514
-        NEW: str = '0'
-        REPLACE: str = '1'
-        CANCEL: str = '2'
-
-    # ExecValuationPoint(515): UTCTIMESTAMP
-    class ExecValuationPoint:
-        tag: int = 515
-
-    # OrderPercent(516): PERCENTAGE
-    class OrderPercent:
-        tag: int = 516
-
-    # OwnershipType(517): CHAR
-    class OwnershipType:
-        tag: int = 517
-        JOINT_TRUSTEES: str = '2'
-        JOINT_INVESTORS: str = 'J'
-        TENANTS_IN_COMMON: str = 'T'
-
-    # NoContAmts(518): NUMINGROUP
-    class NoContAmts:
-        tag: int = 518
-
-    # ContAmtType(519): INT
-    class ContAmtType:
-        tag: int = 519
-        COMMISSIONAMT: int = 1
-        EXITCHARGEPCT: int = 10
-        FUNDBASEDRENEWALCOMM: int = 11
-        PROJECTEDFUNDVALUE: int = 12
-        FUNDBASEDRENEWALCOMMAMTORD: int = 13
-        FUNDBASEDRENEWALCOMMAMTPROJ: int = 14
-        NETSETTLEMENTAMOUNT: int = 15
-        COMMISSIONPCT: int = 2
-        INITIALCHARGEAMT: int = 3
-        INITIALCHARGEPCT: int = 4
-        DISCOUNTAMT: int = 5
-        DISCOUNTPCT: int = 6
-        DILUTIONLEVYAMT: int = 7
-        DILUTIONLEVYPCT: int = 8
-        EXITCHARGEAMT: int = 9
-
-    # ContAmtValue(520): FLOAT
-    class ContAmtValue:
-        tag: int = 520
-
-    # ContAmtCurr(521): CURRENCY
-    class ContAmtCurr:
-        tag: int = 521
-
-    # OwnerType(522): INT
-    class OwnerType:
-        tag: int = 522
-        INDIVINVESTOR: int = 1
-        NETWORKINGSUBACCT: int = 10
-        NON_PROFITORG: int = 11
-        CORPBODY: int = 12
-        NOMINEE: int = 13
-        PUBLICCOMPANY: int = 2
-        PRIVATECOMPANY: int = 3
-        INDIVTRUSTEE: int = 4
-        COMPANYTRUSTEE: int = 5
-        PENSIONPLAN: int = 6
-        CUSTODIANMINORSACT: int = 7
-        TRUSTS: int = 8
-        FIDUCIARIES: int = 9
-
-    # PartySubID(523): STRING
-    class PartySubID:
-        tag: int = 523
-
-    # NestedPartyID(524): STRING
-    class NestedPartyID:
-        tag: int = 524
-
-    # NestedPartyIDSource(525): CHAR
-    class NestedPartyIDSource:
-        tag: int = 525
-
-    # SecondaryClOrdID(526): STRING
-    class SecondaryClOrdID:
-        tag: int = 526
-
-    # SecondaryExecID(527): STRING
-    class SecondaryExecID:
-        tag: int = 527
-
-    # OrderCapacity(528): CHAR
-    class OrderCapacity:
-        tag: int = 528
-        AGENCY: str = 'A'
-        PROPRIETARY: str = 'G'
-        INDIVIDUAL: str = 'I'
-        PRINCIPAL: str = 'P'
-        RISKLESSPRINCIPAL: str = 'R'
-        AGENTOTHERMEMBER: str = 'W'
-
-    # OrderRestrictions(529): MULTIPLESTRINGVALUE
-    class OrderRestrictions:
-        tag: int = 529
-        PROGRAMTRADE: str = "1"
-        INDEXARBITRAGE: str = "2"
-        NON_INDEXARBITRAGE: str = "3"
-        COMPETINGMARKETMAKER: str = "4"
-        ACTMM: str = "5"
-        ACTMMDERIV: str = "6"
-        FORENTITY: str = "7"
-        EXMRKTPART: str = "8"
-        EXINTMRKTLINK: str = "9"
-        RISKARB: str = "A"
-
-    # MassCancelRequestType(530): CHAR
-    class MassCancelRequestType:
-        tag: int = 530
-        CXLORDERSSECURITY: str = '1'
-        CXLORDERSUNDERLYINGSECURITY: str = '2'
-        CXLORDERSPRODUCT: str = '3'
-        CXLORDERSCFICODE: str = '4'
-        CXLORDERSSECURITYTYPE: str = '5'
-        CXLORDERSTRDSESSION: str = '6'
-        CXLALLORDERS: str = '7'
-
-    # MassCancelResponse(531): CHAR
-    class MassCancelResponse:
-        tag: int = 531
-        CXLREQREJ: str = '0'
-        CXLORDERSSECURITY: str = '1'
-        CXLORDERSUNDERLYINGSECURITY: str = '2'
-        CXLORDERSPRODUCT: str = '3'
-        CXLORDERSCFICODE: str = '4'
-        CXLORDERSSECURITYTYPE: str = '5'
-        CXLORDERSTRDSESSION: str = '6'
-        CXLALLORDERS: str = '7'
-
-    # MassCancelRejectReason(532): STRING
-    class MassCancelRejectReason:
-        tag: int = 532
-        MASSCXLNOTSUPPORTED: str = "0"
-        INVALIDSECURITY: str = "1"
-        INVALIDUNDERLYING: str = "2"
-        INVALIDPRODUCT: str = "3"
-        INVALIDCFICODE: str = "4"
-        INVALIDSECURITYTYPE: str = "5"
-        INVALIDTRDSESSION: str = "6"
-        OTHER: str = "99"
-
-    # TotalAffectedOrders(533): INT
-    class TotalAffectedOrders:
-        tag: int = 533
-
-    # NoAffectedOrders(534): INT
-    class NoAffectedOrders:
-        tag: int = 534
-
-    # AffectedOrderID(535): STRING
-    class AffectedOrderID:
-        tag: int = 535
-
-    # AffectedSecondaryOrderID(536): STRING
-    class AffectedSecondaryOrderID:
-        tag: int = 536
-
-    # QuoteType(537): INT
-    class QuoteType:
-        tag: int = 537
-        INDICATIVE: int = 0
-        TRADEABLE: int = 1
-        RESTRICTEDTRADEABLE: int = 2
-        COUNTER: int = 3
-
-    # NestedPartyRole(538): INT
-    class NestedPartyRole:
-        tag: int = 538
-
-    # NoNestedPartyIDs(539): NUMINGROUP
-    class NoNestedPartyIDs:
-        tag: int = 539
-
-    # TotalAccruedInterestAmt(540): AMT
-    class TotalAccruedInterestAmt:
-        tag: int = 540
-
-    # MaturityDate(541): LOCALMKTDATE
-    class MaturityDate:
-        tag: int = 541
-
-    # UnderlyingMaturityDate(542): LOCALMKTDATE
-    class UnderlyingMaturityDate:
-        tag: int = 542
-
-    # InstrRegistry(543): STRING
-    class InstrRegistry:
-        tag: int = 543
-        CUSTODIAN: str = "BIC"
-        COUNTRY: str = "ISO"
-        PHYSICAL: str = "ZZ"
-
-    # CashMargin(544): CHAR
-    class CashMargin:
-        tag: int = 544
-        CASH: str = '1'
-        MARGINOPEN: str = '2'
-        MARGINCLOSE: str = '3'
-
-    # NestedPartySubID(545): STRING
-    class NestedPartySubID:
-        tag: int = 545
-
-    # Scope(546): MULTIPLESTRINGVALUE
-    class Scope:
-        tag: int = 546
-        LOCALMARKET: str = "1"
-        NATIONAL: str = "2"
-        GLOBAL: str = "3"
-
-    # MDImplicitDelete(547): BOOLEAN
-    class MDImplicitDelete:
-        tag: int = 547
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # CrossID(548): STRING
-    class CrossID:
-        tag: int = 548
-
-    # CrossType(549): INT
-    class CrossType:
-        tag: int = 549
-        CROSSAON: int = 1
-        CROSSIOC: int = 2
-        CROSSONESIDE: int = 3
-        CROSSSAMEPRICE: int = 4
-
-    # CrossPrioritization(550): INT
-    class CrossPrioritization:
-        tag: int = 550
-        NONE: int = 0
-        BUY_SIDE_PRIORITIZED: int = 1
-        SELL_SIDE_PRIORITIZED: int = 2
-
-    # OrigCrossID(551): STRING
-    class OrigCrossID:
-        tag: int = 551
-
-    # NoSides(552): NUMINGROUP
-    class NoSides:
-        tag: int = 552
-        ONESIDE: str = "1"
-        BOTHSIDES: str = "2"
-
-    # Username(553): STRING
-    class Username:
-        tag: int = 553
-
-    # Password(554): STRING
-    class Password:
-        tag: int = 554
-
-    # NoLegs(555): NUMINGROUP
-    class NoLegs:
-        tag: int = 555
-
-    # LegCurrency(556): CURRENCY
-    class LegCurrency:
-        tag: int = 556
-
-    # TotNoSecurityTypes(557): INT
-    class TotNoSecurityTypes:
-        tag: int = 557
-
-    # NoSecurityTypes(558): NUMINGROUP
-    class NoSecurityTypes:
-        tag: int = 558
-
-    # SecurityListRequestType(559): INT
-    class SecurityListRequestType:
-        tag: int = 559
-        SYMBOL: int = 0
-        SECURITYTYPECFICODE: int = 1
-        PRODUCT: int = 2
-        TRADINGSESSIONID: int = 3
-        ALLSECURITIES: int = 4
-
-    # SecurityRequestResult(560): INT
-    class SecurityRequestResult:
-        tag: int = 560
-        VALIDREQ: int = 0
-        INVALIDREQ: int = 1
-        NOINSTRUMENTSFOUND: int = 2
-        NOTAUTHORIZED: int = 3
-        INSTRUMENTUNAVAILABLE: int = 4
-        NOTSUPPORTED: int = 5
-
-    # RoundLot(561): QTY
-    class RoundLot:
-        tag: int = 561
-
-    # MinTradeVol(562): QTY
-    class MinTradeVol:
-        tag: int = 562
-
-    # MultiLegRptTypeReq(563): INT
-    class MultiLegRptTypeReq:
-        tag: int = 563
-        REPORT_BY_MULITLEG_SECURITY_ONLY: int = 0
-        REPORT_BY_MULTILEG_SECURITY_AND_BY_INSTRUMENT_LEGS_BELONGING_TO_THE_MULTILEG_SECURITY: int = 1
-        REPORT_BY_INSTRUMENT_LEGS_BELONGING_TO_THE_MULTILEG_SECURITY_ONLY: int = 2
-
-    # LegPositionEffect(564): CHAR
-    class LegPositionEffect:
-        tag: int = 564
-
-    # LegCoveredOrUncovered(565): INT
-    class LegCoveredOrUncovered:
-        tag: int = 565
-
-    # LegPrice(566): PRICE
-    class LegPrice:
-        tag: int = 566
-
-    # TradSesStatusRejReason(567): INT
-    class TradSesStatusRejReason:
-        tag: int = 567
-        UNKNOWNTRADINGSESSIONID: int = 1
-        OTHER: int = 99
-
-    # TradeRequestID(568): STRING
-    class TradeRequestID:
-        tag: int = 568
-
-    # TradeRequestType(569): INT
-    class TradeRequestType:
-        tag: int = 569
-        ALLTRADES: int = 0
-        MATCHEDTRADES: int = 1
-        UNMATCHEDTRADES: int = 2
-        UNREPORTEDTRADES: int = 3
-        ADVISORIESMATCH: int = 4
-
-    # PreviouslyReported(570): BOOLEAN
-    class PreviouslyReported:
-        tag: int = 570
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # TradeReportID(571): STRING
-    class TradeReportID:
-        tag: int = 571
-
-    # TradeReportRefID(572): STRING
-    class TradeReportRefID:
-        tag: int = 572
-
-    # MatchStatus(573): CHAR
-    class MatchStatus:
-        tag: int = 573
-        COMPMATAFF: str = '0'
-        UNCOMPUNMATUNAFF: str = '1'
-        ADVALERT: str = '2'
-
-    # MatchType(574): STRING
-    class MatchType:
-        tag: int = 574
-        EXACTMATCHONTRADEDATESTOCKSYMBOLQUANTITYPRICETRADETYPEANDSPECIALTRADEINDICATORPLUSFOURBADGESANDEXECUTIONTIME: str = "A1"
-        EXACTMATCHONTRADEDATESTOCKSYMBOLQUANTITYPRICETRADETYPEANDSPECIALTRADEINDICATORPLUSFOURBADGES: str = "A2"
-        EXACTMATCHONTRADEDATESTOCKSYMBOLQUANTITYPRICETRADETYPEANDSPECIALTRADEINDICATORPLUSTWOBADGESANDEXECUTIONTIME: str = "A3"
-        EXACTMATCHONTRADEDATESTOCKSYMBOLQUANTITYPRICETRADETYPEANDSPECIALTRADEINDICATORPLUSTWOBADGES: str = "A4"
-        EXACTMATCHONTRADEDATESTOCKSYMBOLQUANTITYPRICETRADETYPEANDSPECIALTRADEINDICATORPLUSEXECUTIONTIME: str = "A5"
-        NASDAQACTM1MATCH: str = "ACTM1"
-        NASDAQACTM2MATCH: str = "ACTM2"
-        NASDAQACTACCEPTEDTRADE: str = "ACTM3"
-        NASDAQACTDEFAULTTRADE: str = "ACTM4"
-        NASDAQACTDEFAULTAFTERM2: str = "ACTM5"
-        NASDAQACTM6MATCH: str = "ACTM6"
-        NASDAQNONACT: str = "ACTMT"
-        COMPAREDRECORDSRESULTINGFROMSTAMPEDADVISORIESORSPECIALISTACCEPTSPAIROFFS: str = "AQ"
-        EXACTMATCHONTRADEDATESTOCKSYMBOLQUANTITYPRICETRADETYPEANDSPECIALTRADEINDICATORMINUSBADGESANDTIMES: str = "M1"
-        SUMMARIZEDMATCHMINUSBADGESANDTIMES: str = "M2"
-        OCSLOCKEDIN: str = "MT"
-        SUMMARIZEDMATCHUSINGA1: str = "S1"
-        SUMMARIZEDMATCHUSINGA2: str = "S2"
-        SUMMARIZEDMATCHUSINGA3: str = "S3"
-        SUMMARIZEDMATCHUSINGA4: str = "S4"
-        SUMMARIZEDMATCHUSINGA5: str = "S5"
-
-    # OddLot(575): BOOLEAN
-    class OddLot:
-        tag: int = 575
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # NoClearingInstructions(576): NUMINGROUP
-    class NoClearingInstructions:
-        tag: int = 576
-
-    # ClearingInstruction(577): INT
-    class ClearingInstruction:
-        tag: int = 577
-        PROCESSNORMALLY: int = 0
-        EXCLUDEFROMALLNETTING: int = 1
-        AUTOMATICGIVEUPMODETRADEGIVEUPTOTHEGIVEUPDESTINATIONNUMBERSPECIFIED: int = 10
-        QUALIFIEDSERVICEREPRESENTATIVEQSR: int = 11
-        CUSTOMERTRADE: int = 12
-        SELFCLEARING: int = 13
-        BILATERALNETTINGONLY: int = 2
-        EXCLEARING: int = 3
-        SPECIALTRADE: int = 4
-        MULTILATERALNETTING: int = 5
-        CLEARAGAINSTCENTRALCOUNTERPARTY: int = 6
-        EXCLUDEFROMCENTRALCOUNTERPARTY: int = 7
-        MANUALMODEPREPOSTINGANDORPREGIVEUP: int = 8
-        AUTOMATICPOSTINGMODETRADEPOSTINGTOTHEPOSITIONACCOUNTNUMBERSPECIFIED: int = 9
-
-    # TradeInputSource(578): STRING
-    class TradeInputSource:
-        tag: int = 578
-
-    # TradeInputDevice(579): STRING
-    class TradeInputDevice:
-        tag: int = 579
-
-    # NoDates(580): INT
-    class NoDates:
-        tag: int = 580
-
-    # AccountType(581): INT
-    class AccountType:
-        tag: int = 581
-        ACCOUNTCUSTOMER: int = 1
-        ACCOUNTNONCUSTOMER: int = 2
-        HOUSETRADER: int = 3
-        FLOORTRADER: int = 4
-        ACCOUNTNONCUSTOMERCROSS: int = 6
-        HOUSETRADERCROSS: int = 7
-        JOINTBOACCT: int = 8
-
-    # CustOrderCapacity(582): INT
-    class CustOrderCapacity:
-        tag: int = 582
-        MEMBER_TRADING_FOR_THEIR_OWN_ACCOUNT: int = 1
-        CLEARING_FIRM_TRADING_FOR_ITS_PROPRIETARY_ACCOUNT: int = 2
-        MEMBER_TRADING_FOR_ANOTHER_MEMBER: int = 3
-        ALL_OTHER: int = 4
-
-    # ClOrdLinkID(583): STRING
-    class ClOrdLinkID:
-        tag: int = 583
-
-    # MassStatusReqID(584): STRING
-    class MassStatusReqID:
-        tag: int = 584
-
-    # MassStatusReqType(585): INT
-    class MassStatusReqType:
-        tag: int = 585
-        STATUSSECURITY: int = 1
-        STATUSUNDERLYINGSECURITY: int = 2
-        STATUSPRODUCT: int = 3
-        STATUSCFICODE: int = 4
-        STATUSSECURITYTYPE: int = 5
-        STATUSTRDSESSION: int = 6
-        STATUSALLORDERS: int = 7
-        STATUSPARTYID: int = 8
-
-    # OrigOrdModTime(586): UTCTIMESTAMP
-    class OrigOrdModTime:
-        tag: int = 586
-
-    # LegSettlType(587): CHAR
-    class LegSettlType:
-        tag: int = 587
-
-    # LegSettlDate(588): LOCALMKTDATE
-    class LegSettlDate:
-        tag: int = 588
-
-    # DayBookingInst(589): CHAR
-    class DayBookingInst:
-        tag: int = 589
-        CAN_TRIGGER_BOOKING_WITHOUT_REFERENCE_TO_THE_ORDER_INITIATOR_AUTO: str = '0'
-        SPEAK_WITH_ORDER_INITIATOR_BEFORE_BOOKING_SPEAK_FIRST: str = '1'
-        ACCUMULATE: str = '2'
-
-    # BookingUnit(590): CHAR
-    class BookingUnit:
-        tag: int = 590
-        EACH_PARTIAL_EXECUTION_IS_A_BOOKABLE_UNIT: str = '0'
-        AGGREGATE_PARTIAL_EXECUTIONS_ON_THIS_ORDER_AND_BOOK_ONE_TRADE_PER_ORDER: str = '1'
-        AGGREGATE_EXECUTIONS_FOR_THIS_SYMBOL_SIDE_AND_SETTLEMENT_DATE: str = '2'
-
-    # PreallocMethod(591): CHAR
-    class PreallocMethod:
-        tag: int = 591
-        PRORATA: str = '0'
-        DO_NOT_PRORATA_DISCUSS_FIRST: str = '1'
-
-    # UnderlyingCountryOfIssue(592): COUNTRY
-    class UnderlyingCountryOfIssue:
-        tag: int = 592
-
-    # UnderlyingStateOrProvinceOfIssue(593): STRING
-    class UnderlyingStateOrProvinceOfIssue:
-        tag: int = 593
-
-    # UnderlyingLocaleOfIssue(594): STRING
-    class UnderlyingLocaleOfIssue:
-        tag: int = 594
-
-    # UnderlyingInstrRegistry(595): STRING
-    class UnderlyingInstrRegistry:
-        tag: int = 595
-
-    # LegCountryOfIssue(596): COUNTRY
-    class LegCountryOfIssue:
-        tag: int = 596
-
-    # LegStateOrProvinceOfIssue(597): STRING
-    class LegStateOrProvinceOfIssue:
-        tag: int = 597
-
-    # LegLocaleOfIssue(598): STRING
-    class LegLocaleOfIssue:
-        tag: int = 598
-
-    # LegInstrRegistry(599): STRING
-    class LegInstrRegistry:
-        tag: int = 599
-
-    # LegSymbol(600): STRING
-    class LegSymbol:
-        tag: int = 600
-
-    # LegSymbolSfx(601): STRING
-    class LegSymbolSfx:
-        tag: int = 601
-
-    # LegSecurityID(602): STRING
-    class LegSecurityID:
-        tag: int = 602
-
-    # LegSecurityIDSource(603): STRING
-    class LegSecurityIDSource:
-        tag: int = 603
-
-    # NoLegSecurityAltID(604): STRING
-    class NoLegSecurityAltID:
-        tag: int = 604
-
-    # LegSecurityAltID(605): STRING
-    class LegSecurityAltID:
-        tag: int = 605
-
-    # LegSecurityAltIDSource(606): STRING
-    class LegSecurityAltIDSource:
-        tag: int = 606
-
-    # LegProduct(607): INT
-    class LegProduct:
-        tag: int = 607
-
-    # LegCFICode(608): STRING
-    class LegCFICode:
-        tag: int = 608
-
-    # LegSecurityType(609): STRING
-    class LegSecurityType:
-        tag: int = 609
-
-    # LegMaturityMonthYear(610): MONTHYEAR
-    class LegMaturityMonthYear:
-        tag: int = 610
-
-    # LegMaturityDate(611): LOCALMKTDATE
-    class LegMaturityDate:
-        tag: int = 611
-
-    # LegStrikePrice(612): PRICE
-    class LegStrikePrice:
-        tag: int = 612
-
-    # LegOptAttribute(613): CHAR
-    class LegOptAttribute:
-        tag: int = 613
-
-    # LegContractMultiplier(614): FLOAT
-    class LegContractMultiplier:
-        tag: int = 614
-
-    # LegCouponRate(615): PERCENTAGE
-    class LegCouponRate:
-        tag: int = 615
-
-    # LegSecurityExchange(616): EXCHANGE
-    class LegSecurityExchange:
-        tag: int = 616
-
-    # LegIssuer(617): STRING
-    class LegIssuer:
-        tag: int = 617
-
-    # EncodedLegIssuerLen(618): LENGTH
-    class EncodedLegIssuerLen:
-        tag: int = 618
-
-    # EncodedLegIssuer(619): DATA
-    class EncodedLegIssuer:
-        tag: int = 619
-
-    # LegSecurityDesc(620): STRING
-    class LegSecurityDesc:
-        tag: int = 620
-
-    # EncodedLegSecurityDescLen(621): LENGTH
-    class EncodedLegSecurityDescLen:
-        tag: int = 621
-
-    # EncodedLegSecurityDesc(622): DATA
-    class EncodedLegSecurityDesc:
-        tag: int = 622
-
-    # LegRatioQty(623): FLOAT
-    class LegRatioQty:
-        tag: int = 623
-
-    # LegSide(624): CHAR
-    class LegSide:
-        tag: int = 624
-
-    # TradingSessionSubID(625): STRING
-    class TradingSessionSubID:
-        tag: int = 625
-
-    # AllocType(626): INT
-    class AllocType:
-        tag: int = 626
-        BUYSIDECALC: int = 1
-        BUYSIDEPRELIM: int = 2
-        SELLSIDECALC: int = 3
-        SELLSIDECALCWITHOUTPRELIM: int = 4
-        BUYSIDEREADYTOBOOKSINGLE: int = 5
-        BUYSIDEREADYTOBOOKCOMBINED: int = 6
-        WAREHOUSEINSTRUCTION: int = 7
-        REQUESTTOINTERMEDIARY: int = 8
-
-    # NoHops(627): NUMINGROUP
-    class NoHops:
-        tag: int = 627
-
-    # HopCompID(628): STRING
-    class HopCompID:
-        tag: int = 628
-
-    # HopSendingTime(629): UTCTIMESTAMP
-    class HopSendingTime:
-        tag: int = 629
-
-    # HopRefID(630): SEQNUM
-    class HopRefID:
-        tag: int = 630
-
-    # MidPx(631): PRICE
-    class MidPx:
-        tag: int = 631
-
-    # BidYield(632): PERCENTAGE
-    class BidYield:
-        tag: int = 632
-
-    # MidYield(633): PERCENTAGE
-    class MidYield:
-        tag: int = 633
-
-    # OfferYield(634): PERCENTAGE
-    class OfferYield:
-        tag: int = 634
-
-    # ClearingFeeIndicator(635): STRING
-    class ClearingFeeIndicator:
-        tag: int = 635
-        _1STYEARDELEGATE: str = "1"
-        _2NDYEARDELEGATE: str = "2"
-        _3RDYEARDELEGATE: str = "3"
-        _4THYEARDELEGATE: str = "4"
-        _5THYEARDELEGATE: str = "5"
-        _6THYEARDELEGATE: str = "9"
-        CBOEMEMBER: str = "B"
-        NONMEMBERCUSTOMER: str = "C"
-        EQUITYCLEARINGMEMBER: str = "E"
-        FULLASSOCIATEMEMBER: str = "F"
-        _106H106J: str = "H"
-        GIMIDEMCOMMEMBERSHIP: str = "I"
-        LESSEE106F: str = "L"
-        ALLOTHERS: str = "M"
-
-    # WorkingIndicator(636): BOOLEAN
-    class WorkingIndicator:
-        tag: int = 636
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # LegLastPx(637): PRICE
-    class LegLastPx:
-        tag: int = 637
-
-    # PriorityIndicator(638): INT
-    class PriorityIndicator:
-        tag: int = 638
-        PRIORITYUNCHANGED: int = 0
-        LOSTPRIORITY: int = 1
-
-    # PriceImprovement(639): PRICEOFFSET
-    class PriceImprovement:
-        tag: int = 639
-
-    # Price2(640): PRICE
-    class Price2:
-        tag: int = 640
-
-    # LastForwardPoints2(641): PRICEOFFSET
-    class LastForwardPoints2:
-        tag: int = 641
-
-    # BidForwardPoints2(642): PRICEOFFSET
-    class BidForwardPoints2:
-        tag: int = 642
-
-    # OfferForwardPoints2(643): PRICEOFFSET
-    class OfferForwardPoints2:
-        tag: int = 643
-
-    # RFQReqID(644): STRING
-    class RFQReqID:
-        tag: int = 644
-
-    # MktBidPx(645): PRICE
-    class MktBidPx:
-        tag: int = 645
-
-    # MktOfferPx(646): PRICE
-    class MktOfferPx:
-        tag: int = 646
-
-    # MinBidSize(647): QTY
-    class MinBidSize:
-        tag: int = 647
-
-    # MinOfferSize(648): QTY
-    class MinOfferSize:
-        tag: int = 648
-
-    # QuoteStatusReqID(649): STRING
-    class QuoteStatusReqID:
-        tag: int = 649
-
-    # LegalConfirm(650): BOOLEAN
-    class LegalConfirm:
-        tag: int = 650
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # UnderlyingLastPx(651): PRICE
-    class UnderlyingLastPx:
-        tag: int = 651
-
-    # UnderlyingLastQty(652): QTY
-    class UnderlyingLastQty:
-        tag: int = 652
-
-    # SecDefStatus(653): INT
-    class SecDefStatus:
-        tag: int = 653
-        PENDINGAPPROVAL: int = 0
-        APPROVEDACCEPTED: int = 1
-        REJECTED: int = 2
-        UNAUTHORIZEDREQUEST: int = 3
-        INVALIDDEFINITIONREQUEST: int = 4
-
-    # LegRefID(654): STRING
-    class LegRefID:
-        tag: int = 654
-
-    # ContraLegRefID(655): STRING
-    class ContraLegRefID:
-        tag: int = 655
-
-    # SettlCurrBidFxRate(656): FLOAT
-    class SettlCurrBidFxRate:
-        tag: int = 656
-
-    # SettlCurrOfferFxRate(657): FLOAT
-    class SettlCurrOfferFxRate:
-        tag: int = 657
-
-    # QuoteRequestRejectReason(658): INT
-    class QuoteRequestRejectReason:
-        tag: int = 658
-        UNKNOWNSYM: int = 1
-        PASS: int = 10
-        EXCHANGECLOSED: int = 2
-        QUOTEREQUESTEXLIMIT: int = 3
-        TOOLATE: int = 4
-        INVPRICE: int = 5
-        NOTAUTHTOREQQUOTE: int = 6
-        NOMATCHFORINQUIRY: int = 7
-        NOMARKETFORINSTRUMENT: int = 8
-        NOINVENTORY: int = 9
-        OTHER: int = 99
-
-    # SideComplianceID(659): STRING
-    class SideComplianceID:
-        tag: int = 659
-
-    # AcctIDSource(660): INT
-    class AcctIDSource:
-        tag: int = 660
-        BIC: int = 1
-        SIDCODE: int = 2
-        TFMGSPTA: int = 3
-        OMGEOALERTID: int = 4
-        DTCCCODE: int = 5
-        OTHER: int = 99
-
-    # AllocAcctIDSource(661): INT
-    class AllocAcctIDSource:
-        tag: int = 661
-
-    # BenchmarkPrice(662): PRICE
-    class BenchmarkPrice:
-        tag: int = 662
-
-    # BenchmarkPriceType(663): INT
-    class BenchmarkPriceType:
-        tag: int = 663
-
-    # ConfirmID(664): STRING
-    class ConfirmID:
-        tag: int = 664
-
-    # ConfirmStatus(665): INT
-    class ConfirmStatus:
-        tag: int = 665
-        RECEIVED: int = 1
-        MISMATCHEDACCOUNT: int = 2
-        MISSINGSETTLEMENTINSTRUCTIONS: int = 3
-        CONFIRMED: int = 4
-        REQUESTREJECTED: int = 5
-
-    # ConfirmTransType(666): INT
-    class ConfirmTransType:
-        tag: int = 666
-        NEW: int = 0
-        REPLACE: int = 1
-        CANCEL: int = 2
-
-    # ContractSettlMonth(667): MONTHYEAR
-    class ContractSettlMonth:
-        tag: int = 667
-
-    # DeliveryForm(668): INT
-    class DeliveryForm:
-        tag: int = 668
-        BOOKENTRY: int = 1
-        BEARER: int = 2
-
-    # LastParPx(669): PRICE
-    class LastParPx:
-        tag: int = 669
-
-    # NoLegAllocs(670): NUMINGROUP
-    class NoLegAllocs:
-        tag: int = 670
-
-    # LegAllocAccount(671): STRING
-    class LegAllocAccount:
-        tag: int = 671
-
-    # LegIndividualAllocID(672): STRING
-    class LegIndividualAllocID:
-        tag: int = 672
-
-    # LegAllocQty(673): QTY
-    class LegAllocQty:
-        tag: int = 673
-
-    # LegAllocAcctIDSource(674): STRING
-    class LegAllocAcctIDSource:
-        tag: int = 674
-
-    # LegSettlCurrency(675): CURRENCY
-    class LegSettlCurrency:
-        tag: int = 675
-
-    # LegBenchmarkCurveCurrency(676): CURRENCY
-    class LegBenchmarkCurveCurrency:
-        tag: int = 676
-
-    # LegBenchmarkCurveName(677): STRING
-    class LegBenchmarkCurveName:
-        tag: int = 677
-
-    # LegBenchmarkCurvePoint(678): STRING
-    class LegBenchmarkCurvePoint:
-        tag: int = 678
-
-    # LegBenchmarkPrice(679): PRICE
-    class LegBenchmarkPrice:
-        tag: int = 679
-
-    # LegBenchmarkPriceType(680): INT
-    class LegBenchmarkPriceType:
-        tag: int = 680
-
-    # LegBidPx(681): PRICE
-    class LegBidPx:
-        tag: int = 681
-
-    # LegIOIQty(682): STRING
-    class LegIOIQty:
-        tag: int = 682
-
-    # NoLegStipulations(683): NUMINGROUP
-    class NoLegStipulations:
-        tag: int = 683
-
-    # LegOfferPx(684): PRICE
-    class LegOfferPx:
-        tag: int = 684
-
-    # LegOrderQty(685): QTY
-    class LegOrderQty:
-        tag: int = 685
-
-    # LegPriceType(686): INT
-    class LegPriceType:
-        tag: int = 686
-
-    # LegQty(687): QTY
-    class LegQty:
-        tag: int = 687
-
-    # LegStipulationType(688): STRING
-    class LegStipulationType:
-        tag: int = 688
-
-    # LegStipulationValue(689): STRING
-    class LegStipulationValue:
-        tag: int = 689
-
-    # LegSwapType(690): INT
-    class LegSwapType:
-        tag: int = 690
-        PARFORPAR: int = 1
-        MODIFIEDDURATION: int = 2
-        RISK: int = 4
-        PROCEEDS: int = 5
-
-    # Pool(691): STRING
-    class Pool:
-        tag: int = 691
-
-    # QuotePriceType(692): INT
-    class QuotePriceType:
-        tag: int = 692
-        PERCENT: int = 1
-        YIELD: int = 10
-        PERSHARE: int = 2
-        FIXEDAMOUNT: int = 3
-        DISCOUNT: int = 4
-        PREMIUM: int = 5
-        BASISPOINTSRELATIVETOBENCHMARK: int = 6
-        TEDPRICE: int = 7
-        TEDYIELD: int = 8
-        YIELDSPREADSWAPS: int = 9
-
-    # QuoteRespID(693): STRING
-    class QuoteRespID:
-        tag: int = 693
-
-    # QuoteRespType(694): INT
-    class QuoteRespType:
-        tag: int = 694
-        HITLIFT: int = 1
-        COUNTER: int = 2
-        EXPIRED: int = 3
-        COVER: int = 4
-        DONEAWAY: int = 5
-        PASS: int = 6
-
-    # QuoteQualifier(695): CHAR
-    class QuoteQualifier:
-        tag: int = 695
-
-    # YieldRedemptionDate(696): LOCALMKTDATE
-    class YieldRedemptionDate:
-        tag: int = 696
-
-    # YieldRedemptionPrice(697): PRICE
-    class YieldRedemptionPrice:
-        tag: int = 697
-
-    # YieldRedemptionPriceType(698): INT
-    class YieldRedemptionPriceType:
-        tag: int = 698
-
-    # BenchmarkSecurityID(699): STRING
-    class BenchmarkSecurityID:
-        tag: int = 699
-
-    # ReversalIndicator(700): BOOLEAN
-    class ReversalIndicator:
-        tag: int = 700
-
-    # YieldCalcDate(701): LOCALMKTDATE
-    class YieldCalcDate:
-        tag: int = 701
-
-    # NoPositions(702): NUMINGROUP
-    class NoPositions:
-        tag: int = 702
-
-    # PosType(703): STRING
-    class PosType:
-        tag: int = 703
-        ALLOCATIONTRADEQTY: str = "ALC"
-        OPTIONASSIGNMENT: str = "AS"
-        ASOFTRADEQTY: str = "ASF"
-        DELIVERYQTY: str = "DLV"
-        ELECTRONICTRADEQTY: str = "ETR"
-        OPTIONEXERCISEQTY: str = "EX"
-        ENDOFDAYQTY: str = "FIN"
-        INTRASPREADQTY: str = "IAS"
-        INTERSPREADQTY: str = "IES"
-        ADJUSTMENTQTY: str = "PA"
-        PITTRADEQTY: str = "PIT"
-        STARTOFDAYQTY: str = "SOD"
-        INTEGRALSPLIT: str = "SPL"
-        TRANSACTIONFROMASSIGNMENT: str = "TA"
-        TOTALTRANSACTIONQTY: str = "TOT"
-        TRANSACTIONQUANTITY: str = "TQ"
-        TRANSFERTRADEQTY: str = "TRF"
-        TRANSACTIONFROMEXERCISE: str = "TX"
-        CROSSMARGINQTY: str = "XM"
-
-    # LongQty(704): QTY
-    class LongQty:
-        tag: int = 704
-
-    # ShortQty(705): QTY
-    class ShortQty:
-        tag: int = 705
-
-    # PosQtyStatus(706): INT
-    class PosQtyStatus:
-        tag: int = 706
-        SUBMITTED: int = 0
-        ACCEPTED: int = 1
-        REJECTED: int = 2
-
-    # PosAmtType(707): STRING
-    class PosAmtType:
-        tag: int = 707
-        CASHAMOUNTCORPORATEEVENT: str = "CASH"
-        CASHRESIDUALAMOUNT: str = "CRES"
-        FINALMARKTOMARKETAMOUNT: str = "FMTM"
-        INCREMENTALMARKTOMARKETAMOUNT: str = "IMTM"
-        PREMIUMAMOUNT: str = "PREM"
-        STARTOFDAYMARKTOMARKETAMOUNT: str = "SMTM"
-        TRADEVARIATIONAMOUNT: str = "TVAR"
-        VALUEADJUSTEDAMOUNT: str = "VADJ"
-
-    # PosAmt(708): AMT
-    class PosAmt:
-        tag: int = 708
-
-    # PosTransType(709): INT
-    class PosTransType:
-        tag: int = 709
-        EXERCISE: int = 1
-        DONOTEXERCISE: int = 2
-        POSITIONADJUSTMENT: int = 3
-        POSITIONCHANGESUBMISSIONMARGINDISPOSITION: int = 4
-        PLEDGE: int = 5
-
-    # PosReqID(710): STRING
-    class PosReqID:
-        tag: int = 710
-
-    # NoUnderlyings(711): NUMINGROUP
-    class NoUnderlyings:
-        tag: int = 711
-
-    # PosMaintAction(712): INT
-    class PosMaintAction:
-        tag: int = 712
-        NEW: int = 1
-        REPLACE: int = 2
-        CANCEL: int = 3
-
-    # OrigPosReqRefID(713): STRING
-    class OrigPosReqRefID:
-        tag: int = 713
-
-    # PosMaintRptRefID(714): STRING
-    class PosMaintRptRefID:
-        tag: int = 714
-
-    # ClearingBusinessDate(715): LOCALMKTDATE
-    class ClearingBusinessDate:
-        tag: int = 715
-
-    # SettlSessID(716): STRING
-    class SettlSessID:
-        tag: int = 716
-
-    # SettlSessSubID(717): STRING
-    class SettlSessSubID:
-        tag: int = 717
-
-    # AdjustmentType(718): INT
-    class AdjustmentType:
-        tag: int = 718
-        PROCESSREQUESTASMARGINDISPOSITION: int = 0
-        DELTAPLUS: int = 1
-        DELTAMINUS: int = 2
-        FINAL: int = 3
-
-    # ContraryInstructionIndicator(719): BOOLEAN
-    class ContraryInstructionIndicator:
-        tag: int = 719
-
-    # PriorSpreadIndicator(720): BOOLEAN
-    class PriorSpreadIndicator:
-        tag: int = 720
-
-    # PosMaintRptID(721): STRING
-    class PosMaintRptID:
-        tag: int = 721
-
-    # PosMaintStatus(722): INT
-    class PosMaintStatus:
-        tag: int = 722
-        ACCEPTED: int = 0
-        ACCEPTEDWITHWARNINGS: int = 1
-        REJECTED: int = 2
-        COMPLETED: int = 3
-        COMPLETEDWITHWARNINGS: int = 4
-
-    # PosMaintResult(723): INT
-    class PosMaintResult:
-        tag: int = 723
-        SUCCESSFULCOMPLETION: int = 0
-        REJECTED: int = 1
-        OTHER: int = 99
-
-    # PosReqType(724): INT
-    class PosReqType:
-        tag: int = 724
-        POSITIONS: int = 0
-        TRADES: int = 1
-        EXERCISES: int = 2
-        ASSIGNMENTS: int = 3
-
-    # ResponseTransportType(725): INT
-    class ResponseTransportType:
-        tag: int = 725
-        INBAND: int = 0
-        OUTOFBAND: int = 1
-
-    # ResponseDestination(726): STRING
-    class ResponseDestination:
-        tag: int = 726
-
-    # TotalNumPosReports(727): INT
-    class TotalNumPosReports:
-        tag: int = 727
-
-    # PosReqResult(728): INT
-    class PosReqResult:
-        tag: int = 728
-        VALIDREQUEST: int = 0
-        INVALIDORUNSUPPORTEDREQUEST: int = 1
-        NOPOSITIONSFOUNDTHATMATCHCRITERIA: int = 2
-        NOTAUTHORIZEDTOREQUESTPOSITIONS: int = 3
-        REQUESTFORPOSITIONNOTSUPPORTED: int = 4
-        OTHER: int = 99
-
-    # PosReqStatus(729): INT
-    class PosReqStatus:
-        tag: int = 729
-        COMPLETED: int = 0
-        COMPLETEDWITHWARNINGS: int = 1
-        REJECTED: int = 2
-
-    # SettlPrice(730): PRICE
-    class SettlPrice:
-        tag: int = 730
-
-    # SettlPriceType(731): INT
-    class SettlPriceType:
-        tag: int = 731
-        FINAL: int = 1
-        THEORETICAL: int = 2
-
-    # UnderlyingSettlPrice(732): PRICE
-    class UnderlyingSettlPrice:
-        tag: int = 732
-
-    # UnderlyingSettlPriceType(733): INT
-    class UnderlyingSettlPriceType:
-        tag: int = 733
-
-    # PriorSettlPrice(734): PRICE
-    class PriorSettlPrice:
-        tag: int = 734
-
-    # NoQuoteQualifiers(735): NUMINGROUP
-    class NoQuoteQualifiers:
-        tag: int = 735
-
-    # AllocSettlCurrency(736): CURRENCY
-    class AllocSettlCurrency:
-        tag: int = 736
-
-    # AllocSettlCurrAmt(737): AMT
-    class AllocSettlCurrAmt:
-        tag: int = 737
-
-    # InterestAtMaturity(738): AMT
-    class InterestAtMaturity:
-        tag: int = 738
-
-    # LegDatedDate(739): LOCALMKTDATE
-    class LegDatedDate:
-        tag: int = 739
-
-    # LegPool(740): STRING
-    class LegPool:
-        tag: int = 740
-
-    # AllocInterestAtMaturity(741): AMT
-    class AllocInterestAtMaturity:
-        tag: int = 741
-
-    # AllocAccruedInterestAmt(742): AMT
-    class AllocAccruedInterestAmt:
-        tag: int = 742
-
-    # DeliveryDate(743): LOCALMKTDATE
-    class DeliveryDate:
-        tag: int = 743
-
-    # AssignmentMethod(744): CHAR
-    class AssignmentMethod:
-        tag: int = 744
-        PRORATA: str = 'P'
-        RANDOM: str = 'R'
-
-    # AssignmentUnit(745): QTY
-    class AssignmentUnit:
-        tag: int = 745
-
-    # OpenInterest(746): AMT
-    class OpenInterest:
-        tag: int = 746
-
-    # ExerciseMethod(747): CHAR
-    class ExerciseMethod:
-        tag: int = 747
-        AUTOMATIC: str = 'A'
-        MANUAL: str = 'M'
-
-    # TotNumTradeReports(748): INT
-    class TotNumTradeReports:
-        tag: int = 748
-
-    # TradeRequestResult(749): INT
-    class TradeRequestResult:
-        tag: int = 749
-        SUCCESSFUL: int = 0
-        INVALIDORUNKNOWNINSTRUMENT: int = 1
-        INVALIDTYPEOFTRADEREQUESTED: int = 2
-        INVALIDPARTIES: int = 3
-        INVALIDTRANSPORTTYPEREQUESTED: int = 4
-        INVALIDDESTINATIONREQUESTED: int = 5
-        TRADEREQUESTTYPENOTSUPPORTED: int = 8
-        UNAUTHORIZEDFORTRADECAPTUREREPORTREQUEST: int = 9
-        OTHER: int = 99
-
-    # TradeRequestStatus(750): INT
-    class TradeRequestStatus:
-        tag: int = 750
-        ACCEPTED: int = 0
-        COMPLETED: int = 1
-        REJECTED: int = 2
-
-    # TradeReportRejectReason(751): INT
-    class TradeReportRejectReason:
-        tag: int = 751
-        SUCCESSFULDEFAULT: int = 0
-        INVALIDPARTYINFORMATION: int = 1
-        UNKNOWNINSTRUMENT: int = 2
-        UNAUTHORIZEDTOREPORTTRADES: int = 3
-        INVALIDTRADETYPE: int = 4
-        OTHER: int = 99
-
-    # SideMultiLegReportingType(752): INT
-    class SideMultiLegReportingType:
-        tag: int = 752
-        SINGLESECURITY: int = 1
-        INDIVIDUALLEGOFAMULTILEGSECURITY: int = 2
-        MULTILEGSECURITY: int = 3
-
-    # NoPosAmt(753): NUMINGROUP
-    class NoPosAmt:
-        tag: int = 753
-
-    # AutoAcceptIndicator(754): BOOLEAN
-    class AutoAcceptIndicator:
-        tag: int = 754
-
-    # AllocReportID(755): STRING
-    class AllocReportID:
-        tag: int = 755
-
-    # NoNested2PartyIDs(756): NUMINGROUP
-    class NoNested2PartyIDs:
-        tag: int = 756
-
-    # Nested2PartyID(757): STRING
-    class Nested2PartyID:
-        tag: int = 757
-
-    # Nested2PartyIDSource(758): CHAR
-    class Nested2PartyIDSource:
-        tag: int = 758
-
-    # Nested2PartyRole(759): INT
-    class Nested2PartyRole:
-        tag: int = 759
-
-    # Nested2PartySubID(760): STRING
-    class Nested2PartySubID:
-        tag: int = 760
-
-    # BenchmarkSecurityIDSource(761): STRING
-    class BenchmarkSecurityIDSource:
-        tag: int = 761
-
-    # SecuritySubType(762): STRING
-    class SecuritySubType:
-        tag: int = 762
-
-    # UnderlyingSecuritySubType(763): STRING
-    class UnderlyingSecuritySubType:
-        tag: int = 763
-
-    # LegSecuritySubType(764): STRING
-    class LegSecuritySubType:
-        tag: int = 764
-
-    # AllowableOneSidednessPct(765): PERCENTAGE
-    class AllowableOneSidednessPct:
-        tag: int = 765
-
-    # AllowableOneSidednessValue(766): AMT
-    class AllowableOneSidednessValue:
-        tag: int = 766
-
-    # AllowableOneSidednessCurr(767): CURRENCY
-    class AllowableOneSidednessCurr:
-        tag: int = 767
-
-    # NoTrdRegTimestamps(768): NUMINGROUP
-    class NoTrdRegTimestamps:
-        tag: int = 768
-
-    # TrdRegTimestamp(769): UTCTIMESTAMP
-    class TrdRegTimestamp:
-        tag: int = 769
-
-    # TrdRegTimestampType(770): INT
-    class TrdRegTimestampType:
-        tag: int = 770
-        EXECUTIONTIME: int = 1
-        TIMEIN: int = 2
-        TIMEOUT: int = 3
-        BROKERRECEIPT: int = 4
-        BROKEREXECUTION: int = 5
-
-    # TrdRegTimestampOrigin(771): STRING
-    class TrdRegTimestampOrigin:
-        tag: int = 771
-
-    # ConfirmRefID(772): STRING
-    class ConfirmRefID:
-        tag: int = 772
-
-    # ConfirmType(773): INT
-    class ConfirmType:
-        tag: int = 773
-        STATUS: int = 1
-        CONFIRMATION: int = 2
-        CONFIRMATIONREQUESTREJECTED: int = 3
-
-    # ConfirmRejReason(774): INT
-    class ConfirmRejReason:
-        tag: int = 774
-        MISMATCHEDACCOUNT: int = 1
-        MISSINGSETTLEMENTINSTRUCTIONS: int = 2
-        OTHER: int = 99
-
-    # BookingType(775): INT
-    class BookingType:
-        tag: int = 775
-        REGULARBOOKING: int = 0
-        CFDCONTRACTFORDIFFERENCE: int = 1
-        TOTALRETURNSWAP: int = 2
-
-    # IndividualAllocRejCode(776): INT
-    class IndividualAllocRejCode:
-        tag: int = 776
-
-    # SettlInstMsgID(777): STRING
-    class SettlInstMsgID:
-        tag: int = 777
-
-    # NoSettlInst(778): NUMINGROUP
-    class NoSettlInst:
-        tag: int = 778
-
-    # LastUpdateTime(779): UTCTIMESTAMP
-    class LastUpdateTime:
-        tag: int = 779
-
-    # AllocSettlInstType(780): INT
-    class AllocSettlInstType:
-        tag: int = 780
-        USEDEFAULTINSTRUCTIONS: int = 0
-        DERIVEFROMPARAMETERSPROVIDED: int = 1
-        FULLDETAILSPROVIDED: int = 2
-        SSIDBIDSPROVIDED: int = 3
-        PHONEFORINSTRUCTIONS: int = 4
-
-    # NoSettlPartyIDs(781): NUMINGROUP
-    class NoSettlPartyIDs:
-        tag: int = 781
-
-    # SettlPartyID(782): STRING
-    class SettlPartyID:
-        tag: int = 782
-
-    # SettlPartyIDSource(783): CHAR
-    class SettlPartyIDSource:
-        tag: int = 783
-
-    # SettlPartyRole(784): INT
-    class SettlPartyRole:
-        tag: int = 784
-
-    # SettlPartySubID(785): STRING
-    class SettlPartySubID:
-        tag: int = 785
-
-    # SettlPartySubIDType(786): INT
-    class SettlPartySubIDType:
-        tag: int = 786
-
-    # DlvyInstType(787): CHAR
-    class DlvyInstType:
-        tag: int = 787
-        CASH: str = 'C'
-        SECURITIES: str = 'S'
-
-    # TerminationType(788): INT
-    class TerminationType:
-        tag: int = 788
-        OVERNIGHT: int = 1
-        TERM: int = 2
-        FLEXIBLE: int = 3
-        OPEN: int = 4
-
-    # NextExpectedMsgSeqNum(789): SEQNUM
-    class NextExpectedMsgSeqNum:
-        tag: int = 789
-
-    # OrdStatusReqID(790): STRING
-    class OrdStatusReqID:
-        tag: int = 790
-
-    # SettlInstReqID(791): STRING
-    class SettlInstReqID:
-        tag: int = 791
-
-    # SettlInstReqRejCode(792): INT
-    class SettlInstReqRejCode:
-        tag: int = 792
-        UNABLETOPROCESSREQUEST: int = 0
-        UNKNOWNACCOUNT: int = 1
-        NOMATCHINGSETTLEMENTINSTRUCTIONSFOUND: int = 2
-        OTHER: int = 99
-
-    # SecondaryAllocID(793): STRING
-    class SecondaryAllocID:
-        tag: int = 793
-
-    # AllocReportType(794): INT
-    class AllocReportType:
-        tag: int = 794
-        SELLSIDECALCULATEDUSINGPRELIMINARY: int = 3
-        SELLSIDECALCULATEDWITHOUTPRELIMINARY: int = 4
-        WAREHOUSERECAP: int = 5
-        REQUESTTOINTERMEDIARY: int = 8
-
-    # AllocReportRefID(795): STRING
-    class AllocReportRefID:
-        tag: int = 795
-
-    # AllocCancReplaceReason(796): INT
-    class AllocCancReplaceReason:
-        tag: int = 796
-        ORIGINALDETAILSINCORRECT: int = 1
-        CHANGEINUNDERLYINGORDERDETAILS: int = 2
-        OTHER: int = 99
-
-    # CopyMsgIndicator(797): BOOLEAN
-    class CopyMsgIndicator:
-        tag: int = 797
-
-    # AllocAccountType(798): INT
-    class AllocAccountType:
-        tag: int = 798
-        ACCOUNTISCARRIEDONCUSTOMERSIDEOFBOOKS: int = 1
-        ACCOUNTISCARRIEDONNONCUSTOMERSIDEOFBOOKS: int = 2
-        HOUSETRADER: int = 3
-        FLOORTRADER: int = 4
-        ACCOUNTISCARRIEDONNONCUSTOMERSIDEOFBOOKSANDISCROSSMARGINED: int = 6
-        ACCOUNTISHOUSETRADERANDISCROSSMARGINED: int = 7
-        JBO: int = 8
-
-    # OrderAvgPx(799): PRICE
-    class OrderAvgPx:
-        tag: int = 799
-
-    # OrderBookingQty(800): QTY
-    class OrderBookingQty:
-        tag: int = 800
-
-    # NoSettlPartySubIDs(801): NUMINGROUP
-    class NoSettlPartySubIDs:
-        tag: int = 801
-
-    # NoPartySubIDs(802): NUMINGROUP
-    class NoPartySubIDs:
-        tag: int = 802
-
-    # PartySubIDType(803): INT
-    class PartySubIDType:
-        tag: int = 803
-        FIRM: int = 1
-        SECURITIESACCOUNTNUMBER: int = 10
-        REGISTRATIONNUMBER: int = 11
-        REGISTEREDADDRESS_12: int = 12
-        REGULATORYSTATUS: int = 13
-        REGISTRATIONNAME: int = 14
-        CASHACCOUNT: int = 15
-        BIC: int = 16
-        CSDPARTICIPANTMEMBERCODE: int = 17
-        REGISTEREDADDRESS_18: int = 18
-        FUNDACCOUNTNAME: int = 19
-        PERSON: int = 2
-        TELEXNUMBER: int = 20
-        FAXNUMBER: int = 21
-        SECURITIESACCOUNTNAME: int = 22
-        CASHACCOUNTNAME: int = 23
-        DEPARTMENT: int = 24
-        LOCATIONDESK: int = 25
-        POSITIONACCOUNTTYPE: int = 26
-        SYSTEM: int = 3
-        APPLICATION: int = 4
-        RESERVEDANDAVAILABLEFORBILATERALLYAGREEDUPONUSERDEFINEDVALUES: int = 4000
-        FULLLEGALNAMEOFFIRM: int = 5
-        POSTALADDRESS: int = 6
-        PHONENUMBER: int = 7
-        EMAILADDRESS: int = 8
-        CONTACTNAME: int = 9
-
-    # NoNestedPartySubIDs(804): NUMINGROUP
-    class NoNestedPartySubIDs:
-        tag: int = 804
-
-    # NestedPartySubIDType(805): INT
-    class NestedPartySubIDType:
-        tag: int = 805
-
-    # NoNested2PartySubIDs(806): NUMINGROUP
-    class NoNested2PartySubIDs:
-        tag: int = 806
-
-    # Nested2PartySubIDType(807): INT
-    class Nested2PartySubIDType:
-        tag: int = 807
-
-    # AllocIntermedReqType(808): INT
-    class AllocIntermedReqType:
-        tag: int = 808
-        PENDINGACCEPT: int = 1
-        PENDINGRELEASE: int = 2
-        PENDINGREVERSAL: int = 3
-        ACCEPT: int = 4
-        BLOCKLEVELREJECT: int = 5
-        ACCOUNTLEVELREJECT: int = 6
-
-    # UnderlyingPx(810): PRICE
-    class UnderlyingPx:
-        tag: int = 810
-
-    # PriceDelta(811): FLOAT
-    class PriceDelta:
-        tag: int = 811
-
-    # ApplQueueMax(812): INT
-    class ApplQueueMax:
-        tag: int = 812
-
-    # ApplQueueDepth(813): INT
-    class ApplQueueDepth:
-        tag: int = 813
-
-    # ApplQueueResolution(814): INT
-    class ApplQueueResolution:
-        tag: int = 814
-        NOACTIONTAKEN: int = 0
-        QUEUEFLUSHED: int = 1
-        OVERLAYLAST: int = 2
-        ENDSESSION: int = 3
-
-    # ApplQueueAction(815): INT
-    class ApplQueueAction:
-        tag: int = 815
-        NOACTIONTAKEN: int = 0
-        QUEUEFLUSHED: int = 1
-        OVERLAYLAST: int = 2
-        ENDSESSION: int = 3
-
-    # NoAltMDSource(816): NUMINGROUP
-    class NoAltMDSource:
-        tag: int = 816
-
-    # AltMDSourceID(817): STRING
-    class AltMDSourceID:
-        tag: int = 817
-
-    # SecondaryTradeReportID(818): STRING
-    class SecondaryTradeReportID:
-        tag: int = 818
-
-    # AvgPxIndicator(819): INT
-    class AvgPxIndicator:
-        tag: int = 819
-        NOAVERAGEPRICING: int = 0
-        TRADEAVERAGEPRICEGROUP: int = 1
-        LASTTRADEAVERAGEPRICEGROUP: int = 2
-
-    # TradeLinkID(820): STRING
-    class TradeLinkID:
-        tag: int = 820
-
-    # OrderInputDevice(821): STRING
-    class OrderInputDevice:
-        tag: int = 821
-
-    # UnderlyingTradingSessionID(822): STRING
-    class UnderlyingTradingSessionID:
-        tag: int = 822
-
-    # UnderlyingTradingSessionSubID(823): STRING
-    class UnderlyingTradingSessionSubID:
-        tag: int = 823
-
-    # TradeLegRefID(824): STRING
-    class TradeLegRefID:
-        tag: int = 824
-
-    # ExchangeRule(825): STRING
-    class ExchangeRule:
-        tag: int = 825
-
-    # TradeAllocIndicator(826): INT
-    class TradeAllocIndicator:
-        tag: int = 826
-        ALLOCATIONNOTREQUIRED: int = 0
-        ALLOCATIONREQUIREDALLOCATIONINFORMATIONNOTPROVIDED: int = 1
-        USEALLOCATIONPROVIDEDWITHTHETRADE: int = 2
-
-    # ExpirationCycle(827): INT
-    class ExpirationCycle:
-        tag: int = 827
-        EXPIREONTRADINGSESSIONCLOSE: int = 0
-        EXPIREONTRADINGSESSIONOPEN: int = 1
-
-    # TrdType(828): INT
-    class TrdType:
-        tag: int = 828
-        REGULARTRADE: int = 0
-        BLOCKTRADE: int = 1
-        AFTERHOURSTRADE: int = 10
-        EFP: int = 2
-        TRANSFER: int = 3
-        LATETRADE: int = 4
-        TTRADE: int = 5
-        WEIGHTEDAVERAGEPRICETRADE: int = 6
-        BUNCHEDTRADE: int = 7
-        LATEBUNCHEDTRADE: int = 8
-        PRIORREFERENCEPRICETRADE: int = 9
-
-    # TrdSubType(829): INT
-    class TrdSubType:
-        tag: int = 829
-
-    # TransferReason(830): STRING
-    class TransferReason:
-        tag: int = 830
-
-    # AsgnReqID(831): STRING
-    class AsgnReqID:
-        tag: int = 831
-
-    # TotNumAssignmentReports(832): INT
-    class TotNumAssignmentReports:
-        tag: int = 832
-
-    # AsgnRptID(833): STRING
-    class AsgnRptID:
-        tag: int = 833
-
-    # ThresholdAmount(834): PRICEOFFSET
-    class ThresholdAmount:
-        tag: int = 834
-
-    # PegMoveType(835): INT
-    class PegMoveType:
-        tag: int = 835
-        FLOATING: int = 0
-        FIXED: int = 1
-
-    # PegOffsetType(836): INT
-    class PegOffsetType:
-        tag: int = 836
-        PRICE: int = 0
-        BASISPOINTS: int = 1
-        TICKS: int = 2
-        PRICETIERLEVEL: int = 3
-
-    # PegLimitType(837): INT
-    class PegLimitType:
-        tag: int = 837
-        ORBETTER: int = 0
-        STRICT: int = 1
-        ORWORSE: int = 2
-
-    # PegRoundDirection(838): INT
-    class PegRoundDirection:
-        tag: int = 838
-        MOREAGGRESSIVE: int = 1
-        MOREPASSIVE: int = 2
-
-    # PeggedPrice(839): PRICE
-    class PeggedPrice:
-        tag: int = 839
-
-    # PegScope(840): INT
-    class PegScope:
-        tag: int = 840
-        LOCALEXCHANGEECNATS: int = 1
-        NATIONAL: int = 2
-        GLOBAL: int = 3
-        NATIONALEXCLUDINGLOCAL: int = 4
-
-    # DiscretionMoveType(841): INT
-    class DiscretionMoveType:
-        tag: int = 841
-        FLOATING: int = 0
-        FIXED: int = 1
-
-    # DiscretionOffsetType(842): INT
-    class DiscretionOffsetType:
-        tag: int = 842
-        PRICE: int = 0
-        BASISPOINTS: int = 1
-        TICKS: int = 2
-        PRICETIERLEVEL: int = 3
-
-    # DiscretionLimitType(843): INT
-    class DiscretionLimitType:
-        tag: int = 843
-        ORBETTER: int = 0
-        STRICT: int = 1
-        ORWORSE: int = 2
-
-    # DiscretionRoundDirection(844): INT
-    class DiscretionRoundDirection:
-        tag: int = 844
-        MOREAGGRESSIVE: int = 1
-        MOREPASSIVE: int = 2
-
-    # DiscretionPrice(845): PRICE
-    class DiscretionPrice:
-        tag: int = 845
-
-    # DiscretionScope(846): INT
-    class DiscretionScope:
-        tag: int = 846
-        LOCALEXCHANGEECNATS: int = 1
-        NATIONAL: int = 2
-        GLOBAL: int = 3
-        NATIONALEXCLUDINGLOCAL: int = 4
-
-    # TargetStrategy(847): INT
-    class TargetStrategy:
-        tag: int = 847
-        VWAP: int = 1
-        RESERVEDANDAVAILABLEFORBILATERALLYAGREEDUPONUSERDEFINEDVALUES: int = 1000
-        PARTICIPATE: int = 2
-        MININIZEMARKETIMPACT: int = 3
-
-    # TargetStrategyParameters(848): STRING
-    class TargetStrategyParameters:
-        tag: int = 848
-
-    # ParticipationRate(849): PERCENTAGE
-    class ParticipationRate:
-        tag: int = 849
-
-    # TargetStrategyPerformance(850): FLOAT
-    class TargetStrategyPerformance:
-        tag: int = 850
-
-    # LastLiquidityInd(851): INT
-    class LastLiquidityInd:
-        tag: int = 851
-        ADDEDLIQUIDITY: int = 1
-        REMOVEDLIQUIDITY: int = 2
-        LIQUIDITYROUTEDOUT: int = 3
-
-    # PublishTrdIndicator(852): BOOLEAN
-    class PublishTrdIndicator:
-        tag: int = 852
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # ShortSaleReason(853): INT
-    class ShortSaleReason:
-        tag: int = 853
-        DEALERSOLDSHORT: int = 0
-        DEALERSOLDSHORTEXEMPT: int = 1
-        SELLINGCUSTOMERSOLDSHORT: int = 2
-        SELLINGCUSTOMERSOLDSHORTEXEMPT: int = 3
-        QSRORAGUCONTRASIDESOLDSHORT: int = 4
-        QSRORAGUCONTRASIDESOLDSHORTEXEMPT: int = 5
-
-    # QtyType(854): INT
-    class QtyType:
-        tag: int = 854
-        UNITS: int = 0
-        CONTRACTS: int = 1
-
-    # SecondaryTrdType(855): INT
-    class SecondaryTrdType:
-        tag: int = 855
-
-    # TradeReportType(856): INT
-    class TradeReportType:
-        tag: int = 856
-        SUBMIT: int = 0
-        ALLEGED: int = 1
-        ACCEPT: int = 2
-        DECLINE: int = 3
-        ADDENDUM: int = 4
-        NOWAS: int = 5
-        TRADEREPORTCANCEL: int = 6
-        LOCKEDINTRADEBREAK: int = 7
-
-    # AllocNoOrdersType(857): INT
-    class AllocNoOrdersType:
-        tag: int = 857
-        NOTSPECIFIED: int = 0
-        EXPLICITLISTPROVIDED: int = 1
-
-    # SharedCommission(858): AMT
-    class SharedCommission:
-        tag: int = 858
-
-    # ConfirmReqID(859): STRING
-    class ConfirmReqID:
-        tag: int = 859
-
-    # AvgParPx(860): PRICE
-    class AvgParPx:
-        tag: int = 860
-
-    # ReportedPx(861): PRICE
-    class ReportedPx:
-        tag: int = 861
-
-    # NoCapacities(862): NUMINGROUP
-    class NoCapacities:
-        tag: int = 862
-
-    # OrderCapacityQty(863): QTY
-    class OrderCapacityQty:
-        tag: int = 863
-
-    # NoEvents(864): NUMINGROUP
-    class NoEvents:
-        tag: int = 864
-
-    # EventType(865): INT
-    class EventType:
-        tag: int = 865
-        PUT: int = 1
-        CALL: int = 2
-        TENDER: int = 3
-        SINKINGFUNDCALL: int = 4
-        OTHER: int = 99
-
-    # EventDate(866): LOCALMKTDATE
-    class EventDate:
-        tag: int = 866
-
-    # EventPx(867): PRICE
-    class EventPx:
-        tag: int = 867
-
-    # EventText(868): STRING
-    class EventText:
-        tag: int = 868
-
-    # PctAtRisk(869): PERCENTAGE
-    class PctAtRisk:
-        tag: int = 869
-
-    # NoInstrAttrib(870): NUMINGROUP
-    class NoInstrAttrib:
-        tag: int = 870
-
-    # InstrAttribType(871): INT
-    class InstrAttribType:
-        tag: int = 871
-        FLAT: int = 1
-        ORIGINALISSUEDISCOUNT: int = 10
-        CALLABLEPUTTABLE: int = 11
-        ESCROWEDTOMATURITY: int = 12
-        ESCROWEDTOREDEMPTIONDATE: int = 13
-        PREREFUNDED: int = 14
-        INDEFAULT: int = 15
-        UNRATED: int = 16
-        TAXABLE: int = 17
-        INDEXED: int = 18
-        SUBJECTTOALTERNATIVEMINIMUMTAX: int = 19
-        ZEROCOUPON: int = 2
-        ORIGINALISSUEDISCOUNTPRICE: int = 20
-        CALLABLEBELOWMATURITYVALUE: int = 21
-        CALLABLEWITHOUTNOTICEBYMAILTOHOLDERUNLESSREGISTERED: int = 22
-        INTERESTBEARING: int = 3
-        NOPERIODICPAYMENTS: int = 4
-        VARIABLERATE: int = 5
-        LESSFEEFORPUT: int = 6
-        STEPPEDCOUPON: int = 7
-        COUPONPERIOD: int = 8
-        WHENISSUED: int = 9
-        TEXT: int = 99
-
-    # InstrAttribValue(872): STRING
-    class InstrAttribValue:
-        tag: int = 872
-
-    # DatedDate(873): LOCALMKTDATE
-    class DatedDate:
-        tag: int = 873
-
-    # InterestAccrualDate(874): LOCALMKTDATE
-    class InterestAccrualDate:
-        tag: int = 874
-
-    # CPProgram(875): INT
-    class CPProgram:
-        tag: int = 875
-        _3A3: int = 1
-        _42: int = 2
-        OTHER: int = 99
-
-    # CPRegType(876): STRING
-    class CPRegType:
-        tag: int = 876
-
-    # UnderlyingCPProgram(877): STRING
-    class UnderlyingCPProgram:
-        tag: int = 877
-
-    # UnderlyingCPRegType(878): STRING
-    class UnderlyingCPRegType:
-        tag: int = 878
-
-    # UnderlyingQty(879): QTY
-    class UnderlyingQty:
-        tag: int = 879
-
-    # TrdMatchID(880): STRING
-    class TrdMatchID:
-        tag: int = 880
-
-    # SecondaryTradeReportRefID(881): STRING
-    class SecondaryTradeReportRefID:
-        tag: int = 881
-
-    # UnderlyingDirtyPrice(882): PRICE
-    class UnderlyingDirtyPrice:
-        tag: int = 882
-
-    # UnderlyingEndPrice(883): PRICE
-    class UnderlyingEndPrice:
-        tag: int = 883
-
-    # UnderlyingStartValue(884): AMT
-    class UnderlyingStartValue:
-        tag: int = 884
-
-    # UnderlyingCurrentValue(885): AMT
-    class UnderlyingCurrentValue:
-        tag: int = 885
-
-    # UnderlyingEndValue(886): AMT
-    class UnderlyingEndValue:
-        tag: int = 886
-
-    # NoUnderlyingStips(887): NUMINGROUP
-    class NoUnderlyingStips:
-        tag: int = 887
-
-    # UnderlyingStipType(888): STRING
-    class UnderlyingStipType:
-        tag: int = 888
-
-    # UnderlyingStipValue(889): STRING
-    class UnderlyingStipValue:
-        tag: int = 889
-
-    # MaturityNetMoney(890): AMT
-    class MaturityNetMoney:
-        tag: int = 890
-
-    # MiscFeeBasis(891): INT
-    class MiscFeeBasis:
-        tag: int = 891
-        ABSOLUTE: int = 0
-        PERUNIT: int = 1
-        PERCENTAGE: int = 2
-
-    # TotNoAllocs(892): INT
-    class TotNoAllocs:
-        tag: int = 892
-
-    # LastFragment(893): BOOLEAN
-    class LastFragment:
-        tag: int = 893
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # CollReqID(894): STRING
-    class CollReqID:
-        tag: int = 894
-
-    # CollAsgnReason(895): INT
-    class CollAsgnReason:
-        tag: int = 895
-        INITIAL: int = 0
-        SCHEDULED: int = 1
-        TIMEWARNING: int = 2
-        MARGINDEFICIENCY: int = 3
-        MARGINEXCESS: int = 4
-        FORWARDCOLLATERALDEMAND: int = 5
-        EVENTOFDEFAULT: int = 6
-        ADVERSETAXEVENT: int = 7
-
-    # CollInquiryQualifier(896): INT
-    class CollInquiryQualifier:
-        tag: int = 896
-        TRADEDATE: int = 0
-        GCINSTRUMENT: int = 1
-        COLLATERALINSTRUMENT: int = 2
-        SUBSTITUTIONELIGIBLE: int = 3
-        NOTASSIGNED: int = 4
-        PARTIALLYASSIGNED: int = 5
-        FULLYASSIGNED: int = 6
-        OUTSTANDINGTRADES: int = 7
-
-    # NoTrades(897): NUMINGROUP
-    class NoTrades:
-        tag: int = 897
-
-    # MarginRatio(898): PERCENTAGE
-    class MarginRatio:
-        tag: int = 898
-
-    # MarginExcess(899): AMT
-    class MarginExcess:
-        tag: int = 899
-
-    # TotalNetValue(900): AMT
-    class TotalNetValue:
-        tag: int = 900
-
-    # CashOutstanding(901): AMT
-    class CashOutstanding:
-        tag: int = 901
-
-    # CollAsgnID(902): STRING
-    class CollAsgnID:
-        tag: int = 902
-
-    # CollAsgnTransType(903): INT
-    class CollAsgnTransType:
-        tag: int = 903
-        NEW: int = 0
-        REPLACE: int = 1
-        CANCEL: int = 2
-        RELEASE: int = 3
-        REVERSE: int = 4
-
-    # CollRespID(904): STRING
-    class CollRespID:
-        tag: int = 904
-
-    # CollAsgnRespType(905): INT
-    class CollAsgnRespType:
-        tag: int = 905
-        RECEIVED: int = 0
-        ACCEPTED: int = 1
-        DECLINED: int = 2
-        REJECTED: int = 3
-
-    # CollAsgnRejectReason(906): INT
-    class CollAsgnRejectReason:
-        tag: int = 906
-        UNKNOWNDEAL: int = 0
-        UNKNOWNORINVALIDINSTRUMENT: int = 1
-        UNAUTHORIZEDTRANSACTION: int = 2
-        INSUFFICIENTCOLLATERAL: int = 3
-        INVALIDTYPEOFCOLLATERAL: int = 4
-        EXCESSIVESUBSTITUTION: int = 5
-        OTHER: int = 99
-
-    # CollAsgnRefID(907): STRING
-    class CollAsgnRefID:
-        tag: int = 907
-
-    # CollRptID(908): STRING
-    class CollRptID:
-        tag: int = 908
-
-    # CollInquiryID(909): STRING
-    class CollInquiryID:
-        tag: int = 909
-
-    # CollStatus(910): INT
-    class CollStatus:
-        tag: int = 910
-        UNASSIGNED: int = 0
-        PARTIALLYASSIGNED: int = 1
-        ASSIGNMENTPROPOSED: int = 2
-        ASSIGNEDACCEPTED: int = 3
-        CHALLENGED: int = 4
-
-    # TotNumReports(911): INT
-    class TotNumReports:
-        tag: int = 911
-
-    # LastRptRequested(912): BOOLEAN
-    class LastRptRequested:
-        tag: int = 912
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # AgreementDesc(913): STRING
-    class AgreementDesc:
-        tag: int = 913
-
-    # AgreementID(914): STRING
-    class AgreementID:
-        tag: int = 914
-
-    # AgreementDate(915): LOCALMKTDATE
-    class AgreementDate:
-        tag: int = 915
-
-    # StartDate(916): LOCALMKTDATE
-    class StartDate:
-        tag: int = 916
-
-    # EndDate(917): LOCALMKTDATE
-    class EndDate:
-        tag: int = 917
-
-    # AgreementCurrency(918): CURRENCY
-    class AgreementCurrency:
-        tag: int = 918
-
-    # DeliveryType(919): INT
-    class DeliveryType:
-        tag: int = 919
-        VERSUSPAYMENT: int = 0
-        FREE: int = 1
-        TRIPARTY: int = 2
-        HOLDINCUSTODY: int = 3
-
-    # EndAccruedInterestAmt(920): AMT
-    class EndAccruedInterestAmt:
-        tag: int = 920
-
-    # StartCash(921): AMT
-    class StartCash:
-        tag: int = 921
-
-    # EndCash(922): AMT
-    class EndCash:
-        tag: int = 922
-
-    # UserRequestID(923): STRING
-    class UserRequestID:
-        tag: int = 923
-
-    # UserRequestType(924): INT
-    class UserRequestType:
-        tag: int = 924
-        LOGONUSER: int = 1
-        LOGOFFUSER: int = 2
-        CHANGEPASSWORDFORUSER: int = 3
-        REQUESTINDIVIDUALUSERSTATUS: int = 4
-
-    # NewPassword(925): STRING
-    class NewPassword:
-        tag: int = 925
-
-    # UserStatus(926): INT
-    class UserStatus:
-        tag: int = 926
-        LOGGEDIN: int = 1
-        NOTLOGGEDIN: int = 2
-        USERNOTRECOGNISED: int = 3
-        PASSWORDINCORRECT: int = 4
-        PASSWORDCHANGED: int = 5
-        OTHER: int = 6
-
-    # UserStatusText(927): STRING
-    class UserStatusText:
-        tag: int = 927
-
-    # StatusValue(928): INT
-    class StatusValue:
-        tag: int = 928
-        CONNECTED: int = 1
-        NOTCONNECTEDDOWNEXPECTEDUP: int = 2
-        NOTCONNECTEDDOWNEXPECTEDDOWN: int = 3
-        INPROCESS: int = 4
-
-    # StatusText(929): STRING
-    class StatusText:
-        tag: int = 929
-
-    # RefCompID(930): STRING
-    class RefCompID:
-        tag: int = 930
-
-    # RefSubID(931): STRING
-    class RefSubID:
-        tag: int = 931
-
-    # NetworkResponseID(932): STRING
-    class NetworkResponseID:
-        tag: int = 932
-
-    # NetworkRequestID(933): STRING
-    class NetworkRequestID:
-        tag: int = 933
-
-    # LastNetworkResponseID(934): STRING
-    class LastNetworkResponseID:
-        tag: int = 934
-
-    # NetworkRequestType(935): INT
-    class NetworkRequestType:
-        tag: int = 935
-        SNAPSHOT: int = 1
-        SUBSCRIBE: int = 2
-        STOPSUBSCRIBING: int = 4
-        LEVELOFDETAIL: int = 8
-
-    # NoCompIDs(936): NUMINGROUP
-    class NoCompIDs:
-        tag: int = 936
-
-    # NetworkStatusResponseType(937): INT
-    class NetworkStatusResponseType:
-        tag: int = 937
-        FULL: int = 1
-        INCREMENTALUPDATE: int = 2
-
-    # NoCollInquiryQualifier(938): NUMINGROUP
-    class NoCollInquiryQualifier:
-        tag: int = 938
-
-    # TrdRptStatus(939): INT
-    class TrdRptStatus:
-        tag: int = 939
-        ACCEPTED: int = 0
-        REJECTED: int = 1
-
-    # AffirmStatus(940): INT
-    class AffirmStatus:
-        tag: int = 940
-        RECEIVED: int = 1
-        CONFIRMREJECTED: int = 2
-        AFFIRMED: int = 3
-
-    # UnderlyingStrikeCurrency(941): CURRENCY
-    class UnderlyingStrikeCurrency:
-        tag: int = 941
-
-    # LegStrikeCurrency(942): CURRENCY
-    class LegStrikeCurrency:
-        tag: int = 942
-
-    # TimeBracket(943): STRING
-    class TimeBracket:
-        tag: int = 943
-
-    # CollAction(944): INT
-    class CollAction:
-        tag: int = 944
-        RETAIN: int = 0
-        ADD: int = 1
-        REMOVE: int = 2
-
-    # CollInquiryStatus(945): INT
-    class CollInquiryStatus:
-        tag: int = 945
-        ACCEPTED: int = 0
-        ACCEPTEDWITHWARNINGS: int = 1
-        COMPLETED: int = 2
-        COMPLETEDWITHWARNINGS: int = 3
-        REJECTED: int = 4
-
-    # CollInquiryResult(946): INT
-    class CollInquiryResult:
-        tag: int = 946
-        SUCCESSFUL: int = 0
-        INVALIDORUNKNOWNINSTRUMENT: int = 1
-        INVALIDORUNKNOWNCOLLATERALTYPE: int = 2
-        INVALIDPARTIES: int = 3
-        INVALIDTRANSPORTTYPEREQUESTED: int = 4
-        INVALIDDESTINATIONREQUESTED: int = 5
-        NOCOLLATERALFOUNDFORTHETRADESPECIFIED: int = 6
-        NOCOLLATERALFOUNDFORTHEORDERSPECIFIED: int = 7
-        COLLATERALINQUIRYTYPENOTSUPPORTED: int = 8
-        UNAUTHORIZEDFORCOLLATERALINQUIRY: int = 9
-        OTHER: int = 99
-
-    # StrikeCurrency(947): CURRENCY
-    class StrikeCurrency:
-        tag: int = 947
-
-    # NoNested3PartyIDs(948): NUMINGROUP
-    class NoNested3PartyIDs:
-        tag: int = 948
-
-    # Nested3PartyID(949): STRING
-    class Nested3PartyID:
-        tag: int = 949
-
-    # Nested3PartyIDSource(950): CHAR
-    class Nested3PartyIDSource:
-        tag: int = 950
-
-    # Nested3PartyRole(951): INT
-    class Nested3PartyRole:
-        tag: int = 951
-
-    # NoNested3PartySubIDs(952): NUMINGROUP
-    class NoNested3PartySubIDs:
-        tag: int = 952
-
-    # Nested3PartySubID(953): STRING
-    class Nested3PartySubID:
-        tag: int = 953
-
-    # Nested3PartySubIDType(954): INT
-    class Nested3PartySubIDType:
-        tag: int = 954
-
-    # LegContractSettlMonth(955): MONTHYEAR
-    class LegContractSettlMonth:
-        tag: int = 955
-
-    # LegInterestAccrualDate(956): LOCALMKTDATE
-    class LegInterestAccrualDate:
-        tag: int = 956
+from UPA.fields import FieldDictionary
+
+FIX44_Fields = FieldDictionary("FIX44", (
+    (1, 'Account', 'STRING', ()),
+    (2, 'AdvId', 'STRING', ()),
+    (3, 'AdvRefID', 'STRING', ()),
+    (4, 'AdvSide', 'CHAR', (('BUY', 'B'), ('SELL', 'S'), ('TRADE', 'T'), ('CROSS', 'X'),)),
+    (5, 'AdvTransType', 'STRING', (('ADVCANCEL', 'C'), ('ADVNEW', 'N'), ('ADVREPLACE', 'R'),)),
+    (6, 'AvgPx', 'PRICE', ()),
+    (7, 'BeginSeqNo', 'SEQNUM', ()),
+    (8, 'BeginString', 'STRING', ()),
+    (9, 'BodyLength', 'LENGTH', ()),
+    (10, 'CheckSum', 'STRING', ()),
+    (11, 'ClOrdID', 'STRING', ()),
+    (12, 'Commission', 'AMT', ()),
+    (13, 'CommType', 'CHAR', (('PER_UNIT', '1'), ('PERCENT', '2'), ('ABSOLUTE', '3'), ('PCTWAIVEDCSHDISC', '4'), ('PCTWAIVEDENUNITS', '5'), ('PERBOND', '6'),)),
+    (14, 'CumQty', 'QTY', ()),
+    (15, 'Currency', 'CURRENCY', ()),
+    (16, 'EndSeqNo', 'SEQNUM', ()),
+    (17, 'ExecID', 'STRING', ()),
+    (18, 'ExecInst', 'MULTIPLESTRINGVALUE', (('STAYOFFER', '0'), ('NOTHELD', '1'), ('WORK', '2'), ('GOALONG', '3'), ('OVERDAY', '4'), ('HELD', '5'), ('PARTNOTINIT', '6'), ('STRICTSCALE', '7'), ('TRYTOSCALE', '8'), ('STAYBID', '9'), ('NOCROSS', 'A'), ('TRAILSTOPPEG', 'a'), ('OKCROSS', 'B'), ('STRICTLIMIT', 'b'), ('IGNOREPRICECHK', 'c'), ('CALLFIRST', 'C'), ('PEGTOLIMIT', 'd'), ('PERCVOL', 'D'), ('DNI', 'E'), ('WORKTOSTRATEGY', 'e'), ('DNR', 'F'), ('AON', 'G'), ('RESTATEONSYSFAIL', 'H'), ('INSTITONLY', 'I'), ('RESTATEONTRADINGHALT', 'J'), ('CANCELONTRADINGHALT', 'K'), ('LASTPEG', 'L'), ('MIDPRCPEG', 'M'), ('NONNEGO', 'N'), ('OPENPEG', 'O'), ('MARKPEG', 'P'), ('CANCELONSYSFAIL', 'Q'), ('PRIMPEG', 'R'), ('SUSPEND', 'S'), ('CUSTDISPINST', 'U'), ('NETTING', 'V'), ('PEGVWAP', 'W'), ('TRADEALONG', 'X'), ('TRYTOSTOP', 'Y'), ('CXLIFNOTBEST', 'Z'),)),
+    (19, 'ExecRefID', 'STRING', ()),
+    (20, 'ExecTransType', 'CHAR', (('NEW', '0'), ('CANCEL', '1'), ('CORRECT', '2'), ('STATUS', '3'),)),
+    (21, 'HandlInst', 'CHAR', (('AUTOEXECPRIV', '1'), ('AUTOEXECPUB', '2'), ('MANUAL', '3'),)),
+    (22, 'SecurityIDSource', 'STRING', (('CUSIP', '1'), ('SEDOL', '2'), ('QUIK', '3'), ('ISIN', '4'), ('RIC', '5'), ('ISOCURR', '6'), ('ISOCOUNTRY', '7'), ('EXCHSYMB', '8'), ('CTA', '9'), ('BLMBRG', 'A'), ('WERTPAPIER', 'B'), ('DUTCH', 'C'), ('VALOREN', 'D'), ('SICOVAM', 'E'), ('BELGIAN', 'F'), ('COMMON', 'G'), ('CLEARINGHOUSE', 'H'), ('FPML', 'I'), ('OPTIONPRICEREPORTINGAUTHORITY', 'J'),)),
+    (23, 'IOIID', 'STRING', ()),
+    (24, 'IOIOthSvc', 'CHAR', ()),
+    (25, 'IOIQltyInd', 'CHAR', (('HIGH', 'H'), ('LOW', 'L'), ('MEDIUM', 'M'),)),
+    (26, 'IOIRefID', 'STRING', ()),
+    (27, 'IOIQty', 'STRING', ()),
+    (28, 'IOITransType', 'CHAR', (('CANCEL', 'C'), ('NEW', 'N'), ('REPLACE', 'R'),)),
+    (29, 'LastCapacity', 'CHAR', (('A', '1'), ('XA', '2'), ('XP', '3'), ('P', '4'),)),
+    (30, 'LastMkt', 'EXCHANGE', ()),
+    (31, 'LastPx', 'PRICE', ()),
+    (32, 'LastQty', 'QTY', ()),
+    (33, 'NoLinesOfText', 'NUMINGROUP', ()),
+    (34, 'MsgSeqNum', 'SEQNUM', ()),
+    (35, 'MsgType', 'STRING', (('HEARTBEAT', '0'), ('TESTREQUEST', '1'), ('RESENDREQUEST', '2'), ('REJECT', '3'), ('SEQUENCERESET', '4'), ('LOGOUT', '5'), ('IOI', '6'), ('ADVERTISEMENT', '7'), ('EXECUTIONREPORT', '8'), ('ORDERCANCELREJECT', '9'), ('QUOTESTATUSREQUEST', 'a'), ('LOGON', 'A'), ('DERIVATIVESECURITYLIST', 'AA'), ('NEWORDERMULTILEG', 'AB'), ('MULTILEGORDERCANCELREPLACE', 'AC'), ('TRADECAPTUREREPORTREQUEST', 'AD'), ('TRADECAPTUREREPORT', 'AE'), ('ORDERMASSSTATUSREQUEST', 'AF'), ('QUOTEREQUESTREJECT', 'AG'), ('RFQREQUEST', 'AH'), ('QUOTESTATUSREPORT', 'AI'), ('QUOTERESPONSE', 'AJ'), ('CONFIRMATION', 'AK'), ('POSITIONMAINTENANCEREQUEST', 'AL'), ('POSITIONMAINTENANCEREPORT', 'AM'), ('REQUESTFORPOSITIONS', 'AN'), ('REQUESTFORPOSITIONSACK', 'AO'), ('POSITIONREPORT', 'AP'), ('TRADECAPTUREREPORTREQUESTACK', 'AQ'), ('TRADECAPTUREREPORTACK', 'AR'), ('ALLOCATIONREPORT', 'AS'), ('ALLOCATIONREPORTACK', 'AT'), ('CONFIRMATIONACK', 'AU'), ('SETTLEMENTINSTRUCTIONREQUEST', 'AV'), ('ASSIGNMENTREPORT', 'AW'), ('COLLATERALREQUEST', 'AX'), ('COLLATERALASSIGNMENT', 'AY'), ('COLLATERALRESPONSE', 'AZ'), ('NEWS', 'B'), ('MASSQUOTEACKNOWLEDGEMENT', 'b'), ('COLLATERALREPORT', 'BA'), ('COLLATERALINQUIRY', 'BB'), ('NETWORKCOUNTERPARTYSYSTEMSTATUSREQUEST', 'BC'), ('NETWORKCOUNTERPARTYSYSTEMSTATUSRESPONSE', 'BD'), ('USERREQUEST', 'BE'), ('USERRESPONSE', 'BF'), ('COLLATERALINQUIRYACK', 'BG'), ('CONFIRMATIONREQUEST', 'BH'), ('EMAIL', 'C'), ('SECURITYDEFINITIONREQUEST', 'c'), ('SECURITYDEFINITION', 'd'), ('NEWORDERSINGLE', 'D'), ('SECURITYSTATUSREQUEST', 'e'), ('NEWORDERLIST', 'E'), ('ORDERCANCELREQUEST', 'F'), ('SECURITYSTATUS', 'f'), ('ORDERCANCELREPLACEREQUEST', 'G'), ('TRADINGSESSIONSTATUSREQUEST', 'g'), ('ORDERSTATUSREQUEST', 'H'), ('TRADINGSESSIONSTATUS', 'h'), ('MASSQUOTE', 'i'), ('BUSINESSMESSAGEREJECT', 'j'), ('ALLOCATIONINSTRUCTION', 'J'), ('BIDREQUEST', 'k'), ('LISTCANCELREQUEST', 'K'), ('BIDRESPONSE', 'l'), ('LISTEXECUTE', 'L'), ('LISTSTRIKEPRICE', 'm'), ('LISTSTATUSREQUEST', 'M'), ('XMLNONFIX', 'n'), ('LISTSTATUS', 'N'), ('REGISTRATIONINSTRUCTIONS', 'o'), ('REGISTRATIONINSTRUCTIONSRESPONSE', 'p'), ('ALLOCATIONINSTRUCTIONACK', 'P'), ('ORDERMASSCANCELREQUEST', 'q'), ('DONTKNOWTRADEDK', 'Q'), ('QUOTEREQUEST', 'R'), ('ORDERMASSCANCELREPORT', 'r'), ('QUOTE', 'S'), ('NEWORDERCROSS', 's'), ('SETTLEMENTINSTRUCTIONS', 'T'), ('CROSSORDERCANCELREPLACEREQUEST', 't'), ('CROSSORDERCANCELREQUEST', 'u'), ('MARKETDATAREQUEST', 'V'), ('SECURITYTYPEREQUEST', 'v'), ('SECURITYTYPES', 'w'), ('MARKETDATASNAPSHOTFULLREFRESH', 'W'), ('SECURITYLISTREQUEST', 'x'), ('MARKETDATAINCREMENTALREFRESH', 'X'), ('MARKETDATAREQUESTREJECT', 'Y'), ('SECURITYLIST', 'y'), ('QUOTECANCEL', 'Z'), ('DERIVATIVESECURITYLISTREQUEST', 'z'),)),
+    (36, 'NewSeqNo', 'SEQNUM', ()),
+    (37, 'OrderID', 'STRING', ()),
+    (38, 'OrderQty', 'QTY', ()),
+    (39, 'OrdStatus', 'CHAR', (('NEW', '0'), ('PARTIAL', '1'), ('FILLED', '2'), ('DONE', '3'), ('CANCELED', '4'), ('PENDING_CANCEL', '6'), ('STOPPED', '7'), ('REJECTED', '8'), ('SUSPENDED', '9'), ('PENDINGNEW', 'A'), ('CALCULATED', 'B'), ('EXPIRED', 'C'), ('ACCEPTBIDDING', 'D'), ('PENDINGREP', 'E'),)),
+    (40, 'OrdType', 'CHAR', (('MARKET', '1'), ('LIMIT', '2'), ('STOP', '3'), ('STOPLIMIT', '4'), ('MARKETONCLOSE', '5'), ('WITHORWITHOUT', '6'), ('LIMITORBETTER', '7'), ('LIMITWITHORWITHOUT', '8'), ('ONBASIS', '9'), ('ONCLOSE', 'A'), ('LIMITONCLOSE', 'B'), ('FOREXMARKET', 'C'), ('PREVIOUSLYQUOTED', 'D'), ('PREVIOUSLYINDICATED', 'E'), ('FOREXLIMIT', 'F'), ('FOREXSWAP', 'G'), ('FOREXPREVIOUSLYQUOTED', 'H'), ('FUNARI', 'I'), ('MARKETIFTOUCHED', 'J'), ('MARKETWITHLEFTOVERLIMIT', 'K'), ('PREVIOUSFUNDVALUATIONPOINT', 'L'), ('NEXTFUNDVALUATIONPOINT', 'M'), ('PEGGED', 'P'),)),
+    (41, 'OrigClOrdID', 'STRING', ()),
+    (42, 'OrigTime', 'UTCTIMESTAMP', ()),
+    (43, 'PossDupFlag', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (44, 'Price', 'PRICE', ()),
+    (45, 'RefSeqNum', 'SEQNUM', ()),
+    (46, 'RelatdSym', 'STRING', ()),
+    (47, 'Rule80A', 'CHAR', (('AGENCYSINGLE', 'A'), ('SHTEXTRANA', 'B'), ('PRGNONINDEXARBMEM', 'C'), ('PRGINDEXARBMEM', 'D'), ('MARKETMAKER', 'E'), ('SHTEXTRANW', 'F'), ('SHTEXTRANI', 'H'), ('INVINESTOR', 'I'), ('PRGNONINDEXARBINV', 'J'), ('PRGINDEXARBINV', 'K'), ('SHTEXTRANMEM', 'L'), ('PRGNONINDEXARBOTHMEM', 'M'), ('PRGINDEXARBOTHMEM', 'N'), ('COMPETINGDEALER', 'O'), ('PRINCIPAL', 'P'), ('COMPDEALER1', 'R'), ('SPECIALIST', 'S'), ('COMPDEALER2', 'T'), ('PRGINDEXARBOTHAGN', 'U'), ('ALLOTHERAGN', 'W'), ('SHTEXTRANMEMWT', 'X'), ('PRGNONINDEXARBOTHAGN', 'Y'), ('SHTEXTRANNONMEM', 'Z'),)),
+    (48, 'SecurityID', 'STRING', ()),
+    (49, 'SenderCompID', 'STRING', ()),
+    (50, 'SenderSubID', 'STRING', ()),
+    (51, 'SendingDate', 'LOCALMKTDATE', ()),
+    (52, 'SendingTime', 'UTCTIMESTAMP', ()),
+    (53, 'Quantity', 'QTY', ()),
+    (54, 'Side', 'CHAR', (('BUY', '1'), ('SELL', '2'), ('BUYMIN', '3'), ('SELLPLUS', '4'), ('SELLSHT', '5'), ('SELLSHTEX', '6'), ('UNDISC', '7'), ('CROSS', '8'), ('CROSSSHORT', '9'), ('CROSSSHORTEX', 'A'), ('ASDEFINED', 'B'), ('OPPOSITE', 'C'), ('SUBSCRIBE', 'D'), ('REDEEM', 'E'), ('LENDFINANCING', 'F'), ('BORROWFINANCING', 'G'),)),
+    (55, 'Symbol', 'STRING', ()),
+    (56, 'TargetCompID', 'STRING', ()),
+    (57, 'TargetSubID', 'STRING', ()),
+    (58, 'Text', 'STRING', ()),
+    (59, 'TimeInForce', 'CHAR', (('DAY', '0'), ('GOODTILLCANCEL', '1'), ('ATTHEOPENING', '2'), ('IMMEDIATEORCANCEL', '3'), ('FILLORKILL', '4'), ('GOODTILLCROSSING', '5'), ('GOODTILLDATE', '6'), ('ATTHECLOSE', '7'),)),
+    (60, 'TransactTime', 'UTCTIMESTAMP', ()),
+    (61, 'Urgency', 'CHAR', (('NORMAL', '0'), ('FLASH', '1'), ('BACKGROUND', '2'),)),
+    (62, 'ValidUntilTime', 'UTCTIMESTAMP', ()),
+    (63, 'SettlType', 'CHAR', (('REGULAR', '0'), ('CASH', '1'), ('NEXTDAY', '2'), ('T2', '3'), ('T3', '4'), ('T4', '5'), ('FUTURE', '6'), ('WHENISSUED', '7'), ('T5', '8'), ('T1', '9'),)),
+    (64, 'SettlDate', 'LOCALMKTDATE', ()),
+    (65, 'SymbolSfx', 'STRING', (('EUCPLUMPSUMINTEREST', 'CD'), ('WHENISSUED', 'WI'),)),
+    (66, 'ListID', 'STRING', ()),
+    (67, 'ListSeqNo', 'INT', ()),
+    (68, 'TotNoOrders', 'INT', ()),
+    (69, 'ListExecInst', 'STRING', ()),
+    (70, 'AllocID', 'STRING', ()),
+    (71, 'AllocTransType', 'CHAR', (('NEW', '0'), ('REPLACE', '1'), ('CANCEL', '2'), ('PRELIMINARY', '3'), ('CALCULATED', '4'), ('CALCULATEDWITHOUTPRELIMINARY', '5'),)),
+    (72, 'RefAllocID', 'STRING', ()),
+    (73, 'NoOrders', 'NUMINGROUP', ()),
+    (74, 'AvgPxPrecision', 'INT', ()),
+    (75, 'TradeDate', 'LOCALMKTDATE', ()),
+    (76, 'ExecBroker', 'STRING', ()),
+    (77, 'PositionEffect', 'CHAR', (('CLOSE', 'C'), ('FIFO', 'F'), ('OPEN', 'O'), ('ROLLED', 'R'),)),
+    (78, 'NoAllocs', 'NUMINGROUP', ()),
+    (79, 'AllocAccount', 'STRING', ()),
+    (80, 'AllocQty', 'QTY', ()),
+    (81, 'ProcessCode', 'CHAR', (('REGULAR', '0'), ('SOFTDOLLAR', '1'), ('STEPIN', '2'), ('STEPOUT', '3'), ('STEPINSOFT', '4'), ('STEPOUTSOFT', '5'), ('PLANSPONSOR', '6'),)),
+    (82, 'NoRpts', 'INT', ()),
+    (83, 'RptSeq', 'INT', ()),
+    (84, 'CxlQty', 'QTY', ()),
+    (85, 'NoDlvyInst', 'NUMINGROUP', ()),
+    (86, 'DlvyInst', 'STRING', ()),
+    (87, 'AllocStatus', 'INT', (('ACCEPTEDSUCCESSFULLYPROCESSED', 0), ('BLOCKLEVELREJECT', 1), ('ACCOUNTLEVELREJECT', 2), ('RECEIVEDRECEIVEDNOTYETPROCESSED', 3), ('INCOMPLETE', 4), ('REJECTEDBYINTERMEDIARY', 5),)),
+    (88, 'AllocRejCode', 'INT', (('UNKNOWNACCT', 0), ('INCORRECTQTY', 1), ('UNKNOWNORSTALEEXECID', 10), ('MISMATCHEDDATA', 11), ('UNKNOWNCLORDID', 12), ('WAREHOUSEREQUESTREJECTED', 13), ('INCORRECTAVGPRC', 2), ('INCORRECTBRKMNC', 3), ('COMMDIFF', 4), ('UNKNOWNORDID', 5), ('UNKNOWNLISTID', 6), ('OTHER', 7), ('INCORRECTALLOCATEDQUANTITY', 8), ('CALCULATIONDIFFERENCE', 9),)),
+    (89, 'Signature', 'DATA', ()),
+    (90, 'SecureDataLen', 'LENGTH', ()),
+    (91, 'SecureData', 'DATA', ()),
+    (92, 'BrokerOfCredit', 'STRING', ()),
+    (93, 'SignatureLength', 'LENGTH', ()),
+    (94, 'EmailType', 'CHAR', (('NEW', '0'), ('REPLY', '1'), ('ADMINREPLY', '2'),)),
+    (95, 'RawDataLength', 'LENGTH', ()),
+    (96, 'RawData', 'DATA', ()),
+    (97, 'PossResend', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (98, 'EncryptMethod', 'INT', (('NONEOTHER', 0), ('PKCSPROPRIETARY', 1), ('DESECBMODE', 2), ('PKCSDESPROPRIETARY', 3), ('PGPDESDEFUNCT', 4), ('PGPDESMD5SEEAPPNOTEONFIXWEBSITE', 5), ('PEMDESMD5SEEAPPNOTEONFIXWEBSITENAFORFIXMLNOTUSED', 6),)),
+    (99, 'StopPx', 'PRICE', ()),
+    (100, 'ExDestination', 'EXCHANGE', ()),
+    (102, 'CxlRejReason', 'INT', (('TOOLATE', 0), ('UNKNOWN', 1), ('BROKEROPT', 2), ('ALREADYPENDINGCXL', 3), ('UNABLETOPROCESS', 4), ('ORIGORDMODTIMEMISMATCH', 5), ('DUPCLORDID', 6), ('OTHER', 99),)),
+    (103, 'OrdRejReason', 'INT', (('BROKEROPT', 0), ('UNKNOWNSYM', 1), ('INVINVID', 10), ('UNSUPPORDERCHAR', 11), ('SURVEILLENCE', 12), ('INCORRECTQUANTITY', 13), ('INCORRECTALLOCATEDQUANTITY', 14), ('UNKNOWNACCOUNTS', 15), ('EXCHCLOSED', 2), ('EXCEEDSLIM', 3), ('TOOLATE', 4), ('UNKNOWN', 5), ('DUPLICATE', 6), ('DUPLICATEVERBAL', 7), ('STALE', 8), ('TRADEALONGREQ', 9), ('OTHER', 99),)),
+    (104, 'IOIQualifier', 'CHAR', (('AON', 'A'), ('MOC', 'B'), ('ATCLOSE', 'C'), ('VWAP', 'D'), ('INTOUCH', 'I'), ('LIMIT', 'L'), ('MOREBEHIND', 'M'), ('ATOPEN', 'O'), ('TAKEPOSITION', 'P'), ('ATMARKET', 'Q'), ('READYTRADE', 'R'), ('PORTSHOW', 'S'), ('THROUGHDAY', 'T'), ('VERSUS', 'V'), ('INDWRKAWAY', 'W'), ('CROSSOPP', 'X'), ('ATMID', 'Y'), ('PREOPEN', 'Z'),)),
+    (105, 'WaveNo', 'STRING', ()),
+    (106, 'Issuer', 'STRING', ()),
+    (107, 'SecurityDesc', 'STRING', ()),
+    (108, 'HeartBtInt', 'INT', ()),
+    (109, 'ClientID', 'STRING', ()),
+    (110, 'MinQty', 'QTY', ()),
+    (111, 'MaxFloor', 'QTY', ()),
+    (112, 'TestReqID', 'STRING', ()),
+    (113, 'ReportToExch', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (114, 'LocateReqd', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (115, 'OnBehalfOfCompID', 'STRING', ()),
+    (116, 'OnBehalfOfSubID', 'STRING', ()),
+    (117, 'QuoteID', 'STRING', ()),
+    (118, 'NetMoney', 'AMT', ()),
+    (119, 'SettlCurrAmt', 'AMT', ()),
+    (120, 'SettlCurrency', 'CURRENCY', ()),
+    (121, 'ForexReq', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (122, 'OrigSendingTime', 'UTCTIMESTAMP', ()),
+    (123, 'GapFillFlag', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (124, 'NoExecs', 'NUMINGROUP', ()),
+    (125, 'CxlType', 'CHAR', ()),
+    (126, 'ExpireTime', 'UTCTIMESTAMP', ()),
+    (127, 'DKReason', 'CHAR', (('UNKNOWNSYMBOL', 'A'), ('WRONGSIDE', 'B'), ('QUANTITYEXCEEDSORDER', 'C'), ('NOMATCH', 'D'), ('PRICEEXCEEDSLIMIT', 'E'), ('CALCULATIONDIFFERENCE', 'F'), ('OTHER', 'Z'),)),
+    (128, 'DeliverToCompID', 'STRING', ()),
+    (129, 'DeliverToSubID', 'STRING', ()),
+    (130, 'IOINaturalFlag', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (131, 'QuoteReqID', 'STRING', ()),
+    (132, 'BidPx', 'PRICE', ()),
+    (133, 'OfferPx', 'PRICE', ()),
+    (134, 'BidSize', 'QTY', ()),
+    (135, 'OfferSize', 'QTY', ()),
+    (136, 'NoMiscFees', 'NUMINGROUP', ()),
+    (137, 'MiscFeeAmt', 'AMT', ()),
+    (138, 'MiscFeeCurr', 'CURRENCY', ()),
+    (139, 'MiscFeeType', 'STRING', (('REG', '1'), ('TRANSACTION', '10'), ('CONVERSION', '11'), ('AGENT', '12'), ('TAX', '2'), ('LOCALCOMM', '3'), ('EXCHFEE', '4'), ('STAMP', '5'), ('LEVY', '6'), ('OTHER', '7'), ('MARKUP', '8'), ('CONSUMPTION', '9'),)),
+    (140, 'PrevClosePx', 'PRICE', ()),
+    (141, 'ResetSeqNumFlag', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (142, 'SenderLocationID', 'STRING', ()),
+    (143, 'TargetLocationID', 'STRING', ()),
+    (144, 'OnBehalfOfLocationID', 'STRING', ()),
+    (145, 'DeliverToLocationID', 'STRING', ()),
+    (146, 'NoRelatedSym', 'NUMINGROUP', ()),
+    (147, 'Subject', 'STRING', ()),
+    (148, 'Headline', 'STRING', ()),
+    (149, 'URLLink', 'STRING', ()),
+    (150, 'ExecType', 'CHAR', (('NEW', '0'), ('DONE', '3'), ('CANCELED', '4'), ('REPLACED', '5'), ('PENDINGCXL', '6'), ('STOPPED', '7'), ('REJECTED', '8'), ('SUSPENDED', '9'), ('PENDINGNEW', 'A'), ('CALCULATED', 'B'), ('EXPIRED', 'C'), ('RESTATED', 'D'), ('PENDINGREPLACE', 'E'), ('TRADE', 'F'), ('TRADECORRECT', 'G'), ('TRADECANCEL', 'H'), ('ORDERSTATUS', 'I'),)),
+    (151, 'LeavesQty', 'QTY', ()),
+    (152, 'CashOrderQty', 'QTY', ()),
+    (153, 'AllocAvgPx', 'PRICE', ()),
+    (154, 'AllocNetMoney', 'AMT', ()),
+    (155, 'SettlCurrFxRate', 'FLOAT', ()),
+    (156, 'SettlCurrFxRateCalc', 'CHAR', (('MULTIPLY', 'M'), ('DIVIDE', 'D'),)),
+    (157, 'NumDaysInterest', 'INT', ()),
+    (158, 'AccruedInterestRate', 'PERCENTAGE', ()),
+    (159, 'AccruedInterestAmt', 'AMT', ()),
+    (160, 'SettlInstMode', 'CHAR', (('DEFAULT', '0'), ('SIPROVIDED', '1'), ('ACCOUNTOVERRIDING', '2'), ('ACCOUNTSTANDING', '3'), ('CIVORDERSINGLEACCT', '4'), ('REJECT', '5'),)),
+    (161, 'AllocText', 'STRING', ()),
+    (162, 'SettlInstID', 'STRING', ()),
+    (163, 'SettlInstTransType', 'CHAR', (('CANCEL', 'C'), ('NEW', 'N'), ('REPLACE', 'R'), ('RESTATE', 'T'),)),
+    (164, 'EmailThreadID', 'STRING', ()),
+    (165, 'SettlInstSource', 'CHAR', (('BROKERINSTR', '1'), ('INSTINSTR', '2'), ('INVESTORCIV', '3'),)),
+    (166, 'SettlLocation', 'STRING', (('CEDEL', 'CED'), ('DEPOSITORYTRUSTCOMPANY', 'DTC'), ('EUROCLEAR', 'EUR'), ('FEDERALBOOKENTRY', 'FED'), ('LOCALMARKETSETTLELOCATION', 'ISO_Country_Code'), ('PHYSICAL', 'PNY'), ('PARTICIPANTTRUSTCOMPANY', 'PTC'),)),
+    (167, 'SecurityType', 'STRING', (('ASSETBACKEDSECURITIES', 'ABS'), ('AMENDEDRESTATED', 'AMENDED'), ('OTHERANTICIPATIONNOTESBANGANETC', 'AN'), ('BANKERSACCEPTANCE', 'BA'), ('BANKNOTES', 'BN'), ('BILLOFEXCHANGES', 'BOX'), ('BRADYBOND', 'BRADY'), ('BRIDGELOAN', 'BRIDGE'), ('BUYSELLBACK', 'BUYSELL'), ('CONVERTIBLEBOND', 'CB'), ('CERTIFICATEOFDEPOSIT', 'CD'), ('CALLLOANS', 'CL'), ('CORPMORTGAGEBACKEDSECURITIES', 'CMBS'), ('COLLATERALIZEDMORTGAGEOBLIGATION', 'CMO'), ('CERTIFICATEOFOBLIGATION', 'COFO'), ('CERTIFICATEOFPARTICIPATION', 'COFP'), ('CORPORATEBOND', 'CORP'), ('COMMERCIALPAPER', 'CP'), ('CORPORATEPRIVATEPLACEMENT', 'CPP'), ('COMMONSTOCK', 'CS'), ('DEFAULTED', 'DEFLTED'), ('DEBTORINPOSSESSION', 'DINP'), ('DEPOSITNOTES', 'DN'), ('DUALCURRENCY', 'DUAL'), ('EUROCERTIFICATEOFDEPOSIT', 'EUCD'), ('EUROCORPORATEBOND', 'EUCORP'), ('EUROCOMMERCIALPAPER', 'EUCP'), ('EUROSOVEREIGNS', 'EUSOV'), ('EUROSUPRANATIONALCOUPONS', 'EUSUPRA'), ('FEDERALAGENCYCOUPON', 'FAC'), ('FEDERALAGENCYDISCOUNTNOTE', 'FADN'), ('FOREIGNEXCHANGECONTRACT', 'FOR'), ('FORWARD', 'FORWARD'), ('FUTURE', 'FUT'), ('GENERALOBLIGATIONBONDS', 'GO'), ('IOETTEMORTGAGE', 'IET'), ('LETTEROFCREDIT', 'LOFC'), ('LIQUIDITYNOTE', 'LQN'), ('MATURED', 'MATURED'), ('MORTGAGEBACKEDSECURITIES', 'MBS'), ('MUTUALFUND', 'MF'), ('MORTGAGEINTERESTONLY', 'MIO'), ('MULTILEGINSTRUMENT', 'MLEG'), ('MORTGAGEPRINCIPALONLY', 'MPO'), ('MORTGAGEPRIVATEPLACEMENT', 'MPP'), ('MISCELLANEOUSPASSTHROUGH', 'MPT'), ('MANDATORYTENDER', 'MT'), ('MEDIUMTERMNOTES', 'MTN'), ('NOSECURITYTYPE', 'NONE'), ('OVERNIGHT', 'ONITE'), ('OPTION', 'OPT'), ('PRIVATEEXPORTFUNDING', 'PEF'), ('PFANDBRIEFE', 'PFAND'), ('PROMISSORYNOTE', 'PN'), ('PREFERREDSTOCK', 'PS'), ('PLAZOSFIJOS', 'PZFJ'), ('REVENUEANTICIPATIONNOTE', 'RAN'), ('REPLACED', 'REPLACD'), ('REPURCHASE', 'REPO'), ('RETIRED', 'RETIRED'), ('REVENUEBONDS', 'REV'), ('REVOLVERLOAN', 'RVLV'), ('REVOLVERTERMLOAN', 'RVLVTRM'), ('SECURITIESLOAN', 'SECLOAN'), ('SECURITIESPLEDGE', 'SECPLEDGE'), ('SPECIALASSESSMENT', 'SPCLA'), ('SPECIALOBLIGATION', 'SPCLO'), ('SPECIALTAX', 'SPCLT'), ('SHORTTERMLOANNOTE', 'STN'), ('STRUCTUREDNOTES', 'STRUCT'), ('USDSUPRANATIONALCOUPONS', 'SUPRA'), ('SWINGLINEFACILITY', 'SWING'), ('TAXANTICIPATIONNOTE', 'TAN'), ('TAXALLOCATION', 'TAXA'), ('TOBEANNOUNCED', 'TBA'), ('USTREASURYBILL', 'TBILL'), ('USTREASURYBOND', 'TBOND'), ('PRINCIPALSTRIPOFACALLABLEBONDORNOTE', 'TCAL'), ('TIMEDEPOSIT', 'TD'), ('TAXEXEMPTCOMMERCIALPAPER', 'TECP'), ('TERMLOAN', 'TERM'), ('INTERESTSTRIPFROMANYBONDORNOTE', 'TINT'), ('TREASURYINFLATIONPROTECTEDSECURITIES', 'TIPS'), ('USTREASURYNOTE', 'TNOTE'), ('PRINCIPALSTRIPFROMANONCALLABLEBONDORNOTE', 'TPRN'), ('TAXREVENUEANTICIPATIONNOTE', 'TRAN'), ('USTREASURYNOTEDEPRECATEDVALUEUSETNOTE', 'UST'), ('USTREASURYBILLDEPRECATEDVALUEUSETBILL', 'USTB'), ('VARIABLERATEDEMANDNOTE', 'VRDN'), ('WARRANT', 'WAR'), ('WITHDRAWN', 'WITHDRN'), ('WILDCARDENTRY', 'WLD'), ('EXTENDEDCOMMNOTE', 'XCN'), ('INDEXEDLINKED', 'XLINKD'), ('YANKEECORPORATEBOND', 'YANK'), ('YANKEECERTIFICATEOFDEPOSIT', 'YCD'),)),
+    (168, 'EffectiveTime', 'UTCTIMESTAMP', ()),
+    (169, 'StandInstDbType', 'INT', (('OTHER', 0), ('SID', 1), ('ALERT', 2), ('CUSTODIAN', 3), ('ACCOUNTNET', 4),)),
+    (170, 'StandInstDbName', 'STRING', ()),
+    (171, 'StandInstDbID', 'STRING', ()),
+    (172, 'SettlDeliveryType', 'INT', ()),
+    (173, 'SettlDepositoryCode', 'STRING', ()),
+    (174, 'SettlBrkrCode', 'STRING', ()),
+    (175, 'SettlInstCode', 'STRING', ()),
+    (176, 'SecuritySettlAgentName', 'STRING', ()),
+    (177, 'SecuritySettlAgentCode', 'STRING', ()),
+    (178, 'SecuritySettlAgentAcctNum', 'STRING', ()),
+    (179, 'SecuritySettlAgentAcctName', 'STRING', ()),
+    (180, 'SecuritySettlAgentContactName', 'STRING', ()),
+    (181, 'SecuritySettlAgentContactPhone', 'STRING', ()),
+    (182, 'CashSettlAgentName', 'STRING', ()),
+    (183, 'CashSettlAgentCode', 'STRING', ()),
+    (184, 'CashSettlAgentAcctNum', 'STRING', ()),
+    (185, 'CashSettlAgentAcctName', 'STRING', ()),
+    (186, 'CashSettlAgentContactName', 'STRING', ()),
+    (187, 'CashSettlAgentContactPhone', 'STRING', ()),
+    (188, 'BidSpotRate', 'PRICE', ()),
+    (189, 'BidForwardPoints', 'PRICEOFFSET', ()),
+    (190, 'OfferSpotRate', 'PRICE', ()),
+    (191, 'OfferForwardPoints', 'PRICEOFFSET', ()),
+    (192, 'OrderQty2', 'QTY', ()),
+    (193, 'SettlDate2', 'LOCALMKTDATE', ()),
+    (194, 'LastSpotRate', 'PRICE', ()),
+    (195, 'LastForwardPoints', 'PRICEOFFSET', ()),
+    (196, 'AllocLinkID', 'STRING', ()),
+    (197, 'AllocLinkType', 'INT', (('FXNETTING', 0), ('FXSWAP', 1),)),
+    (198, 'SecondaryOrderID', 'STRING', ()),
+    (199, 'NoIOIQualifiers', 'NUMINGROUP', ()),
+    (200, 'MaturityMonthYear', 'MONTHYEAR', ()),
+    (201, 'PutOrCall', 'INT', (('PUT', 0), ('CALL', 1),)),
+    (202, 'StrikePrice', 'PRICE', ()),
+    (203, 'CoveredOrUncovered', 'INT', (('COVERED', 0), ('UNCOVERED', 1),)),
+    (204, 'CustomerOrFirm', 'INT', (('CUSTOMER', 0), ('FIRM', 1),)),
+    (205, 'MaturityDay', 'DAYOFMONTH', ()),
+    (206, 'OptAttribute', 'CHAR', ()),
+    (207, 'SecurityExchange', 'EXCHANGE', ()),
+    (208, 'NotifyBrokerOfCredit', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (209, 'AllocHandlInst', 'INT', (('MATCH', 1), ('FORWARD', 2), ('FORWARDMATCH', 3),)),
+    (210, 'MaxShow', 'QTY', ()),
+    (211, 'PegOffsetValue', 'FLOAT', ()),
+    (212, 'XmlDataLen', 'LENGTH', ()),
+    (213, 'XmlData', 'DATA', ()),
+    (214, 'SettlInstRefID', 'STRING', ()),
+    (215, 'NoRoutingIDs', 'NUMINGROUP', ()),
+    (216, 'RoutingType', 'INT', (('TARGETFIRM', 1), ('TARGETLIST', 2), ('BLOCKFIRM', 3), ('BLOCKLIST', 4),)),
+    (217, 'RoutingID', 'STRING', ()),
+    (218, 'Spread', 'PRICEOFFSET', ()),
+    (219, 'Benchmark', 'CHAR', (('CURVE', '1'), ('_5YR', '2'), ('OLD5', '3'), ('_10YR', '4'), ('OLD10', '5'), ('_30YR', '6'), ('OLD30', '7'), ('_3MOLIBOR', '8'), ('_6MOLIBOR', '9'),)),
+    (220, 'BenchmarkCurveCurrency', 'CURRENCY', ()),
+    (221, 'BenchmarkCurveName', 'STRING', (('EONIA', 'EONIA'), ('EUREPO', 'EUREPO'), ('EURIBOR', 'Euribor'), ('FUTURESWAP', 'FutureSWAP'), ('LIBID', 'LIBID'), ('LIBOR', 'LIBOR'), ('MUNIAAA', 'MuniAAA'), ('OTHER', 'OTHER'), ('PFANDBRIEFE', 'Pfandbriefe'), ('SONIA', 'SONIA'), ('SWAP', 'SWAP'), ('TREASURY', 'Treasury'),)),
+    (222, 'BenchmarkCurvePoint', 'STRING', ()),
+    (223, 'CouponRate', 'PERCENTAGE', ()),
+    (224, 'CouponPaymentDate', 'LOCALMKTDATE', ()),
+    (225, 'IssueDate', 'LOCALMKTDATE', ()),
+    (226, 'RepurchaseTerm', 'INT', ()),
+    (227, 'RepurchaseRate', 'PERCENTAGE', ()),
+    (228, 'Factor', 'FLOAT', ()),
+    (229, 'TradeOriginationDate', 'LOCALMKTDATE', ()),
+    (230, 'ExDate', 'LOCALMKTDATE', ()),
+    (231, 'ContractMultiplier', 'FLOAT', ()),
+    (232, 'NoStipulations', 'NUMINGROUP', ()),
+    (233, 'StipulationType', 'STRING', (('ABSOLUTEPREPAYMENTSPEED', 'ABS'), ('AMT', 'AMT'), ('AUTOREINVESTMENTATRATEORBETTER', 'AUTOREINV'), ('BANKQUALIFIED', 'BANKQUAL'), ('BARGAINCONDITIONS', 'BGNCON'), ('COUPONRANGE', 'COUPON'), ('CONSTANTPREPAYMENTPENALTY', 'CPP'), ('CONSTANTPREPAYMENTRATE', 'CPR'), ('CONSTANTPREPAYMENTYIELD', 'CPY'), ('ISOCURRENCYCODE', 'CURRENCY'), ('CUSTOMSTARTENDDATE', 'CUSTOMDATE'), ('GEOGRAPHICSANDRANGE', 'GEOG'), ('VALUATIONDISCOUNT', 'HAIRCUT'), ('FINALCPROFHOMEEQUITYPREPAYMENTCURVE', 'HEP'), ('INSURED', 'INSURED'), ('YEARORYEARMONTHOFISSUE', 'ISSUE'), ('ISSUERSTICKER', 'ISSUER'), ('ISSUESIZERANGE', 'ISSUESIZE'), ('LOOKBACKDAYS', 'LOOKBACK'), ('EXPLICITLOTIDENTIFIER', 'LOT'), ('LOTVARIANCEVALUEINPERCENTMAXIMUMOVERORUNDERALLOCATIONALLOWED', 'LOTVAR'), ('MATURITYYEARANDMONTH', 'MAT'), ('MATURITYRANGE', 'MATURITY'), ('MAXIMUMDENOMINATION', 'MAXDNOM'), ('MAXIMUMSUBSTITUTIONSREPO', 'MAXSUBS'), ('PERCENTOFMANUFACTUREDHOUSINGPREPAYMENTCURVE', 'MHP'), ('MINIMUMDENOMINATION', 'MINDNOM'), ('MINIMUMINCREMENT', 'MININCR'), ('MINIMUMQUANTITY', 'MINQTY'), ('MONTHLYPREPAYMENTRATE', 'MPR'), ('PAYMENTFREQUENCYCALENDAR', 'PAYFREQ'), ('NUMBEROFPIECES', 'PIECES'), ('POOLSMAXIMUM', 'PMAX'), ('POOLSMINIMUM', 'PMIN'), ('PERCENTOFPROSPECTUSPREPAYMENTCURVE', 'PPC'), ('POOLSPERLOT', 'PPL'), ('POOLSPERMILLION', 'PPM'), ('POOLSPERTRADE', 'PPT'), ('PRICERANGE', 'PRICE'), ('PRICINGFREQUENCY', 'PRICEFREQ'), ('PRODUCTIONYEAR', 'PROD'), ('CALLPROTECTION', 'PROTECT'), ('PERCENTOFBMAPREPAYMENTCURVE', 'PSA'), ('PURPOSE', 'PURPOSE'), ('BENCHMARKPRICESOURCE', 'PXSOURCE'), ('RATINGSOURCEANDRANGE', 'RATING'), ('TYPEOFREDEMPTIONVALUESARE', 'REDEMPTION'), ('RESTRICTED', 'RESTRICTED'), ('MARKETSECTOR', 'SECTOR'), ('SECURITYTYPEINCLUDEDOREXCLUDED', 'SECTYPE'), ('SINGLEMONTHLYMORTALITY', 'SMM'), ('STRUCTURE', 'STRUCT'), ('SUBSTITUTIONSFREQUENCYREPO', 'SUBSFREQ'), ('SUBSTITUTIONSLEFTREPO', 'SUBSLEFT'), ('FREEFORMTEXT', 'TEXT'), ('TRADEVARIANCEVALUEINPERCENTMAXIMUMOVERORUNDERALLOCATIONALLOWED', 'TRDVAR'), ('WEIGHTEDAVERAGECOUPON', 'WAC'), ('WEIGHTEDAVERAGELIFECOUPON', 'WAL'), ('WEIGHTEDAVERAGELOANAGE', 'WALA'), ('WEIGHTEDAVERAGEMATURITY', 'WAM'), ('WHOLEPOOL', 'WHOLE'), ('YIELDRANGE', 'YIELD'),)),
+    (234, 'StipulationValue', 'STRING', ()),
+    (235, 'YieldType', 'STRING', (('AFTERTAXYIELD', 'AFTERTAX'), ('ANNUALYIELD', 'ANNUAL'), ('YIELDATISSUE', 'ATISSUE'), ('YIELDTOAVGMATURITY', 'AVGMATURITY'), ('BOOKYIELD', 'BOOK'), ('YIELDTONEXTCALL', 'CALL'), ('YIELDCHANGESINCECLOSE', 'CHANGE'), ('CLOSINGYIELD', 'CLOSE'), ('COMPOUNDYIELD', 'COMPOUND'), ('CURRENTYIELD', 'CURRENT'), ('GVNTEQUIVALENTYIELD', 'GOVTEQUIV'), ('TRUEGROSSYIELD', 'GROSS'), ('YIELDINFLATIONASSUMPTION', 'INFLATION'), ('INVFLOATERBONDYIELD', 'INVERSEFLOATER'), ('MOSTRECENTCLOSINGYIELD', 'LASTCLOSE'), ('CLOSINGYIELDMOSTRECENTMONTH', 'LASTMONTH'), ('CLOSINGYIELDMOSTRECENTQUARTER', 'LASTQUARTER'), ('CLOSINGYIELDMOSTRECENTYEAR', 'LASTYEAR'), ('YIELDTOLONGESTAVERAGELIFE', 'LONGAVGLIFE'), ('MARKTOMARKETYIELD', 'MARK'), ('YIELDTOMATURITY', 'MATURITY'), ('YIELDTONEXTREFUNDSINKING', 'NEXTREFUND'), ('OPENAVERAGEYIELD', 'OPENAVG'), ('PREVIOUSCLOSEYIELD', 'PREVCLOSE'), ('PROCEEDSYIELD', 'PROCEEDS'), ('YIELDTONEXTPUT', 'PUT'), ('SEMI', 'SEMIANNUAL'), ('YIELDTOSHORTESTAVERAGELIFE', 'SHORTAVGLIFE'), ('SIMPLEYIELD', 'SIMPLE'), ('TAXEQUIVALENTYIELD', 'TAXEQUIV'), ('YIELDTOTENDERDATE', 'TENDER'), ('TRUEYIELD', 'TRUE'), ('YIELDVALUEOF132', 'VALUE1_32'), ('YIELDTOWORSTCONVENTION', 'WORST'),)),
+    (236, 'Yield', 'PERCENTAGE', ()),
+    (237, 'TotalTakedown', 'AMT', ()),
+    (238, 'Concession', 'AMT', ()),
+    (239, 'RepoCollateralSecurityType', 'INT', ()),
+    (240, 'RedemptionDate', 'LOCALMKTDATE', ()),
+    (241, 'UnderlyingCouponPaymentDate', 'LOCALMKTDATE', ()),
+    (242, 'UnderlyingIssueDate', 'LOCALMKTDATE', ()),
+    (243, 'UnderlyingRepoCollateralSecurityType', 'INT', ()),
+    (244, 'UnderlyingRepurchaseTerm', 'INT', ()),
+    (245, 'UnderlyingRepurchaseRate', 'PERCENTAGE', ()),
+    (246, 'UnderlyingFactor', 'FLOAT', ()),
+    (247, 'UnderlyingRedemptionDate', 'LOCALMKTDATE', ()),
+    (248, 'LegCouponPaymentDate', 'LOCALMKTDATE', ()),
+    (249, 'LegIssueDate', 'LOCALMKTDATE', ()),
+    (250, 'LegRepoCollateralSecurityType', 'INT', ()),
+    (251, 'LegRepurchaseTerm', 'INT', ()),
+    (252, 'LegRepurchaseRate', 'PERCENTAGE', ()),
+    (253, 'LegFactor', 'FLOAT', ()),
+    (254, 'LegRedemptionDate', 'LOCALMKTDATE', ()),
+    (255, 'CreditRating', 'STRING', ()),
+    (256, 'UnderlyingCreditRating', 'STRING', ()),
+    (257, 'LegCreditRating', 'STRING', ()),
+    (258, 'TradedFlatSwitch', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (259, 'BasisFeatureDate', 'LOCALMKTDATE', ()),
+    (260, 'BasisFeaturePrice', 'PRICE', ()),
+    (262, 'MDReqID', 'STRING', ()),
+    (263, 'SubscriptionRequestType', 'CHAR', (('SNAPSHOT', '0'), ('SNAPSHOTUPDATE', '1'), ('UNSUBSCRIBE', '2'),)),
+    (264, 'MarketDepth', 'INT', ()),
+    (265, 'MDUpdateType', 'INT', (('FULL', 0), ('INCREMENTAL', 1),)),
+    (266, 'AggregatedBook', 'BOOLEAN', ()),
+    (267, 'NoMDEntryTypes', 'NUMINGROUP', ()),
+    (268, 'NoMDEntries', 'NUMINGROUP', ()),
+    (269, 'MDEntryType', 'CHAR', (('BID', '0'), ('OFFER', '1'), ('TRADE', '2'), ('INDEXVALUE', '3'), ('OPENING', '4'), ('CLOSING', '5'), ('SETTLEMENT', '6'), ('TRADINGHIGH', '7'), ('TRADINGLOW', '8'), ('TRADINGVWAP', '9'), ('IMBALANCE', 'A'), ('TRADEVOLUME', 'B'), ('OPENINTEREST', 'C'),)),
+    (270, 'MDEntryPx', 'PRICE', ()),
+    (271, 'MDEntrySize', 'QTY', ()),
+    (272, 'MDEntryDate', 'UTCDATEONLY', ()),
+    (273, 'MDEntryTime', 'UTCTIMEONLY', ()),
+    (274, 'TickDirection', 'CHAR', (('PLUS', '0'), ('ZEROPLUS', '1'), ('MINUS', '2'), ('ZEROMINUS', '3'),)),
+    (275, 'MDMkt', 'EXCHANGE', ()),
+    (276, 'QuoteCondition', 'MULTIPLESTRINGVALUE', (('OPEN', 'A'), ('CLOSED', 'B'), ('EXCHBEST', 'C'), ('CONSOLBEST', 'D'), ('LOCKED', 'E'), ('CROSSED', 'F'), ('DEPTH', 'G'), ('FAST', 'H'), ('NONFIRM', 'I'),)),
+    (277, 'TradeCondition', 'MULTIPLESTRINGVALUE', (('CASHMKT', 'A'), ('AVGPX', 'B'), ('CASHTRADE', 'C'), ('NEXTDAY_D', 'D'), ('OPENING', 'E'), ('INTRADAY', 'F'), ('RULE127', 'G'), ('RULE155', 'H'), ('SOLDLAST', 'I'), ('NEXTDAY_J', 'J'), ('OPENED', 'K'), ('SELLER', 'L'), ('SOLD', 'M'), ('STOPPED', 'N'), ('IMBALANCEMOREBUYERS', 'P'), ('IMBALANCEMORESELLERS', 'Q'), ('OPENINGPRICE', 'R'),)),
+    (278, 'MDEntryID', 'STRING', ()),
+    (279, 'MDUpdateAction', 'CHAR', (('NEW', '0'), ('CHANGE', '1'), ('DELETE', '2'),)),
+    (280, 'MDEntryRefID', 'STRING', ()),
+    (281, 'MDReqRejReason', 'CHAR', (('UNKNOWNSYM', '0'), ('DUPID', '1'), ('INSBAND', '2'), ('INSPERM', '3'), ('UNSUPPSUB', '4'), ('UNSUPPMKTDEPTH', '5'), ('UNSUPPMDUPDATE', '6'), ('UNSUPPAGGBK', '7'), ('UNSUPPENTRY', '8'), ('UNSUPPTRDSESSIONID', '9'), ('UNSUPPSCOPE', 'A'), ('UNSUPPPOSITIONEFFECTSETTLEFLAG', 'B'), ('UNSUPPMDIMPLICITDELETE', 'C'),)),
+    (282, 'MDEntryOriginator', 'STRING', ()),
+    (283, 'LocationID', 'STRING', ()),
+    (284, 'DeskID', 'STRING', ()),
+    (285, 'DeleteReason', 'CHAR', (('CANCELTRADEBUST', '0'), ('ERROR', '1'),)),
+    (286, 'OpenCloseSettlFlag', 'MULTIPLESTRINGVALUE', (('DAILYOPEN', '0'), ('SESSIONOPEN', '1'), ('DELIVERYSETTLEMENT', '2'), ('EXPECTEDENTRY', '3'), ('ENTRYFROMPREVBUSINESSDAY', '4'), ('THEORETICALPRICE', '5'),)),
+    (287, 'SellerDays', 'INT', ()),
+    (288, 'MDEntryBuyer', 'STRING', ()),
+    (289, 'MDEntrySeller', 'STRING', ()),
+    (290, 'MDEntryPositionNo', 'INT', ()),
+    (291, 'FinancialStatus', 'MULTIPLESTRINGVALUE', (('BANKRUPT', '1'), ('PENDINGDELISTING', '2'),)),
+    (292, 'CorporateAction', 'MULTIPLESTRINGVALUE', (('EXDIVIDEND', 'A'), ('EXDIST', 'B'), ('EXRIGHTS', 'C'), ('NEW', 'D'), ('EXINTEREST', 'E'),)),
+    (293, 'DefBidSize', 'QTY', ()),
+    (294, 'DefOfferSize', 'QTY', ()),
+    (295, 'NoQuoteEntries', 'NUMINGROUP', ()),
+    (296, 'NoQuoteSets', 'NUMINGROUP', ()),
+    (297, 'QuoteStatus', 'INT', (('ACCPT', 0), ('CXLSYM', 1), ('PENDING', 10), ('PASS', 11), ('LOCKEDMARKETWARNING', 12), ('CROSSMARKETWARNING', 13), ('CANCELEDDUETOLOCKMARKET', 14), ('CANCELEDDUETOCROSSMARKET', 15), ('CXLSECTYPE', 2), ('CXLUNDER', 3), ('CXLALL', 4), ('REJ', 5), ('REMOVED', 6), ('EXPIRED', 7), ('QUERY', 8), ('QUOTENOTFOUND', 9),)),
+    (298, 'QuoteCancelType', 'INT', (('CXLSYM', 1), ('CXLSECTYPE', 2), ('CXLUNDER', 3), ('CXLALL', 4),)),
+    (299, 'QuoteEntryID', 'STRING', ()),
+    (300, 'QuoteRejectReason', 'INT', (('UNKNSYM', 1), ('EXCHCLSD', 2), ('ORDEXLIM', 3), ('TOOLATE', 4), ('UNKNORD', 5), ('DUPORD', 6), ('INVSPREAD', 7), ('INVPX', 8), ('NOTAUTH', 9), ('OTHER', 99),)),
+    (301, 'QuoteResponseLevel', 'INT', (('NOACK', 0), ('ACKNEG', 1), ('ACKEACH', 2),)),
+    (302, 'QuoteSetID', 'STRING', ()),
+    (303, 'QuoteRequestType', 'INT', (('MAN', 1), ('AUTO', 2),)),
+    (304, 'TotNoQuoteEntries', 'INT', ()),
+    (305, 'UnderlyingSecurityIDSource', 'STRING', ()),
+    (306, 'UnderlyingIssuer', 'STRING', ()),
+    (307, 'UnderlyingSecurityDesc', 'STRING', ()),
+    (308, 'UnderlyingSecurityExchange', 'EXCHANGE', ()),
+    (309, 'UnderlyingSecurityID', 'STRING', ()),
+    (310, 'UnderlyingSecurityType', 'STRING', ()),
+    (311, 'UnderlyingSymbol', 'STRING', ()),
+    (312, 'UnderlyingSymbolSfx', 'STRING', ()),
+    (313, 'UnderlyingMaturityMonthYear', 'MONTHYEAR', ()),
+    (314, 'UnderlyingMaturityDay', 'DAYOFMONTH', ()),
+    (315, 'UnderlyingPutOrCall', 'INT', ()),
+    (316, 'UnderlyingStrikePrice', 'PRICE', ()),
+    (317, 'UnderlyingOptAttribute', 'CHAR', ()),
+    (318, 'UnderlyingCurrency', 'CURRENCY', ()),
+    (319, 'RatioQty', 'QTY', ()),
+    (320, 'SecurityReqID', 'STRING', ()),
+    (321, 'SecurityRequestType', 'INT', (('REQSECID', 0), ('REQSECIDPROV', 1), ('REQSECLISTTYPES', 2), ('REQSECLIST', 3),)),
+    (322, 'SecurityResponseID', 'STRING', ()),
+    (323, 'SecurityResponseType', 'INT', (('ACCPTSECPROP', 1), ('ACCPTSECPROPREV', 2), ('SECLISTTYPESRET', 3), ('SECLISTRET', 4), ('REJSECPROP', 5), ('NOMATCH', 6),)),
+    (324, 'SecurityStatusReqID', 'STRING', ()),
+    (325, 'UnsolicitedIndicator', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (326, 'SecurityTradingStatus', 'INT', (('OPENDELAY', 1), ('MKTONCLSIMBSELL', 10), ('NA', 11), ('NOMKTIMB', 12), ('NOMKTONCLSIMB', 13), ('ITSPREOPN', 14), ('NEWPXIND', 15), ('TRDDISTIME', 16), ('READY', 17), ('NOTAVAIL', 18), ('NOTTRADED', 19), ('TRDHALT', 2), ('UNKNOWN', 20), ('PRE_OPEN', 21), ('OPENINGROTATION', 22), ('FASTMARKET', 23), ('RESUME', 3), ('NOOPEN', 4), ('PXIND', 5), ('TRDRNGIND', 6), ('MKTIMBBUY', 7), ('MKTBALSELL', 8), ('MKTONCLSIMBBUY', 9),)),
+    (327, 'HaltReasonChar', 'CHAR', (('NEWSDISS', 'D'), ('ORDINFL', 'E'), ('ORDIMB', 'I'), ('ADDINFO', 'M'), ('NEWSPEND', 'P'), ('EQUIPCHANGE', 'X'),)),
+    (328, 'InViewOfCommon', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (329, 'DueToRelated', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (330, 'BuyVolume', 'QTY', ()),
+    (331, 'SellVolume', 'QTY', ()),
+    (332, 'HighPx', 'PRICE', ()),
+    (333, 'LowPx', 'PRICE', ()),
+    (334, 'Adjustment', 'INT', (('CANCEL', 1), ('ERROR', 2), ('CORRECTION', 3),)),
+    (335, 'TradSesReqID', 'STRING', ()),
+    (336, 'TradingSessionID', 'STRING', ()),
+    (337, 'ContraTrader', 'STRING', ()),
+    (338, 'TradSesMethod', 'INT', (('ELECTRONIC', 1), ('OPENOUTCRY', 2), ('TWOPARTY', 3),)),
+    (339, 'TradSesMode', 'INT', (('TESTING', 1), ('SIMULATED', 2), ('PRODUCTION', 3),)),
+    (340, 'TradSesStatus', 'INT', (('UNKNOWN', 0), ('HALTED', 1), ('OPEN', 2), ('CLOSED', 3), ('PREOPEN', 4), ('PRECLOSE', 5), ('REQREJ', 6),)),
+    (341, 'TradSesStartTime', 'UTCTIMESTAMP', ()),
+    (342, 'TradSesOpenTime', 'UTCTIMESTAMP', ()),
+    (343, 'TradSesPreCloseTime', 'UTCTIMESTAMP', ()),
+    (344, 'TradSesCloseTime', 'UTCTIMESTAMP', ()),
+    (345, 'TradSesEndTime', 'UTCTIMESTAMP', ()),
+    (346, 'NumberOfOrders', 'INT', ()),
+    (347, 'MessageEncoding', 'STRING', ()),
+    (348, 'EncodedIssuerLen', 'LENGTH', ()),
+    (349, 'EncodedIssuer', 'DATA', ()),
+    (350, 'EncodedSecurityDescLen', 'LENGTH', ()),
+    (351, 'EncodedSecurityDesc', 'DATA', ()),
+    (352, 'EncodedListExecInstLen', 'LENGTH', ()),
+    (353, 'EncodedListExecInst', 'DATA', ()),
+    (354, 'EncodedTextLen', 'LENGTH', ()),
+    (355, 'EncodedText', 'DATA', ()),
+    (356, 'EncodedSubjectLen', 'LENGTH', ()),
+    (357, 'EncodedSubject', 'DATA', ()),
+    (358, 'EncodedHeadlineLen', 'LENGTH', ()),
+    (359, 'EncodedHeadline', 'DATA', ()),
+    (360, 'EncodedAllocTextLen', 'LENGTH', ()),
+    (361, 'EncodedAllocText', 'DATA', ()),
+    (362, 'EncodedUnderlyingIssuerLen', 'LENGTH', ()),
+    (363, 'EncodedUnderlyingIssuer', 'DATA', ()),
+    (364, 'EncodedUnderlyingSecurityDescLen', 'LENGTH', ()),
+    (365, 'EncodedUnderlyingSecurityDesc', 'DATA', ()),
+    (366, 'AllocPrice', 'PRICE', ()),
+    (367, 'QuoteSetValidUntilTime', 'UTCTIMESTAMP', ()),
+    (368, 'QuoteEntryRejectReason', 'INT', (('UNKNWNSYM', 1), ('EXCHCLSD', 2), ('ORDEXCLIM', 3), ('TOOLATE', 4), ('UNKNORD', 5), ('DUPORD', 6), ('INVBIDASK', 7), ('INVPX', 8), ('NOTAUTH', 9), ('OTHER', 99),)),
+    (369, 'LastMsgSeqNumProcessed', 'SEQNUM', ()),
+    (370, 'OnBehalfOfSendingTime', 'UTCTIMESTAMP', ()),
+    (371, 'RefTagID', 'INT', ()),
+    (372, 'RefMsgType', 'STRING', ()),
+    (373, 'SessionRejectReason', 'INT', (('INVALIDTAGNUMBER', 0), ('REQUIREDTAGMISSING', 1), ('SENDINGTIMEACCURACYPROBLEM', 10), ('INVALIDMSGTYPE', 11), ('XMLVALIDATIONERROR', 12), ('TAGAPPEARSMORETHANONCE', 13), ('TAGSPECIFIEDOUTOFREQUIREDORDER', 14), ('REPEATINGGROUPFIELDSOUTOFORDER', 15), ('INCORRECTNUMINGROUPCOUNTFORREPEATINGGROUP', 16), ('NONDATAVALUEINCLUDESFIELDDELIMITERSOHCHARACTER', 17), ('TAGNOTDEFINEDFORTHISMESSAGETYPE', 2), ('UNDEFINEDTAG', 3), ('TAGSPECIFIEDWITHOUTAVALUE', 4), ('VALUEISINCORRECTOUTOFRANGEFORTHISTAG', 5), ('INCORRECTDATAFORMATFORVALUE', 6), ('DECRYPTIONPROBLEM', 7), ('SIGNATUREPROBLEM', 8), ('COMPIDPROBLEM', 9), ('OTHER', 99),)),
+    (374, 'BidRequestTransType', 'CHAR', (('CANCEL', 'C'), ('NO', 'N'),)),
+    (375, 'ContraBroker', 'STRING', ()),
+    (376, 'ComplianceID', 'STRING', ()),
+    (377, 'SolicitedFlag', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (378, 'ExecRestatementReason', 'INT', (('GTCORPACT', 0), ('GTRENEW', 1), ('WAREHOUSERECAP', 10), ('VERBAL', 2), ('REPX', 3), ('BRKROPT', 4), ('PARTDEC', 5), ('CXLTRADINGHALT', 6), ('CXLSYSTEMFAILURE', 7), ('MRKTOPTION', 8), ('CANCELEDNOTBEST', 9), ('OTHER', 99),)),
+    (379, 'BusinessRejectRefID', 'STRING', ()),
+    (380, 'BusinessRejectReason', 'INT', (('OTHER', 0), ('UNKNID', 1), ('UNKNSEC', 2), ('UNKNMSGTYPE', 3), ('APPNA', 4), ('CONDFLDMISS', 5), ('NOTAUTH', 6), ('NODELIVTOFIRM', 7),)),
+    (381, 'GrossTradeAmt', 'AMT', ()),
+    (382, 'NoContraBrokers', 'NUMINGROUP', ()),
+    (383, 'MaxMessageSize', 'LENGTH', ()),
+    (384, 'NoMsgTypes', 'NUMINGROUP', ()),
+    (385, 'MsgDirection', 'CHAR', (('RECEIVE', 'R'), ('SEND', 'S'),)),
+    (386, 'NoTradingSessions', 'NUMINGROUP', ()),
+    (387, 'TotalVolumeTraded', 'QTY', ()),
+    (388, 'DiscretionInst', 'CHAR', (('RELDISPPX', '0'), ('RELMKTPX', '1'), ('RELPRIMPX', '2'), ('RELLOCPRIMPX', '3'), ('RELMIDPX', '4'), ('RELLSTPX', '5'), ('RELVWAP', '6'),)),
+    (389, 'DiscretionOffsetValue', 'FLOAT', ()),
+    (390, 'BidID', 'STRING', ()),
+    (391, 'ClientBidID', 'STRING', ()),
+    (392, 'ListName', 'STRING', ()),
+    (393, 'TotNoRelatedSym', 'INT', ()),
+    (394, 'BidType', 'INT', (('NONDISC', 1), ('DISC', 2), ('NOBID', 3),)),
+    (395, 'NumTickets', 'INT', ()),
+    (396, 'SideValue1', 'AMT', ()),
+    (397, 'SideValue2', 'AMT', ()),
+    (398, 'NoBidDescriptors', 'NUMINGROUP', ()),
+    (399, 'BidDescriptorType', 'INT', (('SECTOR', 1), ('COUNTRY', 2), ('INDEX', 3),)),
+    (400, 'BidDescriptor', 'STRING', ()),
+    (401, 'SideValueInd', 'INT', (('SIDEVALUE1', 1), ('SIDEVALUE2', 2),)),
+    (402, 'LiquidityPctLow', 'PERCENTAGE', ()),
+    (403, 'LiquidityPctHigh', 'PERCENTAGE', ()),
+    (404, 'LiquidityValue', 'AMT', ()),
+    (405, 'EFPTrackingError', 'PERCENTAGE', ()),
+    (406, 'FairValue', 'AMT', ()),
+    (407, 'OutsideIndexPct', 'PERCENTAGE', ()),
+    (408, 'ValueOfFutures', 'AMT', ()),
+    (409, 'LiquidityIndType', 'INT', (('_5DAY', 1), ('_20DAY', 2), ('NORMAL', 3), ('OTHER', 4),)),
+    (410, 'WtAverageLiquidity', 'PERCENTAGE', ()),
+    (411, 'ExchangeForPhysical', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (412, 'OutMainCntryUIndex', 'AMT', ()),
+    (413, 'CrossPercent', 'PERCENTAGE', ()),
+    (414, 'ProgRptReqs', 'INT', (('BUYSIDE', 1), ('SELLSIDE', 2), ('REALTIME', 3),)),
+    (415, 'ProgPeriodInterval', 'INT', ()),
+    (416, 'IncTaxInd', 'INT', (('NET', 1), ('GROSS', 2),)),
+    (417, 'NumBidders', 'INT', ()),
+    (418, 'BidTradeType', 'CHAR', (('AGENCY', 'A'), ('VWAPGUARANTEE', 'G'), ('GUARANTEEDCLOSE', 'J'), ('RISKTRADE', 'R'),)),
+    (419, 'BasisPxType', 'CHAR', (('CLSPXMORN', '2'), ('CLSPX', '3'), ('CURRPX', '4'), ('SQ', '5'), ('VWAPDAY', '6'), ('VWAPMORN', '7'), ('VWAPAFT', '8'), ('VWAPDAYXYORI', '9'), ('VWAPMORNXYORI', 'A'), ('VWAPAFTXYORI', 'B'), ('STRIKE', 'C'), ('OPEN', 'D'), ('OTHERS', 'Z'),)),
+    (420, 'NoBidComponents', 'NUMINGROUP', ()),
+    (421, 'Country', 'COUNTRY', ()),
+    (422, 'TotNoStrikes', 'INT', ()),
+    (423, 'PriceType', 'INT', (('PCT', 1), ('FIXEDCABINETTRADEPRICE', 10), ('VARIABLECABINETTRADEPRICE', 11), ('CPS', 2), ('ABS', 3), ('DISCOUNT', 4), ('PREMIUM', 5), ('SPREAD', 6), ('TEDPRICE', 7), ('TEDYIELD', 8), ('YIELD', 9),)),
+    (424, 'DayOrderQty', 'QTY', ()),
+    (425, 'DayCumQty', 'QTY', ()),
+    (426, 'DayAvgPx', 'PRICE', ()),
+    (427, 'GTBookingInst', 'INT', (('BOOKALL', 0), ('ACCUMUNTILFILL', 1), ('ACCUMUNTILNOTIFY', 2),)),
+    (428, 'NoStrikes', 'NUMINGROUP', ()),
+    (429, 'ListStatusType', 'INT', (('ACK', 1), ('RESP', 2), ('TIMED', 3), ('EXECSTART', 4), ('ALLDONE', 5), ('ALERT', 6),)),
+    (430, 'NetGrossInd', 'INT', (('NET', 1), ('GROSS', 2),)),
+    (431, 'ListOrderStatus', 'INT', (('INBIDPROC', 1), ('RECVFOREXEC', 2), ('EXEC', 3), ('CXL', 4), ('ALERT', 5), ('ALLDONE', 6), ('REJ', 7),)),
+    (432, 'ExpireDate', 'LOCALMKTDATE', ()),
+    (433, 'ListExecInstType', 'CHAR', (('IMMED', '1'), ('WAIT', '2'), ('EXCHCIVSELL', '3'), ('EXCHCIVBUYTOP', '4'), ('EXCHCIVBUYWD', '5'),)),
+    (434, 'CxlRejResponseTo', 'CHAR', (('ORDCXLREQ', '1'), ('ORDCXLREPREQ', '2'),)),
+    (435, 'UnderlyingCouponRate', 'PERCENTAGE', ()),
+    (436, 'UnderlyingContractMultiplier', 'FLOAT', ()),
+    (437, 'ContraTradeQty', 'QTY', ()),
+    (438, 'ContraTradeTime', 'UTCTIMESTAMP', ()),
+    (439, 'ClearingFirm', 'STRING', ()),
+    (440, 'ClearingAccount', 'STRING', ()),
+    (441, 'LiquidityNumSecurities', 'INT', ()),
+    (442, 'MultiLegReportingType', 'CHAR', (('SINGLE', '1'), ('INDIVLEG', '2'), ('MULTILEG', '3'),)),
+    (443, 'StrikeTime', 'UTCTIMESTAMP', ()),
+    (444, 'ListStatusText', 'STRING', ()),
+    (445, 'EncodedListStatusTextLen', 'LENGTH', ()),
+    (446, 'EncodedListStatusText', 'DATA', ()),
+    (447, 'PartyIDSource', 'CHAR', (('KOREANINVESTORID', '1'), ('TAIWANESEQUALIFIED', '2'), ('TAIWANESETRADINGACCT', '3'), ('MCDNUMBER', '4'), ('CHINESEBSHARE', '5'), ('UKNATIONALINSPENNUMBER', '6'), ('USSOCIALSECURITY', '7'), ('USEMPLOYERIDNUMBER', '8'), ('AUSTRALIANBUSINESSNUMBER', '9'), ('AUSTRALIANTAXFILENUMBER', 'A'), ('BIC', 'B'), ('ACCPTMARKETPART', 'C'), ('PROPCODE', 'D'), ('ISOCODE', 'E'), ('SETTLENTLOC', 'F'), ('MIC', 'G'), ('CSDPARTCODE', 'H'), ('DIRECTEDDEFINEDISITC', 'I'),)),
+    (448, 'PartyID', 'STRING', ()),
+    (449, 'TotalVolumeTradedDate', 'UTCDATEONLY', ()),
+    (450, 'TotalVolumeTradedTime', 'UTCTIMEONLY', ()),
+    (451, 'NetChgPrevDay', 'PRICEOFFSET', ()),
+    (452, 'PartyRole', 'INT', (('EXECUTINGFIRM', 1), ('SETTLEMENTLOCATION', 10), ('INITIATINGTRADER', 11), ('EXECUTINGTRADER', 12), ('ORDERORIGINATOR', 13), ('GIVEUPCLEARINGFIRM', 14), ('CORRESPONDANTCLEARINGFIRM', 15), ('EXECUTINGSYSTEM', 16), ('CONTRAFIRM', 17), ('CONTRACLEARINGFIRM', 18), ('SPONSORINGFIRM', 19), ('BROKEROFCREDIT', 2), ('UNDRCONTRAFIRM', 20), ('CLEARINGORGANIZATION', 21), ('EXCHANGE', 22), ('CUSTOMERACCOUNT', 24), ('CORRESPONDENTCLEARINGORGANIZATION', 25), ('CORRESPONDENTBROKER', 26), ('BUYERSELLERRECEIVERDELIVERER', 27), ('CUSTODIAN', 28), ('INTERMEDIARY', 29), ('CLIENTID', 3), ('AGENT', 30), ('SUBCUSTODIAN', 31), ('BENEFICIARY', 32), ('INTERESTEDPARTY', 33), ('REGULATORYBODY', 34), ('LIQUIDITYPROVIDER', 35), ('ENTERINGTRADER', 36), ('CONTRATRADER', 37), ('POSITIONACCOUNT', 38), ('ALLOCENTITY', 39), ('CLEARINGFIRM', 4), ('INVESTORID', 5), ('INTRODUCINGFIRM', 6), ('ENTERINGFIRM', 7), ('LOCATELENDINGFIRM', 8), ('FUNDMANAGER', 9),)),
+    (453, 'NoPartyIDs', 'NUMINGROUP', ()),
+    (454, 'NoSecurityAltID', 'NUMINGROUP', ()),
+    (455, 'SecurityAltID', 'STRING', ()),
+    (456, 'SecurityAltIDSource', 'STRING', ()),
+    (457, 'NoUnderlyingSecurityAltID', 'NUMINGROUP', ()),
+    (458, 'UnderlyingSecurityAltID', 'STRING', ()),
+    (459, 'UnderlyingSecurityAltIDSource', 'STRING', ()),
+    (460, 'Product', 'INT', (('AGENCY', 1), ('MORTGAGE', 10), ('MUNICIPAL', 11), ('OTHER', 12), ('FINANCING', 13), ('COMMODITY', 2), ('CORPORATE', 3), ('CURRENCY', 4), ('EQUITY', 5), ('GOVERNMENT', 6), ('INDEX', 7), ('LOAN', 8), ('MONEYMARKET', 9),)),
+    (461, 'CFICode', 'STRING', ()),
+    (462, 'UnderlyingProduct', 'INT', ()),
+    (463, 'UnderlyingCFICode', 'STRING', ()),
+    (464, 'TestMessageIndicator', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (465, 'QuantityType', 'INT', (('SHARES', 1), ('BONDS', 2), ('CURRENTFACE', 3), ('ORIGINALFACE', 4), ('CURRENCY', 5), ('CONTRACTS', 6), ('OTHER', 7), ('PAR', 8),)),
+    (466, 'BookingRefID', 'STRING', ()),
+    (467, 'IndividualAllocID', 'STRING', ()),
+    (468, 'RoundingDirection', 'CHAR', (('ROUNDNEAREST', '0'), ('ROUNDDOWN', '1'), ('ROUNDUP', '2'),)),
+    (469, 'RoundingModulus', 'FLOAT', ()),
+    (470, 'CountryOfIssue', 'COUNTRY', ()),
+    (471, 'StateOrProvinceOfIssue', 'STRING', ()),
+    (472, 'LocaleOfIssue', 'STRING', ()),
+    (473, 'NoRegistDtls', 'NUMINGROUP', ()),
+    (474, 'MailingDtls', 'STRING', ()),
+    (475, 'InvestorCountryOfResidence', 'COUNTRY', ()),
+    (476, 'PaymentRef', 'STRING', ()),
+    (477, 'DistribPaymentMethod', 'INT', (('CREST', 1), ('BPAY', 10), ('HIGHVALUECLEARINGSYSTEMHVACS', 11), ('REINVESTINFUND', 12), ('NSCC', 2), ('EUROCLEAR', 3), ('CLEARSTREAM', 4), ('CHEQUE', 5), ('TELEGRAPHICTRANSFER', 6), ('FEDWIRE', 7), ('DIRECTCREDITBECSBACS', 8), ('ACHCREDIT', 9),)),
+    (478, 'CashDistribCurr', 'CURRENCY', ()),
+    (479, 'CommCurrency', 'CURRENCY', ()),
+    (480, 'CancellationRights', 'CHAR', (('NOWAIVER', 'M'), ('NOEXECONLY', 'N'), ('NOINSTIT', 'O'), ('YES', 'Y'),)),
+    (481, 'MoneyLaunderingStatus', 'CHAR', (('EXBELOWLIM', '1'), ('EXCLIENTMONEYTYPE', '2'), ('EXAUTHCREDIT', '3'), ('NOTCHECKED', 'N'), ('PASSED', 'Y'),)),
+    (482, 'MailingInst', 'STRING', ()),
+    (483, 'TransBkdTime', 'UTCTIMESTAMP', ()),
+    (484, 'ExecPriceType', 'CHAR', (('BIDPRICE', 'B'), ('CREATIONPRICE', 'C'), ('CREATIONPRICEADJPCT', 'D'), ('CREATIONPRICEADJAMT', 'E'), ('OFFERPRICE', 'O'), ('OFFERPRICEMINUSADJPCT', 'P'), ('OFFERPRICEMINUSADJAMT', 'Q'), ('SINGLEPRICE', 'S'),)),
+    (485, 'ExecPriceAdjustment', 'FLOAT', ()),
+    (486, 'DateOfBirth', 'LOCALMKTDATE', ()),
+    (487, 'TradeReportTransType', 'INT', (('NEW', 0), ('CANCEL', 1), ('REPLACE', 2), ('RELEASE', 3), ('REVERSE', 4),)),
+    (488, 'CardHolderName', 'STRING', ()),
+    (489, 'CardNumber', 'STRING', ()),
+    (490, 'CardExpDate', 'LOCALMKTDATE', ()),
+    (491, 'CardIssNum', 'STRING', ()),
+    (492, 'PaymentMethod', 'INT', (('CREST', 1), ('DIRECTCREDITBECS', 10), ('CREDITCARD', 11), ('ACHDEBIT', 12), ('ACHCREDIT', 13), ('BPAY', 14), ('HIGHVALUECLEARINGSYSTEMHVACS', 15), ('NSCC', 2), ('EUROCLEAR', 3), ('CLEARSTREAM', 4), ('CHEQUE', 5), ('TELEGRAPHICTRANSFER', 6), ('FEDWIRE', 7), ('DEBITCARD', 8), ('DIRECTDEBITBECS', 9),)),
+    (493, 'RegistAcctType', 'STRING', ()),
+    (494, 'Designation', 'STRING', ()),
+    (495, 'TaxAdvantageType', 'INT', (('NONE', 0), ('MAXIISAUK', 1), ('EMPLOYEECURRENTYEARUS', 10), ('EMPLOYERPRIORYEARUS', 11), ('EMPLOYERCURRENTYEARUS', 12), ('NONFUNDPROTOTYPEIRAUS', 13), ('NONFUNDQUALIFIEDPLANUS', 14), ('DEFINEDCONTRIBUTIONPLANUS', 15), ('INDIVIDUALRETIREMENTACCOUNTUS', 16), ('INDIVIDUALRETIREMENTACCOUNTROLLOVERUS', 17), ('KEOGHUS', 18), ('PROFITSHARINGPLANUS', 19), ('TESSAUK', 2), ('_401KUS', 20), ('SELFDIRECTEDIRAUS', 21), ('_403BUS', 22), ('_457US', 23), ('ROTHIRAFUNDPROTOTYPEUS', 24), ('ROTHIRANONPROTOTYPEUS', 25), ('ROTHCONVERSIONIRAFUNDPROTOTYPEUS', 26), ('ROTHCONVERSIONIRANONPROTOTYPEUS', 27), ('EDUCATIONIRAFUNDPROTOTYPEUS', 28), ('EDUCATIONIRANONPROTOTYPEUS', 29), ('MINICASHISAUK', 3), ('MINISTOCKSANDSHARESISAUK', 4), ('MINIINSURANCEISAUK', 5), ('CURRENTYEARPAYMENTUS', 6), ('PRIORYEARPAYMENTUS', 7), ('ASSETTRANSFERUS', 8), ('EMPLOYEEPRIORYEARUS', 9), ('OTHER', 999),)),
+    (496, 'RegistRejReasonText', 'STRING', ()),
+    (497, 'FundRenewWaiv', 'CHAR', (('NO', 'N'), ('YES', 'Y'),)),
+    (498, 'CashDistribAgentName', 'STRING', ()),
+    (499, 'CashDistribAgentCode', 'STRING', ()),
+    (500, 'CashDistribAgentAcctNumber', 'STRING', ()),
+    (501, 'CashDistribPayRef', 'STRING', ()),
+    (502, 'CashDistribAgentAcctName', 'STRING', ()),
+    (503, 'CardStartDate', 'LOCALMKTDATE', ()),
+    (504, 'PaymentDate', 'LOCALMKTDATE', ()),
+    (505, 'PaymentRemitterID', 'STRING', ()),
+    (506, 'RegistStatus', 'CHAR', (('ACCEPTED', 'A'), ('HELD', 'H'), ('REMINDER_IE_REGISTRATION_INSTRUCTIONS_ARE_STILL_OUTSTANDING', 'N'), ('REJECTED', 'R'),)),
+    (507, 'RegistRejReasonCode', 'INT', (('INVALIDACCOUNTTYPE', 1), ('INVALIDINVESTORIDSOURCE', 10), ('INVALIDDATEOFBIRTH', 11), ('INVALIDINVESTORCOUNTRYOFRESIDENCE', 12), ('INVALIDNODISTRIBINSTNS', 13), ('INVALIDDISTRIBPERCENTAGE', 14), ('INVALIDDISTRIBPAYMENTMETHOD', 15), ('INVALIDCASHDISTRIBAGENTACCTNAME', 16), ('INVALIDCASHDISTRIBAGENTCODE', 17), ('INVALIDCASHDISTRIBAGENTACCTNUM', 18), ('INVALIDTAXEXEMPTTYPE', 2), ('INVALIDOWNERSHIPTYPE', 3), ('INVALIDNOREGDETLS', 4), ('INVALIDREGSEQNO', 5), ('INVALIDREGDTLS', 6), ('INVALIDMAILINGDTLS', 7), ('INVALIDMAILINGINST', 8), ('INVALIDINVESTORID', 9), ('OTHER', 99),)),
+    (508, 'RegistRefID', 'STRING', ()),
+    (509, 'RegistDtls', 'STRING', ()),
+    (510, 'NoDistribInsts', 'NUMINGROUP', ()),
+    (511, 'RegistEmail', 'STRING', ()),
+    (512, 'DistribPercentage', 'PERCENTAGE', ()),
+    (513, 'RegistID', 'STRING', ()),
+    (514, 'RegistTransType', 'CHAR', (('NEW', '0'), ('REPLACE', '1'), ('CANCEL', '2'),)),
+    (515, 'ExecValuationPoint', 'UTCTIMESTAMP', ()),
+    (516, 'OrderPercent', 'PERCENTAGE', ()),
+    (517, 'OwnershipType', 'CHAR', (('JOINT_TRUSTEES', '2'), ('JOINT_INVESTORS', 'J'), ('TENANTS_IN_COMMON', 'T'),)),
+    (518, 'NoContAmts', 'NUMINGROUP', ()),
+    (519, 'ContAmtType', 'INT', (('COMMISSIONAMT', 1), ('EXITCHARGEPCT', 10), ('FUNDBASEDRENEWALCOMM', 11), ('PROJECTEDFUNDVALUE', 12), ('FUNDBASEDRENEWALCOMMAMTORD', 13), ('FUNDBASEDRENEWALCOMMAMTPROJ', 14), ('NETSETTLEMENTAMOUNT', 15), ('COMMISSIONPCT', 2), ('INITIALCHARGEAMT', 3), ('INITIALCHARGEPCT', 4), ('DISCOUNTAMT', 5), ('DISCOUNTPCT', 6), ('DILUTIONLEVYAMT', 7), ('DILUTIONLEVYPCT', 8), ('EXITCHARGEAMT', 9),)),
+    (520, 'ContAmtValue', 'FLOAT', ()),
+    (521, 'ContAmtCurr', 'CURRENCY', ()),
+    (522, 'OwnerType', 'INT', (('INDIVINVESTOR', 1), ('NETWORKINGSUBACCT', 10), ('NON_PROFITORG', 11), ('CORPBODY', 12), ('NOMINEE', 13), ('PUBLICCOMPANY', 2), ('PRIVATECOMPANY', 3), ('INDIVTRUSTEE', 4), ('COMPANYTRUSTEE', 5), ('PENSIONPLAN', 6), ('CUSTODIANMINORSACT', 7), ('TRUSTS', 8), ('FIDUCIARIES', 9),)),
+    (523, 'PartySubID', 'STRING', ()),
+    (524, 'NestedPartyID', 'STRING', ()),
+    (525, 'NestedPartyIDSource', 'CHAR', ()),
+    (526, 'SecondaryClOrdID', 'STRING', ()),
+    (527, 'SecondaryExecID', 'STRING', ()),
+    (528, 'OrderCapacity', 'CHAR', (('AGENCY', 'A'), ('PROPRIETARY', 'G'), ('INDIVIDUAL', 'I'), ('PRINCIPAL', 'P'), ('RISKLESSPRINCIPAL', 'R'), ('AGENTOTHERMEMBER', 'W'),)),
+    (529, 'OrderRestrictions', 'MULTIPLESTRINGVALUE', (('PROGRAMTRADE', '1'), ('INDEXARBITRAGE', '2'), ('NON_INDEXARBITRAGE', '3'), ('COMPETINGMARKETMAKER', '4'), ('ACTMM', '5'), ('ACTMMDERIV', '6'), ('FORENTITY', '7'), ('EXMRKTPART', '8'), ('EXINTMRKTLINK', '9'), ('RISKARB', 'A'),)),
+    (530, 'MassCancelRequestType', 'CHAR', (('CXLORDERSSECURITY', '1'), ('CXLORDERSUNDERLYINGSECURITY', '2'), ('CXLORDERSPRODUCT', '3'), ('CXLORDERSCFICODE', '4'), ('CXLORDERSSECURITYTYPE', '5'), ('CXLORDERSTRDSESSION', '6'), ('CXLALLORDERS', '7'),)),
+    (531, 'MassCancelResponse', 'CHAR', (('CXLREQREJ', '0'), ('CXLORDERSSECURITY', '1'), ('CXLORDERSUNDERLYINGSECURITY', '2'), ('CXLORDERSPRODUCT', '3'), ('CXLORDERSCFICODE', '4'), ('CXLORDERSSECURITYTYPE', '5'), ('CXLORDERSTRDSESSION', '6'), ('CXLALLORDERS', '7'),)),
+    (532, 'MassCancelRejectReason', 'STRING', (('MASSCXLNOTSUPPORTED', '0'), ('INVALIDSECURITY', '1'), ('INVALIDUNDERLYING', '2'), ('INVALIDPRODUCT', '3'), ('INVALIDCFICODE', '4'), ('INVALIDSECURITYTYPE', '5'), ('INVALIDTRDSESSION', '6'), ('OTHER', '99'),)),
+    (533, 'TotalAffectedOrders', 'INT', ()),
+    (534, 'NoAffectedOrders', 'INT', ()),
+    (535, 'AffectedOrderID', 'STRING', ()),
+    (536, 'AffectedSecondaryOrderID', 'STRING', ()),
+    (537, 'QuoteType', 'INT', (('INDICATIVE', 0), ('TRADEABLE', 1), ('RESTRICTEDTRADEABLE', 2), ('COUNTER', 3),)),
+    (538, 'NestedPartyRole', 'INT', ()),
+    (539, 'NoNestedPartyIDs', 'NUMINGROUP', ()),
+    (540, 'TotalAccruedInterestAmt', 'AMT', ()),
+    (541, 'MaturityDate', 'LOCALMKTDATE', ()),
+    (542, 'UnderlyingMaturityDate', 'LOCALMKTDATE', ()),
+    (543, 'InstrRegistry', 'STRING', (('CUSTODIAN', 'BIC'), ('COUNTRY', 'ISO'), ('PHYSICAL', 'ZZ'),)),
+    (544, 'CashMargin', 'CHAR', (('CASH', '1'), ('MARGINOPEN', '2'), ('MARGINCLOSE', '3'),)),
+    (545, 'NestedPartySubID', 'STRING', ()),
+    (546, 'Scope', 'MULTIPLESTRINGVALUE', (('LOCALMARKET', '1'), ('NATIONAL', '2'), ('GLOBAL', '3'),)),
+    (547, 'MDImplicitDelete', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (548, 'CrossID', 'STRING', ()),
+    (549, 'CrossType', 'INT', (('CROSSAON', 1), ('CROSSIOC', 2), ('CROSSONESIDE', 3), ('CROSSSAMEPRICE', 4),)),
+    (550, 'CrossPrioritization', 'INT', (('NONE', 0), ('BUY_SIDE_PRIORITIZED', 1), ('SELL_SIDE_PRIORITIZED', 2),)),
+    (551, 'OrigCrossID', 'STRING', ()),
+    (552, 'NoSides', 'NUMINGROUP', (('ONESIDE', '1'), ('BOTHSIDES', '2'),)),
+    (553, 'Username', 'STRING', ()),
+    (554, 'Password', 'STRING', ()),
+    (555, 'NoLegs', 'NUMINGROUP', ()),
+    (556, 'LegCurrency', 'CURRENCY', ()),
+    (557, 'TotNoSecurityTypes', 'INT', ()),
+    (558, 'NoSecurityTypes', 'NUMINGROUP', ()),
+    (559, 'SecurityListRequestType', 'INT', (('SYMBOL', 0), ('SECURITYTYPECFICODE', 1), ('PRODUCT', 2), ('TRADINGSESSIONID', 3), ('ALLSECURITIES', 4),)),
+    (560, 'SecurityRequestResult', 'INT', (('VALIDREQ', 0), ('INVALIDREQ', 1), ('NOINSTRUMENTSFOUND', 2), ('NOTAUTHORIZED', 3), ('INSTRUMENTUNAVAILABLE', 4), ('NOTSUPPORTED', 5),)),
+    (561, 'RoundLot', 'QTY', ()),
+    (562, 'MinTradeVol', 'QTY', ()),
+    (563, 'MultiLegRptTypeReq', 'INT', (('REPORT_BY_MULITLEG_SECURITY_ONLY', 0), ('REPORT_BY_MULTILEG_SECURITY_AND_BY_INSTRUMENT_LEGS_BELONGING_TO_THE_MULTILEG_SECURITY', 1), ('REPORT_BY_INSTRUMENT_LEGS_BELONGING_TO_THE_MULTILEG_SECURITY_ONLY', 2),)),
+    (564, 'LegPositionEffect', 'CHAR', ()),
+    (565, 'LegCoveredOrUncovered', 'INT', ()),
+    (566, 'LegPrice', 'PRICE', ()),
+    (567, 'TradSesStatusRejReason', 'INT', (('UNKNOWNTRADINGSESSIONID', 1), ('OTHER', 99),)),
+    (568, 'TradeRequestID', 'STRING', ()),
+    (569, 'TradeRequestType', 'INT', (('ALLTRADES', 0), ('MATCHEDTRADES', 1), ('UNMATCHEDTRADES', 2), ('UNREPORTEDTRADES', 3), ('ADVISORIESMATCH', 4),)),
+    (570, 'PreviouslyReported', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (571, 'TradeReportID', 'STRING', ()),
+    (572, 'TradeReportRefID', 'STRING', ()),
+    (573, 'MatchStatus', 'CHAR', (('COMPMATAFF', '0'), ('UNCOMPUNMATUNAFF', '1'), ('ADVALERT', '2'),)),
+    (574, 'MatchType', 'STRING', (('EXACTMATCHONTRADEDATESTOCKSYMBOLQUANTITYPRICETRADETYPEANDSPECIALTRADEINDICATORPLUSFOURBADGESANDEXECUTIONTIME', 'A1'), ('EXACTMATCHONTRADEDATESTOCKSYMBOLQUANTITYPRICETRADETYPEANDSPECIALTRADEINDICATORPLUSFOURBADGES', 'A2'), ('EXACTMATCHONTRADEDATESTOCKSYMBOLQUANTITYPRICETRADETYPEANDSPECIALTRADEINDICATORPLUSTWOBADGESANDEXECUTIONTIME', 'A3'), ('EXACTMATCHONTRADEDATESTOCKSYMBOLQUANTITYPRICETRADETYPEANDSPECIALTRADEINDICATORPLUSTWOBADGES', 'A4'), ('EXACTMATCHONTRADEDATESTOCKSYMBOLQUANTITYPRICETRADETYPEANDSPECIALTRADEINDICATORPLUSEXECUTIONTIME', 'A5'), ('NASDAQACTM1MATCH', 'ACTM1'), ('NASDAQACTM2MATCH', 'ACTM2'), ('NASDAQACTACCEPTEDTRADE', 'ACTM3'), ('NASDAQACTDEFAULTTRADE', 'ACTM4'), ('NASDAQACTDEFAULTAFTERM2', 'ACTM5'), ('NASDAQACTM6MATCH', 'ACTM6'), ('NASDAQNONACT', 'ACTMT'), ('COMPAREDRECORDSRESULTINGFROMSTAMPEDADVISORIESORSPECIALISTACCEPTSPAIROFFS', 'AQ'), ('EXACTMATCHONTRADEDATESTOCKSYMBOLQUANTITYPRICETRADETYPEANDSPECIALTRADEINDICATORMINUSBADGESANDTIMES', 'M1'), ('SUMMARIZEDMATCHMINUSBADGESANDTIMES', 'M2'), ('OCSLOCKEDIN', 'MT'), ('SUMMARIZEDMATCHUSINGA1', 'S1'), ('SUMMARIZEDMATCHUSINGA2', 'S2'), ('SUMMARIZEDMATCHUSINGA3', 'S3'), ('SUMMARIZEDMATCHUSINGA4', 'S4'), ('SUMMARIZEDMATCHUSINGA5', 'S5'),)),
+    (575, 'OddLot', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (576, 'NoClearingInstructions', 'NUMINGROUP', ()),
+    (577, 'ClearingInstruction', 'INT', (('PROCESSNORMALLY', 0), ('EXCLUDEFROMALLNETTING', 1), ('AUTOMATICGIVEUPMODETRADEGIVEUPTOTHEGIVEUPDESTINATIONNUMBERSPECIFIED', 10), ('QUALIFIEDSERVICEREPRESENTATIVEQSR', 11), ('CUSTOMERTRADE', 12), ('SELFCLEARING', 13), ('BILATERALNETTINGONLY', 2), ('EXCLEARING', 3), ('SPECIALTRADE', 4), ('MULTILATERALNETTING', 5), ('CLEARAGAINSTCENTRALCOUNTERPARTY', 6), ('EXCLUDEFROMCENTRALCOUNTERPARTY', 7), ('MANUALMODEPREPOSTINGANDORPREGIVEUP', 8), ('AUTOMATICPOSTINGMODETRADEPOSTINGTOTHEPOSITIONACCOUNTNUMBERSPECIFIED', 9),)),
+    (578, 'TradeInputSource', 'STRING', ()),
+    (579, 'TradeInputDevice', 'STRING', ()),
+    (580, 'NoDates', 'INT', ()),
+    (581, 'AccountType', 'INT', (('ACCOUNTCUSTOMER', 1), ('ACCOUNTNONCUSTOMER', 2), ('HOUSETRADER', 3), ('FLOORTRADER', 4), ('ACCOUNTNONCUSTOMERCROSS', 6), ('HOUSETRADERCROSS', 7), ('JOINTBOACCT', 8),)),
+    (582, 'CustOrderCapacity', 'INT', (('MEMBER_TRADING_FOR_THEIR_OWN_ACCOUNT', 1), ('CLEARING_FIRM_TRADING_FOR_ITS_PROPRIETARY_ACCOUNT', 2), ('MEMBER_TRADING_FOR_ANOTHER_MEMBER', 3), ('ALL_OTHER', 4),)),
+    (583, 'ClOrdLinkID', 'STRING', ()),
+    (584, 'MassStatusReqID', 'STRING', ()),
+    (585, 'MassStatusReqType', 'INT', (('STATUSSECURITY', 1), ('STATUSUNDERLYINGSECURITY', 2), ('STATUSPRODUCT', 3), ('STATUSCFICODE', 4), ('STATUSSECURITYTYPE', 5), ('STATUSTRDSESSION', 6), ('STATUSALLORDERS', 7), ('STATUSPARTYID', 8),)),
+    (586, 'OrigOrdModTime', 'UTCTIMESTAMP', ()),
+    (587, 'LegSettlType', 'CHAR', ()),
+    (588, 'LegSettlDate', 'LOCALMKTDATE', ()),
+    (589, 'DayBookingInst', 'CHAR', (('CAN_TRIGGER_BOOKING_WITHOUT_REFERENCE_TO_THE_ORDER_INITIATOR_AUTO', '0'), ('SPEAK_WITH_ORDER_INITIATOR_BEFORE_BOOKING_SPEAK_FIRST', '1'), ('ACCUMULATE', '2'),)),
+    (590, 'BookingUnit', 'CHAR', (('EACH_PARTIAL_EXECUTION_IS_A_BOOKABLE_UNIT', '0'), ('AGGREGATE_PARTIAL_EXECUTIONS_ON_THIS_ORDER_AND_BOOK_ONE_TRADE_PER_ORDER', '1'), ('AGGREGATE_EXECUTIONS_FOR_THIS_SYMBOL_SIDE_AND_SETTLEMENT_DATE', '2'),)),
+    (591, 'PreallocMethod', 'CHAR', (('PRORATA', '0'), ('DO_NOT_PRORATA_DISCUSS_FIRST', '1'),)),
+    (592, 'UnderlyingCountryOfIssue', 'COUNTRY', ()),
+    (593, 'UnderlyingStateOrProvinceOfIssue', 'STRING', ()),
+    (594, 'UnderlyingLocaleOfIssue', 'STRING', ()),
+    (595, 'UnderlyingInstrRegistry', 'STRING', ()),
+    (596, 'LegCountryOfIssue', 'COUNTRY', ()),
+    (597, 'LegStateOrProvinceOfIssue', 'STRING', ()),
+    (598, 'LegLocaleOfIssue', 'STRING', ()),
+    (599, 'LegInstrRegistry', 'STRING', ()),
+    (600, 'LegSymbol', 'STRING', ()),
+    (601, 'LegSymbolSfx', 'STRING', ()),
+    (602, 'LegSecurityID', 'STRING', ()),
+    (603, 'LegSecurityIDSource', 'STRING', ()),
+    (604, 'NoLegSecurityAltID', 'STRING', ()),
+    (605, 'LegSecurityAltID', 'STRING', ()),
+    (606, 'LegSecurityAltIDSource', 'STRING', ()),
+    (607, 'LegProduct', 'INT', ()),
+    (608, 'LegCFICode', 'STRING', ()),
+    (609, 'LegSecurityType', 'STRING', ()),
+    (610, 'LegMaturityMonthYear', 'MONTHYEAR', ()),
+    (611, 'LegMaturityDate', 'LOCALMKTDATE', ()),
+    (612, 'LegStrikePrice', 'PRICE', ()),
+    (613, 'LegOptAttribute', 'CHAR', ()),
+    (614, 'LegContractMultiplier', 'FLOAT', ()),
+    (615, 'LegCouponRate', 'PERCENTAGE', ()),
+    (616, 'LegSecurityExchange', 'EXCHANGE', ()),
+    (617, 'LegIssuer', 'STRING', ()),
+    (618, 'EncodedLegIssuerLen', 'LENGTH', ()),
+    (619, 'EncodedLegIssuer', 'DATA', ()),
+    (620, 'LegSecurityDesc', 'STRING', ()),
+    (621, 'EncodedLegSecurityDescLen', 'LENGTH', ()),
+    (622, 'EncodedLegSecurityDesc', 'DATA', ()),
+    (623, 'LegRatioQty', 'FLOAT', ()),
+    (624, 'LegSide', 'CHAR', ()),
+    (625, 'TradingSessionSubID', 'STRING', ()),
+    (626, 'AllocType', 'INT', (('BUYSIDECALC', 1), ('BUYSIDEPRELIM', 2), ('SELLSIDECALC', 3), ('SELLSIDECALCWITHOUTPRELIM', 4), ('BUYSIDEREADYTOBOOKSINGLE', 5), ('BUYSIDEREADYTOBOOKCOMBINED', 6), ('WAREHOUSEINSTRUCTION', 7), ('REQUESTTOINTERMEDIARY', 8),)),
+    (627, 'NoHops', 'NUMINGROUP', ()),
+    (628, 'HopCompID', 'STRING', ()),
+    (629, 'HopSendingTime', 'UTCTIMESTAMP', ()),
+    (630, 'HopRefID', 'SEQNUM', ()),
+    (631, 'MidPx', 'PRICE', ()),
+    (632, 'BidYield', 'PERCENTAGE', ()),
+    (633, 'MidYield', 'PERCENTAGE', ()),
+    (634, 'OfferYield', 'PERCENTAGE', ()),
+    (635, 'ClearingFeeIndicator', 'STRING', (('_1STYEARDELEGATE', '1'), ('_2NDYEARDELEGATE', '2'), ('_3RDYEARDELEGATE', '3'), ('_4THYEARDELEGATE', '4'), ('_5THYEARDELEGATE', '5'), ('_6THYEARDELEGATE', '9'), ('CBOEMEMBER', 'B'), ('NONMEMBERCUSTOMER', 'C'), ('EQUITYCLEARINGMEMBER', 'E'), ('FULLASSOCIATEMEMBER', 'F'), ('_106H106J', 'H'), ('GIMIDEMCOMMEMBERSHIP', 'I'), ('LESSEE106F', 'L'), ('ALLOTHERS', 'M'),)),
+    (636, 'WorkingIndicator', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (637, 'LegLastPx', 'PRICE', ()),
+    (638, 'PriorityIndicator', 'INT', (('PRIORITYUNCHANGED', 0), ('LOSTPRIORITY', 1),)),
+    (639, 'PriceImprovement', 'PRICEOFFSET', ()),
+    (640, 'Price2', 'PRICE', ()),
+    (641, 'LastForwardPoints2', 'PRICEOFFSET', ()),
+    (642, 'BidForwardPoints2', 'PRICEOFFSET', ()),
+    (643, 'OfferForwardPoints2', 'PRICEOFFSET', ()),
+    (644, 'RFQReqID', 'STRING', ()),
+    (645, 'MktBidPx', 'PRICE', ()),
+    (646, 'MktOfferPx', 'PRICE', ()),
+    (647, 'MinBidSize', 'QTY', ()),
+    (648, 'MinOfferSize', 'QTY', ()),
+    (649, 'QuoteStatusReqID', 'STRING', ()),
+    (650, 'LegalConfirm', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (651, 'UnderlyingLastPx', 'PRICE', ()),
+    (652, 'UnderlyingLastQty', 'QTY', ()),
+    (653, 'SecDefStatus', 'INT', (('PENDINGAPPROVAL', 0), ('APPROVEDACCEPTED', 1), ('REJECTED', 2), ('UNAUTHORIZEDREQUEST', 3), ('INVALIDDEFINITIONREQUEST', 4),)),
+    (654, 'LegRefID', 'STRING', ()),
+    (655, 'ContraLegRefID', 'STRING', ()),
+    (656, 'SettlCurrBidFxRate', 'FLOAT', ()),
+    (657, 'SettlCurrOfferFxRate', 'FLOAT', ()),
+    (658, 'QuoteRequestRejectReason', 'INT', (('UNKNOWNSYM', 1), ('PASS', 10), ('EXCHANGECLOSED', 2), ('QUOTEREQUESTEXLIMIT', 3), ('TOOLATE', 4), ('INVPRICE', 5), ('NOTAUTHTOREQQUOTE', 6), ('NOMATCHFORINQUIRY', 7), ('NOMARKETFORINSTRUMENT', 8), ('NOINVENTORY', 9), ('OTHER', 99),)),
+    (659, 'SideComplianceID', 'STRING', ()),
+    (660, 'AcctIDSource', 'INT', (('BIC', 1), ('SIDCODE', 2), ('TFMGSPTA', 3), ('OMGEOALERTID', 4), ('DTCCCODE', 5), ('OTHER', 99),)),
+    (661, 'AllocAcctIDSource', 'INT', ()),
+    (662, 'BenchmarkPrice', 'PRICE', ()),
+    (663, 'BenchmarkPriceType', 'INT', ()),
+    (664, 'ConfirmID', 'STRING', ()),
+    (665, 'ConfirmStatus', 'INT', (('RECEIVED', 1), ('MISMATCHEDACCOUNT', 2), ('MISSINGSETTLEMENTINSTRUCTIONS', 3), ('CONFIRMED', 4), ('REQUESTREJECTED', 5),)),
+    (666, 'ConfirmTransType', 'INT', (('NEW', 0), ('REPLACE', 1), ('CANCEL', 2),)),
+    (667, 'ContractSettlMonth', 'MONTHYEAR', ()),
+    (668, 'DeliveryForm', 'INT', (('BOOKENTRY', 1), ('BEARER', 2),)),
+    (669, 'LastParPx', 'PRICE', ()),
+    (670, 'NoLegAllocs', 'NUMINGROUP', ()),
+    (671, 'LegAllocAccount', 'STRING', ()),
+    (672, 'LegIndividualAllocID', 'STRING', ()),
+    (673, 'LegAllocQty', 'QTY', ()),
+    (674, 'LegAllocAcctIDSource', 'STRING', ()),
+    (675, 'LegSettlCurrency', 'CURRENCY', ()),
+    (676, 'LegBenchmarkCurveCurrency', 'CURRENCY', ()),
+    (677, 'LegBenchmarkCurveName', 'STRING', ()),
+    (678, 'LegBenchmarkCurvePoint', 'STRING', ()),
+    (679, 'LegBenchmarkPrice', 'PRICE', ()),
+    (680, 'LegBenchmarkPriceType', 'INT', ()),
+    (681, 'LegBidPx', 'PRICE', ()),
+    (682, 'LegIOIQty', 'STRING', ()),
+    (683, 'NoLegStipulations', 'NUMINGROUP', ()),
+    (684, 'LegOfferPx', 'PRICE', ()),
+    (685, 'LegOrderQty', 'QTY', ()),
+    (686, 'LegPriceType', 'INT', ()),
+    (687, 'LegQty', 'QTY', ()),
+    (688, 'LegStipulationType', 'STRING', ()),
+    (689, 'LegStipulationValue', 'STRING', ()),
+    (690, 'LegSwapType', 'INT', (('PARFORPAR', 1), ('MODIFIEDDURATION', 2), ('RISK', 4), ('PROCEEDS', 5),)),
+    (691, 'Pool', 'STRING', ()),
+    (692, 'QuotePriceType', 'INT', (('PERCENT', 1), ('YIELD', 10), ('PERSHARE', 2), ('FIXEDAMOUNT', 3), ('DISCOUNT', 4), ('PREMIUM', 5), ('BASISPOINTSRELATIVETOBENCHMARK', 6), ('TEDPRICE', 7), ('TEDYIELD', 8), ('YIELDSPREADSWAPS', 9),)),
+    (693, 'QuoteRespID', 'STRING', ()),
+    (694, 'QuoteRespType', 'INT', (('HITLIFT', 1), ('COUNTER', 2), ('EXPIRED', 3), ('COVER', 4), ('DONEAWAY', 5), ('PASS', 6),)),
+    (695, 'QuoteQualifier', 'CHAR', ()),
+    (696, 'YieldRedemptionDate', 'LOCALMKTDATE', ()),
+    (697, 'YieldRedemptionPrice', 'PRICE', ()),
+    (698, 'YieldRedemptionPriceType', 'INT', ()),
+    (699, 'BenchmarkSecurityID', 'STRING', ()),
+    (700, 'ReversalIndicator', 'BOOLEAN', ()),
+    (701, 'YieldCalcDate', 'LOCALMKTDATE', ()),
+    (702, 'NoPositions', 'NUMINGROUP', ()),
+    (703, 'PosType', 'STRING', (('ALLOCATIONTRADEQTY', 'ALC'), ('OPTIONASSIGNMENT', 'AS'), ('ASOFTRADEQTY', 'ASF'), ('DELIVERYQTY', 'DLV'), ('ELECTRONICTRADEQTY', 'ETR'), ('OPTIONEXERCISEQTY', 'EX'), ('ENDOFDAYQTY', 'FIN'), ('INTRASPREADQTY', 'IAS'), ('INTERSPREADQTY', 'IES'), ('ADJUSTMENTQTY', 'PA'), ('PITTRADEQTY', 'PIT'), ('STARTOFDAYQTY', 'SOD'), ('INTEGRALSPLIT', 'SPL'), ('TRANSACTIONFROMASSIGNMENT', 'TA'), ('TOTALTRANSACTIONQTY', 'TOT'), ('TRANSACTIONQUANTITY', 'TQ'), ('TRANSFERTRADEQTY', 'TRF'), ('TRANSACTIONFROMEXERCISE', 'TX'), ('CROSSMARGINQTY', 'XM'),)),
+    (704, 'LongQty', 'QTY', ()),
+    (705, 'ShortQty', 'QTY', ()),
+    (706, 'PosQtyStatus', 'INT', (('SUBMITTED', 0), ('ACCEPTED', 1), ('REJECTED', 2),)),
+    (707, 'PosAmtType', 'STRING', (('CASHAMOUNTCORPORATEEVENT', 'CASH'), ('CASHRESIDUALAMOUNT', 'CRES'), ('FINALMARKTOMARKETAMOUNT', 'FMTM'), ('INCREMENTALMARKTOMARKETAMOUNT', 'IMTM'), ('PREMIUMAMOUNT', 'PREM'), ('STARTOFDAYMARKTOMARKETAMOUNT', 'SMTM'), ('TRADEVARIATIONAMOUNT', 'TVAR'), ('VALUEADJUSTEDAMOUNT', 'VADJ'),)),
+    (708, 'PosAmt', 'AMT', ()),
+    (709, 'PosTransType', 'INT', (('EXERCISE', 1), ('DONOTEXERCISE', 2), ('POSITIONADJUSTMENT', 3), ('POSITIONCHANGESUBMISSIONMARGINDISPOSITION', 4), ('PLEDGE', 5),)),
+    (710, 'PosReqID', 'STRING', ()),
+    (711, 'NoUnderlyings', 'NUMINGROUP', ()),
+    (712, 'PosMaintAction', 'INT', (('NEW', 1), ('REPLACE', 2), ('CANCEL', 3),)),
+    (713, 'OrigPosReqRefID', 'STRING', ()),
+    (714, 'PosMaintRptRefID', 'STRING', ()),
+    (715, 'ClearingBusinessDate', 'LOCALMKTDATE', ()),
+    (716, 'SettlSessID', 'STRING', ()),
+    (717, 'SettlSessSubID', 'STRING', ()),
+    (718, 'AdjustmentType', 'INT', (('PROCESSREQUESTASMARGINDISPOSITION', 0), ('DELTAPLUS', 1), ('DELTAMINUS', 2), ('FINAL', 3),)),
+    (719, 'ContraryInstructionIndicator', 'BOOLEAN', ()),
+    (720, 'PriorSpreadIndicator', 'BOOLEAN', ()),
+    (721, 'PosMaintRptID', 'STRING', ()),
+    (722, 'PosMaintStatus', 'INT', (('ACCEPTED', 0), ('ACCEPTEDWITHWARNINGS', 1), ('REJECTED', 2), ('COMPLETED', 3), ('COMPLETEDWITHWARNINGS', 4),)),
+    (723, 'PosMaintResult', 'INT', (('SUCCESSFULCOMPLETION', 0), ('REJECTED', 1), ('OTHER', 99),)),
+    (724, 'PosReqType', 'INT', (('POSITIONS', 0), ('TRADES', 1), ('EXERCISES', 2), ('ASSIGNMENTS', 3),)),
+    (725, 'ResponseTransportType', 'INT', (('INBAND', 0), ('OUTOFBAND', 1),)),
+    (726, 'ResponseDestination', 'STRING', ()),
+    (727, 'TotalNumPosReports', 'INT', ()),
+    (728, 'PosReqResult', 'INT', (('VALIDREQUEST', 0), ('INVALIDORUNSUPPORTEDREQUEST', 1), ('NOPOSITIONSFOUNDTHATMATCHCRITERIA', 2), ('NOTAUTHORIZEDTOREQUESTPOSITIONS', 3), ('REQUESTFORPOSITIONNOTSUPPORTED', 4), ('OTHER', 99),)),
+    (729, 'PosReqStatus', 'INT', (('COMPLETED', 0), ('COMPLETEDWITHWARNINGS', 1), ('REJECTED', 2),)),
+    (730, 'SettlPrice', 'PRICE', ()),
+    (731, 'SettlPriceType', 'INT', (('FINAL', 1), ('THEORETICAL', 2),)),
+    (732, 'UnderlyingSettlPrice', 'PRICE', ()),
+    (733, 'UnderlyingSettlPriceType', 'INT', ()),
+    (734, 'PriorSettlPrice', 'PRICE', ()),
+    (735, 'NoQuoteQualifiers', 'NUMINGROUP', ()),
+    (736, 'AllocSettlCurrency', 'CURRENCY', ()),
+    (737, 'AllocSettlCurrAmt', 'AMT', ()),
+    (738, 'InterestAtMaturity', 'AMT', ()),
+    (739, 'LegDatedDate', 'LOCALMKTDATE', ()),
+    (740, 'LegPool', 'STRING', ()),
+    (741, 'AllocInterestAtMaturity', 'AMT', ()),
+    (742, 'AllocAccruedInterestAmt', 'AMT', ()),
+    (743, 'DeliveryDate', 'LOCALMKTDATE', ()),
+    (744, 'AssignmentMethod', 'CHAR', (('PRORATA', 'P'), ('RANDOM', 'R'),)),
+    (745, 'AssignmentUnit', 'QTY', ()),
+    (746, 'OpenInterest', 'AMT', ()),
+    (747, 'ExerciseMethod', 'CHAR', (('AUTOMATIC', 'A'), ('MANUAL', 'M'),)),
+    (748, 'TotNumTradeReports', 'INT', ()),
+    (749, 'TradeRequestResult', 'INT', (('SUCCESSFUL', 0), ('INVALIDORUNKNOWNINSTRUMENT', 1), ('INVALIDTYPEOFTRADEREQUESTED', 2), ('INVALIDPARTIES', 3), ('INVALIDTRANSPORTTYPEREQUESTED', 4), ('INVALIDDESTINATIONREQUESTED', 5), ('TRADEREQUESTTYPENOTSUPPORTED', 8), ('UNAUTHORIZEDFORTRADECAPTUREREPORTREQUEST', 9), ('OTHER', 99),)),
+    (750, 'TradeRequestStatus', 'INT', (('ACCEPTED', 0), ('COMPLETED', 1), ('REJECTED', 2),)),
+    (751, 'TradeReportRejectReason', 'INT', (('SUCCESSFULDEFAULT', 0), ('INVALIDPARTYINFORMATION', 1), ('UNKNOWNINSTRUMENT', 2), ('UNAUTHORIZEDTOREPORTTRADES', 3), ('INVALIDTRADETYPE', 4), ('OTHER', 99),)),
+    (752, 'SideMultiLegReportingType', 'INT', (('SINGLESECURITY', 1), ('INDIVIDUALLEGOFAMULTILEGSECURITY', 2), ('MULTILEGSECURITY', 3),)),
+    (753, 'NoPosAmt', 'NUMINGROUP', ()),
+    (754, 'AutoAcceptIndicator', 'BOOLEAN', ()),
+    (755, 'AllocReportID', 'STRING', ()),
+    (756, 'NoNested2PartyIDs', 'NUMINGROUP', ()),
+    (757, 'Nested2PartyID', 'STRING', ()),
+    (758, 'Nested2PartyIDSource', 'CHAR', ()),
+    (759, 'Nested2PartyRole', 'INT', ()),
+    (760, 'Nested2PartySubID', 'STRING', ()),
+    (761, 'BenchmarkSecurityIDSource', 'STRING', ()),
+    (762, 'SecuritySubType', 'STRING', ()),
+    (763, 'UnderlyingSecuritySubType', 'STRING', ()),
+    (764, 'LegSecuritySubType', 'STRING', ()),
+    (765, 'AllowableOneSidednessPct', 'PERCENTAGE', ()),
+    (766, 'AllowableOneSidednessValue', 'AMT', ()),
+    (767, 'AllowableOneSidednessCurr', 'CURRENCY', ()),
+    (768, 'NoTrdRegTimestamps', 'NUMINGROUP', ()),
+    (769, 'TrdRegTimestamp', 'UTCTIMESTAMP', ()),
+    (770, 'TrdRegTimestampType', 'INT', (('EXECUTIONTIME', 1), ('TIMEIN', 2), ('TIMEOUT', 3), ('BROKERRECEIPT', 4), ('BROKEREXECUTION', 5),)),
+    (771, 'TrdRegTimestampOrigin', 'STRING', ()),
+    (772, 'ConfirmRefID', 'STRING', ()),
+    (773, 'ConfirmType', 'INT', (('STATUS', 1), ('CONFIRMATION', 2), ('CONFIRMATIONREQUESTREJECTED', 3),)),
+    (774, 'ConfirmRejReason', 'INT', (('MISMATCHEDACCOUNT', 1), ('MISSINGSETTLEMENTINSTRUCTIONS', 2), ('OTHER', 99),)),
+    (775, 'BookingType', 'INT', (('REGULARBOOKING', 0), ('CFDCONTRACTFORDIFFERENCE', 1), ('TOTALRETURNSWAP', 2),)),
+    (776, 'IndividualAllocRejCode', 'INT', ()),
+    (777, 'SettlInstMsgID', 'STRING', ()),
+    (778, 'NoSettlInst', 'NUMINGROUP', ()),
+    (779, 'LastUpdateTime', 'UTCTIMESTAMP', ()),
+    (780, 'AllocSettlInstType', 'INT', (('USEDEFAULTINSTRUCTIONS', 0), ('DERIVEFROMPARAMETERSPROVIDED', 1), ('FULLDETAILSPROVIDED', 2), ('SSIDBIDSPROVIDED', 3), ('PHONEFORINSTRUCTIONS', 4),)),
+    (781, 'NoSettlPartyIDs', 'NUMINGROUP', ()),
+    (782, 'SettlPartyID', 'STRING', ()),
+    (783, 'SettlPartyIDSource', 'CHAR', ()),
+    (784, 'SettlPartyRole', 'INT', ()),
+    (785, 'SettlPartySubID', 'STRING', ()),
+    (786, 'SettlPartySubIDType', 'INT', ()),
+    (787, 'DlvyInstType', 'CHAR', (('CASH', 'C'), ('SECURITIES', 'S'),)),
+    (788, 'TerminationType', 'INT', (('OVERNIGHT', 1), ('TERM', 2), ('FLEXIBLE', 3), ('OPEN', 4),)),
+    (789, 'NextExpectedMsgSeqNum', 'SEQNUM', ()),
+    (790, 'OrdStatusReqID', 'STRING', ()),
+    (791, 'SettlInstReqID', 'STRING', ()),
+    (792, 'SettlInstReqRejCode', 'INT', (('UNABLETOPROCESSREQUEST', 0), ('UNKNOWNACCOUNT', 1), ('NOMATCHINGSETTLEMENTINSTRUCTIONSFOUND', 2), ('OTHER', 99),)),
+    (793, 'SecondaryAllocID', 'STRING', ()),
+    (794, 'AllocReportType', 'INT', (('SELLSIDECALCULATEDUSINGPRELIMINARY', 3), ('SELLSIDECALCULATEDWITHOUTPRELIMINARY', 4), ('WAREHOUSERECAP', 5), ('REQUESTTOINTERMEDIARY', 8),)),
+    (795, 'AllocReportRefID', 'STRING', ()),
+    (796, 'AllocCancReplaceReason', 'INT', (('ORIGINALDETAILSINCORRECT', 1), ('CHANGEINUNDERLYINGORDERDETAILS', 2), ('OTHER', 99),)),
+    (797, 'CopyMsgIndicator', 'BOOLEAN', ()),
+    (798, 'AllocAccountType', 'INT', (('ACCOUNTISCARRIEDONCUSTOMERSIDEOFBOOKS', 1), ('ACCOUNTISCARRIEDONNONCUSTOMERSIDEOFBOOKS', 2), ('HOUSETRADER', 3), ('FLOORTRADER', 4), ('ACCOUNTISCARRIEDONNONCUSTOMERSIDEOFBOOKSANDISCROSSMARGINED', 6), ('ACCOUNTISHOUSETRADERANDISCROSSMARGINED', 7), ('JBO', 8),)),
+    (799, 'OrderAvgPx', 'PRICE', ()),
+    (800, 'OrderBookingQty', 'QTY', ()),
+    (801, 'NoSettlPartySubIDs', 'NUMINGROUP', ()),
+    (802, 'NoPartySubIDs', 'NUMINGROUP', ()),
+    (803, 'PartySubIDType', 'INT', (('FIRM', 1), ('SECURITIESACCOUNTNUMBER', 10), ('REGISTRATIONNUMBER', 11), ('REGISTEREDADDRESS_12', 12), ('REGULATORYSTATUS', 13), ('REGISTRATIONNAME', 14), ('CASHACCOUNT', 15), ('BIC', 16), ('CSDPARTICIPANTMEMBERCODE', 17), ('REGISTEREDADDRESS_18', 18), ('FUNDACCOUNTNAME', 19), ('PERSON', 2), ('TELEXNUMBER', 20), ('FAXNUMBER', 21), ('SECURITIESACCOUNTNAME', 22), ('CASHACCOUNTNAME', 23), ('DEPARTMENT', 24), ('LOCATIONDESK', 25), ('POSITIONACCOUNTTYPE', 26), ('SYSTEM', 3), ('APPLICATION', 4), ('RESERVEDANDAVAILABLEFORBILATERALLYAGREEDUPONUSERDEFINEDVALUES', 4000), ('FULLLEGALNAMEOFFIRM', 5), ('POSTALADDRESS', 6), ('PHONENUMBER', 7), ('EMAILADDRESS', 8), ('CONTACTNAME', 9),)),
+    (804, 'NoNestedPartySubIDs', 'NUMINGROUP', ()),
+    (805, 'NestedPartySubIDType', 'INT', ()),
+    (806, 'NoNested2PartySubIDs', 'NUMINGROUP', ()),
+    (807, 'Nested2PartySubIDType', 'INT', ()),
+    (808, 'AllocIntermedReqType', 'INT', (('PENDINGACCEPT', 1), ('PENDINGRELEASE', 2), ('PENDINGREVERSAL', 3), ('ACCEPT', 4), ('BLOCKLEVELREJECT', 5), ('ACCOUNTLEVELREJECT', 6),)),
+    (810, 'UnderlyingPx', 'PRICE', ()),
+    (811, 'PriceDelta', 'FLOAT', ()),
+    (812, 'ApplQueueMax', 'INT', ()),
+    (813, 'ApplQueueDepth', 'INT', ()),
+    (814, 'ApplQueueResolution', 'INT', (('NOACTIONTAKEN', 0), ('QUEUEFLUSHED', 1), ('OVERLAYLAST', 2), ('ENDSESSION', 3),)),
+    (815, 'ApplQueueAction', 'INT', (('NOACTIONTAKEN', 0), ('QUEUEFLUSHED', 1), ('OVERLAYLAST', 2), ('ENDSESSION', 3),)),
+    (816, 'NoAltMDSource', 'NUMINGROUP', ()),
+    (817, 'AltMDSourceID', 'STRING', ()),
+    (818, 'SecondaryTradeReportID', 'STRING', ()),
+    (819, 'AvgPxIndicator', 'INT', (('NOAVERAGEPRICING', 0), ('TRADEAVERAGEPRICEGROUP', 1), ('LASTTRADEAVERAGEPRICEGROUP', 2),)),
+    (820, 'TradeLinkID', 'STRING', ()),
+    (821, 'OrderInputDevice', 'STRING', ()),
+    (822, 'UnderlyingTradingSessionID', 'STRING', ()),
+    (823, 'UnderlyingTradingSessionSubID', 'STRING', ()),
+    (824, 'TradeLegRefID', 'STRING', ()),
+    (825, 'ExchangeRule', 'STRING', ()),
+    (826, 'TradeAllocIndicator', 'INT', (('ALLOCATIONNOTREQUIRED', 0), ('ALLOCATIONREQUIREDALLOCATIONINFORMATIONNOTPROVIDED', 1), ('USEALLOCATIONPROVIDEDWITHTHETRADE', 2),)),
+    (827, 'ExpirationCycle', 'INT', (('EXPIREONTRADINGSESSIONCLOSE', 0), ('EXPIREONTRADINGSESSIONOPEN', 1),)),
+    (828, 'TrdType', 'INT', (('REGULARTRADE', 0), ('BLOCKTRADE', 1), ('AFTERHOURSTRADE', 10), ('EFP', 2), ('TRANSFER', 3), ('LATETRADE', 4), ('TTRADE', 5), ('WEIGHTEDAVERAGEPRICETRADE', 6), ('BUNCHEDTRADE', 7), ('LATEBUNCHEDTRADE', 8), ('PRIORREFERENCEPRICETRADE', 9),)),
+    (829, 'TrdSubType', 'INT', ()),
+    (830, 'TransferReason', 'STRING', ()),
+    (831, 'AsgnReqID', 'STRING', ()),
+    (832, 'TotNumAssignmentReports', 'INT', ()),
+    (833, 'AsgnRptID', 'STRING', ()),
+    (834, 'ThresholdAmount', 'PRICEOFFSET', ()),
+    (835, 'PegMoveType', 'INT', (('FLOATING', 0), ('FIXED', 1),)),
+    (836, 'PegOffsetType', 'INT', (('PRICE', 0), ('BASISPOINTS', 1), ('TICKS', 2), ('PRICETIERLEVEL', 3),)),
+    (837, 'PegLimitType', 'INT', (('ORBETTER', 0), ('STRICT', 1), ('ORWORSE', 2),)),
+    (838, 'PegRoundDirection', 'INT', (('MOREAGGRESSIVE', 1), ('MOREPASSIVE', 2),)),
+    (839, 'PeggedPrice', 'PRICE', ()),
+    (840, 'PegScope', 'INT', (('LOCALEXCHANGEECNATS', 1), ('NATIONAL', 2), ('GLOBAL', 3), ('NATIONALEXCLUDINGLOCAL', 4),)),
+    (841, 'DiscretionMoveType', 'INT', (('FLOATING', 0), ('FIXED', 1),)),
+    (842, 'DiscretionOffsetType', 'INT', (('PRICE', 0), ('BASISPOINTS', 1), ('TICKS', 2), ('PRICETIERLEVEL', 3),)),
+    (843, 'DiscretionLimitType', 'INT', (('ORBETTER', 0), ('STRICT', 1), ('ORWORSE', 2),)),
+    (844, 'DiscretionRoundDirection', 'INT', (('MOREAGGRESSIVE', 1), ('MOREPASSIVE', 2),)),
+    (845, 'DiscretionPrice', 'PRICE', ()),
+    (846, 'DiscretionScope', 'INT', (('LOCALEXCHANGEECNATS', 1), ('NATIONAL', 2), ('GLOBAL', 3), ('NATIONALEXCLUDINGLOCAL', 4),)),
+    (847, 'TargetStrategy', 'INT', (('VWAP', 1), ('RESERVEDANDAVAILABLEFORBILATERALLYAGREEDUPONUSERDEFINEDVALUES', 1000), ('PARTICIPATE', 2), ('MININIZEMARKETIMPACT', 3),)),
+    (848, 'TargetStrategyParameters', 'STRING', ()),
+    (849, 'ParticipationRate', 'PERCENTAGE', ()),
+    (850, 'TargetStrategyPerformance', 'FLOAT', ()),
+    (851, 'LastLiquidityInd', 'INT', (('ADDEDLIQUIDITY', 1), ('REMOVEDLIQUIDITY', 2), ('LIQUIDITYROUTEDOUT', 3),)),
+    (852, 'PublishTrdIndicator', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (853, 'ShortSaleReason', 'INT', (('DEALERSOLDSHORT', 0), ('DEALERSOLDSHORTEXEMPT', 1), ('SELLINGCUSTOMERSOLDSHORT', 2), ('SELLINGCUSTOMERSOLDSHORTEXEMPT', 3), ('QSRORAGUCONTRASIDESOLDSHORT', 4), ('QSRORAGUCONTRASIDESOLDSHORTEXEMPT', 5),)),
+    (854, 'QtyType', 'INT', (('UNITS', 0), ('CONTRACTS', 1),)),
+    (855, 'SecondaryTrdType', 'INT', ()),
+    (856, 'TradeReportType', 'INT', (('SUBMIT', 0), ('ALLEGED', 1), ('ACCEPT', 2), ('DECLINE', 3), ('ADDENDUM', 4), ('NOWAS', 5), ('TRADEREPORTCANCEL', 6), ('LOCKEDINTRADEBREAK', 7),)),
+    (857, 'AllocNoOrdersType', 'INT', (('NOTSPECIFIED', 0), ('EXPLICITLISTPROVIDED', 1),)),
+    (858, 'SharedCommission', 'AMT', ()),
+    (859, 'ConfirmReqID', 'STRING', ()),
+    (860, 'AvgParPx', 'PRICE', ()),
+    (861, 'ReportedPx', 'PRICE', ()),
+    (862, 'NoCapacities', 'NUMINGROUP', ()),
+    (863, 'OrderCapacityQty', 'QTY', ()),
+    (864, 'NoEvents', 'NUMINGROUP', ()),
+    (865, 'EventType', 'INT', (('PUT', 1), ('CALL', 2), ('TENDER', 3), ('SINKINGFUNDCALL', 4), ('OTHER', 99),)),
+    (866, 'EventDate', 'LOCALMKTDATE', ()),
+    (867, 'EventPx', 'PRICE', ()),
+    (868, 'EventText', 'STRING', ()),
+    (869, 'PctAtRisk', 'PERCENTAGE', ()),
+    (870, 'NoInstrAttrib', 'NUMINGROUP', ()),
+    (871, 'InstrAttribType', 'INT', (('FLAT', 1), ('ORIGINALISSUEDISCOUNT', 10), ('CALLABLEPUTTABLE', 11), ('ESCROWEDTOMATURITY', 12), ('ESCROWEDTOREDEMPTIONDATE', 13), ('PREREFUNDED', 14), ('INDEFAULT', 15), ('UNRATED', 16), ('TAXABLE', 17), ('INDEXED', 18), ('SUBJECTTOALTERNATIVEMINIMUMTAX', 19), ('ZEROCOUPON', 2), ('ORIGINALISSUEDISCOUNTPRICE', 20), ('CALLABLEBELOWMATURITYVALUE', 21), ('CALLABLEWITHOUTNOTICEBYMAILTOHOLDERUNLESSREGISTERED', 22), ('INTERESTBEARING', 3), ('NOPERIODICPAYMENTS', 4), ('VARIABLERATE', 5), ('LESSFEEFORPUT', 6), ('STEPPEDCOUPON', 7), ('COUPONPERIOD', 8), ('WHENISSUED', 9), ('TEXT', 99),)),
+    (872, 'InstrAttribValue', 'STRING', ()),
+    (873, 'DatedDate', 'LOCALMKTDATE', ()),
+    (874, 'InterestAccrualDate', 'LOCALMKTDATE', ()),
+    (875, 'CPProgram', 'INT', (('_3A3', 1), ('_42', 2), ('OTHER', 99),)),
+    (876, 'CPRegType', 'STRING', ()),
+    (877, 'UnderlyingCPProgram', 'STRING', ()),
+    (878, 'UnderlyingCPRegType', 'STRING', ()),
+    (879, 'UnderlyingQty', 'QTY', ()),
+    (880, 'TrdMatchID', 'STRING', ()),
+    (881, 'SecondaryTradeReportRefID', 'STRING', ()),
+    (882, 'UnderlyingDirtyPrice', 'PRICE', ()),
+    (883, 'UnderlyingEndPrice', 'PRICE', ()),
+    (884, 'UnderlyingStartValue', 'AMT', ()),
+    (885, 'UnderlyingCurrentValue', 'AMT', ()),
+    (886, 'UnderlyingEndValue', 'AMT', ()),
+    (887, 'NoUnderlyingStips', 'NUMINGROUP', ()),
+    (888, 'UnderlyingStipType', 'STRING', ()),
+    (889, 'UnderlyingStipValue', 'STRING', ()),
+    (890, 'MaturityNetMoney', 'AMT', ()),
+    (891, 'MiscFeeBasis', 'INT', (('ABSOLUTE', 0), ('PERUNIT', 1), ('PERCENTAGE', 2),)),
+    (892, 'TotNoAllocs', 'INT', ()),
+    (893, 'LastFragment', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (894, 'CollReqID', 'STRING', ()),
+    (895, 'CollAsgnReason', 'INT', (('INITIAL', 0), ('SCHEDULED', 1), ('TIMEWARNING', 2), ('MARGINDEFICIENCY', 3), ('MARGINEXCESS', 4), ('FORWARDCOLLATERALDEMAND', 5), ('EVENTOFDEFAULT', 6), ('ADVERSETAXEVENT', 7),)),
+    (896, 'CollInquiryQualifier', 'INT', (('TRADEDATE', 0), ('GCINSTRUMENT', 1), ('COLLATERALINSTRUMENT', 2), ('SUBSTITUTIONELIGIBLE', 3), ('NOTASSIGNED', 4), ('PARTIALLYASSIGNED', 5), ('FULLYASSIGNED', 6), ('OUTSTANDINGTRADES', 7),)),
+    (897, 'NoTrades', 'NUMINGROUP', ()),
+    (898, 'MarginRatio', 'PERCENTAGE', ()),
+    (899, 'MarginExcess', 'AMT', ()),
+    (900, 'TotalNetValue', 'AMT', ()),
+    (901, 'CashOutstanding', 'AMT', ()),
+    (902, 'CollAsgnID', 'STRING', ()),
+    (903, 'CollAsgnTransType', 'INT', (('NEW', 0), ('REPLACE', 1), ('CANCEL', 2), ('RELEASE', 3), ('REVERSE', 4),)),
+    (904, 'CollRespID', 'STRING', ()),
+    (905, 'CollAsgnRespType', 'INT', (('RECEIVED', 0), ('ACCEPTED', 1), ('DECLINED', 2), ('REJECTED', 3),)),
+    (906, 'CollAsgnRejectReason', 'INT', (('UNKNOWNDEAL', 0), ('UNKNOWNORINVALIDINSTRUMENT', 1), ('UNAUTHORIZEDTRANSACTION', 2), ('INSUFFICIENTCOLLATERAL', 3), ('INVALIDTYPEOFCOLLATERAL', 4), ('EXCESSIVESUBSTITUTION', 5), ('OTHER', 99),)),
+    (907, 'CollAsgnRefID', 'STRING', ()),
+    (908, 'CollRptID', 'STRING', ()),
+    (909, 'CollInquiryID', 'STRING', ()),
+    (910, 'CollStatus', 'INT', (('UNASSIGNED', 0), ('PARTIALLYASSIGNED', 1), ('ASSIGNMENTPROPOSED', 2), ('ASSIGNEDACCEPTED', 3), ('CHALLENGED', 4),)),
+    (911, 'TotNumReports', 'INT', ()),
+    (912, 'LastRptRequested', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (913, 'AgreementDesc', 'STRING', ()),
+    (914, 'AgreementID', 'STRING', ()),
+    (915, 'AgreementDate', 'LOCALMKTDATE', ()),
+    (916, 'StartDate', 'LOCALMKTDATE', ()),
+    (917, 'EndDate', 'LOCALMKTDATE', ()),
+    (918, 'AgreementCurrency', 'CURRENCY', ()),
+    (919, 'DeliveryType', 'INT', (('VERSUSPAYMENT', 0), ('FREE', 1), ('TRIPARTY', 2), ('HOLDINCUSTODY', 3),)),
+    (920, 'EndAccruedInterestAmt', 'AMT', ()),
+    (921, 'StartCash', 'AMT', ()),
+    (922, 'EndCash', 'AMT', ()),
+    (923, 'UserRequestID', 'STRING', ()),
+    (924, 'UserRequestType', 'INT', (('LOGONUSER', 1), ('LOGOFFUSER', 2), ('CHANGEPASSWORDFORUSER', 3), ('REQUESTINDIVIDUALUSERSTATUS', 4),)),
+    (925, 'NewPassword', 'STRING', ()),
+    (926, 'UserStatus', 'INT', (('LOGGEDIN', 1), ('NOTLOGGEDIN', 2), ('USERNOTRECOGNISED', 3), ('PASSWORDINCORRECT', 4), ('PASSWORDCHANGED', 5), ('OTHER', 6),)),
+    (927, 'UserStatusText', 'STRING', ()),
+    (928, 'StatusValue', 'INT', (('CONNECTED', 1), ('NOTCONNECTEDDOWNEXPECTEDUP', 2), ('NOTCONNECTEDDOWNEXPECTEDDOWN', 3), ('INPROCESS', 4),)),
+    (929, 'StatusText', 'STRING', ()),
+    (930, 'RefCompID', 'STRING', ()),
+    (931, 'RefSubID', 'STRING', ()),
+    (932, 'NetworkResponseID', 'STRING', ()),
+    (933, 'NetworkRequestID', 'STRING', ()),
+    (934, 'LastNetworkResponseID', 'STRING', ()),
+    (935, 'NetworkRequestType', 'INT', (('SNAPSHOT', 1), ('SUBSCRIBE', 2), ('STOPSUBSCRIBING', 4), ('LEVELOFDETAIL', 8),)),
+    (936, 'NoCompIDs', 'NUMINGROUP', ()),
+    (937, 'NetworkStatusResponseType', 'INT', (('FULL', 1), ('INCREMENTALUPDATE', 2),)),
+    (938, 'NoCollInquiryQualifier', 'NUMINGROUP', ()),
+    (939, 'TrdRptStatus', 'INT', (('ACCEPTED', 0), ('REJECTED', 1),)),
+    (940, 'AffirmStatus', 'INT', (('RECEIVED', 1), ('CONFIRMREJECTED', 2), ('AFFIRMED', 3),)),
+    (941, 'UnderlyingStrikeCurrency', 'CURRENCY', ()),
+    (942, 'LegStrikeCurrency', 'CURRENCY', ()),
+    (943, 'TimeBracket', 'STRING', ()),
+    (944, 'CollAction', 'INT', (('RETAIN', 0), ('ADD', 1), ('REMOVE', 2),)),
+    (945, 'CollInquiryStatus', 'INT', (('ACCEPTED', 0), ('ACCEPTEDWITHWARNINGS', 1), ('COMPLETED', 2), ('COMPLETEDWITHWARNINGS', 3), ('REJECTED', 4),)),
+    (946, 'CollInquiryResult', 'INT', (('SUCCESSFUL', 0), ('INVALIDORUNKNOWNINSTRUMENT', 1), ('INVALIDORUNKNOWNCOLLATERALTYPE', 2), ('INVALIDPARTIES', 3), ('INVALIDTRANSPORTTYPEREQUESTED', 4), ('INVALIDDESTINATIONREQUESTED', 5), ('NOCOLLATERALFOUNDFORTHETRADESPECIFIED', 6), ('NOCOLLATERALFOUNDFORTHEORDERSPECIFIED', 7), ('COLLATERALINQUIRYTYPENOTSUPPORTED', 8), ('UNAUTHORIZEDFORCOLLATERALINQUIRY', 9), ('OTHER', 99),)),
+    (947, 'StrikeCurrency', 'CURRENCY', ()),
+    (948, 'NoNested3PartyIDs', 'NUMINGROUP', ()),
+    (949, 'Nested3PartyID', 'STRING', ()),
+    (950, 'Nested3PartyIDSource', 'CHAR', ()),
+    (951, 'Nested3PartyRole', 'INT', ()),
+    (952, 'NoNested3PartySubIDs', 'NUMINGROUP', ()),
+    (953, 'Nested3PartySubID', 'STRING', ()),
+    (954, 'Nested3PartySubIDType', 'INT', ()),
+    (955, 'LegContractSettlMonth', 'MONTHYEAR', ()),
+    (956, 'LegInterestAccrualDate', 'LOCALMKTDATE', ()),
+))
@@ -18,8385 +18,1425 @@ RECORDED OR OTHERWISE, WITHOUT THE PRIOR AND  EXPRESS WRITTEN  PERMISSION  OF  F
 TECHNOLOGIES PTY LTD.
 """
 
-# Autogenerated on 2019-09-03 12:58:12.783983
-# /home/sergey/src/f8/fix8pro/compiler/py/f8c/f8c.py --template ufe_java_fields ufe_cpp_fields ufe_cs_fields ufe_py_fields --output-dir ./generated --schema-dir /home/sergey/src/f8/fix8pro/schema/xml FIX50SP2 FIX42 FIX44 FIX40 FIX41 FIX43 FIX50 FIX50SP1
+# Autogenerated on 2026-10-18 15:52:52.943705 by fields_gen.py from ufe_py_fields_fix50sp1.py
 # DO NOT EDIT!
-# 4 spaces instead of tab is required
 
-class FIX50SP1_Fields:
-
-    # Account(1): STRING
-    class Account:
-        tag: int = 1
-
-    # AdvId(2): STRING
-    class AdvId:
-        tag: int = 2
-
-    # AdvRefID(3): STRING
-    class AdvRefID:
-        tag: int = 3
-
-    # AdvSide(4): CHAR
-    class AdvSide:
-        tag: int = 4
-        BUY: str = 'B'
-        SELL: str = 'S'
-        TRADE: str = 'T'
-        CROSS: str = 'X'
-
-    # AdvTransType(5): STRING
-    class AdvTransType:
-        tag: int = 5
-        CANCEL: str = "C"
-        NEW: str = "N"
-        REPLACE: str = "R"
-
-    # AvgPx(6): PRICE
-    class AvgPx:
-        tag: int = 6
-
-    # BeginSeqNo(7): SEQNUM
-    class BeginSeqNo:
-        tag: int = 7
-
-    # BeginString(8): STRING
-    class BeginString:
-        tag: int = 8
-
-    # BodyLength(9): LENGTH
-    class BodyLength:
-        tag: int = 9
-
-    # CheckSum(10): STRING
-    class CheckSum:
-        tag: int = 10
-
-    # ClOrdID(11): STRING
-    class ClOrdID:
-        tag: int = 11
-
-    # Commission(12): AMT
-    class Commission:
-        tag: int = 12
-
-    # CommType(13): CHAR
-    class CommType:
-        tag: int = 13
-        PER_UNIT: str = '1'
-        PERCENT: str = '2'
-        ABSOLUTE: str = '3'
-        PERCENTAGE_WAIVED_4: str = '4'
-        PERCENTAGE_WAIVED_5: str = '5'
-        POINTS_PER_BOND_OR_CONTRACT: str = '6'
-
-    # CumQty(14): QTY
-    class CumQty:
-        tag: int = 14
-
-    # Currency(15): CURRENCY
-    class Currency:
-        tag: int = 15
-
-    # EndSeqNo(16): SEQNUM
-    class EndSeqNo:
-        tag: int = 16
-
-    # ExecID(17): STRING
-    class ExecID:
-        tag: int = 17
-
-    # ExecInst(18): MULTIPLECHARVALUE
-    class ExecInst:
-        tag: int = 18
-        STAY_ON_OFFER_SIDE: str = "0"
-        NOT_HELD: str = "1"
-        WORK: str = "2"
-        GO_ALONG: str = "3"
-        OVER_THE_DAY: str = "4"
-        HELD: str = "5"
-        PARTICIPANT_DONT_INITIATE: str = "6"
-        STRICT_SCALE: str = "7"
-        TRY_TO_SCALE: str = "8"
-        STAY_ON_BID_SIDE: str = "9"
-        NO_CROSS: str = "A"
-        TRAILING_STOP_PEG: str = "a"
-        OK_TO_CROSS: str = "B"
-        STRICT_LIMIT: str = "b"
-        IGNORE_PRICE_VALIDITY_CHECKS: str = "c"
-        CALL_FIRST: str = "C"
-        PEG_TO_LIMIT_PRICE: str = "d"
-        PERCENT_OF_VOLUME: str = "D"
-        DO_NOT_INCREASE: str = "E"
-        WORK_TO_TARGET_STRATEGY: str = "e"
-        DO_NOT_REDUCE: str = "F"
-        ALL_OR_NONE: str = "G"
-        REINSTATE_ON_SYSTEM_FAILURE: str = "H"
-        INSTITUTIONS_ONLY: str = "I"
-        REINSTATE_ON_TRADING_HALT: str = "J"
-        CANCEL_ON_TRADING_HALT: str = "K"
-        LAST_PEG: str = "L"
-        MID_PRICE_PEG: str = "M"
-        NON_NEGOTIABLE: str = "N"
-        OPENING_PEG: str = "O"
-        MARKET_PEG: str = "P"
-        CANCEL_ON_SYSTEM_FAILURE: str = "Q"
-        PRIMARY_PEG: str = "R"
-        SUSPEND: str = "S"
-        CUSTOMER_DISPLAY_INSTRUCTION: str = "U"
-        NETTING: str = "V"
-        PEG_TO_VWAP: str = "W"
-        TRADE_ALONG: str = "X"
-        TRY_TO_STOP: str = "Y"
-        CANCEL_IF_NOT_BEST: str = "Z"
-        INTERMARKET_SWEEP: str = "f"
-        SINGLE_EXECUTION_REQUESTED_FOR_BLOCK_TRADE: str = "j"
-        EXTERNAL_ROUTING_ALLOWED: str = "g"
-        EXTERNAL_ROUTING_NOT_ALLOWED: str = "h"
-        IMBALANCE_ONLY: str = "i"
-        FIXED_PEG_TO_LOCAL_BEST_BID_OR_OFFER_AT_TIME_OF_ORDER: str = "T"
-        BEST_EXECUTION: str = "k"
-        SUSPEND_ON_SYSTEM_FAILURE: str = "l"
-        SUSPEND_ON_TRADING_HALT: str = "m"
-        REINSTATE_ON_CONNECTION_LOSS: str = "n"
-        CANCEL_ON_CONNECTION_LOSS: str = "o"
-        SUSPEND_ON_CONNECTION_LOSS: str = "p"
-        RELEASE_FROM_SUSPENSION: str = "q"
-        EXECUTE_AS_DELTA_NEUTRAL_USING_VOLATILITY_PROVIDED: str = "r"
-        EXECUTE_AS_DURATION_NEUTRAL: str = "s"
-        EXECUTE_AS_FX_NEUTRAL: str = "t"
-
-    # ExecRefID(19): STRING
-    class ExecRefID:
-        tag: int = 19
-
-    # ExecTransType(20): CHAR
-    class ExecTransType:
-        tag: int = 20
-        NEW: str = '0'
-        CANCEL: str = '1'
-        CORRECT: str = '2'
-        STATUS: str = '3'
-
-    # HandlInst(21): CHAR
-    class HandlInst:
-        tag: int = 21
-        AUTOMATED_EXECUTION_ORDER_PRIVATE_NO_BROKER_INTERVENTION: str = '1'
-        AUTOMATED_EXECUTION_ORDER_PUBLIC_BROKER_INTERVENTION_OK: str = '2'
-        MANUAL_ORDER_BEST_EXECUTION: str = '3'
-
-    # SecurityIDSource(22): STRING
-    class SecurityIDSource:
-        tag: int = 22
-        CUSIP: str = "1"
-        SEDOL: str = "2"
-        QUIK: str = "3"
-        ISIN_NUMBER: str = "4"
-        RIC_CODE: str = "5"
-        ISO_CURRENCY_CODE: str = "6"
-        ISO_COUNTRY_CODE: str = "7"
-        EXCHANGE_SYMBOL: str = "8"
-        CONSOLIDATED_TAPE_ASSOCIATION: str = "9"
-        BLOOMBERG_SYMBOL: str = "A"
-        WERTPAPIER: str = "B"
-        DUTCH: str = "C"
-        VALOREN: str = "D"
-        SICOVAM: str = "E"
-        BELGIAN: str = "F"
-        COMMON: str = "G"
-        CLEARING_HOUSE: str = "H"
-        ISDA_FPML_PRODUCT_SPECIFICATION: str = "I"
-        OPTION_PRICE_REPORTING_AUTHORITY: str = "J"
-        LETTER_OF_CREDIT: str = "L"
-        ISDA_FPML_PRODUCT_URL: str = "K"
-        MARKETPLACE_ASSIGNED_IDENTIFIER: str = "M"
-
-    # IOIID(23): STRING
-    class IOIID:
-        tag: int = 23
-
-    # IOIOthSvc(24): CHAR
-    class IOIOthSvc:
-        tag: int = 24
-
-    # IOIQltyInd(25): CHAR
-    class IOIQltyInd:
-        tag: int = 25
-        HIGH: str = 'H'
-        LOW: str = 'L'
-        MEDIUM: str = 'M'
-
-    # IOIRefID(26): STRING
-    class IOIRefID:
-        tag: int = 26
-
-    # IOIQty(27): STRING
-    class IOIQty:
-        tag: int = 27
-        _1000000000: str = "0"
-        SMALL: str = "S"
-        MEDIUM: str = "M"
-        LARGE: str = "L"
-        UNDISCLOSED_QUANTITY: str = "U"
-
-    # IOITransType(28): CHAR
-    class IOITransType:
-        tag: int = 28
-        CANCEL: str = 'C'
-        NEW: str = 'N'
-        REPLACE: str = 'R'
-
-    # LastCapacity(29): CHAR
-    class LastCapacity:
-        tag: int = 29
-        AGENT: str = '1'
-        CROSS_AS_AGENT: str = '2'
-        CROSS_AS_PRINCIPAL: str = '3'
-        PRINCIPAL: str = '4'
-
-    # LastMkt(30): EXCHANGE
-    class LastMkt:
-        tag: int = 30
-
-    # LastPx(31): PRICE
-    class LastPx:
-        tag: int = 31
-
-    # LastQty(32): QTY
-    class LastQty:
-        tag: int = 32
-
-    # NoLinesOfText(33): NUMINGROUP
-    class NoLinesOfText:
-        tag: int = 33
-
-    # MsgSeqNum(34): SEQNUM
-    class MsgSeqNum:
-        tag: int = 34
-
-    # MsgType(35): STRING
-    class MsgType:
-        tag: int = 35
-        HEARTBEAT: str = "0"
-        TEST_REQUEST: str = "1"
-        RESEND_REQUEST: str = "2"
-        REJECT: str = "3"
-        SEQUENCE_RESET: str = "4"
-        LOGOUT: str = "5"
-        INDICATION_OF_INTEREST: str = "6"
-        ADVERTISEMENT: str = "7"
-        EXECUTION_REPORT: str = "8"
-        ORDER_CANCEL_REJECT: str = "9"
-        QUOTE_STATUS_REQUEST: str = "a"
-        LOGON: str = "A"
-        DERIVATIVE_SECURITY_LIST: str = "AA"
-        NEW_ORDER_AB: str = "AB"
-        MULTILEG_ORDER_CANCEL_REPLACE: str = "AC"
-        TRADE_CAPTURE_REPORT_REQUEST: str = "AD"
-        TRADE_CAPTURE_REPORT: str = "AE"
-        ORDER_MASS_STATUS_REQUEST: str = "AF"
-        QUOTE_REQUEST_REJECT: str = "AG"
-        RFQ_REQUEST: str = "AH"
-        QUOTE_STATUS_REPORT: str = "AI"
-        QUOTE_RESPONSE: str = "AJ"
-        CONFIRMATION: str = "AK"
-        POSITION_MAINTENANCE_REQUEST: str = "AL"
-        POSITION_MAINTENANCE_REPORT: str = "AM"
-        REQUEST_FOR_POSITIONS: str = "AN"
-        REQUEST_FOR_POSITIONS_ACK: str = "AO"
-        POSITION_REPORT: str = "AP"
-        TRADE_CAPTURE_REPORT_REQUEST_ACK: str = "AQ"
-        TRADE_CAPTURE_REPORT_ACK: str = "AR"
-        ALLOCATION_REPORT: str = "AS"
-        ALLOCATION_REPORT_ACK: str = "AT"
-        CONFIRMATION_ACK: str = "AU"
-        SETTLEMENT_INSTRUCTION_REQUEST: str = "AV"
-        ASSIGNMENT_REPORT: str = "AW"
-        COLLATERAL_REQUEST: str = "AX"
-        COLLATERAL_ASSIGNMENT: str = "AY"
-        COLLATERAL_RESPONSE: str = "AZ"
-        NEWS: str = "B"
-        MASS_QUOTE_ACKNOWLEDGEMENT: str = "b"
-        COLLATERAL_REPORT: str = "BA"
-        COLLATERAL_INQUIRY: str = "BB"
-        NETWORK_COUNTERPARTY_SYSTEM_STATUS_REQUEST: str = "BC"
-        NETWORK_COUNTERPARTY_SYSTEM_STATUS_RESPONSE: str = "BD"
-        USER_REQUEST: str = "BE"
-        USER_RESPONSE: str = "BF"
-        COLLATERAL_INQUIRY_ACK: str = "BG"
-        CONFIRMATION_REQUEST: str = "BH"
-        EMAIL: str = "C"
-        SECURITY_DEFINITION_REQUEST: str = "c"
-        SECURITY_DEFINITION: str = "d"
-        NEW_ORDER_D: str = "D"
-        SECURITY_STATUS_REQUEST: str = "e"
-        NEW_ORDER_E: str = "E"
-        ORDER_CANCEL_REQUEST: str = "F"
-        SECURITY_STATUS: str = "f"
-        ORDER_CANCEL_REPLACE_REQUEST: str = "G"
-        TRADING_SESSION_STATUS_REQUEST: str = "g"
-        ORDER_STATUS_REQUEST: str = "H"
-        TRADING_SESSION_STATUS: str = "h"
-        MASS_QUOTE: str = "i"
-        BUSINESS_MESSAGE_REJECT: str = "j"
-        ALLOCATION_INSTRUCTION: str = "J"
-        BID_REQUEST: str = "k"
-        LIST_CANCEL_REQUEST: str = "K"
-        BID_RESPONSE: str = "l"
-        LIST_EXECUTE: str = "L"
-        LIST_STRIKE_PRICE: str = "m"
-        LIST_STATUS_REQUEST: str = "M"
-        XML_MESSAGE: str = "n"
-        LIST_STATUS: str = "N"
-        REGISTRATION_INSTRUCTIONS: str = "o"
-        REGISTRATION_INSTRUCTIONS_RESPONSE: str = "p"
-        ALLOCATION_INSTRUCTION_ACK: str = "P"
-        ORDER_MASS_CANCEL_REQUEST: str = "q"
-        DONT_KNOW_TRADE: str = "Q"
-        QUOTE_REQUEST: str = "R"
-        ORDER_MASS_CANCEL_REPORT: str = "r"
-        QUOTE: str = "S"
-        NEW_ORDER_s: str = "s"
-        SETTLEMENT_INSTRUCTIONS: str = "T"
-        CROSS_ORDER_CANCEL_REPLACE_REQUEST: str = "t"
-        CROSS_ORDER_CANCEL_REQUEST: str = "u"
-        MARKET_DATA_REQUEST: str = "V"
-        SECURITY_TYPE_REQUEST: str = "v"
-        SECURITY_TYPES: str = "w"
-        MARKET_DATA_W: str = "W"
-        SECURITY_LIST_REQUEST: str = "x"
-        MARKET_DATA_X: str = "X"
-        MARKET_DATA_REQUEST_REJECT: str = "Y"
-        SECURITY_LIST: str = "y"
-        QUOTE_CANCEL: str = "Z"
-        DERIVATIVE_SECURITY_LIST_REQUEST: str = "z"
-        CONTRARY_INTENTION_REPORT: str = "BO"
-        SECURITY_DEFINITION_UPDATE_REPORT: str = "BP"
-        SECURITY_LIST_UPDATE_REPORT: str = "BK"
-        ADJUSTED_POSITION_REPORT: str = "BL"
-        ALLOCATION_INSTRUCTION_ALERT: str = "BM"
-        EXECUTION_ACKNOWLEDGEMENT: str = "BN"
-        TRADING_SESSION_LIST: str = "BJ"
-        TRADING_SESSION_LIST_REQUEST: str = "BI"
-        SETTLEMENTOBLIGATIONREPORT: str = "BQ"
-        DERIVATIVESECURITYLISTUPDATEREPORT: str = "BR"
-        TRADINGSESSIONLISTUPDATEREPORT: str = "BS"
-        MARKETDEFINITIONREQUEST: str = "BT"
-        MARKETDEFINITION: str = "BU"
-        MARKETDEFINITIONUPDATEREPORT: str = "BV"
-        USERNOTIFICATION: str = "CB"
-        ORDERMASSACTIONREPORT: str = "BZ"
-        ORDERMASSACTIONREQUEST: str = "CA"
-        APPLICATIONMESSAGEREQUEST: str = "BW"
-        APPLICATIONMESSAGEREQUESTACK: str = "BX"
-        APPLICATIONMESSAGEREPORT: str = "BY"
-
-    # NewSeqNo(36): SEQNUM
-    class NewSeqNo:
-        tag: int = 36
-
-    # OrderID(37): STRING
-    class OrderID:
-        tag: int = 37
-
-    # OrderQty(38): QTY
-    class OrderQty:
-        tag: int = 38
-
-    # OrdStatus(39): CHAR
-    class OrdStatus:
-        tag: int = 39
-        NEW: str = '0'
-        PARTIALLY_FILLED: str = '1'
-        FILLED: str = '2'
-        DONE_FOR_DAY: str = '3'
-        CANCELED: str = '4'
-        PENDING_CANCEL: str = '6'
-        STOPPED: str = '7'
-        REJECTED: str = '8'
-        SUSPENDED: str = '9'
-        PENDING_NEW: str = 'A'
-        CALCULATED: str = 'B'
-        EXPIRED: str = 'C'
-        ACCEPTED_FOR_BIDDING: str = 'D'
-        PENDING_REPLACE: str = 'E'
-        REPLACED: str = '5'
-
-    # OrdType(40): CHAR
-    class OrdType:
-        tag: int = 40
-        MARKET: str = '1'
-        LIMIT: str = '2'
-        STOP: str = '3'
-        STOP_LIMIT: str = '4'
-        MARKET_ON_CLOSE: str = '5'
-        WITH_OR_WITHOUT: str = '6'
-        LIMIT_OR_BETTER: str = '7'
-        LIMIT_WITH_OR_WITHOUT: str = '8'
-        ON_BASIS: str = '9'
-        ON_CLOSE: str = 'A'
-        LIMIT_ON_CLOSE: str = 'B'
-        FOREX_MARKET: str = 'C'
-        PREVIOUSLY_QUOTED: str = 'D'
-        PREVIOUSLY_INDICATED: str = 'E'
-        FOREX_LIMIT: str = 'F'
-        FOREX_SWAP: str = 'G'
-        FOREX_PREVIOUSLY_QUOTED: str = 'H'
-        FUNARI: str = 'I'
-        MARKET_IF_TOUCHED: str = 'J'
-        MARKET_WITH_LEFT_OVER_AS_LIMIT: str = 'K'
-        PREVIOUS_FUND_VALUATION_POINT: str = 'L'
-        NEXT_FUND_VALUATION_POINT: str = 'M'
-        PEGGED: str = 'P'
-        COUNTER_ORDER_SELECTION: str = 'Q'
-
-    # OrigClOrdID(41): STRING
-    class OrigClOrdID:
-        tag: int = 41
-
-    # OrigTime(42): UTCTIMESTAMP
-    class OrigTime:
-        tag: int = 42
-
-    # PossDupFlag(43): BOOLEAN
-    class PossDupFlag:
-        tag: int = 43
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # Price(44): PRICE
-    class Price:
-        tag: int = 44
-
-    # RefSeqNum(45): SEQNUM
-    class RefSeqNum:
-        tag: int = 45
-
-    # RelatdSym(46): STRING
-    class RelatdSym:
-        tag: int = 46
-
-    # Rule80A(47): CHAR
-    class Rule80A:
-        tag: int = 47
-        AGENCY_SINGLE_ORDER: str = 'A'
-        SHORT_EXEMPT_TRANSACTION_B: str = 'B'
-        PROPRIETARY_NON_ALGORITHMIC_PROGRAM_TRADE: str = 'C'
-        PROGRAM_ORDER_INDEX_ARB_FOR_MEMBER_FIRM_ORG: str = 'D'
-        SHORT_EXEMPT_TRANSACTION_FOR_PRINCIPAL: str = 'E'
-        SHORT_EXEMPT_TRANSACTION_F: str = 'F'
-        SHORT_EXEMPT_TRANSACTION_H: str = 'H'
-        INDIVIDUAL_INVESTOR_SINGLE_ORDER: str = 'I'
-        PROPRIETARY_ALGORITHMIC_PROGRAM_TRADING: str = 'J'
-        AGENCY_ALGORITHMIC_PROGRAM_TRADING: str = 'K'
-        SHORT_EXEMPT_TRANSACTION_FOR_MEMBER_COMPETING_MARKET_MAKER_AFFLIATED_WITH_THE_FIRM_CLEARING_THE_TRADE: str = 'L'
-        PROGRAM_ORDER_INDEX_ARB_FOR_OTHER_MEMBER: str = 'M'
-        AGENT_FOR_OTHER_MEMBER_NON_ALGORITHMIC_PROGRAM_TRADE: str = 'N'
-        PROPRIETARY_TRANSACTIONS_FOR_COMPETING_MARKET_MAKER_THAT_IS_AFFILIATED_WITH_THE_CLEARING_MEMBER: str = 'O'
-        PRINCIPAL: str = 'P'
-        TRANSACTIONS_FOR_THE_ACCOUNT_OF_A_NON_MEMBER_COMPTING_MARKET_MAKER: str = 'R'
-        SPECIALIST_TRADES: str = 'S'
-        TRANSACTIONS_FOR_THE_ACCOUNT_OF_AN_UNAFFILIATED_MEMBERS_COMPETING_MARKET_MAKER: str = 'T'
-        AGENCY_INDEX_ARBITRAGE: str = 'U'
-        ALL_OTHER_ORDERS_AS_AGENT_FOR_OTHER_MEMBER: str = 'W'
-        SHORT_EXEMPT_TRANSACTION_FOR_MEMBER_COMPETING_MARKET_MAKER_NOT_AFFILIATED_WITH_THE_FIRM_CLEARING_THE_TRADE: str = 'X'
-        AGENCY_NON_ALGORITHMIC_PROGRAM_TRADE: str = 'Y'
-        SHORT_EXEMPT_TRANSACTION_FOR_NON_MEMBER_COMPETING_MARKET_MAKER: str = 'Z'
-
-    # SecurityID(48): STRING
-    class SecurityID:
-        tag: int = 48
-
-    # SenderCompID(49): STRING
-    class SenderCompID:
-        tag: int = 49
-
-    # SenderSubID(50): STRING
-    class SenderSubID:
-        tag: int = 50
-
-    # SendingDate(51): LOCALMKTDATE
-    class SendingDate:
-        tag: int = 51
-
-    # SendingTime(52): UTCTIMESTAMP
-    class SendingTime:
-        tag: int = 52
-
-    # Quantity(53): QTY
-    class Quantity:
-        tag: int = 53
-
-    # Side(54): CHAR
-    class Side:
-        tag: int = 54
-        BUY: str = '1'
-        SELL: str = '2'
-        BUY_MINUS: str = '3'
-        SELL_PLUS: str = '4'
-        SELL_SHORT: str = '5'
-        SELL_SHORT_EXEMPT: str = '6'
-        UNDISCLOSED: str = '7'
-        CROSS: str = '8'
-        CROSS_SHORT: str = '9'
-        CROSS_SHORT_EXXMPT: str = 'A'
-        AS_DEFINED: str = 'B'
-        OPPOSITE: str = 'C'
-        SUBSCRIBE: str = 'D'
-        REDEEM: str = 'E'
-        LEND: str = 'F'
-        BORROW: str = 'G'
-
-    # Symbol(55): STRING
-    class Symbol:
-        tag: int = 55
-
-    # TargetCompID(56): STRING
-    class TargetCompID:
-        tag: int = 56
-
-    # TargetSubID(57): STRING
-    class TargetSubID:
-        tag: int = 57
-
-    # Text(58): STRING
-    class Text:
-        tag: int = 58
-
-    # TimeInForce(59): CHAR
-    class TimeInForce:
-        tag: int = 59
-        DAY: str = '0'
-        GOOD_TILL_CANCEL: str = '1'
-        AT_THE_OPENING: str = '2'
-        IMMEDIATE_OR_CANCEL: str = '3'
-        FILL_OR_KILL: str = '4'
-        GOOD_TILL_CROSSING: str = '5'
-        GOOD_TILL_DATE: str = '6'
-        AT_THE_CLOSE: str = '7'
-        GOOD_THROUGH_CROSSING: str = '8'
-        AT_CROSSING: str = '9'
-
-    # TransactTime(60): UTCTIMESTAMP
-    class TransactTime:
-        tag: int = 60
-
-    # Urgency(61): CHAR
-    class Urgency:
-        tag: int = 61
-        NORMAL: str = '0'
-        FLASH: str = '1'
-        BACKGROUND: str = '2'
-
-    # ValidUntilTime(62): UTCTIMESTAMP
-    class ValidUntilTime:
-        tag: int = 62
-
-    # SettlType(63): STRING
-    class SettlType:
-        tag: int = 63
-        REGULAR: str = "0"
-        CASH: str = "1"
-        NEXT_DAY: str = "2"
-        T_PLUS_2: str = "3"
-        T_PLUS_3: str = "4"
-        T_PLUS_4: str = "5"
-        FUTURE: str = "6"
-        WHEN_AND_IF_ISSUED: str = "7"
-        SELLERS_OPTION: str = "8"
-        T_PLUS_5: str = "9"
-        FX_SPOT_NEXT_SETTLEMENT: str = "C"
-        BROKEN_DATE: str = "B"
-
-    # SettlDate(64): LOCALMKTDATE
-    class SettlDate:
-        tag: int = 64
-
-    # SymbolSfx(65): STRING
-    class SymbolSfx:
-        tag: int = 65
-        EUCP_WITH_LUMP_SUM_INTEREST_RATHER_THAN_DISCOUNT_PRICE: str = "CD"
-        WHEN_ISSUED_FOR_A_SECURITY_TO_BE_REISSUED_UNDER_AN_OLD_CUSIP_OR_ISIN: str = "WI"
-
-    # ListID(66): STRING
-    class ListID:
-        tag: int = 66
-
-    # ListSeqNo(67): INT
-    class ListSeqNo:
-        tag: int = 67
-
-    # TotNoOrders(68): INT
-    class TotNoOrders:
-        tag: int = 68
-
-    # ListExecInst(69): STRING
-    class ListExecInst:
-        tag: int = 69
-
-    # AllocID(70): STRING
-    class AllocID:
-        tag: int = 70
-
-    # AllocTransType(71): CHAR
-    class AllocTransType:
-        tag: int = 71
-        NEW: str = '0'
-        REPLACE: str = '1'
-        CANCEL: str = '2'
-        PRELIMINARY: str = '3'
-        CALCULATED: str = '4'
-        CALCULATED_WITHOUT_PRELIMINARY: str = '5'
-        REVERSAL: str = '6'
-
-    # RefAllocID(72): STRING
-    class RefAllocID:
-        tag: int = 72
-
-    # NoOrders(73): NUMINGROUP
-    class NoOrders:
-        tag: int = 73
-
-    # AvgPxPrecision(74): INT
-    class AvgPxPrecision:
-        tag: int = 74
-
-    # TradeDate(75): LOCALMKTDATE
-    class TradeDate:
-        tag: int = 75
-
-    # ExecBroker(76): STRING
-    class ExecBroker:
-        tag: int = 76
-
-    # PositionEffect(77): CHAR
-    class PositionEffect:
-        tag: int = 77
-        CLOSE: str = 'C'
-        FIFO: str = 'F'
-        OPEN: str = 'O'
-        ROLLED: str = 'R'
-        CLOSE_BUT_NOTIFY_ON_OPEN: str = 'N'
-        DEFAULT: str = 'D'
-
-    # NoAllocs(78): NUMINGROUP
-    class NoAllocs:
-        tag: int = 78
-
-    # AllocAccount(79): STRING
-    class AllocAccount:
-        tag: int = 79
-
-    # AllocQty(80): QTY
-    class AllocQty:
-        tag: int = 80
-
-    # ProcessCode(81): CHAR
-    class ProcessCode:
-        tag: int = 81
-        REGULAR: str = '0'
-        SOFT_DOLLAR: str = '1'
-        STEP_IN: str = '2'
-        STEP_OUT: str = '3'
-        SOFT_DOLLAR_STEP_IN: str = '4'
-        SOFT_DOLLAR_STEP_OUT: str = '5'
-        PLAN_SPONSOR: str = '6'
-
-    # NoRpts(82): INT
-    class NoRpts:
-        tag: int = 82
-
-    # RptSeq(83): INT
-    class RptSeq:
-        tag: int = 83
-
-    # CxlQty(84): QTY
-    class CxlQty:
-        tag: int = 84
-
-    # NoDlvyInst(85): NUMINGROUP
-    class NoDlvyInst:
-        tag: int = 85
-
-    # DlvyInst(86): STRING
-    class DlvyInst:
-        tag: int = 86
-
-    # AllocStatus(87): INT
-    class AllocStatus:
-        tag: int = 87
-        ACCEPTED: int = 0
-        BLOCK_LEVEL_REJECT: int = 1
-        ACCOUNT_LEVEL_REJECT: int = 2
-        RECEIVED: int = 3
-        INCOMPLETE: int = 4
-        REJECTED_BY_INTERMEDIARY: int = 5
-        ALLOCATION_PENDING: int = 6
-        REVERSED: int = 7
-
-    # AllocRejCode(88): INT
-    class AllocRejCode:
-        tag: int = 88
-        UNKNOWN_ACCOUNT: int = 0
-        INCORRECT_QUANTITY: int = 1
-        UNKNOWN_OR_STALE_EXECID: int = 10
-        MISMATCHED_DATA: int = 11
-        UNKNOWN_CLORDID: int = 12
-        WAREHOUSE_REQUEST_REJECTED: int = 13
-        INCORRECT_AVERAGEG_PRICE: int = 2
-        UNKNOWN_EXECUTING_BROKER_MNEMONIC: int = 3
-        COMMISSION_DIFFERENCE: int = 4
-        UNKNOWN_ORDERID: int = 5
-        UNKNOWN_LISTID: int = 6
-        OTHER: int = 7
-        INCORRECT_ALLOCATED_QUANTITY: int = 8
-        CALCULATION_DIFFERENCE: int = 9
-
-    # Signature(89): DATA
-    class Signature:
-        tag: int = 89
-
-    # SecureDataLen(90): LENGTH
-    class SecureDataLen:
-        tag: int = 90
-
-    # SecureData(91): DATA
-    class SecureData:
-        tag: int = 91
-
-    # BrokerOfCredit(92): STRING
-    class BrokerOfCredit:
-        tag: int = 92
-
-    # SignatureLength(93): LENGTH
-    class SignatureLength:
-        tag: int = 93
-
-    # EmailType(94): CHAR
-    class EmailType:
-        tag: int = 94
-        NEW: str = '0'
-        REPLY: str = '1'
-        ADMIN_REPLY: str = '2'
-
-    # RawDataLength(95): LENGTH
-    class RawDataLength:
-        tag: int = 95
-
-    # RawData(96): DATA
-    class RawData:
-        tag: int = 96
-
-    # PossResend(97): BOOLEAN
-    class PossResend:
-        tag: int = 97
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # EncryptMethod(98): INT
-    class EncryptMethod:
-        tag: int = 98
-        NONE: int = 0
-        PKCS_1: int = 1
-        DES: int = 2
-        PKCS_3: int = 3
-        PGP_4: int = 4
-        PGP_5: int = 5
-        PEM: int = 6
-
-    # StopPx(99): PRICE
-    class StopPx:
-        tag: int = 99
-
-    # ExDestination(100): EXCHANGE
-    class ExDestination:
-        tag: int = 100
-
-    # CxlRejReason(102): INT
-    class CxlRejReason:
-        tag: int = 102
-        TOO_LATE_TO_CANCEL: int = 0
-        UNKNOWN_ORDER: int = 1
-        BROKER: int = 2
-        ORDER_ALREADY_IN_PENDING_CANCEL_OR_PENDING_REPLACE_STATUS: int = 3
-        UNABLE_TO_PROCESS_ORDER_MASS_CANCEL_REQUEST: int = 4
-        ORIGORDMODTIME: int = 5
-        DUPLICATE_CLORDID: int = 6
-        OTHER: int = 99
-        INVALID_PRICE_INCREMENT: int = 18
-        PRICE_EXCEEDS_CURRENT_PRICE: int = 7
-        PRICE_EXCEEDS_CURRENT_PRICE_BAND: int = 8
-
-    # OrdRejReason(103): INT
-    class OrdRejReason:
-        tag: int = 103
-        BROKER: int = 0
-        UNKNOWN_SYMBOL: int = 1
-        INVALID_INVESTOR_ID: int = 10
-        UNSUPPORTED_ORDER_CHARACTERISTIC: int = 11
-        SURVEILLENCE_OPTION: int = 12
-        INCORRECT_QUANTITY: int = 13
-        INCORRECT_ALLOCATED_QUANTITY: int = 14
-        UNKNOWN_ACCOUNT: int = 15
-        EXCHANGE_CLOSED: int = 2
-        ORDER_EXCEEDS_LIMIT: int = 3
-        TOO_LATE_TO_ENTER: int = 4
-        UNKNOWN_ORDER: int = 5
-        DUPLICATE_ORDER: int = 6
-        DUPLICATE_OF_A_VERBALLY_COMMUNICATED_ORDER: int = 7
-        STALE_ORDER: int = 8
-        TRADE_ALONG_REQUIRED: int = 9
-        OTHER: int = 99
-        INVALID_PRICE_INCREMENT: int = 18
-        PRICE_EXCEEDS_CURRENT_PRICE_BAND: int = 16
-
-    # IOIQualifier(104): CHAR
-    class IOIQualifier:
-        tag: int = 104
-        ALL_OR_NONE: str = 'A'
-        MARKET_ON_CLOSE: str = 'B'
-        AT_THE_CLOSE: str = 'C'
-        VWAP: str = 'D'
-        IN_TOUCH_WITH: str = 'I'
-        LIMIT: str = 'L'
-        MORE_BEHIND: str = 'M'
-        AT_THE_OPEN: str = 'O'
-        TAKING_A_POSITION: str = 'P'
-        AT_THE_MARKET: str = 'Q'
-        READY_TO_TRADE: str = 'R'
-        PORTFOLIO_SHOWN: str = 'S'
-        THROUGH_THE_DAY: str = 'T'
-        VERSUS: str = 'V'
-        INDIDCATION: str = 'W'
-        CROSSING_OPPORTUNITY: str = 'X'
-        AT_THE_MIDPOINT: str = 'Y'
-        PRE_OPEN: str = 'Z'
-
-    # WaveNo(105): STRING
-    class WaveNo:
-        tag: int = 105
-
-    # Issuer(106): STRING
-    class Issuer:
-        tag: int = 106
-
-    # SecurityDesc(107): STRING
-    class SecurityDesc:
-        tag: int = 107
-
-    # HeartBtInt(108): INT
-    class HeartBtInt:
-        tag: int = 108
-
-    # ClientID(109): STRING
-    class ClientID:
-        tag: int = 109
-
-    # MinQty(110): QTY
-    class MinQty:
-        tag: int = 110
-
-    # MaxFloor(111): QTY
-    class MaxFloor:
-        tag: int = 111
-
-    # TestReqID(112): STRING
-    class TestReqID:
-        tag: int = 112
-
-    # ReportToExch(113): BOOLEAN
-    class ReportToExch:
-        tag: int = 113
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # LocateReqd(114): BOOLEAN
-    class LocateReqd:
-        tag: int = 114
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # OnBehalfOfCompID(115): STRING
-    class OnBehalfOfCompID:
-        tag: int = 115
-
-    # OnBehalfOfSubID(116): STRING
-    class OnBehalfOfSubID:
-        tag: int = 116
-
-    # QuoteID(117): STRING
-    class QuoteID:
-        tag: int = 117
-
-    # NetMoney(118): AMT
-    class NetMoney:
-        tag: int = 118
-
-    # SettlCurrAmt(119): AMT
-    class SettlCurrAmt:
-        tag: int = 119
-
-    # SettlCurrency(120): CURRENCY
-    class SettlCurrency:
-        tag: int = 120
-
-    # ForexReq(121): BOOLEAN
-    class ForexReq:
-        tag: int = 121
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # OrigSendingTime(122): UTCTIMESTAMP
-    class OrigSendingTime:
-        tag: int = 122
-
-    # GapFillFlag(123): BOOLEAN
-    class GapFillFlag:
-        tag: int = 123
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # NoExecs(124): NUMINGROUP
-    class NoExecs:
-        tag: int = 124
-
-    # CxlType(125): CHAR
-    class CxlType:
-        tag: int = 125
-
-    # ExpireTime(126): UTCTIMESTAMP
-    class ExpireTime:
-        tag: int = 126
-
-    # DKReason(127): CHAR
-    class DKReason:
-        tag: int = 127
-        UNKNOWN_SYMBOL: str = 'A'
-        WRONG_SIDE: str = 'B'
-        QUANTITY_EXCEEDS_ORDER: str = 'C'
-        NO_MATCHING_ORDER: str = 'D'
-        PRICE_EXCEEDS_LIMIT: str = 'E'
-        CALCULATION_DIFFERENCE: str = 'F'
-        OTHER: str = 'Z'
-
-    # DeliverToCompID(128): STRING
-    class DeliverToCompID:
-        tag: int = 128
-
-    # DeliverToSubID(129): STRING
-    class DeliverToSubID:
-        tag: int = 129
-
-    # IOINaturalFlag(130): BOOLEAN
-    class IOINaturalFlag:
-        tag: int = 130
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # QuoteReqID(131): STRING
-    class QuoteReqID:
-        tag: int = 131
-
-    # BidPx(132): PRICE
-    class BidPx:
-        tag: int = 132
-
-    # OfferPx(133): PRICE
-    class OfferPx:
-        tag: int = 133
-
-    # BidSize(134): QTY
-    class BidSize:
-        tag: int = 134
-
-    # OfferSize(135): QTY
-    class OfferSize:
-        tag: int = 135
-
-    # NoMiscFees(136): NUMINGROUP
-    class NoMiscFees:
-        tag: int = 136
-
-    # MiscFeeAmt(137): AMT
-    class MiscFeeAmt:
-        tag: int = 137
-
-    # MiscFeeCurr(138): CURRENCY
-    class MiscFeeCurr:
-        tag: int = 138
-
-    # MiscFeeType(139): STRING
-    class MiscFeeType:
-        tag: int = 139
-        REGULATORY: str = "1"
-        PER_TRANSACTION: str = "10"
-        CONVERSION: str = "11"
-        AGENT: str = "12"
-        TAX: str = "2"
-        LOCAL_COMMISSION: str = "3"
-        EXCHANGE_FEES: str = "4"
-        STAMP: str = "5"
-        LEVY: str = "6"
-        OTHER: str = "7"
-        MARKUP: str = "8"
-        CONSUMPTION_TAX: str = "9"
-        TRANSFER_FEE: str = "13"
-        SECURITY_LENDING: str = "14"
-
-    # PrevClosePx(140): PRICE
-    class PrevClosePx:
-        tag: int = 140
-
-    # ResetSeqNumFlag(141): BOOLEAN
-    class ResetSeqNumFlag:
-        tag: int = 141
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # SenderLocationID(142): STRING
-    class SenderLocationID:
-        tag: int = 142
-
-    # TargetLocationID(143): STRING
-    class TargetLocationID:
-        tag: int = 143
-
-    # OnBehalfOfLocationID(144): STRING
-    class OnBehalfOfLocationID:
-        tag: int = 144
-
-    # DeliverToLocationID(145): STRING
-    class DeliverToLocationID:
-        tag: int = 145
-
-    # NoRelatedSym(146): NUMINGROUP
-    class NoRelatedSym:
-        tag: int = 146
-
-    # Subject(147): STRING
-    class Subject:
-        tag: int = 147
-
-    # Headline(148): STRING
-    class Headline:
-        tag: int = 148
-
-    # URLLink(149): STRING
-    class URLLink:
-        tag: int = 149
-
-    # ExecType(150): CHAR
-    class ExecType:
-        tag: int = 150
-        NEW: str = '0'
-        DONE_FOR_DAY: str = '3'
-        CANCELED: str = '4'
-        REPLACED: str = '5'
-        PENDING_CANCEL: str = '6'
-        STOPPED: str = '7'
-        REJECTED: str = '8'
-        SUSPENDED: str = '9'
-        PENDING_NEW: str = 'A'
-        CALCULATED: str = 'B'
-        EXPIRED: str = 'C'
-        RESTATED: str = 'D'
-        PENDING_REPLACE: str = 'E'
-        TRADE: str = 'F'
-        TRADE_CORRECT: str = 'G'
-        TRADE_CANCEL: str = 'H'
-        ORDER_STATUS: str = 'I'
-        TRADE_IN_A_CLEARING_HOLD: str = 'J'
-        TRADE_HAS_BEEN_RELEASED_TO_CLEARING: str = 'K'
-        TRIGGERED_OR_ACTIVATED_BY_SYSTEM: str = 'L'
-
-    # LeavesQty(151): QTY
-    class LeavesQty:
-        tag: int = 151
-
-    # CashOrderQty(152): QTY
-    class CashOrderQty:
-        tag: int = 152
-
-    # AllocAvgPx(153): PRICE
-    class AllocAvgPx:
-        tag: int = 153
-
-    # AllocNetMoney(154): AMT
-    class AllocNetMoney:
-        tag: int = 154
-
-    # SettlCurrFxRate(155): FLOAT
-    class SettlCurrFxRate:
-        tag: int = 155
-
-    # SettlCurrFxRateCalc(156): CHAR
-    class SettlCurrFxRateCalc:
-        tag: int = 156
-        MULTIPLY: str = 'M'
-        DIVIDE: str = 'D'
-
-    # NumDaysInterest(157): INT
-    class NumDaysInterest:
-        tag: int = 157
-
-    # AccruedInterestRate(158): PERCENTAGE
-    class AccruedInterestRate:
-        tag: int = 158
-
-    # AccruedInterestAmt(159): AMT
-    class AccruedInterestAmt:
-        tag: int = 159
-
-    # SettlInstMode(160): CHAR
-    class SettlInstMode:
-        tag: int = 160
-        DEFAULT: str = '0'
-        STANDING_INSTRUCTIONS_PROVIDED: str = '1'
-        SPECIFIC_ALLOCATION_ACCOUNT_OVERRIDING: str = '2'
-        SPECIFIC_ALLOCATION_ACCOUNT_STANDING: str = '3'
-        SPECIFIC_ORDER_FOR_A_SINGLE_ACCOUNT: str = '4'
-        REQUEST_REJECT: str = '5'
-
-    # AllocText(161): STRING
-    class AllocText:
-        tag: int = 161
-
-    # SettlInstID(162): STRING
-    class SettlInstID:
-        tag: int = 162
-
-    # SettlInstTransType(163): CHAR
-    class SettlInstTransType:
-        tag: int = 163
-        CANCEL: str = 'C'
-        NEW: str = 'N'
-        REPLACE: str = 'R'
-        RESTATE: str = 'T'
-
-    # EmailThreadID(164): STRING
-    class EmailThreadID:
-        tag: int = 164
-
-    # SettlInstSource(165): CHAR
-    class SettlInstSource:
-        tag: int = 165
-        BROKERS_INSTRUCTIONS: str = '1'
-        INSTITUTIONS_INSTRUCTIONS: str = '2'
-        INVESTOR: str = '3'
-
-    # SettlLocation(166): STRING
-    class SettlLocation:
-        tag: int = 166
-        CEDEL: str = "CED"
-        DEPOSITORY_TRUST_COMPANY: str = "DTC"
-        EURO_CLEAR: str = "EUR"
-        FEDERAL_BOOK_ENTRY: str = "FED"
-        LOCAL_MARKET_SETTLE_LOCATION: str = "ISO_Country_Code"
-        PHYSICAL: str = "PNY"
-        PARTICIPANT_TRUST_COMPANY: str = "PTC"
-
-    # SecurityType(167): STRING
-    class SecurityType:
-        tag: int = 167
-        ASSET_BACKED_SECURITIES: str = "ABS"
-        AMENDED_RESTATED: str = "AMENDED"
-        OTHER_ANTICIPATION_NOTES: str = "AN"
-        BANKERS_ACCEPTANCE: str = "BA"
-        BANK_NOTES: str = "BN"
-        BILL_OF_EXCHANGES: str = "BOX"
-        BRADY_BOND: str = "BRADY"
-        BRIDGE_LOAN: str = "BRIDGE"
-        BUY_SELLBACK: str = "BUYSELL"
-        CONVERTIBLE_BOND: str = "CB"
-        CERTIFICATE_OF_DEPOSIT: str = "CD"
-        CALL_LOANS: str = "CL"
-        CORP_MORTGAGE_BACKED_SECURITIES: str = "CMBS"
-        COLLATERALIZED_MORTGAGE_OBLIGATION: str = "CMO"
-        CERTIFICATE_OF_OBLIGATION: str = "COFO"
-        CERTIFICATE_OF_PARTICIPATION: str = "COFP"
-        CORPORATE_BOND: str = "CORP"
-        COMMERCIAL_PAPER: str = "CP"
-        CORPORATE_PRIVATE_PLACEMENT: str = "CPP"
-        COMMON_STOCK: str = "CS"
-        DEFAULTED: str = "DEFLTED"
-        DEBTOR_IN_POSSESSION: str = "DINP"
-        DEPOSIT_NOTES: str = "DN"
-        DUAL_CURRENCY: str = "DUAL"
-        EURO_CERTIFICATE_OF_DEPOSIT: str = "EUCD"
-        EURO_CORPORATE_BOND: str = "EUCORP"
-        EURO_COMMERCIAL_PAPER: str = "EUCP"
-        EURO_SOVEREIGNS: str = "EUSOV"
-        EURO_SUPRANATIONAL_COUPONS: str = "EUSUPRA"
-        FEDERAL_AGENCY_COUPON: str = "FAC"
-        FEDERAL_AGENCY_DISCOUNT_NOTE: str = "FADN"
-        FOREIGN_EXCHANGE_CONTRACT: str = "FOR"
-        FORWARD: str = "FORWARD"
-        FUTURE: str = "FUT"
-        GENERAL_OBLIGATION_BONDS: str = "GO"
-        IOETTE_MORTGAGE: str = "IET"
-        LETTER_OF_CREDIT: str = "LOFC"
-        LIQUIDITY_NOTE: str = "LQN"
-        MATURED: str = "MATURED"
-        MORTGAGE_BACKED_SECURITIES: str = "MBS"
-        MUTUAL_FUND: str = "MF"
-        MORTGAGE_INTEREST_ONLY: str = "MIO"
-        MULTILEG_INSTRUMENT: str = "MLEG"
-        MORTGAGE_PRINCIPAL_ONLY: str = "MPO"
-        MORTGAGE_PRIVATE_PLACEMENT: str = "MPP"
-        MISCELLANEOUS_PASS_THROUGH: str = "MPT"
-        MANDATORY_TENDER: str = "MT"
-        MEDIUM_TERM_NOTES: str = "MTN"
-        NO_SECURITY_TYPE: str = "NONE"
-        OVERNIGHT: str = "ONITE"
-        OPTION: str = "OPT"
-        PRIVATE_EXPORT_FUNDING: str = "PEF"
-        PFANDBRIEFE: str = "PFAND"
-        PROMISSORY_NOTE: str = "PN"
-        PREFERRED_STOCK: str = "PS"
-        PLAZOS_FIJOS: str = "PZFJ"
-        REVENUE_ANTICIPATION_NOTE: str = "RAN"
-        REPLACED: str = "REPLACD"
-        REPURCHASE: str = "REPO"
-        RETIRED: str = "RETIRED"
-        REVENUE_BONDS: str = "REV"
-        REVOLVER_LOAN: str = "RVLV"
-        REVOLVER_TERM_LOAN: str = "RVLVTRM"
-        SECURITIES_LOAN: str = "SECLOAN"
-        SECURITIES_PLEDGE: str = "SECPLEDGE"
-        SPECIAL_ASSESSMENT: str = "SPCLA"
-        SPECIAL_OBLIGATION: str = "SPCLO"
-        SPECIAL_TAX: str = "SPCLT"
-        SHORT_TERM_LOAN_NOTE: str = "STN"
-        STRUCTURED_NOTES: str = "STRUCT"
-        USD_SUPRANATIONAL_COUPONS: str = "SUPRA"
-        SWING_LINE_FACILITY: str = "SWING"
-        TAX_ANTICIPATION_NOTE: str = "TAN"
-        TAX_ALLOCATION: str = "TAXA"
-        TO_BE_ANNOUNCED: str = "TBA"
-        US_TREASURY_BILL_TBILL: str = "TBILL"
-        US_TREASURY_BOND: str = "TBOND"
-        PRINCIPAL_STRIP_OF_A_CALLABLE_BOND_OR_NOTE: str = "TCAL"
-        TIME_DEPOSIT: str = "TD"
-        TAX_EXEMPT_COMMERCIAL_PAPER: str = "TECP"
-        TERM_LOAN: str = "TERM"
-        INTEREST_STRIP_FROM_ANY_BOND_OR_NOTE: str = "TINT"
-        TREASURY_INFLATION_PROTECTED_SECURITIES: str = "TIPS"
-        US_TREASURY_NOTE_TNOTE: str = "TNOTE"
-        PRINCIPAL_STRIP_FROM_A_NON_CALLABLE_BOND_OR_NOTE: str = "TPRN"
-        TAX_REVENUE_ANTICIPATION_NOTE: str = "TRAN"
-        US_TREASURY_NOTE_UST: str = "UST"
-        US_TREASURY_BILL_USTB: str = "USTB"
-        VARIABLE_RATE_DEMAND_NOTE: str = "VRDN"
-        WARRANT: str = "WAR"
-        WITHDRAWN: str = "WITHDRN"
-        WILDCARD_ENTRY_FOR_USE_ON_SECURITY_DEFINITION_REQUEST: str = "?"
-        EXTENDED_COMM_NOTE: str = "XCN"
-        INDEXED_LINKED: str = "XLINKD"
-        YANKEE_CORPORATE_BOND: str = "YANK"
-        YANKEE_CERTIFICATE_OF_DEPOSIT: str = "YCD"
-        OPTIONS_ON_PHYSICAL: str = "OOP"
-        OPTIONS_ON_FUTURES: str = "OOF"
-        CASH: str = "CASH"
-        OPTIONS_ON_COMBO: str = "OOC"
-        INTEREST_RATE_SWAP: str = "IRS"
-        BANK_DEPOSITORY_NOTE: str = "BDN"
-        CANADIAN_MONEY_MARKETS: str = "CAMM"
-        CANADIAN_TREASURY_NOTES: str = "CAN"
-        CANADIAN_TREASURY_BILLS: str = "CTB"
-        CREDIT_DEFAULT_SWAP: str = "CDS"
-        CANADIAN_MORTGAGE_BONDS: str = "CMB"
-        EURO_CORPORATE_FLOATING_RATE_NOTES: str = "EUFRN"
-        US_CORPORATE_FLOATING_RATE_NOTES: str = "FRN"
-        CANADIAN_PROVINCIAL_BONDS: str = "PROV"
-        SECURED_LIQUIDITY_NOTE: str = "SLQN"
-        TREASURY_BILL: str = "TB"
-        TERM_LIQUIDITY_NOTE: str = "TLQN"
-        TAXABLE_MUNICIPAL_CP: str = "TMCP"
-
-    # EffectiveTime(168): UTCTIMESTAMP
-    class EffectiveTime:
-        tag: int = 168
-
-    # StandInstDbType(169): INT
-    class StandInstDbType:
-        tag: int = 169
-        OTHER: int = 0
-        DTC_SID: int = 1
-        THOMSON_ALERT: int = 2
-        A_GLOBAL_CUSTODIAN: int = 3
-        ACCOUNTNET: int = 4
-
-    # StandInstDbName(170): STRING
-    class StandInstDbName:
-        tag: int = 170
-
-    # StandInstDbID(171): STRING
-    class StandInstDbID:
-        tag: int = 171
-
-    # SettlDeliveryType(172): INT
-    class SettlDeliveryType:
-        tag: int = 172
-        VERSUS_PAYMENT_DELIVER: int = 0
-        FREE_DELIVER: int = 1
-        TRI_PARTY: int = 2
-        HOLD_IN_CUSTODY: int = 3
-
-    # SettlDepositoryCode(173): STRING
-    class SettlDepositoryCode:
-        tag: int = 173
-
-    # SettlBrkrCode(174): STRING
-    class SettlBrkrCode:
-        tag: int = 174
-
-    # SettlInstCode(175): STRING
-    class SettlInstCode:
-        tag: int = 175
-
-    # SecuritySettlAgentName(176): STRING
-    class SecuritySettlAgentName:
-        tag: int = 176
-
-    # SecuritySettlAgentCode(177): STRING
-    class SecuritySettlAgentCode:
-        tag: int = 177
-
-    # SecuritySettlAgentAcctNum(178): STRING
-    class SecuritySettlAgentAcctNum:
-        tag: int = 178
-
-    # SecuritySettlAgentAcctName(179): STRING
-    class SecuritySettlAgentAcctName:
-        tag: int = 179
-
-    # SecuritySettlAgentContactName(180): STRING
-    class SecuritySettlAgentContactName:
-        tag: int = 180
-
-    # SecuritySettlAgentContactPhone(181): STRING
-    class SecuritySettlAgentContactPhone:
-        tag: int = 181
-
-    # CashSettlAgentName(182): STRING
-    class CashSettlAgentName:
-        tag: int = 182
-
-    # CashSettlAgentCode(183): STRING
-    class CashSettlAgentCode:
-        tag: int = 183
-
-    # CashSettlAgentAcctNum(184): STRING
-    class CashSettlAgentAcctNum:
-        tag: int = 184
-
-    # CashSettlAgentAcctName(185): STRING
-    class CashSettlAgentAcctName:
-        tag: int = 185
-
-    # CashSettlAgentContactName(186): STRING
-    class CashSettlAgentContactName:
-        tag: int = 186
-
-    # CashSettlAgentContactPhone(187): STRING
-    class CashSettlAgentContactPhone:
-        tag: int = 187
-
-    # BidSpotRate(188): PRICE
-    class BidSpotRate:
-        tag: int = 188
-
-    # BidForwardPoints(189): PRICEOFFSET
-    class BidForwardPoints:
-        tag: int = 189
-
-    # OfferSpotRate(190): PRICE
-    class OfferSpotRate:
-        tag: int = 190
-
-    # OfferForwardPoints(191): PRICEOFFSET
-    class OfferForwardPoints:
-        tag: int = 191
-
-    # OrderQty2(192): QTY
-    class OrderQty2:
-        tag: int = 192
-
-    # SettlDate2(193): LOCALMKTDATE
-    class SettlDate2:
-        tag: int = 193
-
-    # LastSpotRate(194): PRICE
-    class LastSpotRate:
-        tag: int = 194
-
-    # LastForwardPoints(195): PRICEOFFSET
-    class LastForwardPoints:
-        tag: int = 195
-
-    # AllocLinkID(196): STRING
-    class AllocLinkID:
-        tag: int = 196
-
-    # AllocLinkType(197): INT
-    class AllocLinkType:
-        tag: int = 197
-        FX_NETTING: int = 0
-        FX_SWAP: int = 1
-
-    # SecondaryOrderID(198): STRING
-    class SecondaryOrderID:
-        tag: int = 198
-
-    # NoIOIQualifiers(199): NUMINGROUP
-    class NoIOIQualifiers:
-        tag: int = 199
-
-    # MaturityMonthYear(200): MONTHYEAR
-    class MaturityMonthYear:
-        tag: int = 200
-
-    # PutOrCall(201): INT
-    class PutOrCall:
-        tag: int = 201
-        PUT: int = 0
-        CALL: int = 1
-
-    # StrikePrice(202): PRICE
-    class StrikePrice:
-        tag: int = 202
-
-    # CoveredOrUncovered(203): INT
-    class CoveredOrUncovered:
-        tag: int = 203
-        COVERED: int = 0
-        UNCOVERED: int = 1
-
-    # CustomerOrFirm(204): INT
-    class CustomerOrFirm:
-        tag: int = 204
-        CUSTOMER: int = 0
-        FIRM: int = 1
-
-    # MaturityDay(205): DAYOFMONTH
-    class MaturityDay:
-        tag: int = 205
-
-    # OptAttribute(206): CHAR
-    class OptAttribute:
-        tag: int = 206
-
-    # SecurityExchange(207): EXCHANGE
-    class SecurityExchange:
-        tag: int = 207
-
-    # NotifyBrokerOfCredit(208): BOOLEAN
-    class NotifyBrokerOfCredit:
-        tag: int = 208
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # AllocHandlInst(209): INT
-    class AllocHandlInst:
-        tag: int = 209
-        MATCH: int = 1
-        FORWARD: int = 2
-        FORWARD_AND_MATCH: int = 3
-
-    # MaxShow(210): QTY
-    class MaxShow:
-        tag: int = 210
-
-    # PegOffsetValue(211): FLOAT
-    class PegOffsetValue:
-        tag: int = 211
-
-    # XmlDataLen(212): LENGTH
-    class XmlDataLen:
-        tag: int = 212
-
-    # XmlData(213): DATA
-    class XmlData:
-        tag: int = 213
-
-    # SettlInstRefID(214): STRING
-    class SettlInstRefID:
-        tag: int = 214
-
-    # NoRoutingIDs(215): NUMINGROUP
-    class NoRoutingIDs:
-        tag: int = 215
-
-    # RoutingType(216): INT
-    class RoutingType:
-        tag: int = 216
-        TARGET_FIRM: int = 1
-        TARGET_LIST: int = 2
-        BLOCK_FIRM: int = 3
-        BLOCK_LIST: int = 4
-
-    # RoutingID(217): STRING
-    class RoutingID:
-        tag: int = 217
-
-    # Spread(218): PRICEOFFSET
-    class Spread:
-        tag: int = 218
-
-    # Benchmark(219): CHAR
-    class Benchmark:
-        tag: int = 219
-        CURVE: str = '1'
-        _5YR: str = '2'
-        OLD5: str = '3'
-        _10YR: str = '4'
-        OLD10: str = '5'
-        _30YR: str = '6'
-        OLD30: str = '7'
-        _3MOLIBOR: str = '8'
-        _6MOLIBOR: str = '9'
-
-    # BenchmarkCurveCurrency(220): CURRENCY
-    class BenchmarkCurveCurrency:
-        tag: int = 220
-
-    # BenchmarkCurveName(221): STRING
-    class BenchmarkCurveName:
-        tag: int = 221
-        EONIA: str = "EONIA"
-        EUREPO: str = "EUREPO"
-        EURIBOR: str = "Euribor"
-        FUTURESWAP: str = "FutureSWAP"
-        LIBID: str = "LIBID"
-        LIBOR: str = "LIBOR"
-        MUNIAAA: str = "MuniAAA"
-        OTHER: str = "OTHER"
-        PFANDBRIEFE: str = "Pfandbriefe"
-        SONIA: str = "SONIA"
-        SWAP: str = "SWAP"
-        TREASURY: str = "Treasury"
-
-    # BenchmarkCurvePoint(222): STRING
-    class BenchmarkCurvePoint:
-        tag: int = 222
-
-    # CouponRate(223): PERCENTAGE
-    class CouponRate:
-        tag: int = 223
-
-    # CouponPaymentDate(224): LOCALMKTDATE
-    class CouponPaymentDate:
-        tag: int = 224
-
-    # IssueDate(225): LOCALMKTDATE
-    class IssueDate:
-        tag: int = 225
-
-    # RepurchaseTerm(226): INT
-    class RepurchaseTerm:
-        tag: int = 226
-
-    # RepurchaseRate(227): PERCENTAGE
-    class RepurchaseRate:
-        tag: int = 227
-
-    # Factor(228): FLOAT
-    class Factor:
-        tag: int = 228
-
-    # TradeOriginationDate(229): LOCALMKTDATE
-    class TradeOriginationDate:
-        tag: int = 229
-
-    # ExDate(230): LOCALMKTDATE
-    class ExDate:
-        tag: int = 230
-
-    # ContractMultiplier(231): FLOAT
-    class ContractMultiplier:
-        tag: int = 231
-
-    # NoStipulations(232): NUMINGROUP
-    class NoStipulations:
-        tag: int = 232
-
-    # StipulationType(233): STRING
-    class StipulationType:
-        tag: int = 233
-        ABSOLUTE_PREPAYMENT_SPEED: str = "ABS"
-        ALTERNATIVE_MINIMUM_TAX: str = "AMT"
-        AUTO_REINVESTMENT_AT_RATE_OR_BETTER: str = "AUTOREINV"
-        BANK_QUALIFIED: str = "BANKQUAL"
-        BARGAIN_CONDITIONS: str = "BGNCON"
-        COUPON_RANGE: str = "COUPON"
-        CONSTANT_PREPAYMENT_PENALTY: str = "CPP"
-        CONSTANT_PREPAYMENT_RATE: str = "CPR"
-        CONSTANT_PREPAYMENT_YIELD: str = "CPY"
-        ISO_CURRENCY_CODE: str = "CURRENCY"
-        CUSTOM_START_END_DATE: str = "CUSTOMDATE"
-        GEOGRAPHICS_AND_RANGE: str = "GEOG"
-        VALUATION_DISCOUNT: str = "HAIRCUT"
-        FINAL_CPR_OF_HOME_EQUITY_PREPAYMENT_CURVE: str = "HEP"
-        INSURED: str = "INSURED"
-        YEAR_OR_YEAR_MONTH_OF_ISSUE: str = "ISSUE"
-        ISSUERS_TICKER: str = "ISSUER"
-        ISSUE_SIZE_RANGE: str = "ISSUESIZE"
-        LOOKBACK_DAYS: str = "LOOKBACK"
-        EXPLICIT_LOT_IDENTIFIER: str = "LOT"
-        LOT_VARIANCE: str = "LOTVAR"
-        MATURITY_YEAR_AND_MONTH: str = "MAT"
-        MATURITY_RANGE: str = "MATURITY"
-        MAXIMUM_SUBSTITUTIONS: str = "MAXSUBS"
-        PERCENT_OF_MANUFACTURED_HOUSING_PREPAYMENT_CURVE: str = "MHP"
-        MINIMUM_DENOMINATION: str = "MINDNOM"
-        MINIMUM_INCREMENT: str = "MININCR"
-        MINIMUM_QUANTITY: str = "MINQTY"
-        MONTHLY_PREPAYMENT_RATE: str = "MPR"
-        PAYMENT_FREQUENCY_CALENDAR: str = "PAYFREQ"
-        NUMBER_OF_PIECES: str = "PIECES"
-        POOLS_MAXIMUM: str = "PMAX"
-        PERCENT_OF_PROSPECTUS_PREPAYMENT_CURVE: str = "PPC"
-        POOLS_PER_LOT: str = "PPL"
-        POOLS_PER_MILLION: str = "PPM"
-        POOLS_PER_TRADE: str = "PPT"
-        PRICE_RANGE: str = "PRICE"
-        PRICING_FREQUENCY: str = "PRICEFREQ"
-        PRODUCTION_YEAR: str = "PROD"
-        CALL_PROTECTION: str = "PROTECT"
-        PERCENT_OF_BMA_PREPAYMENT_CURVE: str = "PSA"
-        PURPOSE: str = "PURPOSE"
-        BENCHMARK_PRICE_SOURCE: str = "PXSOURCE"
-        RATING_SOURCE_AND_RANGE: str = "RATING"
-        TYPE_OF_REDEMPTION: str = "REDEMPTION"
-        RESTRICTED: str = "RESTRICTED"
-        MARKET_SECTOR: str = "SECTOR"
-        SECURITY_TYPE_INCLUDED_OR_EXCLUDED: str = "SECTYPE"
-        SINGLE_MONTHLY_MORTALITY: str = "SMM"
-        STRUCTURE: str = "STRUCT"
-        SUBSTITUTIONS_FREQUENCY: str = "SUBSFREQ"
-        SUBSTITUTIONS_LEFT: str = "SUBSLEFT"
-        FREEFORM_TEXT: str = "TEXT"
-        TRADE_VARIANCE: str = "TRDVAR"
-        WEIGHTED_AVERAGE_COUPON: str = "WAC"
-        WEIGHTED_AVERAGE_LIFE_COUPON: str = "WAL"
-        WEIGHTED_AVERAGE_LOAN_AGE: str = "WALA"
-        WEIGHTED_AVERAGE_MATURITY: str = "WAM"
-        WHOLE_POOL: str = "WHOLE"
-        YIELD_RANGE: str = "YIELD"
-        AVERAGE_FICO_SCORE: str = "AVFICO"
-        AVERAGE_LOAN_SIZE: str = "AVSIZE"
-        MAXIMUM_LOAN_BALANCE: str = "MAXBAL"
-        POOL_IDENTIFIER: str = "POOL"
-        TYPE_OF_ROLL_TRADE: str = "ROLLTYPE"
-        REFERENCE_TO_ROLLING_OR_CLOSING_TRADE: str = "REFTRADE"
-        PRINCIPAL_OF_ROLLING_OR_CLOSING_TRADE: str = "REFPRIN"
-        INTEREST_OF_ROLLING_OR_CLOSING_TRADE: str = "REFINT"
-        AVAILABLE_OFFER_QUANTITY_TO_BE_SHOWN_TO_THE_STREET: str = "AVAILQTY"
-        BROKERS_SALES_CREDIT: str = "BROKERCREDIT"
-        OFFER_PRICE_TO_BE_SHOWN_TO_INTERNAL_BROKERS: str = "INTERNALPX"
-        OFFER_QUANTITY_TO_BE_SHOWN_TO_INTERNAL_BROKERS: str = "INTERNALQTY"
-        THE_MINIMUM_RESIDUAL_OFFER_QUANTITY: str = "LEAVEQTY"
-        MAXIMUM_ORDER_SIZE: str = "MAXORDQTY"
-        ORDER_QUANTITY_INCREMENT: str = "ORDRINCR"
-        PRIMARY_OR_SECONDARY_MARKET_INDICATOR: str = "PRIMARY"
-        BROKER_SALES_CREDIT_OVERRIDE: str = "SALESCREDITOVR"
-        TRADERS_CREDIT: str = "TRADERCREDIT"
-        DISCOUNT_RATE: str = "DISCOUNT"
-        YIELD_TO_MATURITY: str = "YTM"
-
-    # StipulationValue(234): STRING
-    class StipulationValue:
-        tag: int = 234
-
-    # YieldType(235): STRING
-    class YieldType:
-        tag: int = 235
-        AFTER_TAX_YIELD: str = "AFTERTAX"
-        ANNUAL_YIELD: str = "ANNUAL"
-        YIELD_AT_ISSUE: str = "ATISSUE"
-        YIELD_TO_AVG_MATURITY: str = "AVGMATURITY"
-        BOOK_YIELD: str = "BOOK"
-        YIELD_TO_NEXT_CALL: str = "CALL"
-        YIELD_CHANGE_SINCE_CLOSE: str = "CHANGE"
-        CLOSING_YIELD: str = "CLOSE"
-        COMPOUND_YIELD: str = "COMPOUND"
-        CURRENT_YIELD: str = "CURRENT"
-        GVNT_EQUIVALENT_YIELD: str = "GOVTEQUIV"
-        TRUE_GROSS_YIELD: str = "GROSS"
-        YIELD_WITH_INFLATION_ASSUMPTION: str = "INFLATION"
-        INVERSE_FLOATER_BOND_YIELD: str = "INVERSEFLOATER"
-        MOST_RECENT_CLOSING_YIELD: str = "LASTCLOSE"
-        CLOSING_YIELD_MOST_RECENT_MONTH: str = "LASTMONTH"
-        CLOSING_YIELD_MOST_RECENT_QUARTER: str = "LASTQUARTER"
-        CLOSING_YIELD_MOST_RECENT_YEAR: str = "LASTYEAR"
-        YIELD_TO_LONGEST_AVERAGE_LIFE: str = "LONGAVGLIFE"
-        MARK_TO_MARKET_YIELD: str = "MARK"
-        YIELD_TO_MATURITY: str = "MATURITY"
-        YIELD_TO_NEXT_REFUND: str = "NEXTREFUND"
-        OPEN_AVERAGE_YIELD: str = "OPENAVG"
-        PREVIOUS_CLOSE_YIELD: str = "PREVCLOSE"
-        PROCEEDS_YIELD: str = "PROCEEDS"
-        YIELD_TO_NEXT_PUT: str = "PUT"
-        SEMI_ANNUAL_YIELD: str = "SEMIANNUAL"
-        YIELD_TO_SHORTEST_AVERAGE_LIFE: str = "SHORTAVGLIFE"
-        SIMPLE_YIELD: str = "SIMPLE"
-        TAX_EQUIVALENT_YIELD: str = "TAXEQUIV"
-        YIELD_TO_TENDER_DATE: str = "TENDER"
-        TRUE_YIELD: str = "TRUE"
-        YIELD_VALUE_OF_1_32: str = "VALUE1_32"
-        YIELD_TO_WORST: str = "WORST"
-
-    # Yield(236): PERCENTAGE
-    class Yield:
-        tag: int = 236
-
-    # TotalTakedown(237): AMT
-    class TotalTakedown:
-        tag: int = 237
-
-    # Concession(238): AMT
-    class Concession:
-        tag: int = 238
-
-    # RepoCollateralSecurityType(239): INT
-    class RepoCollateralSecurityType:
-        tag: int = 239
-
-    # RedemptionDate(240): LOCALMKTDATE
-    class RedemptionDate:
-        tag: int = 240
-
-    # UnderlyingCouponPaymentDate(241): LOCALMKTDATE
-    class UnderlyingCouponPaymentDate:
-        tag: int = 241
-
-    # UnderlyingIssueDate(242): LOCALMKTDATE
-    class UnderlyingIssueDate:
-        tag: int = 242
-
-    # UnderlyingRepoCollateralSecurityType(243): INT
-    class UnderlyingRepoCollateralSecurityType:
-        tag: int = 243
-
-    # UnderlyingRepurchaseTerm(244): INT
-    class UnderlyingRepurchaseTerm:
-        tag: int = 244
-
-    # UnderlyingRepurchaseRate(245): PERCENTAGE
-    class UnderlyingRepurchaseRate:
-        tag: int = 245
-
-    # UnderlyingFactor(246): FLOAT
-    class UnderlyingFactor:
-        tag: int = 246
-
-    # UnderlyingRedemptionDate(247): LOCALMKTDATE
-    class UnderlyingRedemptionDate:
-        tag: int = 247
-
-    # LegCouponPaymentDate(248): LOCALMKTDATE
-    class LegCouponPaymentDate:
-        tag: int = 248
-
-    # LegIssueDate(249): LOCALMKTDATE
-    class LegIssueDate:
-        tag: int = 249
-
-    # LegRepoCollateralSecurityType(250): INT
-    class LegRepoCollateralSecurityType:
-        tag: int = 250
-
-    # LegRepurchaseTerm(251): INT
-    class LegRepurchaseTerm:
-        tag: int = 251
-
-    # LegRepurchaseRate(252): PERCENTAGE
-    class LegRepurchaseRate:
-        tag: int = 252
-
-    # LegFactor(253): FLOAT
-    class LegFactor:
-        tag: int = 253
-
-    # LegRedemptionDate(254): LOCALMKTDATE
-    class LegRedemptionDate:
-        tag: int = 254
-
-    # CreditRating(255): STRING
-    class CreditRating:
-        tag: int = 255
-
-    # UnderlyingCreditRating(256): STRING
-    class UnderlyingCreditRating:
-        tag: int = 256
-
-    # LegCreditRating(257): STRING
-    class LegCreditRating:
-        tag: int = 257
-
-    # TradedFlatSwitch(258): BOOLEAN
-    class TradedFlatSwitch:
-        tag: int = 258
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # BasisFeatureDate(259): LOCALMKTDATE
-    class BasisFeatureDate:
-        tag: int = 259
-
-    # BasisFeaturePrice(260): PRICE
-    class BasisFeaturePrice:
-        tag: int = 260
-
-    # MDReqID(262): STRING
-    class MDReqID:
-        tag: int = 262
-
-    # SubscriptionRequestType(263): CHAR
-    class SubscriptionRequestType:
-        tag: int = 263
-        SNAPSHOT: str = '0'
-        SNAPSHOT_PLUS_UPDATES: str = '1'
-        DISABLE_PREVIOUS_SNAPSHOT_PLUS_UPDATE_REQUEST: str = '2'
-
-    # MarketDepth(264): INT
-    class MarketDepth:
-        tag: int = 264
-
-    # MDUpdateType(265): INT
-    class MDUpdateType:
-        tag: int = 265
-        FULL_REFRESH: int = 0
-        INCREMENTAL_REFRESH: int = 1
-
-    # AggregatedBook(266): BOOLEAN
-    class AggregatedBook:
-        tag: int = 266
-        YES: str = 'Y'
-        NO: str = 'N'
-
-    # NoMDEntryTypes(267): NUMINGROUP
-    class NoMDEntryTypes:
-        tag: int = 267
-
-    # NoMDEntries(268): NUMINGROUP
-    class NoMDEntries:
-        tag: int = 268
-
-    # MDEntryType(269): CHAR
-    class MDEntryType:
-        tag: int = 269
-        BID: str = '0'
-        OFFER: str = '1'
-        TRADE: str = '2'
-        INDEX_VALUE: str = '3'
-        OPENING_PRICE: str = '4'
-        CLOSING_PRICE: str = '5'
-        SETTLEMENT_PRICE: str = '6'
-        TRADING_SESSION_HIGH_PRICE: str = '7'
-        TRADING_SESSION_LOW_PRICE: str = '8'
-        TRADING_SESSION_VWAP_PRICE: str = '9'
-        IMBALANCE: str = 'A'
-        TRADE_VOLUME: str = 'B'
-        OPEN_INTEREST: str = 'C'
-        COMPOSITE_UNDERLYING_PRICE: str = 'D'
-        SIMULATED_SELL_PRICE: str = 'E'
-        SIMULATED_BUY_PRICE: str = 'F'
-        MARGIN_RATE: str = 'G'
-        MID_PRICE: str = 'H'
-        EMPTY_BOOK: str = 'J'
-        SETTLE_HIGH_PRICE: str = 'K'
-        SETTLE_LOW_PRICE: str = 'L'
-        PRIOR_SETTLE_PRICE: str = 'M'
-        SESSION_HIGH_BID: str = 'N'
-        SESSION_LOW_OFFER: str = 'O'
-        EARLY_PRICES: str = 'P'
-        AUCTION_CLEARING_PRICE: str = 'Q'
-        SWAP_VALUE_FACTOR: str = 'S'
-        DAILY_VALUE_ADJUSTMENT_FOR_LONG_POSITIONS: str = 'R'
-        CUMULATIVE_VALUE_ADJUSTMENT_FOR_LONG_POSITIONS: str = 'T'
-        DAILY_VALUE_ADJUSTMENT_FOR_SHORT_POSITIONS: str = 'U'
-        CUMULATIVE_VALUE_ADJUSTMENT_FOR_SHORT_POSITIONS: str = 'V'
-
-    # MDEntryPx(270): PRICE
-    class MDEntryPx:
-        tag: int = 270
-
-    # MDEntrySize(271): QTY
-    class MDEntrySize:
-        tag: int = 271
-
-    # MDEntryDate(272): UTCDATEONLY
-    class MDEntryDate:
-        tag: int = 272
-
-    # MDEntryTime(273): UTCTIMEONLY
-    class MDEntryTime:
-        tag: int = 273
-
-    # TickDirection(274): CHAR
-    class TickDirection:
-        tag: int = 274
-        PLUS_TICK: str = '0'
-        ZERO_PLUS_TICK: str = '1'
-        MINUS_TICK: str = '2'
-        ZERO_MINUS_TICK: str = '3'
-
-    # MDMkt(275): EXCHANGE
-    class MDMkt:
-        tag: int = 275
-
-    # QuoteCondition(276): MULTIPLESTRINGVALUE
-    class QuoteCondition:
-        tag: int = 276
-        OPEN_ACTIVE: str = "A"
-        CLOSED_INACTIVE: str = "B"
-        EXCHANGE_BEST: str = "C"
-        CONSOLIDATED_BEST: str = "D"
-        LOCKED: str = "E"
-        CROSSED: str = "F"
-        DEPTH: str = "G"
-        FAST_TRADING: str = "H"
-        NON_FIRM: str = "I"
-        MANUAL_SLOW_QUOTE: str = "L"
-        OUTRIGHT_PRICE: str = "J"
-        IMPLIED_PRICE: str = "K"
-        DEPTH_ON_OFFER: str = "M"
-        DEPTH_ON_BID: str = "N"
-        CLOSING: str = "O"
-        NEWS_DISSEMINATION: str = "P"
-        TRADING_RANGE: str = "Q"
-        ORDER_INFLUX: str = "R"
-        DUE_TO_RELATED: str = "S"
-        NEWS_PENDING: str = "T"
-        ADDITIONAL_INFO: str = "U"
-        ADDITIONAL_INFO_DUE_TO_RELATED: str = "V"
-        RESUME: str = "W"
-        VIEW_OF_COMMON: str = "X"
-        VOLUME_ALERT: str = "Y"
-        ORDER_IMBALANCE: str = "Z"
-        EQUIPMENT_CHANGEOVER: str = "a"
-        NO_OPEN: str = "b"
-        REGULAR_ETH: str = "c"
-        AUTOMATIC_EXECUTION: str = "d"
-        AUTOMATIC_EXECUTION_ETH: str = "e"
-        FAST_MARKET_ETH: str = "f "
-        INACTIVE_ETH: str = "g"
-        ROTATION: str = "h"
-        ROTATION_ETH: str = "i"
-        HALT: str = "j"
-        HALT_ETH: str = "k"
-        DUE_TO_NEWS_DISSEMINATION: str = "l"
-        DUE_TO_NEWS_PENDING: str = "m"
-        TRADING_RESUME: str = "n"
-        OUT_OF_SEQUENCE: str = "o"
-        BID_SPECIALIST: str = "p"
-        OFFER_SPECIALIST: str = "q"
-        BID_OFFER_SPECIALIST: str = "r"
-        END_OF_DAY_SAM: str = "s"
-        FORBIDDEN_SAM: str = "t"
-        FROZEN_SAM: str = "u"
-        PREOPENING_SAM: str = "v"
-        OPENING_SAM: str = "w"
-        OPEN_SAM: str = "x"
-        SURVEILLANCE_SAM: str = "y"
-        SUSPENDED_SAM: str = "z"
-        RESERVED_SAM: str = "0"
-        NO_ACTIVE_SAM: str = "1"
-        RESTRICTED: str = "2"
-        REST_OF_BOOK_VWAP: str = "3"
-        BETTER_PRICES_IN_CONDITIONAL_ORDERS: str = "4"
-        MEDIAN_PRICE: str = "5"
-
-    # TradeCondition(277): MULTIPLESTRINGVALUE
-    class TradeCondition:
-        tag: int = 277
-        CASH: str = "A"
-        AVERAGE_PRICE_TRADE: str = "B"
-        CASH_TRADE: str = "C"
-        NEXT_DAY: str = "D"
-        OPENING_REOPENING_TRADE_DETAIL: str = "E"
-        INTRADAY_TRADE_DETAIL: str = "F"
-        RULE_127_TRADE: str = "G"
-        RULE_155_TRADE: str = "H"
-        SOLD_LAST: str = "I"
-        NEXT_DAY_TRADE: str = "J"
-        OPENED: str = "K"
-        SELLER: str = "L"
-        SOLD: str = "M"
-        STOPPED_STOCK: str = "N"
-        IMBALANCE_MORE_BUYERS: str = "P"
-        IMBALANCE_MORE_SELLERS: str = "Q"
-        OPENING_PRICE: str = "R"
-        TRADES_RESULTING_FROM_MANUAL_SLOW_QUOTE: str = "Y"
-        TRADES_RESULTING_FROM_INTERMARKET_SWEEP: str = "Z"
-        BARGAIN_CONDITION: str = "S"
-        CONVERTED_PRICE_INDICATOR: str = "T"
-        EXCHANGE_LAST: str = "U"
-        FINAL_PRICE_OF_SESSION: str = "V"
-        EX_PIT: str = "W"
-        CROSSED_X: str = "X"
-        CANCEL: str = "0"
-        VOLUME_ONLY: str = "a"
-        DIRECT_PLUS: str = "b"
-        ACQUISITION: str = "c"
-        BUNCHED: str = "d"
-        DISTRIBUTION: str = "e"
-        BUNCHED_SALE: str = "f"
-        SPLIT_TRADE: str = "g"
-        CANCEL_STOPPED: str = "h"
-        CANCEL_ETH: str = "i"
-        CANCEL_STOPPED_ETH: str = "j"
-        OUT_OF_SEQUENCE_ETH: str = "k"
-        CANCEL_LAST_ETH: str = "l"
-        SOLD_LAST_SALE_ETH: str = "m"
-        CANCEL_LAST: str = "n"
-        SOLD_LAST_SALE: str = "o"
-        CANCEL_OPEN: str = "p"
-        CANCEL_OPEN_ETH: str = "q"
-        OPENED_SALE_ETH: str = "r"
-        CANCEL_ONLY: str = "s"
-        CANCEL_ONLY_ETH: str = "t"
-        LATE_OPEN_ETH: str = "u"
-        AUTO_EXECUTION_ETH: str = "v"
-        REOPEN: str = "w"
-        REOPEN_ETH: str = "x"
-        ADJUSTED: str = "y"
-        ADJUSTED_ETH: str = "z"
-        SPREAD: str = "AA"
-        SPREAD_ETH: str = "AB"
-        STRADDLE: str = "AC"
-        STRADDLE_ETH: str = "AD"
-        STOPPED: str = "AE"
-        STOPPED_ETH: str = "AF"
-        REGULAR_ETH: str = "AG"
-        COMBO: str = "AH"
-        COMBO_ETH: str = "AI"
-        OFFICIAL_CLOSING_PRICE: str = "AJ"
-        PRIOR_REFERENCE_PRICE: str = "AK"
-        STOPPED_SOLD_LAST: str = "AL"
-        STOPPED_OUT_OF_SEQUENCE: str = "AM"
-        OFFICAL_CLOSING_PRICE: str = "AN"
-        CROSSED_AO: str = "AO"
-        FAST_MARKET: str = "AP"
-        AUTOMATIC_EXECUTION: str = "AQ"
-        FORM_T: str = "AR"
-        BASKET_INDEX: str = "AS"
-        BURST_BASKET: str = "AT"
-        IMPLIED_TRADE: str = "1"
-        OUTSIDE_SPREAD: str = "AV"
-        MARKETPLACE_ENTERED_TRADE: str = "2"
-        MULT_ASSET_CLASS_MULTILEG_TRADE: str = "3"
-        MULTILEG_TO_MULTILEG_TRADE: str = "4"
-
-    # MDEntryID(278): STRING
-    class MDEntryID:
-        tag: int = 278
-
-    # MDUpdateAction(279): CHAR
-    class MDUpdateAction:
-        tag: int = 279
-        NEW: str = '0'
-        CHANGE: str = '1'
-        DELETE: str = '2'
-        DELETE_THRU: str = '3'
-        DELETE_FROM: str = '4'
-        OVERLAY: str = '5'
-
-    # MDEntryRefID(280): STRING
-    class MDEntryRefID:
-        tag: int = 280
-
-    # MDReqRejReason(281): CHAR
-    class MDReqRejReason:
-        tag: int = 281
-        UNKNOWN_SYMBOL: str = '0'
-        DUPLICATE_MDREQID: str = '1'
-        INSUFFICIENT_BANDWIDTH: str = '2'
-        INSUFFICIENT_PERMISSIONS: str = '3'
-        UNSUPPORTED_SUBSCRIPTIONREQUESTTYPE: str = '4'
-        UNSUPPORTED_MARKETDEPTH: str = '5'
-        UNSUPPORTED_MDUPDATETYPE: str = '6'
-        UNSUPPORTED_AGGREGATEDBOOK: str = '7'
-        UNSUPPORTED_MDENTRYTYPE: str = '8'
-        UNSUPPORTED_TRADINGSESSIONID: str = '9'
-        UNSUPPORTED_SCOPE: str = 'A'
-        UNSUPPORTED_OPENCLOSESETTLEFLAG: str = 'B'
-        UNSUPPORTED_MDIMPLICITDELETE: str = 'C'
-        INSUFFICIENT_CREDIT: str = 'D'
-
-    # MDEntryOriginator(282): STRING
-    class MDEntryOriginator:
-        tag: int = 282
-
-    # LocationID(283): STRING
-    class LocationID:
-        tag: int = 283
-
-    # DeskID(284): STRING
-    class DeskID:
-        tag: int = 284
-
-    # DeleteReason(285): CHAR
-    class DeleteReason:
-        tag: int = 285
-        CANCELLATION: str = '0'
-        ERROR: str = '1'
-
-    # OpenCloseSettlFlag(286): MULTIPLECHARVALUE
-    class OpenCloseSettlFlag:
-        tag: int = 286
-        DAILY_OPEN: str = "0"
-        SESSION_OPEN: str = "1"
-        DELIVERY_SETTLEMENT_ENTRY: str = "2"
-        EXPECTED_ENTRY: str = "3"
-        ENTRY_FROM_PREVIOUS_BUSINESS_DAY: str = "4"
-        THEORETICAL_PRICE_VALUE: str = "5"
-
-    # SellerDays(287): INT
-    class SellerDays:
-        tag: int = 287
-
-    # MDEntryBuyer(288): STRING
-    class MDEntryBuyer:
-        tag: int = 288
-
-    # MDEntrySeller(289): STRING
-    class MDEntrySeller:
-        tag: int = 289
-
-    # MDEntryPositionNo(290): INT
-    class MDEntryPositionNo:
-        tag: int = 290
-
-    # FinancialStatus(291): MULTIPLECHARVALUE
-    class FinancialStatus:
-        tag: int = 291
-        BANKRUPT: str = "1"
-        PENDING_DELISTING: str = "2"
-        RESTRICTED: str = "3"
-
-    # CorporateAction(292): MULTIPLECHARVALUE
-    class CorporateAction:
-        tag: int = 292
-        EX_DIVIDEND: str = "A"
-        EX_DISTRIBUTION: str = "B"
-        EX_RIGHTS: str = "C"
-        NEW: str = "D"
-        EX_INTEREST: str = "E"
-        CASH_DIVIDEND: str = "F"
-        STOCK_DIVIDEND: str = "G"
-        NON_INTEGER_STOCK_SPLIT: str = "H"
-        REVERSE_STOCK_SPLIT: str = "I"
-        STANDARD_INTEGER_STOCK_SPLIT: str = "J"
-        POSITION_CONSOLIDATION: str = "K"
-        LIQUIDATION_REORGANIZATION: str = "L"
-        MERGER_REORGANIZATION: str = "M"
-        RIGHTS_OFFERING: str = "N"
-        SHAREHOLDER_MEETING: str = "O"
-        SPINOFF: str = "P"
-        TENDER_OFFER: str = "Q"
-        WARRANT: str = "R"
-        SPECIAL_ACTION: str = "S"
-        SYMBOL_CONVERSION: str = "T"
-        CUSIP: str = "U"
-        LEAP_ROLLOVER: str = "V"
-        SUCCESSION_EVENT: str = "W"
-
-    # DefBidSize(293): QTY
-    class DefBidSize:
-        tag: int = 293
-
-    # DefOfferSize(294): QTY
-    class DefOfferSize:
-        tag: int = 294
-
-    # NoQuoteEntries(295): NUMINGROUP
-    class NoQuoteEntries:
-        tag: int = 295
-
-    # NoQuoteSets(296): NUMINGROUP
-    class NoQuoteSets:
-        tag: int = 296
-
-    # QuoteStatus(297): INT
-    class QuoteStatus:
-        tag: int = 297
-        ACCEPTED: int = 0
-        CANCEL_FOR_SYMBOL: int = 1
-        PENDING: int = 10
-        PASS: int = 11
-        LOCKED_MARKET_WARNING: int = 12
-        CROSS_MARKET_WARNING: int = 13
-        CANCELED_DUE_TO_LOCK_MARKET: int = 14
-        CANCELED_DUE_TO_CROSS_MARKET: int = 15
-        CANCELED_FOR_SECURITY_TYPE: int = 2
-        CANCELED_FOR_UNDERLYING: int = 3
-        CANCELED_ALL: int = 4
-        REJECTED: int = 5
-        REMOVED_FROM_MARKET: int = 6
-        EXPIRED: int = 7
-        QUERY: int = 8
-        QUOTE_NOT_FOUND: int = 9
-        ACTIVE: int = 16
-        CANCELED: int = 17
-        UNSOLICITED_QUOTE_REPLENISHMENT: int = 18
-        PENDING_END_TRADE: int = 19
-        TOO_LATE_TO_END: int = 20
-
-    # QuoteCancelType(298): INT
-    class QuoteCancelType:
-        tag: int = 298
-        CANCEL_FOR_SYMBOL: int = 1
-        CANCEL_FOR_SECURITY_TYPE: int = 2
-        CANCEL_FOR_UNDERLYING_SYMBOL: int = 3
-        CANCEL_ALL_QUOTES: int = 4
-        CANCEL_QUOTE_SPECIFIED_IN_QUOTEID: int = 5
-
-    # QuoteEntryID(299): STRING
-    class QuoteEntryID:
-        tag: int = 299
-
-    # QuoteRejectReason(300): INT
-    class QuoteRejectReason:
-        tag: int = 300
-        UNKNOWN_SYMBOL: int = 1
-        EXCHANGE: int = 2
-        QUOTE_REQUEST_EXCEEDS_LIMIT: int = 3
-        TOO_LATE_TO_ENTER: int = 4
-        UNKNOWN_QUOTE: int = 5
-        DUPLICATE_QUOTE: int = 6
-        INVALID_BID_ASK_SPREAD: int = 7
-        INVALID_PRICE: int = 8
-        NOT_AUTHORIZED_TO_QUOTE_SECURITY: int = 9
-        OTHER: int = 99
-        PRICE_EXCEEDS_CURRENT_PRICE_BAND: int = 10
-        QUOTE_LOCKED: int = 11
-
-    # QuoteResponseLevel(301): INT
-    class QuoteResponseLevel:
-        tag: int = 301
-        NO_ACKNOWLEDGEMENT: int = 0
-        ACKNOWLEDGE_ONLY_NEGATIVE_OR_ERRONEOUS_QUOTES: int = 1
-        ACKNOWLEDGE_EACH_QUOTE_MESSAGES: int = 2
-        SUMMARY_ACKNOWLEDGEMENT: int = 3
-
-    # QuoteSetID(302): STRING
-    class QuoteSetID:
-        tag: int = 302
-
-    # QuoteRequestType(303): INT
-    class QuoteRequestType:
-        tag: int = 303
-        MANUAL: int = 1
-        AUTOMATIC: int = 2
-
-    # TotNoQuoteEntries(304): INT
-    class TotNoQuoteEntries:
-        tag: int = 304
-
-    # UnderlyingSecurityIDSource(305): STRING
-    class UnderlyingSecurityIDSource:
-        tag: int = 305
-
-    # UnderlyingIssuer(306): STRING
-    class UnderlyingIssuer:
-        tag: int = 306
-
-    # UnderlyingSecurityDesc(307): STRING
-    class UnderlyingSecurityDesc:
-        tag: int = 307
-
-    # UnderlyingSecurityExchange(308): EXCHANGE
-    class UnderlyingSecurityExchange:
-        tag: int = 308
-
-    # UnderlyingSecurityID(309): STRING
-    class UnderlyingSecurityID:
-        tag: int = 309
-
-    # UnderlyingSecurityType(310): STRING
-    class UnderlyingSecurityType:
-        tag: int = 310
-
-    # UnderlyingSymbol(311): STRING
-    class UnderlyingSymbol:
-        tag: int = 311
-
-    # UnderlyingSymbolSfx(312): STRING
-    class UnderlyingSymbolSfx:
-        tag: int = 312
-
-    # UnderlyingMaturityMonthYear(313): MONTHYEAR
-    class UnderlyingMaturityMonthYear:
-        tag: int = 313
-
-    # UnderlyingMaturityDay(314): DAYOFMONTH
-    class UnderlyingMaturityDay:
-        tag: int = 314
-
-    # UnderlyingPutOrCall(315): INT
-    class UnderlyingPutOrCall:
-        tag: int = 315
-
-    # UnderlyingStrikePrice(316): PRICE
-    class UnderlyingStrikePrice:
-        tag: int = 316
-
-    # UnderlyingOptAttribute(317): CHAR
-    class UnderlyingOptAttribute:
-        tag: int = 317
-
-    # UnderlyingCurrency(318): CURRENCY
-    class UnderlyingCurrency:
-        tag: int = 318
-
-    # RatioQty(319): QTY
-    class RatioQty:
-        tag: int = 319
-
-    # SecurityReqID(320): STRING
-    class SecurityReqID:
-        tag: int = 320
-
-    # SecurityRequestType(321): INT
-    class SecurityRequestType:
-        tag: int = 321
-        REQUEST_SECURITY_IDENTITY_AND_SPECIFICATIONS: int = 0
-        REQUEST_SECURITY_IDENTITY_FOR_THE_SPECIFICATIONS_PROVIDED: int = 1
-        REQUEST_LIST_SECURITY_TYPES: int = 2
-        REQUEST_LIST_SECURITIES: int = 3
-        SYMBOL: int = 4
-        SECURITYTYPE_AND_OR_CFICODE: int = 5
-        PRODUCT: int = 6
-        TRADINGSESSIONID: int = 7
-        ALL_SECURITIES: int = 8
-        MARKETID_OR_MARKETID_PLUS_MARKETSEGMENTID: int = 9
-
-    # SecurityResponseID(322): STRING
-    class SecurityResponseID:
-        tag: int = 322
-
-    # SecurityResponseType(323): INT
-    class SecurityResponseType:
-        tag: int = 323
-        ACCEPT_SECURITY_PROPOSAL_AS_IS: int = 1
-        ACCEPT_SECURITY_PROPOSAL_WITH_REVISIONS_AS_INDICATED_IN_THE_MESSAGE: int = 2
-        LIST_OF_SECURITY_TYPES_RETURNED_PER_REQUEST: int = 3
-        LIST_OF_SECURITIES_RETURNED_PER_REQUEST: int = 4
-        REJECT_SECURITY_PROPOSAL: int = 5
-        CANNOT_MATCH_SELECTION_CRITERIA: int = 6
-
-    # SecurityStatusReqID(324): STRING
-    class SecurityStatusReqID:
-        tag: int = 324
-
-    # UnsolicitedIndicator(325): BOOLEAN
-    class UnsolicitedIndicator:
-        tag: int = 325
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # SecurityTradingStatus(326): INT
-    class SecurityTradingStatus:
-        tag: int = 326
-        OPENING_DELAY: int = 1
-        MARKET_ON_CLOSE_IMBALANCE_SELL: int = 10
-        _11: int = 11
-        NO_MARKET_IMBALANCE: int = 12
-        NO_MARKET_ON_CLOSE_IMBALANCE: int = 13
-        ITS_PRE_OPENING: int = 14
-        NEW_PRICE_INDICATION: int = 15
-        TRADE_DISSEMINATION_TIME: int = 16
-        READY_TO_TRADE: int = 17
-        NOT_AVAILABLE_FOR_TRADING: int = 18
-        NOT_TRADED_ON_THIS_MARKET: int = 19
-        TRADING_HALT: int = 2
-        UNKNOWN_OR_INVALID: int = 20
-        PRE_OPEN: int = 21
-        OPENING_ROTATION: int = 22
-        FAST_MARKET: int = 23
-        RESUME: int = 3
-        NO_OPEN: int = 4
-        PRICE_INDICATION: int = 5
-        TRADING_RANGE_INDICATION: int = 6
-        MARKET_IMBALANCE_BUY: int = 7
-        MARKET_IMBALANCE_SELL: int = 8
-        MARKET_ON_CLOSE_IMBALANCE_BUY: int = 9
-        PRE_CROSS: int = 24
-        CROSS: int = 25
-
-    # HaltReasonChar(327): CHAR
-    class HaltReasonChar:
-        tag: int = 327
-        NEWS_DISSEMINATION: str = 'D'
-        ORDER_INFLUX: str = 'E'
-        ORDER_IMBALANCE: str = 'I'
-        ADDITIONAL_INFORMATION: str = 'M'
-        NEW_PENDING: str = 'P'
-        EQUIPMENT_CHANGEOVER: str = 'X'
-
-    # InViewOfCommon(328): BOOLEAN
-    class InViewOfCommon:
-        tag: int = 328
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # DueToRelated(329): BOOLEAN
-    class DueToRelated:
-        tag: int = 329
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # BuyVolume(330): QTY
-    class BuyVolume:
-        tag: int = 330
-
-    # SellVolume(331): QTY
-    class SellVolume:
-        tag: int = 331
-
-    # HighPx(332): PRICE
-    class HighPx:
-        tag: int = 332
-
-    # LowPx(333): PRICE
-    class LowPx:
-        tag: int = 333
-
-    # Adjustment(334): INT
-    class Adjustment:
-        tag: int = 334
-        CANCEL: int = 1
-        ERROR: int = 2
-        CORRECTION: int = 3
-
-    # TradSesReqID(335): STRING
-    class TradSesReqID:
-        tag: int = 335
-
-    # TradingSessionID(336): STRING
-    class TradingSessionID:
-        tag: int = 336
-        DAY: str = "1"
-        HALFDAY: str = "2"
-        MORNING: str = "3"
-        AFTERNOON: str = "4"
-        EVENING: str = "5"
-        AFTER_HOURS: str = "6"
-
-    # ContraTrader(337): STRING
-    class ContraTrader:
-        tag: int = 337
-
-    # TradSesMethod(338): INT
-    class TradSesMethod:
-        tag: int = 338
-        ELECTRONIC: int = 1
-        OPEN_OUTCRY: int = 2
-        TWO_PARTY: int = 3
-
-    # TradSesMode(339): INT
-    class TradSesMode:
-        tag: int = 339
-        TESTING: int = 1
-        SIMULATED: int = 2
-        PRODUCTION: int = 3
-
-    # TradSesStatus(340): INT
-    class TradSesStatus:
-        tag: int = 340
-        UNKNOWN: int = 0
-        HALTED: int = 1
-        OPEN: int = 2
-        CLOSED: int = 3
-        PRE_OPEN: int = 4
-        PRE_CLOSE: int = 5
-        REQUEST_REJECTED: int = 6
-
-    # TradSesStartTime(341): UTCTIMESTAMP
-    class TradSesStartTime:
-        tag: int = 341
-
-    # TradSesOpenTime(342): UTCTIMESTAMP
-    class TradSesOpenTime:
-        tag: int = 342
-
-    # TradSesPreCloseTime(343): UTCTIMESTAMP
-    class TradSesPreCloseTime:
-        tag: int = 343
-
-    # TradSesCloseTime(344): UTCTIMESTAMP
-    class TradSesCloseTime:
-        tag: int = 344
-
-    # TradSesEndTime(345): UTCTIMESTAMP
-    class TradSesEndTime:
-        tag: int = 345
-
-    # NumberOfOrders(346): INT
-    class NumberOfOrders:
-        tag: int = 346
-
-    # MessageEncoding(347): STRING
-    class MessageEncoding:
-        tag: int = 347
-
-    # EncodedIssuerLen(348): LENGTH
-    class EncodedIssuerLen:
-        tag: int = 348
-
-    # EncodedIssuer(349): DATA
-    class EncodedIssuer:
-        tag: int = 349
-
-    # EncodedSecurityDescLen(350): LENGTH
-    class EncodedSecurityDescLen:
-        tag: int = 350
-
-    # EncodedSecurityDesc(351): DATA
-    class EncodedSecurityDesc:
-        tag: int = 351
-
-    # EncodedListExecInstLen(352): LENGTH
-    class EncodedListExecInstLen:
-        tag: int = 352
-
-    # EncodedListExecInst(353): DATA
-    class EncodedListExecInst:
-        tag: int = 353
-
-    # EncodedTextLen(354): LENGTH
-    class EncodedTextLen:
-        tag: int = 354
-
-    # EncodedText(355): DATA
-    class EncodedText:
-        tag: int = 355
-
-    # EncodedSubjectLen(356): LENGTH
-    class EncodedSubjectLen:
-        tag: int = 356
-
-    # EncodedSubject(357): DATA
-    class EncodedSubject:
-        tag: int = 357
-
-    # EncodedHeadlineLen(358): LENGTH
-    class EncodedHeadlineLen:
-        tag: int = 358
-
-    # EncodedHeadline(359): DATA
-    class EncodedHeadline:
-        tag: int = 359
-
-    # EncodedAllocTextLen(360): LENGTH
-    class EncodedAllocTextLen:
-        tag: int = 360
-
-    # EncodedAllocText(361): DATA
-    class EncodedAllocText:
-        tag: int = 361
-
-    # EncodedUnderlyingIssuerLen(362): LENGTH
-    class EncodedUnderlyingIssuerLen:
-        tag: int = 362
-
-    # EncodedUnderlyingIssuer(363): DATA
-    class EncodedUnderlyingIssuer:
-        tag: int = 363
-
-    # EncodedUnderlyingSecurityDescLen(364): LENGTH
-    class EncodedUnderlyingSecurityDescLen:
-        tag: int = 364
-
-    # EncodedUnderlyingSecurityDesc(365): DATA
-    class EncodedUnderlyingSecurityDesc:
-        tag: int = 365
-
-    # AllocPrice(366): PRICE
-    class AllocPrice:
-        tag: int = 366
-
-    # QuoteSetValidUntilTime(367): UTCTIMESTAMP
-    class QuoteSetValidUntilTime:
-        tag: int = 367
-
-    # QuoteEntryRejectReason(368): INT
-    class QuoteEntryRejectReason:
-        tag: int = 368
-
-    # LastMsgSeqNumProcessed(369): SEQNUM
-    class LastMsgSeqNumProcessed:
-        tag: int = 369
-
-    # OnBehalfOfSendingTime(370): UTCTIMESTAMP
-    class OnBehalfOfSendingTime:
-        tag: int = 370
-
-    # RefTagID(371): INT
-    class RefTagID:
-        tag: int = 371
-
-    # RefMsgType(372): STRING
-    class RefMsgType:
-        tag: int = 372
-
-    # SessionRejectReason(373): INT
-    class SessionRejectReason:
-        tag: int = 373
-        INVALID_TAG_NUMBER: int = 0
-        REQUIRED_TAG_MISSING: int = 1
-        SENDINGTIME_ACCURACY_PROBLEM: int = 10
-        INVALID_MSGTYPE: int = 11
-        XML_VALIDATION_ERROR: int = 12
-        TAG_APPEARS_MORE_THAN_ONCE: int = 13
-        TAG_SPECIFIED_OUT_OF_REQUIRED_ORDER: int = 14
-        REPEATING_GROUP_FIELDS_OUT_OF_ORDER: int = 15
-        INCORRECT_NUMINGROUP_COUNT_FOR_REPEATING_GROUP: int = 16
-        NON_DATA_VALUE_INCLUDES_FIELD_DELIMITER: int = 17
-        TAG_NOT_DEFINED_FOR_THIS_MESSAGE_TYPE: int = 2
-        UNDEFINED_TAG: int = 3
-        TAG_SPECIFIED_WITHOUT_A_VALUE: int = 4
-        VALUE_IS_INCORRECT: int = 5
-        INCORRECT_DATA_FORMAT_FOR_VALUE: int = 6
-        DECRYPTION_PROBLEM: int = 7
-        SIGNATURE_PROBLEM: int = 8
-        COMPID_PROBLEM: int = 9
-        OTHER: int = 99
-        INVALID_UNSUPPORTED_APPLICATION_VERSION: int = 18
-
-    # BidRequestTransType(374): CHAR
-    class BidRequestTransType:
-        tag: int = 374
-        CANCEL: str = 'C'
-        NO: str = 'N'
-
-    # ContraBroker(375): STRING
-    class ContraBroker:
-        tag: int = 375
-
-    # ComplianceID(376): STRING
-    class ComplianceID:
-        tag: int = 376
-
-    # SolicitedFlag(377): BOOLEAN
-    class SolicitedFlag:
-        tag: int = 377
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # ExecRestatementReason(378): INT
-    class ExecRestatementReason:
-        tag: int = 378
-        GT_CORPORATE_ACTION: int = 0
-        GT_RENEWAL: int = 1
-        WAREHOUSE_RECAP: int = 10
-        VERBAL_CHANGE: int = 2
-        REPRICING_OF_ORDER: int = 3
-        BROKER_OPTION: int = 4
-        PARTIAL_DECLINE_OF_ORDERQTY: int = 5
-        CANCEL_ON_TRADING_HALT: int = 6
-        CANCEL_ON_SYSTEM_FAILURE: int = 7
-        MARKET: int = 8
-        CANCELED_NOT_BEST: int = 9
-        OTHER: int = 99
-        PEG_REFRESH: int = 11
-
-    # BusinessRejectRefID(379): STRING
-    class BusinessRejectRefID:
-        tag: int = 379
-
-    # BusinessRejectReason(380): INT
-    class BusinessRejectReason:
-        tag: int = 380
-        OTHER: int = 0
-        UNKNOWN_ID: int = 1
-        UNKNOWN_SECURITY: int = 2
-        UNKNOWN_MESSAGE_TYPE: int = 3
-        APPLICATION_NOT_AVAILABLE: int = 4
-        CONDITIONALLY_REQUIRED_FIELD_MISSING: int = 5
-        NOT_AUTHORIZED: int = 6
-        DELIVERTO_FIRM_NOT_AVAILABLE_AT_THIS_TIME: int = 7
-        INVALID_PRICE_INCREMENT: int = 18
-
-    # GrossTradeAmt(381): AMT
-    class GrossTradeAmt:
-        tag: int = 381
-
-    # NoContraBrokers(382): NUMINGROUP
-    class NoContraBrokers:
-        tag: int = 382
-
-    # MaxMessageSize(383): LENGTH
-    class MaxMessageSize:
-        tag: int = 383
-
-    # NoMsgTypes(384): NUMINGROUP
-    class NoMsgTypes:
-        tag: int = 384
-
-    # MsgDirection(385): CHAR
-    class MsgDirection:
-        tag: int = 385
-        RECEIVE: str = 'R'
-        SEND: str = 'S'
-
-    # NoTradingSessions(386): NUMINGROUP
-    class NoTradingSessions:
-        tag: int = 386
-
-    # TotalVolumeTraded(387): QTY
-    class TotalVolumeTraded:
-        tag: int = 387
-
-    # DiscretionInst(388): CHAR
-    class DiscretionInst:
-        tag: int = 388
-        RELATED_TO_DISPLAYED_PRICE: str = '0'
-        RELATED_TO_MARKET_PRICE: str = '1'
-        RELATED_TO_PRIMARY_PRICE: str = '2'
-        RELATED_TO_LOCAL_PRIMARY_PRICE: str = '3'
-        RELATED_TO_MIDPOINT_PRICE: str = '4'
-        RELATED_TO_LAST_TRADE_PRICE: str = '5'
-        RELATED_TO_VWAP: str = '6'
-        AVERAGE_PRICE_GUARANTEE: str = '7'
-
-    # DiscretionOffsetValue(389): FLOAT
-    class DiscretionOffsetValue:
-        tag: int = 389
-
-    # BidID(390): STRING
-    class BidID:
-        tag: int = 390
-
-    # ClientBidID(391): STRING
-    class ClientBidID:
-        tag: int = 391
-
-    # ListName(392): STRING
-    class ListName:
-        tag: int = 392
-
-    # TotNoRelatedSym(393): INT
-    class TotNoRelatedSym:
-        tag: int = 393
-
-    # BidType(394): INT
-    class BidType:
-        tag: int = 394
-        NON_DISCLOSED_STYLE: int = 1
-        DISCLOSED_SYTLE: int = 2
-        NO_BIDDING_PROCESS: int = 3
-
-    # NumTickets(395): INT
-    class NumTickets:
-        tag: int = 395
-
-    # SideValue1(396): AMT
-    class SideValue1:
-        tag: int = 396
-
-    # SideValue2(397): AMT
-    class SideValue2:
-        tag: int = 397
-
-    # NoBidDescriptors(398): NUMINGROUP
-    class NoBidDescriptors:
-        tag: int = 398
-
-    # BidDescriptorType(399): INT
-    class BidDescriptorType:
-        tag: int = 399
-        SECTOR: int = 1
-        COUNTRY: int = 2
-        INDEX: int = 3
-
-    # BidDescriptor(400): STRING
-    class BidDescriptor:
-        tag: int = 400
-
-    # SideValueInd(401): INT
-    class SideValueInd:
-        tag: int = 401
-        SIDE_VALUE_1: int = 1
-        SIDE_VALUE_2: int = 2
-
-    # LiquidityPctLow(402): PERCENTAGE
-    class LiquidityPctLow:
-        tag: int = 402
-
-    # LiquidityPctHigh(403): PERCENTAGE
-    class LiquidityPctHigh:
-        tag: int = 403
-
-    # LiquidityValue(404): AMT
-    class LiquidityValue:
-        tag: int = 404
-
-    # EFPTrackingError(405): PERCENTAGE
-    class EFPTrackingError:
-        tag: int = 405
-
-    # FairValue(406): AMT
-    class FairValue:
-        tag: int = 406
-
-    # OutsideIndexPct(407): PERCENTAGE
-    class OutsideIndexPct:
-        tag: int = 407
-
-    # ValueOfFutures(408): AMT
-    class ValueOfFutures:
-        tag: int = 408
-
-    # LiquidityIndType(409): INT
-    class LiquidityIndType:
-        tag: int = 409
-        _5_DAY_MOVING_AVERAGE: int = 1
-        _20_DAY_MOVING_AVERAGE: int = 2
-        NORMAL_MARKET_SIZE: int = 3
-        OTHER: int = 4
-
-    # WtAverageLiquidity(410): PERCENTAGE
-    class WtAverageLiquidity:
-        tag: int = 410
-
-    # ExchangeForPhysical(411): BOOLEAN
-    class ExchangeForPhysical:
-        tag: int = 411
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # OutMainCntryUIndex(412): AMT
-    class OutMainCntryUIndex:
-        tag: int = 412
-
-    # CrossPercent(413): PERCENTAGE
-    class CrossPercent:
-        tag: int = 413
-
-    # ProgRptReqs(414): INT
-    class ProgRptReqs:
-        tag: int = 414
-        BUY_SIDE_EXPLICITLY_REQUESTS_STATUS_USING_STATUE_REQUEST: int = 1
-        SELL_SIDE_PERIODICALLY_SENDS_STATUS_USING_LIST_STATUS_PERIOD_OPTIONALLY_SPECIFIED_IN_PROGRESSPERIOD: int = 2
-        REAL_TIME_EXECUTION_REPORTS: int = 3
-
-    # ProgPeriodInterval(415): INT
-    class ProgPeriodInterval:
-        tag: int = 415
-
-    # IncTaxInd(416): INT
-    class IncTaxInd:
-        tag: int = 416
-        NET: int = 1
-        GROSS: int = 2
-
-    # NumBidders(417): INT
-    class NumBidders:
-        tag: int = 417
-
-    # BidTradeType(418): CHAR
-    class BidTradeType:
-        tag: int = 418
-        AGENCY: str = 'A'
-        VWAP_GUARANTEE: str = 'G'
-        GUARANTEED_CLOSE: str = 'J'
-        RISK_TRADE: str = 'R'
-
-    # BasisPxType(419): CHAR
-    class BasisPxType:
-        tag: int = 419
-        CLOSING_PRICE_AT_MORNINGN_SESSION: str = '2'
-        CLOSING_PRICE: str = '3'
-        CURRENT_PRICE: str = '4'
-        SQ: str = '5'
-        VWAP_THROUGH_A_DAY: str = '6'
-        VWAP_THROUGH_A_MORNING_SESSION: str = '7'
-        VWAP_THROUGH_AN_AFTERNOON_SESSION: str = '8'
-        VWAP_THROUGH_A_DAY_EXCEPT_YORI: str = '9'
-        VWAP_THROUGH_A_MORNING_SESSION_EXCEPT_YORI: str = 'A'
-        VWAP_THROUGH_AN_AFTERNOON_SESSION_EXCEPT_YORI: str = 'B'
-        STRIKE: str = 'C'
-        OPEN: str = 'D'
-        OTHERS: str = 'Z'
-
-    # NoBidComponents(420): NUMINGROUP
-    class NoBidComponents:
-        tag: int = 420
-
-    # Country(421): COUNTRY
-    class Country:
-        tag: int = 421
-
-    # TotNoStrikes(422): INT
-    class TotNoStrikes:
-        tag: int = 422
-
-    # PriceType(423): INT
-    class PriceType:
-        tag: int = 423
-        PERCENTAGE: int = 1
-        FIXED_CABINET_TRADE_PRICE: int = 10
-        VARIABLE_CABINET_TRADE_PRICE: int = 11
-        PER_UNIT: int = 2
-        FIXED_AMOUNT: int = 3
-        DISCOUNT: int = 4
-        PREMIUM: int = 5
-        SPREAD: int = 6
-        TED_PRICE: int = 7
-        TED_YIELD: int = 8
-        YIELD: int = 9
-        PRODUCT_TICKS_IN_HALFS: int = 13
-        PRODUCT_TICKS_IN_FOURTHS: int = 14
-        PRODUCT_TICKS_IN_EIGHTS: int = 15
-        PRODUCT_TICKS_IN_SIXTEENTHS: int = 16
-        PRODUCT_TICKS_IN_THIRTY_SECONDS: int = 17
-        PRODUCT_TICKS_IN_SIXTY_FORTHS: int = 18
-        PRODUCT_TICKS_IN_ONE_TWENTY_EIGHTS: int = 19
-
-    # DayOrderQty(424): QTY
-    class DayOrderQty:
-        tag: int = 424
-
-    # DayCumQty(425): QTY
-    class DayCumQty:
-        tag: int = 425
-
-    # DayAvgPx(426): PRICE
-    class DayAvgPx:
-        tag: int = 426
-
-    # GTBookingInst(427): INT
-    class GTBookingInst:
-        tag: int = 427
-        BOOK_OUT_ALL_TRADES_ON_DAY_OF_EXECUTION: int = 0
-        ACCUMULATE_EXECTUIONS_UNTIL_FORDER_IS_FILLED_OR_EXPIRES: int = 1
-        ACCUMULATE_UNTIL_VERBALLLY_NOTIFIED_OTHERWISE: int = 2
-
-    # NoStrikes(428): NUMINGROUP
-    class NoStrikes:
-        tag: int = 428
-
-    # ListStatusType(429): INT
-    class ListStatusType:
-        tag: int = 429
-        ACK: int = 1
-        RESPONSE: int = 2
-        TIMED: int = 3
-        EXEC_STARTED: int = 4
-        ALL_DONE: int = 5
-        ALERT: int = 6
-
-    # NetGrossInd(430): INT
-    class NetGrossInd:
-        tag: int = 430
-        NET: int = 1
-        GROSS: int = 2
-
-    # ListOrderStatus(431): INT
-    class ListOrderStatus:
-        tag: int = 431
-        IN_BIDDING_PROCESS: int = 1
-        RECEIVED_FOR_EXECUTION: int = 2
-        EXECUTING: int = 3
-        CANCELLING: int = 4
-        ALERT: int = 5
-        ALL_DONE: int = 6
-        REJECT: int = 7
-
-    # ExpireDate(432): LOCALMKTDATE
-    class ExpireDate:
-        tag: int = 432
-
-    # ListExecInstType(433): CHAR
-    class ListExecInstType:
-        tag: int = 433
-        IMMEDIATE: str = '1'
-        WAIT_FOR_EXECUT_INSTRUCTION: str = '2'
-        EXCHANGE_SWITCH_CIV_ORDER_3: str = '3'
-        EXCHANGE_SWITCH_CIV_ORDER_4: str = '4'
-        EXCHANGE_SWITCH_CIV_ORDER_5: str = '5'
-
-    # CxlRejResponseTo(434): CHAR
-    class CxlRejResponseTo:
-        tag: int = 434
-        ORDER_CANCEL_REQUEST: str = '1'
-        ORDER_CANCEL_REPLACE_REQUEST: str = '2'
-
-    # UnderlyingCouponRate(435): PERCENTAGE
-    class UnderlyingCouponRate:
-        tag: int = 435
-
-    # UnderlyingContractMultiplier(436): FLOAT
-    class UnderlyingContractMultiplier:
-        tag: int = 436
-
-    # ContraTradeQty(437): QTY
-    class ContraTradeQty:
-        tag: int = 437
-
-    # ContraTradeTime(438): UTCTIMESTAMP
-    class ContraTradeTime:
-        tag: int = 438
-
-    # ClearingFirm(439): STRING
-    class ClearingFirm:
-        tag: int = 439
-
-    # ClearingAccount(440): STRING
-    class ClearingAccount:
-        tag: int = 440
-
-    # LiquidityNumSecurities(441): INT
-    class LiquidityNumSecurities:
-        tag: int = 441
-
-    # MultiLegReportingType(442): CHAR
-    class MultiLegReportingType:
-        tag: int = 442
-        SINGLE_SECURITY: str = '1'
-        INDIVIDUAL_LEG_OF_A_MULTILEG_SECURITY: str = '2'
-        MULTI_LEG_SECURITY: str = '3'
-
-    # StrikeTime(443): UTCTIMESTAMP
-    class StrikeTime:
-        tag: int = 443
-
-    # ListStatusText(444): STRING
-    class ListStatusText:
-        tag: int = 444
-
-    # EncodedListStatusTextLen(445): LENGTH
-    class EncodedListStatusTextLen:
-        tag: int = 445
-
-    # EncodedListStatusText(446): DATA
-    class EncodedListStatusText:
-        tag: int = 446
-
-    # PartyIDSource(447): CHAR
-    class PartyIDSource:
-        tag: int = 447
-        KOREAN_INVESTOR_ID: str = '1'
-        TAIWANESE_QUALIFIED_FOREIGN_INVESTOR_ID_QFII_FID: str = '2'
-        TAIWANESE_TRADING_ACCT: str = '3'
-        MALAYSIAN_CENTRAL_DEPOSITORY: str = '4'
-        CHINESE_INVESTOR_ID: str = '5'
-        UK_NATIONAL_INSURANCE_OR_PENSION_NUMBER: str = '6'
-        US_SOCIAL_SECURITY_NUMBER: str = '7'
-        US_EMPLOYER_OR_TAX_ID_NUMBER: str = '8'
-        AUSTRALIAN_BUSINESS_NUMBER: str = '9'
-        AUSTRALIAN_TAX_FILE_NUMBER: str = 'A'
-        BIC: str = 'B'
-        GENERALLY_ACCEPTED_MARKET_PARTICIPANT_IDENTIFIER: str = 'C'
-        PROPRIETARY: str = 'D'
-        ISO_COUNTRY_CODE: str = 'E'
-        SETTLEMENT_ENTITY_LOCATION: str = 'F'
-        MIC: str = 'G'
-        CSD_PARTICIPANT_MEMBER_CODE: str = 'H'
-        DIRECTED_BROKER_THREE_CHARACTER_ACRONYM_AS_DEFINED_IN_ISITC_ETC_BEST_PRACTICE_GUIDELINES_DOCUMENT: str = 'I'
-
-    # PartyID(448): STRING
-    class PartyID:
-        tag: int = 448
-
-    # TotalVolumeTradedDate(449): UTCDATEONLY
-    class TotalVolumeTradedDate:
-        tag: int = 449
-
-    # TotalVolumeTradedTime(450): UTCTIMEONLY
-    class TotalVolumeTradedTime:
-        tag: int = 450
-
-    # NetChgPrevDay(451): PRICEOFFSET
-    class NetChgPrevDay:
-        tag: int = 451
-
-    # PartyRole(452): INT
-    class PartyRole:
-        tag: int = 452
-        EXECUTING_FIRM: int = 1
-        SETTLEMENT_LOCATION: int = 10
-        ORDER_ORIGINATION_TRADER: int = 11
-        EXECUTING_TRADER: int = 12
-        ORDER_ORIGINATION_FIRM: int = 13
-        GIVEUP_CLEARING_FIRM: int = 14
-        CORRESPONDANT_CLEARING_FIRM: int = 15
-        EXECUTING_SYSTEM: int = 16
-        CONTRA_FIRM: int = 17
-        CONTRA_CLEARING_FIRM: int = 18
-        SPONSORING_FIRM: int = 19
-        BROKER_OF_CREDIT: int = 2
-        UNDERLYING_CONTRA_FIRM: int = 20
-        CLEARING_ORGANIZATION: int = 21
-        EXCHANGE: int = 22
-        CUSTOMER_ACCOUNT: int = 24
-        CORRESPONDENT_CLEARING_ORGANIZATION: int = 25
-        CORRESPONDENT_BROKER: int = 26
-        BUYER_SELLER: int = 27
-        CUSTODIAN: int = 28
-        INTERMEDIARY: int = 29
-        CLIENT_ID: int = 3
-        AGENT: int = 30
-        SUB_CUSTODIAN: int = 31
-        BENEFICIARY: int = 32
-        INTERESTED_PARTY: int = 33
-        REGULATORY_BODY: int = 34
-        LIQUIDITY_PROVIDER: int = 35
-        ENTERING_TRADER: int = 36
-        CONTRA_TRADER: int = 37
-        POSITION_ACCOUNT: int = 38
-        CLEARING_FIRM: int = 4
-        INVESTOR_ID: int = 5
-        INTRODUCING_FIRM: int = 6
-        ENTERING_FIRM: int = 7
-        LOCATE: int = 8
-        FUND_MANAGER_CLIENT_ID: int = 9
-        INTRODUCING_BROKER: int = 60
-        CONTRA_POSITION_ACCOUNT: int = 41
-        CONTRA_EXCHANGE: int = 42
-        INTERNAL_CARRY_ACCOUNT: int = 43
-        ORDER_ENTRY_OPERATOR_ID: int = 44
-        SECONDARY_ACCOUNT_NUMBER: int = 45
-        FORIEGN_FIRM: int = 46
-        THIRD_PARTY_ALLOCATION_FIRM: int = 47
-        CLAIMING_ACCOUNT: int = 48
-        ASSET_MANAGER: int = 49
-        PLEDGOR_ACCOUNT: int = 50
-        PLEDGEE_ACCOUNT: int = 51
-        LARGE_TRADER_REPORTABLE_ACCOUNT: int = 52
-        TRADER_MNEMONIC: int = 53
-        SENDER_LOCATION: int = 54
-        SESSION_ID: int = 55
-        ACCEPTABLE_COUNTERPARTY: int = 56
-        UNACCEPTABLE_COUNTERPARTY: int = 57
-        ENTERING_UNIT: int = 58
-        EXECUTING_UNIT: int = 59
-        CONTRA_INVESTOR_ID: int = 39
-        TRANSFER_TO_FIRM: int = 40
-        QUOTE_ORIGINATOR: int = 61
-        REPORT_ORIGINATOR: int = 62
-        SYSTEMATIC_INTERNALISER: int = 63
-        MULTILATERAL_TRADING_FACILITY: int = 64
-        REGULATED_MARKET: int = 65
-        MARKET_MAKER: int = 66
-        INVESTMENT_FIRM: int = 67
-        HOST_COMPETENT_AUTHORITY: int = 68
-        HOME_COMPETENT_AUTHORITY: int = 69
-        COMPETENT_AUTHORITY_OF_THE_MOST_RELEVANT_MARKET_IN_TERMS_OF_LIQUIDITY: int = 70
-        COMPETENT_AUTHORITY_OF_THE_TRANSACTION: int = 71
-        REPORTING_INTERMEDIARY: int = 72
-        EXECUTION_VENUE: int = 73
-        MARKET_DATA_ENTRY_ORIGINATOR: int = 74
-        LOCATION_ID: int = 75
-        DESK_ID: int = 76
-        MARKET_DATA_MARKET: int = 77
-        ALLOCATION_ENTITY: int = 78
-        PRIME_BROKER_PROVIDING_GENERAL_TRADE_SERVICES: int = 79
-        STEP_OUT_FIRM: int = 80
-        BROKERCLEARINGID: int = 81
-
-    # NoPartyIDs(453): NUMINGROUP
-    class NoPartyIDs:
-        tag: int = 453
-
-    # NoSecurityAltID(454): NUMINGROUP
-    class NoSecurityAltID:
-        tag: int = 454
-
-    # SecurityAltID(455): STRING
-    class SecurityAltID:
-        tag: int = 455
-
-    # SecurityAltIDSource(456): STRING
-    class SecurityAltIDSource:
-        tag: int = 456
-
-    # NoUnderlyingSecurityAltID(457): NUMINGROUP
-    class NoUnderlyingSecurityAltID:
-        tag: int = 457
-
-    # UnderlyingSecurityAltID(458): STRING
-    class UnderlyingSecurityAltID:
-        tag: int = 458
-
-    # UnderlyingSecurityAltIDSource(459): STRING
-    class UnderlyingSecurityAltIDSource:
-        tag: int = 459
-
-    # Product(460): INT
-    class Product:
-        tag: int = 460
-        AGENCY: int = 1
-        MORTGAGE: int = 10
-        MUNICIPAL: int = 11
-        OTHER: int = 12
-        FINANCING: int = 13
-        COMMODITY: int = 2
-        CORPORATE: int = 3
-        CURRENCY: int = 4
-        EQUITY: int = 5
-        GOVERNMENT: int = 6
-        INDEX: int = 7
-        LOAN: int = 8
-        MONEYMARKET: int = 9
-
-    # CFICode(461): STRING
-    class CFICode:
-        tag: int = 461
-
-    # UnderlyingProduct(462): INT
-    class UnderlyingProduct:
-        tag: int = 462
-
-    # UnderlyingCFICode(463): STRING
-    class UnderlyingCFICode:
-        tag: int = 463
-
-    # TestMessageIndicator(464): BOOLEAN
-    class TestMessageIndicator:
-        tag: int = 464
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # QuantityType(465): INT
-    class QuantityType:
-        tag: int = 465
-        SHARES: int = 1
-        BONDS: int = 2
-        CURRENTFACE: int = 3
-        ORIGINALFACE: int = 4
-        CURRENCY: int = 5
-        CONTRACTS: int = 6
-        OTHER: int = 7
-        PAR: int = 8
-
-    # BookingRefID(466): STRING
-    class BookingRefID:
-        tag: int = 466
-
-    # IndividualAllocID(467): STRING
-    class IndividualAllocID:
-        tag: int = 467
-
-    # RoundingDirection(468): CHAR
-    class RoundingDirection:
-        tag: int = 468
-        ROUND_TO_NEAREST: str = '0'
-        ROUND_DOWN: str = '1'
-        ROUND_UP: str = '2'
-
-    # RoundingModulus(469): FLOAT
-    class RoundingModulus:
-        tag: int = 469
-
-    # CountryOfIssue(470): COUNTRY
-    class CountryOfIssue:
-        tag: int = 470
-
-    # StateOrProvinceOfIssue(471): STRING
-    class StateOrProvinceOfIssue:
-        tag: int = 471
-
-    # LocaleOfIssue(472): STRING
-    class LocaleOfIssue:
-        tag: int = 472
-
-    # NoRegistDtls(473): NUMINGROUP
-    class NoRegistDtls:
-        tag: int = 473
-
-    # MailingDtls(474): STRING
-    class MailingDtls:
-        tag: int = 474
-
-    # InvestorCountryOfResidence(475): COUNTRY
-    class InvestorCountryOfResidence:
-        tag: int = 475
-
-    # PaymentRef(476): STRING
-    class PaymentRef:
-        tag: int = 476
-
-    # DistribPaymentMethod(477): INT
-    class DistribPaymentMethod:
-        tag: int = 477
-        CREST: int = 1
-        BPAY: int = 10
-        HIGH_VALUE_CLEARING_SYSTEM_HVACS: int = 11
-        REINVEST_IN_FUND: int = 12
-        NSCC: int = 2
-        EUROCLEAR: int = 3
-        CLEARSTREAM: int = 4
-        CHEQUE: int = 5
-        TELEGRAPHIC_TRANSFER: int = 6
-        FED_WIRE: int = 7
-        DIRECT_CREDIT: int = 8
-        ACH_CREDIT: int = 9
-
-    # CashDistribCurr(478): CURRENCY
-    class CashDistribCurr:
-        tag: int = 478
-
-    # CommCurrency(479): CURRENCY
-    class CommCurrency:
-        tag: int = 479
-
-    # CancellationRights(480): CHAR
-    class CancellationRights:
-        tag: int = 480
-        NO_M: str = 'M'
-        NO_N: str = 'N'
-        NO_O: str = 'O'
-        YES: str = 'Y'
-
-    # MoneyLaunderingStatus(481): CHAR
-    class MoneyLaunderingStatus:
-        tag: int = 481
-        EXEMPT_1: str = '1'
-        EXEMPT_2: str = '2'
-        EXEMPT_3: str = '3'
-        NOT_CHECKED: str = 'N'
-        PASSED: str = 'Y'
-
-    # MailingInst(482): STRING
-    class MailingInst:
-        tag: int = 482
-
-    # TransBkdTime(483): UTCTIMESTAMP
-    class TransBkdTime:
-        tag: int = 483
-
-    # ExecPriceType(484): CHAR
-    class ExecPriceType:
-        tag: int = 484
-        BID_PRICE: str = 'B'
-        CREATION_PRICE: str = 'C'
-        CREATION_PRICE_PLUS_ADJUSTMENT_PERCENT: str = 'D'
-        CREATION_PRICE_PLUS_ADJUSTMENT_AMOUNT: str = 'E'
-        OFFER_PRICE: str = 'O'
-        OFFER_PRICE_MINUS_ADJUSTMENT_PERCENT: str = 'P'
-        OFFER_PRICE_MINUS_ADJUSTMENT_AMOUNT: str = 'Q'
-        SINGLE_PRICE: str = 'S'
-
-    # ExecPriceAdjustment(485): FLOAT
-    class ExecPriceAdjustment:
-        tag: int = 485
-
-    # DateOfBirth(486): LOCALMKTDATE
-    class DateOfBirth:
-        tag: int = 486
-
-    # TradeReportTransType(487): INT
-    class TradeReportTransType:
-        tag: int = 487
-        NEW: int = 0
-        CANCEL: int = 1
-        REPLACE: int = 2
-        RELEASE: int = 3
-        REVERSE: int = 4
-        CANCEL_DUE_TO_BACK_OUT_OF_TRADE: int = 5
-
-    # CardHolderName(488): STRING
-    class CardHolderName:
-        tag: int = 488
-
-    # CardNumber(489): STRING
-    class CardNumber:
-        tag: int = 489
-
-    # CardExpDate(490): LOCALMKTDATE
-    class CardExpDate:
-        tag: int = 490
-
-    # CardIssNum(491): STRING
-    class CardIssNum:
-        tag: int = 491
-
-    # PaymentMethod(492): INT
-    class PaymentMethod:
-        tag: int = 492
-        CREST: int = 1
-        DIRECT_CREDIT: int = 10
-        CREDIT_CARD: int = 11
-        ACH_DEBIT: int = 12
-        ACH_CREDIT: int = 13
-        BPAY: int = 14
-        HIGH_VALUE_CLEARING_SYSTEM: int = 15
-        NSCC: int = 2
-        EUROCLEAR: int = 3
-        CLEARSTREAM: int = 4
-        CHEQUE: int = 5
-        TELEGRAPHIC_TRANSFER: int = 6
-        FED_WIRE: int = 7
-        DEBIT_CARD: int = 8
-        DIRECT_DEBIT: int = 9
-
-    # RegistAcctType(493): STRING
-    class RegistAcctType:
-        tag: int = 493
-
-    # Designation(494): STRING
-    class Designation:
-        tag: int = 494
-
-    # TaxAdvantageType(495): INT
-    class TaxAdvantageType:
-        tag: int = 495
-        NONE_NOT_APPLICABLE: int = 0
-        MAXI_ISA: int = 1
-        EMPLOYEE_10: int = 10
-        EMPLOYER_11: int = 11
-        EMPLOYER_12: int = 12
-        NON_FUND_PROTOTYPE_IRA: int = 13
-        NON_FUND_QUALIFIED_PLAN: int = 14
-        DEFINED_CONTRIBUTION_PLAN: int = 15
-        INDIVIDUAL_RETIREMENT_ACCOUNT_16: int = 16
-        INDIVIDUAL_RETIREMENT_ACCOUNT_17: int = 17
-        KEOGH: int = 18
-        PROFIT_SHARING_PLAN: int = 19
-        TESSA: int = 2
-        _401: int = 20
-        SELF_DIRECTED_IRA: int = 21
-        _403: int = 22
-        _457: int = 23
-        ROTH_IRA_24: int = 24
-        ROTH_IRA_25: int = 25
-        ROTH_CONVERSION_IRA_26: int = 26
-        ROTH_CONVERSION_IRA_27: int = 27
-        EDUCATION_IRA_28: int = 28
-        EDUCATION_IRA_29: int = 29
-        MINI_CASH_ISA: int = 3
-        MINI_STOCKS_AND_SHARES_ISA: int = 4
-        MINI_INSURANCE_ISA: int = 5
-        CURRENT_YEAR_PAYMENT: int = 6
-        PRIOR_YEAR_PAYMENT: int = 7
-        ASSET_TRANSFER: int = 8
-        EMPLOYEE_9: int = 9
-        OTHER: int = 999
-
-    # RegistRejReasonText(496): STRING
-    class RegistRejReasonText:
-        tag: int = 496
-
-    # FundRenewWaiv(497): CHAR
-    class FundRenewWaiv:
-        tag: int = 497
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # CashDistribAgentName(498): STRING
-    class CashDistribAgentName:
-        tag: int = 498
-
-    # CashDistribAgentCode(499): STRING
-    class CashDistribAgentCode:
-        tag: int = 499
-
-    # CashDistribAgentAcctNumber(500): STRING
-    class CashDistribAgentAcctNumber:
-        tag: int = 500
-
-    # CashDistribPayRef(501): STRING
-    class CashDistribPayRef:
-        tag: int = 501
-
-    # CashDistribAgentAcctName(502): STRING
-    class CashDistribAgentAcctName:
-        tag: int = 502
-
-    # CardStartDate(503): LOCALMKTDATE
-    class CardStartDate:
-        tag: int = 503
-
-    # PaymentDate(504): LOCALMKTDATE
-    class PaymentDate:
-        tag: int = 504
-
-    # PaymentRemitterID(505): STRING
-    class PaymentRemitterID:
-        tag: int = 505
-
-    # RegistStatus(506): CHAR
-    class RegistStatus:
-        tag: int = 506
-        ACCEPTED: str = 'A'
-        HELD: str = 'H'
-        REMINDER: str = 'N'
-        REJECTED: str = 'R'
-
-    # RegistRejReasonCode(507): INT
-    class RegistRejReasonCode:
-        tag: int = 507
-        INVALID_UNACCEPTABLE_ACCOUNT_TYPE: int = 1
-        INVALID_UNACEEPTABLE_INVESTOR_ID_SOURCE: int = 10
-        INVALID_UNACCEPTABLE_DATE_OF_BIRTH: int = 11
-        INVALID_UNACCEPTABLE_INVESTOR_COUNTRY_OF_RESIDENCE: int = 12
-        INVALID_UNACCEPTABLE_NO_DISTRIB_INSTNS: int = 13
-        INVALID_UNACCEPTABLE_DISTRIB_PERCENTAGE: int = 14
-        INVALID_UNACCEPTABLE_DISTRIB_PAYMENT_METHOD: int = 15
-        INVALID_UNACCEPTABLE_CASH_DISTRIB_AGENT_ACCT_NAME: int = 16
-        INVALID_UNACCEPTABLE_CASH_DISTRIB_AGENT_CODE: int = 17
-        INVALID_UNACCEPTABLE_CASH_DISTRIB_AGENT_ACCT_NUM: int = 18
-        INVALID_UNACCEPTABLE_TAX_EXEMPT_TYPE: int = 2
-        INVALID_UNACCEPTABLE_OWNERSHIP_TYPE: int = 3
-        INVALID_UNACCEPTABLE_NO_REG_DETAILS: int = 4
-        INVALID_UNACCEPTABLE_REG_SEQ_NO: int = 5
-        INVALID_UNACCEPTABLE_REG_DETAILS: int = 6
-        INVALID_UNACCEPTABLE_MAILING_DETAILS: int = 7
-        INVALID_UNACCEPTABLE_MAILING_INSTRUCTIONS: int = 8
-        INVALID_UNACCEPTABLE_INVESTOR_ID: int = 9
-        OTHER: int = 99
-
-    # RegistRefID(508): STRING
-    class RegistRefID:
-        tag: int = 508
-
-    # RegistDtls(509): STRING
-    class RegistDtls:
-        tag: int = 509
-
-    # NoDistribInsts(510): NUMINGROUP
-    class NoDistribInsts:
-        tag: int = 510
-
-    # RegistEmail(511): STRING
-    class RegistEmail:
-        tag: int = 511
-
-    # DistribPercentage(512): PERCENTAGE
-    class DistribPercentage:
-        tag: int = 512
-
-    # RegistID(513): STRING
-    class RegistID:
-        tag: int = 513
-
-    # RegistTransType(514): CHAR
-    class RegistTransType:
-        tag: int = 514
-        NEW: str = '0'
-        REPLACE: str = '1'
-        CANCEL: str = '2'
-
-    # ExecValuationPoint(515): UTCTIMESTAMP
-    class ExecValuationPoint:
-        tag: int = 515
-
-    # OrderPercent(516): PERCENTAGE
-    class OrderPercent:
-        tag: int = 516
-
-    # OwnershipType(517): CHAR
-    class OwnershipType:
-        tag: int = 517
-        JOINT_TRUSTEES: str = '2'
-        JOINT_INVESTORS: str = 'J'
-        TENANTS_IN_COMMON: str = 'T'
-
-    # NoContAmts(518): NUMINGROUP
-    class NoContAmts:
-        tag: int = 518
-
-    # ContAmtType(519): INT
-    class ContAmtType:
-        tag: int = 519
-        COMMISSION_AMOUNT: int = 1
-        EXIT_CHARGE_PERCENT: int = 10
-        FUND_BASED_RENEWAL_COMMISSION_PERCENT: int = 11
-        PROJECTED_FUND_VALUE: int = 12
-        FUND_BASED_RENEWAL_COMMISSION_AMOUNT_13: int = 13
-        FUND_BASED_RENEWAL_COMMISSION_AMOUNT_14: int = 14
-        NET_SETTLEMENT_AMOUNT: int = 15
-        COMMISSION_PERCENT: int = 2
-        INITIAL_CHARGE_AMOUNT: int = 3
-        INITIAL_CHARGE_PERCENT: int = 4
-        DISCOUNT_AMOUNT: int = 5
-        DISCOUNT_PERCENT: int = 6
-        DILUTION_LEVY_AMOUNT: int = 7
-        DILUTION_LEVY_PERCENT: int = 8
-        EXIT_CHARGE_AMOUNT: int = 9
-
-    # ContAmtValue(520): FLOAT
-    class ContAmtValue:
-        tag: int = 520
-
-    # ContAmtCurr(521): CURRENCY
-    class ContAmtCurr:
-        tag: int = 521
-
-    # OwnerType(522): INT
-    class OwnerType:
-        tag: int = 522
-        INDIVIDUAL_INVESTOR: int = 1
-        NETWORKING_SUB_ACCOUNT: int = 10
-        NON_PROFIT_ORGANIZATION: int = 11
-        CORPORATE_BODY: int = 12
-        NOMINEE: int = 13
-        PUBLIC_COMPANY: int = 2
-        PRIVATE_COMPANY: int = 3
-        INDIVIDUAL_TRUSTEE: int = 4
-        COMPANY_TRUSTEE: int = 5
-        PENSION_PLAN: int = 6
-        CUSTODIAN_UNDER_GIFTS_TO_MINORS_ACT: int = 7
-        TRUSTS: int = 8
-        FIDUCIARIES: int = 9
-
-    # PartySubID(523): STRING
-    class PartySubID:
-        tag: int = 523
-
-    # NestedPartyID(524): STRING
-    class NestedPartyID:
-        tag: int = 524
-
-    # NestedPartyIDSource(525): CHAR
-    class NestedPartyIDSource:
-        tag: int = 525
-
-    # SecondaryClOrdID(526): STRING
-    class SecondaryClOrdID:
-        tag: int = 526
-
-    # SecondaryExecID(527): STRING
-    class SecondaryExecID:
-        tag: int = 527
-
-    # OrderCapacity(528): CHAR
-    class OrderCapacity:
-        tag: int = 528
-        AGENCY: str = 'A'
-        PROPRIETARY: str = 'G'
-        INDIVIDUAL: str = 'I'
-        PRINCIPAL: str = 'P'
-        RISKLESS_PRINCIPAL: str = 'R'
-        AGENT_FOR_OTHER_MEMBER: str = 'W'
-
-    # OrderRestrictions(529): MULTIPLECHARVALUE
-    class OrderRestrictions:
-        tag: int = 529
-        PROGRAM_TRADE: str = "1"
-        INDEX_ARBITRAGE: str = "2"
-        NON_INDEX_ARBITRAGE: str = "3"
-        COMPETING_MARKET_MAKER: str = "4"
-        ACTING_AS_MARKET_MAKER_OR_SPECIALIST_IN_THE_SECURITY: str = "5"
-        ACTING_AS_MARKET_MAKER_OF_SPECIALIST_IN_THE_UNDERLYING_SECURITY_OF_A_DERIVATIVE_SEUCIRTY: str = "6"
-        FOREIGN_ENTITY: str = "7"
-        EXTERNAL_MARKET_PARTICIPANT: str = "8"
-        EXTNERAL_INTER_CONNECTED_MARKET_LINKAGE: str = "9"
-        RISKLESS_ARBITRAGE: str = "A"
-        ISSUER_HOLDING: str = "B"
-        ISSUE_PRICE_STABILIZATION: str = "C"
-        NON_ALGORITHMIC: str = "D"
-        ALGORITHMIC: str = "E"
-
-    # MassCancelRequestType(530): CHAR
-    class MassCancelRequestType:
-        tag: int = 530
-        CANCEL_ORDERS_FOR_A_SECURITY: str = '1'
-        CANCEL_ORDERS_FOR_AN_UNDERLYING_SECURITY: str = '2'
-        CANCEL_ORDERS_FOR_A_PRODUCT: str = '3'
-        CANCEL_ORDERS_FOR_A_CFICODE: str = '4'
-        CANCEL_ORDERS_FOR_A_SECURITYTYPE: str = '5'
-        CANCEL_ORDERS_FOR_A_TRADING_SESSION: str = '6'
-        CANCEL_ALL_ORDERS: str = '7'
-        CANCEL_ORDERS_FOR_A_MARKET: str = '8'
-        CANCEL_ORDERS_FOR_A_MARKET_SEGMENT: str = '9'
-        CANCEL_ORDERS_FOR_A_SECURITY_GROUP: str = 'A'
-
-    # MassCancelResponse(531): CHAR
-    class MassCancelResponse:
-        tag: int = 531
-        CANCEL_REQUEST_REJECTED: str = '0'
-        CANCEL_ORDERS_FOR_A_SECURITY: str = '1'
-        CANCEL_ORDERS_FOR_AN_UNDERLYING_SECURITY: str = '2'
-        CANCEL_ORDERS_FOR_A_PRODUCT: str = '3'
-        CANCEL_ORDERS_FOR_A_CFICODE: str = '4'
-        CANCEL_ORDERS_FOR_A_SECURITYTYPE: str = '5'
-        CANCEL_ORDERS_FOR_A_TRADING_SESSION: str = '6'
-        CANCEL_ALL_ORDERS: str = '7'
-        CANCEL_ORDERS_FOR_A_MARKET: str = '8'
-        CANCEL_ORDERS_FOR_A_MARKET_SEGMENT: str = '9'
-        CANCEL_ORDERS_FOR_A_SECURITY_GROUP: str = 'A'
-
-    # MassCancelRejectReason(532): INT
-    class MassCancelRejectReason:
-        tag: int = 532
-        MASS_CANCEL_NOT_SUPPORTED: int = 0
-        INVALID_OR_UNKNOWN_SECURITY: int = 1
-        INVALID_OR_UNKOWN_UNDERLYING_SECURITY: int = 2
-        INVALID_OR_UNKNOWN_PRODUCT: int = 3
-        INVALID_OR_UNKNOWN_CFICODE: int = 4
-        INVALID_OR_UNKNOWN_SECURITYTYPE: int = 5
-        INVALID_OR_UNKNOWN_TRADING_SESSION: int = 6
-        OTHER: int = 99
-        INVALID_OR_UNKNOWN_MARKET: int = 7
-        INVALID_OR_UNKOWN_MARKET_SEGMENT: int = 8
-        INVALID_OR_UNKNOWN_SECURITY_GROUP: int = 9
-
-    # TotalAffectedOrders(533): INT
-    class TotalAffectedOrders:
-        tag: int = 533
-
-    # NoAffectedOrders(534): NUMINGROUP
-    class NoAffectedOrders:
-        tag: int = 534
-
-    # AffectedOrderID(535): STRING
-    class AffectedOrderID:
-        tag: int = 535
-
-    # AffectedSecondaryOrderID(536): STRING
-    class AffectedSecondaryOrderID:
-        tag: int = 536
-
-    # QuoteType(537): INT
-    class QuoteType:
-        tag: int = 537
-        INDICATIVE: int = 0
-        TRADEABLE: int = 1
-        RESTRICTED_TRADEABLE: int = 2
-        COUNTER: int = 3
-
-    # NestedPartyRole(538): INT
-    class NestedPartyRole:
-        tag: int = 538
-
-    # NoNestedPartyIDs(539): NUMINGROUP
-    class NoNestedPartyIDs:
-        tag: int = 539
-
-    # TotalAccruedInterestAmt(540): AMT
-    class TotalAccruedInterestAmt:
-        tag: int = 540
-
-    # MaturityDate(541): LOCALMKTDATE
-    class MaturityDate:
-        tag: int = 541
-
-    # UnderlyingMaturityDate(542): LOCALMKTDATE
-    class UnderlyingMaturityDate:
-        tag: int = 542
-
-    # InstrRegistry(543): STRING
-    class InstrRegistry:
-        tag: int = 543
-
-    # CashMargin(544): CHAR
-    class CashMargin:
-        tag: int = 544
-        CASH: str = '1'
-        MARGIN_OPEN: str = '2'
-        MARGIN_CLOSE: str = '3'
-
-    # NestedPartySubID(545): STRING
-    class NestedPartySubID:
-        tag: int = 545
-
-    # Scope(546): MULTIPLECHARVALUE
-    class Scope:
-        tag: int = 546
-        LOCAL_MARKET: str = "1"
-        NATIONAL: str = "2"
-        GLOBAL: str = "3"
-
-    # MDImplicitDelete(547): BOOLEAN
-    class MDImplicitDelete:
-        tag: int = 547
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # CrossID(548): STRING
-    class CrossID:
-        tag: int = 548
-
-    # CrossType(549): INT
-    class CrossType:
-        tag: int = 549
-        CROSS_AON: int = 1
-        CROSS_IOC: int = 2
-        CROSS_ONE_SIDE: int = 3
-        CROSS_SAME_PRICE: int = 4
-
-    # CrossPrioritization(550): INT
-    class CrossPrioritization:
-        tag: int = 550
-        NONE: int = 0
-        BUY_SIDE_IS_PRIORITIZED: int = 1
-        SELL_SIDE_IS_PRIORITIZED: int = 2
-
-    # OrigCrossID(551): STRING
-    class OrigCrossID:
-        tag: int = 551
-
-    # NoSides(552): NUMINGROUP
-    class NoSides:
-        tag: int = 552
-        ONE_SIDE: str = "1"
-        BOTH_SIDES: str = "2"
-
-    # Username(553): STRING
-    class Username:
-        tag: int = 553
-
-    # Password(554): STRING
-    class Password:
-        tag: int = 554
-
-    # NoLegs(555): NUMINGROUP
-    class NoLegs:
-        tag: int = 555
-
-    # LegCurrency(556): CURRENCY
-    class LegCurrency:
-        tag: int = 556
-
-    # TotNoSecurityTypes(557): INT
-    class TotNoSecurityTypes:
-        tag: int = 557
-
-    # NoSecurityTypes(558): NUMINGROUP
-    class NoSecurityTypes:
-        tag: int = 558
-
-    # SecurityListRequestType(559): INT
-    class SecurityListRequestType:
-        tag: int = 559
-        SYMBOL: int = 0
-        SECURITYTYPE_AND_OR_CFICODE: int = 1
-        PRODUCT: int = 2
-        TRADINGSESSIONID: int = 3
-        ALL_SECURITIES: int = 4
-        MARKETID_OR_MARKETID_PLUS_MARKETSEGMENTID: int = 5
-
-    # SecurityRequestResult(560): INT
-    class SecurityRequestResult:
-        tag: int = 560
-        VALID_REQUEST: int = 0
-        INVALID_OR_UNSUPPORTED_REQUEST: int = 1
-        NO_INSTRUMENTS_FOUND_THAT_MATCH_SELECTION_CRITERIA: int = 2
-        NOT_AUTHORIZED_TO_RETRIEVE_INSTRUMENT_DATA: int = 3
-        INSTRUMENT_DATA_TEMPORARILY_UNAVAILABLE: int = 4
-        REQUEST_FOR_INSTRUMENT_DATA_NOT_SUPPORTED: int = 5
-
-    # RoundLot(561): QTY
-    class RoundLot:
-        tag: int = 561
-
-    # MinTradeVol(562): QTY
-    class MinTradeVol:
-        tag: int = 562
-
-    # MultiLegRptTypeReq(563): INT
-    class MultiLegRptTypeReq:
-        tag: int = 563
-        REPORT_BY_MULITLEG_SECURITY_ONLY: int = 0
-        REPORT_BY_MULTILEG_SECURITY_AND_BY_INSTRUMENT_LEGS_BELONGING_TO_THE_MULTILEG_SECURITY: int = 1
-        REPORT_BY_INSTRUMENT_LEGS_BELONGING_TO_THE_MULTILEG_SECURITY_ONLY: int = 2
-
-    # LegPositionEffect(564): CHAR
-    class LegPositionEffect:
-        tag: int = 564
-
-    # LegCoveredOrUncovered(565): INT
-    class LegCoveredOrUncovered:
-        tag: int = 565
-
-    # LegPrice(566): PRICE
-    class LegPrice:
-        tag: int = 566
-
-    # TradSesStatusRejReason(567): INT
-    class TradSesStatusRejReason:
-        tag: int = 567
-        UNKNOWN_OR_INVALID_TRADINGSESSIONID: int = 1
-        OTHER: int = 99
-
-    # TradeRequestID(568): STRING
-    class TradeRequestID:
-        tag: int = 568
-
-    # TradeRequestType(569): INT
-    class TradeRequestType:
-        tag: int = 569
-        ALL_TRADES: int = 0
-        MATCHED_TRADES_MATCHING_CRITERIA_PROVIDED_ON_REQUEST: int = 1
-        UNMATCHED_TRADES_THAT_MATCH_CRITERIA: int = 2
-        UNREPORTED_TRADES_THAT_MATCH_CRITERIA: int = 3
-        ADVISORIES_THAT_MATCH_CRITERIA: int = 4
-
-    # PreviouslyReported(570): BOOLEAN
-    class PreviouslyReported:
-        tag: int = 570
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # TradeReportID(571): STRING
-    class TradeReportID:
-        tag: int = 571
-
-    # TradeReportRefID(572): STRING
-    class TradeReportRefID:
-        tag: int = 572
-
-    # MatchStatus(573): CHAR
-    class MatchStatus:
-        tag: int = 573
-        COMPARED_MATCHED_OR_AFFIRMED: str = '0'
-        UNCOMPARED_UNMATCHED_OR_UNAFFIRED: str = '1'
-        ADVISORY_OR_ALERT: str = '2'
-
-    # MatchType(574): STRING
-    class MatchType:
-        tag: int = 574
-        EXACT_MATCH_ON_TRADE_DATE_STOCK_SYMBOL_QUANTITY_PRICE_TRADE_TYPE_AND_SPECIAL_TRADE_INDICATOR_PLUS_FOUR_BADGES_AND_EXECUTION_TIME: str = "A1"
-        EXACT_MATCH_ON_TRADE_DATE_STOCK_SYMBOL_QUANTITY_PRICE_TRADE_TYPE_AND_SPECIAL_TRADE_INDICATOR_PLUS_FOUR_BADGES: str = "A2"
-        EXACT_MATCH_ON_TRADE_DATE_STOCK_SYMBOL_QUANTITY_PRICE_TRADE_TYPE_AND_SPECIAL_TRADE_INDICATOR_PLUS_TWO_BADGES_AND_EXECUTION_TIME: str = "A3"
-        EXACT_MATCH_ON_TRADE_DATE_STOCK_SYMBOL_QUANTITY_PRICE_TRADE_TYPE_AND_SPECIAL_TRADE_INDICATOR_PLUS_TWO_BADGES: str = "A4"
-        EXACT_MATCH_ON_TRADE_DATE_STOCK_SYMBOL_QUANTITY_PRICE_TRADETYPE_AND_SPECIAL_TRADE_INDICATOR_PLUS_EXECUTION_TIME: str = "A5"
-        ACT_ACCEPTED_TRADE: str = "M3"
-        ACT_DEFAULT_TRADE: str = "M4"
-        ACT_DEFAULT_AFTER_M2: str = "M5"
-        ACT_M6_MATCH: str = "M6"
-        COMPARED_RECORDS_RESULTING_FROM_STAMPED_ADVISORIES_OR_SPECIALIST_ACCEPTS_PAIR_OFFS: str = "AQ"
-        EXACT_MATCH_ON_TRADE_DATE_STOCK_SYMBOL_QUANTITY_PRICE_TRADE_TYPE_AND_SPECIAL_TRADE_INDICATOR_MINUS_BADGES_AND_TIMES_ACT_M1_MATCH: str = "M1"
-        SUMMARIZED_MATCH_MINUS_BADGES_AND_TIMES_ACT_M2_MATCH: str = "M2"
-        OCS_LOCKED_IN_NON_ACT: str = "MT"
-        SUMMARIZED_MATCH_USING_A1_EXACT_MATCH_CRITERIA_EXCEPT_QUANTITY_IS_SUMMARIED: str = "S1"
-        SUMMARIZED_MATCH_USING_A2_EXACT_MATCH_CRITERIA_EXCEPT_QUANTITY_IS_SUMMARIZED: str = "S2"
-        SUMMARIZED_MATCH_USING_A3_EXACT_MATCH_CRITERIA_EXCEPT_QUANTITY_IS_SUMMARIZED: str = "S3"
-        SUMMARIZED_MATCH_USING_A4_EXACT_MATCH_CRITERIA_EXCEPT_QUANTITY_IS_SUMMARIZED: str = "S4"
-        SUMMARIZED_MATCH_USING_A5_EXACT_MATCH_CRITERIA_EXCEPT_QUANTITY_IS_SUMMARIZED: str = "S5"
-        ONE_PARTY_TRADE_REPORT: str = "1"
-        TWO_PARTY_TRADE_REPORT: str = "2"
-        CONFIRMED_TRADE_REPORT: str = "3"
-        AUTO_MATCH: str = "4"
-        CROSS_AUCTION: str = "5"
-        COUNTER_ORDER_SELECTION: str = "6"
-        CALL_AUCTION: str = "7"
-        ISSUING_BUY_BACK_AUCTION: str = "8"
-
-    # OddLot(575): BOOLEAN
-    class OddLot:
-        tag: int = 575
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # NoClearingInstructions(576): NUMINGROUP
-    class NoClearingInstructions:
-        tag: int = 576
-
-    # ClearingInstruction(577): INT
-    class ClearingInstruction:
-        tag: int = 577
-        PROCESS_NORMALLY: int = 0
-        EXCLUDE_FROM_ALL_NETTING: int = 1
-        AUTOMATIC_GIVE_UP_MODE: int = 10
-        QUALIFIED_SERVICE_REPRESENTATIVE_QSR: int = 11
-        CUSTOMER_TRADE: int = 12
-        SELF_CLEARING: int = 13
-        BILATERAL_NETTING_ONLY: int = 2
-        EX_CLEARING: int = 3
-        SPECIAL_TRADE: int = 4
-        MULTILATERAL_NETTING: int = 5
-        CLEAR_AGAINST_CENTRAL_COUNTERPARTY: int = 6
-        EXCLUDE_FROM_CENTRAL_COUNTERPARTY: int = 7
-        MANUAL_MODE: int = 8
-        AUTOMATIC_POSTING_MODE: int = 9
-
-    # TradeInputSource(578): STRING
-    class TradeInputSource:
-        tag: int = 578
-
-    # TradeInputDevice(579): STRING
-    class TradeInputDevice:
-        tag: int = 579
-
-    # NoDates(580): INT
-    class NoDates:
-        tag: int = 580
-
-    # AccountType(581): INT
-    class AccountType:
-        tag: int = 581
-        ACCOUNT_IS_CARRIED_ON_CUSTOMER_SIDE_OF_THE_BOOKS: int = 1
-        ACCOUNT_IS_CARRIED_ON_NON_CUSTOMER_SIDE_OF_BOOKS: int = 2
-        HOUSE_TRADER: int = 3
-        FLOOR_TRADER: int = 4
-        ACCOUNT_IS_CARRIED_ON_NON_CUSTOMER_SIDE_OF_BOOKS_AND_IS_CROSS_MARGINED: int = 6
-        ACCOUNT_IS_HOUSE_TRADER_AND_IS_CROSS_MARGINED: int = 7
-        JOINT_BACK_OFFICE_ACCOUNT: int = 8
-
-    # CustOrderCapacity(582): INT
-    class CustOrderCapacity:
-        tag: int = 582
-        MEMBER_TRADING_FOR_THEIR_OWN_ACCOUNT: int = 1
-        CLEARING_FIRM_TRADING_FOR_ITS_PROPRIETARY_ACCOUNT: int = 2
-        MEMBER_TRADING_FOR_ANOTHER_MEMBER: int = 3
-        ALL_OTHER: int = 4
-
-    # ClOrdLinkID(583): STRING
-    class ClOrdLinkID:
-        tag: int = 583
-
-    # MassStatusReqID(584): STRING
-    class MassStatusReqID:
-        tag: int = 584
-
-    # MassStatusReqType(585): INT
-    class MassStatusReqType:
-        tag: int = 585
-        STATUS_FOR_ORDERS_FOR_A_SECURITY: int = 1
-        STATUS_FOR_ORDERS_FOR_AN_UNDERLYING_SECURITY: int = 2
-        STATUS_FOR_ORDERS_FOR_A_PRODUCT: int = 3
-        STATUS_FOR_ORDERS_FOR_A_CFICODE: int = 4
-        STATUS_FOR_ORDERS_FOR_A_SECURITYTYPE: int = 5
-        STATUS_FOR_ORDERS_FOR_A_TRADING_SESSION: int = 6
-        STATUS_FOR_ALL_ORDERS: int = 7
-        STATUS_FOR_ORDERS_FOR_A_PARTYID: int = 8
-
-    # OrigOrdModTime(586): UTCTIMESTAMP
-    class OrigOrdModTime:
-        tag: int = 586
-
-    # LegSettlType(587): CHAR
-    class LegSettlType:
-        tag: int = 587
-
-    # LegSettlDate(588): LOCALMKTDATE
-    class LegSettlDate:
-        tag: int = 588
-
-    # DayBookingInst(589): CHAR
-    class DayBookingInst:
-        tag: int = 589
-        CAN_TRIGGER_BOOKING_WITHOUT_REFERENCE_TO_THE_ORDER_INITIATOR: str = '0'
-        SPEAK_WITH_ORDER_INITIATOR_BEFORE_BOOKING: str = '1'
-        ACCUMULATE: str = '2'
-
-    # BookingUnit(590): CHAR
-    class BookingUnit:
-        tag: int = 590
-        EACH_PARTIAL_EXECUTION_IS_A_BOOKABLE_UNIT: str = '0'
-        AGGREGATE_PARTIAL_EXECUTIONS_ON_THIS_ORDER_AND_BOOK_ONE_TRADE_PER_ORDER: str = '1'
-        AGGREGATE_EXECUTIONS_FOR_THIS_SYMBOL_SIDE_AND_SETTLEMENT_DATE: str = '2'
-
-    # PreallocMethod(591): CHAR
-    class PreallocMethod:
-        tag: int = 591
-        PRO_RATA: str = '0'
-        DO_NOT_PRO_RATA: str = '1'
-
-    # UnderlyingCountryOfIssue(592): COUNTRY
-    class UnderlyingCountryOfIssue:
-        tag: int = 592
-
-    # UnderlyingStateOrProvinceOfIssue(593): STRING
-    class UnderlyingStateOrProvinceOfIssue:
-        tag: int = 593
-
-    # UnderlyingLocaleOfIssue(594): STRING
-    class UnderlyingLocaleOfIssue:
-        tag: int = 594
-
-    # UnderlyingInstrRegistry(595): STRING
-    class UnderlyingInstrRegistry:
-        tag: int = 595
-
-    # LegCountryOfIssue(596): COUNTRY
-    class LegCountryOfIssue:
-        tag: int = 596
-
-    # LegStateOrProvinceOfIssue(597): STRING
-    class LegStateOrProvinceOfIssue:
-        tag: int = 597
-
-    # LegLocaleOfIssue(598): STRING
-    class LegLocaleOfIssue:
-        tag: int = 598
-
-    # LegInstrRegistry(599): STRING
-    class LegInstrRegistry:
-        tag: int = 599
-
-    # LegSymbol(600): STRING
-    class LegSymbol:
-        tag: int = 600
-
-    # LegSymbolSfx(601): STRING
-    class LegSymbolSfx:
-        tag: int = 601
-
-    # LegSecurityID(602): STRING
-    class LegSecurityID:
-        tag: int = 602
-
-    # LegSecurityIDSource(603): STRING
-    class LegSecurityIDSource:
-        tag: int = 603
-
-    # NoLegSecurityAltID(604): STRING
-    class NoLegSecurityAltID:
-        tag: int = 604
-
-    # LegSecurityAltID(605): STRING
-    class LegSecurityAltID:
-        tag: int = 605
-
-    # LegSecurityAltIDSource(606): STRING
-    class LegSecurityAltIDSource:
-        tag: int = 606
-
-    # LegProduct(607): INT
-    class LegProduct:
-        tag: int = 607
-
-    # LegCFICode(608): STRING
-    class LegCFICode:
-        tag: int = 608
-
-    # LegSecurityType(609): STRING
-    class LegSecurityType:
-        tag: int = 609
-
-    # LegMaturityMonthYear(610): MONTHYEAR
-    class LegMaturityMonthYear:
-        tag: int = 610
-
-    # LegMaturityDate(611): LOCALMKTDATE
-    class LegMaturityDate:
-        tag: int = 611
-
-    # LegStrikePrice(612): PRICE
-    class LegStrikePrice:
-        tag: int = 612
-
-    # LegOptAttribute(613): CHAR
-    class LegOptAttribute:
-        tag: int = 613
-
-    # LegContractMultiplier(614): FLOAT
-    class LegContractMultiplier:
-        tag: int = 614
-
-    # LegCouponRate(615): PERCENTAGE
-    class LegCouponRate:
-        tag: int = 615
-
-    # LegSecurityExchange(616): EXCHANGE
-    class LegSecurityExchange:
-        tag: int = 616
-
-    # LegIssuer(617): STRING
-    class LegIssuer:
-        tag: int = 617
-
-    # EncodedLegIssuerLen(618): LENGTH
-    class EncodedLegIssuerLen:
-        tag: int = 618
-
-    # EncodedLegIssuer(619): DATA
-    class EncodedLegIssuer:
-        tag: int = 619
-
-    # LegSecurityDesc(620): STRING
-    class LegSecurityDesc:
-        tag: int = 620
-
-    # EncodedLegSecurityDescLen(621): LENGTH
-    class EncodedLegSecurityDescLen:
-        tag: int = 621
-
-    # EncodedLegSecurityDesc(622): DATA
-    class EncodedLegSecurityDesc:
-        tag: int = 622
-
-    # LegRatioQty(623): FLOAT
-    class LegRatioQty:
-        tag: int = 623
-
-    # LegSide(624): CHAR
-    class LegSide:
-        tag: int = 624
-
-    # TradingSessionSubID(625): STRING
-    class TradingSessionSubID:
-        tag: int = 625
-        PRE_TRADING: str = "1"
-        OPENING_OR_OPENING_AUCTION: str = "2"
-        _3: str = "3"
-        CLOSING_OR_CLOSING_AUCTION: str = "4"
-        POST_TRADING: str = "5"
-        INTRADAY_AUCTION: str = "6"
-        QUIESCENT: str = "7"
-
-    # AllocType(626): INT
-    class AllocType:
-        tag: int = 626
-        CALCULATED: int = 1
-        PRELIMINARY: int = 2
-        SELLSIDE_CALCULATED_USING_PRELIMINARY: int = 3
-        SELLSIDE_CALCULATED_WITHOUT_PRELIMINARY: int = 4
-        READY_TO_BOOK: int = 5
-        BUYSIDE_READY_TO_BOOK: int = 6
-        WAREHOUSE_INSTRUCTION: int = 7
-        REQUEST_TO_INTERMEDIARY: int = 8
-        ACCEPT: int = 9
-        REJECT: int = 10
-        ACCEPT_PENDING: int = 11
-        INCOMPLETE_GROUP: int = 12
-        COMPLETE_GROUP: int = 13
-        REVERSAL_PENDING: int = 14
-
-    # NoHops(627): NUMINGROUP
-    class NoHops:
-        tag: int = 627
-
-    # HopCompID(628): STRING
-    class HopCompID:
-        tag: int = 628
-
-    # HopSendingTime(629): UTCTIMESTAMP
-    class HopSendingTime:
-        tag: int = 629
-
-    # HopRefID(630): SEQNUM
-    class HopRefID:
-        tag: int = 630
-
-    # MidPx(631): PRICE
-    class MidPx:
-        tag: int = 631
-
-    # BidYield(632): PERCENTAGE
-    class BidYield:
-        tag: int = 632
-
-    # MidYield(633): PERCENTAGE
-    class MidYield:
-        tag: int = 633
-
-    # OfferYield(634): PERCENTAGE
-    class OfferYield:
-        tag: int = 634
-
-    # ClearingFeeIndicator(635): STRING
-    class ClearingFeeIndicator:
-        tag: int = 635
-        _1ST_YEAR_DELEGATE_TRADING_FOR_OWN_ACCOUNT: str = "1"
-        _2ND_YEAR_DELEGATE_TRADING_FOR_OWN_ACCOUNT: str = "2"
-        _3RD_YEAR_DELEGATE_TRADING_FOR_OWN_ACCOUNT: str = "3"
-        _4TH_YEAR_DELEGATE_TRADING_FOR_OWN_ACCOUNT: str = "4"
-        _5TH_YEAR_DELEGATE_TRADING_FOR_OWN_ACCOUNT: str = "5"
-        _6TH_YEAR_DELEGATE_TRADING_FOR_OWN_ACCOUNT: str = "9"
-        CBOE_MEMBER: str = "B"
-        NON_MEMBER_AND_CUSTOMER: str = "C"
-        EQUITY_MEMBER_AND_CLEARING_MEMBER: str = "E"
-        FULL_AND_ASSOCIATE_MEMBER_TRADING_FOR_OWN_ACCOUNT_AND_AS_FLOOR_BROKERS: str = "F"
-        _106H_AND_106J_FIRMS: str = "H"
-        GIM_IDEM_AND_COM_MEMBERSHIP_INTEREST_HOLDERS: str = "I"
-        LESSEE_106F_EMPLOYEES: str = "L"
-        ALL_OTHER_OWNERSHIP_TYPES: str = "M"
-
-    # WorkingIndicator(636): BOOLEAN
-    class WorkingIndicator:
-        tag: int = 636
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # LegLastPx(637): PRICE
-    class LegLastPx:
-        tag: int = 637
-
-    # PriorityIndicator(638): INT
-    class PriorityIndicator:
-        tag: int = 638
-        PRIORITY_UNCHANGED: int = 0
-        LOST_PRIORITY_AS_RESULT_OF_ORDER_CHANGE: int = 1
-
-    # PriceImprovement(639): PRICEOFFSET
-    class PriceImprovement:
-        tag: int = 639
-
-    # Price2(640): PRICE
-    class Price2:
-        tag: int = 640
-
-    # LastForwardPoints2(641): PRICEOFFSET
-    class LastForwardPoints2:
-        tag: int = 641
-
-    # BidForwardPoints2(642): PRICEOFFSET
-    class BidForwardPoints2:
-        tag: int = 642
-
-    # OfferForwardPoints2(643): PRICEOFFSET
-    class OfferForwardPoints2:
-        tag: int = 643
-
-    # RFQReqID(644): STRING
-    class RFQReqID:
-        tag: int = 644
-
-    # MktBidPx(645): PRICE
-    class MktBidPx:
-        tag: int = 645
-
-    # MktOfferPx(646): PRICE
-    class MktOfferPx:
-        tag: int = 646
-
-    # MinBidSize(647): QTY
-    class MinBidSize:
-        tag: int = 647
-
-    # MinOfferSize(648): QTY
-    class MinOfferSize:
-        tag: int = 648
-
-    # QuoteStatusReqID(649): STRING
-    class QuoteStatusReqID:
-        tag: int = 649
-
-    # LegalConfirm(650): BOOLEAN
-    class LegalConfirm:
-        tag: int = 650
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # UnderlyingLastPx(651): PRICE
-    class UnderlyingLastPx:
-        tag: int = 651
-
-    # UnderlyingLastQty(652): QTY
-    class UnderlyingLastQty:
-        tag: int = 652
-
-    # SecDefStatus(653): INT
-    class SecDefStatus:
-        tag: int = 653
-        PENDING_APPROVAL: int = 0
-        APPROVED: int = 1
-        REJECTED: int = 2
-        UNAUTHORIZED_REQUEST: int = 3
-        INVALID_DEFINITION_REQUEST: int = 4
-
-    # LegRefID(654): STRING
-    class LegRefID:
-        tag: int = 654
-
-    # ContraLegRefID(655): STRING
-    class ContraLegRefID:
-        tag: int = 655
-
-    # SettlCurrBidFxRate(656): FLOAT
-    class SettlCurrBidFxRate:
-        tag: int = 656
-
-    # SettlCurrOfferFxRate(657): FLOAT
-    class SettlCurrOfferFxRate:
-        tag: int = 657
-
-    # QuoteRequestRejectReason(658): INT
-    class QuoteRequestRejectReason:
-        tag: int = 658
-        UNKNOWN_SYMBOL: int = 1
-        PASS: int = 10
-        EXCHANGE: int = 2
-        QUOTE_REQUEST_EXCEEDS_LIMIT: int = 3
-        TOO_LATE_TO_ENTER: int = 4
-        INVALID_PRICE: int = 5
-        NOT_AUTHORIZED_TO_REQUEST_QUOTE: int = 6
-        NO_MATCH_FOR_INQUIRY: int = 7
-        NO_MARKET_FOR_INSTRUMENT: int = 8
-        NO_INVENTORY: int = 9
-        OTHER: int = 99
-        INSUFFICIENT_CREDIT: int = 11
-
-    # SideComplianceID(659): STRING
-    class SideComplianceID:
-        tag: int = 659
-
-    # AcctIDSource(660): INT
-    class AcctIDSource:
-        tag: int = 660
-        BIC: int = 1
-        SID_CODE: int = 2
-        TFM: int = 3
-        OMGEO: int = 4
-        DTCC_CODE: int = 5
-        OTHER: int = 99
-
-    # AllocAcctIDSource(661): INT
-    class AllocAcctIDSource:
-        tag: int = 661
-
-    # BenchmarkPrice(662): PRICE
-    class BenchmarkPrice:
-        tag: int = 662
-
-    # BenchmarkPriceType(663): INT
-    class BenchmarkPriceType:
-        tag: int = 663
-
-    # ConfirmID(664): STRING
-    class ConfirmID:
-        tag: int = 664
-
-    # ConfirmStatus(665): INT
-    class ConfirmStatus:
-        tag: int = 665
-        RECEIVED: int = 1
-        MISMATCHED_ACCOUNT: int = 2
-        MISSING_SETTLEMENT_INSTRUCTIONS: int = 3
-        CONFIRMED: int = 4
-        REQUEST_REJECTED: int = 5
-
-    # ConfirmTransType(666): INT
-    class ConfirmTransType:
-        tag: int = 666
-        NEW: int = 0
-        REPLACE: int = 1
-        CANCEL: int = 2
-
-    # ContractSettlMonth(667): MONTHYEAR
-    class ContractSettlMonth:
-        tag: int = 667
-
-    # DeliveryForm(668): INT
-    class DeliveryForm:
-        tag: int = 668
-        BOOK_ENTRY: int = 1
-        BEARER: int = 2
-
-    # LastParPx(669): PRICE
-    class LastParPx:
-        tag: int = 669
-
-    # NoLegAllocs(670): NUMINGROUP
-    class NoLegAllocs:
-        tag: int = 670
-
-    # LegAllocAccount(671): STRING
-    class LegAllocAccount:
-        tag: int = 671
-
-    # LegIndividualAllocID(672): STRING
-    class LegIndividualAllocID:
-        tag: int = 672
-
-    # LegAllocQty(673): QTY
-    class LegAllocQty:
-        tag: int = 673
-
-    # LegAllocAcctIDSource(674): STRING
-    class LegAllocAcctIDSource:
-        tag: int = 674
-
-    # LegSettlCurrency(675): CURRENCY
-    class LegSettlCurrency:
-        tag: int = 675
-
-    # LegBenchmarkCurveCurrency(676): CURRENCY
-    class LegBenchmarkCurveCurrency:
-        tag: int = 676
-
-    # LegBenchmarkCurveName(677): STRING
-    class LegBenchmarkCurveName:
-        tag: int = 677
-
-    # LegBenchmarkCurvePoint(678): STRING
-    class LegBenchmarkCurvePoint:
-        tag: int = 678
-
-    # LegBenchmarkPrice(679): PRICE
-    class LegBenchmarkPrice:
-        tag: int = 679
-
-    # LegBenchmarkPriceType(680): INT
-    class LegBenchmarkPriceType:
-        tag: int = 680
-
-    # LegBidPx(681): PRICE
-    class LegBidPx:
-        tag: int = 681
-
-    # LegIOIQty(682): STRING
-    class LegIOIQty:
-        tag: int = 682
-
-    # NoLegStipulations(683): NUMINGROUP
-    class NoLegStipulations:
-        tag: int = 683
-
-    # LegOfferPx(684): PRICE
-    class LegOfferPx:
-        tag: int = 684
-
-    # LegOrderQty(685): QTY
-    class LegOrderQty:
-        tag: int = 685
-
-    # LegPriceType(686): INT
-    class LegPriceType:
-        tag: int = 686
-
-    # LegQty(687): QTY
-    class LegQty:
-        tag: int = 687
-
-    # LegStipulationType(688): STRING
-    class LegStipulationType:
-        tag: int = 688
-
-    # LegStipulationValue(689): STRING
-    class LegStipulationValue:
-        tag: int = 689
-
-    # LegSwapType(690): INT
-    class LegSwapType:
-        tag: int = 690
-        PAR_FOR_PAR: int = 1
-        MODIFIED_DURATION: int = 2
-        RISK: int = 4
-        PROCEEDS: int = 5
-
-    # Pool(691): STRING
-    class Pool:
-        tag: int = 691
-
-    # QuotePriceType(692): INT
-    class QuotePriceType:
-        tag: int = 692
-        PERCENT: int = 1
-        YIELD: int = 10
-        PER_SHARE: int = 2
-        FIXED_AMOUNT: int = 3
-        DISCOUNT: int = 4
-        PREMIUM: int = 5
-        SPREAD: int = 6
-        TED_PRICE: int = 7
-        TED_YIELD: int = 8
-        YIELD_SPREAD: int = 9
-
-    # QuoteRespID(693): STRING
-    class QuoteRespID:
-        tag: int = 693
-
-    # QuoteRespType(694): INT
-    class QuoteRespType:
-        tag: int = 694
-        HIT_LIFT: int = 1
-        COUNTER: int = 2
-        EXPIRED: int = 3
-        COVER: int = 4
-        DONE_AWAY: int = 5
-        PASS: int = 6
-        END_TRADE: int = 7
-        TIMED_OUT: int = 8
-
-    # QuoteQualifier(695): CHAR
-    class QuoteQualifier:
-        tag: int = 695
-
-    # YieldRedemptionDate(696): LOCALMKTDATE
-    class YieldRedemptionDate:
-        tag: int = 696
-
-    # YieldRedemptionPrice(697): PRICE
-    class YieldRedemptionPrice:
-        tag: int = 697
-
-    # YieldRedemptionPriceType(698): INT
-    class YieldRedemptionPriceType:
-        tag: int = 698
-
-    # BenchmarkSecurityID(699): STRING
-    class BenchmarkSecurityID:
-        tag: int = 699
-
-    # ReversalIndicator(700): BOOLEAN
-    class ReversalIndicator:
-        tag: int = 700
-
-    # YieldCalcDate(701): LOCALMKTDATE
-    class YieldCalcDate:
-        tag: int = 701
-
-    # NoPositions(702): NUMINGROUP
-    class NoPositions:
-        tag: int = 702
-
-    # PosType(703): STRING
-    class PosType:
-        tag: int = 703
-        ALLOCATION_TRADE_QTY: str = "ALC"
-        OPTION_ASSIGNMENT: str = "AS"
-        AS_OF_TRADE_QTY: str = "ASF"
-        DELIVERY_QTY: str = "DLV"
-        ELECTRONIC_TRADE_QTY: str = "ETR"
-        OPTION_EXERCISE_QTY: str = "EX"
-        END_OF_DAY_QTY: str = "FIN"
-        INTRA_SPREAD_QTY: str = "IAS"
-        INTER_SPREAD_QTY: str = "IES"
-        ADJUSTMENT_QTY: str = "PA"
-        PIT_TRADE_QTY: str = "PIT"
-        START_OF_DAY_QTY: str = "SOD"
-        INTEGRAL_SPLIT: str = "SPL"
-        TRANSACTION_FROM_ASSIGNMENT: str = "TA"
-        TOTAL_TRANSACTION_QTY: str = "TOT"
-        TRANSACTION_QUANTITY: str = "TQ"
-        TRANSFER_TRADE_QTY: str = "TRF"
-        TRANSACTION_FROM_EXERCISE: str = "TX"
-        CROSS_MARGIN_QTY: str = "XM"
-        RECEIVE_QUANTITY: str = "RCV"
-        CORPORATE_ACTION_ADJUSTMENT: str = "CAA"
-        DELIVERY_NOTICE_QTY: str = "DN"
-        EXCHANGE_FOR_PHYSICAL_QTY: str = "EP"
-        PRIVATELY_NEGOTIATED_TRADE_QTY: str = "PNTN"
-
-    # LongQty(704): QTY
-    class LongQty:
-        tag: int = 704
-
-    # ShortQty(705): QTY
-    class ShortQty:
-        tag: int = 705
-
-    # PosQtyStatus(706): INT
-    class PosQtyStatus:
-        tag: int = 706
-        SUBMITTED: int = 0
-        ACCEPTED: int = 1
-        REJECTED: int = 2
-
-    # PosAmtType(707): STRING
-    class PosAmtType:
-        tag: int = 707
-        CASH_AMOUNT: str = "CASH"
-        CASH_RESIDUAL_AMOUNT: str = "CRES"
-        FINAL_MARK_TO_MARKET_AMOUNT: str = "FMTM"
-        INCREMENTAL_MARK_TO_MARKET_AMOUNT: str = "IMTM"
-        PREMIUM_AMOUNT: str = "PREM"
-        START_OF_DAY_MARK_TO_MARKET_AMOUNT: str = "SMTM"
-        TRADE_VARIATION_AMOUNT: str = "TVAR"
-        VALUE_ADJUSTED_AMOUNT: str = "VADJ"
-        SETTLEMENT_VALUE: str = "SETL"
-
-    # PosAmt(708): AMT
-    class PosAmt:
-        tag: int = 708
-
-    # PosTransType(709): INT
-    class PosTransType:
-        tag: int = 709
-        EXERCISE: int = 1
-        DO_NOT_EXERCISE: int = 2
-        POSITION_ADJUSTMENT: int = 3
-        POSITION_CHANGE_SUBMISSION_MARGIN_DISPOSITION: int = 4
-        PLEDGE: int = 5
-        LARGE_TRADER_SUBMISSION: int = 6
-
-    # PosReqID(710): STRING
-    class PosReqID:
-        tag: int = 710
-
-    # NoUnderlyings(711): NUMINGROUP
-    class NoUnderlyings:
-        tag: int = 711
-
-    # PosMaintAction(712): INT
-    class PosMaintAction:
-        tag: int = 712
-        NEW: int = 1
-        REPLACE: int = 2
-        CANCEL: int = 3
-        REVERSE: int = 4
-
-    # OrigPosReqRefID(713): STRING
-    class OrigPosReqRefID:
-        tag: int = 713
-
-    # PosMaintRptRefID(714): STRING
-    class PosMaintRptRefID:
-        tag: int = 714
-
-    # ClearingBusinessDate(715): LOCALMKTDATE
-    class ClearingBusinessDate:
-        tag: int = 715
-
-    # SettlSessID(716): STRING
-    class SettlSessID:
-        tag: int = 716
-        INTRADAY: str = "ITD"
-        REGULAR_TRADING_HOURS: str = "RTH"
-        ELECTRONIC_TRADING_HOURS: str = "ETH"
-        END_OF_DAY: str = "EOD"
-
-    # SettlSessSubID(717): STRING
-    class SettlSessSubID:
-        tag: int = 717
-
-    # AdjustmentType(718): INT
-    class AdjustmentType:
-        tag: int = 718
-        PROCESS_REQUEST_AS_MARGIN_DISPOSITION: int = 0
-        DELTA_PLUS: int = 1
-        DELTA_MINUS: int = 2
-        FINAL: int = 3
-
-    # ContraryInstructionIndicator(719): BOOLEAN
-    class ContraryInstructionIndicator:
-        tag: int = 719
-
-    # PriorSpreadIndicator(720): BOOLEAN
-    class PriorSpreadIndicator:
-        tag: int = 720
-
-    # PosMaintRptID(721): STRING
-    class PosMaintRptID:
-        tag: int = 721
-
-    # PosMaintStatus(722): INT
-    class PosMaintStatus:
-        tag: int = 722
-        ACCEPTED: int = 0
-        ACCEPTED_WITH_WARNINGS: int = 1
-        REJECTED: int = 2
-        COMPLETED: int = 3
-        COMPLETED_WITH_WARNINGS: int = 4
-
-    # PosMaintResult(723): INT
-    class PosMaintResult:
-        tag: int = 723
-        SUCCESSFUL_COMPLETION: int = 0
-        REJECTED: int = 1
-        OTHER: int = 99
-
-    # PosReqType(724): INT
-    class PosReqType:
-        tag: int = 724
-        POSITIONS: int = 0
-        TRADES: int = 1
-        EXERCISES: int = 2
-        ASSIGNMENTS: int = 3
-        SETTLEMENT_ACTIVITY: int = 4
-        BACKOUT_MESSAGE: int = 5
-
-    # ResponseTransportType(725): INT
-    class ResponseTransportType:
-        tag: int = 725
-        INBAND: int = 0
-        OUT_OF_BAND: int = 1
-
-    # ResponseDestination(726): STRING
-    class ResponseDestination:
-        tag: int = 726
-
-    # TotalNumPosReports(727): INT
-    class TotalNumPosReports:
-        tag: int = 727
-
-    # PosReqResult(728): INT
-    class PosReqResult:
-        tag: int = 728
-        VALID_REQUEST: int = 0
-        INVALID_OR_UNSUPPORTED_REQUEST: int = 1
-        NO_POSITIONS_FOUND_THAT_MATCH_CRITERIA: int = 2
-        NOT_AUTHORIZED_TO_REQUEST_POSITIONS: int = 3
-        REQUEST_FOR_POSITION_NOT_SUPPORTED: int = 4
-        OTHER: int = 99
-
-    # PosReqStatus(729): INT
-    class PosReqStatus:
-        tag: int = 729
-        COMPLETED: int = 0
-        COMPLETED_WITH_WARNINGS: int = 1
-        REJECTED: int = 2
-
-    # SettlPrice(730): PRICE
-    class SettlPrice:
-        tag: int = 730
-
-    # SettlPriceType(731): INT
-    class SettlPriceType:
-        tag: int = 731
-        FINAL: int = 1
-        THEORETICAL: int = 2
-
-    # UnderlyingSettlPrice(732): PRICE
-    class UnderlyingSettlPrice:
-        tag: int = 732
-
-    # UnderlyingSettlPriceType(733): INT
-    class UnderlyingSettlPriceType:
-        tag: int = 733
-
-    # PriorSettlPrice(734): PRICE
-    class PriorSettlPrice:
-        tag: int = 734
-
-    # NoQuoteQualifiers(735): NUMINGROUP
-    class NoQuoteQualifiers:
-        tag: int = 735
-
-    # AllocSettlCurrency(736): CURRENCY
-    class AllocSettlCurrency:
-        tag: int = 736
-
-    # AllocSettlCurrAmt(737): AMT
-    class AllocSettlCurrAmt:
-        tag: int = 737
-
-    # InterestAtMaturity(738): AMT
-    class InterestAtMaturity:
-        tag: int = 738
-
-    # LegDatedDate(739): LOCALMKTDATE
-    class LegDatedDate:
-        tag: int = 739
-
-    # LegPool(740): STRING
-    class LegPool:
-        tag: int = 740
-
-    # AllocInterestAtMaturity(741): AMT
-    class AllocInterestAtMaturity:
-        tag: int = 741
-
-    # AllocAccruedInterestAmt(742): AMT
-    class AllocAccruedInterestAmt:
-        tag: int = 742
-
-    # DeliveryDate(743): LOCALMKTDATE
-    class DeliveryDate:
-        tag: int = 743
-
-    # AssignmentMethod(744): CHAR
-    class AssignmentMethod:
-        tag: int = 744
-        PRO_RATA: str = 'P'
-        RANDOM: str = 'R'
-
-    # AssignmentUnit(745): QTY
-    class AssignmentUnit:
-        tag: int = 745
-
-    # OpenInterest(746): AMT
-    class OpenInterest:
-        tag: int = 746
-
-    # ExerciseMethod(747): CHAR
-    class ExerciseMethod:
-        tag: int = 747
-        AUTOMATIC: str = 'A'
-        MANUAL: str = 'M'
-
-    # TotNumTradeReports(748): INT
-    class TotNumTradeReports:
-        tag: int = 748
-
-    # TradeRequestResult(749): INT
-    class TradeRequestResult:
-        tag: int = 749
-        SUCCESSFUL: int = 0
-        INVALID_OR_UNKNOWN_INSTRUMENT: int = 1
-        INVALID_TYPE_OF_TRADE_REQUESTED: int = 2
-        INVALID_PARTIES: int = 3
-        INVALID_TRANSPORT_TYPE_REQUESTED: int = 4
-        INVALID_DESTINATION_REQUESTED: int = 5
-        TRADEREQUESTTYPE_NOT_SUPPORTED: int = 8
-        NOT_AUTHORIZED: int = 9
-        OTHER: int = 99
-
-    # TradeRequestStatus(750): INT
-    class TradeRequestStatus:
-        tag: int = 750
-        ACCEPTED: int = 0
-        COMPLETED: int = 1
-        REJECTED: int = 2
-
-    # TradeReportRejectReason(751): INT
-    class TradeReportRejectReason:
-        tag: int = 751
-        SUCCESSFUL: int = 0
-        INVALID_PARTY_ONFORMATION: int = 1
-        UNKNOWN_INSTRUMENT: int = 2
-        UNAUTHORIZED_TO_REPORT_TRADES: int = 3
-        INVALID_TRADE_TYPE: int = 4
-        OTHER: int = 99
-
-    # SideMultiLegReportingType(752): INT
-    class SideMultiLegReportingType:
-        tag: int = 752
-        SINGLE_SECURITY: int = 1
-        INDIVIDUAL_LEG_OF_A_MULTILEG_SECURITY: int = 2
-        MULTILEG_SECURITY: int = 3
-
-    # NoPosAmt(753): NUMINGROUP
-    class NoPosAmt:
-        tag: int = 753
-
-    # AutoAcceptIndicator(754): BOOLEAN
-    class AutoAcceptIndicator:
-        tag: int = 754
-
-    # AllocReportID(755): STRING
-    class AllocReportID:
-        tag: int = 755
-
-    # NoNested2PartyIDs(756): NUMINGROUP
-    class NoNested2PartyIDs:
-        tag: int = 756
-
-    # Nested2PartyID(757): STRING
-    class Nested2PartyID:
-        tag: int = 757
-
-    # Nested2PartyIDSource(758): CHAR
-    class Nested2PartyIDSource:
-        tag: int = 758
-
-    # Nested2PartyRole(759): INT
-    class Nested2PartyRole:
-        tag: int = 759
-
-    # Nested2PartySubID(760): STRING
-    class Nested2PartySubID:
-        tag: int = 760
-
-    # BenchmarkSecurityIDSource(761): STRING
-    class BenchmarkSecurityIDSource:
-        tag: int = 761
-
-    # SecuritySubType(762): STRING
-    class SecuritySubType:
-        tag: int = 762
-
-    # UnderlyingSecuritySubType(763): STRING
-    class UnderlyingSecuritySubType:
-        tag: int = 763
-
-    # LegSecuritySubType(764): STRING
-    class LegSecuritySubType:
-        tag: int = 764
-
-    # AllowableOneSidednessPct(765): PERCENTAGE
-    class AllowableOneSidednessPct:
-        tag: int = 765
-
-    # AllowableOneSidednessValue(766): AMT
-    class AllowableOneSidednessValue:
-        tag: int = 766
-
-    # AllowableOneSidednessCurr(767): CURRENCY
-    class AllowableOneSidednessCurr:
-        tag: int = 767
-
-    # NoTrdRegTimestamps(768): NUMINGROUP
-    class NoTrdRegTimestamps:
-        tag: int = 768
-
-    # TrdRegTimestamp(769): UTCTIMESTAMP
-    class TrdRegTimestamp:
-        tag: int = 769
-
-    # TrdRegTimestampType(770): INT
-    class TrdRegTimestampType:
-        tag: int = 770
-        EXECUTION_TIME: int = 1
-        TIME_IN: int = 2
-        TIME_OUT: int = 3
-        BROKER_RECEIPT: int = 4
-        BROKER_EXECUTION: int = 5
-        DESK_RECEIPT: int = 6
-
-    # TrdRegTimestampOrigin(771): STRING
-    class TrdRegTimestampOrigin:
-        tag: int = 771
-
-    # ConfirmRefID(772): STRING
-    class ConfirmRefID:
-        tag: int = 772
-
-    # ConfirmType(773): INT
-    class ConfirmType:
-        tag: int = 773
-        STATUS: int = 1
-        CONFIRMATION: int = 2
-        CONFIRMATION_REQUEST_REJECTED: int = 3
-
-    # ConfirmRejReason(774): INT
-    class ConfirmRejReason:
-        tag: int = 774
-        MISMATCHED_ACCOUNT: int = 1
-        MISSING_SETTLEMENT_INSTRUCTIONS: int = 2
-        OTHER: int = 99
-
-    # BookingType(775): INT
-    class BookingType:
-        tag: int = 775
-        REGULAR_BOOKING: int = 0
-        CFD: int = 1
-        TOTAL_RETURN_SWAP: int = 2
-
-    # IndividualAllocRejCode(776): INT
-    class IndividualAllocRejCode:
-        tag: int = 776
-
-    # SettlInstMsgID(777): STRING
-    class SettlInstMsgID:
-        tag: int = 777
-
-    # NoSettlInst(778): NUMINGROUP
-    class NoSettlInst:
-        tag: int = 778
-
-    # LastUpdateTime(779): UTCTIMESTAMP
-    class LastUpdateTime:
-        tag: int = 779
-
-    # AllocSettlInstType(780): INT
-    class AllocSettlInstType:
-        tag: int = 780
-        USE_DEFAULT_INSTRUCTIONS: int = 0
-        DERIVE_FROM_PARAMETERS_PROVIDED: int = 1
-        FULL_DETAILS_PROVIDED: int = 2
-        SSI_DB_IDS_PROVIDED: int = 3
-        PHONE_FOR_INSTRUCTIONS: int = 4
-
-    # NoSettlPartyIDs(781): NUMINGROUP
-    class NoSettlPartyIDs:
-        tag: int = 781
-
-    # SettlPartyID(782): STRING
-    class SettlPartyID:
-        tag: int = 782
-
-    # SettlPartyIDSource(783): CHAR
-    class SettlPartyIDSource:
-        tag: int = 783
-
-    # SettlPartyRole(784): INT
-    class SettlPartyRole:
-        tag: int = 784
-
-    # SettlPartySubID(785): STRING
-    class SettlPartySubID:
-        tag: int = 785
-
-    # SettlPartySubIDType(786): INT
-    class SettlPartySubIDType:
-        tag: int = 786
-
-    # DlvyInstType(787): CHAR
-    class DlvyInstType:
-        tag: int = 787
-        CASH: str = 'C'
-        SECURITIES: str = 'S'
-
-    # TerminationType(788): INT
-    class TerminationType:
-        tag: int = 788
-        OVERNIGHT: int = 1
-        TERM: int = 2
-        FLEXIBLE: int = 3
-        OPEN: int = 4
-
-    # NextExpectedMsgSeqNum(789): SEQNUM
-    class NextExpectedMsgSeqNum:
-        tag: int = 789
-
-    # OrdStatusReqID(790): STRING
-    class OrdStatusReqID:
-        tag: int = 790
-
-    # SettlInstReqID(791): STRING
-    class SettlInstReqID:
-        tag: int = 791
-
-    # SettlInstReqRejCode(792): INT
-    class SettlInstReqRejCode:
-        tag: int = 792
-        UNABLE_TO_PROCESS_REQUEST: int = 0
-        UNKNOWN_ACCOUNT: int = 1
-        NO_MATCHING_SETTLEMENT_INSTRUCTIONS_FOUND: int = 2
-        OTHER: int = 99
-
-    # SecondaryAllocID(793): STRING
-    class SecondaryAllocID:
-        tag: int = 793
-
-    # AllocReportType(794): INT
-    class AllocReportType:
-        tag: int = 794
-        SELLSIDE_CALCULATED_USING_PRELIMINARY: int = 3
-        SELLSIDE_CALCULATED_WITHOUT_PRELIMINARY: int = 4
-        WAREHOUSE_RECAP: int = 5
-        REQUEST_TO_INTERMEDIARY: int = 8
-        PRELIMINARY_REQUEST_TO_INTERMEDIARY: int = 2
-        ACCEPT: int = 9
-        REJECT: int = 10
-        ACCEPT_PENDING: int = 11
-        COMPLETE: int = 12
-        REVERSE_PENDING: int = 14
-
-    # AllocReportRefID(795): STRING
-    class AllocReportRefID:
-        tag: int = 795
-
-    # AllocCancReplaceReason(796): INT
-    class AllocCancReplaceReason:
-        tag: int = 796
-        ORIGINAL_DETAILS_INCOMPLETE_INCORRECT: int = 1
-        CHANGE_IN_UNDERLYING_ORDER_DETAILS: int = 2
-        OTHER: int = 99
-
-    # CopyMsgIndicator(797): BOOLEAN
-    class CopyMsgIndicator:
-        tag: int = 797
-
-    # AllocAccountType(798): INT
-    class AllocAccountType:
-        tag: int = 798
-        ACCOUNT_IS_CARRIED_PN_CUSTOMER_SIDE_OF_BOOKS: int = 1
-        ACCOUNT_IS_CARRIED_ON_NON_CUSTOMER_SIDE_OF_BOOKS: int = 2
-        HOUSE_TRADER: int = 3
-        FLOOR_TRADER: int = 4
-        ACCOUNT_IS_CARRIED_ON_NON_CUSTOMER_SIDE_OF_BOOKS_AND_IS_CROSS_MARGINED: int = 6
-        ACCOUNT_IS_HOUSE_TRADER_AND_IS_CROSS_MARGINED: int = 7
-        JOINT_BACK_OFFICE_ACCOUNT: int = 8
-
-    # OrderAvgPx(799): PRICE
-    class OrderAvgPx:
-        tag: int = 799
-
-    # OrderBookingQty(800): QTY
-    class OrderBookingQty:
-        tag: int = 800
-
-    # NoSettlPartySubIDs(801): NUMINGROUP
-    class NoSettlPartySubIDs:
-        tag: int = 801
-
-    # NoPartySubIDs(802): NUMINGROUP
-    class NoPartySubIDs:
-        tag: int = 802
-
-    # PartySubIDType(803): INT
-    class PartySubIDType:
-        tag: int = 803
-        FIRM: int = 1
-        SECURITIES_ACCOUNT_NUMBER: int = 10
-        REGISTRATION_NUMBER: int = 11
-        REGISTERED_ADDRESS_12: int = 12
-        REGULATORY_STATUS: int = 13
-        REGISTRATION_NAME: int = 14
-        CASH_ACCOUNT_NUMBER: int = 15
-        BIC: int = 16
-        CSD_PARTICIPANT_MEMBER_CODE: int = 17
-        REGISTERED_ADDRESS_18: int = 18
-        FUND_ACCOUNT_NAME: int = 19
-        PERSON: int = 2
-        TELEX_NUMBER: int = 20
-        FAX_NUMBER: int = 21
-        SECURITIES_ACCOUNT_NAME: int = 22
-        CASH_ACCOUNT_NAME: int = 23
-        DEPARTMENT: int = 24
-        LOCATION_DESK: int = 25
-        POSITION_ACCOUNT_TYPE: int = 26
-        SYSTEM: int = 3
-        APPLICATION: int = 4
-        FULL_LEGAL_NAME_OF_FIRM: int = 5
-        POSTAL_ADDRESS: int = 6
-        PHONE_NUMBER: int = 7
-        EMAIL_ADDRESS: int = 8
-        CONTACT_NAME: int = 9
-        SECURITY_LOCATE_ID: int = 27
-        MARKET_MAKER: int = 28
-        ELIGIBLE_COUNTERPARTY: int = 29
-        PROFESSIONAL_CLIENT: int = 30
-        LOCATION: int = 31
-        EXECUTION_VENUE: int = 32
-        CURRENCY_DELIVERY_IDENTIFIER: int = 33
-
-    # NoNestedPartySubIDs(804): NUMINGROUP
-    class NoNestedPartySubIDs:
-        tag: int = 804
-
-    # NestedPartySubIDType(805): INT
-    class NestedPartySubIDType:
-        tag: int = 805
-
-    # NoNested2PartySubIDs(806): NUMINGROUP
-    class NoNested2PartySubIDs:
-        tag: int = 806
-
-    # Nested2PartySubIDType(807): INT
-    class Nested2PartySubIDType:
-        tag: int = 807
-
-    # AllocIntermedReqType(808): INT
-    class AllocIntermedReqType:
-        tag: int = 808
-        PENDING_ACCEPT: int = 1
-        PENDING_RELEASE: int = 2
-        PENDING_REVERSAL: int = 3
-        ACCEPT: int = 4
-        BLOCK_LEVEL_REJECT: int = 5
-        ACCOUNT_LEVEL_REJECT: int = 6
-
-    # UnderlyingPx(810): PRICE
-    class UnderlyingPx:
-        tag: int = 810
-
-    # PriceDelta(811): FLOAT
-    class PriceDelta:
-        tag: int = 811
-
-    # ApplQueueMax(812): INT
-    class ApplQueueMax:
-        tag: int = 812
-
-    # ApplQueueDepth(813): INT
-    class ApplQueueDepth:
-        tag: int = 813
-
-    # ApplQueueResolution(814): INT
-    class ApplQueueResolution:
-        tag: int = 814
-        NO_ACTION_TAKEN: int = 0
-        QUEUE_FLUSHED: int = 1
-        OVERLAY_LAST: int = 2
-        END_SESSION: int = 3
-
-    # ApplQueueAction(815): INT
-    class ApplQueueAction:
-        tag: int = 815
-        NO_ACTION_TAKEN: int = 0
-        QUEUE_FLUSHED: int = 1
-        OVERLAY_LAST: int = 2
-        END_SESSION: int = 3
-
-    # NoAltMDSource(816): NUMINGROUP
-    class NoAltMDSource:
-        tag: int = 816
-
-    # AltMDSourceID(817): STRING
-    class AltMDSourceID:
-        tag: int = 817
-
-    # SecondaryTradeReportID(818): STRING
-    class SecondaryTradeReportID:
-        tag: int = 818
-
-    # AvgPxIndicator(819): INT
-    class AvgPxIndicator:
-        tag: int = 819
-        NO_AVERAGE_PRICING: int = 0
-        TRADE_IS_PART_OF_AN_AVERAGE_PRICE_GROUP_IDENTIFIED_BY_THE_TRADELINKID: int = 1
-        LAST_TRADE_IS_THE_AVERAGE_PRICE_GROUP_IDENTIFIED_BY_THE_TRADELINKID: int = 2
-
-    # TradeLinkID(820): STRING
-    class TradeLinkID:
-        tag: int = 820
-
-    # OrderInputDevice(821): STRING
-    class OrderInputDevice:
-        tag: int = 821
-
-    # UnderlyingTradingSessionID(822): STRING
-    class UnderlyingTradingSessionID:
-        tag: int = 822
-
-    # UnderlyingTradingSessionSubID(823): STRING
-    class UnderlyingTradingSessionSubID:
-        tag: int = 823
-
-    # TradeLegRefID(824): STRING
-    class TradeLegRefID:
-        tag: int = 824
-
-    # ExchangeRule(825): STRING
-    class ExchangeRule:
-        tag: int = 825
-
-    # TradeAllocIndicator(826): INT
-    class TradeAllocIndicator:
-        tag: int = 826
-        ALLOCATION_NOT_REQUIRED: int = 0
-        ALLOCATION_REQUIRED: int = 1
-        USE_ALLOCATION_PROVIDED_WITH_THE_TRADE: int = 2
-        ALLOCATION_GIVE_UP_EXECUTOR: int = 3
-        ALLOCATION_FROM_EXECUTOR: int = 4
-        ALLOCATION_TO_CLAIM_ACCOUNT: int = 5
-
-    # ExpirationCycle(827): INT
-    class ExpirationCycle:
-        tag: int = 827
-        EXPIRE_ON_TRADING_SESSION_CLOSE: int = 0
-        EXPIRE_ON_TRADING_SESSION_OPEN: int = 1
-        TRADING_ELIGIBILITY_EXPIRATION_SPECIFIED_IN_THE_DATE_AND_TIME_FIELDS_EVENTDATE: int = 2
-
-    # TrdType(828): INT
-    class TrdType:
-        tag: int = 828
-        REGULAR_TRADE: int = 0
-        BLOCK_TRADE_1: int = 1
-        AFTER_HOURS_TRADE: int = 10
-        EFP: int = 2
-        TRANSFER: int = 3
-        LATE_TRADE: int = 4
-        T_TRADE: int = 5
-        WEIGHTED_AVERAGE_PRICE_TRADE: int = 6
-        BUNCHED_TRADE: int = 7
-        LATE_BUNCHED_TRADE: int = 8
-        PRIOR_REFERENCE_PRICE_TRADE: int = 9
-        EXCHANGE_FOR_RISK: int = 11
-        EXCHANGE_FOR_SWAP: int = 12
-        EXCHANGE_OF_FUTURES_FOR: int = 13
-        EXCHANGE_OF_OPTIONS_FOR_OPTIONS: int = 14
-        TRADING_AT_SETTLEMENT: int = 15
-        ALL_OR_NONE: int = 16
-        FUTURES_LARGE_ORDER_EXECUTION: int = 17
-        EXCHANGE_OF_FUTURES_FOR_FUTURES: int = 18
-        OPTION_INTERIM_TRADE: int = 19
-        OPTION_CABINET_TRADE: int = 20
-        PRIVATELY_NEGOTIATED_TRADES: int = 22
-        SUBSTITUTION_OF_FUTURES_FOR_FORWARDS: int = 23
-        ERROR_TRADE: int = 24
-        SPECIAL_CUM_DIVIDEND: int = 25
-        SPECIAL_EX_DIVIDEND: int = 26
-        SPECIAL_CUM_COUPON: int = 27
-        SPECIAL_EX_COUPON: int = 28
-        CASH_SETTLEMENT: int = 29
-        SPECIAL_PRICE: int = 30
-        GUARANTEED_DELIVERY: int = 31
-        SPECIAL_CUM_RIGHTS: int = 32
-        SPECIAL_EX_RIGHTS: int = 33
-        SPECIAL_CUM_CAPITAL_REPAYMENTS: int = 34
-        SPECIAL_EX_CAPITAL_REPAYMENTS: int = 35
-        SPECIAL_CUM_BONUS: int = 36
-        SPECIAL_EX_BONUS: int = 37
-        BLOCK_TRADE_38: int = 38
-        WORKED_PRINCIPAL_TRADE: int = 39
-        BLOCK_TRADES: int = 40
-        NAME_CHANGE: int = 41
-        PORTFOLIO_TRANSFER: int = 42
-        PROROGATION_BUY: int = 43
-        PROROGATION_SELL: int = 44
-        OPTION_EXERCISE: int = 45
-        DELTA_NEUTRAL_TRANSACTION: int = 46
-        FINANCING_TRANSACTION: int = 47
-        NON_STANDARD_SETTLEMENT: int = 48
-        DERIVATIVE_RELATED_TRANSACTION: int = 49
-        PORTFOLIO_TRADE: int = 50
-        VOLUME_WEIGHTED_AVERAGE_TRADE: int = 51
-        EXCHANGE_GRANTED_TRADE: int = 52
-        REPURCHASE_AGREEMENT: int = 53
-        OTC: int = 54
-        EXCHANGE_BASIS_FACILITY: int = 55
-
-    # TrdSubType(829): INT
-    class TrdSubType:
-        tag: int = 829
-        CMTA: int = 0
-        INTERNAL_TRANSFER_OR_ADJUSTMENT: int = 1
-        EXTERNAL_TRANSFER_OR_TRANSFER_OF_ACCOUNT: int = 2
-        REJECT_FOR_SUBMITTING_SIDE: int = 3
-        ADVISORY_FOR_CONTRA_SIDE: int = 4
-        OFFSET_DUE_TO_AN_ALLOCATION: int = 5
-        ONSET_DUT_TO_AN_ALLOCATION: int = 6
-        DIFFERENTIAL_SPREAD: int = 7
-        IMPLIED_SPREAD_LEG_EXECUTED_AGAINST_AN_OUTRIGHT: int = 8
-        TRANSACTION_FROM_EXERCISE: int = 9
-        TRANSACTION_FROM_ASSIGNMENT: int = 10
-        ACATS: int = 11
-        AI: int = 14
-        B: int = 15
-        K: int = 16
-        LC: int = 17
-        M: int = 18
-        N: int = 19
-        NM: int = 20
-        NR: int = 21
-        P: int = 22
-        PA: int = 23
-        PC: int = 24
-        PN: int = 25
-        R: int = 26
-        RO: int = 27
-        RT: int = 28
-        SW: int = 29
-        T: int = 30
-        WN: int = 31
-        WT: int = 32
-        OFF_HOURS_TRADE: int = 33
-        ON_HOURS_TRADE: int = 34
-        OTC_QUOTE: int = 35
-        CONVERTED_SWAP: int = 36
-        CROSSED_TRADE: int = 37
-        INTERIM_PROTECTED_TRADE: int = 38
-        LARGE_IN_SCALE: int = 39
-
-    # TransferReason(830): STRING
-    class TransferReason:
-        tag: int = 830
-
-    # AsgnReqID(831): STRING
-    class AsgnReqID:
-        tag: int = 831
-
-    # TotNumAssignmentReports(832): INT
-    class TotNumAssignmentReports:
-        tag: int = 832
-
-    # AsgnRptID(833): STRING
-    class AsgnRptID:
-        tag: int = 833
-
-    # ThresholdAmount(834): PRICEOFFSET
-    class ThresholdAmount:
-        tag: int = 834
-
-    # PegMoveType(835): INT
-    class PegMoveType:
-        tag: int = 835
-        FLOATING: int = 0
-        FIXED: int = 1
-
-    # PegOffsetType(836): INT
-    class PegOffsetType:
-        tag: int = 836
-        PRICE: int = 0
-        BASIS_POINTS: int = 1
-        TICKS: int = 2
-        PRICE_TIER: int = 3
-
-    # PegLimitType(837): INT
-    class PegLimitType:
-        tag: int = 837
-        OR_BETTER: int = 0
-        STRICT: int = 1
-        OR_WORSE: int = 2
-
-    # PegRoundDirection(838): INT
-    class PegRoundDirection:
-        tag: int = 838
-        MORE_AGGRESSIVE: int = 1
-        MORE_PASSIVE: int = 2
-
-    # PeggedPrice(839): PRICE
-    class PeggedPrice:
-        tag: int = 839
-
-    # PegScope(840): INT
-    class PegScope:
-        tag: int = 840
-        LOCAL: int = 1
-        NATIONAL: int = 2
-        GLOBAL: int = 3
-        NATIONAL_EXCLUDING_LOCAL: int = 4
-
-    # DiscretionMoveType(841): INT
-    class DiscretionMoveType:
-        tag: int = 841
-        FLOATING: int = 0
-        FIXED: int = 1
-
-    # DiscretionOffsetType(842): INT
-    class DiscretionOffsetType:
-        tag: int = 842
-        PRICE: int = 0
-        BASIS_POINTS: int = 1
-        TICKS: int = 2
-        PRICE_TIER: int = 3
-
-    # DiscretionLimitType(843): INT
-    class DiscretionLimitType:
-        tag: int = 843
-        OR_BETTER: int = 0
-        STRICT: int = 1
-        OR_WORSE: int = 2
-
-    # DiscretionRoundDirection(844): INT
-    class DiscretionRoundDirection:
-        tag: int = 844
-        MORE_AGGRESSIVE: int = 1
-        MORE_PASSIVE: int = 2
-
-    # DiscretionPrice(845): PRICE
-    class DiscretionPrice:
-        tag: int = 845
-
-    # DiscretionScope(846): INT
-    class DiscretionScope:
-        tag: int = 846
-        LOCAL: int = 1
-        NATIONAL: int = 2
-        GLOBAL: int = 3
-        NATIONAL_EXCLUDING_LOCAL: int = 4
-
-    # TargetStrategy(847): INT
-    class TargetStrategy:
-        tag: int = 847
-        VWAP: int = 1
-        PARTICIPATE: int = 2
-        MININIZE_MARKET_IMPACT: int = 3
-
-    # TargetStrategyParameters(848): STRING
-    class TargetStrategyParameters:
-        tag: int = 848
-
-    # ParticipationRate(849): PERCENTAGE
-    class ParticipationRate:
-        tag: int = 849
-
-    # TargetStrategyPerformance(850): FLOAT
-    class TargetStrategyPerformance:
-        tag: int = 850
-
-    # LastLiquidityInd(851): INT
-    class LastLiquidityInd:
-        tag: int = 851
-        ADDED_LIQUIDITY: int = 1
-        REMOVED_LIQUIDITY: int = 2
-        LIQUIDITY_ROUTED_OUT: int = 3
-        AUCTION: int = 4
-
-    # PublishTrdIndicator(852): BOOLEAN
-    class PublishTrdIndicator:
-        tag: int = 852
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # ShortSaleReason(853): INT
-    class ShortSaleReason:
-        tag: int = 853
-        DEALER_SOLD_SHORT: int = 0
-        DEALER_SOLD_SHORT_EXEMPT: int = 1
-        SELLING_CUSTOMER_SOLD_SHORT: int = 2
-        SELLING_CUSTOMER_SOLD_SHORT_EXEMPT: int = 3
-        QUALIFIED_SERVICE_REPRESENTATIVE: int = 4
-        QSR_OR_AGU_CONTRA_SIDE_SOLD_SHORT_EXEMPT: int = 5
-
-    # QtyType(854): INT
-    class QtyType:
-        tag: int = 854
-        UNITS: int = 0
-        CONTRACTS: int = 1
-        UNITS_OF_MEASURE_PER_TIME_UNIT: int = 2
-
-    # SecondaryTrdType(855): INT
-    class SecondaryTrdType:
-        tag: int = 855
-
-    # TradeReportType(856): INT
-    class TradeReportType:
-        tag: int = 856
-        SUBMIT: int = 0
-        ALLEGED_1: int = 1
-        ACCEPT: int = 2
-        DECLINE: int = 3
-        ADDENDUM: int = 4
-        NO_WAS: int = 5
-        TRADE_REPORT_CANCEL: int = 6
-        _7: int = 7
-        DEFAULTED: int = 8
-        INVALID_CMTA: int = 9
-        PENDED: int = 10
-        ALLEGED_NEW: int = 11
-        ALLEGED_ADDENDUM: int = 12
-        ALLEGED_NO_WAS: int = 13
-        ALLEGED_TRADE_REPORT_CANCEL: int = 14
-        ALLEGED_15: int = 15
-
-    # AllocNoOrdersType(857): INT
-    class AllocNoOrdersType:
-        tag: int = 857
-        NOT_SPECIFIED: int = 0
-        EXPLICIT_LIST_PROVIDED: int = 1
-
-    # SharedCommission(858): AMT
-    class SharedCommission:
-        tag: int = 858
-
-    # ConfirmReqID(859): STRING
-    class ConfirmReqID:
-        tag: int = 859
-
-    # AvgParPx(860): PRICE
-    class AvgParPx:
-        tag: int = 860
-
-    # ReportedPx(861): PRICE
-    class ReportedPx:
-        tag: int = 861
-
-    # NoCapacities(862): NUMINGROUP
-    class NoCapacities:
-        tag: int = 862
-
-    # OrderCapacityQty(863): QTY
-    class OrderCapacityQty:
-        tag: int = 863
-
-    # NoEvents(864): NUMINGROUP
-    class NoEvents:
-        tag: int = 864
-
-    # EventType(865): INT
-    class EventType:
-        tag: int = 865
-        PUT: int = 1
-        CALL: int = 2
-        TENDER: int = 3
-        SINKING_FUND_CALL: int = 4
-        OTHER: int = 99
-        ACTIVATION: int = 5
-        INACTIVIATION: int = 6
-        LAST_ELIGIBLE_TRADE_DATE: int = 7
-        SWAP_START_DATE: int = 8
-        SWAP_END_DATE: int = 9
-        SWAP_NEXT_START_DATE: int = 11
-        SWAP_ROLL_DATE: int = 10
-        SWAP_NEXT_ROLL_DATE: int = 12
-        FIRST_DELIVERY_DATE: int = 13
-        LAST_DELIVERY_DATE: int = 14
-        INITIAL_INVENTORY_DUE_DATE: int = 15
-        FINAL_INVENTORY_DUE_DATE: int = 16
-        FIRST_INTENT_DATE: int = 17
-        LAST_INTENT_DATE: int = 18
-        POSITION_REMOVAL_DATE: int = 19
-
-    # EventDate(866): LOCALMKTDATE
-    class EventDate:
-        tag: int = 866
-
-    # EventPx(867): PRICE
-    class EventPx:
-        tag: int = 867
-
-    # EventText(868): STRING
-    class EventText:
-        tag: int = 868
-
-    # PctAtRisk(869): PERCENTAGE
-    class PctAtRisk:
-        tag: int = 869
-
-    # NoInstrAttrib(870): NUMINGROUP
-    class NoInstrAttrib:
-        tag: int = 870
-
-    # InstrAttribType(871): INT
-    class InstrAttribType:
-        tag: int = 871
-        FLAT: int = 1
-        ORIGINAL_ISSUE_DISCOUNT: int = 10
-        CALLABLE_PUTTABLE: int = 11
-        ESCROWED_TO_MATURITY: int = 12
-        ESCROWED_TO_REDEMPTION_DATE: int = 13
-        PRE_REFUNDED: int = 14
-        IN_DEFAULT: int = 15
-        UNRATED: int = 16
-        TAXABLE: int = 17
-        INDEXED: int = 18
-        SUBJECT_TO_ALTERNATIVE_MINIMUM_TAX: int = 19
-        ZERO_COUPON: int = 2
-        ORIGINAL_ISSUE_DISCOUNT_PRICE_SUPPLY_PRICE_IN_THE_INSTRATTRIBVALUE: int = 20
-        CALLABLE_BELOW_MATURITY_VALUE: int = 21
-        CALLABLE_WITHOUT_NOTICE_BY_MAIL_TO_HOLDER_UNLESS_REGISTERED: int = 22
-        INTEREST_BEARING: int = 3
-        NO_PERIODIC_PAYMENTS: int = 4
-        VARIABLE_RATE: int = 5
-        LESS_FEE_FOR_PUT: int = 6
-        STEPPED_COUPON: int = 7
-        COUPON_PERIOD: int = 8
-        WHEN_AND_IF_ISSUED: int = 9
-        TEXT_SUPPLY_THE_TEXT_OF_THE_ATTRIBUTE_OR_DISCLAIMER_IN_THE_INSTRATTRIBVALUE: int = 99
-        PRICE_TICK_RULES_FOR_SECURITY: int = 23
-        TRADE_TYPE_ELIGIBILITY_DETAILS_FOR_SECURITY: int = 24
-        INSTRUMENT_DENOMINATOR: int = 25
-        INSTRUMENT_NUMERATOR: int = 26
-        INSTRUMENT_PRICE_PRECISION: int = 27
-        INSTRUMENT_STRIKE_PRICE: int = 28
-        TRADEABLE_INDICATOR: int = 29
-
-    # InstrAttribValue(872): STRING
-    class InstrAttribValue:
-        tag: int = 872
-
-    # DatedDate(873): LOCALMKTDATE
-    class DatedDate:
-        tag: int = 873
-
-    # InterestAccrualDate(874): LOCALMKTDATE
-    class InterestAccrualDate:
-        tag: int = 874
-
-    # CPProgram(875): INT
-    class CPProgram:
-        tag: int = 875
-        _3: int = 1
-        _4: int = 2
-        OTHER: int = 99
-
-    # CPRegType(876): STRING
-    class CPRegType:
-        tag: int = 876
-
-    # UnderlyingCPProgram(877): STRING
-    class UnderlyingCPProgram:
-        tag: int = 877
-
-    # UnderlyingCPRegType(878): STRING
-    class UnderlyingCPRegType:
-        tag: int = 878
-
-    # UnderlyingQty(879): QTY
-    class UnderlyingQty:
-        tag: int = 879
-
-    # TrdMatchID(880): STRING
-    class TrdMatchID:
-        tag: int = 880
-
-    # SecondaryTradeReportRefID(881): STRING
-    class SecondaryTradeReportRefID:
-        tag: int = 881
-
-    # UnderlyingDirtyPrice(882): PRICE
-    class UnderlyingDirtyPrice:
-        tag: int = 882
-
-    # UnderlyingEndPrice(883): PRICE
-    class UnderlyingEndPrice:
-        tag: int = 883
-
-    # UnderlyingStartValue(884): AMT
-    class UnderlyingStartValue:
-        tag: int = 884
-
-    # UnderlyingCurrentValue(885): AMT
-    class UnderlyingCurrentValue:
-        tag: int = 885
-
-    # UnderlyingEndValue(886): AMT
-    class UnderlyingEndValue:
-        tag: int = 886
-
-    # NoUnderlyingStips(887): NUMINGROUP
-    class NoUnderlyingStips:
-        tag: int = 887
-
-    # UnderlyingStipType(888): STRING
-    class UnderlyingStipType:
-        tag: int = 888
-
-    # UnderlyingStipValue(889): STRING
-    class UnderlyingStipValue:
-        tag: int = 889
-
-    # MaturityNetMoney(890): AMT
-    class MaturityNetMoney:
-        tag: int = 890
-
-    # MiscFeeBasis(891): INT
-    class MiscFeeBasis:
-        tag: int = 891
-        ABSOLUTE: int = 0
-        PER_UNIT: int = 1
-        PERCENTAGE: int = 2
-
-    # TotNoAllocs(892): INT
-    class TotNoAllocs:
-        tag: int = 892
-
-    # LastFragment(893): BOOLEAN
-    class LastFragment:
-        tag: int = 893
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # CollReqID(894): STRING
-    class CollReqID:
-        tag: int = 894
-
-    # CollAsgnReason(895): INT
-    class CollAsgnReason:
-        tag: int = 895
-        INITIAL: int = 0
-        SCHEDULED: int = 1
-        TIME_WARNING: int = 2
-        MARGIN_DEFICIENCY: int = 3
-        MARGIN_EXCESS: int = 4
-        FORWARD_COLLATERAL_DEMAND: int = 5
-        EVENT_OF_DEFAULT: int = 6
-        ADVERSE_TAX_EVENT: int = 7
-
-    # CollInquiryQualifier(896): INT
-    class CollInquiryQualifier:
-        tag: int = 896
-        TRADE_DATE: int = 0
-        GC_INSTRUMENT: int = 1
-        COLLATERAL_INSTRUMENT: int = 2
-        SUBSTITUTION_ELIGIBLE: int = 3
-        NOT_ASSIGNED: int = 4
-        PARTIALLY_ASSIGNED: int = 5
-        FULLY_ASSIGNED: int = 6
-        OUTSTANDING_TRADES: int = 7
-
-    # NoTrades(897): NUMINGROUP
-    class NoTrades:
-        tag: int = 897
-
-    # MarginRatio(898): PERCENTAGE
-    class MarginRatio:
-        tag: int = 898
-
-    # MarginExcess(899): AMT
-    class MarginExcess:
-        tag: int = 899
-
-    # TotalNetValue(900): AMT
-    class TotalNetValue:
-        tag: int = 900
-
-    # CashOutstanding(901): AMT
-    class CashOutstanding:
-        tag: int = 901
-
-    # CollAsgnID(902): STRING
-    class CollAsgnID:
-        tag: int = 902
-
-    # CollAsgnTransType(903): INT
-    class CollAsgnTransType:
-        tag: int = 903
-        NEW: int = 0
-        REPLACE: int = 1
-        CANCEL: int = 2
-        RELEASE: int = 3
-        REVERSE: int = 4
-
-    # CollRespID(904): STRING
-    class CollRespID:
-        tag: int = 904
-
-    # CollAsgnRespType(905): INT
-    class CollAsgnRespType:
-        tag: int = 905
-        RECEIVED: int = 0
-        ACCEPTED: int = 1
-        DECLINED: int = 2
-        REJECTED: int = 3
-
-    # CollAsgnRejectReason(906): INT
-    class CollAsgnRejectReason:
-        tag: int = 906
-        UNKNOWN_DEAL: int = 0
-        UNKNOWN_OR_INVALID_INSTRUMENT: int = 1
-        UNAUTHORIZED_TRANSACTION: int = 2
-        INSUFFICIENT_COLLATERAL: int = 3
-        INVALID_TYPE_OF_COLLATERAL: int = 4
-        EXCESSIVE_SUBSTITUTION: int = 5
-        OTHER: int = 99
-
-    # CollAsgnRefID(907): STRING
-    class CollAsgnRefID:
-        tag: int = 907
-
-    # CollRptID(908): STRING
-    class CollRptID:
-        tag: int = 908
-
-    # CollInquiryID(909): STRING
-    class CollInquiryID:
-        tag: int = 909
-
-    # CollStatus(910): INT
-    class CollStatus:
-        tag: int = 910
-        UNASSIGNED: int = 0
-        PARTIALLY_ASSIGNED: int = 1
-        ASSIGNMENT_PROPOSED: int = 2
-        ASSIGNED: int = 3
-        CHALLENGED: int = 4
-
-    # TotNumReports(911): INT
-    class TotNumReports:
-        tag: int = 911
-
-    # LastRptRequested(912): BOOLEAN
-    class LastRptRequested:
-        tag: int = 912
-        NO: str = 'N'
-        YES: str = 'Y'
-
-    # AgreementDesc(913): STRING
-    class AgreementDesc:
-        tag: int = 913
-
-    # AgreementID(914): STRING
-    class AgreementID:
-        tag: int = 914
-
-    # AgreementDate(915): LOCALMKTDATE
-    class AgreementDate:
-        tag: int = 915
-
-    # StartDate(916): LOCALMKTDATE
-    class StartDate:
-        tag: int = 916
-
-    # EndDate(917): LOCALMKTDATE
-    class EndDate:
-        tag: int = 917
-
-    # AgreementCurrency(918): CURRENCY
-    class AgreementCurrency:
-        tag: int = 918
-
-    # DeliveryType(919): INT
-    class DeliveryType:
-        tag: int = 919
-        VERSUS_PAYMENT_DELIVER: int = 0
-        FREE_DELIVER: int = 1
-        TRI_PARTY: int = 2
-        HOLD_IN_CUSTODY: int = 3
-
-    # EndAccruedInterestAmt(920): AMT
-    class EndAccruedInterestAmt:
-        tag: int = 920
-
-    # StartCash(921): AMT
-    class StartCash:
-        tag: int = 921
-
-    # EndCash(922): AMT
-    class EndCash:
-        tag: int = 922
-
-    # UserRequestID(923): STRING
-    class UserRequestID:
-        tag: int = 923
-
-    # UserRequestType(924): INT
-    class UserRequestType:
-        tag: int = 924
-        LOG_ON_USER: int = 1
-        LOG_OFF_USER: int = 2
-        CHANGE_PASSWORD_FOR_USER: int = 3
-        REQUEST_INDIVIDUAL_USER_STATUS: int = 4
-
-    # NewPassword(925): STRING
-    class NewPassword:
-        tag: int = 925
-
-    # UserStatus(926): INT
-    class UserStatus:
-        tag: int = 926
-        LOGGED_IN: int = 1
-        NOT_LOGGED_IN: int = 2
-        USER_NOT_RECOGNISED: int = 3
-        PASSWORD_INCORRECT: int = 4
-        PASSWORD_CHANGED: int = 5
-        OTHER: int = 6
-        FORCED_USER_LOGOUT_BY_EXCHANGE: int = 7
-        SESSION_SHUTDOWN_WARNING: int = 8
-
-    # UserStatusText(927): STRING
-    class UserStatusText:
-        tag: int = 927
-
-    # StatusValue(928): INT
-    class StatusValue:
-        tag: int = 928
-        CONNECTED: int = 1
-        NOT_CONNECTED_2: int = 2
-        NOT_CONNECTED_3: int = 3
-        IN_PROCESS: int = 4
-
-    # StatusText(929): STRING
-    class StatusText:
-        tag: int = 929
-
-    # RefCompID(930): STRING
-    class RefCompID:
-        tag: int = 930
-
-    # RefSubID(931): STRING
-    class RefSubID:
-        tag: int = 931
-
-    # NetworkResponseID(932): STRING
-    class NetworkResponseID:
-        tag: int = 932
-
-    # NetworkRequestID(933): STRING
-    class NetworkRequestID:
-        tag: int = 933
-
-    # LastNetworkResponseID(934): STRING
-    class LastNetworkResponseID:
-        tag: int = 934
-
-    # NetworkRequestType(935): INT
-    class NetworkRequestType:
-        tag: int = 935
-        SNAPSHOT: int = 1
-        SUBSCRIBE: int = 2
-        STOP_SUBSCRIBING: int = 4
-        LEVEL_OF_DETAIL_THEN_NOCOMPIDS_BECOMES_REQUIRED: int = 8
-
-    # NoCompIDs(936): NUMINGROUP
-    class NoCompIDs:
-        tag: int = 936
-
-    # NetworkStatusResponseType(937): INT
-    class NetworkStatusResponseType:
-        tag: int = 937
-        FULL: int = 1
-        INCREMENTAL_UPDATE: int = 2
-
-    # NoCollInquiryQualifier(938): NUMINGROUP
-    class NoCollInquiryQualifier:
-        tag: int = 938
-
-    # TrdRptStatus(939): INT
-    class TrdRptStatus:
-        tag: int = 939
-        ACCEPTED: int = 0
-        REJECTED: int = 1
-        ACCEPTED_WITH_ERRORS: int = 3
-
-    # AffirmStatus(940): INT
-    class AffirmStatus:
-        tag: int = 940
-        RECEIVED: int = 1
-        CONFIRM_REJECTED_IE_NOT_AFFIRMED: int = 2
-        AFFIRMED: int = 3
-
-    # UnderlyingStrikeCurrency(941): CURRENCY
-    class UnderlyingStrikeCurrency:
-        tag: int = 941
-
-    # LegStrikeCurrency(942): CURRENCY
-    class LegStrikeCurrency:
-        tag: int = 942
-
-    # TimeBracket(943): STRING
-    class TimeBracket:
-        tag: int = 943
-
-    # CollAction(944): INT
-    class CollAction:
-        tag: int = 944
-        RETAIN: int = 0
-        ADD: int = 1
-        REMOVE: int = 2
-
-    # CollInquiryStatus(945): INT
-    class CollInquiryStatus:
-        tag: int = 945
-        ACCEPTED: int = 0
-        ACCEPTED_WITH_WARNINGS: int = 1
-        COMPLETED: int = 2
-        COMPLETED_WITH_WARNINGS: int = 3
-        REJECTED: int = 4
-
-    # CollInquiryResult(946): INT
-    class CollInquiryResult:
-        tag: int = 946
-        SUCCESSFUL: int = 0
-        INVALID_OR_UNKNOWN_INSTRUMENT: int = 1
-        INVALID_OR_UNKNOWN_COLLATERAL_TYPE: int = 2
-        INVALID_PARTIES: int = 3
-        INVALID_TRANSPORT_TYPE_REQUESTED: int = 4
-        INVALID_DESTINATION_REQUESTED: int = 5
-        NO_COLLATERAL_FOUND_FOR_THE_TRADE_SPECIFIED: int = 6
-        NO_COLLATERAL_FOUND_FOR_THE_ORDER_SPECIFIED: int = 7
-        COLLATERAL_INQUIRY_TYPE_NOT_SUPPORTED: int = 8
-        UNAUTHORIZED_FOR_COLLATERAL_INQUIRY: int = 9
-        OTHER: int = 99
-
-    # StrikeCurrency(947): CURRENCY
-    class StrikeCurrency:
-        tag: int = 947
-
-    # NoNested3PartyIDs(948): NUMINGROUP
-    class NoNested3PartyIDs:
-        tag: int = 948
-
-    # Nested3PartyID(949): STRING
-    class Nested3PartyID:
-        tag: int = 949
-
-    # Nested3PartyIDSource(950): CHAR
-    class Nested3PartyIDSource:
-        tag: int = 950
-
-    # Nested3PartyRole(951): INT
-    class Nested3PartyRole:
-        tag: int = 951
-
-    # NoNested3PartySubIDs(952): NUMINGROUP
-    class NoNested3PartySubIDs:
-        tag: int = 952
-
-    # Nested3PartySubID(953): STRING
-    class Nested3PartySubID:
-        tag: int = 953
-
-    # Nested3PartySubIDType(954): INT
-    class Nested3PartySubIDType:
-        tag: int = 954
-
-    # LegContractSettlMonth(955): MONTHYEAR
-    class LegContractSettlMonth:
-        tag: int = 955
-
-    # LegInterestAccrualDate(956): LOCALMKTDATE
-    class LegInterestAccrualDate:
-        tag: int = 956
-
-    # NoStrategyParameters(957): NUMINGROUP
-    class NoStrategyParameters:
-        tag: int = 957
-
-    # StrategyParameterName(958): STRING
-    class StrategyParameterName:
-        tag: int = 958
-
-    # StrategyParameterType(959): INT
-    class StrategyParameterType:
-        tag: int = 959
-        INT: int = 1
-        LENGTH: int = 2
-        NUMINGROUP: int = 3
-        SEQNUM: int = 4
-        TAGNUM: int = 5
-        FLOAT: int = 6
-        QTY: int = 7
-        PRICE: int = 8
-        PRICEOFFSET: int = 9
-        AMT: int = 10
-        PERCENTAGE: int = 11
-        CHAR: int = 12
-        BOOLEAN: int = 13
-        STRING: int = 14
-        MULTIPLECHARVALUE: int = 15
-        CURRENCY: int = 16
-        EXCHANGE: int = 17
-        MONTH_YEAR: int = 18
-        UTCTIMESTAMP: int = 19
-        UTCTIMEONLY: int = 20
-        LOCALMKTTIME: int = 21
-        UTCDATE: int = 22
-        DATA: int = 23
-        MULTIPLESTRINGVALUE: int = 24
-
-    # StrategyParameterValue(960): STRING
-    class StrategyParameterValue:
-        tag: int = 960
-
-    # HostCrossID(961): STRING
-    class HostCrossID:
-        tag: int = 961
-
-    # SideTimeInForce(962): UTCTIMESTAMP
-    class SideTimeInForce:
-        tag: int = 962
-
-    # MDReportID(963): INT
-    class MDReportID:
-        tag: int = 963
-
-    # SecurityReportID(964): INT
-    class SecurityReportID:
-        tag: int = 964
-
-    # SecurityStatusID(965): STRING
-    class SecurityStatusID:
-        tag: int = 965
-        ACTIVE: str = "1"
-        INACTIVE: str = "2"
-
-    # SettleOnOpenFlag(966): STRING
-    class SettleOnOpenFlag:
-        tag: int = 966
-
-    # StrikeMultiplier(967): FLOAT
-    class StrikeMultiplier:
-        tag: int = 967
-
-    # StrikeValue(968): FLOAT
-    class StrikeValue:
-        tag: int = 968
-
-    # MinPriceIncrement(969): FLOAT
-    class MinPriceIncrement:
-        tag: int = 969
-
-    # PositionLimit(970): INT
-    class PositionLimit:
-        tag: int = 970
-
-    # NTPositionLimit(971): INT
-    class NTPositionLimit:
-        tag: int = 971
-
-    # UnderlyingAllocationPercent(972): PERCENTAGE
-    class UnderlyingAllocationPercent:
-        tag: int = 972
-
-    # UnderlyingCashAmount(973): AMT
-    class UnderlyingCashAmount:
-        tag: int = 973
-
-    # UnderlyingCashType(974): STRING
-    class UnderlyingCashType:
-        tag: int = 974
-        FIXED: str = "FIXED"
-        DIFF: str = "DIFF"
-
-    # UnderlyingSettlementType(975): INT
-    class UnderlyingSettlementType:
-        tag: int = 975
-        T_PLUS_1: int = 2
-        T_PLUS_3: int = 4
-        T_PLUS_4: int = 5
-
-    # QuantityDate(976): LOCALMKTDATE
-    class QuantityDate:
-        tag: int = 976
-
-    # ContIntRptID(977): STRING
-    class ContIntRptID:
-        tag: int = 977
-
-    # LateIndicator(978): BOOLEAN
-    class LateIndicator:
-        tag: int = 978
-
-    # InputSource(979): STRING
-    class InputSource:
-        tag: int = 979
-
-    # SecurityUpdateAction(980): CHAR
-    class SecurityUpdateAction:
-        tag: int = 980
-        ADD: str = 'A'
-        DELETE: str = 'D'
-        MODIFY: str = 'M'
-
-    # NoExpiration(981): NUMINGROUP
-    class NoExpiration:
-        tag: int = 981
-
-    # ExpirationQtyType(982): INT
-    class ExpirationQtyType:
-        tag: int = 982
-        AUTO_EXERCISE: int = 1
-        NON_AUTO_EXERCISE: int = 2
-        FINAL_WILL_BE_EXERCISED: int = 3
-        CONTRARY_INTENTION: int = 4
-        DIFFERENCE: int = 5
-
-    # ExpQty(983): QTY
-    class ExpQty:
-        tag: int = 983
-
-    # NoUnderlyingAmounts(984): NUMINGROUP
-    class NoUnderlyingAmounts:
-        tag: int = 984
-
-    # UnderlyingPayAmount(985): AMT
-    class UnderlyingPayAmount:
-        tag: int = 985
-
-    # UnderlyingCollectAmount(986): AMT
-    class UnderlyingCollectAmount:
-        tag: int = 986
-
-    # UnderlyingSettlementDate(987): LOCALMKTDATE
-    class UnderlyingSettlementDate:
-        tag: int = 987
-
-    # UnderlyingSettlementStatus(988): STRING
-    class UnderlyingSettlementStatus:
-        tag: int = 988
-
-    # SecondaryIndividualAllocID(989): STRING
-    class SecondaryIndividualAllocID:
-        tag: int = 989
-
-    # LegReportID(990): STRING
-    class LegReportID:
-        tag: int = 990
-
-    # RndPx(991): PRICE
-    class RndPx:
-        tag: int = 991
-
-    # IndividualAllocType(992): INT
-    class IndividualAllocType:
-        tag: int = 992
-        SUB_ALLOCATE: int = 1
-        THIRD_PARTY_ALLOCATION: int = 2
-
-    # AllocCustomerCapacity(993): STRING
-    class AllocCustomerCapacity:
-        tag: int = 993
-
-    # TierCode(994): STRING
-    class TierCode:
-        tag: int = 994
-
-    # UnitOfMeasure(996): STRING
-    class UnitOfMeasure:
-        tag: int = 996
-        MEGAWATT_HOURS: str = "MWh"
-        ONE_MILLION_BTU: str = "MMBtu"
-        BARRELS: str = "Bbl"
-        GALLONS: str = "Gal"
-        METRIC_TONS: str = "t"
-        TONS: str = "tn"
-        MILLION_BARRELS: str = "MMbbl"
-        POUNDS: str = "lbs"
-        TROY_OUNCES: str = "oz_tr"
-        US_DOLLARS: str = "USD"
-        BILLION_CUBIC_FEET: str = "Bcf"
-        BUSHELS: str = "Bu"
-
-    # TimeUnit(997): STRING
-    class TimeUnit:
-        tag: int = 997
-        SECOND: str = "S"
-        MINUTE: str = "Min"
-        HOUR: str = "H"
-        DAY: str = "D"
-        WEEK: str = "Wk"
-        MONTH: str = "Mo"
-        YEAR: str = "Yr"
-
-    # UnderlyingUnitOfMeasure(998): STRING
-    class UnderlyingUnitOfMeasure:
-        tag: int = 998
-
-    # LegUnitOfMeasure(999): STRING
-    class LegUnitOfMeasure:
-        tag: int = 999
-
-    # UnderlyingTimeUnit(1000): STRING
-    class UnderlyingTimeUnit:
-        tag: int = 1000
-
-    # LegTimeUnit(1001): STRING
-    class LegTimeUnit:
-        tag: int = 1001
-
-    # AllocMethod(1002): INT
-    class AllocMethod:
-        tag: int = 1002
-        AUTOMATIC: int = 1
-        GUARANTOR: int = 2
-        MANUAL: int = 3
-
-    # TradeID(1003): STRING
-    class TradeID:
-        tag: int = 1003
-
-    # SideTradeReportID(1005): STRING
-    class SideTradeReportID:
-        tag: int = 1005
-
-    # SideFillStationCd(1006): STRING
-    class SideFillStationCd:
-        tag: int = 1006
-
-    # SideReasonCd(1007): STRING
-    class SideReasonCd:
-        tag: int = 1007
-
-    # SideTrdSubTyp(1008): INT
-    class SideTrdSubTyp:
-        tag: int = 1008
-        CMTA: int = 0
-        INTERNAL_TRANSFER: int = 1
-        EXTERNAL_TRANSFER: int = 2
-        REJECT_FOR_SUBMITTING_TRADE: int = 3
-        ADVISORY_FOR_CONTRA_SIDE: int = 4
-        OFFSET_DUE_TO_AN_ALLOCATION: int = 5
-        ONSET_DUE_TO_AN_ALLOCATION: int = 6
-        DIFFERENTIAL_SPREAD: int = 7
-        IMPLIED_SPREAD_LEG_EXECUTED_AGAINST_AN_OUTRIGHT: int = 8
-        TRANSACTION_FROM_EXERCISE: int = 9
-        TRANSACTION_FROM_ASSIGNMENT: int = 10
-
-    # SideQty(1009): INT
-    class SideQty:
-        tag: int = 1009
-
-    # MessageEventSource(1011): STRING
-    class MessageEventSource:
-        tag: int = 1011
-
-    # SideTrdRegTimestamp(1012): UTCTIMESTAMP
-    class SideTrdRegTimestamp:
-        tag: int = 1012
-
-    # SideTrdRegTimestampType(1013): INT
-    class SideTrdRegTimestampType:
-        tag: int = 1013
-
-    # SideTrdRegTimestampSrc(1014): STRING
-    class SideTrdRegTimestampSrc:
-        tag: int = 1014
-
-    # AsOfIndicator(1015): CHAR
-    class AsOfIndicator:
-        tag: int = 1015
-        FALSE: str = '0'
-        TRUE: str = '1'
-
-    # NoSideTrdRegTS(1016): NUMINGROUP
-    class NoSideTrdRegTS:
-        tag: int = 1016
-
-    # LegOptionRatio(1017): FLOAT
-    class LegOptionRatio:
-        tag: int = 1017
-
-    # NoInstrumentParties(1018): NUMINGROUP
-    class NoInstrumentParties:
-        tag: int = 1018
-
-    # InstrumentPartyID(1019): STRING
-    class InstrumentPartyID:
-        tag: int = 1019
-
-    # TradeVolume(1020): QTY
-    class TradeVolume:
-        tag: int = 1020
-
-    # MDBookType(1021): INT
-    class MDBookType:
-        tag: int = 1021
-        TOP_OF_BOOK: int = 1
-        PRICE_DEPTH: int = 2
-        ORDER_DEPTH: int = 3
-
-    # MDFeedType(1022): STRING
-    class MDFeedType:
-        tag: int = 1022
-
-    # MDPriceLevel(1023): INT
-    class MDPriceLevel:
-        tag: int = 1023
-
-    # MDOriginType(1024): INT
-    class MDOriginType:
-        tag: int = 1024
-        BOOK: int = 0
-        OFF_BOOK: int = 1
-        CROSS: int = 2
-
-    # FirstPx(1025): PRICE
-    class FirstPx:
-        tag: int = 1025
-
-    # MDEntrySpotRate(1026): FLOAT
-    class MDEntrySpotRate:
-        tag: int = 1026
-
-    # MDEntryForwardPoints(1027): PRICEOFFSET
-    class MDEntryForwardPoints:
-        tag: int = 1027
-
-    # ManualOrderIndicator(1028): BOOLEAN
-    class ManualOrderIndicator:
-        tag: int = 1028
-
-    # CustDirectedOrder(1029): BOOLEAN
-    class CustDirectedOrder:
-        tag: int = 1029
-
-    # ReceivedDeptID(1030): STRING
-    class ReceivedDeptID:
-        tag: int = 1030
-
-    # CustOrderHandlingInst(1031): MULTIPLESTRINGVALUE
-    class CustOrderHandlingInst:
-        tag: int = 1031
-        ADD_ON_ORDER: str = "ADD"
-        ALL_OR_NONE: str = "AON"
-        CASH_NOT_HELD: str = "CNH"
-        DIRECTED_ORDER: str = "DIR"
-        EXCHANGE_FOR_PHYSICAL_TRANSACTION: str = "E.W"
-        FILL_OR_KILL: str = "FOK"
-        IMBALANCE_ONLY: str = "IO"
-        IMMEDIATE_OR_CANCEL: str = "IOC"
-        LIMIT_ON_OPEN: str = "LOO"
-        LIMIT_ON_CLOSE: str = "LOC"
-        MARKET_AT_OPEN: str = "MAO"
-        MARKET_AT_CLOSE: str = "MAC"
-        MARKET_ON_OPEN: str = "MOO"
-        MARKET_ON_CLOSE: str = "MOC"
-        MINIMUM_QUANTITY: str = "MQT"
-        NOT_HELD: str = "NH"
-        OVER_THE_DAY: str = "OVD"
-        PEGGED: str = "PEG"
-        RESERVE_SIZE_ORDER: str = "RSV"
-        STOP_STOCK_TRANSACTION: str = "S.W"
-        SCALE: str = "SCL"
-        TIME_ORDER: str = "TMO"
-        TRAILING_STOP: str = "TS"
-        WORK: str = "WRK"
-
-    # OrderHandlingInstSource(1032): INT
-    class OrderHandlingInstSource:
-        tag: int = 1032
-        NASD_OATS: int = 1
-
-    # DeskType(1033): STRING
-    class DeskType:
-        tag: int = 1033
-        AGENCY: str = "A"
-        ARBITRAGE: str = "AR"
-        DERIVATIVES: str = "D"
-        INTERNATIONAL: str = "IN"
-        INSTITUTIONAL: str = "IS"
-        OTHER: str = "O"
-        PREFERRED_TRADING: str = "PF"
-        PROPRIETARY: str = "PR"
-        PROGRAM_TRADING: str = "PT"
-        SALES: str = "S"
-        TRADING: str = "T"
-
-    # DeskTypeSource(1034): INT
-    class DeskTypeSource:
-        tag: int = 1034
-        NASD_OATS: int = 1
-
-    # DeskOrderHandlingInst(1035): MULTIPLESTRINGVALUE
-    class DeskOrderHandlingInst:
-        tag: int = 1035
-        ADD_ON_ORDER: str = "ADD"
-        ALL_OR_NONE: str = "AON"
-        CASH_NOT_HELD: str = "CNH"
-        DIRECTED_ORDER: str = "DIR"
-        EXCHANGE_FOR_PHYSICAL_TRANSACTION: str = "E.W"
-        FILL_OR_KILL: str = "FOK"
-        IMBALANCE_ONLY: str = "IO"
-        IMMEDIATE_OR_CANCEL: str = "IOC"
-        LIMIT_ON_OPEN: str = "LOO"
-        LIMIT_ON_CLOSE: str = "LOC"
-        MARKET_AT_OPEN: str = "MAO"
-        MARKET_AT_CLOSE: str = "MAC"
-        MARKET_ON_OPEN: str = "MOO"
-        MARKET_ON_CLOSE: str = "MOC"
-        MINIMUM_QUANTITY: str = "MQT"
-        NOT_HELD: str = "NH"
-        OVER_THE_DAY: str = "OVD"
-        PEGGED: str = "PEG"
-        RESERVE_SIZE_ORDER: str = "RSV"
-        STOP_STOCK_TRANSACTION: str = "S.W"
-        SCALE: str = "SCL"
-        TIME_ORDER: str = "TMO"
-        TRAILING_STOP: str = "TS"
-        WORK: str = "WRK"
-
-    # ExecAckStatus(1036): CHAR
-    class ExecAckStatus:
-        tag: int = 1036
-        RECEIVED_NOT_YET_PROCESSED: str = '0'
-        ACCEPTED: str = '1'
-        DONT_KNOW: str = '2'
-
-    # UnderlyingDeliveryAmount(1037): AMT
-    class UnderlyingDeliveryAmount:
-        tag: int = 1037
-
-    # UnderlyingCapValue(1038): AMT
-    class UnderlyingCapValue:
-        tag: int = 1038
-
-    # UnderlyingSettlMethod(1039): STRING
-    class UnderlyingSettlMethod:
-        tag: int = 1039
-
-    # SecondaryTradeID(1040): STRING
-    class SecondaryTradeID:
-        tag: int = 1040
-
-    # FirmTradeID(1041): STRING
-    class FirmTradeID:
-        tag: int = 1041
-
-    # SecondaryFirmTradeID(1042): STRING
-    class SecondaryFirmTradeID:
-        tag: int = 1042
-
-    # CollApplType(1043): INT
-    class CollApplType:
-        tag: int = 1043
-        SPECIFIC_DEPOSIT: int = 0
-        GENERAL: int = 1
-
-    # UnderlyingAdjustedQuantity(1044): QTY
-    class UnderlyingAdjustedQuantity:
-        tag: int = 1044
-
-    # UnderlyingFXRate(1045): FLOAT
-    class UnderlyingFXRate:
-        tag: int = 1045
-
-    # UnderlyingFXRateCalc(1046): CHAR
-    class UnderlyingFXRateCalc:
-        tag: int = 1046
-        MULTIPLY: str = 'M'
-        DIVIDE: str = 'D'
-
-    # AllocPositionEffect(1047): CHAR
-    class AllocPositionEffect:
-        tag: int = 1047
-        OPEN: str = 'O'
-        CLOSE: str = 'C'
-        ROLLED: str = 'R'
-        FIFO: str = 'F'
-
-    # DealingCapacity(1048): PRICEOFFSET
-    class DealingCapacity:
-        tag: int = 1048
-
-    # InstrmtAssignmentMethod(1049): CHAR
-    class InstrmtAssignmentMethod:
-        tag: int = 1049
-
-    # InstrumentPartyIDSource(1050): CHAR
-    class InstrumentPartyIDSource:
-        tag: int = 1050
-
-    # InstrumentPartyRole(1051): INT
-    class InstrumentPartyRole:
-        tag: int = 1051
-
-    # NoInstrumentPartySubIDs(1052): NUMINGROUP
-    class NoInstrumentPartySubIDs:
-        tag: int = 1052
-
-    # InstrumentPartySubID(1053): STRING
-    class InstrumentPartySubID:
-        tag: int = 1053
-
-    # InstrumentPartySubIDType(1054): INT
-    class InstrumentPartySubIDType:
-        tag: int = 1054
-
-    # PositionCurrency(1055): STRING
-    class PositionCurrency:
-        tag: int = 1055
-
-    # CalculatedCcyLastQty(1056): QTY
-    class CalculatedCcyLastQty:
-        tag: int = 1056
-
-    # AggressorIndicator(1057): BOOLEAN
-    class AggressorIndicator:
-        tag: int = 1057
-        YES: str = 'Y'
-        NO: str = 'N'
-
-    # NoUndlyInstrumentParties(1058): NUMINGROUP
-    class NoUndlyInstrumentParties:
-        tag: int = 1058
-
-    # UndlyInstrumentPartyID(1059): STRING
-    class UndlyInstrumentPartyID:
-        tag: int = 1059
-
-    # UndlyInstrumentPartyIDSource(1060): CHAR
-    class UndlyInstrumentPartyIDSource:
-        tag: int = 1060
-
-    # UndlyInstrumentPartyRole(1061): INT
-    class UndlyInstrumentPartyRole:
-        tag: int = 1061
-
-    # NoUndlyInstrumentPartySubIDs(1062): NUMINGROUP
-    class NoUndlyInstrumentPartySubIDs:
-        tag: int = 1062
-
-    # UndlyInstrumentPartySubID(1063): STRING
-    class UndlyInstrumentPartySubID:
-        tag: int = 1063
-
-    # UndlyInstrumentPartySubIDType(1064): INT
-    class UndlyInstrumentPartySubIDType:
-        tag: int = 1064
-
-    # BidSwapPoints(1065): PRICEOFFSET
-    class BidSwapPoints:
-        tag: int = 1065
-
-    # OfferSwapPoints(1066): PRICEOFFSET
-    class OfferSwapPoints:
-        tag: int = 1066
-
-    # LegBidForwardPoints(1067): PRICEOFFSET
-    class LegBidForwardPoints:
-        tag: int = 1067
-
-    # LegOfferForwardPoints(1068): PRICEOFFSET
-    class LegOfferForwardPoints:
-        tag: int = 1068
-
-    # SwapPoints(1069): PRICEOFFSET
-    class SwapPoints:
-        tag: int = 1069
-
-    # MDQuoteType(1070): INT
-    class MDQuoteType:
-        tag: int = 1070
-        INDICATIVE: int = 0
-        TRADEABLE: int = 1
-        RESTRICTED_TRADEABLE: int = 2
-        COUNTER: int = 3
-        INDICATIVE_AND_TRADEABLE: int = 4
-
-    # LastSwapPoints(1071): PRICEOFFSET
-    class LastSwapPoints:
-        tag: int = 1071
-
-    # SideGrossTradeAmt(1072): AMT
-    class SideGrossTradeAmt:
-        tag: int = 1072
-
-    # LegLastForwardPoints(1073): PRICEOFFSET
-    class LegLastForwardPoints:
-        tag: int = 1073
-
-    # LegCalculatedCcyLastQty(1074): QTY
-    class LegCalculatedCcyLastQty:
-        tag: int = 1074
-
-    # LegGrossTradeAmt(1075): AMT
-    class LegGrossTradeAmt:
-        tag: int = 1075
-
-    # MaturityTime(1079): TZTIMEONLY
-    class MaturityTime:
-        tag: int = 1079
-
-    # RefOrderID(1080): STRING
-    class RefOrderID:
-        tag: int = 1080
-
-    # RefOrderIDSource(1081): CHAR
-    class RefOrderIDSource:
-        tag: int = 1081
-        SECONDARYORDERID: str = '0'
-        ORDERID: str = '1'
-        MDENTRYID: str = '2'
-        QUOTEENTRYID: str = '3'
-
-    # SecondaryDisplayQty(1082): QTY
-    class SecondaryDisplayQty:
-        tag: int = 1082
-
-    # DisplayWhen(1083): CHAR
-    class DisplayWhen:
-        tag: int = 1083
-        IMMEDIATE: str = '1'
-        EXHAUST: str = '2'
-
-    # DisplayMethod(1084): CHAR
-    class DisplayMethod:
-        tag: int = 1084
-        INITIAL: str = '1'
-        NEW: str = '2'
-        RANDOM: str = '3'
-
-    # DisplayLowQty(1085): QTY
-    class DisplayLowQty:
-        tag: int = 1085
-
-    # DisplayHighQty(1086): QTY
-    class DisplayHighQty:
-        tag: int = 1086
-
-    # DisplayMinIncr(1087): QTY
-    class DisplayMinIncr:
-        tag: int = 1087
-
-    # RefreshQty(1088): QTY
-    class RefreshQty:
-        tag: int = 1088
-
-    # MatchIncrement(1089): QTY
-    class MatchIncrement:
-        tag: int = 1089
-
-    # MaxPriceLevels(1090): INT
-    class MaxPriceLevels:
-        tag: int = 1090
-
-    # PreTradeAnonymity(1091): BOOLEAN
-    class PreTradeAnonymity:
-        tag: int = 1091
-
-    # PriceProtectionScope(1092): CHAR
-    class PriceProtectionScope:
-        tag: int = 1092
-        NONE: str = '0'
-        LOCAL: str = '1'
-        NATIONAL: str = '2'
-        GLOBAL: str = '3'
-
-    # LotType(1093): CHAR
-    class LotType:
-        tag: int = 1093
-        ODD_LOT: str = '1'
-        ROUND_LOT: str = '2'
-        BLOCK_LOT: str = '3'
-
-    # PegPriceType(1094): INT
-    class PegPriceType:
-        tag: int = 1094
-        LAST_PEG: int = 1
-        MID_PRICE_PEG: int = 2
-        OPENING_PEG: int = 3
-        MARKET_PEG: int = 4
-        PRIMARY_PEG: int = 5
-        PEG_TO_VWAP: int = 7
-        TRAILING_STOP_PEG: int = 8
-        PEG_TO_LIMIT_PRICE: int = 9
-
-    # PeggedRefPrice(1095): PRICE
-    class PeggedRefPrice:
-        tag: int = 1095
-
-    # PegSecurityIDSource(1096): STRING
-    class PegSecurityIDSource:
-        tag: int = 1096
-
-    # PegSecurityID(1097): STRING
-    class PegSecurityID:
-        tag: int = 1097
-
-    # PegSymbol(1098): STRING
-    class PegSymbol:
-        tag: int = 1098
-
-    # PegSecurityDesc(1099): STRING
-    class PegSecurityDesc:
-        tag: int = 1099
-
-    # TriggerType(1100): CHAR
-    class TriggerType:
-        tag: int = 1100
-        PARTIAL_EXECUTION: str = '1'
-        SPECIFIED_TRADING_SESSION: str = '2'
-        NEXT_AUCTION: str = '3'
-        PRICE_MOVEMENT: str = '4'
-
-    # TriggerAction(1101): CHAR
-    class TriggerAction:
-        tag: int = 1101
-        ACTIVATE: str = '1'
-        MODIFY: str = '2'
-        CANCEL: str = '3'
-
-    # TriggerPrice(1102): PRICE
-    class TriggerPrice:
-        tag: int = 1102
-
-    # TriggerSymbol(1103): STRING
-    class TriggerSymbol:
-        tag: int = 1103
-
-    # TriggerSecurityID(1104): STRING
-    class TriggerSecurityID:
-        tag: int = 1104
-
-    # TriggerSecurityIDSource(1105): STRING
-    class TriggerSecurityIDSource:
-        tag: int = 1105
-
-    # TriggerSecurityDesc(1106): STRING
-    class TriggerSecurityDesc:
-        tag: int = 1106
-
-    # TriggerPriceType(1107): CHAR
-    class TriggerPriceType:
-        tag: int = 1107
-        BEST_OFFER: str = '1'
-        LAST_TRADE: str = '2'
-        BEST_BID: str = '3'
-        BEST_BID_OR_LAST_TRADE: str = '4'
-        BEST_OFFER_OR_LAST_TRADE: str = '5'
-        BEST_MID: str = '6'
-
-    # TriggerPriceTypeScope(1108): CHAR
-    class TriggerPriceTypeScope:
-        tag: int = 1108
-        NONE: str = '0'
-        LOCAL: str = '1'
-        NATIONAL: str = '2'
-        GLOBAL: str = '3'
-
-    # TriggerPriceDirection(1109): CHAR
-    class TriggerPriceDirection:
-        tag: int = 1109
-        TRIGGER_IF_THE_PRICE_OF_THE_SPECIFIED_TYPE_GOES_UP_TO_OR_THROUGH_THE_SPECIFIED_TRIGGER_PRICE: str = 'U'
-        TRIGGER_IF_THE_PRICE_OF_THE_SPECIFIED_TYPE_GOES_DOWN_TO_OR_THROUGH_THE_SPECIFIED_TRIGGER_PRICE: str = 'D'
-
-    # TriggerNewPrice(1110): PRICE
-    class TriggerNewPrice:
-        tag: int = 1110
-
-    # TriggerOrderType(1111): CHAR
-    class TriggerOrderType:
-        tag: int = 1111
-        MARKET: str = '1'
-        LIMIT: str = '2'
-
-    # TriggerNewQty(1112): QTY
-    class TriggerNewQty:
-        tag: int = 1112
-
-    # TriggerTradingSessionID(1113): STRING
-    class TriggerTradingSessionID:
-        tag: int = 1113
-
-    # TriggerTradingSessionSubID(1114): STRING
-    class TriggerTradingSessionSubID:
-        tag: int = 1114
-
-    # OrderCategory(1115): CHAR
-    class OrderCategory:
-        tag: int = 1115
-        ORDER: str = '1'
-        QUOTE: str = '2'
-        PRIVATELY_NEGOTIATED_TRADE: str = '3'
-        MULTILEG_ORDER: str = '4'
-        LINKED_ORDER: str = '5'
-        QUOTE_REQUEST: str = '6'
-        IMPLIED_ORDER: str = '7'
-        CROSS_ORDER: str = '8'
-        STREAMING_PRICE: str = '9'
-
-    # NoRootPartyIDs(1116): NUMINGROUP
-    class NoRootPartyIDs:
-        tag: int = 1116
-
-    # RootPartyID(1117): STRING
-    class RootPartyID:
-        tag: int = 1117
-
-    # RootPartyIDSource(1118): CHAR
-    class RootPartyIDSource:
-        tag: int = 1118
-
-    # RootPartyRole(1119): INT
-    class RootPartyRole:
-        tag: int = 1119
-
-    # NoRootPartySubIDs(1120): NUMINGROUP
-    class NoRootPartySubIDs:
-        tag: int = 1120
-
-    # RootPartySubID(1121): STRING
-    class RootPartySubID:
-        tag: int = 1121
-
-    # RootPartySubIDType(1122): INT
-    class RootPartySubIDType:
-        tag: int = 1122
-
-    # TradeHandlingInstr(1123): CHAR
-    class TradeHandlingInstr:
-        tag: int = 1123
-        TRADE_CONFIRMATION: str = '0'
-        TWO_PARTY_REPORT: str = '1'
-        ONE_PARTY_REPORT_FOR_MATCHING: str = '2'
-        ONE_PARTY_REPORT_FOR_PASS_THROUGH: str = '3'
-        AUTOMATED_FLOOR_ORDER_ROUTING: str = '4'
-        TWO_PARTY_REPORT_FOR_CLAIM: str = '5'
-
-    # OrigTradeHandlingInstr(1124): CHAR
-    class OrigTradeHandlingInstr:
-        tag: int = 1124
-
-    # OrigTradeDate(1125): LOCALMKTDATE
-    class OrigTradeDate:
-        tag: int = 1125
-
-    # OrigTradeID(1126): STRING
-    class OrigTradeID:
-        tag: int = 1126
-
-    # OrigSecondaryTradeID(1127): STRING
-    class OrigSecondaryTradeID:
-        tag: int = 1127
-
-    # ApplVerID(1128): STRING
-    class ApplVerID:
-        tag: int = 1128
-        FIX27: str = "0"
-        FIX30: str = "1"
-        FIX40: str = "2"
-        FIX41: str = "3"
-        FIX42: str = "4"
-        FIX43: str = "5"
-        FIX44: str = "6"
-        FIX50: str = "7"
-        FIX50SP1: str = "8"
-
-    # CstmApplVerID(1129): STRING
-    class CstmApplVerID:
-        tag: int = 1129
-
-    # RefApplVerID(1130): STRING
-    class RefApplVerID:
-        tag: int = 1130
-
-    # RefCstmApplVerID(1131): STRING
-    class RefCstmApplVerID:
-        tag: int = 1131
-
-    # TZTransactTime(1132): TZTIMESTAMP
-    class TZTransactTime:
-        tag: int = 1132
-
-    # ExDestinationIDSource(1133): CHAR
-    class ExDestinationIDSource:
-        tag: int = 1133
-        BIC: str = 'B'
-        GENERALLY_ACCEPTED_MARKET_PARTICIPANT_IDENTIFIER: str = 'C'
-        PROPRIETARY: str = 'D'
-        ISO_COUNTRY_CODE: str = 'E'
-        MIC: str = 'G'
-
-    # ReportedPxDiff(1134): BOOLEAN
-    class ReportedPxDiff:
-        tag: int = 1134
-
-    # RptSys(1135): STRING
-    class RptSys:
-        tag: int = 1135
-
-    # AllocClearingFeeIndicator(1136): STRING
-    class AllocClearingFeeIndicator:
-        tag: int = 1136
-
-    # DefaultApplVerID(1137): STRING
-    class DefaultApplVerID:
-        tag: int = 1137
-
-    # DisplayQty(1138): QTY
-    class DisplayQty:
-        tag: int = 1138
-
-    # ExchangeSpecialInstructions(1139): STRING
-    class ExchangeSpecialInstructions:
-        tag: int = 1139
-
-    # MaxTradeVol(1140): QTY
-    class MaxTradeVol:
-        tag: int = 1140
-
-    # NoMDFeedTypes(1141): NUMINGROUP
-    class NoMDFeedTypes:
-        tag: int = 1141
-
-    # MatchAlgorithm(1142): STRING
-    class MatchAlgorithm:
-        tag: int = 1142
-
-    # MaxPriceVariation(1143): FLOAT
-    class MaxPriceVariation:
-        tag: int = 1143
-
-    # ImpliedMarketIndicator(1144): INT
-    class ImpliedMarketIndicator:
-        tag: int = 1144
-        NOT_IMPLIED: int = 0
-        IMPLIED_IN: int = 1
-        IMPLIED_OUT: int = 2
-        BOTH_IMPLIED_IN_AND_IMPLIED_OUT: int = 3
-
-    # EventTime(1145): UTCTIMESTAMP
-    class EventTime:
-        tag: int = 1145
-
-    # MinPriceIncrementAmount(1146): AMT
-    class MinPriceIncrementAmount:
-        tag: int = 1146
-
-    # UnitOfMeasureQty(1147): QTY
-    class UnitOfMeasureQty:
-        tag: int = 1147
-
-    # LowLimitPrice(1148): PRICE
-    class LowLimitPrice:
-        tag: int = 1148
-
-    # HighLimitPrice(1149): PRICE
-    class HighLimitPrice:
-        tag: int = 1149
-
-    # TradingReferencePrice(1150): PRICE
-    class TradingReferencePrice:
-        tag: int = 1150
-
-    # SecurityGroup(1151): STRING
-    class SecurityGroup:
-        tag: int = 1151
-
-    # LegNumber(1152): INT
-    class LegNumber:
-        tag: int = 1152
-
-    # SettlementCycleNo(1153): INT
-    class SettlementCycleNo:
-        tag: int = 1153
-
-    # SideCurrency(1154): CURRENCY
-    class SideCurrency:
-        tag: int = 1154
-
-    # SideSettlCurrency(1155): CURRENCY
-    class SideSettlCurrency:
-        tag: int = 1155
-
-    # ApplExtID(1156): INT
-    class ApplExtID:
-        tag: int = 1156
-
-    # CcyAmt(1157): AMT
-    class CcyAmt:
-        tag: int = 1157
-
-    # NoSettlDetails(1158): NUMINGROUP
-    class NoSettlDetails:
-        tag: int = 1158
-
-    # SettlObligMode(1159): INT
-    class SettlObligMode:
-        tag: int = 1159
-        PRELIMINARY: int = 1
-        FINAL: int = 2
-
-    # SettlObligMsgID(1160): STRING
-    class SettlObligMsgID:
-        tag: int = 1160
-
-    # SettlObligID(1161): STRING
-    class SettlObligID:
-        tag: int = 1161
-
-    # SettlObligTransType(1162): CHAR
-    class SettlObligTransType:
-        tag: int = 1162
-        CANCEL: str = 'C'
-        NEW: str = 'N'
-        REPLACE: str = 'R'
-        RESTATE: str = 'T'
-
-    # SettlObligRefID(1163): STRING
-    class SettlObligRefID:
-        tag: int = 1163
-
-    # SettlObligSource(1164): CHAR
-    class SettlObligSource:
-        tag: int = 1164
-        INSTRUCTIONS_OF_BROKER: str = '1'
-        INSTRUCTIONS_FOR_INSTITUTION: str = '2'
-        INVESTOR: str = '3'
-
-    # NoSettlOblig(1165): NUMINGROUP
-    class NoSettlOblig:
-        tag: int = 1165
-
-    # QuoteMsgID(1166): STRING
-    class QuoteMsgID:
-        tag: int = 1166
-
-    # QuoteEntryStatus(1167): INT
-    class QuoteEntryStatus:
-        tag: int = 1167
-        ACCEPTED: int = 0
-        REJECTED: int = 5
-        REMOVED_FROM_MARKET: int = 6
-        EXPIRED: int = 7
-        LOCKED_MARKET_WARNING: int = 12
-        CROSS_MARKET_WARNING: int = 13
-        CANCELED_DUE_TO_LOCK_MARKET: int = 14
-        CANCELED_DUE_TO_CROSS_MARKET: int = 15
-        ACTIVE: int = 16
-
-    # TotNoCxldQuotes(1168): INT
-    class TotNoCxldQuotes:
-        tag: int = 1168
-
-    # TotNoAccQuotes(1169): INT
-    class TotNoAccQuotes:
-        tag: int = 1169
-
-    # TotNoRejQuotes(1170): INT
-    class TotNoRejQuotes:
-        tag: int = 1170
-
-    # PrivateQuote(1171): BOOLEAN
-    class PrivateQuote:
-        tag: int = 1171
-
-    # RespondentType(1172): INT
-    class RespondentType:
-        tag: int = 1172
-        ALL_MARKET_PARTICIPANTS: int = 1
-        SPECIFIED_MARKET_PARTICIPANTS: int = 2
-        ALL_MARKET_MAKERS: int = 3
-        PRIMARY_MARKET_MAKER: int = 4
-
-    # MDSubBookType(1173): INT
-    class MDSubBookType:
-        tag: int = 1173
-
-    # SecurityTradingEvent(1174): INT
-    class SecurityTradingEvent:
-        tag: int = 1174
-        ORDER_IMBALANCE_AUCTION_IS_EXTENDED: int = 1
-        TRADING_RESUMES: int = 2
-        PRICE_VOLATILITY_INTERRUPTION: int = 3
-        CHANGE_OF_TRADING_SESSION: int = 4
-        CHANGE_OF_TRADING_SUBSESSION: int = 5
-        CHANGE_OF_SECURITY_STATUS: int = 6
-        CHANGE_OF_BOOK_TYPE: int = 7
-        CHANGE_OF_MARKET_DEPTH: int = 8
-
-    # NoStatsIndicators(1175): NUMINGROUP
-    class NoStatsIndicators:
-        tag: int = 1175
-
-    # StatsType(1176): INT
-    class StatsType:
-        tag: int = 1176
-        EXCHANGE_LAST: int = 1
-        HIGH: int = 2
-        AVERAGE_PRICE: int = 3
-        TURNOVER: int = 4
-
-    # NoOfSecSizes(1177): NUMINGROUP
-    class NoOfSecSizes:
-        tag: int = 1177
-
-    # MDSecSizeType(1178): INT
-    class MDSecSizeType:
-        tag: int = 1178
-        CUSTOMER: int = 1
-
-    # MDSecSize(1179): QTY
-    class MDSecSize:
-        tag: int = 1179
-
-    # ApplID(1180): STRING
-    class ApplID:
-        tag: int = 1180
-
-    # ApplSeqNum(1181): SEQNUM
-    class ApplSeqNum:
-        tag: int = 1181
-
-    # ApplBegSeqNum(1182): SEQNUM
-    class ApplBegSeqNum:
-        tag: int = 1182
-
-    # ApplEndSeqNum(1183): SEQNUM
-    class ApplEndSeqNum:
-        tag: int = 1183
-
-    # SecurityXMLLen(1184): LENGTH
-    class SecurityXMLLen:
-        tag: int = 1184
-
-    # SecurityXML(1185): XMLDATA
-    class SecurityXML:
-        tag: int = 1185
-
-    # SecurityXMLSchema(1186): STRING
-    class SecurityXMLSchema:
-        tag: int = 1186
-
-    # RefreshIndicator(1187): BOOLEAN
-    class RefreshIndicator:
-        tag: int = 1187
-
-    # Volatility(1188): FLOAT
-    class Volatility:
-        tag: int = 1188
-
-    # TimeToExpiration(1189): FLOAT
-    class TimeToExpiration:
-        tag: int = 1189
-
-    # RiskFreeRate(1190): FLOAT
-    class RiskFreeRate:
-        tag: int = 1190
-
-    # PriceUnitOfMeasure(1191): STRING
-    class PriceUnitOfMeasure:
-        tag: int = 1191
-
-    # PriceUnitOfMeasureQty(1192): QTY
-    class PriceUnitOfMeasureQty:
-        tag: int = 1192
-
-    # SettlMethod(1193): CHAR
-    class SettlMethod:
-        tag: int = 1193
-        CASH_SETTLEMENT_REQUIRED: str = 'C'
-        PHYSICAL_SETTLEMENT_REQUIRED: str = 'P'
-
-    # ExerciseStyle(1194): INT
-    class ExerciseStyle:
-        tag: int = 1194
-        EUROPEAN: int = 0
-        AMERICAN: int = 1
-        BERMUDA: int = 2
-
-    # OptPayAmount(1195): AMT
-    class OptPayAmount:
-        tag: int = 1195
-
-    # PriceQuoteMethod(1196): STRING
-    class PriceQuoteMethod:
-        tag: int = 1196
-        STANDARD: str = "STD"
-        INDEX: str = "INX"
-        INTEREST_RATE_INDEX: str = "INT"
-
-    # FuturesValuationMethod(1197): STRING
-    class FuturesValuationMethod:
-        tag: int = 1197
-        PREMIUM_STYLE: str = "EQTY"
-        FUTURES_STYLE_MARK_TO_MARKET: str = "FUT"
-        FUTURES_STYLE_WITH_AN_ATTACHED_CASH_ADJUSTMENT: str = "FUTDA"
-
-    # ListMethod(1198): INT
-    class ListMethod:
-        tag: int = 1198
-        PRE_LISTED_ONLY: int = 0
-        USER_REQUESTED: int = 1
-
-    # CapPrice(1199): PRICE
-    class CapPrice:
-        tag: int = 1199
-
-    # FloorPrice(1200): PRICE
-    class FloorPrice:
-        tag: int = 1200
-
-    # NoStrikeRules(1201): NUMINGROUP
-    class NoStrikeRules:
-        tag: int = 1201
-
-    # StartStrikePxRange(1202): PRICE
-    class StartStrikePxRange:
-        tag: int = 1202
-
-    # EndStrikePxRange(1203): PRICE
-    class EndStrikePxRange:
-        tag: int = 1203
-
-    # StrikeIncrement(1204): FLOAT
-    class StrikeIncrement:
-        tag: int = 1204
-
-    # NoTickRules(1205): NUMINGROUP
-    class NoTickRules:
-        tag: int = 1205
-
-    # StartTickPriceRange(1206): PRICE
-    class StartTickPriceRange:
-        tag: int = 1206
-
-    # EndTickPriceRange(1207): PRICE
-    class EndTickPriceRange:
-        tag: int = 1207
-
-    # TickIncrement(1208): PRICE
-    class TickIncrement:
-        tag: int = 1208
-
-    # TickRuleType(1209): INT
-    class TickRuleType:
-        tag: int = 1209
-        REGULAR: int = 0
-        VARIABLE: int = 1
-        FIXED: int = 2
-        TRADED_AS_A_SPREAD_LEG: int = 3
-        SETTLED_AS_A_SPREAD_LEG: int = 4
-
-    # NestedInstrAttribType(1210): INT
-    class NestedInstrAttribType:
-        tag: int = 1210
-
-    # NestedInstrAttribValue(1211): STRING
-    class NestedInstrAttribValue:
-        tag: int = 1211
-
-    # LegMaturityTime(1212): TZTIMEONLY
-    class LegMaturityTime:
-        tag: int = 1212
-
-    # UnderlyingMaturityTime(1213): TZTIMEONLY
-    class UnderlyingMaturityTime:
-        tag: int = 1213
-
-    # DerivativeSymbol(1214): STRING
-    class DerivativeSymbol:
-        tag: int = 1214
-
-    # DerivativeSymbolSfx(1215): STRING
-    class DerivativeSymbolSfx:
-        tag: int = 1215
-
-    # DerivativeSecurityID(1216): STRING
-    class DerivativeSecurityID:
-        tag: int = 1216
-
-    # DerivativeSecurityIDSource(1217): STRING
-    class DerivativeSecurityIDSource:
-        tag: int = 1217
-
-    # NoDerivativeSecurityAltID(1218): NUMINGROUP
-    class NoDerivativeSecurityAltID:
-        tag: int = 1218
-
-    # DerivativeSecurityAltID(1219): STRING
-    class DerivativeSecurityAltID:
-        tag: int = 1219
-
-    # DerivativeSecurityAltIDSource(1220): STRING
-    class DerivativeSecurityAltIDSource:
-        tag: int = 1220
-
-    # SecondaryLowLimitPrice(1221): PRICE
-    class SecondaryLowLimitPrice:
-        tag: int = 1221
-
-    # MaturityRuleID(1222): STRING
-    class MaturityRuleID:
-        tag: int = 1222
-
-    # StrikeRuleID(1223): STRING
-    class StrikeRuleID:
-        tag: int = 1223
-
-    # LegUnitOfMeasureQty(1224): QTY
-    class LegUnitOfMeasureQty:
-        tag: int = 1224
-
-    # DerivativeOptPayAmount(1225): AMT
-    class DerivativeOptPayAmount:
-        tag: int = 1225
-
-    # EndMaturityMonthYear(1226): MONTHYEAR
-    class EndMaturityMonthYear:
-        tag: int = 1226
-
-    # ProductComplex(1227): STRING
-    class ProductComplex:
-        tag: int = 1227
-
-    # DerivativeProductComplex(1228): STRING
-    class DerivativeProductComplex:
-        tag: int = 1228
-
-    # MaturityMonthYearIncrement(1229): INT
-    class MaturityMonthYearIncrement:
-        tag: int = 1229
-
-    # SecondaryHighLimitPrice(1230): PRICE
-    class SecondaryHighLimitPrice:
-        tag: int = 1230
-
-    # MinLotSize(1231): QTY
-    class MinLotSize:
-        tag: int = 1231
-
-    # NoExecInstRules(1232): NUMINGROUP
-    class NoExecInstRules:
-        tag: int = 1232
-
-    # NoLotTypeRules(1234): NUMINGROUP
-    class NoLotTypeRules:
-        tag: int = 1234
-
-    # NoMatchRules(1235): NUMINGROUP
-    class NoMatchRules:
-        tag: int = 1235
-
-    # NoMaturityRules(1236): NUMINGROUP
-    class NoMaturityRules:
-        tag: int = 1236
-
-    # NoOrdTypeRules(1237): NUMINGROUP
-    class NoOrdTypeRules:
-        tag: int = 1237
-
-    # NoTimeInForceRules(1239): NUMINGROUP
-    class NoTimeInForceRules:
-        tag: int = 1239
-
-    # SecondaryTradingReferencePrice(1240): PRICE
-    class SecondaryTradingReferencePrice:
-        tag: int = 1240
-
-    # StartMaturityMonthYear(1241): MONTHYEAR
-    class StartMaturityMonthYear:
-        tag: int = 1241
-
-    # FlexProductEligibilityIndicator(1242): BOOLEAN
-    class FlexProductEligibilityIndicator:
-        tag: int = 1242
-
-    # DerivFlexProductEligibilityIndicator(1243): BOOLEAN
-    class DerivFlexProductEligibilityIndicator:
-        tag: int = 1243
-
-    # FlexibleIndicator(1244): BOOLEAN
-    class FlexibleIndicator:
-        tag: int = 1244
-
-    # TradingCurrency(1245): CURRENCY
-    class TradingCurrency:
-        tag: int = 1245
-
-    # DerivativeProduct(1246): INT
-    class DerivativeProduct:
-        tag: int = 1246
-
-    # DerivativeSecurityGroup(1247): STRING
-    class DerivativeSecurityGroup:
-        tag: int = 1247
-
-    # DerivativeCFICode(1248): STRING
-    class DerivativeCFICode:
-        tag: int = 1248
-
-    # DerivativeSecurityType(1249): STRING
-    class DerivativeSecurityType:
-        tag: int = 1249
-
-    # DerivativeSecuritySubType(1250): STRING
-    class DerivativeSecuritySubType:
-        tag: int = 1250
-
-    # DerivativeMaturityMonthYear(1251): MONTHYEAR
-    class DerivativeMaturityMonthYear:
-        tag: int = 1251
-
-    # DerivativeMaturityDate(1252): LOCALMKTDATE
-    class DerivativeMaturityDate:
-        tag: int = 1252
-
-    # DerivativeMaturityTime(1253): TZTIMEONLY
-    class DerivativeMaturityTime:
-        tag: int = 1253
-
-    # DerivativeSettleOnOpenFlag(1254): STRING
-    class DerivativeSettleOnOpenFlag:
-        tag: int = 1254
-
-    # DerivativeInstrmtAssignmentMethod(1255): CHAR
-    class DerivativeInstrmtAssignmentMethod:
-        tag: int = 1255
-
-    # DerivativeSecurityStatus(1256): STRING
-    class DerivativeSecurityStatus:
-        tag: int = 1256
-
-    # DerivativeInstrRegistry(1257): STRING
-    class DerivativeInstrRegistry:
-        tag: int = 1257
-
-    # DerivativeCountryOfIssue(1258): COUNTRY
-    class DerivativeCountryOfIssue:
-        tag: int = 1258
-
-    # DerivativeStateOrProvinceOfIssue(1259): STRING
-    class DerivativeStateOrProvinceOfIssue:
-        tag: int = 1259
-
-    # DerivativeLocaleOfIssue(1260): STRING
-    class DerivativeLocaleOfIssue:
-        tag: int = 1260
-
-    # DerivativeStrikePrice(1261): PRICE
-    class DerivativeStrikePrice:
-        tag: int = 1261
-
-    # DerivativeStrikeCurrency(1262): CURRENCY
-    class DerivativeStrikeCurrency:
-        tag: int = 1262
-
-    # DerivativeStrikeMultiplier(1263): FLOAT
-    class DerivativeStrikeMultiplier:
-        tag: int = 1263
-
-    # DerivativeStrikeValue(1264): FLOAT
-    class DerivativeStrikeValue:
-        tag: int = 1264
-
-    # DerivativeOptAttribute(1265): CHAR
-    class DerivativeOptAttribute:
-        tag: int = 1265
-
-    # DerivativeContractMultiplier(1266): FLOAT
-    class DerivativeContractMultiplier:
-        tag: int = 1266
-
-    # DerivativeMinPriceIncrement(1267): FLOAT
-    class DerivativeMinPriceIncrement:
-        tag: int = 1267
-
-    # DerivativeMinPriceIncrementAmount(1268): AMT
-    class DerivativeMinPriceIncrementAmount:
-        tag: int = 1268
-
-    # DerivativeUnitOfMeasure(1269): STRING
-    class DerivativeUnitOfMeasure:
-        tag: int = 1269
-
-    # DerivativeUnitOfMeasureQty(1270): QTY
-    class DerivativeUnitOfMeasureQty:
-        tag: int = 1270
-
-    # DerivativeTimeUnit(1271): STRING
-    class DerivativeTimeUnit:
-        tag: int = 1271
-
-    # DerivativeSecurityExchange(1272): EXCHANGE
-    class DerivativeSecurityExchange:
-        tag: int = 1272
-
-    # DerivativePositionLimit(1273): INT
-    class DerivativePositionLimit:
-        tag: int = 1273
-
-    # DerivativeNTPositionLimit(1274): INT
-    class DerivativeNTPositionLimit:
-        tag: int = 1274
-
-    # DerivativeIssuer(1275): STRING
-    class DerivativeIssuer:
-        tag: int = 1275
-
-    # DerivativeIssueDate(1276): LOCALMKTDATE
-    class DerivativeIssueDate:
-        tag: int = 1276
-
-    # DerivativeEncodedIssuerLen(1277): LENGTH
-    class DerivativeEncodedIssuerLen:
-        tag: int = 1277
-
-    # DerivativeEncodedIssuer(1278): DATA
-    class DerivativeEncodedIssuer:
-        tag: int = 1278
-
-    # DerivativeSecurityDesc(1279): STRING
-    class DerivativeSecurityDesc:
-        tag: int = 1279
-
-    # DerivativeEncodedSecurityDescLen(1280): LENGTH
-    class DerivativeEncodedSecurityDescLen:
-        tag: int = 1280
-
-    # DerivativeEncodedSecurityDesc(1281): DATA
-    class DerivativeEncodedSecurityDesc:
-        tag: int = 1281
-
-    # DerivativeSecurityXMLLen(1282): LENGTH
-    class DerivativeSecurityXMLLen:
-        tag: int = 1282
-
-    # DerivativeSecurityXML(1283): DATA
-    class DerivativeSecurityXML:
-        tag: int = 1283
-
-    # DerivativeSecurityXMLSchema(1284): STRING
-    class DerivativeSecurityXMLSchema:
-        tag: int = 1284
-
-    # DerivativeContractSettlMonth(1285): MONTHYEAR
-    class DerivativeContractSettlMonth:
-        tag: int = 1285
-
-    # NoDerivativeEvents(1286): NUMINGROUP
-    class NoDerivativeEvents:
-        tag: int = 1286
-
-    # DerivativeEventType(1287): INT
-    class DerivativeEventType:
-        tag: int = 1287
-
-    # DerivativeEventDate(1288): LOCALMKTDATE
-    class DerivativeEventDate:
-        tag: int = 1288
-
-    # DerivativeEventTime(1289): UTCTIMESTAMP
-    class DerivativeEventTime:
-        tag: int = 1289
-
-    # DerivativeEventPx(1290): PRICE
-    class DerivativeEventPx:
-        tag: int = 1290
-
-    # DerivativeEventText(1291): STRING
-    class DerivativeEventText:
-        tag: int = 1291
-
-    # NoDerivativeInstrumentParties(1292): NUMINGROUP
-    class NoDerivativeInstrumentParties:
-        tag: int = 1292
-
-    # DerivativeInstrumentPartyID(1293): STRING
-    class DerivativeInstrumentPartyID:
-        tag: int = 1293
-
-    # DerivativeInstrumentPartyIDSource(1294): STRING
-    class DerivativeInstrumentPartyIDSource:
-        tag: int = 1294
-
-    # DerivativeInstrumentPartyRole(1295): INT
-    class DerivativeInstrumentPartyRole:
-        tag: int = 1295
-
-    # NoDerivativeInstrumentPartySubIDs(1296): NUMINGROUP
-    class NoDerivativeInstrumentPartySubIDs:
-        tag: int = 1296
-
-    # DerivativeInstrumentPartySubID(1297): STRING
-    class DerivativeInstrumentPartySubID:
-        tag: int = 1297
-
-    # DerivativeInstrumentPartySubIDType(1298): INT
-    class DerivativeInstrumentPartySubIDType:
-        tag: int = 1298
-
-    # DerivativeExerciseStyle(1299): CHAR
-    class DerivativeExerciseStyle:
-        tag: int = 1299
-
-    # MarketSegmentID(1300): STRING
-    class MarketSegmentID:
-        tag: int = 1300
-
-    # MarketID(1301): EXCHANGE
-    class MarketID:
-        tag: int = 1301
-
-    # MaturityMonthYearIncrementUnits(1302): INT
-    class MaturityMonthYearIncrementUnits:
-        tag: int = 1302
-        MONTHS: int = 0
-        DAYS: int = 1
-        WEEKS: int = 2
-        YEARS: int = 3
-
-    # MaturityMonthYearFormat(1303): INT
-    class MaturityMonthYearFormat:
-        tag: int = 1303
-        YEARMONTH_ONLY: int = 0
-        YEARMONTHDAY: int = 1
-        YEARMONTHWEEK: int = 2
-
-    # StrikeExerciseStyle(1304): INT
-    class StrikeExerciseStyle:
-        tag: int = 1304
-
-    # SecondaryPriceLimitType(1305): INT
-    class SecondaryPriceLimitType:
-        tag: int = 1305
-
-    # PriceLimitType(1306): INT
-    class PriceLimitType:
-        tag: int = 1306
-        PRICE: int = 0
-        TICKS: int = 1
-        PERCENTAGE: int = 2
-
-    # DerivativeSecurityListRequestType(1307): INT
-    class DerivativeSecurityListRequestType:
-        tag: int = 1307
-        SYMBOL: int = 0
-        SECURITYTYPE_AND_OR_CFICODE: int = 1
-        PRODUCT: int = 2
-        TRADINGSESSIONID: int = 3
-        ALL_SECURITIES: int = 4
-        UNDELYINGSYMBOL: int = 5
-        UNDERLYING_SECURITYTYPE_AND_OR_CFICODE: int = 6
-        UNDERLYING_PRODUCT: int = 7
-        MARKETID_OR_MARKETID_PLUS_MARKETSEGMENTID: int = 8
-
-    # ExecInstValue(1308): CHAR
-    class ExecInstValue:
-        tag: int = 1308
-
-    # NoTradingSessionRules(1309): NUMINGROUP
-    class NoTradingSessionRules:
-        tag: int = 1309
-
-    # NoMarketSegments(1310): NUMINGROUP
-    class NoMarketSegments:
-        tag: int = 1310
-
-    # NoDerivativeInstrAttrib(1311): NUMINGROUP
-    class NoDerivativeInstrAttrib:
-        tag: int = 1311
-
-    # NoNestedInstrAttrib(1312): NUMINGROUP
-    class NoNestedInstrAttrib:
-        tag: int = 1312
-
-    # DerivativeInstrAttribType(1313): INT
-    class DerivativeInstrAttribType:
-        tag: int = 1313
-
-    # DerivativeInstrAttribValue(1314): STRING
-    class DerivativeInstrAttribValue:
-        tag: int = 1314
-
-    # DerivativePriceUnitOfMeasure(1315): STRING
-    class DerivativePriceUnitOfMeasure:
-        tag: int = 1315
-
-    # DerivativePriceUnitOfMeasureQty(1316): QTY
-    class DerivativePriceUnitOfMeasureQty:
-        tag: int = 1316
-
-    # DerivativeSettlMethod(1317): CHAR
-    class DerivativeSettlMethod:
-        tag: int = 1317
-
-    # DerivativePriceQuoteMethod(1318): STRING
-    class DerivativePriceQuoteMethod:
-        tag: int = 1318
-
-    # DerivativeFuturesValuationMethod(1319): STRING
-    class DerivativeFuturesValuationMethod:
-        tag: int = 1319
-
-    # DerivativeListMethod(1320): INT
-    class DerivativeListMethod:
-        tag: int = 1320
-
-    # DerivativeCapPrice(1321): PRICE
-    class DerivativeCapPrice:
-        tag: int = 1321
-
-    # DerivativeFloorPrice(1322): PRICE
-    class DerivativeFloorPrice:
-        tag: int = 1322
-
-    # DerivativePutOrCall(1323): INT
-    class DerivativePutOrCall:
-        tag: int = 1323
-
-    # ListUpdateAction(1324): CHAR
-    class ListUpdateAction:
-        tag: int = 1324
-
-    # ParentMktSegmID(1325): STRING
-    class ParentMktSegmID:
-        tag: int = 1325
-
-    # TradingSessionDesc(1326): STRING
-    class TradingSessionDesc:
-        tag: int = 1326
-
-    # TradSesUpdateAction(1327): CHAR
-    class TradSesUpdateAction:
-        tag: int = 1327
-
-    # RejectText(1328): STRING
-    class RejectText:
-        tag: int = 1328
-
-    # FeeMultiplier(1329): FLOAT
-    class FeeMultiplier:
-        tag: int = 1329
-
-    # UnderlyingLegSymbol(1330): STRING
-    class UnderlyingLegSymbol:
-        tag: int = 1330
-
-    # UnderlyingLegSymbolSfx(1331): STRING
-    class UnderlyingLegSymbolSfx:
-        tag: int = 1331
-
-    # UnderlyingLegSecurityID(1332): STRING
-    class UnderlyingLegSecurityID:
-        tag: int = 1332
-
-    # UnderlyingLegSecurityIDSource(1333): STRING
-    class UnderlyingLegSecurityIDSource:
-        tag: int = 1333
-
-    # NoUnderlyingLegSecurityAltID(1334): NUMINGROUP
-    class NoUnderlyingLegSecurityAltID:
-        tag: int = 1334
-
-    # UnderlyingLegSecurityAltID(1335): STRING
-    class UnderlyingLegSecurityAltID:
-        tag: int = 1335
-
-    # UnderlyingLegSecurityAltIDSource(1336): STRING
-    class UnderlyingLegSecurityAltIDSource:
-        tag: int = 1336
-
-    # UnderlyingLegSecurityType(1337): STRING
-    class UnderlyingLegSecurityType:
-        tag: int = 1337
-
-    # UnderlyingLegSecuritySubType(1338): STRING
-    class UnderlyingLegSecuritySubType:
-        tag: int = 1338
-
-    # UnderlyingLegMaturityMonthYear(1339): MONTHYEAR
-    class UnderlyingLegMaturityMonthYear:
-        tag: int = 1339
-
-    # UnderlyingLegStrikePrice(1340): PRICE
-    class UnderlyingLegStrikePrice:
-        tag: int = 1340
-
-    # UnderlyingLegSecurityExchange(1341): STRING
-    class UnderlyingLegSecurityExchange:
-        tag: int = 1341
-
-    # NoOfLegUnderlyings(1342): NUMINGROUP
-    class NoOfLegUnderlyings:
-        tag: int = 1342
-
-    # UnderlyingLegPutOrCall(1343): INT
-    class UnderlyingLegPutOrCall:
-        tag: int = 1343
-
-    # UnderlyingLegCFICode(1344): STRING
-    class UnderlyingLegCFICode:
-        tag: int = 1344
-
-    # UnderlyingLegMaturityDate(1345): LOCALMKTDATE
-    class UnderlyingLegMaturityDate:
-        tag: int = 1345
-
-    # ApplReqID(1346): STRING
-    class ApplReqID:
-        tag: int = 1346
-
-    # ApplReqType(1347): INT
-    class ApplReqType:
-        tag: int = 1347
-        RETRANSMISSION_OF_APPLICATION_MESSAGES_FOR_THE_SPECIFIED_APPLICATIONS: int = 0
-        SUBSCRIPTION_TO_THE_SPECIFIED_APPLICATIONS: int = 1
-        REQUEST_FOR_THE_LAST_APPLLASTSEQNUM_PUBLISHED_FOR_THE_SPECIFIED_APPLICATIONS: int = 2
-        REQUEST_VALID_SET_OF_APPLICATIONS: int = 3
-        UNSUBSCRIBE_TO_THE_SPECIFIED_APPLICATIONS: int = 4
-
-    # ApplResponseType(1348): INT
-    class ApplResponseType:
-        tag: int = 1348
-        REQUEST_SUCCESSFULLY_PROCESSED: int = 0
-        APPLICATION_DOES_NOT_EXIST: int = 1
-        MESSAGES_NOT_AVAILABLE: int = 2
-
-    # ApplTotalMessageCount(1349): INT
-    class ApplTotalMessageCount:
-        tag: int = 1349
-
-    # ApplLastSeqNum(1350): SEQNUM
-    class ApplLastSeqNum:
-        tag: int = 1350
-
-    # NoApplIDs(1351): NUMINGROUP
-    class NoApplIDs:
-        tag: int = 1351
-
-    # ApplResendFlag(1352): BOOLEAN
-    class ApplResendFlag:
-        tag: int = 1352
-
-    # ApplResponseID(1353): STRING
-    class ApplResponseID:
-        tag: int = 1353
-
-    # ApplResponseError(1354): INT
-    class ApplResponseError:
-        tag: int = 1354
-        APPLICATION_DOES_NOT_EXIST: int = 0
-        MESSAGES_REQUESTED_ARE_NOT_AVAILABLE: int = 1
-        USER_NOT_AUTHORIZED_FOR_APPLICATION: int = 2
-
-    # RefApplID(1355): STRING
-    class RefApplID:
-        tag: int = 1355
-
-    # ApplReportID(1356): STRING
-    class ApplReportID:
-        tag: int = 1356
-
-    # RefApplLastSeqNum(1357): SEQNUM
-    class RefApplLastSeqNum:
-        tag: int = 1357
-
-    # LegPutOrCall(1358): INT
-    class LegPutOrCall:
-        tag: int = 1358
-
-    # EncodedSymbolLen(1359): LENGTH
-    class EncodedSymbolLen:
-        tag: int = 1359
-
-    # EncodedSymbol(1360): DATA
-    class EncodedSymbol:
-        tag: int = 1360
-
-    # TotNoFills(1361): INT
-    class TotNoFills:
-        tag: int = 1361
-
-    # NoFills(1362): NUMINGROUP
-    class NoFills:
-        tag: int = 1362
-
-    # FillExecID(1363): STRING
-    class FillExecID:
-        tag: int = 1363
-
-    # FillPx(1364): PRICE
-    class FillPx:
-        tag: int = 1364
-
-    # FillQty(1365): QTY
-    class FillQty:
-        tag: int = 1365
-
-    # LegAllocID(1366): STRING
-    class LegAllocID:
-        tag: int = 1366
-
-    # LegAllocSettlCurrency(1367): CURRENCY
-    class LegAllocSettlCurrency:
-        tag: int = 1367
-
-    # TradSesEvent(1368): INT
-    class TradSesEvent:
-        tag: int = 1368
-        TRADING_RESUMES: int = 0
-        CHANGE_OF_TRADING_SESSION: int = 1
-        CHANGE_OF_TRADING_SUBSESSION: int = 2
-        CHANGE_OF_TRADING_STATUS: int = 3
-
-    # MassActionReportID(1369): STRING
-    class MassActionReportID:
-        tag: int = 1369
-
-    # NoNotAffectedOrders(1370): NUMINGROUP
-    class NoNotAffectedOrders:
-        tag: int = 1370
-
-    # NotAffectedOrderID(1371): STRING
-    class NotAffectedOrderID:
-        tag: int = 1371
-
-    # NotAffOrigClOrdID(1372): STRING
-    class NotAffOrigClOrdID:
-        tag: int = 1372
-
-    # MassActionType(1373): INT
-    class MassActionType:
-        tag: int = 1373
-        SUSPEND_ORDERS: int = 1
-        RELEASE_ORDERS_FROM_SUSPENSION: int = 2
-        CANCEL_ORDERS: int = 3
-
-    # MassActionScope(1374): INT
-    class MassActionScope:
-        tag: int = 1374
-        ALL_ORDERS_FOR_A_SECURITY: int = 1
-        ALL_ORDERS_FOR_AN_UNDERLYING_SECURITY: int = 2
-        ALL_ORDERS_FOR_A_PRODUCT: int = 3
-        ALL_ORDERS_FOR_A_CFICODE: int = 4
-        ALL_ORDERS_FOR_A_SECURITYTYPE: int = 5
-        ALL_ORDERS_FOR_A_TRADING_SESSION: int = 6
-        ALL_ORDERS: int = 7
-        ALL_ORDERS_FOR_A_MARKET: int = 8
-        ALL_ORDERS_FOR_A_MARKET_SEGMENT: int = 9
-        ALL_ORDERS_FOR_A_SECURITY_GROUP: int = 10
-
-    # MassActionResponse(1375): INT
-    class MassActionResponse:
-        tag: int = 1375
-        REJECTED: int = 0
-        ACCEPTED: int = 1
-
-    # MassActionRejectReason(1376): INT
-    class MassActionRejectReason:
-        tag: int = 1376
-        MASS_ACTION_NOT_SUPPORTED: int = 0
-        INVALID_OR_UNKNOWN_SECURITY: int = 1
-        INVALID_OR_UNKNOWN_UNDERLYING_SECURITY: int = 2
-        INVALID_OR_UNKNOWN_PRODUCT: int = 3
-        INVALID_OR_UNKNOWN_CFICODE: int = 4
-        INVALID_OR_UNKNOWN_SECURITYTYPE: int = 5
-        INVALID_OR_UNKNOWN_TRADING_SESSION: int = 6
-        INVALID_OR_UNKNOWN_MARKET: int = 7
-        INVALID_OR_UNKNOWN_MARKET_SEGMENT: int = 8
-        INVALID_OR_UNKNOWN_SECURITY_GROUP: int = 9
-        OTHER: int = 99
-
-    # MultilegModel(1377): INT
-    class MultilegModel:
-        tag: int = 1377
-        PREDEFINED_MULTILEG_SECURITY: int = 0
-        USER_DEFINED_MULTLEG_SECURITY: int = 1
-        USER_DEFINED_NON_SECURITIZED_MULTILEG: int = 2
-
-    # MultilegPriceMethod(1378): INT
-    class MultilegPriceMethod:
-        tag: int = 1378
-        NET_PRICE: int = 0
-        REVERSED_NET_PRICE: int = 1
-        YIELD_DIFFERENCE: int = 2
-        INDIVIDUAL: int = 3
-        CONTRACT_WEIGHTED_AVERAGE_PRICE: int = 4
-        MULTIPLIED_PRICE: int = 5
-
-    # LegVolatility(1379): FLOAT
-    class LegVolatility:
-        tag: int = 1379
-
-    # DividendYield(1380): PERCENTAGE
-    class DividendYield:
-        tag: int = 1380
-
-    # LegDividendYield(1381): PERCENTAGE
-    class LegDividendYield:
-        tag: int = 1381
-
-    # CurrencyRatio(1382): FLOAT
-    class CurrencyRatio:
-        tag: int = 1382
-
-    # LegCurrencyRatio(1383): FLOAT
-    class LegCurrencyRatio:
-        tag: int = 1383
-
-    # LegExecInst(1384): MULTIPLECHARVALUE
-    class LegExecInst:
-        tag: int = 1384
-
-    # ContingencyType(1385): INT
-    class ContingencyType:
-        tag: int = 1385
-        ONE_CANCELS_THE_OTHER: int = 1
-        ONE_TRIGGERS_THE_OTHER: int = 2
-        ONE_UPDATES_THE_OTHER_3: int = 3
-        ONE_UPDATES_THE_OTHER_4: int = 4
-
-    # ListRejectReason(1386): INT
-    class ListRejectReason:
-        tag: int = 1386
-        BROKER: int = 0
-        EXCHANGE_CLOSED: int = 2
-        TOO_LATE_TO_ENTER: int = 4
-        UNKNOWN_ORDER: int = 5
-        DUPLICATE_ORDER: int = 6
-        UNSUPPORTED_ORDER_CHARACTERISTIC: int = 11
-        OTHER: int = 99
-
-    # NoTrdRepIndicators(1387): NUMINGROUP
-    class NoTrdRepIndicators:
-        tag: int = 1387
-
-    # TrdRepPartyRole(1388): INT
-    class TrdRepPartyRole:
-        tag: int = 1388
-
-    # TrdRepIndicator(1389): BOOLEAN
-    class TrdRepIndicator:
-        tag: int = 1389
-
-    # TradePublishIndicator(1390): INT
-    class TradePublishIndicator:
-        tag: int = 1390
-        DO_NOT_PUBLISH_TRADE: int = 0
-        PUBLISH_TRADE: int = 1
-        DEFERRED_PUBLICATION: int = 2
-
-    # UnderlyingLegOptAttribute(1391): CHAR
-    class UnderlyingLegOptAttribute:
-        tag: int = 1391
-
-    # UnderlyingLegSecurityDesc(1392): STRING
-    class UnderlyingLegSecurityDesc:
-        tag: int = 1392
-
-    # MarketReqID(1393): STRING
-    class MarketReqID:
-        tag: int = 1393
-
-    # MarketReportID(1394): STRING
-    class MarketReportID:
-        tag: int = 1394
-
-    # MarketUpdateAction(1395): CHAR
-    class MarketUpdateAction:
-        tag: int = 1395
-        ADD: str = 'A'
-        DELETE: str = 'D'
-        MODIFY: str = 'M'
-
-    # MarketSegmentDesc(1396): STRING
-    class MarketSegmentDesc:
-        tag: int = 1396
-
-    # EncodedMktSegmDescLen(1397): LENGTH
-    class EncodedMktSegmDescLen:
-        tag: int = 1397
-
-    # EncodedMktSegmDesc(1398): DATA
-    class EncodedMktSegmDesc:
-        tag: int = 1398
-
-    # ApplNewSeqNum(1399): SEQNUM
-    class ApplNewSeqNum:
-        tag: int = 1399
-
-    # EncryptedPasswordMethod(1400): INT
-    class EncryptedPasswordMethod:
-        tag: int = 1400
-
-    # EncryptedPasswordLen(1401): LENGTH
-    class EncryptedPasswordLen:
-        tag: int = 1401
-
-    # EncryptedPassword(1402): DATA
-    class EncryptedPassword:
-        tag: int = 1402
-
-    # EncryptedNewPasswordLen(1403): LENGTH
-    class EncryptedNewPasswordLen:
-        tag: int = 1403
-
-    # EncryptedNewPassword(1404): DATA
-    class EncryptedNewPassword:
-        tag: int = 1404
-
-    # UnderlyingLegMaturityTime(1405): TZTIMEONLY
-    class UnderlyingLegMaturityTime:
-        tag: int = 1405
-
-    # RefApplExtID(1406): INT
-    class RefApplExtID:
-        tag: int = 1406
-
-    # DefaultApplExtID(1407): INT
-    class DefaultApplExtID:
-        tag: int = 1407
-
-    # DefaultCstmApplVerID(1408): STRING
-    class DefaultCstmApplVerID:
-        tag: int = 1408
-
-    # SessionStatus(1409): INT
-    class SessionStatus:
-        tag: int = 1409
-        SESSION_ACTIVE: int = 0
-        SESSION_PASSWORD_CHANGED: int = 1
-        SESSION_PASSWORD_DUE_TO_EXPIRE: int = 2
-        NEW_SESSION_PASSWORD_DOES_NOT_COMPLY_WITH_POLICY: int = 3
-        SESSION_LOGOUT_COMPLETE: int = 4
-        INVALID_USERNAME_OR_PASSWORD: int = 5
-        ACCOUNT_LOCKED: int = 6
-        LOGONS_ARE_NOT_ALLOWED_AT_THIS_TIME: int = 7
-        PASSWORD_EXPIRED: int = 8
-
-    # DefaultVerIndicator(1410): BOOLEAN
-    class DefaultVerIndicator:
-        tag: int = 1410
-
-    # Nested4PartySubIDType(1411): INT
-    class Nested4PartySubIDType:
-        tag: int = 1411
-
-    # Nested4PartySubID(1412): STRING
-    class Nested4PartySubID:
-        tag: int = 1412
-
-    # NoNested4PartySubIDs(1413): NUMINGROUP
-    class NoNested4PartySubIDs:
-        tag: int = 1413
-
-    # NoNested4PartyIDs(1414): NUMINGROUP
-    class NoNested4PartyIDs:
-        tag: int = 1414
-
-    # Nested4PartyID(1415): STRING
-    class Nested4PartyID:
-        tag: int = 1415
-
-    # Nested4PartyIDSource(1416): CHAR
-    class Nested4PartyIDSource:
-        tag: int = 1416
-
-    # Nested4PartyRole(1417): INT
-    class Nested4PartyRole:
-        tag: int = 1417
-
-    # LegLastQty(1418): QTY
-    class LegLastQty:
-        tag: int = 1418
-
-    # UnderlyingExerciseStyle(1419): INT
-    class UnderlyingExerciseStyle:
-        tag: int = 1419
-
-    # LegExerciseStyle(1420): INT
-    class LegExerciseStyle:
-        tag: int = 1420
-
-    # LegPriceUnitOfMeasure(1421): STRING
-    class LegPriceUnitOfMeasure:
-        tag: int = 1421
-
-    # LegPriceUnitOfMeasureQty(1422): QTY
-    class LegPriceUnitOfMeasureQty:
-        tag: int = 1422
-
-    # UnderlyingUnitOfMeasureQty(1423): QTY
-    class UnderlyingUnitOfMeasureQty:
-        tag: int = 1423
-
-    # UnderlyingPriceUnitOfMeasure(1424): STRING
-    class UnderlyingPriceUnitOfMeasure:
-        tag: int = 1424
-
-    # UnderlyingPriceUnitOfMeasureQty(1425): QTY
-    class UnderlyingPriceUnitOfMeasureQty:
-        tag: int = 1425
-
-    # ApplReportType(1426): INT
-    class ApplReportType:
-        tag: int = 1426
-        RESET_APPLSEQNUM_TO_NEW_VALUE_SPECIFIED_IN_APPLNEWSEQNUM: int = 0
-        REPORTS_THAT_THE_LAST_MESSAGE_HAS_BEEN_SENT_FOR_THE_APPLIDS_REFER_TO_REFAPPLLASTSEQNUM: int = 1
-        HEARTBEAT_MESSAGE_INDICATING_THAT_APPLICATION_IDENTIFIED_BY_REFAPPLID: int = 2
+from UPA.fields import FieldDictionary
+
+FIX50SP1_Fields = FieldDictionary("FIX50SP1", (
+    (1, 'Account', 'STRING', ()),
+    (2, 'AdvId', 'STRING', ()),
+    (3, 'AdvRefID', 'STRING', ()),
+    (4, 'AdvSide', 'CHAR', (('BUY', 'B'), ('SELL', 'S'), ('TRADE', 'T'), ('CROSS', 'X'),)),
+    (5, 'AdvTransType', 'STRING', (('CANCEL', 'C'), ('NEW', 'N'), ('REPLACE', 'R'),)),
+    (6, 'AvgPx', 'PRICE', ()),
+    (7, 'BeginSeqNo', 'SEQNUM', ()),
+    (8, 'BeginString', 'STRING', ()),
+    (9, 'BodyLength', 'LENGTH', ()),
+    (10, 'CheckSum', 'STRING', ()),
+    (11, 'ClOrdID', 'STRING', ()),
+    (12, 'Commission', 'AMT', ()),
+    (13, 'CommType', 'CHAR', (('PER_UNIT', '1'), ('PERCENT', '2'), ('ABSOLUTE', '3'), ('PERCENTAGE_WAIVED_4', '4'), ('PERCENTAGE_WAIVED_5', '5'), ('POINTS_PER_BOND_OR_CONTRACT', '6'),)),
+    (14, 'CumQty', 'QTY', ()),
+    (15, 'Currency', 'CURRENCY', ()),
+    (16, 'EndSeqNo', 'SEQNUM', ()),
+    (17, 'ExecID', 'STRING', ()),
+    (18, 'ExecInst', 'MULTIPLECHARVALUE', (('STAY_ON_OFFER_SIDE', '0'), ('NOT_HELD', '1'), ('WORK', '2'), ('GO_ALONG', '3'), ('OVER_THE_DAY', '4'), ('HELD', '5'), ('PARTICIPANT_DONT_INITIATE', '6'), ('STRICT_SCALE', '7'), ('TRY_TO_SCALE', '8'), ('STAY_ON_BID_SIDE', '9'), ('NO_CROSS', 'A'), ('TRAILING_STOP_PEG', 'a'), ('OK_TO_CROSS', 'B'), ('STRICT_LIMIT', 'b'), ('IGNORE_PRICE_VALIDITY_CHECKS', 'c'), ('CALL_FIRST', 'C'), ('PEG_TO_LIMIT_PRICE', 'd'), ('PERCENT_OF_VOLUME', 'D'), ('DO_NOT_INCREASE', 'E'), ('WORK_TO_TARGET_STRATEGY', 'e'), ('DO_NOT_REDUCE', 'F'), ('ALL_OR_NONE', 'G'), ('REINSTATE_ON_SYSTEM_FAILURE', 'H'), ('INSTITUTIONS_ONLY', 'I'), ('REINSTATE_ON_TRADING_HALT', 'J'), ('CANCEL_ON_TRADING_HALT', 'K'), ('LAST_PEG', 'L'), ('MID_PRICE_PEG', 'M'), ('NON_NEGOTIABLE', 'N'), ('OPENING_PEG', 'O'), ('MARKET_PEG', 'P'), ('CANCEL_ON_SYSTEM_FAILURE', 'Q'), ('PRIMARY_PEG', 'R'), ('SUSPEND', 'S'), ('CUSTOMER_DISPLAY_INSTRUCTION', 'U'), ('NETTING', 'V'), ('PEG_TO_VWAP', 'W'), ('TRADE_ALONG', 'X'), ('TRY_TO_STOP', 'Y'), ('CANCEL_IF_NOT_BEST', 'Z'), ('INTERMARKET_SWEEP', 'f'), ('SINGLE_EXECUTION_REQUESTED_FOR_BLOCK_TRADE', 'j'), ('EXTERNAL_ROUTING_ALLOWED', 'g'), ('EXTERNAL_ROUTING_NOT_ALLOWED', 'h'), ('IMBALANCE_ONLY', 'i'), ('FIXED_PEG_TO_LOCAL_BEST_BID_OR_OFFER_AT_TIME_OF_ORDER', 'T'), ('BEST_EXECUTION', 'k'), ('SUSPEND_ON_SYSTEM_FAILURE', 'l'), ('SUSPEND_ON_TRADING_HALT', 'm'), ('REINSTATE_ON_CONNECTION_LOSS', 'n'), ('CANCEL_ON_CONNECTION_LOSS', 'o'), ('SUSPEND_ON_CONNECTION_LOSS', 'p'), ('RELEASE_FROM_SUSPENSION', 'q'), ('EXECUTE_AS_DELTA_NEUTRAL_USING_VOLATILITY_PROVIDED', 'r'), ('EXECUTE_AS_DURATION_NEUTRAL', 's'), ('EXECUTE_AS_FX_NEUTRAL', 't'),)),
+    (19, 'ExecRefID', 'STRING', ()),
+    (20, 'ExecTransType', 'CHAR', (('NEW', '0'), ('CANCEL', '1'), ('CORRECT', '2'), ('STATUS', '3'),)),
+    (21, 'HandlInst', 'CHAR', (('AUTOMATED_EXECUTION_ORDER_PRIVATE_NO_BROKER_INTERVENTION', '1'), ('AUTOMATED_EXECUTION_ORDER_PUBLIC_BROKER_INTERVENTION_OK', '2'), ('MANUAL_ORDER_BEST_EXECUTION', '3'),)),
+    (22, 'SecurityIDSource', 'STRING', (('CUSIP', '1'), ('SEDOL', '2'), ('QUIK', '3'), ('ISIN_NUMBER', '4'), ('RIC_CODE', '5'), ('ISO_CURRENCY_CODE', '6'), ('ISO_COUNTRY_CODE', '7'), ('EXCHANGE_SYMBOL', '8'), ('CONSOLIDATED_TAPE_ASSOCIATION', '9'), ('BLOOMBERG_SYMBOL', 'A'), ('WERTPAPIER', 'B'), ('DUTCH', 'C'), ('VALOREN', 'D'), ('SICOVAM', 'E'), ('BELGIAN', 'F'), ('COMMON', 'G'), ('CLEARING_HOUSE', 'H'), ('ISDA_FPML_PRODUCT_SPECIFICATION', 'I'), ('OPTION_PRICE_REPORTING_AUTHORITY', 'J'), ('LETTER_OF_CREDIT', 'L'), ('ISDA_FPML_PRODUCT_URL', 'K'), ('MARKETPLACE_ASSIGNED_IDENTIFIER', 'M'),)),
+    (23, 'IOIID', 'STRING', ()),
+    (24, 'IOIOthSvc', 'CHAR', ()),
+    (25, 'IOIQltyInd', 'CHAR', (('HIGH', 'H'), ('LOW', 'L'), ('MEDIUM', 'M'),)),
+    (26, 'IOIRefID', 'STRING', ()),
+    (27, 'IOIQty', 'STRING', (('_1000000000', '0'), ('SMALL', 'S'), ('MEDIUM', 'M'), ('LARGE', 'L'), ('UNDISCLOSED_QUANTITY', 'U'),)),
+    (28, 'IOITransType', 'CHAR', (('CANCEL', 'C'), ('NEW', 'N'), ('REPLACE', 'R'),)),
+    (29, 'LastCapacity', 'CHAR', (('AGENT', '1'), ('CROSS_AS_AGENT', '2'), ('CROSS_AS_PRINCIPAL', '3'), ('PRINCIPAL', '4'),)),
+    (30, 'LastMkt', 'EXCHANGE', ()),
+    (31, 'LastPx', 'PRICE', ()),
+    (32, 'LastQty', 'QTY', ()),
+    (33, 'NoLinesOfText', 'NUMINGROUP', ()),
+    (34, 'MsgSeqNum', 'SEQNUM', ()),
+    (35, 'MsgType', 'STRING', (('HEARTBEAT', '0'), ('TEST_REQUEST', '1'), ('RESEND_REQUEST', '2'), ('REJECT', '3'), ('SEQUENCE_RESET', '4'), ('LOGOUT', '5'), ('INDICATION_OF_INTEREST', '6'), ('ADVERTISEMENT', '7'), ('EXECUTION_REPORT', '8'), ('ORDER_CANCEL_REJECT', '9'), ('QUOTE_STATUS_REQUEST', 'a'), ('LOGON', 'A'), ('DERIVATIVE_SECURITY_LIST', 'AA'), ('NEW_ORDER_AB', 'AB'), ('MULTILEG_ORDER_CANCEL_REPLACE', 'AC'), ('TRADE_CAPTURE_REPORT_REQUEST', 'AD'), ('TRADE_CAPTURE_REPORT', 'AE'), ('ORDER_MASS_STATUS_REQUEST', 'AF'), ('QUOTE_REQUEST_REJECT', 'AG'), ('RFQ_REQUEST', 'AH'), ('QUOTE_STATUS_REPORT', 'AI'), ('QUOTE_RESPONSE', 'AJ'), ('CONFIRMATION', 'AK'), ('POSITION_MAINTENANCE_REQUEST', 'AL'), ('POSITION_MAINTENANCE_REPORT', 'AM'), ('REQUEST_FOR_POSITIONS', 'AN'), ('REQUEST_FOR_POSITIONS_ACK', 'AO'), ('POSITION_REPORT', 'AP'), ('TRADE_CAPTURE_REPORT_REQUEST_ACK', 'AQ'), ('TRADE_CAPTURE_REPORT_ACK', 'AR'), ('ALLOCATION_REPORT', 'AS'), ('ALLOCATION_REPORT_ACK', 'AT'), ('CONFIRMATION_ACK', 'AU'), ('SETTLEMENT_INSTRUCTION_REQUEST', 'AV'), ('ASSIGNMENT_REPORT', 'AW'), ('COLLATERAL_REQUEST', 'AX'), ('COLLATERAL_ASSIGNMENT', 'AY'), ('COLLATERAL_RESPONSE', 'AZ'), ('NEWS', 'B'), ('MASS_QUOTE_ACKNOWLEDGEMENT', 'b'), ('COLLATERAL_REPORT', 'BA'), ('COLLATERAL_INQUIRY', 'BB'), ('NETWORK_COUNTERPARTY_SYSTEM_STATUS_REQUEST', 'BC'), ('NETWORK_COUNTERPARTY_SYSTEM_STATUS_RESPONSE', 'BD'), ('USER_REQUEST', 'BE'), ('USER_RESPONSE', 'BF'), ('COLLATERAL_INQUIRY_ACK', 'BG'), ('CONFIRMATION_REQUEST', 'BH'), ('EMAIL', 'C'), ('SECURITY_DEFINITION_REQUEST', 'c'), ('SECURITY_DEFINITION', 'd'), ('NEW_ORDER_D', 'D'), ('SECURITY_STATUS_REQUEST', 'e'), ('NEW_ORDER_E', 'E'), ('ORDER_CANCEL_REQUEST', 'F'), ('SECURITY_STATUS', 'f'), ('ORDER_CANCEL_REPLACE_REQUEST', 'G'), ('TRADING_SESSION_STATUS_REQUEST', 'g'), ('ORDER_STATUS_REQUEST', 'H'), ('TRADING_SESSION_STATUS', 'h'), ('MASS_QUOTE', 'i'), ('BUSINESS_MESSAGE_REJECT', 'j'), ('ALLOCATION_INSTRUCTION', 'J'), ('BID_REQUEST', 'k'), ('LIST_CANCEL_REQUEST', 'K'), ('BID_RESPONSE', 'l'), ('LIST_EXECUTE', 'L'), ('LIST_STRIKE_PRICE', 'm'), ('LIST_STATUS_REQUEST', 'M'), ('XML_MESSAGE', 'n'), ('LIST_STATUS', 'N'), ('REGISTRATION_INSTRUCTIONS', 'o'), ('REGISTRATION_INSTRUCTIONS_RESPONSE', 'p'), ('ALLOCATION_INSTRUCTION_ACK', 'P'), ('ORDER_MASS_CANCEL_REQUEST', 'q'), ('DONT_KNOW_TRADE', 'Q'), ('QUOTE_REQUEST', 'R'), ('ORDER_MASS_CANCEL_REPORT', 'r'), ('QUOTE', 'S'), ('NEW_ORDER_s', 's'), ('SETTLEMENT_INSTRUCTIONS', 'T'), ('CROSS_ORDER_CANCEL_REPLACE_REQUEST', 't'), ('CROSS_ORDER_CANCEL_REQUEST', 'u'), ('MARKET_DATA_REQUEST', 'V'), ('SECURITY_TYPE_REQUEST', 'v'), ('SECURITY_TYPES', 'w'), ('MARKET_DATA_W', 'W'), ('SECURITY_LIST_REQUEST', 'x'), ('MARKET_DATA_X', 'X'), ('MARKET_DATA_REQUEST_REJECT', 'Y'), ('SECURITY_LIST', 'y'), ('QUOTE_CANCEL', 'Z'), ('DERIVATIVE_SECURITY_LIST_REQUEST', 'z'), ('CONTRARY_INTENTION_REPORT', 'BO'), ('SECURITY_DEFINITION_UPDATE_REPORT', 'BP'), ('SECURITY_LIST_UPDATE_REPORT', 'BK'), ('ADJUSTED_POSITION_REPORT', 'BL'), ('ALLOCATION_INSTRUCTION_ALERT', 'BM'), ('EXECUTION_ACKNOWLEDGEMENT', 'BN'), ('TRADING_SESSION_LIST', 'BJ'), ('TRADING_SESSION_LIST_REQUEST', 'BI'), ('SETTLEMENTOBLIGATIONREPORT', 'BQ'), ('DERIVATIVESECURITYLISTUPDATEREPORT', 'BR'), ('TRADINGSESSIONLISTUPDATEREPORT', 'BS'), ('MARKETDEFINITIONREQUEST', 'BT'), ('MARKETDEFINITION', 'BU'), ('MARKETDEFINITIONUPDATEREPORT', 'BV'), ('USERNOTIFICATION', 'CB'), ('ORDERMASSACTIONREPORT', 'BZ'), ('ORDERMASSACTIONREQUEST', 'CA'), ('APPLICATIONMESSAGEREQUEST', 'BW'), ('APPLICATIONMESSAGEREQUESTACK', 'BX'), ('APPLICATIONMESSAGEREPORT', 'BY'),)),
+    (36, 'NewSeqNo', 'SEQNUM', ()),
+    (37, 'OrderID', 'STRING', ()),
+    (38, 'OrderQty', 'QTY', ()),
+    (39, 'OrdStatus', 'CHAR', (('NEW', '0'), ('PARTIALLY_FILLED', '1'), ('FILLED', '2'), ('DONE_FOR_DAY', '3'), ('CANCELED', '4'), ('PENDING_CANCEL', '6'), ('STOPPED', '7'), ('REJECTED', '8'), ('SUSPENDED', '9'), ('PENDING_NEW', 'A'), ('CALCULATED', 'B'), ('EXPIRED', 'C'), ('ACCEPTED_FOR_BIDDING', 'D'), ('PENDING_REPLACE', 'E'), ('REPLACED', '5'),)),
+    (40, 'OrdType', 'CHAR', (('MARKET', '1'), ('LIMIT', '2'), ('STOP', '3'), ('STOP_LIMIT', '4'), ('MARKET_ON_CLOSE', '5'), ('WITH_OR_WITHOUT', '6'), ('LIMIT_OR_BETTER', '7'), ('LIMIT_WITH_OR_WITHOUT', '8'), ('ON_BASIS', '9'), ('ON_CLOSE', 'A'), ('LIMIT_ON_CLOSE', 'B'), ('FOREX_MARKET', 'C'), ('PREVIOUSLY_QUOTED', 'D'), ('PREVIOUSLY_INDICATED', 'E'), ('FOREX_LIMIT', 'F'), ('FOREX_SWAP', 'G'), ('FOREX_PREVIOUSLY_QUOTED', 'H'), ('FUNARI', 'I'), ('MARKET_IF_TOUCHED', 'J'), ('MARKET_WITH_LEFT_OVER_AS_LIMIT', 'K'), ('PREVIOUS_FUND_VALUATION_POINT', 'L'), ('NEXT_FUND_VALUATION_POINT', 'M'), ('PEGGED', 'P'), ('COUNTER_ORDER_SELECTION', 'Q'),)),
+    (41, 'OrigClOrdID', 'STRING', ()),
+    (42, 'OrigTime', 'UTCTIMESTAMP', ()),
+    (43, 'PossDupFlag', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (44, 'Price', 'PRICE', ()),
+    (45, 'RefSeqNum', 'SEQNUM', ()),
+    (46, 'RelatdSym', 'STRING', ()),
+    (47, 'Rule80A', 'CHAR', (('AGENCY_SINGLE_ORDER', 'A'), ('SHORT_EXEMPT_TRANSACTION_B', 'B'), ('PROPRIETARY_NON_ALGORITHMIC_PROGRAM_TRADE', 'C'), ('PROGRAM_ORDER_INDEX_ARB_FOR_MEMBER_FIRM_ORG', 'D'), ('SHORT_EXEMPT_TRANSACTION_FOR_PRINCIPAL', 'E'), ('SHORT_EXEMPT_TRANSACTION_F', 'F'), ('SHORT_EXEMPT_TRANSACTION_H', 'H'), ('INDIVIDUAL_INVESTOR_SINGLE_ORDER', 'I'), ('PROPRIETARY_ALGORITHMIC_PROGRAM_TRADING', 'J'), ('AGENCY_ALGORITHMIC_PROGRAM_TRADING', 'K'), ('SHORT_EXEMPT_TRANSACTION_FOR_MEMBER_COMPETING_MARKET_MAKER_AFFLIATED_WITH_THE_FIRM_CLEARING_THE_TRADE', 'L'), ('PROGRAM_ORDER_INDEX_ARB_FOR_OTHER_MEMBER', 'M'), ('AGENT_FOR_OTHER_MEMBER_NON_ALGORITHMIC_PROGRAM_TRADE', 'N'), ('PROPRIETARY_TRANSACTIONS_FOR_COMPETING_MARKET_MAKER_THAT_IS_AFFILIATED_WITH_THE_CLEARING_MEMBER', 'O'), ('PRINCIPAL', 'P'), ('TRANSACTIONS_FOR_THE_ACCOUNT_OF_A_NON_MEMBER_COMPTING_MARKET_MAKER', 'R'), ('SPECIALIST_TRADES', 'S'), ('TRANSACTIONS_FOR_THE_ACCOUNT_OF_AN_UNAFFILIATED_MEMBERS_COMPETING_MARKET_MAKER', 'T'), ('AGENCY_INDEX_ARBITRAGE', 'U'), ('ALL_OTHER_ORDERS_AS_AGENT_FOR_OTHER_MEMBER', 'W'), ('SHORT_EXEMPT_TRANSACTION_FOR_MEMBER_COMPETING_MARKET_MAKER_NOT_AFFILIATED_WITH_THE_FIRM_CLEARING_THE_TRADE', 'X'), ('AGENCY_NON_ALGORITHMIC_PROGRAM_TRADE', 'Y'), ('SHORT_EXEMPT_TRANSACTION_FOR_NON_MEMBER_COMPETING_MARKET_MAKER', 'Z'),)),
+    (48, 'SecurityID', 'STRING', ()),
+    (49, 'SenderCompID', 'STRING', ()),
+    (50, 'SenderSubID', 'STRING', ()),
+    (51, 'SendingDate', 'LOCALMKTDATE', ()),
+    (52, 'SendingTime', 'UTCTIMESTAMP', ()),
+    (53, 'Quantity', 'QTY', ()),
+    (54, 'Side', 'CHAR', (('BUY', '1'), ('SELL', '2'), ('BUY_MINUS', '3'), ('SELL_PLUS', '4'), ('SELL_SHORT', '5'), ('SELL_SHORT_EXEMPT', '6'), ('UNDISCLOSED', '7'), ('CROSS', '8'), ('CROSS_SHORT', '9'), ('CROSS_SHORT_EXXMPT', 'A'), ('AS_DEFINED', 'B'), ('OPPOSITE', 'C'), ('SUBSCRIBE', 'D'), ('REDEEM', 'E'), ('LEND', 'F'), ('BORROW', 'G'),)),
+    (55, 'Symbol', 'STRING', ()),
+    (56, 'TargetCompID', 'STRING', ()),
+    (57, 'TargetSubID', 'STRING', ()),
+    (58, 'Text', 'STRING', ()),
+    (59, 'TimeInForce', 'CHAR', (('DAY', '0'), ('GOOD_TILL_CANCEL', '1'), ('AT_THE_OPENING', '2'), ('IMMEDIATE_OR_CANCEL', '3'), ('FILL_OR_KILL', '4'), ('GOOD_TILL_CROSSING', '5'), ('GOOD_TILL_DATE', '6'), ('AT_THE_CLOSE', '7'), ('GOOD_THROUGH_CROSSING', '8'), ('AT_CROSSING', '9'),)),
+    (60, 'TransactTime', 'UTCTIMESTAMP', ()),
+    (61, 'Urgency', 'CHAR', (('NORMAL', '0'), ('FLASH', '1'), ('BACKGROUND', '2'),)),
+    (62, 'ValidUntilTime', 'UTCTIMESTAMP', ()),
+    (63, 'SettlType', 'STRING', (('REGULAR', '0'), ('CASH', '1'), ('NEXT_DAY', '2'), ('T_PLUS_2', '3'), ('T_PLUS_3', '4'), ('T_PLUS_4', '5'), ('FUTURE', '6'), ('WHEN_AND_IF_ISSUED', '7'), ('SELLERS_OPTION', '8'), ('T_PLUS_5', '9'), ('FX_SPOT_NEXT_SETTLEMENT', 'C'), ('BROKEN_DATE', 'B'),)),
+    (64, 'SettlDate', 'LOCALMKTDATE', ()),
+    (65, 'SymbolSfx', 'STRING', (('EUCP_WITH_LUMP_SUM_INTEREST_RATHER_THAN_DISCOUNT_PRICE', 'CD'), ('WHEN_ISSUED_FOR_A_SECURITY_TO_BE_REISSUED_UNDER_AN_OLD_CUSIP_OR_ISIN', 'WI'),)),
+    (66, 'ListID', 'STRING', ()),
+    (67, 'ListSeqNo', 'INT', ()),
+    (68, 'TotNoOrders', 'INT', ()),
+    (69, 'ListExecInst', 'STRING', ()),
+    (70, 'AllocID', 'STRING', ()),
+    (71, 'AllocTransType', 'CHAR', (('NEW', '0'), ('REPLACE', '1'), ('CANCEL', '2'), ('PRELIMINARY', '3'), ('CALCULATED', '4'), ('CALCULATED_WITHOUT_PRELIMINARY', '5'), ('REVERSAL', '6'),)),
+    (72, 'RefAllocID', 'STRING', ()),
+    (73, 'NoOrders', 'NUMINGROUP', ()),
+    (74, 'AvgPxPrecision', 'INT', ()),
+    (75, 'TradeDate', 'LOCALMKTDATE', ()),
+    (76, 'ExecBroker', 'STRING', ()),
+    (77, 'PositionEffect', 'CHAR', (('CLOSE', 'C'), ('FIFO', 'F'), ('OPEN', 'O'), ('ROLLED', 'R'), ('CLOSE_BUT_NOTIFY_ON_OPEN', 'N'), ('DEFAULT', 'D'),)),
+    (78, 'NoAllocs', 'NUMINGROUP', ()),
+    (79, 'AllocAccount', 'STRING', ()),
+    (80, 'AllocQty', 'QTY', ()),
+    (81, 'ProcessCode', 'CHAR', (('REGULAR', '0'), ('SOFT_DOLLAR', '1'), ('STEP_IN', '2'), ('STEP_OUT', '3'), ('SOFT_DOLLAR_STEP_IN', '4'), ('SOFT_DOLLAR_STEP_OUT', '5'), ('PLAN_SPONSOR', '6'),)),
+    (82, 'NoRpts', 'INT', ()),
+    (83, 'RptSeq', 'INT', ()),
+    (84, 'CxlQty', 'QTY', ()),
+    (85, 'NoDlvyInst', 'NUMINGROUP', ()),
+    (86, 'DlvyInst', 'STRING', ()),
+    (87, 'AllocStatus', 'INT', (('ACCEPTED', 0), ('BLOCK_LEVEL_REJECT', 1), ('ACCOUNT_LEVEL_REJECT', 2), ('RECEIVED', 3), ('INCOMPLETE', 4), ('REJECTED_BY_INTERMEDIARY', 5), ('ALLOCATION_PENDING', 6), ('REVERSED', 7),)),
+    (88, 'AllocRejCode', 'INT', (('UNKNOWN_ACCOUNT', 0), ('INCORRECT_QUANTITY', 1), ('UNKNOWN_OR_STALE_EXECID', 10), ('MISMATCHED_DATA', 11), ('UNKNOWN_CLORDID', 12), ('WAREHOUSE_REQUEST_REJECTED', 13), ('INCORRECT_AVERAGEG_PRICE', 2), ('UNKNOWN_EXECUTING_BROKER_MNEMONIC', 3), ('COMMISSION_DIFFERENCE', 4), ('UNKNOWN_ORDERID', 5), ('UNKNOWN_LISTID', 6), ('OTHER', 7), ('INCORRECT_ALLOCATED_QUANTITY', 8), ('CALCULATION_DIFFERENCE', 9),)),
+    (89, 'Signature', 'DATA', ()),
+    (90, 'SecureDataLen', 'LENGTH', ()),
+    (91, 'SecureData', 'DATA', ()),
+    (92, 'BrokerOfCredit', 'STRING', ()),
+    (93, 'SignatureLength', 'LENGTH', ()),
+    (94, 'EmailType', 'CHAR', (('NEW', '0'), ('REPLY', '1'), ('ADMIN_REPLY', '2'),)),
+    (95, 'RawDataLength', 'LENGTH', ()),
+    (96, 'RawData', 'DATA', ()),
+    (97, 'PossResend', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (98, 'EncryptMethod', 'INT', (('NONE', 0), ('PKCS_1', 1), ('DES', 2), ('PKCS_3', 3), ('PGP_4', 4), ('PGP_5', 5), ('PEM', 6),)),
+    (99, 'StopPx', 'PRICE', ()),
+    (100, 'ExDestination', 'EXCHANGE', ()),
+    (102, 'CxlRejReason', 'INT', (('TOO_LATE_TO_CANCEL', 0), ('UNKNOWN_ORDER', 1), ('BROKER', 2), ('ORDER_ALREADY_IN_PENDING_CANCEL_OR_PENDING_REPLACE_STATUS', 3), ('UNABLE_TO_PROCESS_ORDER_MASS_CANCEL_REQUEST', 4), ('ORIGORDMODTIME', 5), ('DUPLICATE_CLORDID', 6), ('OTHER', 99), ('INVALID_PRICE_INCREMENT', 18), ('PRICE_EXCEEDS_CURRENT_PRICE', 7), ('PRICE_EXCEEDS_CURRENT_PRICE_BAND', 8),)),
+    (103, 'OrdRejReason', 'INT', (('BROKER', 0), ('UNKNOWN_SYMBOL', 1), ('INVALID_INVESTOR_ID', 10), ('UNSUPPORTED_ORDER_CHARACTERISTIC', 11), ('SURVEILLENCE_OPTION', 12), ('INCORRECT_QUANTITY', 13), ('INCORRECT_ALLOCATED_QUANTITY', 14), ('UNKNOWN_ACCOUNT', 15), ('EXCHANGE_CLOSED', 2), ('ORDER_EXCEEDS_LIMIT', 3), ('TOO_LATE_TO_ENTER', 4), ('UNKNOWN_ORDER', 5), ('DUPLICATE_ORDER', 6), ('DUPLICATE_OF_A_VERBALLY_COMMUNICATED_ORDER', 7), ('STALE_ORDER', 8), ('TRADE_ALONG_REQUIRED', 9), ('OTHER', 99), ('INVALID_PRICE_INCREMENT', 18), ('PRICE_EXCEEDS_CURRENT_PRICE_BAND', 16),)),
+    (104, 'IOIQualifier', 'CHAR', (('ALL_OR_NONE', 'A'), ('MARKET_ON_CLOSE', 'B'), ('AT_THE_CLOSE', 'C'), ('VWAP', 'D'), ('IN_TOUCH_WITH', 'I'), ('LIMIT', 'L'), ('MORE_BEHIND', 'M'), ('AT_THE_OPEN', 'O'), ('TAKING_A_POSITION', 'P'), ('AT_THE_MARKET', 'Q'), ('READY_TO_TRADE', 'R'), ('PORTFOLIO_SHOWN', 'S'), ('THROUGH_THE_DAY', 'T'), ('VERSUS', 'V'), ('INDIDCATION', 'W'), ('CROSSING_OPPORTUNITY', 'X'), ('AT_THE_MIDPOINT', 'Y'), ('PRE_OPEN', 'Z'),)),
+    (105, 'WaveNo', 'STRING', ()),
+    (106, 'Issuer', 'STRING', ()),
+    (107, 'SecurityDesc', 'STRING', ()),
+    (108, 'HeartBtInt', 'INT', ()),
+    (109, 'ClientID', 'STRING', ()),
+    (110, 'MinQty', 'QTY', ()),
+    (111, 'MaxFloor', 'QTY', ()),
+    (112, 'TestReqID', 'STRING', ()),
+    (113, 'ReportToExch', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (114, 'LocateReqd', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (115, 'OnBehalfOfCompID', 'STRING', ()),
+    (116, 'OnBehalfOfSubID', 'STRING', ()),
+    (117, 'QuoteID', 'STRING', ()),
+    (118, 'NetMoney', 'AMT', ()),
+    (119, 'SettlCurrAmt', 'AMT', ()),
+    (120, 'SettlCurrency', 'CURRENCY', ()),
+    (121, 'ForexReq', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (122, 'OrigSendingTime', 'UTCTIMESTAMP', ()),
+    (123, 'GapFillFlag', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (124, 'NoExecs', 'NUMINGROUP', ()),
+    (125, 'CxlType', 'CHAR', ()),
+    (126, 'ExpireTime', 'UTCTIMESTAMP', ()),
+    (127, 'DKReason', 'CHAR', (('UNKNOWN_SYMBOL', 'A'), ('WRONG_SIDE', 'B'), ('QUANTITY_EXCEEDS_ORDER', 'C'), ('NO_MATCHING_ORDER', 'D'), ('PRICE_EXCEEDS_LIMIT', 'E'), ('CALCULATION_DIFFERENCE', 'F'), ('OTHER', 'Z'),)),
+    (128, 'DeliverToCompID', 'STRING', ()),
+    (129, 'DeliverToSubID', 'STRING', ()),
+    (130, 'IOINaturalFlag', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (131, 'QuoteReqID', 'STRING', ()),
+    (132, 'BidPx', 'PRICE', ()),
+    (133, 'OfferPx', 'PRICE', ()),
+    (134, 'BidSize', 'QTY', ()),
+    (135, 'OfferSize', 'QTY', ()),
+    (136, 'NoMiscFees', 'NUMINGROUP', ()),
+    (137, 'MiscFeeAmt', 'AMT', ()),
+    (138, 'MiscFeeCurr', 'CURRENCY', ()),
+    (139, 'MiscFeeType', 'STRING', (('REGULATORY', '1'), ('PER_TRANSACTION', '10'), ('CONVERSION', '11'), ('AGENT', '12'), ('TAX', '2'), ('LOCAL_COMMISSION', '3'), ('EXCHANGE_FEES', '4'), ('STAMP', '5'), ('LEVY', '6'), ('OTHER', '7'), ('MARKUP', '8'), ('CONSUMPTION_TAX', '9'), ('TRANSFER_FEE', '13'), ('SECURITY_LENDING', '14'),)),
+    (140, 'PrevClosePx', 'PRICE', ()),
+    (141, 'ResetSeqNumFlag', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (142, 'SenderLocationID', 'STRING', ()),
+    (143, 'TargetLocationID', 'STRING', ()),
+    (144, 'OnBehalfOfLocationID', 'STRING', ()),
+    (145, 'DeliverToLocationID', 'STRING', ()),
+    (146, 'NoRelatedSym', 'NUMINGROUP', ()),
+    (147, 'Subject', 'STRING', ()),
+    (148, 'Headline', 'STRING', ()),
+    (149, 'URLLink', 'STRING', ()),
+    (150, 'ExecType', 'CHAR', (('NEW', '0'), ('DONE_FOR_DAY', '3'), ('CANCELED', '4'), ('REPLACED', '5'), ('PENDING_CANCEL', '6'), ('STOPPED', '7'), ('REJECTED', '8'), ('SUSPENDED', '9'), ('PENDING_NEW', 'A'), ('CALCULATED', 'B'), ('EXPIRED', 'C'), ('RESTATED', 'D'), ('PENDING_REPLACE', 'E'), ('TRADE', 'F'), ('TRADE_CORRECT', 'G'), ('TRADE_CANCEL', 'H'), ('ORDER_STATUS', 'I'), ('TRADE_IN_A_CLEARING_HOLD', 'J'), ('TRADE_HAS_BEEN_RELEASED_TO_CLEARING', 'K'), ('TRIGGERED_OR_ACTIVATED_BY_SYSTEM', 'L'),)),
+    (151, 'LeavesQty', 'QTY', ()),
+    (152, 'CashOrderQty', 'QTY', ()),
+    (153, 'AllocAvgPx', 'PRICE', ()),
+    (154, 'AllocNetMoney', 'AMT', ()),
+    (155, 'SettlCurrFxRate', 'FLOAT', ()),
+    (156, 'SettlCurrFxRateCalc', 'CHAR', (('MULTIPLY', 'M'), ('DIVIDE', 'D'),)),
+    (157, 'NumDaysInterest', 'INT', ()),
+    (158, 'AccruedInterestRate', 'PERCENTAGE', ()),
+    (159, 'AccruedInterestAmt', 'AMT', ()),
+    (160, 'SettlInstMode', 'CHAR', (('DEFAULT', '0'), ('STANDING_INSTRUCTIONS_PROVIDED', '1'), ('SPECIFIC_ALLOCATION_ACCOUNT_OVERRIDING', '2'), ('SPECIFIC_ALLOCATION_ACCOUNT_STANDING', '3'), ('SPECIFIC_ORDER_FOR_A_SINGLE_ACCOUNT', '4'), ('REQUEST_REJECT', '5'),)),
+    (161, 'AllocText', 'STRING', ()),
+    (162, 'SettlInstID', 'STRING', ()),
+    (163, 'SettlInstTransType', 'CHAR', (('CANCEL', 'C'), ('NEW', 'N'), ('REPLACE', 'R'), ('RESTATE', 'T'),)),
+    (164, 'EmailThreadID', 'STRING', ()),
+    (165, 'SettlInstSource', 'CHAR', (('BROKERS_INSTRUCTIONS', '1'), ('INSTITUTIONS_INSTRUCTIONS', '2'), ('INVESTOR', '3'),)),
+    (166, 'SettlLocation', 'STRING', (('CEDEL', 'CED'), ('DEPOSITORY_TRUST_COMPANY', 'DTC'), ('EURO_CLEAR', 'EUR'), ('FEDERAL_BOOK_ENTRY', 'FED'), ('LOCAL_MARKET_SETTLE_LOCATION', 'ISO_Country_Code'), ('PHYSICAL', 'PNY'), ('PARTICIPANT_TRUST_COMPANY', 'PTC'),)),
+    (167, 'SecurityType', 'STRING', (('ASSET_BACKED_SECURITIES', 'ABS'), ('AMENDED_RESTATED', 'AMENDED'), ('OTHER_ANTICIPATION_NOTES', 'AN'), ('BANKERS_ACCEPTANCE', 'BA'), ('BANK_NOTES', 'BN'), ('BILL_OF_EXCHANGES', 'BOX'), ('BRADY_BOND', 'BRADY'), ('BRIDGE_LOAN', 'BRIDGE'), ('BUY_SELLBACK', 'BUYSELL'), ('CONVERTIBLE_BOND', 'CB'), ('CERTIFICATE_OF_DEPOSIT', 'CD'), ('CALL_LOANS', 'CL'), ('CORP_MORTGAGE_BACKED_SECURITIES', 'CMBS'), ('COLLATERALIZED_MORTGAGE_OBLIGATION', 'CMO'), ('CERTIFICATE_OF_OBLIGATION', 'COFO'), ('CERTIFICATE_OF_PARTICIPATION', 'COFP'), ('CORPORATE_BOND', 'CORP'), ('COMMERCIAL_PAPER', 'CP'), ('CORPORATE_PRIVATE_PLACEMENT', 'CPP'), ('COMMON_STOCK', 'CS'), ('DEFAULTED', 'DEFLTED'), ('DEBTOR_IN_POSSESSION', 'DINP'), ('DEPOSIT_NOTES', 'DN'), ('DUAL_CURRENCY', 'DUAL'), ('EURO_CERTIFICATE_OF_DEPOSIT', 'EUCD'), ('EURO_CORPORATE_BOND', 'EUCORP'), ('EURO_COMMERCIAL_PAPER', 'EUCP'), ('EURO_SOVEREIGNS', 'EUSOV'), ('EURO_SUPRANATIONAL_COUPONS', 'EUSUPRA'), ('FEDERAL_AGENCY_COUPON', 'FAC'), ('FEDERAL_AGENCY_DISCOUNT_NOTE', 'FADN'), ('FOREIGN_EXCHANGE_CONTRACT', 'FOR'), ('FORWARD', 'FORWARD'), ('FUTURE', 'FUT'), ('GENERAL_OBLIGATION_BONDS', 'GO'), ('IOETTE_MORTGAGE', 'IET'), ('LETTER_OF_CREDIT', 'LOFC'), ('LIQUIDITY_NOTE', 'LQN'), ('MATURED', 'MATURED'), ('MORTGAGE_BACKED_SECURITIES', 'MBS'), ('MUTUAL_FUND', 'MF'), ('MORTGAGE_INTEREST_ONLY', 'MIO'), ('MULTILEG_INSTRUMENT', 'MLEG'), ('MORTGAGE_PRINCIPAL_ONLY', 'MPO'), ('MORTGAGE_PRIVATE_PLACEMENT', 'MPP'), ('MISCELLANEOUS_PASS_THROUGH', 'MPT'), ('MANDATORY_TENDER', 'MT'), ('MEDIUM_TERM_NOTES', 'MTN'), ('NO_SECURITY_TYPE', 'NONE'), ('OVERNIGHT', 'ONITE'), ('OPTION', 'OPT'), ('PRIVATE_EXPORT_FUNDING', 'PEF'), ('PFANDBRIEFE', 'PFAND'), ('PROMISSORY_NOTE', 'PN'), ('PREFERRED_STOCK', 'PS'), ('PLAZOS_FIJOS', 'PZFJ'), ('REVENUE_ANTICIPATION_NOTE', 'RAN'), ('REPLACED', 'REPLACD'), ('REPURCHASE', 'REPO'), ('RETIRED', 'RETIRED'), ('REVENUE_BONDS', 'REV'), ('REVOLVER_LOAN', 'RVLV'), ('REVOLVER_TERM_LOAN', 'RVLVTRM'), ('SECURITIES_LOAN', 'SECLOAN'), ('SECURITIES_PLEDGE', 'SECPLEDGE'), ('SPECIAL_ASSESSMENT', 'SPCLA'), ('SPECIAL_OBLIGATION', 'SPCLO'), ('SPECIAL_TAX', 'SPCLT'), ('SHORT_TERM_LOAN_NOTE', 'STN'), ('STRUCTURED_NOTES', 'STRUCT'), ('USD_SUPRANATIONAL_COUPONS', 'SUPRA'), ('SWING_LINE_FACILITY', 'SWING'), ('TAX_ANTICIPATION_NOTE', 'TAN'), ('TAX_ALLOCATION', 'TAXA'), ('TO_BE_ANNOUNCED', 'TBA'), ('US_TREASURY_BILL_TBILL', 'TBILL'), ('US_TREASURY_BOND', 'TBOND'), ('PRINCIPAL_STRIP_OF_A_CALLABLE_BOND_OR_NOTE', 'TCAL'), ('TIME_DEPOSIT', 'TD'), ('TAX_EXEMPT_COMMERCIAL_PAPER', 'TECP'), ('TERM_LOAN', 'TERM'), ('INTEREST_STRIP_FROM_ANY_BOND_OR_NOTE', 'TINT'), ('TREASURY_INFLATION_PROTECTED_SECURITIES', 'TIPS'), ('US_TREASURY_NOTE_TNOTE', 'TNOTE'), ('PRINCIPAL_STRIP_FROM_A_NON_CALLABLE_BOND_OR_NOTE', 'TPRN'), ('TAX_REVENUE_ANTICIPATION_NOTE', 'TRAN'), ('US_TREASURY_NOTE_UST', 'UST'), ('US_TREASURY_BILL_USTB', 'USTB'), ('VARIABLE_RATE_DEMAND_NOTE', 'VRDN'), ('WARRANT', 'WAR'), ('WITHDRAWN', 'WITHDRN'), ('WILDCARD_ENTRY_FOR_USE_ON_SECURITY_DEFINITION_REQUEST', '?'), ('EXTENDED_COMM_NOTE', 'XCN'), ('INDEXED_LINKED', 'XLINKD'), ('YANKEE_CORPORATE_BOND', 'YANK'), ('YANKEE_CERTIFICATE_OF_DEPOSIT', 'YCD'), ('OPTIONS_ON_PHYSICAL', 'OOP'), ('OPTIONS_ON_FUTURES', 'OOF'), ('CASH', 'CASH'), ('OPTIONS_ON_COMBO', 'OOC'), ('INTEREST_RATE_SWAP', 'IRS'), ('BANK_DEPOSITORY_NOTE', 'BDN'), ('CANADIAN_MONEY_MARKETS', 'CAMM'), ('CANADIAN_TREASURY_NOTES', 'CAN'), ('CANADIAN_TREASURY_BILLS', 'CTB'), ('CREDIT_DEFAULT_SWAP', 'CDS'), ('CANADIAN_MORTGAGE_BONDS', 'CMB'), ('EURO_CORPORATE_FLOATING_RATE_NOTES', 'EUFRN'), ('US_CORPORATE_FLOATING_RATE_NOTES', 'FRN'), ('CANADIAN_PROVINCIAL_BONDS', 'PROV'), ('SECURED_LIQUIDITY_NOTE', 'SLQN'), ('TREASURY_BILL', 'TB'), ('TERM_LIQUIDITY_NOTE', 'TLQN'), ('TAXABLE_MUNICIPAL_CP', 'TMCP'),)),
+    (168, 'EffectiveTime', 'UTCTIMESTAMP', ()),
+    (169, 'StandInstDbType', 'INT', (('OTHER', 0), ('DTC_SID', 1), ('THOMSON_ALERT', 2), ('A_GLOBAL_CUSTODIAN', 3), ('ACCOUNTNET', 4),)),
+    (170, 'StandInstDbName', 'STRING', ()),
+    (171, 'StandInstDbID', 'STRING', ()),
+    (172, 'SettlDeliveryType', 'INT', (('VERSUS_PAYMENT_DELIVER', 0), ('FREE_DELIVER', 1), ('TRI_PARTY', 2), ('HOLD_IN_CUSTODY', 3),)),
+    (173, 'SettlDepositoryCode', 'STRING', ()),
+    (174, 'SettlBrkrCode', 'STRING', ()),
+    (175, 'SettlInstCode', 'STRING', ()),
+    (176, 'SecuritySettlAgentName', 'STRING', ()),
+    (177, 'SecuritySettlAgentCode', 'STRING', ()),
+    (178, 'SecuritySettlAgentAcctNum', 'STRING', ()),
+    (179, 'SecuritySettlAgentAcctName', 'STRING', ()),
+    (180, 'SecuritySettlAgentContactName', 'STRING', ()),
+    (181, 'SecuritySettlAgentContactPhone', 'STRING', ()),
+    (182, 'CashSettlAgentName', 'STRING', ()),
+    (183, 'CashSettlAgentCode', 'STRING', ()),
+    (184, 'CashSettlAgentAcctNum', 'STRING', ()),
+    (185, 'CashSettlAgentAcctName', 'STRING', ()),
+    (186, 'CashSettlAgentContactName', 'STRING', ()),
+    (187, 'CashSettlAgentContactPhone', 'STRING', ()),
+    (188, 'BidSpotRate', 'PRICE', ()),
+    (189, 'BidForwardPoints', 'PRICEOFFSET', ()),
+    (190, 'OfferSpotRate', 'PRICE', ()),
+    (191, 'OfferForwardPoints', 'PRICEOFFSET', ()),
+    (192, 'OrderQty2', 'QTY', ()),
+    (193, 'SettlDate2', 'LOCALMKTDATE', ()),
+    (194, 'LastSpotRate', 'PRICE', ()),
+    (195, 'LastForwardPoints', 'PRICEOFFSET', ()),
+    (196, 'AllocLinkID', 'STRING', ()),
+    (197, 'AllocLinkType', 'INT', (('FX_NETTING', 0), ('FX_SWAP', 1),)),
+    (198, 'SecondaryOrderID', 'STRING', ()),
+    (199, 'NoIOIQualifiers', 'NUMINGROUP', ()),
+    (200, 'MaturityMonthYear', 'MONTHYEAR', ()),
+    (201, 'PutOrCall', 'INT', (('PUT', 0), ('CALL', 1),)),
+    (202, 'StrikePrice', 'PRICE', ()),
+    (203, 'CoveredOrUncovered', 'INT', (('COVERED', 0), ('UNCOVERED', 1),)),
+    (204, 'CustomerOrFirm', 'INT', (('CUSTOMER', 0), ('FIRM', 1),)),
+    (205, 'MaturityDay', 'DAYOFMONTH', ()),
+    (206, 'OptAttribute', 'CHAR', ()),
+    (207, 'SecurityExchange', 'EXCHANGE', ()),
+    (208, 'NotifyBrokerOfCredit', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (209, 'AllocHandlInst', 'INT', (('MATCH', 1), ('FORWARD', 2), ('FORWARD_AND_MATCH', 3),)),
+    (210, 'MaxShow', 'QTY', ()),
+    (211, 'PegOffsetValue', 'FLOAT', ()),
+    (212, 'XmlDataLen', 'LENGTH', ()),
+    (213, 'XmlData', 'DATA', ()),
+    (214, 'SettlInstRefID', 'STRING', ()),
+    (215, 'NoRoutingIDs', 'NUMINGROUP', ()),
+    (216, 'RoutingType', 'INT', (('TARGET_FIRM', 1), ('TARGET_LIST', 2), ('BLOCK_FIRM', 3), ('BLOCK_LIST', 4),)),
+    (217, 'RoutingID', 'STRING', ()),
+    (218, 'Spread', 'PRICEOFFSET', ()),
+    (219, 'Benchmark', 'CHAR', (('CURVE', '1'), ('_5YR', '2'), ('OLD5', '3'), ('_10YR', '4'), ('OLD10', '5'), ('_30YR', '6'), ('OLD30', '7'), ('_3MOLIBOR', '8'), ('_6MOLIBOR', '9'),)),
+    (220, 'BenchmarkCurveCurrency', 'CURRENCY', ()),
+    (221, 'BenchmarkCurveName', 'STRING', (('EONIA', 'EONIA'), ('EUREPO', 'EUREPO'), ('EURIBOR', 'Euribor'), ('FUTURESWAP', 'FutureSWAP'), ('LIBID', 'LIBID'), ('LIBOR', 'LIBOR'), ('MUNIAAA', 'MuniAAA'), ('OTHER', 'OTHER'), ('PFANDBRIEFE', 'Pfandbriefe'), ('SONIA', 'SONIA'), ('SWAP', 'SWAP'), ('TREASURY', 'Treasury'),)),
+    (222, 'BenchmarkCurvePoint', 'STRING', ()),
+    (223, 'CouponRate', 'PERCENTAGE', ()),
+    (224, 'CouponPaymentDate', 'LOCALMKTDATE', ()),
+    (225, 'IssueDate', 'LOCALMKTDATE', ()),
+    (226, 'RepurchaseTerm', 'INT', ()),
+    (227, 'RepurchaseRate', 'PERCENTAGE', ()),
+    (228, 'Factor', 'FLOAT', ()),
+    (229, 'TradeOriginationDate', 'LOCALMKTDATE', ()),
+    (230, 'ExDate', 'LOCALMKTDATE', ()),
+    (231, 'ContractMultiplier', 'FLOAT', ()),
+    (232, 'NoStipulations', 'NUMINGROUP', ()),
+    (233, 'StipulationType', 'STRING', (('ABSOLUTE_PREPAYMENT_SPEED', 'ABS'), ('ALTERNATIVE_MINIMUM_TAX', 'AMT'), ('AUTO_REINVESTMENT_AT_RATE_OR_BETTER', 'AUTOREINV'), ('BANK_QUALIFIED', 'BANKQUAL'), ('BARGAIN_CONDITIONS', 'BGNCON'), ('COUPON_RANGE', 'COUPON'), ('CONSTANT_PREPAYMENT_PENALTY', 'CPP'), ('CONSTANT_PREPAYMENT_RATE', 'CPR'), ('CONSTANT_PREPAYMENT_YIELD', 'CPY'), ('ISO_CURRENCY_CODE', 'CURRENCY'), ('CUSTOM_START_END_DATE', 'CUSTOMDATE'), ('GEOGRAPHICS_AND_RANGE', 'GEOG'), ('VALUATION_DISCOUNT', 'HAIRCUT'), ('FINAL_CPR_OF_HOME_EQUITY_PREPAYMENT_CURVE', 'HEP'), ('INSURED', 'INSURED'), ('YEAR_OR_YEAR_MONTH_OF_ISSUE', 'ISSUE'), ('ISSUERS_TICKER', 'ISSUER'), ('ISSUE_SIZE_RANGE', 'ISSUESIZE'), ('LOOKBACK_DAYS', 'LOOKBACK'), ('EXPLICIT_LOT_IDENTIFIER', 'LOT'), ('LOT_VARIANCE', 'LOTVAR'), ('MATURITY_YEAR_AND_MONTH', 'MAT'), ('MATURITY_RANGE', 'MATURITY'), ('MAXIMUM_SUBSTITUTIONS', 'MAXSUBS'), ('PERCENT_OF_MANUFACTURED_HOUSING_PREPAYMENT_CURVE', 'MHP'), ('MINIMUM_DENOMINATION', 'MINDNOM'), ('MINIMUM_INCREMENT', 'MININCR'), ('MINIMUM_QUANTITY', 'MINQTY'), ('MONTHLY_PREPAYMENT_RATE', 'MPR'), ('PAYMENT_FREQUENCY_CALENDAR', 'PAYFREQ'), ('NUMBER_OF_PIECES', 'PIECES'), ('POOLS_MAXIMUM', 'PMAX'), ('PERCENT_OF_PROSPECTUS_PREPAYMENT_CURVE', 'PPC'), ('POOLS_PER_LOT', 'PPL'), ('POOLS_PER_MILLION', 'PPM'), ('POOLS_PER_TRADE', 'PPT'), ('PRICE_RANGE', 'PRICE'), ('PRICING_FREQUENCY', 'PRICEFREQ'), ('PRODUCTION_YEAR', 'PROD'), ('CALL_PROTECTION', 'PROTECT'), ('PERCENT_OF_BMA_PREPAYMENT_CURVE', 'PSA'), ('PURPOSE', 'PURPOSE'), ('BENCHMARK_PRICE_SOURCE', 'PXSOURCE'), ('RATING_SOURCE_AND_RANGE', 'RATING'), ('TYPE_OF_REDEMPTION', 'REDEMPTION'), ('RESTRICTED', 'RESTRICTED'), ('MARKET_SECTOR', 'SECTOR'), ('SECURITY_TYPE_INCLUDED_OR_EXCLUDED', 'SECTYPE'), ('SINGLE_MONTHLY_MORTALITY', 'SMM'), ('STRUCTURE', 'STRUCT'), ('SUBSTITUTIONS_FREQUENCY', 'SUBSFREQ'), ('SUBSTITUTIONS_LEFT', 'SUBSLEFT'), ('FREEFORM_TEXT', 'TEXT'), ('TRADE_VARIANCE', 'TRDVAR'), ('WEIGHTED_AVERAGE_COUPON', 'WAC'), ('WEIGHTED_AVERAGE_LIFE_COUPON', 'WAL'), ('WEIGHTED_AVERAGE_LOAN_AGE', 'WALA'), ('WEIGHTED_AVERAGE_MATURITY', 'WAM'), ('WHOLE_POOL', 'WHOLE'), ('YIELD_RANGE', 'YIELD'), ('AVERAGE_FICO_SCORE', 'AVFICO'), ('AVERAGE_LOAN_SIZE', 'AVSIZE'), ('MAXIMUM_LOAN_BALANCE', 'MAXBAL'), ('POOL_IDENTIFIER', 'POOL'), ('TYPE_OF_ROLL_TRADE', 'ROLLTYPE'), ('REFERENCE_TO_ROLLING_OR_CLOSING_TRADE', 'REFTRADE'), ('PRINCIPAL_OF_ROLLING_OR_CLOSING_TRADE', 'REFPRIN'), ('INTEREST_OF_ROLLING_OR_CLOSING_TRADE', 'REFINT'), ('AVAILABLE_OFFER_QUANTITY_TO_BE_SHOWN_TO_THE_STREET', 'AVAILQTY'), ('BROKERS_SALES_CREDIT', 'BROKERCREDIT'), ('OFFER_PRICE_TO_BE_SHOWN_TO_INTERNAL_BROKERS', 'INTERNALPX'), ('OFFER_QUANTITY_TO_BE_SHOWN_TO_INTERNAL_BROKERS', 'INTERNALQTY'), ('THE_MINIMUM_RESIDUAL_OFFER_QUANTITY', 'LEAVEQTY'), ('MAXIMUM_ORDER_SIZE', 'MAXORDQTY'), ('ORDER_QUANTITY_INCREMENT', 'ORDRINCR'), ('PRIMARY_OR_SECONDARY_MARKET_INDICATOR', 'PRIMARY'), ('BROKER_SALES_CREDIT_OVERRIDE', 'SALESCREDITOVR'), ('TRADERS_CREDIT', 'TRADERCREDIT'), ('DISCOUNT_RATE', 'DISCOUNT'), ('YIELD_TO_MATURITY', 'YTM'),)),
+    (234, 'StipulationValue', 'STRING', ()),
+    (235, 'YieldType', 'STRING', (('AFTER_TAX_YIELD', 'AFTERTAX'), ('ANNUAL_YIELD', 'ANNUAL'), ('YIELD_AT_ISSUE', 'ATISSUE'), ('YIELD_TO_AVG_MATURITY', 'AVGMATURITY'), ('BOOK_YIELD', 'BOOK'), ('YIELD_TO_NEXT_CALL', 'CALL'), ('YIELD_CHANGE_SINCE_CLOSE', 'CHANGE'), ('CLOSING_YIELD', 'CLOSE'), ('COMPOUND_YIELD', 'COMPOUND'), ('CURRENT_YIELD', 'CURRENT'), ('GVNT_EQUIVALENT_YIELD', 'GOVTEQUIV'), ('TRUE_GROSS_YIELD', 'GROSS'), ('YIELD_WITH_INFLATION_ASSUMPTION', 'INFLATION'), ('INVERSE_FLOATER_BOND_YIELD', 'INVERSEFLOATER'), ('MOST_RECENT_CLOSING_YIELD', 'LASTCLOSE'), ('CLOSING_YIELD_MOST_RECENT_MONTH', 'LASTMONTH'), ('CLOSING_YIELD_MOST_RECENT_QUARTER', 'LASTQUARTER'), ('CLOSING_YIELD_MOST_RECENT_YEAR', 'LASTYEAR'), ('YIELD_TO_LONGEST_AVERAGE_LIFE', 'LONGAVGLIFE'), ('MARK_TO_MARKET_YIELD', 'MARK'), ('YIELD_TO_MATURITY', 'MATURITY'), ('YIELD_TO_NEXT_REFUND', 'NEXTREFUND'), ('OPEN_AVERAGE_YIELD', 'OPENAVG'), ('PREVIOUS_CLOSE_YIELD', 'PREVCLOSE'), ('PROCEEDS_YIELD', 'PROCEEDS'), ('YIELD_TO_NEXT_PUT', 'PUT'), ('SEMI_ANNUAL_YIELD', 'SEMIANNUAL'), ('YIELD_TO_SHORTEST_AVERAGE_LIFE', 'SHORTAVGLIFE'), ('SIMPLE_YIELD', 'SIMPLE'), ('TAX_EQUIVALENT_YIELD', 'TAXEQUIV'), ('YIELD_TO_TENDER_DATE', 'TENDER'), ('TRUE_YIELD', 'TRUE'), ('YIELD_VALUE_OF_1_32', 'VALUE1_32'), ('YIELD_TO_WORST', 'WORST'),)),
+    (236, 'Yield', 'PERCENTAGE', ()),
+    (237, 'TotalTakedown', 'AMT', ()),
+    (238, 'Concession', 'AMT', ()),
+    (239, 'RepoCollateralSecurityType', 'INT', ()),
+    (240, 'RedemptionDate', 'LOCALMKTDATE', ()),
+    (241, 'UnderlyingCouponPaymentDate', 'LOCALMKTDATE', ()),
+    (242, 'UnderlyingIssueDate', 'LOCALMKTDATE', ()),
+    (243, 'UnderlyingRepoCollateralSecurityType', 'INT', ()),
+    (244, 'UnderlyingRepurchaseTerm', 'INT', ()),
+    (245, 'UnderlyingRepurchaseRate', 'PERCENTAGE', ()),
+    (246, 'UnderlyingFactor', 'FLOAT', ()),
+    (247, 'UnderlyingRedemptionDate', 'LOCALMKTDATE', ()),
+    (248, 'LegCouponPaymentDate', 'LOCALMKTDATE', ()),
+    (249, 'LegIssueDate', 'LOCALMKTDATE', ()),
+    (250, 'LegRepoCollateralSecurityType', 'INT', ()),
+    (251, 'LegRepurchaseTerm', 'INT', ()),
+    (252, 'LegRepurchaseRate', 'PERCENTAGE', ()),
+    (253, 'LegFactor', 'FLOAT', ()),
+    (254, 'LegRedemptionDate', 'LOCALMKTDATE', ()),
+    (255, 'CreditRating', 'STRING', ()),
+    (256, 'UnderlyingCreditRating', 'STRING', ()),
+    (257, 'LegCreditRating', 'STRING', ()),
+    (258, 'TradedFlatSwitch', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (259, 'BasisFeatureDate', 'LOCALMKTDATE', ()),
+    (260, 'BasisFeaturePrice', 'PRICE', ()),
+    (262, 'MDReqID', 'STRING', ()),
+    (263, 'SubscriptionRequestType', 'CHAR', (('SNAPSHOT', '0'), ('SNAPSHOT_PLUS_UPDATES', '1'), ('DISABLE_PREVIOUS_SNAPSHOT_PLUS_UPDATE_REQUEST', '2'),)),
+    (264, 'MarketDepth', 'INT', ()),
+    (265, 'MDUpdateType', 'INT', (('FULL_REFRESH', 0), ('INCREMENTAL_REFRESH', 1),)),
+    (266, 'AggregatedBook', 'BOOLEAN', (('YES', 'Y'), ('NO', 'N'),)),
+    (267, 'NoMDEntryTypes', 'NUMINGROUP', ()),
+    (268, 'NoMDEntries', 'NUMINGROUP', ()),
+    (269, 'MDEntryType', 'CHAR', (('BID', '0'), ('OFFER', '1'), ('TRADE', '2'), ('INDEX_VALUE', '3'), ('OPENING_PRICE', '4'), ('CLOSING_PRICE', '5'), ('SETTLEMENT_PRICE', '6'), ('TRADING_SESSION_HIGH_PRICE', '7'), ('TRADING_SESSION_LOW_PRICE', '8'), ('TRADING_SESSION_VWAP_PRICE', '9'), ('IMBALANCE', 'A'), ('TRADE_VOLUME', 'B'), ('OPEN_INTEREST', 'C'), ('COMPOSITE_UNDERLYING_PRICE', 'D'), ('SIMULATED_SELL_PRICE', 'E'), ('SIMULATED_BUY_PRICE', 'F'), ('MARGIN_RATE', 'G'), ('MID_PRICE', 'H'), ('EMPTY_BOOK', 'J'), ('SETTLE_HIGH_PRICE', 'K'), ('SETTLE_LOW_PRICE', 'L'), ('PRIOR_SETTLE_PRICE', 'M'), ('SESSION_HIGH_BID', 'N'), ('SESSION_LOW_OFFER', 'O'), ('EARLY_PRICES', 'P'), ('AUCTION_CLEARING_PRICE', 'Q'), ('SWAP_VALUE_FACTOR', 'S'), ('DAILY_VALUE_ADJUSTMENT_FOR_LONG_POSITIONS', 'R'), ('CUMULATIVE_VALUE_ADJUSTMENT_FOR_LONG_POSITIONS', 'T'), ('DAILY_VALUE_ADJUSTMENT_FOR_SHORT_POSITIONS', 'U'), ('CUMULATIVE_VALUE_ADJUSTMENT_FOR_SHORT_POSITIONS', 'V'),)),
+    (270, 'MDEntryPx', 'PRICE', ()),
+    (271, 'MDEntrySize', 'QTY', ()),
+    (272, 'MDEntryDate', 'UTCDATEONLY', ()),
+    (273, 'MDEntryTime', 'UTCTIMEONLY', ()),
+    (274, 'TickDirection', 'CHAR', (('PLUS_TICK', '0'), ('ZERO_PLUS_TICK', '1'), ('MINUS_TICK', '2'), ('ZERO_MINUS_TICK', '3'),)),
+    (275, 'MDMkt', 'EXCHANGE', ()),
+    (276, 'QuoteCondition', 'MULTIPLESTRINGVALUE', (('OPEN_ACTIVE', 'A'), ('CLOSED_INACTIVE', 'B'), ('EXCHANGE_BEST', 'C'), ('CONSOLIDATED_BEST', 'D'), ('LOCKED', 'E'), ('CROSSED', 'F'), ('DEPTH', 'G'), ('FAST_TRADING', 'H'), ('NON_FIRM', 'I'), ('MANUAL_SLOW_QUOTE', 'L'), ('OUTRIGHT_PRICE', 'J'), ('IMPLIED_PRICE', 'K'), ('DEPTH_ON_OFFER', 'M'), ('DEPTH_ON_BID', 'N'), ('CLOSING', 'O'), ('NEWS_DISSEMINATION', 'P'), ('TRADING_RANGE', 'Q'), ('ORDER_INFLUX', 'R'), ('DUE_TO_RELATED', 'S'), ('NEWS_PENDING', 'T'), ('ADDITIONAL_INFO', 'U'), ('ADDITIONAL_INFO_DUE_TO_RELATED', 'V'), ('RESUME', 'W'), ('VIEW_OF_COMMON', 'X'), ('VOLUME_ALERT', 'Y'), ('ORDER_IMBALANCE', 'Z'), ('EQUIPMENT_CHANGEOVER', 'a'), ('NO_OPEN', 'b'), ('REGULAR_ETH', 'c'), ('AUTOMATIC_EXECUTION', 'd'), ('AUTOMATIC_EXECUTION_ETH', 'e'), ('FAST_MARKET_ETH', 'f '), ('INACTIVE_ETH', 'g'), ('ROTATION', 'h'), ('ROTATION_ETH', 'i'), ('HALT', 'j'), ('HALT_ETH', 'k'), ('DUE_TO_NEWS_DISSEMINATION', 'l'), ('DUE_TO_NEWS_PENDING', 'm'), ('TRADING_RESUME', 'n'), ('OUT_OF_SEQUENCE', 'o'), ('BID_SPECIALIST', 'p'), ('OFFER_SPECIALIST', 'q'), ('BID_OFFER_SPECIALIST', 'r'), ('END_OF_DAY_SAM', 's'), ('FORBIDDEN_SAM', 't'), ('FROZEN_SAM', 'u'), ('PREOPENING_SAM', 'v'), ('OPENING_SAM', 'w'), ('OPEN_SAM', 'x'), ('SURVEILLANCE_SAM', 'y'), ('SUSPENDED_SAM', 'z'), ('RESERVED_SAM', '0'), ('NO_ACTIVE_SAM', '1'), ('RESTRICTED', '2'), ('REST_OF_BOOK_VWAP', '3'), ('BETTER_PRICES_IN_CONDITIONAL_ORDERS', '4'), ('MEDIAN_PRICE', '5'),)),
+    (277, 'TradeCondition', 'MULTIPLESTRINGVALUE', (('CASH', 'A'), ('AVERAGE_PRICE_TRADE', 'B'), ('CASH_TRADE', 'C'), ('NEXT_DAY', 'D'), ('OPENING_REOPENING_TRADE_DETAIL', 'E'), ('INTRADAY_TRADE_DETAIL', 'F'), ('RULE_127_TRADE', 'G'), ('RULE_155_TRADE', 'H'), ('SOLD_LAST', 'I'), ('NEXT_DAY_TRADE', 'J'), ('OPENED', 'K'), ('SELLER', 'L'), ('SOLD', 'M'), ('STOPPED_STOCK', 'N'), ('IMBALANCE_MORE_BUYERS', 'P'), ('IMBALANCE_MORE_SELLERS', 'Q'), ('OPENING_PRICE', 'R'), ('TRADES_RESULTING_FROM_MANUAL_SLOW_QUOTE', 'Y'), ('TRADES_RESULTING_FROM_INTERMARKET_SWEEP', 'Z'), ('BARGAIN_CONDITION', 'S'), ('CONVERTED_PRICE_INDICATOR', 'T'), ('EXCHANGE_LAST', 'U'), ('FINAL_PRICE_OF_SESSION', 'V'), ('EX_PIT', 'W'), ('CROSSED_X', 'X'), ('CANCEL', '0'), ('VOLUME_ONLY', 'a'), ('DIRECT_PLUS', 'b'), ('ACQUISITION', 'c'), ('BUNCHED', 'd'), ('DISTRIBUTION', 'e'), ('BUNCHED_SALE', 'f'), ('SPLIT_TRADE', 'g'), ('CANCEL_STOPPED', 'h'), ('CANCEL_ETH', 'i'), ('CANCEL_STOPPED_ETH', 'j'), ('OUT_OF_SEQUENCE_ETH', 'k'), ('CANCEL_LAST_ETH', 'l'), ('SOLD_LAST_SALE_ETH', 'm'), ('CANCEL_LAST', 'n'), ('SOLD_LAST_SALE', 'o'), ('CANCEL_OPEN', 'p'), ('CANCEL_OPEN_ETH', 'q'), ('OPENED_SALE_ETH', 'r'), ('CANCEL_ONLY', 's'), ('CANCEL_ONLY_ETH', 't'), ('LATE_OPEN_ETH', 'u'), ('AUTO_EXECUTION_ETH', 'v'), ('REOPEN', 'w'), ('REOPEN_ETH', 'x'), ('ADJUSTED', 'y'), ('ADJUSTED_ETH', 'z'), ('SPREAD', 'AA'), ('SPREAD_ETH', 'AB'), ('STRADDLE', 'AC'), ('STRADDLE_ETH', 'AD'), ('STOPPED', 'AE'), ('STOPPED_ETH', 'AF'), ('REGULAR_ETH', 'AG'), ('COMBO', 'AH'), ('COMBO_ETH', 'AI'), ('OFFICIAL_CLOSING_PRICE', 'AJ'), ('PRIOR_REFERENCE_PRICE', 'AK'), ('STOPPED_SOLD_LAST', 'AL'), ('STOPPED_OUT_OF_SEQUENCE', 'AM'), ('OFFICAL_CLOSING_PRICE', 'AN'), ('CROSSED_AO', 'AO'), ('FAST_MARKET', 'AP'), ('AUTOMATIC_EXECUTION', 'AQ'), ('FORM_T', 'AR'), ('BASKET_INDEX', 'AS'), ('BURST_BASKET', 'AT'), ('IMPLIED_TRADE', '1'), ('OUTSIDE_SPREAD', 'AV'), ('MARKETPLACE_ENTERED_TRADE', '2'), ('MULT_ASSET_CLASS_MULTILEG_TRADE', '3'), ('MULTILEG_TO_MULTILEG_TRADE', '4'),)),
+    (278, 'MDEntryID', 'STRING', ()),
+    (279, 'MDUpdateAction', 'CHAR', (('NEW', '0'), ('CHANGE', '1'), ('DELETE', '2'), ('DELETE_THRU', '3'), ('DELETE_FROM', '4'), ('OVERLAY', '5'),)),
+    (280, 'MDEntryRefID', 'STRING', ()),
+    (281, 'MDReqRejReason', 'CHAR', (('UNKNOWN_SYMBOL', '0'), ('DUPLICATE_MDREQID', '1'), ('INSUFFICIENT_BANDWIDTH', '2'), ('INSUFFICIENT_PERMISSIONS', '3'), ('UNSUPPORTED_SUBSCRIPTIONREQUESTTYPE', '4'), ('UNSUPPORTED_MARKETDEPTH', '5'), ('UNSUPPORTED_MDUPDATETYPE', '6'), ('UNSUPPORTED_AGGREGATEDBOOK', '7'), ('UNSUPPORTED_MDENTRYTYPE', '8'), ('UNSUPPORTED_TRADINGSESSIONID', '9'), ('UNSUPPORTED_SCOPE', 'A'), ('UNSUPPORTED_OPENCLOSESETTLEFLAG', 'B'), ('UNSUPPORTED_MDIMPLICITDELETE', 'C'), ('INSUFFICIENT_CREDIT', 'D'),)),
+    (282, 'MDEntryOriginator', 'STRING', ()),
+    (283, 'LocationID', 'STRING', ()),
+    (284, 'DeskID', 'STRING', ()),
+    (285, 'DeleteReason', 'CHAR', (('CANCELLATION', '0'), ('ERROR', '1'),)),
+    (286, 'OpenCloseSettlFlag', 'MULTIPLECHARVALUE', (('DAILY_OPEN', '0'), ('SESSION_OPEN', '1'), ('DELIVERY_SETTLEMENT_ENTRY', '2'), ('EXPECTED_ENTRY', '3'), ('ENTRY_FROM_PREVIOUS_BUSINESS_DAY', '4'), ('THEORETICAL_PRICE_VALUE', '5'),)),
+    (287, 'SellerDays', 'INT', ()),
+    (288, 'MDEntryBuyer', 'STRING', ()),
+    (289, 'MDEntrySeller', 'STRING', ()),
+    (290, 'MDEntryPositionNo', 'INT', ()),
+    (291, 'FinancialStatus', 'MULTIPLECHARVALUE', (('BANKRUPT', '1'), ('PENDING_DELISTING', '2'), ('RESTRICTED', '3'),)),
+    (292, 'CorporateAction', 'MULTIPLECHARVALUE', (('EX_DIVIDEND', 'A'), ('EX_DISTRIBUTION', 'B'), ('EX_RIGHTS', 'C'), ('NEW', 'D'), ('EX_INTEREST', 'E'), ('CASH_DIVIDEND', 'F'), ('STOCK_DIVIDEND', 'G'), ('NON_INTEGER_STOCK_SPLIT', 'H'), ('REVERSE_STOCK_SPLIT', 'I'), ('STANDARD_INTEGER_STOCK_SPLIT', 'J'), ('POSITION_CONSOLIDATION', 'K'), ('LIQUIDATION_REORGANIZATION', 'L'), ('MERGER_REORGANIZATION', 'M'), ('RIGHTS_OFFERING', 'N'), ('SHAREHOLDER_MEETING', 'O'), ('SPINOFF', 'P'), ('TENDER_OFFER', 'Q'), ('WARRANT', 'R'), ('SPECIAL_ACTION', 'S'), ('SYMBOL_CONVERSION', 'T'), ('CUSIP', 'U'), ('LEAP_ROLLOVER', 'V'), ('SUCCESSION_EVENT', 'W'),)),
+    (293, 'DefBidSize', 'QTY', ()),
+    (294, 'DefOfferSize', 'QTY', ()),
+    (295, 'NoQuoteEntries', 'NUMINGROUP', ()),
+    (296, 'NoQuoteSets', 'NUMINGROUP', ()),
+    (297, 'QuoteStatus', 'INT', (('ACCEPTED', 0), ('CANCEL_FOR_SYMBOL', 1), ('PENDING', 10), ('PASS', 11), ('LOCKED_MARKET_WARNING', 12), ('CROSS_MARKET_WARNING', 13), ('CANCELED_DUE_TO_LOCK_MARKET', 14), ('CANCELED_DUE_TO_CROSS_MARKET', 15), ('CANCELED_FOR_SECURITY_TYPE', 2), ('CANCELED_FOR_UNDERLYING', 3), ('CANCELED_ALL', 4), ('REJECTED', 5), ('REMOVED_FROM_MARKET', 6), ('EXPIRED', 7), ('QUERY', 8), ('QUOTE_NOT_FOUND', 9), ('ACTIVE', 16), ('CANCELED', 17), ('UNSOLICITED_QUOTE_REPLENISHMENT', 18), ('PENDING_END_TRADE', 19), ('TOO_LATE_TO_END', 20),)),
+    (298, 'QuoteCancelType', 'INT', (('CANCEL_FOR_SYMBOL', 1), ('CANCEL_FOR_SECURITY_TYPE', 2), ('CANCEL_FOR_UNDERLYING_SYMBOL', 3), ('CANCEL_ALL_QUOTES', 4), ('CANCEL_QUOTE_SPECIFIED_IN_QUOTEID', 5),)),
+    (299, 'QuoteEntryID', 'STRING', ()),
+    (300, 'QuoteRejectReason', 'INT', (('UNKNOWN_SYMBOL', 1), ('EXCHANGE', 2), ('QUOTE_REQUEST_EXCEEDS_LIMIT', 3), ('TOO_LATE_TO_ENTER', 4), ('UNKNOWN_QUOTE', 5), ('DUPLICATE_QUOTE', 6), ('INVALID_BID_ASK_SPREAD', 7), ('INVALID_PRICE', 8), ('NOT_AUTHORIZED_TO_QUOTE_SECURITY', 9), ('OTHER', 99), ('PRICE_EXCEEDS_CURRENT_PRICE_BAND', 10), ('QUOTE_LOCKED', 11),)),
+    (301, 'QuoteResponseLevel', 'INT', (('NO_ACKNOWLEDGEMENT', 0), ('ACKNOWLEDGE_ONLY_NEGATIVE_OR_ERRONEOUS_QUOTES', 1), ('ACKNOWLEDGE_EACH_QUOTE_MESSAGES', 2), ('SUMMARY_ACKNOWLEDGEMENT', 3),)),
+    (302, 'QuoteSetID', 'STRING', ()),
+    (303, 'QuoteRequestType', 'INT', (('MANUAL', 1), ('AUTOMATIC', 2),)),
+    (304, 'TotNoQuoteEntries', 'INT', ()),
+    (305, 'UnderlyingSecurityIDSource', 'STRING', ()),
+    (306, 'UnderlyingIssuer', 'STRING', ()),
+    (307, 'UnderlyingSecurityDesc', 'STRING', ()),
+    (308, 'UnderlyingSecurityExchange', 'EXCHANGE', ()),
+    (309, 'UnderlyingSecurityID', 'STRING', ()),
+    (310, 'UnderlyingSecurityType', 'STRING', ()),
+    (311, 'UnderlyingSymbol', 'STRING', ()),
+    (312, 'UnderlyingSymbolSfx', 'STRING', ()),
+    (313, 'UnderlyingMaturityMonthYear', 'MONTHYEAR', ()),
+    (314, 'UnderlyingMaturityDay', 'DAYOFMONTH', ()),
+    (315, 'UnderlyingPutOrCall', 'INT', ()),
+    (316, 'UnderlyingStrikePrice', 'PRICE', ()),
+    (317, 'UnderlyingOptAttribute', 'CHAR', ()),
+    (318, 'UnderlyingCurrency', 'CURRENCY', ()),
+    (319, 'RatioQty', 'QTY', ()),
+    (320, 'SecurityReqID', 'STRING', ()),
+    (321, 'SecurityRequestType', 'INT', (('REQUEST_SECURITY_IDENTITY_AND_SPECIFICATIONS', 0), ('REQUEST_SECURITY_IDENTITY_FOR_THE_SPECIFICATIONS_PROVIDED', 1), ('REQUEST_LIST_SECURITY_TYPES', 2), ('REQUEST_LIST_SECURITIES', 3), ('SYMBOL', 4), ('SECURITYTYPE_AND_OR_CFICODE', 5), ('PRODUCT', 6), ('TRADINGSESSIONID', 7), ('ALL_SECURITIES', 8), ('MARKETID_OR_MARKETID_PLUS_MARKETSEGMENTID', 9),)),
+    (322, 'SecurityResponseID', 'STRING', ()),
+    (323, 'SecurityResponseType', 'INT', (('ACCEPT_SECURITY_PROPOSAL_AS_IS', 1), ('ACCEPT_SECURITY_PROPOSAL_WITH_REVISIONS_AS_INDICATED_IN_THE_MESSAGE', 2), ('LIST_OF_SECURITY_TYPES_RETURNED_PER_REQUEST', 3), ('LIST_OF_SECURITIES_RETURNED_PER_REQUEST', 4), ('REJECT_SECURITY_PROPOSAL', 5), ('CANNOT_MATCH_SELECTION_CRITERIA', 6),)),
+    (324, 'SecurityStatusReqID', 'STRING', ()),
+    (325, 'UnsolicitedIndicator', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (326, 'SecurityTradingStatus', 'INT', (('OPENING_DELAY', 1), ('MARKET_ON_CLOSE_IMBALANCE_SELL', 10), ('_11', 11), ('NO_MARKET_IMBALANCE', 12), ('NO_MARKET_ON_CLOSE_IMBALANCE', 13), ('ITS_PRE_OPENING', 14), ('NEW_PRICE_INDICATION', 15), ('TRADE_DISSEMINATION_TIME', 16), ('READY_TO_TRADE', 17), ('NOT_AVAILABLE_FOR_TRADING', 18), ('NOT_TRADED_ON_THIS_MARKET', 19), ('TRADING_HALT', 2), ('UNKNOWN_OR_INVALID', 20), ('PRE_OPEN', 21), ('OPENING_ROTATION', 22), ('FAST_MARKET', 23), ('RESUME', 3), ('NO_OPEN', 4), ('PRICE_INDICATION', 5), ('TRADING_RANGE_INDICATION', 6), ('MARKET_IMBALANCE_BUY', 7), ('MARKET_IMBALANCE_SELL', 8), ('MARKET_ON_CLOSE_IMBALANCE_BUY', 9), ('PRE_CROSS', 24), ('CROSS', 25),)),
+    (327, 'HaltReasonChar', 'CHAR', (('NEWS_DISSEMINATION', 'D'), ('ORDER_INFLUX', 'E'), ('ORDER_IMBALANCE', 'I'), ('ADDITIONAL_INFORMATION', 'M'), ('NEW_PENDING', 'P'), ('EQUIPMENT_CHANGEOVER', 'X'),)),
+    (328, 'InViewOfCommon', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (329, 'DueToRelated', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (330, 'BuyVolume', 'QTY', ()),
+    (331, 'SellVolume', 'QTY', ()),
+    (332, 'HighPx', 'PRICE', ()),
+    (333, 'LowPx', 'PRICE', ()),
+    (334, 'Adjustment', 'INT', (('CANCEL', 1), ('ERROR', 2), ('CORRECTION', 3),)),
+    (335, 'TradSesReqID', 'STRING', ()),
+    (336, 'TradingSessionID', 'STRING', (('DAY', '1'), ('HALFDAY', '2'), ('MORNING', '3'), ('AFTERNOON', '4'), ('EVENING', '5'), ('AFTER_HOURS', '6'),)),
+    (337, 'ContraTrader', 'STRING', ()),
+    (338, 'TradSesMethod', 'INT', (('ELECTRONIC', 1), ('OPEN_OUTCRY', 2), ('TWO_PARTY', 3),)),
+    (339, 'TradSesMode', 'INT', (('TESTING', 1), ('SIMULATED', 2), ('PRODUCTION', 3),)),
+    (340, 'TradSesStatus', 'INT', (('UNKNOWN', 0), ('HALTED', 1), ('OPEN', 2), ('CLOSED', 3), ('PRE_OPEN', 4), ('PRE_CLOSE', 5), ('REQUEST_REJECTED', 6),)),
+    (341, 'TradSesStartTime', 'UTCTIMESTAMP', ()),
+    (342, 'TradSesOpenTime', 'UTCTIMESTAMP', ()),
+    (343, 'TradSesPreCloseTime', 'UTCTIMESTAMP', ()),
+    (344, 'TradSesCloseTime', 'UTCTIMESTAMP', ()),
+    (345, 'TradSesEndTime', 'UTCTIMESTAMP', ()),
+    (346, 'NumberOfOrders', 'INT', ()),
+    (347, 'MessageEncoding', 'STRING', ()),
+    (348, 'EncodedIssuerLen', 'LENGTH', ()),
+    (349, 'EncodedIssuer', 'DATA', ()),
+    (350, 'EncodedSecurityDescLen', 'LENGTH', ()),
+    (351, 'EncodedSecurityDesc', 'DATA', ()),
+    (352, 'EncodedListExecInstLen', 'LENGTH', ()),
+    (353, 'EncodedListExecInst', 'DATA', ()),
+    (354, 'EncodedTextLen', 'LENGTH', ()),
+    (355, 'EncodedText', 'DATA', ()),
+    (356, 'EncodedSubjectLen', 'LENGTH', ()),
+    (357, 'EncodedSubject', 'DATA', ()),
+    (358, 'EncodedHeadlineLen', 'LENGTH', ()),
+    (359, 'EncodedHeadline', 'DATA', ()),
+    (360, 'EncodedAllocTextLen', 'LENGTH', ()),
+    (361, 'EncodedAllocText', 'DATA', ()),
+    (362, 'EncodedUnderlyingIssuerLen', 'LENGTH', ()),
+    (363, 'EncodedUnderlyingIssuer', 'DATA', ()),
+    (364, 'EncodedUnderlyingSecurityDescLen', 'LENGTH', ()),
+    (365, 'EncodedUnderlyingSecurityDesc', 'DATA', ()),
+    (366, 'AllocPrice', 'PRICE', ()),
+    (367, 'QuoteSetValidUntilTime', 'UTCTIMESTAMP', ()),
+    (368, 'QuoteEntryRejectReason', 'INT', ()),
+    (369, 'LastMsgSeqNumProcessed', 'SEQNUM', ()),
+    (370, 'OnBehalfOfSendingTime', 'UTCTIMESTAMP', ()),
+    (371, 'RefTagID', 'INT', ()),
+    (372, 'RefMsgType', 'STRING', ()),
+    (373, 'SessionRejectReason', 'INT', (('INVALID_TAG_NUMBER', 0), ('REQUIRED_TAG_MISSING', 1), ('SENDINGTIME_ACCURACY_PROBLEM', 10), ('INVALID_MSGTYPE', 11), ('XML_VALIDATION_ERROR', 12), ('TAG_APPEARS_MORE_THAN_ONCE', 13), ('TAG_SPECIFIED_OUT_OF_REQUIRED_ORDER', 14), ('REPEATING_GROUP_FIELDS_OUT_OF_ORDER', 15), ('INCORRECT_NUMINGROUP_COUNT_FOR_REPEATING_GROUP', 16), ('NON_DATA_VALUE_INCLUDES_FIELD_DELIMITER', 17), ('TAG_NOT_DEFINED_FOR_THIS_MESSAGE_TYPE', 2), ('UNDEFINED_TAG', 3), ('TAG_SPECIFIED_WITHOUT_A_VALUE', 4), ('VALUE_IS_INCORRECT', 5), ('INCORRECT_DATA_FORMAT_FOR_VALUE', 6), ('DECRYPTION_PROBLEM', 7), ('SIGNATURE_PROBLEM', 8), ('COMPID_PROBLEM', 9), ('OTHER', 99), ('INVALID_UNSUPPORTED_APPLICATION_VERSION', 18),)),
+    (374, 'BidRequestTransType', 'CHAR', (('CANCEL', 'C'), ('NO', 'N'),)),
+    (375, 'ContraBroker', 'STRING', ()),
+    (376, 'ComplianceID', 'STRING', ()),
+    (377, 'SolicitedFlag', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (378, 'ExecRestatementReason', 'INT', (('GT_CORPORATE_ACTION', 0), ('GT_RENEWAL', 1), ('WAREHOUSE_RECAP', 10), ('VERBAL_CHANGE', 2), ('REPRICING_OF_ORDER', 3), ('BROKER_OPTION', 4), ('PARTIAL_DECLINE_OF_ORDERQTY', 5), ('CANCEL_ON_TRADING_HALT', 6), ('CANCEL_ON_SYSTEM_FAILURE', 7), ('MARKET', 8), ('CANCELED_NOT_BEST', 9), ('OTHER', 99), ('PEG_REFRESH', 11),)),
+    (379, 'BusinessRejectRefID', 'STRING', ()),
+    (380, 'BusinessRejectReason', 'INT', (('OTHER', 0), ('UNKNOWN_ID', 1), ('UNKNOWN_SECURITY', 2), ('UNKNOWN_MESSAGE_TYPE', 3), ('APPLICATION_NOT_AVAILABLE', 4), ('CONDITIONALLY_REQUIRED_FIELD_MISSING', 5), ('NOT_AUTHORIZED', 6), ('DELIVERTO_FIRM_NOT_AVAILABLE_AT_THIS_TIME', 7), ('INVALID_PRICE_INCREMENT', 18),)),
+    (381, 'GrossTradeAmt', 'AMT', ()),
+    (382, 'NoContraBrokers', 'NUMINGROUP', ()),
+    (383, 'MaxMessageSize', 'LENGTH', ()),
+    (384, 'NoMsgTypes', 'NUMINGROUP', ()),
+    (385, 'MsgDirection', 'CHAR', (('RECEIVE', 'R'), ('SEND', 'S'),)),
+    (386, 'NoTradingSessions', 'NUMINGROUP', ()),
+    (387, 'TotalVolumeTraded', 'QTY', ()),
+    (388, 'DiscretionInst', 'CHAR', (('RELATED_TO_DISPLAYED_PRICE', '0'), ('RELATED_TO_MARKET_PRICE', '1'), ('RELATED_TO_PRIMARY_PRICE', '2'), ('RELATED_TO_LOCAL_PRIMARY_PRICE', '3'), ('RELATED_TO_MIDPOINT_PRICE', '4'), ('RELATED_TO_LAST_TRADE_PRICE', '5'), ('RELATED_TO_VWAP', '6'), ('AVERAGE_PRICE_GUARANTEE', '7'),)),
+    (389, 'DiscretionOffsetValue', 'FLOAT', ()),
+    (390, 'BidID', 'STRING', ()),
+    (391, 'ClientBidID', 'STRING', ()),
+    (392, 'ListName', 'STRING', ()),
+    (393, 'TotNoRelatedSym', 'INT', ()),
+    (394, 'BidType', 'INT', (('NON_DISCLOSED_STYLE', 1), ('DISCLOSED_SYTLE', 2), ('NO_BIDDING_PROCESS', 3),)),
+    (395, 'NumTickets', 'INT', ()),
+    (396, 'SideValue1', 'AMT', ()),
+    (397, 'SideValue2', 'AMT', ()),
+    (398, 'NoBidDescriptors', 'NUMINGROUP', ()),
+    (399, 'BidDescriptorType', 'INT', (('SECTOR', 1), ('COUNTRY', 2), ('INDEX', 3),)),
+    (400, 'BidDescriptor', 'STRING', ()),
+    (401, 'SideValueInd', 'INT', (('SIDE_VALUE_1', 1), ('SIDE_VALUE_2', 2),)),
+    (402, 'LiquidityPctLow', 'PERCENTAGE', ()),
+    (403, 'LiquidityPctHigh', 'PERCENTAGE', ()),
+    (404, 'LiquidityValue', 'AMT', ()),
+    (405, 'EFPTrackingError', 'PERCENTAGE', ()),
+    (406, 'FairValue', 'AMT', ()),
+    (407, 'OutsideIndexPct', 'PERCENTAGE', ()),
+    (408, 'ValueOfFutures', 'AMT', ()),
+    (409, 'LiquidityIndType', 'INT', (('_5_DAY_MOVING_AVERAGE', 1), ('_20_DAY_MOVING_AVERAGE', 2), ('NORMAL_MARKET_SIZE', 3), ('OTHER', 4),)),
+    (410, 'WtAverageLiquidity', 'PERCENTAGE', ()),
+    (411, 'ExchangeForPhysical', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (412, 'OutMainCntryUIndex', 'AMT', ()),
+    (413, 'CrossPercent', 'PERCENTAGE', ()),
+    (414, 'ProgRptReqs', 'INT', (('BUY_SIDE_EXPLICITLY_REQUESTS_STATUS_USING_STATUE_REQUEST', 1), ('SELL_SIDE_PERIODICALLY_SENDS_STATUS_USING_LIST_STATUS_PERIOD_OPTIONALLY_SPECIFIED_IN_PROGRESSPERIOD', 2), ('REAL_TIME_EXECUTION_REPORTS', 3),)),
+    (415, 'ProgPeriodInterval', 'INT', ()),
+    (416, 'IncTaxInd', 'INT', (('NET', 1), ('GROSS', 2),)),
+    (417, 'NumBidders', 'INT', ()),
+    (418, 'BidTradeType', 'CHAR', (('AGENCY', 'A'), ('VWAP_GUARANTEE', 'G'), ('GUARANTEED_CLOSE', 'J'), ('RISK_TRADE', 'R'),)),
+    (419, 'BasisPxType', 'CHAR', (('CLOSING_PRICE_AT_MORNINGN_SESSION', '2'), ('CLOSING_PRICE', '3'), ('CURRENT_PRICE', '4'), ('SQ', '5'), ('VWAP_THROUGH_A_DAY', '6'), ('VWAP_THROUGH_A_MORNING_SESSION', '7'), ('VWAP_THROUGH_AN_AFTERNOON_SESSION', '8'), ('VWAP_THROUGH_A_DAY_EXCEPT_YORI', '9'), ('VWAP_THROUGH_A_MORNING_SESSION_EXCEPT_YORI', 'A'), ('VWAP_THROUGH_AN_AFTERNOON_SESSION_EXCEPT_YORI', 'B'), ('STRIKE', 'C'), ('OPEN', 'D'), ('OTHERS', 'Z'),)),
+    (420, 'NoBidComponents', 'NUMINGROUP', ()),
+    (421, 'Country', 'COUNTRY', ()),
+    (422, 'TotNoStrikes', 'INT', ()),
+    (423, 'PriceType', 'INT', (('PERCENTAGE', 1), ('FIXED_CABINET_TRADE_PRICE', 10), ('VARIABLE_CABINET_TRADE_PRICE', 11), ('PER_UNIT', 2), ('FIXED_AMOUNT', 3), ('DISCOUNT', 4), ('PREMIUM', 5), ('SPREAD', 6), ('TED_PRICE', 7), ('TED_YIELD', 8), ('YIELD', 9), ('PRODUCT_TICKS_IN_HALFS', 13), ('PRODUCT_TICKS_IN_FOURTHS', 14), ('PRODUCT_TICKS_IN_EIGHTS', 15), ('PRODUCT_TICKS_IN_SIXTEENTHS', 16), ('PRODUCT_TICKS_IN_THIRTY_SECONDS', 17), ('PRODUCT_TICKS_IN_SIXTY_FORTHS', 18), ('PRODUCT_TICKS_IN_ONE_TWENTY_EIGHTS', 19),)),
+    (424, 'DayOrderQty', 'QTY', ()),
+    (425, 'DayCumQty', 'QTY', ()),
+    (426, 'DayAvgPx', 'PRICE', ()),
+    (427, 'GTBookingInst', 'INT', (('BOOK_OUT_ALL_TRADES_ON_DAY_OF_EXECUTION', 0), ('ACCUMULATE_EXECTUIONS_UNTIL_FORDER_IS_FILLED_OR_EXPIRES', 1), ('ACCUMULATE_UNTIL_VERBALLLY_NOTIFIED_OTHERWISE', 2),)),
+    (428, 'NoStrikes', 'NUMINGROUP', ()),
+    (429, 'ListStatusType', 'INT', (('ACK', 1), ('RESPONSE', 2), ('TIMED', 3), ('EXEC_STARTED', 4), ('ALL_DONE', 5), ('ALERT', 6),)),
+    (430, 'NetGrossInd', 'INT', (('NET', 1), ('GROSS', 2),)),
+    (431, 'ListOrderStatus', 'INT', (('IN_BIDDING_PROCESS', 1), ('RECEIVED_FOR_EXECUTION', 2), ('EXECUTING', 3), ('CANCELLING', 4), ('ALERT', 5), ('ALL_DONE', 6), ('REJECT', 7),)),
+    (432, 'ExpireDate', 'LOCALMKTDATE', ()),
+    (433, 'ListExecInstType', 'CHAR', (('IMMEDIATE', '1'), ('WAIT_FOR_EXECUT_INSTRUCTION', '2'), ('EXCHANGE_SWITCH_CIV_ORDER_3', '3'), ('EXCHANGE_SWITCH_CIV_ORDER_4', '4'), ('EXCHANGE_SWITCH_CIV_ORDER_5', '5'),)),
+    (434, 'CxlRejResponseTo', 'CHAR', (('ORDER_CANCEL_REQUEST', '1'), ('ORDER_CANCEL_REPLACE_REQUEST', '2'),)),
+    (435, 'UnderlyingCouponRate', 'PERCENTAGE', ()),
+    (436, 'UnderlyingContractMultiplier', 'FLOAT', ()),
+    (437, 'ContraTradeQty', 'QTY', ()),
+    (438, 'ContraTradeTime', 'UTCTIMESTAMP', ()),
+    (439, 'ClearingFirm', 'STRING', ()),
+    (440, 'ClearingAccount', 'STRING', ()),
+    (441, 'LiquidityNumSecurities', 'INT', ()),
+    (442, 'MultiLegReportingType', 'CHAR', (('SINGLE_SECURITY', '1'), ('INDIVIDUAL_LEG_OF_A_MULTILEG_SECURITY', '2'), ('MULTI_LEG_SECURITY', '3'),)),
+    (443, 'StrikeTime', 'UTCTIMESTAMP', ()),
+    (444, 'ListStatusText', 'STRING', ()),
+    (445, 'EncodedListStatusTextLen', 'LENGTH', ()),
+    (446, 'EncodedListStatusText', 'DATA', ()),
+    (447, 'PartyIDSource', 'CHAR', (('KOREAN_INVESTOR_ID', '1'), ('TAIWANESE_QUALIFIED_FOREIGN_INVESTOR_ID_QFII_FID', '2'), ('TAIWANESE_TRADING_ACCT', '3'), ('MALAYSIAN_CENTRAL_DEPOSITORY', '4'), ('CHINESE_INVESTOR_ID', '5'), ('UK_NATIONAL_INSURANCE_OR_PENSION_NUMBER', '6'), ('US_SOCIAL_SECURITY_NUMBER', '7'), ('US_EMPLOYER_OR_TAX_ID_NUMBER', '8'), ('AUSTRALIAN_BUSINESS_NUMBER', '9'), ('AUSTRALIAN_TAX_FILE_NUMBER', 'A'), ('BIC', 'B'), ('GENERALLY_ACCEPTED_MARKET_PARTICIPANT_IDENTIFIER', 'C'), ('PROPRIETARY', 'D'), ('ISO_COUNTRY_CODE', 'E'), ('SETTLEMENT_ENTITY_LOCATION', 'F'), ('MIC', 'G'), ('CSD_PARTICIPANT_MEMBER_CODE', 'H'), ('DIRECTED_BROKER_THREE_CHARACTER_ACRONYM_AS_DEFINED_IN_ISITC_ETC_BEST_PRACTICE_GUIDELINES_DOCUMENT', 'I'),)),
+    (448, 'PartyID', 'STRING', ()),
+    (449, 'TotalVolumeTradedDate', 'UTCDATEONLY', ()),
+    (450, 'TotalVolumeTradedTime', 'UTCTIMEONLY', ()),
+    (451, 'NetChgPrevDay', 'PRICEOFFSET', ()),
+    (452, 'PartyRole', 'INT', (('EXECUTING_FIRM', 1), ('SETTLEMENT_LOCATION', 10), ('ORDER_ORIGINATION_TRADER', 11), ('EXECUTING_TRADER', 12), ('ORDER_ORIGINATION_FIRM', 13), ('GIVEUP_CLEARING_FIRM', 14), ('CORRESPONDANT_CLEARING_FIRM', 15), ('EXECUTING_SYSTEM', 16), ('CONTRA_FIRM', 17), ('CONTRA_CLEARING_FIRM', 18), ('SPONSORING_FIRM', 19), ('BROKER_OF_CREDIT', 2), ('UNDERLYING_CONTRA_FIRM', 20), ('CLEARING_ORGANIZATION', 21), ('EXCHANGE', 22), ('CUSTOMER_ACCOUNT', 24), ('CORRESPONDENT_CLEARING_ORGANIZATION', 25), ('CORRESPONDENT_BROKER', 26), ('BUYER_SELLER', 27), ('CUSTODIAN', 28), ('INTERMEDIARY', 29), ('CLIENT_ID', 3), ('AGENT', 30), ('SUB_CUSTODIAN', 31), ('BENEFICIARY', 32), ('INTERESTED_PARTY', 33), ('REGULATORY_BODY', 34), ('LIQUIDITY_PROVIDER', 35), ('ENTERING_TRADER', 36), ('CONTRA_TRADER', 37), ('POSITION_ACCOUNT', 38), ('CLEARING_FIRM', 4), ('INVESTOR_ID', 5), ('INTRODUCING_FIRM', 6), ('ENTERING_FIRM', 7), ('LOCATE', 8), ('FUND_MANAGER_CLIENT_ID', 9), ('INTRODUCING_BROKER', 60), ('CONTRA_POSITION_ACCOUNT', 41), ('CONTRA_EXCHANGE', 42), ('INTERNAL_CARRY_ACCOUNT', 43), ('ORDER_ENTRY_OPERATOR_ID', 44), ('SECONDARY_ACCOUNT_NUMBER', 45), ('FORIEGN_FIRM', 46), ('THIRD_PARTY_ALLOCATION_FIRM', 47), ('CLAIMING_ACCOUNT', 48), ('ASSET_MANAGER', 49), ('PLEDGOR_ACCOUNT', 50), ('PLEDGEE_ACCOUNT', 51), ('LARGE_TRADER_REPORTABLE_ACCOUNT', 52), ('TRADER_MNEMONIC', 53), ('SENDER_LOCATION', 54), ('SESSION_ID', 55), ('ACCEPTABLE_COUNTERPARTY', 56), ('UNACCEPTABLE_COUNTERPARTY', 57), ('ENTERING_UNIT', 58), ('EXECUTING_UNIT', 59), ('CONTRA_INVESTOR_ID', 39), ('TRANSFER_TO_FIRM', 40), ('QUOTE_ORIGINATOR', 61), ('REPORT_ORIGINATOR', 62), ('SYSTEMATIC_INTERNALISER', 63), ('MULTILATERAL_TRADING_FACILITY', 64), ('REGULATED_MARKET', 65), ('MARKET_MAKER', 66), ('INVESTMENT_FIRM', 67), ('HOST_COMPETENT_AUTHORITY', 68), ('HOME_COMPETENT_AUTHORITY', 69), ('COMPETENT_AUTHORITY_OF_THE_MOST_RELEVANT_MARKET_IN_TERMS_OF_LIQUIDITY', 70), ('COMPETENT_AUTHORITY_OF_THE_TRANSACTION', 71), ('REPORTING_INTERMEDIARY', 72), ('EXECUTION_VENUE', 73), ('MARKET_DATA_ENTRY_ORIGINATOR', 74), ('LOCATION_ID', 75), ('DESK_ID', 76), ('MARKET_DATA_MARKET', 77), ('ALLOCATION_ENTITY', 78), ('PRIME_BROKER_PROVIDING_GENERAL_TRADE_SERVICES', 79), ('STEP_OUT_FIRM', 80), ('BROKERCLEARINGID', 81),)),
+    (453, 'NoPartyIDs', 'NUMINGROUP', ()),
+    (454, 'NoSecurityAltID', 'NUMINGROUP', ()),
+    (455, 'SecurityAltID', 'STRING', ()),
+    (456, 'SecurityAltIDSource', 'STRING', ()),
+    (457, 'NoUnderlyingSecurityAltID', 'NUMINGROUP', ()),
+    (458, 'UnderlyingSecurityAltID', 'STRING', ()),
+    (459, 'UnderlyingSecurityAltIDSource', 'STRING', ()),
+    (460, 'Product', 'INT', (('AGENCY', 1), ('MORTGAGE', 10), ('MUNICIPAL', 11), ('OTHER', 12), ('FINANCING', 13), ('COMMODITY', 2), ('CORPORATE', 3), ('CURRENCY', 4), ('EQUITY', 5), ('GOVERNMENT', 6), ('INDEX', 7), ('LOAN', 8), ('MONEYMARKET', 9),)),
+    (461, 'CFICode', 'STRING', ()),
+    (462, 'UnderlyingProduct', 'INT', ()),
+    (463, 'UnderlyingCFICode', 'STRING', ()),
+    (464, 'TestMessageIndicator', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (465, 'QuantityType', 'INT', (('SHARES', 1), ('BONDS', 2), ('CURRENTFACE', 3), ('ORIGINALFACE', 4), ('CURRENCY', 5), ('CONTRACTS', 6), ('OTHER', 7), ('PAR', 8),)),
+    (466, 'BookingRefID', 'STRING', ()),
+    (467, 'IndividualAllocID', 'STRING', ()),
+    (468, 'RoundingDirection', 'CHAR', (('ROUND_TO_NEAREST', '0'), ('ROUND_DOWN', '1'), ('ROUND_UP', '2'),)),
+    (469, 'RoundingModulus', 'FLOAT', ()),
+    (470, 'CountryOfIssue', 'COUNTRY', ()),
+    (471, 'StateOrProvinceOfIssue', 'STRING', ()),
+    (472, 'LocaleOfIssue', 'STRING', ()),
+    (473, 'NoRegistDtls', 'NUMINGROUP', ()),
+    (474, 'MailingDtls', 'STRING', ()),
+    (475, 'InvestorCountryOfResidence', 'COUNTRY', ()),
+    (476, 'PaymentRef', 'STRING', ()),
+    (477, 'DistribPaymentMethod', 'INT', (('CREST', 1), ('BPAY', 10), ('HIGH_VALUE_CLEARING_SYSTEM_HVACS', 11), ('REINVEST_IN_FUND', 12), ('NSCC', 2), ('EUROCLEAR', 3), ('CLEARSTREAM', 4), ('CHEQUE', 5), ('TELEGRAPHIC_TRANSFER', 6), ('FED_WIRE', 7), ('DIRECT_CREDIT', 8), ('ACH_CREDIT', 9),)),
+    (478, 'CashDistribCurr', 'CURRENCY', ()),
+    (479, 'CommCurrency', 'CURRENCY', ()),
+    (480, 'CancellationRights', 'CHAR', (('NO_M', 'M'), ('NO_N', 'N'), ('NO_O', 'O'), ('YES', 'Y'),)),
+    (481, 'MoneyLaunderingStatus', 'CHAR', (('EXEMPT_1', '1'), ('EXEMPT_2', '2'), ('EXEMPT_3', '3'), ('NOT_CHECKED', 'N'), ('PASSED', 'Y'),)),
+    (482, 'MailingInst', 'STRING', ()),
+    (483, 'TransBkdTime', 'UTCTIMESTAMP', ()),
+    (484, 'ExecPriceType', 'CHAR', (('BID_PRICE', 'B'), ('CREATION_PRICE', 'C'), ('CREATION_PRICE_PLUS_ADJUSTMENT_PERCENT', 'D'), ('CREATION_PRICE_PLUS_ADJUSTMENT_AMOUNT', 'E'), ('OFFER_PRICE', 'O'), ('OFFER_PRICE_MINUS_ADJUSTMENT_PERCENT', 'P'), ('OFFER_PRICE_MINUS_ADJUSTMENT_AMOUNT', 'Q'), ('SINGLE_PRICE', 'S'),)),
+    (485, 'ExecPriceAdjustment', 'FLOAT', ()),
+    (486, 'DateOfBirth', 'LOCALMKTDATE', ()),
+    (487, 'TradeReportTransType', 'INT', (('NEW', 0), ('CANCEL', 1), ('REPLACE', 2), ('RELEASE', 3), ('REVERSE', 4), ('CANCEL_DUE_TO_BACK_OUT_OF_TRADE', 5),)),
+    (488, 'CardHolderName', 'STRING', ()),
+    (489, 'CardNumber', 'STRING', ()),
+    (490, 'CardExpDate', 'LOCALMKTDATE', ()),
+    (491, 'CardIssNum', 'STRING', ()),
+    (492, 'PaymentMethod', 'INT', (('CREST', 1), ('DIRECT_CREDIT', 10), ('CREDIT_CARD', 11), ('ACH_DEBIT', 12), ('ACH_CREDIT', 13), ('BPAY', 14), ('HIGH_VALUE_CLEARING_SYSTEM', 15), ('NSCC', 2), ('EUROCLEAR', 3), ('CLEARSTREAM', 4), ('CHEQUE', 5), ('TELEGRAPHIC_TRANSFER', 6), ('FED_WIRE', 7), ('DEBIT_CARD', 8), ('DIRECT_DEBIT', 9),)),
+    (493, 'RegistAcctType', 'STRING', ()),
+    (494, 'Designation', 'STRING', ()),
+    (495, 'TaxAdvantageType', 'INT', (('NONE_NOT_APPLICABLE', 0), ('MAXI_ISA', 1), ('EMPLOYEE_10', 10), ('EMPLOYER_11', 11), ('EMPLOYER_12', 12), ('NON_FUND_PROTOTYPE_IRA', 13), ('NON_FUND_QUALIFIED_PLAN', 14), ('DEFINED_CONTRIBUTION_PLAN', 15), ('INDIVIDUAL_RETIREMENT_ACCOUNT_16', 16), ('INDIVIDUAL_RETIREMENT_ACCOUNT_17', 17), ('KEOGH', 18), ('PROFIT_SHARING_PLAN', 19), ('TESSA', 2), ('_401', 20), ('SELF_DIRECTED_IRA', 21), ('_403', 22), ('_457', 23), ('ROTH_IRA_24', 24), ('ROTH_IRA_25', 25), ('ROTH_CONVERSION_IRA_26', 26), ('ROTH_CONVERSION_IRA_27', 27), ('EDUCATION_IRA_28', 28), ('EDUCATION_IRA_29', 29), ('MINI_CASH_ISA', 3), ('MINI_STOCKS_AND_SHARES_ISA', 4), ('MINI_INSURANCE_ISA', 5), ('CURRENT_YEAR_PAYMENT', 6), ('PRIOR_YEAR_PAYMENT', 7), ('ASSET_TRANSFER', 8), ('EMPLOYEE_9', 9), ('OTHER', 999),)),
+    (496, 'RegistRejReasonText', 'STRING', ()),
+    (497, 'FundRenewWaiv', 'CHAR', (('NO', 'N'), ('YES', 'Y'),)),
+    (498, 'CashDistribAgentName', 'STRING', ()),
+    (499, 'CashDistribAgentCode', 'STRING', ()),
+    (500, 'CashDistribAgentAcctNumber', 'STRING', ()),
+    (501, 'CashDistribPayRef', 'STRING', ()),
+    (502, 'CashDistribAgentAcctName', 'STRING', ()),
+    (503, 'CardStartDate', 'LOCALMKTDATE', ()),
+    (504, 'PaymentDate', 'LOCALMKTDATE', ()),
+    (505, 'PaymentRemitterID', 'STRING', ()),
+    (506, 'RegistStatus', 'CHAR', (('ACCEPTED', 'A'), ('HELD', 'H'), ('REMINDER', 'N'), ('REJECTED', 'R'),)),
+    (507, 'RegistRejReasonCode', 'INT', (('INVALID_UNACCEPTABLE_ACCOUNT_TYPE', 1), ('INVALID_UNACEEPTABLE_INVESTOR_ID_SOURCE', 10), ('INVALID_UNACCEPTABLE_DATE_OF_BIRTH', 11), ('INVALID_UNACCEPTABLE_INVESTOR_COUNTRY_OF_RESIDENCE', 12), ('INVALID_UNACCEPTABLE_NO_DISTRIB_INSTNS', 13), ('INVALID_UNACCEPTABLE_DISTRIB_PERCENTAGE', 14), ('INVALID_UNACCEPTABLE_DISTRIB_PAYMENT_METHOD', 15), ('INVALID_UNACCEPTABLE_CASH_DISTRIB_AGENT_ACCT_NAME', 16), ('INVALID_UNACCEPTABLE_CASH_DISTRIB_AGENT_CODE', 17), ('INVALID_UNACCEPTABLE_CASH_DISTRIB_AGENT_ACCT_NUM', 18), ('INVALID_UNACCEPTABLE_TAX_EXEMPT_TYPE', 2), ('INVALID_UNACCEPTABLE_OWNERSHIP_TYPE', 3), ('INVALID_UNACCEPTABLE_NO_REG_DETAILS', 4), ('INVALID_UNACCEPTABLE_REG_SEQ_NO', 5), ('INVALID_UNACCEPTABLE_REG_DETAILS', 6), ('INVALID_UNACCEPTABLE_MAILING_DETAILS', 7), ('INVALID_UNACCEPTABLE_MAILING_INSTRUCTIONS', 8), ('INVALID_UNACCEPTABLE_INVESTOR_ID', 9), ('OTHER', 99),)),
+    (508, 'RegistRefID', 'STRING', ()),
+    (509, 'RegistDtls', 'STRING', ()),
+    (510, 'NoDistribInsts', 'NUMINGROUP', ()),
+    (511, 'RegistEmail', 'STRING', ()),
+    (512, 'DistribPercentage', 'PERCENTAGE', ()),
+    (513, 'RegistID', 'STRING', ()),
+    (514, 'RegistTransType', 'CHAR', (('NEW', '0'), ('REPLACE', '1'), ('CANCEL', '2'),)),
+    (515, 'ExecValuationPoint', 'UTCTIMESTAMP', ()),
+    (516, 'OrderPercent', 'PERCENTAGE', ()),
+    (517, 'OwnershipType', 'CHAR', (('JOINT_TRUSTEES', '2'), ('JOINT_INVESTORS', 'J'), ('TENANTS_IN_COMMON', 'T'),)),
+    (518, 'NoContAmts', 'NUMINGROUP', ()),
+    (519, 'ContAmtType', 'INT', (('COMMISSION_AMOUNT', 1), ('EXIT_CHARGE_PERCENT', 10), ('FUND_BASED_RENEWAL_COMMISSION_PERCENT', 11), ('PROJECTED_FUND_VALUE', 12), ('FUND_BASED_RENEWAL_COMMISSION_AMOUNT_13', 13), ('FUND_BASED_RENEWAL_COMMISSION_AMOUNT_14', 14), ('NET_SETTLEMENT_AMOUNT', 15), ('COMMISSION_PERCENT', 2), ('INITIAL_CHARGE_AMOUNT', 3), ('INITIAL_CHARGE_PERCENT', 4), ('DISCOUNT_AMOUNT', 5), ('DISCOUNT_PERCENT', 6), ('DILUTION_LEVY_AMOUNT', 7), ('DILUTION_LEVY_PERCENT', 8), ('EXIT_CHARGE_AMOUNT', 9),)),
+    (520, 'ContAmtValue', 'FLOAT', ()),
+    (521, 'ContAmtCurr', 'CURRENCY', ()),
+    (522, 'OwnerType', 'INT', (('INDIVIDUAL_INVESTOR', 1), ('NETWORKING_SUB_ACCOUNT', 10), ('NON_PROFIT_ORGANIZATION', 11), ('CORPORATE_BODY', 12), ('NOMINEE', 13), ('PUBLIC_COMPANY', 2), ('PRIVATE_COMPANY', 3), ('INDIVIDUAL_TRUSTEE', 4), ('COMPANY_TRUSTEE', 5), ('PENSION_PLAN', 6), ('CUSTODIAN_UNDER_GIFTS_TO_MINORS_ACT', 7), ('TRUSTS', 8), ('FIDUCIARIES', 9),)),
+    (523, 'PartySubID', 'STRING', ()),
+    (524, 'NestedPartyID', 'STRING', ()),
+    (525, 'NestedPartyIDSource', 'CHAR', ()),
+    (526, 'SecondaryClOrdID', 'STRING', ()),
+    (527, 'SecondaryExecID', 'STRING', ()),
+    (528, 'OrderCapacity', 'CHAR', (('AGENCY', 'A'), ('PROPRIETARY', 'G'), ('INDIVIDUAL', 'I'), ('PRINCIPAL', 'P'), ('RISKLESS_PRINCIPAL', 'R'), ('AGENT_FOR_OTHER_MEMBER', 'W'),)),
+    (529, 'OrderRestrictions', 'MULTIPLECHARVALUE', (('PROGRAM_TRADE', '1'), ('INDEX_ARBITRAGE', '2'), ('NON_INDEX_ARBITRAGE', '3'), ('COMPETING_MARKET_MAKER', '4'), ('ACTING_AS_MARKET_MAKER_OR_SPECIALIST_IN_THE_SECURITY', '5'), ('ACTING_AS_MARKET_MAKER_OF_SPECIALIST_IN_THE_UNDERLYING_SECURITY_OF_A_DERIVATIVE_SEUCIRTY', '6'), ('FOREIGN_ENTITY', '7'), ('EXTERNAL_MARKET_PARTICIPANT', '8'), ('EXTNERAL_INTER_CONNECTED_MARKET_LINKAGE', '9'), ('RISKLESS_ARBITRAGE', 'A'), ('ISSUER_HOLDING', 'B'), ('ISSUE_PRICE_STABILIZATION', 'C'), ('NON_ALGORITHMIC', 'D'), ('ALGORITHMIC', 'E'),)),
+    (530, 'MassCancelRequestType', 'CHAR', (('CANCEL_ORDERS_FOR_A_SECURITY', '1'), ('CANCEL_ORDERS_FOR_AN_UNDERLYING_SECURITY', '2'), ('CANCEL_ORDERS_FOR_A_PRODUCT', '3'), ('CANCEL_ORDERS_FOR_A_CFICODE', '4'), ('CANCEL_ORDERS_FOR_A_SECURITYTYPE', '5'), ('CANCEL_ORDERS_FOR_A_TRADING_SESSION', '6'), ('CANCEL_ALL_ORDERS', '7'), ('CANCEL_ORDERS_FOR_A_MARKET', '8'), ('CANCEL_ORDERS_FOR_A_MARKET_SEGMENT', '9'), ('CANCEL_ORDERS_FOR_A_SECURITY_GROUP', 'A'),)),
+    (531, 'MassCancelResponse', 'CHAR', (('CANCEL_REQUEST_REJECTED', '0'), ('CANCEL_ORDERS_FOR_A_SECURITY', '1'), ('CANCEL_ORDERS_FOR_AN_UNDERLYING_SECURITY', '2'), ('CANCEL_ORDERS_FOR_A_PRODUCT', '3'), ('CANCEL_ORDERS_FOR_A_CFICODE', '4'), ('CANCEL_ORDERS_FOR_A_SECURITYTYPE', '5'), ('CANCEL_ORDERS_FOR_A_TRADING_SESSION', '6'), ('CANCEL_ALL_ORDERS', '7'), ('CANCEL_ORDERS_FOR_A_MARKET', '8'), ('CANCEL_ORDERS_FOR_A_MARKET_SEGMENT', '9'), ('CANCEL_ORDERS_FOR_A_SECURITY_GROUP', 'A'),)),
+    (532, 'MassCancelRejectReason', 'INT', (('MASS_CANCEL_NOT_SUPPORTED', 0), ('INVALID_OR_UNKNOWN_SECURITY', 1), ('INVALID_OR_UNKOWN_UNDERLYING_SECURITY', 2), ('INVALID_OR_UNKNOWN_PRODUCT', 3), ('INVALID_OR_UNKNOWN_CFICODE', 4), ('INVALID_OR_UNKNOWN_SECURITYTYPE', 5), ('INVALID_OR_UNKNOWN_TRADING_SESSION', 6), ('OTHER', 99), ('INVALID_OR_UNKNOWN_MARKET', 7), ('INVALID_OR_UNKOWN_MARKET_SEGMENT', 8), ('INVALID_OR_UNKNOWN_SECURITY_GROUP', 9),)),
+    (533, 'TotalAffectedOrders', 'INT', ()),
+    (534, 'NoAffectedOrders', 'NUMINGROUP', ()),
+    (535, 'AffectedOrderID', 'STRING', ()),
+    (536, 'AffectedSecondaryOrderID', 'STRING', ()),
+    (537, 'QuoteType', 'INT', (('INDICATIVE', 0), ('TRADEABLE', 1), ('RESTRICTED_TRADEABLE', 2), ('COUNTER', 3),)),
+    (538, 'NestedPartyRole', 'INT', ()),
+    (539, 'NoNestedPartyIDs', 'NUMINGROUP', ()),
+    (540, 'TotalAccruedInterestAmt', 'AMT', ()),
+    (541, 'MaturityDate', 'LOCALMKTDATE', ()),
+    (542, 'UnderlyingMaturityDate', 'LOCALMKTDATE', ()),
+    (543, 'InstrRegistry', 'STRING', ()),
+    (544, 'CashMargin', 'CHAR', (('CASH', '1'), ('MARGIN_OPEN', '2'), ('MARGIN_CLOSE', '3'),)),
+    (545, 'NestedPartySubID', 'STRING', ()),
+    (546, 'Scope', 'MULTIPLECHARVALUE', (('LOCAL_MARKET', '1'), ('NATIONAL', '2'), ('GLOBAL', '3'),)),
+    (547, 'MDImplicitDelete', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (548, 'CrossID', 'STRING', ()),
+    (549, 'CrossType', 'INT', (('CROSS_AON', 1), ('CROSS_IOC', 2), ('CROSS_ONE_SIDE', 3), ('CROSS_SAME_PRICE', 4),)),
+    (550, 'CrossPrioritization', 'INT', (('NONE', 0), ('BUY_SIDE_IS_PRIORITIZED', 1), ('SELL_SIDE_IS_PRIORITIZED', 2),)),
+    (551, 'OrigCrossID', 'STRING', ()),
+    (552, 'NoSides', 'NUMINGROUP', (('ONE_SIDE', '1'), ('BOTH_SIDES', '2'),)),
+    (553, 'Username', 'STRING', ()),
+    (554, 'Password', 'STRING', ()),
+    (555, 'NoLegs', 'NUMINGROUP', ()),
+    (556, 'LegCurrency', 'CURRENCY', ()),
+    (557, 'TotNoSecurityTypes', 'INT', ()),
+    (558, 'NoSecurityTypes', 'NUMINGROUP', ()),
+    (559, 'SecurityListRequestType', 'INT', (('SYMBOL', 0), ('SECURITYTYPE_AND_OR_CFICODE', 1), ('PRODUCT', 2), ('TRADINGSESSIONID', 3), ('ALL_SECURITIES', 4), ('MARKETID_OR_MARKETID_PLUS_MARKETSEGMENTID', 5),)),
+    (560, 'SecurityRequestResult', 'INT', (('VALID_REQUEST', 0), ('INVALID_OR_UNSUPPORTED_REQUEST', 1), ('NO_INSTRUMENTS_FOUND_THAT_MATCH_SELECTION_CRITERIA', 2), ('NOT_AUTHORIZED_TO_RETRIEVE_INSTRUMENT_DATA', 3), ('INSTRUMENT_DATA_TEMPORARILY_UNAVAILABLE', 4), ('REQUEST_FOR_INSTRUMENT_DATA_NOT_SUPPORTED', 5),)),
+    (561, 'RoundLot', 'QTY', ()),
+    (562, 'MinTradeVol', 'QTY', ()),
+    (563, 'MultiLegRptTypeReq', 'INT', (('REPORT_BY_MULITLEG_SECURITY_ONLY', 0), ('REPORT_BY_MULTILEG_SECURITY_AND_BY_INSTRUMENT_LEGS_BELONGING_TO_THE_MULTILEG_SECURITY', 1), ('REPORT_BY_INSTRUMENT_LEGS_BELONGING_TO_THE_MULTILEG_SECURITY_ONLY', 2),)),
+    (564, 'LegPositionEffect', 'CHAR', ()),
+    (565, 'LegCoveredOrUncovered', 'INT', ()),
+    (566, 'LegPrice', 'PRICE', ()),
+    (567, 'TradSesStatusRejReason', 'INT', (('UNKNOWN_OR_INVALID_TRADINGSESSIONID', 1), ('OTHER', 99),)),
+    (568, 'TradeRequestID', 'STRING', ()),
+    (569, 'TradeRequestType', 'INT', (('ALL_TRADES', 0), ('MATCHED_TRADES_MATCHING_CRITERIA_PROVIDED_ON_REQUEST', 1), ('UNMATCHED_TRADES_THAT_MATCH_CRITERIA', 2), ('UNREPORTED_TRADES_THAT_MATCH_CRITERIA', 3), ('ADVISORIES_THAT_MATCH_CRITERIA', 4),)),
+    (570, 'PreviouslyReported', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (571, 'TradeReportID', 'STRING', ()),
+    (572, 'TradeReportRefID', 'STRING', ()),
+    (573, 'MatchStatus', 'CHAR', (('COMPARED_MATCHED_OR_AFFIRMED', '0'), ('UNCOMPARED_UNMATCHED_OR_UNAFFIRED', '1'), ('ADVISORY_OR_ALERT', '2'),)),
+    (574, 'MatchType', 'STRING', (('EXACT_MATCH_ON_TRADE_DATE_STOCK_SYMBOL_QUANTITY_PRICE_TRADE_TYPE_AND_SPECIAL_TRADE_INDICATOR_PLUS_FOUR_BADGES_AND_EXECUTION_TIME', 'A1'), ('EXACT_MATCH_ON_TRADE_DATE_STOCK_SYMBOL_QUANTITY_PRICE_TRADE_TYPE_AND_SPECIAL_TRADE_INDICATOR_PLUS_FOUR_BADGES', 'A2'), ('EXACT_MATCH_ON_TRADE_DATE_STOCK_SYMBOL_QUANTITY_PRICE_TRADE_TYPE_AND_SPECIAL_TRADE_INDICATOR_PLUS_TWO_BADGES_AND_EXECUTION_TIME', 'A3'), ('EXACT_MATCH_ON_TRADE_DATE_STOCK_SYMBOL_QUANTITY_PRICE_TRADE_TYPE_AND_SPECIAL_TRADE_INDICATOR_PLUS_TWO_BADGES', 'A4'), ('EXACT_MATCH_ON_TRADE_DATE_STOCK_SYMBOL_QUANTITY_PRICE_TRADETYPE_AND_SPECIAL_TRADE_INDICATOR_PLUS_EXECUTION_TIME', 'A5'), ('ACT_ACCEPTED_TRADE', 'M3'), ('ACT_DEFAULT_TRADE', 'M4'), ('ACT_DEFAULT_AFTER_M2', 'M5'), ('ACT_M6_MATCH', 'M6'), ('COMPARED_RECORDS_RESULTING_FROM_STAMPED_ADVISORIES_OR_SPECIALIST_ACCEPTS_PAIR_OFFS', 'AQ'), ('EXACT_MATCH_ON_TRADE_DATE_STOCK_SYMBOL_QUANTITY_PRICE_TRADE_TYPE_AND_SPECIAL_TRADE_INDICATOR_MINUS_BADGES_AND_TIMES_ACT_M1_MATCH', 'M1'), ('SUMMARIZED_MATCH_MINUS_BADGES_AND_TIMES_ACT_M2_MATCH', 'M2'), ('OCS_LOCKED_IN_NON_ACT', 'MT'), ('SUMMARIZED_MATCH_USING_A1_EXACT_MATCH_CRITERIA_EXCEPT_QUANTITY_IS_SUMMARIED', 'S1'), ('SUMMARIZED_MATCH_USING_A2_EXACT_MATCH_CRITERIA_EXCEPT_QUANTITY_IS_SUMMARIZED', 'S2'), ('SUMMARIZED_MATCH_USING_A3_EXACT_MATCH_CRITERIA_EXCEPT_QUANTITY_IS_SUMMARIZED', 'S3'), ('SUMMARIZED_MATCH_USING_A4_EXACT_MATCH_CRITERIA_EXCEPT_QUANTITY_IS_SUMMARIZED', 'S4'), ('SUMMARIZED_MATCH_USING_A5_EXACT_MATCH_CRITERIA_EXCEPT_QUANTITY_IS_SUMMARIZED', 'S5'), ('ONE_PARTY_TRADE_REPORT', '1'), ('TWO_PARTY_TRADE_REPORT', '2'), ('CONFIRMED_TRADE_REPORT', '3'), ('AUTO_MATCH', '4'), ('CROSS_AUCTION', '5'), ('COUNTER_ORDER_SELECTION', '6'), ('CALL_AUCTION', '7'), ('ISSUING_BUY_BACK_AUCTION', '8'),)),
+    (575, 'OddLot', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (576, 'NoClearingInstructions', 'NUMINGROUP', ()),
+    (577, 'ClearingInstruction', 'INT', (('PROCESS_NORMALLY', 0), ('EXCLUDE_FROM_ALL_NETTING', 1), ('AUTOMATIC_GIVE_UP_MODE', 10), ('QUALIFIED_SERVICE_REPRESENTATIVE_QSR', 11), ('CUSTOMER_TRADE', 12), ('SELF_CLEARING', 13), ('BILATERAL_NETTING_ONLY', 2), ('EX_CLEARING', 3), ('SPECIAL_TRADE', 4), ('MULTILATERAL_NETTING', 5), ('CLEAR_AGAINST_CENTRAL_COUNTERPARTY', 6), ('EXCLUDE_FROM_CENTRAL_COUNTERPARTY', 7), ('MANUAL_MODE', 8), ('AUTOMATIC_POSTING_MODE', 9),)),
+    (578, 'TradeInputSource', 'STRING', ()),
+    (579, 'TradeInputDevice', 'STRING', ()),
+    (580, 'NoDates', 'INT', ()),
+    (581, 'AccountType', 'INT', (('ACCOUNT_IS_CARRIED_ON_CUSTOMER_SIDE_OF_THE_BOOKS', 1), ('ACCOUNT_IS_CARRIED_ON_NON_CUSTOMER_SIDE_OF_BOOKS', 2), ('HOUSE_TRADER', 3), ('FLOOR_TRADER', 4), ('ACCOUNT_IS_CARRIED_ON_NON_CUSTOMER_SIDE_OF_BOOKS_AND_IS_CROSS_MARGINED', 6), ('ACCOUNT_IS_HOUSE_TRADER_AND_IS_CROSS_MARGINED', 7), ('JOINT_BACK_OFFICE_ACCOUNT', 8),)),
+    (582, 'CustOrderCapacity', 'INT', (('MEMBER_TRADING_FOR_THEIR_OWN_ACCOUNT', 1), ('CLEARING_FIRM_TRADING_FOR_ITS_PROPRIETARY_ACCOUNT', 2), ('MEMBER_TRADING_FOR_ANOTHER_MEMBER', 3), ('ALL_OTHER', 4),)),
+    (583, 'ClOrdLinkID', 'STRING', ()),
+    (584, 'MassStatusReqID', 'STRING', ()),
+    (585, 'MassStatusReqType', 'INT', (('STATUS_FOR_ORDERS_FOR_A_SECURITY', 1), ('STATUS_FOR_ORDERS_FOR_AN_UNDERLYING_SECURITY', 2), ('STATUS_FOR_ORDERS_FOR_A_PRODUCT', 3), ('STATUS_FOR_ORDERS_FOR_A_CFICODE', 4), ('STATUS_FOR_ORDERS_FOR_A_SECURITYTYPE', 5), ('STATUS_FOR_ORDERS_FOR_A_TRADING_SESSION', 6), ('STATUS_FOR_ALL_ORDERS', 7), ('STATUS_FOR_ORDERS_FOR_A_PARTYID', 8),)),
+    (586, 'OrigOrdModTime', 'UTCTIMESTAMP', ()),
+    (587, 'LegSettlType', 'CHAR', ()),
+    (588, 'LegSettlDate', 'LOCALMKTDATE', ()),
+    (589, 'DayBookingInst', 'CHAR', (('CAN_TRIGGER_BOOKING_WITHOUT_REFERENCE_TO_THE_ORDER_INITIATOR', '0'), ('SPEAK_WITH_ORDER_INITIATOR_BEFORE_BOOKING', '1'), ('ACCUMULATE', '2'),)),
+    (590, 'BookingUnit', 'CHAR', (('EACH_PARTIAL_EXECUTION_IS_A_BOOKABLE_UNIT', '0'), ('AGGREGATE_PARTIAL_EXECUTIONS_ON_THIS_ORDER_AND_BOOK_ONE_TRADE_PER_ORDER', '1'), ('AGGREGATE_EXECUTIONS_FOR_THIS_SYMBOL_SIDE_AND_SETTLEMENT_DATE', '2'),)),
+    (591, 'PreallocMethod', 'CHAR', (('PRO_RATA', '0'), ('DO_NOT_PRO_RATA', '1'),)),
+    (592, 'UnderlyingCountryOfIssue', 'COUNTRY', ()),
+    (593, 'UnderlyingStateOrProvinceOfIssue', 'STRING', ()),
+    (594, 'UnderlyingLocaleOfIssue', 'STRING', ()),
+    (595, 'UnderlyingInstrRegistry', 'STRING', ()),
+    (596, 'LegCountryOfIssue', 'COUNTRY', ()),
+    (597, 'LegStateOrProvinceOfIssue', 'STRING', ()),
+    (598, 'LegLocaleOfIssue', 'STRING', ()),
+    (599, 'LegInstrRegistry', 'STRING', ()),
+    (600, 'LegSymbol', 'STRING', ()),
+    (601, 'LegSymbolSfx', 'STRING', ()),
+    (602, 'LegSecurityID', 'STRING', ()),
+    (603, 'LegSecurityIDSource', 'STRING', ()),
+    (604, 'NoLegSecurityAltID', 'STRING', ()),
+    (605, 'LegSecurityAltID', 'STRING', ()),
+    (606, 'LegSecurityAltIDSource', 'STRING', ()),
+    (607, 'LegProduct', 'INT', ()),
+    (608, 'LegCFICode', 'STRING', ()),
+    (609, 'LegSecurityType', 'STRING', ()),
+    (610, 'LegMaturityMonthYear', 'MONTHYEAR', ()),
+    (611, 'LegMaturityDate', 'LOCALMKTDATE', ()),
+    (612, 'LegStrikePrice', 'PRICE', ()),
+    (613, 'LegOptAttribute', 'CHAR', ()),
+    (614, 'LegContractMultiplier', 'FLOAT', ()),
+    (615, 'LegCouponRate', 'PERCENTAGE', ()),
+    (616, 'LegSecurityExchange', 'EXCHANGE', ()),
+    (617, 'LegIssuer', 'STRING', ()),
+    (618, 'EncodedLegIssuerLen', 'LENGTH', ()),
+    (619, 'EncodedLegIssuer', 'DATA', ()),
+    (620, 'LegSecurityDesc', 'STRING', ()),
+    (621, 'EncodedLegSecurityDescLen', 'LENGTH', ()),
+    (622, 'EncodedLegSecurityDesc', 'DATA', ()),
+    (623, 'LegRatioQty', 'FLOAT', ()),
+    (624, 'LegSide', 'CHAR', ()),
+    (625, 'TradingSessionSubID', 'STRING', (('PRE_TRADING', '1'), ('OPENING_OR_OPENING_AUCTION', '2'), ('_3', '3'), ('CLOSING_OR_CLOSING_AUCTION', '4'), ('POST_TRADING', '5'), ('INTRADAY_AUCTION', '6'), ('QUIESCENT', '7'),)),
+    (626, 'AllocType', 'INT', (('CALCULATED', 1), ('PRELIMINARY', 2), ('SELLSIDE_CALCULATED_USING_PRELIMINARY', 3), ('SELLSIDE_CALCULATED_WITHOUT_PRELIMINARY', 4), ('READY_TO_BOOK', 5), ('BUYSIDE_READY_TO_BOOK', 6), ('WAREHOUSE_INSTRUCTION', 7), ('REQUEST_TO_INTERMEDIARY', 8), ('ACCEPT', 9), ('REJECT', 10), ('ACCEPT_PENDING', 11), ('INCOMPLETE_GROUP', 12), ('COMPLETE_GROUP', 13), ('REVERSAL_PENDING', 14),)),
+    (627, 'NoHops', 'NUMINGROUP', ()),
+    (628, 'HopCompID', 'STRING', ()),
+    (629, 'HopSendingTime', 'UTCTIMESTAMP', ()),
+    (630, 'HopRefID', 'SEQNUM', ()),
+    (631, 'MidPx', 'PRICE', ()),
+    (632, 'BidYield', 'PERCENTAGE', ()),
+    (633, 'MidYield', 'PERCENTAGE', ()),
+    (634, 'OfferYield', 'PERCENTAGE', ()),
+    (635, 'ClearingFeeIndicator', 'STRING', (('_1ST_YEAR_DELEGATE_TRADING_FOR_OWN_ACCOUNT', '1'), ('_2ND_YEAR_DELEGATE_TRADING_FOR_OWN_ACCOUNT', '2'), ('_3RD_YEAR_DELEGATE_TRADING_FOR_OWN_ACCOUNT', '3'), ('_4TH_YEAR_DELEGATE_TRADING_FOR_OWN_ACCOUNT', '4'), ('_5TH_YEAR_DELEGATE_TRADING_FOR_OWN_ACCOUNT', '5'), ('_6TH_YEAR_DELEGATE_TRADING_FOR_OWN_ACCOUNT', '9'), ('CBOE_MEMBER', 'B'), ('NON_MEMBER_AND_CUSTOMER', 'C'), ('EQUITY_MEMBER_AND_CLEARING_MEMBER', 'E'), ('FULL_AND_ASSOCIATE_MEMBER_TRADING_FOR_OWN_ACCOUNT_AND_AS_FLOOR_BROKERS', 'F'), ('_106H_AND_106J_FIRMS', 'H'), ('GIM_IDEM_AND_COM_MEMBERSHIP_INTEREST_HOLDERS', 'I'), ('LESSEE_106F_EMPLOYEES', 'L'), ('ALL_OTHER_OWNERSHIP_TYPES', 'M'),)),
+    (636, 'WorkingIndicator', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (637, 'LegLastPx', 'PRICE', ()),
+    (638, 'PriorityIndicator', 'INT', (('PRIORITY_UNCHANGED', 0), ('LOST_PRIORITY_AS_RESULT_OF_ORDER_CHANGE', 1),)),
+    (639, 'PriceImprovement', 'PRICEOFFSET', ()),
+    (640, 'Price2', 'PRICE', ()),
+    (641, 'LastForwardPoints2', 'PRICEOFFSET', ()),
+    (642, 'BidForwardPoints2', 'PRICEOFFSET', ()),
+    (643, 'OfferForwardPoints2', 'PRICEOFFSET', ()),
+    (644, 'RFQReqID', 'STRING', ()),
+    (645, 'MktBidPx', 'PRICE', ()),
+    (646, 'MktOfferPx', 'PRICE', ()),
+    (647, 'MinBidSize', 'QTY', ()),
+    (648, 'MinOfferSize', 'QTY', ()),
+    (649, 'QuoteStatusReqID', 'STRING', ()),
+    (650, 'LegalConfirm', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (651, 'UnderlyingLastPx', 'PRICE', ()),
+    (652, 'UnderlyingLastQty', 'QTY', ()),
+    (653, 'SecDefStatus', 'INT', (('PENDING_APPROVAL', 0), ('APPROVED', 1), ('REJECTED', 2), ('UNAUTHORIZED_REQUEST', 3), ('INVALID_DEFINITION_REQUEST', 4),)),
+    (654, 'LegRefID', 'STRING', ()),
+    (655, 'ContraLegRefID', 'STRING', ()),
+    (656, 'SettlCurrBidFxRate', 'FLOAT', ()),
+    (657, 'SettlCurrOfferFxRate', 'FLOAT', ()),
+    (658, 'QuoteRequestRejectReason', 'INT', (('UNKNOWN_SYMBOL', 1), ('PASS', 10), ('EXCHANGE', 2), ('QUOTE_REQUEST_EXCEEDS_LIMIT', 3), ('TOO_LATE_TO_ENTER', 4), ('INVALID_PRICE', 5), ('NOT_AUTHORIZED_TO_REQUEST_QUOTE', 6), ('NO_MATCH_FOR_INQUIRY', 7), ('NO_MARKET_FOR_INSTRUMENT', 8), ('NO_INVENTORY', 9), ('OTHER', 99), ('INSUFFICIENT_CREDIT', 11),)),
+    (659, 'SideComplianceID', 'STRING', ()),
+    (660, 'AcctIDSource', 'INT', (('BIC', 1), ('SID_CODE', 2), ('TFM', 3), ('OMGEO', 4), ('DTCC_CODE', 5), ('OTHER', 99),)),
+    (661, 'AllocAcctIDSource', 'INT', ()),
+    (662, 'BenchmarkPrice', 'PRICE', ()),
+    (663, 'BenchmarkPriceType', 'INT', ()),
+    (664, 'ConfirmID', 'STRING', ()),
+    (665, 'ConfirmStatus', 'INT', (('RECEIVED', 1), ('MISMATCHED_ACCOUNT', 2), ('MISSING_SETTLEMENT_INSTRUCTIONS', 3), ('CONFIRMED', 4), ('REQUEST_REJECTED', 5),)),
+    (666, 'ConfirmTransType', 'INT', (('NEW', 0), ('REPLACE', 1), ('CANCEL', 2),)),
+    (667, 'ContractSettlMonth', 'MONTHYEAR', ()),
+    (668, 'DeliveryForm', 'INT', (('BOOK_ENTRY', 1), ('BEARER', 2),)),
+    (669, 'LastParPx', 'PRICE', ()),
+    (670, 'NoLegAllocs', 'NUMINGROUP', ()),
+    (671, 'LegAllocAccount', 'STRING', ()),
+    (672, 'LegIndividualAllocID', 'STRING', ()),
+    (673, 'LegAllocQty', 'QTY', ()),
+    (674, 'LegAllocAcctIDSource', 'STRING', ()),
+    (675, 'LegSettlCurrency', 'CURRENCY', ()),
+    (676, 'LegBenchmarkCurveCurrency', 'CURRENCY', ()),
+    (677, 'LegBenchmarkCurveName', 'STRING', ()),
+    (678, 'LegBenchmarkCurvePoint', 'STRING', ()),
+    (679, 'LegBenchmarkPrice', 'PRICE', ()),
+    (680, 'LegBenchmarkPriceType', 'INT', ()),
+    (681, 'LegBidPx', 'PRICE', ()),
+    (682, 'LegIOIQty', 'STRING', ()),
+    (683, 'NoLegStipulations', 'NUMINGROUP', ()),
+    (684, 'LegOfferPx', 'PRICE', ()),
+    (685, 'LegOrderQty', 'QTY', ()),
+    (686, 'LegPriceType', 'INT', ()),
+    (687, 'LegQty', 'QTY', ()),
+    (688, 'LegStipulationType', 'STRING', ()),
+    (689, 'LegStipulationValue', 'STRING', ()),
+    (690, 'LegSwapType', 'INT', (('PAR_FOR_PAR', 1), ('MODIFIED_DURATION', 2), ('RISK', 4), ('PROCEEDS', 5),)),
+    (691, 'Pool', 'STRING', ()),
+    (692, 'QuotePriceType', 'INT', (('PERCENT', 1), ('YIELD', 10), ('PER_SHARE', 2), ('FIXED_AMOUNT', 3), ('DISCOUNT', 4), ('PREMIUM', 5), ('SPREAD', 6), ('TED_PRICE', 7), ('TED_YIELD', 8), ('YIELD_SPREAD', 9),)),
+    (693, 'QuoteRespID', 'STRING', ()),
+    (694, 'QuoteRespType', 'INT', (('HIT_LIFT', 1), ('COUNTER', 2), ('EXPIRED', 3), ('COVER', 4), ('DONE_AWAY', 5), ('PASS', 6), ('END_TRADE', 7), ('TIMED_OUT', 8),)),
+    (695, 'QuoteQualifier', 'CHAR', ()),
+    (696, 'YieldRedemptionDate', 'LOCALMKTDATE', ()),
+    (697, 'YieldRedemptionPrice', 'PRICE', ()),
+    (698, 'YieldRedemptionPriceType', 'INT', ()),
+    (699, 'BenchmarkSecurityID', 'STRING', ()),
+    (700, 'ReversalIndicator', 'BOOLEAN', ()),
+    (701, 'YieldCalcDate', 'LOCALMKTDATE', ()),
+    (702, 'NoPositions', 'NUMINGROUP', ()),
+    (703, 'PosType', 'STRING', (('ALLOCATION_TRADE_QTY', 'ALC'), ('OPTION_ASSIGNMENT', 'AS'), ('AS_OF_TRADE_QTY', 'ASF'), ('DELIVERY_QTY', 'DLV'), ('ELECTRONIC_TRADE_QTY', 'ETR'), ('OPTION_EXERCISE_QTY', 'EX'), ('END_OF_DAY_QTY', 'FIN'), ('INTRA_SPREAD_QTY', 'IAS'), ('INTER_SPREAD_QTY', 'IES'), ('ADJUSTMENT_QTY', 'PA'), ('PIT_TRADE_QTY', 'PIT'), ('START_OF_DAY_QTY', 'SOD'), ('INTEGRAL_SPLIT', 'SPL'), ('TRANSACTION_FROM_ASSIGNMENT', 'TA'), ('TOTAL_TRANSACTION_QTY', 'TOT'), ('TRANSACTION_QUANTITY', 'TQ'), ('TRANSFER_TRADE_QTY', 'TRF'), ('TRANSACTION_FROM_EXERCISE', 'TX'), ('CROSS_MARGIN_QTY', 'XM'), ('RECEIVE_QUANTITY', 'RCV'), ('CORPORATE_ACTION_ADJUSTMENT', 'CAA'), ('DELIVERY_NOTICE_QTY', 'DN'), ('EXCHANGE_FOR_PHYSICAL_QTY', 'EP'), ('PRIVATELY_NEGOTIATED_TRADE_QTY', 'PNTN'),)),
+    (704, 'LongQty', 'QTY', ()),
+    (705, 'ShortQty', 'QTY', ()),
+    (706, 'PosQtyStatus', 'INT', (('SUBMITTED', 0), ('ACCEPTED', 1), ('REJECTED', 2),)),
+    (707, 'PosAmtType', 'STRING', (('CASH_AMOUNT', 'CASH'), ('CASH_RESIDUAL_AMOUNT', 'CRES'), ('FINAL_MARK_TO_MARKET_AMOUNT', 'FMTM'), ('INCREMENTAL_MARK_TO_MARKET_AMOUNT', 'IMTM'), ('PREMIUM_AMOUNT', 'PREM'), ('START_OF_DAY_MARK_TO_MARKET_AMOUNT', 'SMTM'), ('TRADE_VARIATION_AMOUNT', 'TVAR'), ('VALUE_ADJUSTED_AMOUNT', 'VADJ'), ('SETTLEMENT_VALUE', 'SETL'),)),
+    (708, 'PosAmt', 'AMT', ()),
+    (709, 'PosTransType', 'INT', (('EXERCISE', 1), ('DO_NOT_EXERCISE', 2), ('POSITION_ADJUSTMENT', 3), ('POSITION_CHANGE_SUBMISSION_MARGIN_DISPOSITION', 4), ('PLEDGE', 5), ('LARGE_TRADER_SUBMISSION', 6),)),
+    (710, 'PosReqID', 'STRING', ()),
+    (711, 'NoUnderlyings', 'NUMINGROUP', ()),
+    (712, 'PosMaintAction', 'INT', (('NEW', 1), ('REPLACE', 2), ('CANCEL', 3), ('REVERSE', 4),)),
+    (713, 'OrigPosReqRefID', 'STRING', ()),
+    (714, 'PosMaintRptRefID', 'STRING', ()),
+    (715, 'ClearingBusinessDate', 'LOCALMKTDATE', ()),
+    (716, 'SettlSessID', 'STRING', (('INTRADAY', 'ITD'), ('REGULAR_TRADING_HOURS', 'RTH'), ('ELECTRONIC_TRADING_HOURS', 'ETH'), ('END_OF_DAY', 'EOD'),)),
+    (717, 'SettlSessSubID', 'STRING', ()),
+    (718, 'AdjustmentType', 'INT', (('PROCESS_REQUEST_AS_MARGIN_DISPOSITION', 0), ('DELTA_PLUS', 1), ('DELTA_MINUS', 2), ('FINAL', 3),)),
+    (719, 'ContraryInstructionIndicator', 'BOOLEAN', ()),
+    (720, 'PriorSpreadIndicator', 'BOOLEAN', ()),
+    (721, 'PosMaintRptID', 'STRING', ()),
+    (722, 'PosMaintStatus', 'INT', (('ACCEPTED', 0), ('ACCEPTED_WITH_WARNINGS', 1), ('REJECTED', 2), ('COMPLETED', 3), ('COMPLETED_WITH_WARNINGS', 4),)),
+    (723, 'PosMaintResult', 'INT', (('SUCCESSFUL_COMPLETION', 0), ('REJECTED', 1), ('OTHER', 99),)),
+    (724, 'PosReqType', 'INT', (('POSITIONS', 0), ('TRADES', 1), ('EXERCISES', 2), ('ASSIGNMENTS', 3), ('SETTLEMENT_ACTIVITY', 4), ('BACKOUT_MESSAGE', 5),)),
+    (725, 'ResponseTransportType', 'INT', (('INBAND', 0), ('OUT_OF_BAND', 1),)),
+    (726, 'ResponseDestination', 'STRING', ()),
+    (727, 'TotalNumPosReports', 'INT', ()),
+    (728, 'PosReqResult', 'INT', (('VALID_REQUEST', 0), ('INVALID_OR_UNSUPPORTED_REQUEST', 1), ('NO_POSITIONS_FOUND_THAT_MATCH_CRITERIA', 2), ('NOT_AUTHORIZED_TO_REQUEST_POSITIONS', 3), ('REQUEST_FOR_POSITION_NOT_SUPPORTED', 4), ('OTHER', 99),)),
+    (729, 'PosReqStatus', 'INT', (('COMPLETED', 0), ('COMPLETED_WITH_WARNINGS', 1), ('REJECTED', 2),)),
+    (730, 'SettlPrice', 'PRICE', ()),
+    (731, 'SettlPriceType', 'INT', (('FINAL', 1), ('THEORETICAL', 2),)),
+    (732, 'UnderlyingSettlPrice', 'PRICE', ()),
+    (733, 'UnderlyingSettlPriceType', 'INT', ()),
+    (734, 'PriorSettlPrice', 'PRICE', ()),
+    (735, 'NoQuoteQualifiers', 'NUMINGROUP', ()),
+    (736, 'AllocSettlCurrency', 'CURRENCY', ()),
+    (737, 'AllocSettlCurrAmt', 'AMT', ()),
+    (738, 'InterestAtMaturity', 'AMT', ()),
+    (739, 'LegDatedDate', 'LOCALMKTDATE', ()),
+    (740, 'LegPool', 'STRING', ()),
+    (741, 'AllocInterestAtMaturity', 'AMT', ()),
+    (742, 'AllocAccruedInterestAmt', 'AMT', ()),
+    (743, 'DeliveryDate', 'LOCALMKTDATE', ()),
+    (744, 'AssignmentMethod', 'CHAR', (('PRO_RATA', 'P'), ('RANDOM', 'R'),)),
+    (745, 'AssignmentUnit', 'QTY', ()),
+    (746, 'OpenInterest', 'AMT', ()),
+    (747, 'ExerciseMethod', 'CHAR', (('AUTOMATIC', 'A'), ('MANUAL', 'M'),)),
+    (748, 'TotNumTradeReports', 'INT', ()),
+    (749, 'TradeRequestResult', 'INT', (('SUCCESSFUL', 0), ('INVALID_OR_UNKNOWN_INSTRUMENT', 1), ('INVALID_TYPE_OF_TRADE_REQUESTED', 2), ('INVALID_PARTIES', 3), ('INVALID_TRANSPORT_TYPE_REQUESTED', 4), ('INVALID_DESTINATION_REQUESTED', 5), ('TRADEREQUESTTYPE_NOT_SUPPORTED', 8), ('NOT_AUTHORIZED', 9), ('OTHER', 99),)),
+    (750, 'TradeRequestStatus', 'INT', (('ACCEPTED', 0), ('COMPLETED', 1), ('REJECTED', 2),)),
+    (751, 'TradeReportRejectReason', 'INT', (('SUCCESSFUL', 0), ('INVALID_PARTY_ONFORMATION', 1), ('UNKNOWN_INSTRUMENT', 2), ('UNAUTHORIZED_TO_REPORT_TRADES', 3), ('INVALID_TRADE_TYPE', 4), ('OTHER', 99),)),
+    (752, 'SideMultiLegReportingType', 'INT', (('SINGLE_SECURITY', 1), ('INDIVIDUAL_LEG_OF_A_MULTILEG_SECURITY', 2), ('MULTILEG_SECURITY', 3),)),
+    (753, 'NoPosAmt', 'NUMINGROUP', ()),
+    (754, 'AutoAcceptIndicator', 'BOOLEAN', ()),
+    (755, 'AllocReportID', 'STRING', ()),
+    (756, 'NoNested2PartyIDs', 'NUMINGROUP', ()),
+    (757, 'Nested2PartyID', 'STRING', ()),
+    (758, 'Nested2PartyIDSource', 'CHAR', ()),
+    (759, 'Nested2PartyRole', 'INT', ()),
+    (760, 'Nested2PartySubID', 'STRING', ()),
+    (761, 'BenchmarkSecurityIDSource', 'STRING', ()),
+    (762, 'SecuritySubType', 'STRING', ()),
+    (763, 'UnderlyingSecuritySubType', 'STRING', ()),
+    (764, 'LegSecuritySubType', 'STRING', ()),
+    (765, 'AllowableOneSidednessPct', 'PERCENTAGE', ()),
+    (766, 'AllowableOneSidednessValue', 'AMT', ()),
+    (767, 'AllowableOneSidednessCurr', 'CURRENCY', ()),
+    (768, 'NoTrdRegTimestamps', 'NUMINGROUP', ()),
+    (769, 'TrdRegTimestamp', 'UTCTIMESTAMP', ()),
+    (770, 'TrdRegTimestampType', 'INT', (('EXECUTION_TIME', 1), ('TIME_IN', 2), ('TIME_OUT', 3), ('BROKER_RECEIPT', 4), ('BROKER_EXECUTION', 5), ('DESK_RECEIPT', 6),)),
+    (771, 'TrdRegTimestampOrigin', 'STRING', ()),
+    (772, 'ConfirmRefID', 'STRING', ()),
+    (773, 'ConfirmType', 'INT', (('STATUS', 1), ('CONFIRMATION', 2), ('CONFIRMATION_REQUEST_REJECTED', 3),)),
+    (774, 'ConfirmRejReason', 'INT', (('MISMATCHED_ACCOUNT', 1), ('MISSING_SETTLEMENT_INSTRUCTIONS', 2), ('OTHER', 99),)),
+    (775, 'BookingType', 'INT', (('REGULAR_BOOKING', 0), ('CFD', 1), ('TOTAL_RETURN_SWAP', 2),)),
+    (776, 'IndividualAllocRejCode', 'INT', ()),
+    (777, 'SettlInstMsgID', 'STRING', ()),
+    (778, 'NoSettlInst', 'NUMINGROUP', ()),
+    (779, 'LastUpdateTime', 'UTCTIMESTAMP', ()),
+    (780, 'AllocSettlInstType', 'INT', (('USE_DEFAULT_INSTRUCTIONS', 0), ('DERIVE_FROM_PARAMETERS_PROVIDED', 1), ('FULL_DETAILS_PROVIDED', 2), ('SSI_DB_IDS_PROVIDED', 3), ('PHONE_FOR_INSTRUCTIONS', 4),)),
+    (781, 'NoSettlPartyIDs', 'NUMINGROUP', ()),
+    (782, 'SettlPartyID', 'STRING', ()),
+    (783, 'SettlPartyIDSource', 'CHAR', ()),
+    (784, 'SettlPartyRole', 'INT', ()),
+    (785, 'SettlPartySubID', 'STRING', ()),
+    (786, 'SettlPartySubIDType', 'INT', ()),
+    (787, 'DlvyInstType', 'CHAR', (('CASH', 'C'), ('SECURITIES', 'S'),)),
+    (788, 'TerminationType', 'INT', (('OVERNIGHT', 1), ('TERM', 2), ('FLEXIBLE', 3), ('OPEN', 4),)),
+    (789, 'NextExpectedMsgSeqNum', 'SEQNUM', ()),
+    (790, 'OrdStatusReqID', 'STRING', ()),
+    (791, 'SettlInstReqID', 'STRING', ()),
+    (792, 'SettlInstReqRejCode', 'INT', (('UNABLE_TO_PROCESS_REQUEST', 0), ('UNKNOWN_ACCOUNT', 1), ('NO_MATCHING_SETTLEMENT_INSTRUCTIONS_FOUND', 2), ('OTHER', 99),)),
+    (793, 'SecondaryAllocID', 'STRING', ()),
+    (794, 'AllocReportType', 'INT', (('SELLSIDE_CALCULATED_USING_PRELIMINARY', 3), ('SELLSIDE_CALCULATED_WITHOUT_PRELIMINARY', 4), ('WAREHOUSE_RECAP', 5), ('REQUEST_TO_INTERMEDIARY', 8), ('PRELIMINARY_REQUEST_TO_INTERMEDIARY', 2), ('ACCEPT', 9), ('REJECT', 10), ('ACCEPT_PENDING', 11), ('COMPLETE', 12), ('REVERSE_PENDING', 14),)),
+    (795, 'AllocReportRefID', 'STRING', ()),
+    (796, 'AllocCancReplaceReason', 'INT', (('ORIGINAL_DETAILS_INCOMPLETE_INCORRECT', 1), ('CHANGE_IN_UNDERLYING_ORDER_DETAILS', 2), ('OTHER', 99),)),
+    (797, 'CopyMsgIndicator', 'BOOLEAN', ()),
+    (798, 'AllocAccountType', 'INT', (('ACCOUNT_IS_CARRIED_PN_CUSTOMER_SIDE_OF_BOOKS', 1), ('ACCOUNT_IS_CARRIED_ON_NON_CUSTOMER_SIDE_OF_BOOKS', 2), ('HOUSE_TRADER', 3), ('FLOOR_TRADER', 4), ('ACCOUNT_IS_CARRIED_ON_NON_CUSTOMER_SIDE_OF_BOOKS_AND_IS_CROSS_MARGINED', 6), ('ACCOUNT_IS_HOUSE_TRADER_AND_IS_CROSS_MARGINED', 7), ('JOINT_BACK_OFFICE_ACCOUNT', 8),)),
+    (799, 'OrderAvgPx', 'PRICE', ()),
+    (800, 'OrderBookingQty', 'QTY', ()),
+    (801, 'NoSettlPartySubIDs', 'NUMINGROUP', ()),
+    (802, 'NoPartySubIDs', 'NUMINGROUP', ()),
+    (803, 'PartySubIDType', 'INT', (('FIRM', 1), ('SECURITIES_ACCOUNT_NUMBER', 10), ('REGISTRATION_NUMBER', 11), ('REGISTERED_ADDRESS_12', 12), ('REGULATORY_STATUS', 13), ('REGISTRATION_NAME', 14), ('CASH_ACCOUNT_NUMBER', 15), ('BIC', 16), ('CSD_PARTICIPANT_MEMBER_CODE', 17), ('REGISTERED_ADDRESS_18', 18), ('FUND_ACCOUNT_NAME', 19), ('PERSON', 2), ('TELEX_NUMBER', 20), ('FAX_NUMBER', 21), ('SECURITIES_ACCOUNT_NAME', 22), ('CASH_ACCOUNT_NAME', 23), ('DEPARTMENT', 24), ('LOCATION_DESK', 25), ('POSITION_ACCOUNT_TYPE', 26), ('SYSTEM', 3), ('APPLICATION', 4), ('FULL_LEGAL_NAME_OF_FIRM', 5), ('POSTAL_ADDRESS', 6), ('PHONE_NUMBER', 7), ('EMAIL_ADDRESS', 8), ('CONTACT_NAME', 9), ('SECURITY_LOCATE_ID', 27), ('MARKET_MAKER', 28), ('ELIGIBLE_COUNTERPARTY', 29), ('PROFESSIONAL_CLIENT', 30), ('LOCATION', 31), ('EXECUTION_VENUE', 32), ('CURRENCY_DELIVERY_IDENTIFIER', 33),)),
+    (804, 'NoNestedPartySubIDs', 'NUMINGROUP', ()),
+    (805, 'NestedPartySubIDType', 'INT', ()),
+    (806, 'NoNested2PartySubIDs', 'NUMINGROUP', ()),
+    (807, 'Nested2PartySubIDType', 'INT', ()),
+    (808, 'AllocIntermedReqType', 'INT', (('PENDING_ACCEPT', 1), ('PENDING_RELEASE', 2), ('PENDING_REVERSAL', 3), ('ACCEPT', 4), ('BLOCK_LEVEL_REJECT', 5), ('ACCOUNT_LEVEL_REJECT', 6),)),
+    (810, 'UnderlyingPx', 'PRICE', ()),
+    (811, 'PriceDelta', 'FLOAT', ()),
+    (812, 'ApplQueueMax', 'INT', ()),
+    (813, 'ApplQueueDepth', 'INT', ()),
+    (814, 'ApplQueueResolution', 'INT', (('NO_ACTION_TAKEN', 0), ('QUEUE_FLUSHED', 1), ('OVERLAY_LAST', 2), ('END_SESSION', 3),)),
+    (815, 'ApplQueueAction', 'INT', (('NO_ACTION_TAKEN', 0), ('QUEUE_FLUSHED', 1), ('OVERLAY_LAST', 2), ('END_SESSION', 3),)),
+    (816, 'NoAltMDSource', 'NUMINGROUP', ()),
+    (817, 'AltMDSourceID', 'STRING', ()),
+    (818, 'SecondaryTradeReportID', 'STRING', ()),
+    (819, 'AvgPxIndicator', 'INT', (('NO_AVERAGE_PRICING', 0), ('TRADE_IS_PART_OF_AN_AVERAGE_PRICE_GROUP_IDENTIFIED_BY_THE_TRADELINKID', 1), ('LAST_TRADE_IS_THE_AVERAGE_PRICE_GROUP_IDENTIFIED_BY_THE_TRADELINKID', 2),)),
+    (820, 'TradeLinkID', 'STRING', ()),
+    (821, 'OrderInputDevice', 'STRING', ()),
+    (822, 'UnderlyingTradingSessionID', 'STRING', ()),
+    (823, 'UnderlyingTradingSessionSubID', 'STRING', ()),
+    (824, 'TradeLegRefID', 'STRING', ()),
+    (825, 'ExchangeRule', 'STRING', ()),
+    (826, 'TradeAllocIndicator', 'INT', (('ALLOCATION_NOT_REQUIRED', 0), ('ALLOCATION_REQUIRED', 1), ('USE_ALLOCATION_PROVIDED_WITH_THE_TRADE', 2), ('ALLOCATION_GIVE_UP_EXECUTOR', 3), ('ALLOCATION_FROM_EXECUTOR', 4), ('ALLOCATION_TO_CLAIM_ACCOUNT', 5),)),
+    (827, 'ExpirationCycle', 'INT', (('EXPIRE_ON_TRADING_SESSION_CLOSE', 0), ('EXPIRE_ON_TRADING_SESSION_OPEN', 1), ('TRADING_ELIGIBILITY_EXPIRATION_SPECIFIED_IN_THE_DATE_AND_TIME_FIELDS_EVENTDATE', 2),)),
+    (828, 'TrdType', 'INT', (('REGULAR_TRADE', 0), ('BLOCK_TRADE_1', 1), ('AFTER_HOURS_TRADE', 10), ('EFP', 2), ('TRANSFER', 3), ('LATE_TRADE', 4), ('T_TRADE', 5), ('WEIGHTED_AVERAGE_PRICE_TRADE', 6), ('BUNCHED_TRADE', 7), ('LATE_BUNCHED_TRADE', 8), ('PRIOR_REFERENCE_PRICE_TRADE', 9), ('EXCHANGE_FOR_RISK', 11), ('EXCHANGE_FOR_SWAP', 12), ('EXCHANGE_OF_FUTURES_FOR', 13), ('EXCHANGE_OF_OPTIONS_FOR_OPTIONS', 14), ('TRADING_AT_SETTLEMENT', 15), ('ALL_OR_NONE', 16), ('FUTURES_LARGE_ORDER_EXECUTION', 17), ('EXCHANGE_OF_FUTURES_FOR_FUTURES', 18), ('OPTION_INTERIM_TRADE', 19), ('OPTION_CABINET_TRADE', 20), ('PRIVATELY_NEGOTIATED_TRADES', 22), ('SUBSTITUTION_OF_FUTURES_FOR_FORWARDS', 23), ('ERROR_TRADE', 24), ('SPECIAL_CUM_DIVIDEND', 25), ('SPECIAL_EX_DIVIDEND', 26), ('SPECIAL_CUM_COUPON', 27), ('SPECIAL_EX_COUPON', 28), ('CASH_SETTLEMENT', 29), ('SPECIAL_PRICE', 30), ('GUARANTEED_DELIVERY', 31), ('SPECIAL_CUM_RIGHTS', 32), ('SPECIAL_EX_RIGHTS', 33), ('SPECIAL_CUM_CAPITAL_REPAYMENTS', 34), ('SPECIAL_EX_CAPITAL_REPAYMENTS', 35), ('SPECIAL_CUM_BONUS', 36), ('SPECIAL_EX_BONUS', 37), ('BLOCK_TRADE_38', 38), ('WORKED_PRINCIPAL_TRADE', 39), ('BLOCK_TRADES', 40), ('NAME_CHANGE', 41), ('PORTFOLIO_TRANSFER', 42), ('PROROGATION_BUY', 43), ('PROROGATION_SELL', 44), ('OPTION_EXERCISE', 45), ('DELTA_NEUTRAL_TRANSACTION', 46), ('FINANCING_TRANSACTION', 47), ('NON_STANDARD_SETTLEMENT', 48), ('DERIVATIVE_RELATED_TRANSACTION', 49), ('PORTFOLIO_TRADE', 50), ('VOLUME_WEIGHTED_AVERAGE_TRADE', 51), ('EXCHANGE_GRANTED_TRADE', 52), ('REPURCHASE_AGREEMENT', 53), ('OTC', 54), ('EXCHANGE_BASIS_FACILITY', 55),)),
+    (829, 'TrdSubType', 'INT', (('CMTA', 0), ('INTERNAL_TRANSFER_OR_ADJUSTMENT', 1), ('EXTERNAL_TRANSFER_OR_TRANSFER_OF_ACCOUNT', 2), ('REJECT_FOR_SUBMITTING_SIDE', 3), ('ADVISORY_FOR_CONTRA_SIDE', 4), ('OFFSET_DUE_TO_AN_ALLOCATION', 5), ('ONSET_DUT_TO_AN_ALLOCATION', 6), ('DIFFERENTIAL_SPREAD', 7), ('IMPLIED_SPREAD_LEG_EXECUTED_AGAINST_AN_OUTRIGHT', 8), ('TRANSACTION_FROM_EXERCISE', 9), ('TRANSACTION_FROM_ASSIGNMENT', 10), ('ACATS', 11), ('AI', 14), ('B', 15), ('K', 16), ('LC', 17), ('M', 18), ('N', 19), ('NM', 20), ('NR', 21), ('P', 22), ('PA', 23), ('PC', 24), ('PN', 25), ('R', 26), ('RO', 27), ('RT', 28), ('SW', 29), ('T', 30), ('WN', 31), ('WT', 32), ('OFF_HOURS_TRADE', 33), ('ON_HOURS_TRADE', 34), ('OTC_QUOTE', 35), ('CONVERTED_SWAP', 36), ('CROSSED_TRADE', 37), ('INTERIM_PROTECTED_TRADE', 38), ('LARGE_IN_SCALE', 39),)),
+    (830, 'TransferReason', 'STRING', ()),
+    (831, 'AsgnReqID', 'STRING', ()),
+    (832, 'TotNumAssignmentReports', 'INT', ()),
+    (833, 'AsgnRptID', 'STRING', ()),
+    (834, 'ThresholdAmount', 'PRICEOFFSET', ()),
+    (835, 'PegMoveType', 'INT', (('FLOATING', 0), ('FIXED', 1),)),
+    (836, 'PegOffsetType', 'INT', (('PRICE', 0), ('BASIS_POINTS', 1), ('TICKS', 2), ('PRICE_TIER', 3),)),
+    (837, 'PegLimitType', 'INT', (('OR_BETTER', 0), ('STRICT', 1), ('OR_WORSE', 2),)),
+    (838, 'PegRoundDirection', 'INT', (('MORE_AGGRESSIVE', 1), ('MORE_PASSIVE', 2),)),
+    (839, 'PeggedPrice', 'PRICE', ()),
+    (840, 'PegScope', 'INT', (('LOCAL', 1), ('NATIONAL', 2), ('GLOBAL', 3), ('NATIONAL_EXCLUDING_LOCAL', 4),)),
+    (841, 'DiscretionMoveType', 'INT', (('FLOATING', 0), ('FIXED', 1),)),
+    (842, 'DiscretionOffsetType', 'INT', (('PRICE', 0), ('BASIS_POINTS', 1), ('TICKS', 2), ('PRICE_TIER', 3),)),
+    (843, 'DiscretionLimitType', 'INT', (('OR_BETTER', 0), ('STRICT', 1), ('OR_WORSE', 2),)),
+    (844, 'DiscretionRoundDirection', 'INT', (('MORE_AGGRESSIVE', 1), ('MORE_PASSIVE', 2),)),
+    (845, 'DiscretionPrice', 'PRICE', ()),
+    (846, 'DiscretionScope', 'INT', (('LOCAL', 1), ('NATIONAL', 2), ('GLOBAL', 3), ('NATIONAL_EXCLUDING_LOCAL', 4),)),
+    (847, 'TargetStrategy', 'INT', (('VWAP', 1), ('PARTICIPATE', 2), ('MININIZE_MARKET_IMPACT', 3),)),
+    (848, 'TargetStrategyParameters', 'STRING', ()),
+    (849, 'ParticipationRate', 'PERCENTAGE', ()),
+    (850, 'TargetStrategyPerformance', 'FLOAT', ()),
+    (851, 'LastLiquidityInd', 'INT', (('ADDED_LIQUIDITY', 1), ('REMOVED_LIQUIDITY', 2), ('LIQUIDITY_ROUTED_OUT', 3), ('AUCTION', 4),)),
+    (852, 'PublishTrdIndicator', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (853, 'ShortSaleReason', 'INT', (('DEALER_SOLD_SHORT', 0), ('DEALER_SOLD_SHORT_EXEMPT', 1), ('SELLING_CUSTOMER_SOLD_SHORT', 2), ('SELLING_CUSTOMER_SOLD_SHORT_EXEMPT', 3), ('QUALIFIED_SERVICE_REPRESENTATIVE', 4), ('QSR_OR_AGU_CONTRA_SIDE_SOLD_SHORT_EXEMPT', 5),)),
+    (854, 'QtyType', 'INT', (('UNITS', 0), ('CONTRACTS', 1), ('UNITS_OF_MEASURE_PER_TIME_UNIT', 2),)),
+    (855, 'SecondaryTrdType', 'INT', ()),
+    (856, 'TradeReportType', 'INT', (('SUBMIT', 0), ('ALLEGED_1', 1), ('ACCEPT', 2), ('DECLINE', 3), ('ADDENDUM', 4), ('NO_WAS', 5), ('TRADE_REPORT_CANCEL', 6), ('_7', 7), ('DEFAULTED', 8), ('INVALID_CMTA', 9), ('PENDED', 10), ('ALLEGED_NEW', 11), ('ALLEGED_ADDENDUM', 12), ('ALLEGED_NO_WAS', 13), ('ALLEGED_TRADE_REPORT_CANCEL', 14), ('ALLEGED_15', 15),)),
+    (857, 'AllocNoOrdersType', 'INT', (('NOT_SPECIFIED', 0), ('EXPLICIT_LIST_PROVIDED', 1),)),
+    (858, 'SharedCommission', 'AMT', ()),
+    (859, 'ConfirmReqID', 'STRING', ()),
+    (860, 'AvgParPx', 'PRICE', ()),
+    (861, 'ReportedPx', 'PRICE', ()),
+    (862, 'NoCapacities', 'NUMINGROUP', ()),
+    (863, 'OrderCapacityQty', 'QTY', ()),
+    (864, 'NoEvents', 'NUMINGROUP', ()),
+    (865, 'EventType', 'INT', (('PUT', 1), ('CALL', 2), ('TENDER', 3), ('SINKING_FUND_CALL', 4), ('OTHER', 99), ('ACTIVATION', 5), ('INACTIVIATION', 6), ('LAST_ELIGIBLE_TRADE_DATE', 7), ('SWAP_START_DATE', 8), ('SWAP_END_DATE', 9), ('SWAP_NEXT_START_DATE', 11), ('SWAP_ROLL_DATE', 10), ('SWAP_NEXT_ROLL_DATE', 12), ('FIRST_DELIVERY_DATE', 13), ('LAST_DELIVERY_DATE', 14), ('INITIAL_INVENTORY_DUE_DATE', 15), ('FINAL_INVENTORY_DUE_DATE', 16), ('FIRST_INTENT_DATE', 17), ('LAST_INTENT_DATE', 18), ('POSITION_REMOVAL_DATE', 19),)),
+    (866, 'EventDate', 'LOCALMKTDATE', ()),
+    (867, 'EventPx', 'PRICE', ()),
+    (868, 'EventText', 'STRING', ()),
+    (869, 'PctAtRisk', 'PERCENTAGE', ()),
+    (870, 'NoInstrAttrib', 'NUMINGROUP', ()),
+    (871, 'InstrAttribType', 'INT', (('FLAT', 1), ('ORIGINAL_ISSUE_DISCOUNT', 10), ('CALLABLE_PUTTABLE', 11), ('ESCROWED_TO_MATURITY', 12), ('ESCROWED_TO_REDEMPTION_DATE', 13), ('PRE_REFUNDED', 14), ('IN_DEFAULT', 15), ('UNRATED', 16), ('TAXABLE', 17), ('INDEXED', 18), ('SUBJECT_TO_ALTERNATIVE_MINIMUM_TAX', 19), ('ZERO_COUPON', 2), ('ORIGINAL_ISSUE_DISCOUNT_PRICE_SUPPLY_PRICE_IN_THE_INSTRATTRIBVALUE', 20), ('CALLABLE_BELOW_MATURITY_VALUE', 21), ('CALLABLE_WITHOUT_NOTICE_BY_MAIL_TO_HOLDER_UNLESS_REGISTERED', 22), ('INTEREST_BEARING', 3), ('NO_PERIODIC_PAYMENTS', 4), ('VARIABLE_RATE', 5), ('LESS_FEE_FOR_PUT', 6), ('STEPPED_COUPON', 7), ('COUPON_PERIOD', 8), ('WHEN_AND_IF_ISSUED', 9), ('TEXT_SUPPLY_THE_TEXT_OF_THE_ATTRIBUTE_OR_DISCLAIMER_IN_THE_INSTRATTRIBVALUE', 99), ('PRICE_TICK_RULES_FOR_SECURITY', 23), ('TRADE_TYPE_ELIGIBILITY_DETAILS_FOR_SECURITY', 24), ('INSTRUMENT_DENOMINATOR', 25), ('INSTRUMENT_NUMERATOR', 26), ('INSTRUMENT_PRICE_PRECISION', 27), ('INSTRUMENT_STRIKE_PRICE', 28), ('TRADEABLE_INDICATOR', 29),)),
+    (872, 'InstrAttribValue', 'STRING', ()),
+    (873, 'DatedDate', 'LOCALMKTDATE', ()),
+    (874, 'InterestAccrualDate', 'LOCALMKTDATE', ()),
+    (875, 'CPProgram', 'INT', (('_3', 1), ('_4', 2), ('OTHER', 99),)),
+    (876, 'CPRegType', 'STRING', ()),
+    (877, 'UnderlyingCPProgram', 'STRING', ()),
+    (878, 'UnderlyingCPRegType', 'STRING', ()),
+    (879, 'UnderlyingQty', 'QTY', ()),
+    (880, 'TrdMatchID', 'STRING', ()),
+    (881, 'SecondaryTradeReportRefID', 'STRING', ()),
+    (882, 'UnderlyingDirtyPrice', 'PRICE', ()),
+    (883, 'UnderlyingEndPrice', 'PRICE', ()),
+    (884, 'UnderlyingStartValue', 'AMT', ()),
+    (885, 'UnderlyingCurrentValue', 'AMT', ()),
+    (886, 'UnderlyingEndValue', 'AMT', ()),
+    (887, 'NoUnderlyingStips', 'NUMINGROUP', ()),
+    (888, 'UnderlyingStipType', 'STRING', ()),
+    (889, 'UnderlyingStipValue', 'STRING', ()),
+    (890, 'MaturityNetMoney', 'AMT', ()),
+    (891, 'MiscFeeBasis', 'INT', (('ABSOLUTE', 0), ('PER_UNIT', 1), ('PERCENTAGE', 2),)),
+    (892, 'TotNoAllocs', 'INT', ()),
+    (893, 'LastFragment', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (894, 'CollReqID', 'STRING', ()),
+    (895, 'CollAsgnReason', 'INT', (('INITIAL', 0), ('SCHEDULED', 1), ('TIME_WARNING', 2), ('MARGIN_DEFICIENCY', 3), ('MARGIN_EXCESS', 4), ('FORWARD_COLLATERAL_DEMAND', 5), ('EVENT_OF_DEFAULT', 6), ('ADVERSE_TAX_EVENT', 7),)),
+    (896, 'CollInquiryQualifier', 'INT', (('TRADE_DATE', 0), ('GC_INSTRUMENT', 1), ('COLLATERAL_INSTRUMENT', 2), ('SUBSTITUTION_ELIGIBLE', 3), ('NOT_ASSIGNED', 4), ('PARTIALLY_ASSIGNED', 5), ('FULLY_ASSIGNED', 6), ('OUTSTANDING_TRADES', 7),)),
+    (897, 'NoTrades', 'NUMINGROUP', ()),
+    (898, 'MarginRatio', 'PERCENTAGE', ()),
+    (899, 'MarginExcess', 'AMT', ()),
+    (900, 'TotalNetValue', 'AMT', ()),
+    (901, 'CashOutstanding', 'AMT', ()),
+    (902, 'CollAsgnID', 'STRING', ()),
+    (903, 'CollAsgnTransType', 'INT', (('NEW', 0), ('REPLACE', 1), ('CANCEL', 2), ('RELEASE', 3), ('REVERSE', 4),)),
+    (904, 'CollRespID', 'STRING', ()),
+    (905, 'CollAsgnRespType', 'INT', (('RECEIVED', 0), ('ACCEPTED', 1), ('DECLINED', 2), ('REJECTED', 3),)),
+    (906, 'CollAsgnRejectReason', 'INT', (('UNKNOWN_DEAL', 0), ('UNKNOWN_OR_INVALID_INSTRUMENT', 1), ('UNAUTHORIZED_TRANSACTION', 2), ('INSUFFICIENT_COLLATERAL', 3), ('INVALID_TYPE_OF_COLLATERAL', 4), ('EXCESSIVE_SUBSTITUTION', 5), ('OTHER', 99),)),
+    (907, 'CollAsgnRefID', 'STRING', ()),
+    (908, 'CollRptID', 'STRING', ()),
+    (909, 'CollInquiryID', 'STRING', ()),
+    (910, 'CollStatus', 'INT', (('UNASSIGNED', 0), ('PARTIALLY_ASSIGNED', 1), ('ASSIGNMENT_PROPOSED', 2), ('ASSIGNED', 3), ('CHALLENGED', 4),)),
+    (911, 'TotNumReports', 'INT', ()),
+    (912, 'LastRptRequested', 'BOOLEAN', (('NO', 'N'), ('YES', 'Y'),)),
+    (913, 'AgreementDesc', 'STRING', ()),
+    (914, 'AgreementID', 'STRING', ()),
+    (915, 'AgreementDate', 'LOCALMKTDATE', ()),
+    (916, 'StartDate', 'LOCALMKTDATE', ()),
+    (917, 'EndDate', 'LOCALMKTDATE', ()),
+    (918, 'AgreementCurrency', 'CURRENCY', ()),
+    (919, 'DeliveryType', 'INT', (('VERSUS_PAYMENT_DELIVER', 0), ('FREE_DELIVER', 1), ('TRI_PARTY', 2), ('HOLD_IN_CUSTODY', 3),)),
+    (920, 'EndAccruedInterestAmt', 'AMT', ()),
+    (921, 'StartCash', 'AMT', ()),
+    (922, 'EndCash', 'AMT', ()),
+    (923, 'UserRequestID', 'STRING', ()),
+    (924, 'UserRequestType', 'INT', (('LOG_ON_USER', 1), ('LOG_OFF_USER', 2), ('CHANGE_PASSWORD_FOR_USER', 3), ('REQUEST_INDIVIDUAL_USER_STATUS', 4),)),
+    (925, 'NewPassword', 'STRING', ()),
+    (926, 'UserStatus', 'INT', (('LOGGED_IN', 1), ('NOT_LOGGED_IN', 2), ('USER_NOT_RECOGNISED', 3), ('PASSWORD_INCORRECT', 4), ('PASSWORD_CHANGED', 5), ('OTHER', 6), ('FORCED_USER_LOGOUT_BY_EXCHANGE', 7), ('SESSION_SHUTDOWN_WARNING', 8),)),
+    (927, 'UserStatusText', 'STRING', ()),
+    (928, 'StatusValue', 'INT', (('CONNECTED', 1), ('NOT_CONNECTED_2', 2), ('NOT_CONNECTED_3', 3), ('IN_PROCESS', 4),)),
+    (929, 'StatusText', 'STRING', ()),
+    (930, 'RefCompID', 'STRING', ()),
+    (931, 'RefSubID', 'STRING', ()),
+    (932, 'NetworkResponseID', 'STRING', ()),
+    (933, 'NetworkRequestID', 'STRING', ()),
+    (934, 'LastNetworkResponseID', 'STRING', ()),
+    (935, 'NetworkRequestType', 'INT', (('SNAPSHOT', 1), ('SUBSCRIBE', 2), ('STOP_SUBSCRIBING', 4), ('LEVEL_OF_DETAIL_THEN_NOCOMPIDS_BECOMES_REQUIRED', 8),)),
+    (936, 'NoCompIDs', 'NUMINGROUP', ()),
+    (937, 'NetworkStatusResponseType', 'INT', (('FULL', 1), ('INCREMENTAL_UPDATE', 2),)),
+    (938, 'NoCollInquiryQualifier', 'NUMINGROUP', ()),
+    (939, 'TrdRptStatus', 'INT', (('ACCEPTED', 0), ('REJECTED', 1), ('ACCEPTED_WITH_ERRORS', 3),)),
+    (940, 'AffirmStatus', 'INT', (('RECEIVED', 1), ('CONFIRM_REJECTED_IE_NOT_AFFIRMED', 2), ('AFFIRMED', 3),)),
+    (941, 'UnderlyingStrikeCurrency', 'CURRENCY', ()),
+    (942, 'LegStrikeCurrency', 'CURRENCY', ()),
+    (943, 'TimeBracket', 'STRING', ()),
+    (944, 'CollAction', 'INT', (('RETAIN', 0), ('ADD', 1), ('REMOVE', 2),)),
+    (945, 'CollInquiryStatus', 'INT', (('ACCEPTED', 0), ('ACCEPTED_WITH_WARNINGS', 1), ('COMPLETED', 2), ('COMPLETED_WITH_WARNINGS', 3), ('REJECTED', 4),)),
+    (946, 'CollInquiryResult', 'INT', (('SUCCESSFUL', 0), ('INVALID_OR_UNKNOWN_INSTRUMENT', 1), ('INVALID_OR_UNKNOWN_COLLATERAL_TYPE', 2), ('INVALID_PARTIES', 3), ('INVALID_TRANSPORT_TYPE_REQUESTED', 4), ('INVALID_DESTINATION_REQUESTED', 5), ('NO_COLLATERAL_FOUND_FOR_THE_TRADE_SPECIFIED', 6), ('NO_COLLATERAL_FOUND_FOR_THE_ORDER_SPECIFIED', 7), ('COLLATERAL_INQUIRY_TYPE_NOT_SUPPORTED', 8), ('UNAUTHORIZED_FOR_COLLATERAL_INQUIRY', 9), ('OTHER', 99),)),
+    (947, 'StrikeCurrency', 'CURRENCY', ()),
+    (948, 'NoNested3PartyIDs', 'NUMINGROUP', ()),
+    (949, 'Nested3PartyID', 'STRING', ()),
+    (950, 'Nested3PartyIDSource', 'CHAR', ()),
+    (951, 'Nested3PartyRole', 'INT', ()),
+    (952, 'NoNested3PartySubIDs', 'NUMINGROUP', ()),
+    (953, 'Nested3PartySubID', 'STRING', ()),
+    (954, 'Nested3PartySubIDType', 'INT', ()),
+    (955, 'LegContractSettlMonth', 'MONTHYEAR', ()),
+    (956, 'LegInterestAccrualDate', 'LOCALMKTDATE', ()),
+    (957, 'NoStrategyParameters', 'NUMINGROUP', ()),
+    (958, 'StrategyParameterName', 'STRING', ()),
+    (959, 'StrategyParameterType', 'INT', (('INT', 1), ('LENGTH', 2), ('NUMINGROUP', 3), ('SEQNUM', 4), ('TAGNUM', 5), ('FLOAT', 6), ('QTY', 7), ('PRICE', 8), ('PRICEOFFSET', 9), ('AMT', 10), ('PERCENTAGE', 11), ('CHAR', 12), ('BOOLEAN', 13), ('STRING', 14), ('MULTIPLECHARVALUE', 15), ('CURRENCY', 16), ('EXCHANGE', 17), ('MONTH_YEAR', 18), ('UTCTIMESTAMP', 19), ('UTCTIMEONLY', 20), ('LOCALMKTTIME', 21), ('UTCDATE', 22), ('DATA', 23), ('MULTIPLESTRINGVALUE', 24),)),
+    (960, 'StrategyParameterValue', 'STRING', ()),
+    (961, 'HostCrossID', 'STRING', ()),
+    (962, 'SideTimeInForce', 'UTCTIMESTAMP', ()),
+    (963, 'MDReportID', 'INT', ()),
+    (964, 'SecurityReportID', 'INT', ()),
+    (965, 'SecurityStatusID', 'STRING', (('ACTIVE', '1'), ('INACTIVE', '2'),)),
+    (966, 'SettleOnOpenFlag', 'STRING', ()),
+    (967, 'StrikeMultiplier', 'FLOAT', ()),
+    (968, 'StrikeValue', 'FLOAT', ()),
+    (969, 'MinPriceIncrement', 'FLOAT', ()),
+    (970, 'PositionLimit', 'INT', ()),
+    (971, 'NTPositionLimit', 'INT', ()),
+    (972, 'UnderlyingAllocationPercent', 'PERCENTAGE', ()),
+    (973, 'UnderlyingCashAmount', 'AMT', ()),
+    (974, 'UnderlyingCashType', 'STRING', (('FIXED', 'FIXED'), ('DIFF', 'DIFF'),)),
+    (975, 'UnderlyingSettlementType', 'INT', (('T_PLUS_1', 2), ('T_PLUS_3', 4), ('T_PLUS_4', 5),)),
+    (976, 'QuantityDate', 'LOCALMKTDATE', ()),
+    (977, 'ContIntRptID', 'STRING', ()),
+    (978, 'LateIndicator', 'BOOLEAN', ()),
+    (979, 'InputSource', 'STRING', ()),
+    (980, 'SecurityUpdateAction', 'CHAR', (('ADD', 'A'), ('DELETE', 'D'), ('MODIFY', 'M'),)),
+    (981, 'NoExpiration', 'NUMINGROUP', ()),
+    (982, 'ExpirationQtyType', 'INT', (('AUTO_EXERCISE', 1), ('NON_AUTO_EXERCISE', 2), ('FINAL_WILL_BE_EXERCISED', 3), ('CONTRARY_INTENTION', 4), ('DIFFERENCE', 5),)),
+    (983, 'ExpQty', 'QTY', ()),
+    (984, 'NoUnderlyingAmounts', 'NUMINGROUP', ()),
+    (985, 'UnderlyingPayAmount', 'AMT', ()),
+    (986, 'UnderlyingCollectAmount', 'AMT', ()),
+    (987, 'UnderlyingSettlementDate', 'LOCALMKTDATE', ()),
+    (988, 'UnderlyingSettlementStatus', 'STRING', ()),
+    (989, 'SecondaryIndividualAllocID', 'STRING', ()),
+    (990, 'LegReportID', 'STRING', ()),
+    (991, 'RndPx', 'PRICE', ()),
+    (992, 'IndividualAllocType', 'INT', (('SUB_ALLOCATE', 1), ('THIRD_PARTY_ALLOCATION', 2),)),
+    (993, 'AllocCustomerCapacity', 'STRING', ()),
+    (994, 'TierCode', 'STRING', ()),
+    (996, 'UnitOfMeasure', 'STRING', (('MEGAWATT_HOURS', 'MWh'), ('ONE_MILLION_BTU', 'MMBtu'), ('BARRELS', 'Bbl'), ('GALLONS', 'Gal'), ('METRIC_TONS', 't'), ('TONS', 'tn'), ('MILLION_BARRELS', 'MMbbl'), ('POUNDS', 'lbs'), ('TROY_OUNCES', 'oz_tr'), ('US_DOLLARS', 'USD'), ('BILLION_CUBIC_FEET', 'Bcf'), ('BUSHELS', 'Bu'),)),
+    (997, 'TimeUnit', 'STRING', (('SECOND', 'S'), ('MINUTE', 'Min'), ('HOUR', 'H'), ('DAY', 'D'), ('WEEK', 'Wk'), ('MONTH', 'Mo'), ('YEAR', 'Yr'),)),
+    (998, 'UnderlyingUnitOfMeasure', 'STRING', ()),
+    (999, 'LegUnitOfMeasure', 'STRING', ()),
+    (1000, 'UnderlyingTimeUnit', 'STRING', ()),
+    (1001, 'LegTimeUnit', 'STRING', ()),
+    (1002, 'AllocMethod', 'INT', (('AUTOMATIC', 1), ('GUARANTOR', 2), ('MANUAL', 3),)),
+    (1003, 'TradeID', 'STRING', ()),
+    (1005, 'SideTradeReportID', 'STRING', ()),
+    (1006, 'SideFillStationCd', 'STRING', ()),
+    (1007, 'SideReasonCd', 'STRING', ()),
+    (1008, 'SideTrdSubTyp', 'INT', (('CMTA', 0), ('INTERNAL_TRANSFER', 1), ('EXTERNAL_TRANSFER', 2), ('REJECT_FOR_SUBMITTING_TRADE', 3), ('ADVISORY_FOR_CONTRA_SIDE', 4), ('OFFSET_DUE_TO_AN_ALLOCATION', 5), ('ONSET_DUE_TO_AN_ALLOCATION', 6), ('DIFFERENTIAL_SPREAD', 7), ('IMPLIED_SPREAD_LEG_EXECUTED_AGAINST_AN_OUTRIGHT', 8), ('TRANSACTION_FROM_EXERCISE', 9), ('TRANSACTION_FROM_ASSIGNMENT', 10),)),
+    (1009, 'SideQty', 'INT', ()),
+    (1011, 'MessageEventSource', 'STRING', ()),
+    (1012, 'SideTrdRegTimestamp', 'UTCTIMESTAMP', ()),
+    (1013, 'SideTrdRegTimestampType', 'INT', ()),
+    (1014, 'SideTrdRegTimestampSrc', 'STRING', ()),
+    (1015, 'AsOfIndicator', 'CHAR', (('FALSE', '0'), ('TRUE', '1'),)),
+    (1016, 'NoSideTrdRegTS', 'NUMINGROUP', ()),
+    (1017, 'LegOptionRatio', 'FLOAT', ()),
+    (1018, 'NoInstrumentParties', 'NUMINGROUP', ()),
+    (1019, 'InstrumentPartyID', 'STRING', ()),
+    (1020, 'TradeVolume', 'QTY', ()),
+    (1021, 'MDBookType', 'INT', (('TOP_OF_BOOK', 1), ('PRICE_DEPTH', 2), ('ORDER_DEPTH', 3),)),
+    (1022, 'MDFeedType', 'STRING', ()),
+    (1023, 'MDPriceLevel', 'INT', ()),
+    (1024, 'MDOriginType', 'INT', (('BOOK', 0), ('OFF_BOOK', 1), ('CROSS', 2),)),
+    (1025, 'FirstPx', 'PRICE', ()),
+    (1026, 'MDEntrySpotRate', 'FLOAT', ()),
+    (1027, 'MDEntryForwardPoints', 'PRICEOFFSET', ()),
+    (1028, 'ManualOrderIndicator', 'BOOLEAN', ()),
+    (1029, 'CustDirectedOrder', 'BOOLEAN', ()),
+    (1030, 'ReceivedDeptID', 'STRING', ()),
+    (1031, 'CustOrderHandlingInst', 'MULTIPLESTRINGVALUE', (('ADD_ON_ORDER', 'ADD'), ('ALL_OR_NONE', 'AON'), ('CASH_NOT_HELD', 'CNH'), ('DIRECTED_ORDER', 'DIR'), ('EXCHANGE_FOR_PHYSICAL_TRANSACTION', 'E.W'), ('FILL_OR_KILL', 'FOK'), ('IMBALANCE_ONLY', 'IO'), ('IMMEDIATE_OR_CANCEL', 'IOC'), ('LIMIT_ON_OPEN', 'LOO'), ('LIMIT_ON_CLOSE', 'LOC'), ('MARKET_AT_OPEN', 'MAO'), ('MARKET_AT_CLOSE', 'MAC'), ('MARKET_ON_OPEN', 'MOO'), ('MARKET_ON_CLOSE', 'MOC'), ('MINIMUM_QUANTITY', 'MQT'), ('NOT_HELD', 'NH'), ('OVER_THE_DAY', 'OVD'), ('PEGGED', 'PEG'), ('RESERVE_SIZE_ORDER', 'RSV'), ('STOP_STOCK_TRANSACTION', 'S.W'), ('SCALE', 'SCL'), ('TIME_ORDER', 'TMO'), ('TRAILING_STOP', 'TS'), ('WORK', 'WRK'),)),
+    (1032, 'OrderHandlingInstSource', 'INT', (('NASD_OATS', 1),)),
+    (1033, 'DeskType', 'STRING', (('AGENCY', 'A'), ('ARBITRAGE', 'AR'), ('DERIVATIVES', 'D'), ('INTERNATIONAL', 'IN'), ('INSTITUTIONAL', 'IS'), ('OTHER', 'O'), ('PREFERRED_TRADING', 'PF'), ('PROPRIETARY', 'PR'), ('PROGRAM_TRADING', 'PT'), ('SALES', 'S'), ('TRADING', 'T'),)),
+    (1034, 'DeskTypeSource', 'INT', (('NASD_OATS', 1),)),
+    (1035, 'DeskOrderHandlingInst', 'MULTIPLESTRINGVALUE', (('ADD_ON_ORDER', 'ADD'), ('ALL_OR_NONE', 'AON'), ('CASH_NOT_HELD', 'CNH'), ('DIRECTED_ORDER', 'DIR'), ('EXCHANGE_FOR_PHYSICAL_TRANSACTION', 'E.W'), ('FILL_OR_KILL', 'FOK'), ('IMBALANCE_ONLY', 'IO'), ('IMMEDIATE_OR_CANCEL', 'IOC'), ('LIMIT_ON_OPEN', 'LOO'), ('LIMIT_ON_CLOSE', 'LOC'), ('MARKET_AT_OPEN', 'MAO'), ('MARKET_AT_CLOSE', 'MAC'), ('MARKET_ON_OPEN', 'MOO'), ('MARKET_ON_CLOSE', 'MOC'), ('MINIMUM_QUANTITY', 'MQT'), ('NOT_HELD', 'NH'), ('OVER_THE_DAY', 'OVD'), ('PEGGED', 'PEG'), ('RESERVE_SIZE_ORDER', 'RSV'), ('STOP_STOCK_TRANSACTION', 'S.W'), ('SCALE', 'SCL'), ('TIME_ORDER', 'TMO'), ('TRAILING_STOP', 'TS'), ('WORK', 'WRK'),)),
+    (1036, 'ExecAckStatus', 'CHAR', (('RECEIVED_NOT_YET_PROCESSED', '0'), ('ACCEPTED', '1'), ('DONT_KNOW', '2'),)),
+    (1037, 'UnderlyingDeliveryAmount', 'AMT', ()),
+    (1038, 'UnderlyingCapValue', 'AMT', ()),
+    (1039, 'UnderlyingSettlMethod', 'STRING', ()),
+    (1040, 'SecondaryTradeID', 'STRING', ()),
+    (1041, 'FirmTradeID', 'STRING', ()),
+    (1042, 'SecondaryFirmTradeID', 'STRING', ()),
+    (1043, 'CollApplType', 'INT', (('SPECIFIC_DEPOSIT', 0), ('GENERAL', 1),)),
+    (1044, 'UnderlyingAdjustedQuantity', 'QTY', ()),
+    (1045, 'UnderlyingFXRate', 'FLOAT', ()),
+    (1046, 'UnderlyingFXRateCalc', 'CHAR', (('MULTIPLY', 'M'), ('DIVIDE', 'D'),)),
+    (1047, 'AllocPositionEffect', 'CHAR', (('OPEN', 'O'), ('CLOSE', 'C'), ('ROLLED', 'R'), ('FIFO', 'F'),)),
+    (1048, 'DealingCapacity', 'PRICEOFFSET', ()),
+    (1049, 'InstrmtAssignmentMethod', 'CHAR', ()),
+    (1050, 'InstrumentPartyIDSource', 'CHAR', ()),
+    (1051, 'InstrumentPartyRole', 'INT', ()),
+    (1052, 'NoInstrumentPartySubIDs', 'NUMINGROUP', ()),
+    (1053, 'InstrumentPartySubID', 'STRING', ()),
+    (1054, 'InstrumentPartySubIDType', 'INT', ()),
+    (1055, 'PositionCurrency', 'STRING', ()),
+    (1056, 'CalculatedCcyLastQty', 'QTY', ()),
+    (1057, 'AggressorIndicator', 'BOOLEAN', (('YES', 'Y'), ('NO', 'N'),)),
+    (1058, 'NoUndlyInstrumentParties', 'NUMINGROUP', ()),
+    (1059, 'UndlyInstrumentPartyID', 'STRING', ()),
+    (1060, 'UndlyInstrumentPartyIDSource', 'CHAR', ()),
+    (1061, 'UndlyInstrumentPartyRole', 'INT', ()),
+    (1062, 'NoUndlyInstrumentPartySubIDs', 'NUMINGROUP', ()),
+    (1063, 'UndlyInstrumentPartySubID', 'STRING', ()),
+    (1064, 'UndlyInstrumentPartySubIDType', 'INT', ()),
+    (1065, 'BidSwapPoints', 'PRICEOFFSET', ()),
+    (1066, 'OfferSwapPoints', 'PRICEOFFSET', ()),
+    (1067, 'LegBidForwardPoints', 'PRICEOFFSET', ()),
+    (1068, 'LegOfferForwardPoints', 'PRICEOFFSET', ()),
+    (1069, 'SwapPoints', 'PRICEOFFSET', ()),
+    (1070, 'MDQuoteType', 'INT', (('INDICATIVE', 0), ('TRADEABLE', 1), ('RESTRICTED_TRADEABLE', 2), ('COUNTER', 3), ('INDICATIVE_AND_TRADEABLE', 4),)),
+    (1071, 'LastSwapPoints', 'PRICEOFFSET', ()),
+    (1072, 'SideGrossTradeAmt', 'AMT', ()),
+    (1073, 'LegLastForwardPoints', 'PRICEOFFSET', ()),
+    (1074, 'LegCalculatedCcyLastQty', 'QTY', ()),
+    (1075, 'LegGrossTradeAmt', 'AMT', ()),
+    (1079, 'MaturityTime', 'TZTIMEONLY', ()),
+    (1080, 'RefOrderID', 'STRING', ()),
+    (1081, 'RefOrderIDSource', 'CHAR', (('SECONDARYORDERID', '0'), ('ORDERID', '1'), ('MDENTRYID', '2'), ('QUOTEENTRYID', '3'),)),
+    (1082, 'SecondaryDisplayQty', 'QTY', ()),
+    (1083, 'DisplayWhen', 'CHAR', (('IMMEDIATE', '1'), ('EXHAUST', '2'),)),
+    (1084, 'DisplayMethod', 'CHAR', (('INITIAL', '1'), ('NEW', '2'), ('RANDOM', '3'),)),
+    (1085, 'DisplayLowQty', 'QTY', ()),
+    (1086, 'DisplayHighQty', 'QTY', ()),
+    (1087, 'DisplayMinIncr', 'QTY', ()),
+    (1088, 'RefreshQty', 'QTY', ()),
+    (1089, 'MatchIncrement', 'QTY', ()),
+    (1090, 'MaxPriceLevels', 'INT', ()),
+    (1091, 'PreTradeAnonymity', 'BOOLEAN', ()),
+    (1092, 'PriceProtectionScope', 'CHAR', (('NONE', '0'), ('LOCAL', '1'), ('NATIONAL', '2'), ('GLOBAL', '3'),)),
+    (1093, 'LotType', 'CHAR', (('ODD_LOT', '1'), ('ROUND_LOT', '2'), ('BLOCK_LOT', '3'),)),
+    (1094, 'PegPriceType', 'INT', (('LAST_PEG', 1), ('MID_PRICE_PEG', 2), ('OPENING_PEG', 3), ('MARKET_PEG', 4), ('PRIMARY_PEG', 5), ('PEG_TO_VWAP', 7), ('TRAILING_STOP_PEG', 8), ('PEG_TO_LIMIT_PRICE', 9),)),
+    (1095, 'PeggedRefPrice', 'PRICE', ()),
+    (1096, 'PegSecurityIDSource', 'STRING', ()),
+    (1097, 'PegSecurityID', 'STRING', ()),
+    (1098, 'PegSymbol', 'STRING', ()),
+    (1099, 'PegSecurityDesc', 'STRING', ()),
+    (1100, 'TriggerType', 'CHAR', (('PARTIAL_EXECUTION', '1'), ('SPECIFIED_TRADING_SESSION', '2'), ('NEXT_AUCTION', '3'), ('PRICE_MOVEMENT', '4'),)),
+    (1101, 'TriggerAction', 'CHAR', (('ACTIVATE', '1'), ('MODIFY', '2'), ('CANCEL', '3'),)),
+    (1102, 'TriggerPrice', 'PRICE', ()),
+    (1103, 'TriggerSymbol', 'STRING', ()),
+    (1104, 'TriggerSecurityID', 'STRING', ()),
+    (1105, 'TriggerSecurityIDSource', 'STRING', ()),
+    (1106, 'TriggerSecurityDesc', 'STRING', ()),
+    (1107, 'TriggerPriceType', 'CHAR', (('BEST_OFFER', '1'), ('LAST_TRADE', '2'), ('BEST_BID', '3'), ('BEST_BID_OR_LAST_TRADE', '4'), ('BEST_OFFER_OR_LAST_TRADE', '5'), ('BEST_MID', '6'),)),
+    (1108, 'TriggerPriceTypeScope', 'CHAR', (('NONE', '0'), ('LOCAL', '1'), ('NATIONAL', '2'), ('GLOBAL', '3'),)),
+    (1109, 'TriggerPriceDirection', 'CHAR', (('TRIGGER_IF_THE_PRICE_OF_THE_SPECIFIED_TYPE_GOES_UP_TO_OR_THROUGH_THE_SPECIFIED_TRIGGER_PRICE', 'U'), ('TRIGGER_IF_THE_PRICE_OF_THE_SPECIFIED_TYPE_GOES_DOWN_TO_OR_THROUGH_THE_SPECIFIED_TRIGGER_PRICE', 'D'),)),
+    (1110, 'TriggerNewPrice', 'PRICE', ()),
+    (1111, 'TriggerOrderType', 'CHAR', (('MARKET', '1'), ('LIMIT', '2'),)),
+    (1112, 'TriggerNewQty', 'QTY', ()),
+    (1113, 'TriggerTradingSessionID', 'STRING', ()),
+    (1114, 'TriggerTradingSessionSubID', 'STRING', ()),
+    (1115, 'OrderCategory', 'CHAR', (('ORDER', '1'), ('QUOTE', '2'), ('PRIVATELY_NEGOTIATED_TRADE', '3'), ('MULTILEG_ORDER', '4'), ('LINKED_ORDER', '5'), ('QUOTE_REQUEST', '6'), ('IMPLIED_ORDER', '7'), ('CROSS_ORDER', '8'), ('STREAMING_PRICE', '9'),)),
+    (1116, 'NoRootPartyIDs', 'NUMINGROUP', ()),
+    (1117, 'RootPartyID', 'STRING', ()),
+    (1118, 'RootPartyIDSource', 'CHAR', ()),
+    (1119, 'RootPartyRole', 'INT', ()),
+    (1120, 'NoRootPartySubIDs', 'NUMINGROUP', ()),
+    (1121, 'RootPartySubID', 'STRING', ()),
+    (1122, 'RootPartySubIDType', 'INT', ()),
+    (1123, 'TradeHandlingInstr', 'CHAR', (('TRADE_CONFIRMATION', '0'), ('TWO_PARTY_REPORT', '1'), ('ONE_PARTY_REPORT_FOR_MATCHING', '2'), ('ONE_PARTY_REPORT_FOR_PASS_THROUGH', '3'), ('AUTOMATED_FLOOR_ORDER_ROUTING', '4'), ('TWO_PARTY_REPORT_FOR_CLAIM', '5'),)),
+    (1124, 'OrigTradeHandlingInstr', 'CHAR', ()),
+    (1125, 'OrigTradeDate', 'LOCALMKTDATE', ()),
+    (1126, 'OrigTradeID', 'STRING', ()),
+    (1127, 'OrigSecondaryTradeID', 'STRING', ()),
+    (1128, 'ApplVerID', 'STRING', (('FIX27', '0'), ('FIX30', '1'), ('FIX40', '2'), ('FIX41', '3'), ('FIX42', '4'), ('FIX43', '5'), ('FIX44', '6'), ('FIX50', '7'), ('FIX50SP1', '8'),)),
+    (1129, 'CstmApplVerID', 'STRING', ()),
+    (1130, 'RefApplVerID', 'STRING', ()),
+    (1131, 'RefCstmApplVerID', 'STRING', ()),
+    (1132, 'TZTransactTime', 'TZTIMESTAMP', ()),
+    (1133, 'ExDestinationIDSource', 'CHAR', (('BIC', 'B'), ('GENERALLY_ACCEPTED_MARKET_PARTICIPANT_IDENTIFIER', 'C'), ('PROPRIETARY', 'D'), ('ISO_COUNTRY_CODE', 'E'), ('MIC', 'G'),)),
+    (1134, 'ReportedPxDiff', 'BOOLEAN', ()),
+    (1135, 'RptSys', 'STRING', ()),
+    (1136, 'AllocClearingFeeIndicator', 'STRING', ()),
+    (1137, 'DefaultApplVerID', 'STRING', ()),
+    (1138, 'DisplayQty', 'QTY', ()),
+    (1139, 'ExchangeSpecialInstructions', 'STRING', ()),
+    (1140, 'MaxTradeVol', 'QTY', ()),
+    (1141, 'NoMDFeedTypes', 'NUMINGROUP', ()),
+    (1142, 'MatchAlgorithm', 'STRING', ()),
+    (1143, 'MaxPriceVariation', 'FLOAT', ()),
+    (1144, 'ImpliedMarketIndicator', 'INT', (('NOT_IMPLIED', 0), ('IMPLIED_IN', 1), ('IMPLIED_OUT', 2), ('BOTH_IMPLIED_IN_AND_IMPLIED_OUT', 3),)),
+    (1145, 'EventTime', 'UTCTIMESTAMP', ()),
+    (1146, 'MinPriceIncrementAmount', 'AMT', ()),
+    (1147, 'UnitOfMeasureQty', 'QTY', ()),
+    (1148, 'LowLimitPrice', 'PRICE', ()),
+    (1149, 'HighLimitPrice', 'PRICE', ()),
+    (1150, 'TradingReferencePrice', 'PRICE', ()),
+    (1151, 'SecurityGroup', 'STRING', ()),
+    (1152, 'LegNumber', 'INT', ()),
+    (1153, 'SettlementCycleNo', 'INT', ()),
+    (1154, 'SideCurrency', 'CURRENCY', ()),
+    (1155, 'SideSettlCurrency', 'CURRENCY', ()),
+    (1156, 'ApplExtID', 'INT', ()),
+    (1157, 'CcyAmt', 'AMT', ()),
+    (1158, 'NoSettlDetails', 'NUMINGROUP', ()),
+    (1159, 'SettlObligMode', 'INT', (('PRELIMINARY', 1), ('FINAL', 2),)),
+    (1160, 'SettlObligMsgID', 'STRING', ()),
+    (1161, 'SettlObligID', 'STRING', ()),
+    (1162, 'SettlObligTransType', 'CHAR', (('CANCEL', 'C'), ('NEW', 'N'), ('REPLACE', 'R'), ('RESTATE', 'T'),)),
+    (1163, 'SettlObligRefID', 'STRING', ()),
+    (1164, 'SettlObligSource', 'CHAR', (('INSTRUCTIONS_OF_BROKER', '1'), ('INSTRUCTIONS_FOR_INSTITUTION', '2'), ('INVESTOR', '3'),)),
+    (1165, 'NoSettlOblig', 'NUMINGROUP', ()),
+    (1166, 'QuoteMsgID', 'STRING', ()),
+    (1167, 'QuoteEntryStatus', 'INT', (('ACCEPTED', 0), ('REJECTED', 5), ('REMOVED_FROM_MARKET', 6), ('EXPIRED', 7), ('LOCKED_MARKET_WARNING', 12), ('CROSS_MARKET_WARNING', 13), ('CANCELED_DUE_TO_LOCK_MARKET', 14), ('CANCELED_DUE_TO_CROSS_MARKET', 15), ('ACTIVE', 16),)),
+    (1168, 'TotNoCxldQuotes', 'INT', ()),
+    (1169, 'TotNoAccQuotes', 'INT', ()),
+    (1170, 'TotNoRejQuotes', 'INT', ()),
+    (1171, 'PrivateQuote', 'BOOLEAN', ()),
+    (1172, 'RespondentType', 'INT', (('ALL_MARKET_PARTICIPANTS', 1), ('SPECIFIED_MARKET_PARTICIPANTS', 2), ('ALL_MARKET_MAKERS', 3), ('PRIMARY_MARKET_MAKER', 4),)),
+    (1173, 'MDSubBookType', 'INT', ()),
+    (1174, 'SecurityTradingEvent', 'INT', (('ORDER_IMBALANCE_AUCTION_IS_EXTENDED', 1), ('TRADING_RESUMES', 2), ('PRICE_VOLATILITY_INTERRUPTION', 3), ('CHANGE_OF_TRADING_SESSION', 4), ('CHANGE_OF_TRADING_SUBSESSION', 5), ('CHANGE_OF_SECURITY_STATUS', 6), ('CHANGE_OF_BOOK_TYPE', 7), ('CHANGE_OF_MARKET_DEPTH', 8),)),
+    (1175, 'NoStatsIndicators', 'NUMINGROUP', ()),
+    (1176, 'StatsType', 'INT', (('EXCHANGE_LAST', 1), ('HIGH', 2), ('AVERAGE_PRICE', 3), ('TURNOVER', 4),)),
+    (1177, 'NoOfSecSizes', 'NUMINGROUP', ()),
+    (1178, 'MDSecSizeType', 'INT', (('CUSTOMER', 1),)),
+    (1179, 'MDSecSize', 'QTY', ()),
+    (1180, 'ApplID', 'STRING', ()),
+    (1181, 'ApplSeqNum', 'SEQNUM', ()),
+    (1182, 'ApplBegSeqNum', 'SEQNUM', ()),
+    (1183, 'ApplEndSeqNum', 'SEQNUM', ()),
+    (1184, 'SecurityXMLLen', 'LENGTH', ()),
+    (1185, 'SecurityXML', 'XMLDATA', ()),
+    (1186, 'SecurityXMLSchema', 'STRING', ()),
+    (1187, 'RefreshIndicator', 'BOOLEAN', ()),
+    (1188, 'Volatility', 'FLOAT', ()),
+    (1189, 'TimeToExpiration', 'FLOAT', ()),
+    (1190, 'RiskFreeRate', 'FLOAT', ()),
+    (1191, 'PriceUnitOfMeasure', 'STRING', ()),
+    (1192, 'PriceUnitOfMeasureQty', 'QTY', ()),
+    (1193, 'SettlMethod', 'CHAR', (('CASH_SETTLEMENT_REQUIRED', 'C'), ('PHYSICAL_SETTLEMENT_REQUIRED', 'P'),)),
+    (1194, 'ExerciseStyle', 'INT', (('EUROPEAN', 0), ('AMERICAN', 1), ('BERMUDA', 2),)),
+    (1195, 'OptPayAmount', 'AMT', ()),
+    (1196, 'PriceQuoteMethod', 'STRING', (('STANDARD', 'STD'), ('INDEX', 'INX'), ('INTEREST_RATE_INDEX', 'INT'),)),
+    (1197, 'FuturesValuationMethod', 'STRING', (('PREMIUM_STYLE', 'EQTY'), ('FUTURES_STYLE_MARK_TO_MARKET', 'FUT'), ('FUTURES_STYLE_WITH_AN_ATTACHED_CASH_ADJUSTMENT', 'FUTDA'),)),
+    (1198, 'ListMethod', 'INT', (('PRE_LISTED_ONLY', 0), ('USER_REQUESTED', 1),)),
+    (1199, 'CapPrice', 'PRICE', ()),
+    (1200, 'FloorPrice', 'PRICE', ()),
+    (1201, 'NoStrikeRules', 'NUMINGROUP', ()),
+    (1202, 'StartStrikePxRange', 'PRICE', ()),
+    (1203, 'EndStrikePxRange', 'PRICE', ()),
+    (1204, 'StrikeIncrement', 'FLOAT', ()),
+    (1205, 'NoTickRules', 'NUMINGROUP', ()),
+    (1206, 'StartTickPriceRange', 'PRICE', ()),
+    (1207, 'EndTickPriceRange', 'PRICE', ()),
+    (1208, 'TickIncrement', 'PRICE', ()),
+    (1209, 'TickRuleType', 'INT', (('REGULAR', 0), ('VARIABLE', 1), ('FIXED', 2), ('TRADED_AS_A_SPREAD_LEG', 3), ('SETTLED_AS_A_SPREAD_LEG', 4),)),
+    (1210, 'NestedInstrAttribType', 'INT', ()),
+    (1211, 'NestedInstrAttribValue', 'STRING', ()),
+    (1212, 'LegMaturityTime', 'TZTIMEONLY', ()),
+    (1213, 'UnderlyingMaturityTime', 'TZTIMEONLY', ()),
+    (1214, 'DerivativeSymbol', 'STRING', ()),
+    (1215, 'DerivativeSymbolSfx', 'STRING', ()),
+    (1216, 'DerivativeSecurityID', 'STRING', ()),
+    (1217, 'DerivativeSecurityIDSource', 'STRING', ()),
+    (1218, 'NoDerivativeSecurityAltID', 'NUMINGROUP', ()),
+    (1219, 'DerivativeSecurityAltID', 'STRING', ()),
+    (1220, 'DerivativeSecurityAltIDSource', 'STRING', ()),
+    (1221, 'SecondaryLowLimitPrice', 'PRICE', ()),
+    (1222, 'MaturityRuleID', 'STRING', ()),
+    (1223, 'StrikeRuleID', 'STRING', ()),
+    (1224, 'LegUnitOfMeasureQty', 'QTY', ()),
+    (1225, 'DerivativeOptPayAmount', 'AMT', ()),
+    (1226, 'EndMaturityMonthYear', 'MONTHYEAR', ()),
+    (1227, 'ProductComplex', 'STRING', ()),
+    (1228, 'DerivativeProductComplex', 'STRING', ()),
+    (1229, 'MaturityMonthYearIncrement', 'INT', ()),
+    (1230, 'SecondaryHighLimitPrice', 'PRICE', ()),
+    (1231, 'MinLotSize', 'QTY', ()),
+    (1232, 'NoExecInstRules', 'NUMINGROUP', ()),
+    (1234, 'NoLotTypeRules', 'NUMINGROUP', ()),
+    (1235, 'NoMatchRules', 'NUMINGROUP', ()),
+    (1236, 'NoMaturityRules', 'NUMINGROUP', ()),
+    (1237, 'NoOrdTypeRules', 'NUMINGROUP', ()),
+    (1239, 'NoTimeInForceRules', 'NUMINGROUP', ()),
+    (1240, 'SecondaryTradingReferencePrice', 'PRICE', ()),
+    (1241, 'StartMaturityMonthYear', 'MONTHYEAR', ()),
+    (1242, 'FlexProductEligibilityIndicator', 'BOOLEAN', ()),
+    (1243, 'DerivFlexProductEligibilityIndicator', 'BOOLEAN', ()),
+    (1244, 'FlexibleIndicator', 'BOOLEAN', ()),
+    (1245, 'TradingCurrency', 'CURRENCY', ()),
+    (1246, 'DerivativeProduct', 'INT', ()),
+    (1247, 'DerivativeSecurityGroup', 'STRING', ()),
+    (1248, 'DerivativeCFICode', 'STRING', ()),
+    (1249, 'DerivativeSecurityType', 'STRING', ()),
+    (1250, 'DerivativeSecuritySubType', 'STRING', ()),
+    (1251, 'DerivativeMaturityMonthYear', 'MONTHYEAR', ()),
+    (1252, 'DerivativeMaturityDate', 'LOCALMKTDATE', ()),
+    (1253, 'DerivativeMaturityTime', 'TZTIMEONLY', ()),
+    (1254, 'DerivativeSettleOnOpenFlag', 'STRING', ()),
+    (1255, 'DerivativeInstrmtAssignmentMethod', 'CHAR', ()),
+    (1256, 'DerivativeSecurityStatus', 'STRING', ()),
+    (1257, 'DerivativeInstrRegistry', 'STRING', ()),
+    (1258, 'DerivativeCountryOfIssue', 'COUNTRY', ()),
+    (1259, 'DerivativeStateOrProvinceOfIssue', 'STRING', ()),
+    (1260, 'DerivativeLocaleOfIssue', 'STRING', ()),
+    (1261, 'DerivativeStrikePrice', 'PRICE', ()),
+    (1262, 'DerivativeStrikeCurrency', 'CURRENCY', ()),
+    (1263, 'DerivativeStrikeMultiplier', 'FLOAT', ()),
+    (1264, 'DerivativeStrikeValue', 'FLOAT', ()),
+    (1265, 'DerivativeOptAttribute', 'CHAR', ()),
+    (1266, 'DerivativeContractMultiplier', 'FLOAT', ()),
+    (1267, 'DerivativeMinPriceIncrement', 'FLOAT', ()),
+    (1268, 'DerivativeMinPriceIncrementAmount', 'AMT', ()),
+    (1269, 'DerivativeUnitOfMeasure', 'STRING', ()),
+    (1270, 'DerivativeUnitOfMeasureQty', 'QTY', ()),
+    (1271, 'DerivativeTimeUnit', 'STRING', ()),
+    (1272, 'DerivativeSecurityExchange', 'EXCHANGE', ()),
+    (1273, 'DerivativePositionLimit', 'INT', ()),
+    (1274, 'DerivativeNTPositionLimit', 'INT', ()),
+    (1275, 'DerivativeIssuer', 'STRING', ()),
+    (1276, 'DerivativeIssueDate', 'LOCALMKTDATE', ()),
+    (1277, 'DerivativeEncodedIssuerLen', 'LENGTH', ()),
+    (1278, 'DerivativeEncodedIssuer', 'DATA', ()),
+    (1279, 'DerivativeSecurityDesc', 'STRING', ()),
+    (1280, 'DerivativeEncodedSecurityDescLen', 'LENGTH', ()),
+    (1281, 'DerivativeEncodedSecurityDesc', 'DATA', ()),
+    (1282, 'DerivativeSecurityXMLLen', 'LENGTH', ()),
+    (1283, 'DerivativeSecurityXML', 'DATA', ()),
+    (1284, 'DerivativeSecurityXMLSchema', 'STRING', ()),
+    (1285, 'DerivativeContractSettlMonth', 'MONTHYEAR', ()),
+    (1286, 'NoDerivativeEvents', 'NUMINGROUP', ()),
+    (1287, 'DerivativeEventType', 'INT', ()),
+    (1288, 'DerivativeEventDate', 'LOCALMKTDATE', ()),
+    (1289, 'DerivativeEventTime', 'UTCTIMESTAMP', ()),
+    (1290, 'DerivativeEventPx', 'PRICE', ()),
+    (1291, 'DerivativeEventText', 'STRING', ()),
+    (1292, 'NoDerivativeInstrumentParties', 'NUMINGROUP', ()),
+    (1293, 'DerivativeInstrumentPartyID', 'STRING', ()),
+    (1294, 'DerivativeInstrumentPartyIDSource', 'STRING', ()),
+    (1295, 'DerivativeInstrumentPartyRole', 'INT', ()),
+    (1296, 'NoDerivativeInstrumentPartySubIDs', 'NUMINGROUP', ()),
+    (1297, 'DerivativeInstrumentPartySubID', 'STRING', ()),
+    (1298, 'DerivativeInstrumentPartySubIDType', 'INT', ()),
+    (1299, 'DerivativeExerciseStyle', 'CHAR', ()),
+    (1300, 'MarketSegmentID', 'STRING', ()),
+    (1301, 'MarketID', 'EXCHANGE', ()),
+    (1302, 'MaturityMonthYearIncrementUnits', 'INT', (('MONTHS', 0), ('DAYS', 1), ('WEEKS', 2), ('YEARS', 3),)),
+    (1303, 'MaturityMonthYearFormat', 'INT', (('YEARMONTH_ONLY', 0), ('YEARMONTHDAY', 1), ('YEARMONTHWEEK', 2),)),
+    (1304, 'StrikeExerciseStyle', 'INT', ()),
+    (1305, 'SecondaryPriceLimitType', 'INT', ()),
+    (1306, 'PriceLimitType', 'INT', (('PRICE', 0), ('TICKS', 1), ('PERCENTAGE', 2),)),
+    (1307, 'DerivativeSecurityListRequestType', 'INT', (('SYMBOL', 0), ('SECURITYTYPE_AND_OR_CFICODE', 1), ('PRODUCT', 2), ('TRADINGSESSIONID', 3), ('ALL_SECURITIES', 4), ('UNDELYINGSYMBOL', 5), ('UNDERLYING_SECURITYTYPE_AND_OR_CFICODE', 6), ('UNDERLYING_PRODUCT', 7), ('MARKETID_OR_MARKETID_PLUS_MARKETSEGMENTID', 8),)),
+    (1308, 'ExecInstValue', 'CHAR', ()),
+    (1309, 'NoTradingSessionRules', 'NUMINGROUP', ()),
+    (1310, 'NoMarketSegments', 'NUMINGROUP', ()),
+    (1311, 'NoDerivativeInstrAttrib', 'NUMINGROUP', ()),
+    (1312, 'NoNestedInstrAttrib', 'NUMINGROUP', ()),
+    (1313, 'DerivativeInstrAttribType', 'INT', ()),
+    (1314, 'DerivativeInstrAttribValue', 'STRING', ()),
+    (1315, 'DerivativePriceUnitOfMeasure', 'STRING', ()),
+    (1316, 'DerivativePriceUnitOfMeasureQty', 'QTY', ()),
+    (1317, 'DerivativeSettlMethod', 'CHAR', ()),
+    (1318, 'DerivativePriceQuoteMethod', 'STRING', ()),
+    (1319, 'DerivativeFuturesValuationMethod', 'STRING', ()),
+    (1320, 'DerivativeListMethod', 'INT', ()),
+    (1321, 'DerivativeCapPrice', 'PRICE', ()),
+    (1322, 'DerivativeFloorPrice', 'PRICE', ()),
+    (1323, 'DerivativePutOrCall', 'INT', ()),
+    (1324, 'ListUpdateAction', 'CHAR', ()),
+    (1325, 'ParentMktSegmID', 'STRING', ()),
+    (1326, 'TradingSessionDesc', 'STRING', ()),
+    (1327, 'TradSesUpdateAction', 'CHAR', ()),
+    (1328, 'RejectText', 'STRING', ()),
+    (1329, 'FeeMultiplier', 'FLOAT', ()),
+    (1330, 'UnderlyingLegSymbol', 'STRING', ()),
+    (1331, 'UnderlyingLegSymbolSfx', 'STRING', ()),
+    (1332, 'UnderlyingLegSecurityID', 'STRING', ()),
+    (1333, 'UnderlyingLegSecurityIDSource', 'STRING', ()),
+    (1334, 'NoUnderlyingLegSecurityAltID', 'NUMINGROUP', ()),
+    (1335, 'UnderlyingLegSecurityAltID', 'STRING', ()),
+    (1336, 'UnderlyingLegSecurityAltIDSource', 'STRING', ()),
+    (1337, 'UnderlyingLegSecurityType', 'STRING', ()),
+    (1338, 'UnderlyingLegSecuritySubType', 'STRING', ()),
+    (1339, 'UnderlyingLegMaturityMonthYear', 'MONTHYEAR', ()),
+    (1340, 'UnderlyingLegStrikePrice', 'PRICE', ()),
+    (1341, 'UnderlyingLegSecurityExchange', 'STRING', ()),
+    (1342, 'NoOfLegUnderlyings', 'NUMINGROUP', ()),
+    (1343, 'UnderlyingLegPutOrCall', 'INT', ()),
+    (1344, 'UnderlyingLegCFICode', 'STRING', ()),
+    (1345, 'UnderlyingLegMaturityDate', 'LOCALMKTDATE', ()),
+    (1346, 'ApplReqID', 'STRING', ()),
+    (1347, 'ApplReqType', 'INT', (('RETRANSMISSION_OF_APPLICATION_MESSAGES_FOR_THE_SPECIFIED_APPLICATIONS', 0), ('SUBSCRIPTION_TO_THE_SPECIFIED_APPLICATIONS', 1), ('REQUEST_FOR_THE_LAST_APPLLASTSEQNUM_PUBLISHED_FOR_THE_SPECIFIED_APPLICATIONS', 2), ('REQUEST_VALID_SET_OF_APPLICATIONS', 3), ('UNSUBSCRIBE_TO_THE_SPECIFIED_APPLICATIONS', 4),)),
+    (1348, 'ApplResponseType', 'INT', (('REQUEST_SUCCESSFULLY_PROCESSED', 0), ('APPLICATION_DOES_NOT_EXIST', 1), ('MESSAGES_NOT_AVAILABLE', 2),)),
+    (1349, 'ApplTotalMessageCount', 'INT', ()),
+    (1350, 'ApplLastSeqNum', 'SEQNUM', ()),
+    (1351, 'NoApplIDs', 'NUMINGROUP', ()),
+    (1352, 'ApplResendFlag', 'BOOLEAN', ()),
+    (1353, 'ApplResponseID', 'STRING', ()),
+    (1354, 'ApplResponseError', 'INT', (('APPLICATION_DOES_NOT_EXIST', 0), ('MESSAGES_REQUESTED_ARE_NOT_AVAILABLE', 1), ('USER_NOT_AUTHORIZED_FOR_APPLICATION', 2),)),
+    (1355, 'RefApplID', 'STRING', ()),
+    (1356, 'ApplReportID', 'STRING', ()),
+    (1357, 'RefApplLastSeqNum', 'SEQNUM', ()),
+    (1358, 'LegPutOrCall', 'INT', ()),
+    (1359, 'EncodedSymbolLen', 'LENGTH', ()),
+    (1360, 'EncodedSymbol', 'DATA', ()),
+    (1361, 'TotNoFills', 'INT', ()),
+    (1362, 'NoFills', 'NUMINGROUP', ()),
+    (1363, 'FillExecID', 'STRING', ()),
+    (1364, 'FillPx', 'PRICE', ()),
+    (1365, 'FillQty', 'QTY', ()),
+    (1366, 'LegAllocID', 'STRING', ()),
+    (1367, 'LegAllocSettlCurrency', 'CURRENCY', ()),
+    (1368, 'TradSesEvent', 'INT', (('TRADING_RESUMES', 0), ('CHANGE_OF_TRADING_SESSION', 1), ('CHANGE_OF_TRADING_SUBSESSION', 2), ('CHANGE_OF_TRADING_STATUS', 3),)),
+    (1369, 'MassActionReportID', 'STRING', ()),
+    (1370, 'NoNotAffectedOrders', 'NUMINGROUP', ()),
+    (1371, 'NotAffectedOrderID', 'STRING', ()),
+    (1372, 'NotAffOrigClOrdID', 'STRING', ()),
+    (1373, 'MassActionType', 'INT', (('SUSPEND_ORDERS', 1), ('RELEASE_ORDERS_FROM_SUSPENSION', 2), ('CANCEL_ORDERS', 3),)),
+    (1374, 'MassActionScope', 'INT', (('ALL_ORDERS_FOR_A_SECURITY', 1), ('ALL_ORDERS_FOR_AN_UNDERLYING_SECURITY', 2), ('ALL_ORDERS_FOR_A_PRODUCT', 3), ('ALL_ORDERS_FOR_A_CFICODE', 4), ('ALL_ORDERS_FOR_A_SECURITYTYPE', 5), ('ALL_ORDERS_FOR_A_TRADING_SESSION', 6), ('ALL_ORDERS', 7), ('ALL_ORDERS_FOR_A_MARKET', 8), ('ALL_ORDERS_FOR_A_MARKET_SEGMENT', 9), ('ALL_ORDERS_FOR_A_SECURITY_GROUP', 10),)),
+    (1375, 'MassActionResponse', 'INT', (('REJECTED', 0), ('ACCEPTED', 1),)),
+    (1376, 'MassActionRejectReason', 'INT', (('MASS_ACTION_NOT_SUPPORTED', 0), ('INVALID_OR_UNKNOWN_SECURITY', 1), ('INVALID_OR_UNKNOWN_UNDERLYING_SECURITY', 2), ('INVALID_OR_UNKNOWN_PRODUCT', 3), ('INVALID_OR_UNKNOWN_CFICODE', 4), ('INVALID_OR_UNKNOWN_SECURITYTYPE', 5), ('INVALID_OR_UNKNOWN_TRADING_SESSION', 6), ('INVALID_OR_UNKNOWN_MARKET', 7), ('INVALID_OR_UNKNOWN_MARKET_SEGMENT', 8), ('INVALID_OR_UNKNOWN_SECURITY_GROUP', 9), ('OTHER', 99),)),
+    (1377, 'MultilegModel', 'INT', (('PREDEFINED_MULTILEG_SECURITY', 0), ('USER_DEFINED_MULTLEG_SECURITY', 1), ('USER_DEFINED_NON_SECURITIZED_MULTILEG', 2),)),
+    (1378, 'MultilegPriceMethod', 'INT', (('NET_PRICE', 0), ('REVERSED_NET_PRICE', 1), ('YIELD_DIFFERENCE', 2), ('INDIVIDUAL', 3), ('CONTRACT_WEIGHTED_AVERAGE_PRICE', 4), ('MULTIPLIED_PRICE', 5),)),
+    (1379, 'LegVolatility', 'FLOAT', ()),
+    (1380, 'DividendYield', 'PERCENTAGE', ()),
+    (1381, 'LegDividendYield', 'PERCENTAGE', ()),
+    (1382, 'CurrencyRatio', 'FLOAT', ()),
+    (1383, 'LegCurrencyRatio', 'FLOAT', ()),
+    (1384, 'LegExecInst', 'MULTIPLECHARVALUE', ()),
+    (1385, 'ContingencyType', 'INT', (('ONE_CANCELS_THE_OTHER', 1), ('ONE_TRIGGERS_THE_OTHER', 2), ('ONE_UPDATES_THE_OTHER_3', 3), ('ONE_UPDATES_THE_OTHER_4', 4),)),
+    (1386, 'ListRejectReason', 'INT', (('BROKER', 0), ('EXCHANGE_CLOSED', 2), ('TOO_LATE_TO_ENTER', 4), ('UNKNOWN_ORDER', 5), ('DUPLICATE_ORDER', 6), ('UNSUPPORTED_ORDER_CHARACTERISTIC', 11), ('OTHER', 99),)),
+    (1387, 'NoTrdRepIndicators', 'NUMINGROUP', ()),
+    (1388, 'TrdRepPartyRole', 'INT', ()),
+    (1389, 'TrdRepIndicator', 'BOOLEAN', ()),
+    (1390, 'TradePublishIndicator', 'INT', (('DO_NOT_PUBLISH_TRADE', 0), ('PUBLISH_TRADE', 1), ('DEFERRED_PUBLICATION', 2),)),
+    (1391, 'UnderlyingLegOptAttribute', 'CHAR', ()),
+    (1392, 'UnderlyingLegSecurityDesc', 'STRING', ()),
+    (1393, 'MarketReqID', 'STRING', ()),
+    (1394, 'MarketReportID', 'STRING', ()),
+    (1395, 'MarketUpdateAction', 'CHAR', (('ADD', 'A'), ('DELETE', 'D'), ('MODIFY', 'M'),)),
+    (1396, 'MarketSegmentDesc', 'STRING', ()),
+    (1397, 'EncodedMktSegmDescLen', 'LENGTH', ()),
+    (1398, 'EncodedMktSegmDesc', 'DATA', ()),
+    (1399, 'ApplNewSeqNum', 'SEQNUM', ()),
+    (1400, 'EncryptedPasswordMethod', 'INT', ()),
+    (1401, 'EncryptedPasswordLen', 'LENGTH', ()),
+    (1402, 'EncryptedPassword', 'DATA', ()),
+    (1403, 'EncryptedNewPasswordLen', 'LENGTH', ()),
+    (1404, 'EncryptedNewPassword', 'DATA', ()),
+    (1405, 'UnderlyingLegMaturityTime', 'TZTIMEONLY', ()),
+    (1406, 'RefApplExtID', 'INT', ()),
+    (1407, 'DefaultApplExtID', 'INT', ()),
+    (1408, 'DefaultCstmApplVerID', 'STRING', ()),
+    (1409, 'SessionStatus', 'INT', (('SESSION_ACTIVE', 0), ('SESSION_PASSWORD_CHANGED', 1), ('SESSION_PASSWORD_DUE_TO_EXPIRE', 2), ('NEW_SESSION_PASSWORD_DOES_NOT_COMPLY_WITH_POLICY', 3), ('SESSION_LOGOUT_COMPLETE', 4), ('INVALID_USERNAME_OR_PASSWORD', 5), ('ACCOUNT_LOCKED', 6), ('LOGONS_ARE_NOT_ALLOWED_AT_THIS_TIME', 7), ('PASSWORD_EXPIRED', 8),)),
+    (1410, 'DefaultVerIndicator', 'BOOLEAN', ()),
+    (1411, 'Nested4PartySubIDType', 'INT', ()),
+    (1412, 'Nested4PartySubID', 'STRING', ()),
+    (1413, 'NoNested4PartySubIDs', 'NUMINGROUP', ()),
+    (1414, 'NoNested4PartyIDs', 'NUMINGROUP', ()),
+    (1415, 'Nested4PartyID', 'STRING', ()),
+    (1416, 'Nested4PartyIDSource', 'CHAR', ()),
+    (1417, 'Nested4PartyRole', 'INT', ()),
+    (1418, 'LegLastQty', 'QTY', ()),
+    (1419, 'UnderlyingExerciseStyle', 'INT', ()),
+    (1420, 'LegExerciseStyle', 'INT', ()),
+    (1421, 'LegPriceUnitOfMeasure', 'STRING', ()),
+    (1422, 'LegPriceUnitOfMeasureQty', 'QTY', ()),
+    (1423, 'UnderlyingUnitOfMeasureQty', 'QTY', ()),
+    (1424, 'UnderlyingPriceUnitOfMeasure', 'STRING', ()),
+    (1425, 'UnderlyingPriceUnitOfMeasureQty', 'QTY', ()),
+    (1426, 'ApplReportType', 'INT', (('RESET_APPLSEQNUM_TO_NEW_VALUE_SPECIFIED_IN_APPLNEWSEQNUM', 0), ('REPORTS_THAT_THE_LAST_MESSAGE_HAS_BEEN_SENT_FOR_THE_APPLIDS_REFER_TO_REFAPPLLASTSEQNUM', 1), ('HEARTBEAT_MESSAGE_INDICATING_THAT_APPLICATION_IDENTIFIED_BY_REFAPPLID', 2),)),
+))
@@ -19,39 +19,105 @@
 #
 # --------------------------------------------------------------------------------------------
 import atexit
+import contextlib
+import functools
 import hashlib
+import heapq
+import itertools
 import logging
-import os
 import threading
 import time
-from typing import Optional
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, Dict, Iterable, Sequence, Union
 
 import zmq
+from zmq.utils.monitor import recv_monitor_message
 
 from UPA.consts import *
+from UPA.capture import CaptureReader, CaptureWriter
+from UPA.dispatcher import ShardedDispatcher, SubscriberDispatcher
 from UPA.message import *
+from UPA.metrics import Metrics, MetricsServer
+from UPA.requestpool import RequestPool
+from UPA.tracing import tracer, traced
+
+_NO_LOCK = contextlib.nullcontext()
+
+
+# unbinds socket and waits until its listener is closed, so that the endpoint may be bound again
+# as soon as the socket owner is stopped; zmq closes listeners asynchronously otherwise (protected)
+def _unbind(sock: zmq.Socket, timeout_ms: int = 1000) -> None:
+    endpoint = sock.get(zmq.LAST_ENDPOINT)
+    if not endpoint or endpoint.startswith(b"inproc://"):
+        return
+    monitor = sock.get_monitor_socket(zmq.EVENT_CLOSED)
+    try:
+        sock.unbind(endpoint)
+        while monitor.poll(timeout_ms) and recv_monitor_message(monitor)["endpoint"] != endpoint:
+            pass
+    finally:
+        sock.disable_monitor()
+        monitor.close(linger=0)
+
+
+# runs responder handlers in a worker thread or process, the last handler's response is replied (protected)
+def _respond(handlers: Sequence[Callable[[Message], Message]], wms: bytes) -> bytes:
+    wm = WireMessage()
+    wm.ParseFromString(wms)
+    rep: Optional[Message] = None
+    for f in handlers:
+        rep = f(Message(wm))
+    return rep.wire_message.SerializeToString()
+
+
+class _Session:
+    """Session token state of a client, prepares requests and processes responses for UFEedClient,
+    its RequestPools and AsyncUFEedClient (protected)"""
+    def __init__(self):
+        self.id: Optional[uuid.UUID] = None
+        self.field: bytes = b""  # serialized session token field appended to requests
+
+    # sets session id and its pre-serialized token field
+    def set_id(self, session_id: Optional[uuid.UUID]) -> None:
+        self.id = session_id
+        self.field = b"" if session_id is None else \
+            Message.Builder().add_field(UFE_SESSION_TOKEN, session_id, Location.fl_system).serialize()
+
+    # serializes request and appends session token if necessary, throws if no session token and not login attempt.
+    # A serialized WireMessage followed by a serialized fields entry parses as the message with the field appended,
+    # so the caller's builder is not modified
+    def prepare_request(self, msg: Message.Builder) -> bytes:
+        # have we already logged in? or logging out?
+        if self.id or msg.service_id == UFE_CMD_LOGOUT:
+            return msg.serialize() + self.field
 
-if not os.path.isfile('upa.log'):
-    upa_logging = False
-else:
-    upa_logging = True
-    logging.basicConfig(filename='upa.log',
-                        format='%(asctime)s.%(msecs)03d %(message)s',
-                        datefmt='%Y-%m-%d %H:%M:%S',
-                        level=logging.INFO)
+        # well ok, is this a login attempt?
+        elif msg.service_id == UFE_CMD_LOGIN:
+            # wm = self.__hash_password(wm)
+            return msg.serialize()
 
+        # neither?
+        else:
+            raise LookupError('No session token found - you must log on before making a request.')
 
-def log(func):
-    if not upa_logging:
-        return func
+    # updates session state from login/logout responses and calls REQ handlers with the response
+    def process_response(self, msg: Message.Builder, wm: WireMessage, req_handlers: Iterable[Callable[[Message], None]]) -> Message:
+        if msg.service_id == UFE_CMD_LOGIN:
+            session_field = [field for field in wm.fields if field.tag == UFE_SESSION_TOKEN]
+            if session_field:
+                self.set_id(uuid.UUID(bytes=session_field[0].sval))
 
-    def function_wrapper(*args, **kwargs):
-        logging.info(f"{func} START")
-        res = func(*args, **kwargs)
-        logging.info(f"{func} END")
-        return res
+        elif msg.service_id == UFE_CMD_LOGOUT:
+            logged_off = [field for field in wm.fields if field.tag == UFE_RESPONSE_CODE]
+            if logged_off and logged_off[0].ival == LOGOFF_SUCCESSFUL:
+                self.set_id(None)
 
-    return function_wrapper
+        # send REP WireMessage to REQ handler function
+        rep = Message(wm)
+        for f in req_handlers:
+            f(rep)
+        return rep
 
 
 class UFEedClient:
@@ -66,27 +132,55 @@ class UFEedClient:
     """
 
     # prepares connection strings, sockets and session_id
-    @log
-    def __init__(self, connection_string_dict=None):
+    # request_timeout is the default number of seconds to wait for a response, None waits forever
+    # echo_seq tells that the peer echoes request seq in responses, so that request_async() may pipeline requests
+    @traced
+    def __init__(self, connection_string_dict=None, request_timeout: Optional[float] = None, echo_seq: bool = False):
         if connection_string_dict is None:
             connection_string_dict = {}
         self.__cs = self.__set_connection_strings(connection_string_dict)
+        self.__pub_topic: bytes = self.__cs[PUBLISHER_TOPIC].encode()
         self.__context = zmq.Context()
         self.__req_socket = self.__context.socket(zmq.REQ)
         self.__pub_socket = self.__context.socket(zmq.PUB)
-        self.__stop_threads = False
-        self.__stop_responder_thread = False
-        self.__sub_thread: threading.Thread = threading.Thread()
+        self.__worker_seq = itertools.count()
+        self.__sub_thread: Optional[threading.Thread] = None
+        self.__sub_wake: Optional[zmq.Socket] = None  # wakes SUB thread up to stop
         self.__rep_thread: Optional[threading.Thread] = None
-        self.__session_id = None  # session id
+        self.__rep_wake: Optional[zmq.Socket] = None  # wakes REP thread up to stop
+        self.__dealer_thread: Optional[threading.Thread] = None
+        self.__dealer_push: Optional[zmq.Socket] = None
+        self.__dealer_lock = threading.Lock()
+        self.__dealer_seq = itertools.count(1)
+        self.__dealer_pending: OrderedDict = OrderedDict()  # seq -> (Future, Message.Builder, start ns)
+        self.__dealer_deadlines: List[tuple] = []  # heap of (deadline, seq)
+        self.request_timeout: Optional[float] = request_timeout
+        self.__echo_seq = echo_seq
+        self.__session = _Session()
+        self.__request_pools: List[RequestPool] = []
         self.started = False
         self.sub_handlers: List[Callable[[Message], None]] = []  # prepare handler functions
+        self.__sub_filters: Dict[Callable[[Message], None], WireHeader.Filter] = {}
+        self.__sub_dispatcher: Optional[Union[SubscriberDispatcher, ShardedDispatcher]] = None
         self.req_handlers: List[Callable[[Message], None]] = []
         self.rep_handlers: List[Callable[[Message], Message]] = []
+        self.__rep_workers = 0  # responder pool size, 0 serves requests on a REP socket one at a time
+        self.__rep_processes = False
+        self.__metrics = Metrics()
+        self.__metrics.gauges["requests_in_flight"] = lambda: len(self.__dealer_pending)
+        self.__metrics.gauges["dispatcher_queue_depth"] = \
+            lambda: sum(self.__sub_dispatcher.stats().get("queue_depth", ())) if self.__sub_dispatcher is not None else 0
+        self.__metrics_server: Optional[MetricsServer] = None
+        self.__capture: Optional[CaptureWriter] = None  # records received broadcasts
+        self.__capture_lock = threading.Lock()
+        # serializes dispatching of SUB thread batches and replayed broadcasts, never held while handlers run inline
+        self.__broadcast_lock = threading.Lock()
+        self.__dispatcher_lock = threading.Lock()  # guards dispatcher swap
+        self.__retired_dispatchers: List[Union[SubscriberDispatcher, ShardedDispatcher]] = []  # replaced, to shut down
 
         atexit.register(self.__cleanup)
 
-    @log
+    @traced
     def __str__(self):
         """When cast to a str object, UFEedClient serialises its connection string details.
         
@@ -96,66 +190,70 @@ class UFEedClient:
         return ",".join(("{}={}".format(*i) for i in self.__cs.items()))
 
     # destructor, logs out, cleans up session id, shuts down threads
-    @log
+    @traced
     def __cleanup(self, do_not_send_logout = False) -> None:
         if self.started:
-            if not do_not_send_logout and self.__session_id:
+            if not do_not_send_logout and self.__session.id:
                 logout = self.create_message() \
                     .set_long_name("logout") \
                     .set_type(MsgType.st_system) \
                     .set_service_id(UFE_CMD_LOGOUT) \
                     .add_field(UFE_CMD, Message.Status(UFE_CMD_LOGOUT))
                 self.request(logout)
+            self.__stop_dealer()
+            for pool in self.__request_pools:
+                pool.close()
+            self.__request_pools.clear()
             self.__close_all_sockets()
-        self.__session_id = None
-        self.__stop_threads = True
-        self.__stop_responder_thread = True
-        self.__sub_thread.join(1)
-        if self.__rep_thread:
-            self.__rep_thread.join()
-
-    # repurposes existing REQ and PUB sockets to flush REP and SUBs on threads
-    # after this function is called, REQ, REP, PUB and SUB sockets are all closed
-    # (protected)
-    @log
+        self.__session.set_id(None)
+        self.__stop_worker(self.__sub_thread, self.__sub_wake)
+        self.__sub_thread, self.__sub_wake = None, None
+        self.__stop_worker(self.__rep_thread, self.__rep_wake)
+        self.__rep_thread, self.__rep_wake = None, None
+        self.__shutdown_retired_dispatchers()
+        if self.__sub_dispatcher is not None:
+            self.__sub_dispatcher.shutdown()
+            self.__sub_dispatcher = None
+        if self.__metrics_server is not None:
+            self.__metrics_server.close()
+            self.__metrics_server = None
+        self.stop_capture()
+
+    # closes REQ and PUB sockets, REP and SUB sockets are closed by their threads (protected)
+    @traced
     def __close_all_sockets(self) -> None:
-        print("closing sockets...")
-
-        if self.__req_socket is None and self.__pub_socket is None:
-            print("sockets already closed...")
+        if self.__req_socket is not None:
+            self.__req_socket.close(linger=0)
+            self.__req_socket = None
+        if self.__pub_socket is not None:
+            _unbind(self.__pub_socket)
+            self.__pub_socket.close()
+            self.__pub_socket = None
+
+    # starts worker thread with an inproc control socket it polls along with its own sockets,
+    # returns the thread and the socket that wakes the thread up to stop (protected)
+    @traced
+    def __start_worker(self, target: Callable[[zmq.Socket], None]) -> (threading.Thread, zmq.Socket):
+        address = f"inproc://ufeedclient-control-{id(self)}-{next(self.__worker_seq)}"
+        control_socket = self.__context.socket(zmq.PULL)
+        control_socket.bind(address)
+        wake_socket = self.__context.socket(zmq.PUSH)
+        wake_socket.connect(address)
+        thread = threading.Thread(target=target, args=(control_socket,), daemon=True)
+        thread.start()
+        return thread, wake_socket
+
+    # wakes worker thread up via its control socket and waits for it to finish (protected)
+    @traced
+    def __stop_worker(self, thread: Optional[threading.Thread], wake_socket: Optional[zmq.Socket]) -> None:
+        if thread is None:
             return
-
-        pub_endpoint = self.__pub_socket.get(zmq.LAST_ENDPOINT)
-        self.__pub_socket.unbind(pub_endpoint)
-        sub_loopback_port = self.__cs[SUBSCRIBER].split(':')[2]
-        sub_loopback_address = f"tcp://127.0.0.1:{sub_loopback_port}"
-
-        req_endpoint = self.__req_socket.get(zmq.LAST_ENDPOINT)
-        self.__req_socket.unbind(req_endpoint)
-        rep_loopback_port = self.__cs[RESPONDER].split(':')[2]
-        rep_loopback_address = f"tcp://127.0.0.1:{rep_loopback_port}"
-
-        # give sockets time to unbind
-        time.sleep(1)
-
-        self.__pub_socket.connect(sub_loopback_address)
-        self.__req_socket.connect(rep_loopback_address)
-
-        # give sockets time to connect
-        time.sleep(1)
-
-        self.__req_socket.send("".encode(), zmq.SNDMORE)
-        self.__req_socket.send("".encode())
-        self.__pub_socket.send(self.__cs[SUBSCRIBER_TOPIC].encode(), zmq.SNDMORE)  # TODO:
-        self.__pub_socket.send("".encode())
-
-        self.__req_socket.close()
-        self.__pub_socket.close()
-        self.__req_socket = None
-        self.__pub_socket = None
+        wake_socket.send(b"")
+        thread.join()
+        wake_socket.close()
 
     # prepares dictionary of connection strings (protected)
-    @log
+    @traced
     def __set_connection_strings(self, d: {str, str}) -> {str, str}:
         conn_strs = {}
         conn_strs[SUBSCRIBER] = d.get(SUBSCRIBER, SUBSCRIBER_DEFAULT)
@@ -168,28 +266,250 @@ class UFEedClient:
         conn_strs[RESPONDER_TOPIC] = d.get(RESPONDER_TOPIC, RESPONDER_TOPIC_DEFAULT)
         return conn_strs
 
-    # WireMessage submitted for REQ/REP, returns resultant WireMessage (protected)
-    @log
-    def __request_response(self, wm: WireMessage) -> WireMessage:
-        wms = wm.SerializeToString()
-        self.__req_socket.send(self.__cs[REQUESTER_TOPIC].encode(), zmq.SNDMORE)
-        self.__req_socket.send(wms)
-        response = self.__req_socket.recv_multipart()[1]
+    # serialized WireMessage submitted for REQ/REP, returns resultant WireMessage,
+    # resets REQ socket and throws TimeoutError if there is no response within timeout seconds (protected)
+    @traced
+    def __request_response(self, wms: bytes, timeout: Optional[float] = None) -> WireMessage:
+        metrics = self.__metrics
+        with tracer.span("UFEedClient.request.round_trip"):
+            start = time.perf_counter_ns()
+            self.__req_socket.send(self.__cs[REQUESTER_TOPIC].encode(), zmq.SNDMORE)
+            self.__req_socket.send(wms)
+            metrics.requests_sent += 1
+            metrics.bytes_out += len(wms)
+            if timeout is not None and not self.__req_socket.poll(max(0, int(timeout * 1000)), zmq.POLLIN):
+                metrics.request_errors += 1
+                self.__reset_req_socket()
+                raise TimeoutError(f"no response within {timeout}s")
+            response = self.__req_socket.recv_multipart()[1]
+            metrics.request_rtt_ns.record(time.perf_counter_ns() - start)
+        metrics.replies_received += 1
+        metrics.bytes_in += len(response)
         wm_r = WireMessage()
         wm_r.ParseFromString(response)
         return wm_r
 
+    # replaces REQ socket stuck waiting for a response with a new connected one, a late response to the
+    # abandoned request is discarded together with the old socket (protected)
+    @traced
+    def __reset_req_socket(self) -> None:
+        self.__req_socket.close(linger=0)
+        self.__req_socket = self.__context.socket(zmq.REQ)
+        self.__req_socket.connect(self.__cs[REQUESTER])
+
+    # starts pipelined DEALER requester thread on first use, every thread gets its own pending requests (protected)
+    @traced
+    def __start_dealer(self) -> None:
+        address = f"inproc://ufeedclient-dealer-{id(self)}-{next(self.__worker_seq)}"
+        pull_socket = self.__context.socket(zmq.PULL)
+        pull_socket.bind(address)
+        self.__dealer_push = self.__context.socket(zmq.PUSH)
+        self.__dealer_push.connect(address)
+        self.__dealer_pending = OrderedDict()
+        self.__dealer_deadlines = []
+        self.__dealer_thread = threading.Thread(target=self.__poll_dealer, daemon=True,
+                                                args=(pull_socket, self.__dealer_pending, self.__dealer_deadlines))
+        self.__dealer_thread.start()
+
+    # stops pipelined DEALER requester thread, the thread fails its outstanding requests (protected)
+    @traced
+    def __stop_dealer(self) -> None:
+        with self.__dealer_lock:
+            thread, push = self.__dealer_thread, self.__dealer_push
+            if thread is None:
+                return
+            self.__dealer_thread, self.__dealer_push = None, None
+            push.send(b"")  # single empty frame stops the DEALER thread
+        thread.join()
+        push.close()
+
+    # serialized WireMessage submitted for pipelined REQ/REP, returns Future of resultant Message (protected)
+    @traced
+    def __dealer_request(self, msg: Message.Builder, wms: bytes, timeout: Optional[float] = None) -> Future:
+        fut = Future()
+        with self.__dealer_lock:
+            if self.__dealer_thread is None:
+                self.__start_dealer()
+            seq = next(self.__dealer_seq) & 0xffffffff or next(self.__dealer_seq)  # seq is uint32, 0 means unset
+            self.__dealer_pending[seq] = (fut, msg, time.perf_counter_ns())
+            if timeout is not None:
+                heapq.heappush(self.__dealer_deadlines, (time.monotonic() + timeout, seq))
+            # appended seq overrides any seq already set in the message
+            push = self.__dealer_push
+            push.send_multipart((seq.to_bytes(4, "little"), self.__cs[REQUESTER_TOPIC].encode(),
+                                 wms + WireMessage(seq=seq).SerializeToString()))
+            self.__metrics.requests_sent += 1
+            self.__metrics.bytes_out += len(wms)
+        fut.add_done_callback(lambda f: f.cancelled() and self.__cancel_dealer_request(push, seq))
+        return fut
+
+    # tells DEALER thread that owns push socket to drop a cancelled request (protected)
+    def __cancel_dealer_request(self, push: zmq.Socket, seq: int) -> None:
+        with self.__dealer_lock:
+            if self.__dealer_push is push:
+                push.send(seq.to_bytes(4, "little"))
+
+    # fails and drops timed out pipelined requests, returns milliseconds until the next deadline or None and
+    # whether a timed out request was in flight (protected)
+    def __expire_dealer_requests(self, pending: OrderedDict, deadlines: List[tuple], in_flight: OrderedDict) \
+            -> (Optional[int], bool):
+        now = time.monotonic()
+        expired = []
+        with self.__dealer_lock:
+            while deadlines and deadlines[0][0] <= now:
+                seq = heapq.heappop(deadlines)[1]
+                entry = pending.pop(seq, None)
+                if entry is not None:
+                    expired.append((seq, entry[0]))
+            next_deadline = deadlines[0][0] if deadlines else None
+        for _, fut in expired:
+            if not fut.done() and fut.set_running_or_notify_cancel():
+                self.__metrics.request_errors += 1
+                fut.set_exception(TimeoutError("no response within request timeout"))
+        return None if next_deadline is None else max(1, int((next_deadline - now) * 1000)), \
+            any(seq in in_flight for seq, _ in expired)
+
+    # DEALER socket gets popped out to separate thread, requests are forwarded from the inproc PULL socket.
+    # Responses are correlated by WireMessage.seq if the UFEGW echoes it, otherwise requests are sent one at a time
+    # and each response belongs to the single request in flight. When a request in flight times out, the DEALER
+    # or is cancelled, the DEALER socket is replaced and the other requests in flight are failed, as with the REQ
+    # socket in request(), so a lost response can neither hold pending requests forever nor be matched to a later
+    # request. The thread fails its outstanding requests when it stops, or if it dies; the next request then starts
+    # a new thread (protected)
+    @traced
+    def __poll_dealer(self, pull_socket: zmq.Socket, pending: OrderedDict, deadlines: List[tuple]) -> None:
+        def connect() -> zmq.Socket:
+            sock = self.__context.socket(zmq.DEALER)
+            sock.connect(self.__cs[REQUESTER])
+            poller.register(sock, zmq.POLLIN)
+            return sock
+
+        poller = zmq.Poller()
+        poller.register(pull_socket, zmq.POLLIN)
+        dealer_socket = connect()
+        queued = deque()  # (seq, frames) of requests waiting for the request in flight without echoed seq
+        in_flight: OrderedDict = OrderedDict()  # seqs of sent requests waiting for their responses
+        error: Exception = ConnectionAbortedError("UFEedClient stopped before response was received")
+
+        def send_queued():
+            while queued and (self.__echo_seq or not in_flight):
+                seq, frames = queued.popleft()
+                entry = pending.get(seq)  # dropped if it timed out or was cancelled before it was sent
+                if entry is not None:
+                    dealer_socket.send_multipart([b""] + frames)  # empty delimiter keeps REQ/REP peers compatible
+                    in_flight[seq] = None
+
+        try:
+            while True:
+                timeout_ms, reset = self.__expire_dealer_requests(pending, deadlines, in_flight)
+                if reset:
+                    self.__reset_dealer_socket(dealer_socket, poller, pending, in_flight)
+                    dealer_socket = connect()
+                    send_queued()
+                events = dict(poller.poll(timeout_ms))
+                if pull_socket in events:
+                    frames = pull_socket.recv_multipart()
+                    if frames == [b""]:
+                        break
+                    seq = int.from_bytes(frames[0], "little")
+                    if len(frames) > 1:
+                        queued.append((seq, frames[1:]))
+                    else:  # cancelled, its response is not awaited
+                        with self.__dealer_lock:
+                            pending.pop(seq, None)
+                        if seq in in_flight:
+                            self.__reset_dealer_socket(dealer_socket, poller, pending, in_flight)
+                            dealer_socket = connect()
+                if dealer_socket in events:
+                    self.__on_dealer_response(dealer_socket.recv_multipart()[-1], pending, in_flight)
+                send_queued()
+        except Exception as e:
+            logging.error("DEALER requester failed", exc_info=e)
+            error = ConnectionAbortedError(f"DEALER requester failed: {e}")
+        finally:
+            dealer_socket.close(linger=0)
+            pull_socket.close(linger=0)
+            with self.__dealer_lock:
+                if self.__dealer_thread is threading.current_thread():  # died, not stopped
+                    self.__dealer_push.close(linger=0)
+                    self.__dealer_thread, self.__dealer_push = None, None
+                outstanding = list(pending.values())
+                pending.clear()
+                deadlines.clear()
+            for fut, _, _ in outstanding:
+                if not fut.done() and fut.set_running_or_notify_cancel():
+                    fut.set_exception(error)
+
+    # closes DEALER socket with a timed out or cancelled request in flight and fails the other requests in flight,
+    # their responses are discarded together with the socket (protected)
+    def __reset_dealer_socket(self, dealer_socket: zmq.Socket, poller: zmq.Poller, pending: OrderedDict,
+                              in_flight: OrderedDict) -> None:
+        poller.unregister(dealer_socket)
+        dealer_socket.close(linger=0)
+        with self.__dealer_lock:
+            abandoned = [pending.pop(seq) for seq in in_flight if seq in pending]
+        in_flight.clear()
+        for fut, _, _ in abandoned:
+            if not fut.done() and fut.set_running_or_notify_cancel():
+                self.__metrics.request_errors += 1
+                fut.set_exception(ConnectionResetError("request abandoned by DEALER socket reset after a timeout"))
+
+    # resolves the request a DEALER response belongs to, responses that cannot be correlated are counted as
+    # request errors and discarded, a malformed response fails its request if it is known (protected)
+    def __on_dealer_response(self, response: bytes, pending: OrderedDict, in_flight: OrderedDict) -> None:
+        self.__metrics.replies_received += 1
+        self.__metrics.bytes_in += len(response)
+        wm_r = WireMessage()
+        parse_error: Optional[Exception] = None
+        try:
+            wm_r.ParseFromString(response)
+        except Exception as e:
+            parse_error = e
+        if self.__echo_seq:
+            seq = wm_r.seq if parse_error is None else None
+        else:
+            seq = next(iter(in_flight), None)
+        if seq not in in_flight:
+            self.__metrics.request_errors += 1
+            logging.error(f"discarded response matching no outstanding request: seq {wm_r.seq}, error {parse_error}")
+            return
+        del in_flight[seq]
+        with self.__dealer_lock:
+            entry = pending.pop(seq, None)
+        if entry is None:
+            return
+        fut, msg, start_ns = entry
+        rtt = time.perf_counter_ns() - start_ns
+        self.__metrics.request_rtt_ns.record(rtt)
+        tracer.record("UFEedClient.request_async.round_trip", rtt)
+        if fut.done() or not fut.set_running_or_notify_cancel():
+            return  # timed out or cancelled
+        if parse_error is not None:
+            self.__metrics.request_errors += 1
+            fut.set_exception(parse_error)
+            return
+        try:
+            res = self.__process_response(msg, wm_r)
+        except Exception as e:
+            fut.set_exception(e)
+        else:
+            fut.set_result(res)
+
     # responder socket gets popped out to separate thread but shares context with main thread (protected)
-    @log
-    def __poll_responder(self) -> None:
+    @traced
+    def __poll_responder(self, control_socket: zmq.Socket) -> None:
         rep_socket = self.__context.socket(zmq.REP)
         rep_socket.bind(self.__cs[RESPONDER])
+        poller = zmq.Poller()
+        poller.register(rep_socket, zmq.POLLIN)
+        poller.register(control_socket, zmq.POLLIN)
 
         while True:
-            msg = rep_socket.recv_multipart()
-            if self.__stop_responder_thread:
+            events = dict(poller.poll())
+            if control_socket in events:
                 break
-            elif msg[0].decode('utf-8') != self.__cs[RESPONDER_TOPIC]:
+            msg = rep_socket.recv_multipart()
+            if msg[0].decode('utf-8') != self.__cs[RESPONDER_TOPIC]:
                 sss = msg[0].decode('utf-8')
                 rep_socket.send("".encode(), zmq.SNDMORE)
                 rep_socket.send("TOPIC UNKNOWN".encode())
@@ -203,29 +523,145 @@ class UFEedClient:
                 rep_socket.send(self.__cs[RESPONDER_TOPIC].encode(), zmq.SNDMORE)
                 rep_socket.send(msg2.wire_message.SerializeToString())
 
-        rep_socket.close()
+        _unbind(rep_socket)
+        rep_socket.close(linger=0)
+        control_socket.close()
+
+    # ROUTER responder, requests are handled concurrently by a pool of workers and replies are routed back to the
+    # requesting peer by its envelope as soon as each worker finishes. Workers hand replies over to this thread
+    # through per thread inproc PUSH sockets, as only this thread may use the ROUTER socket (protected)
+    @traced
+    def __poll_router(self, control_socket: zmq.Socket) -> None:
+        router_socket = self.__context.socket(zmq.ROUTER)
+        router_socket.bind(self.__cs[RESPONDER])
+        address = f"inproc://ufeedclient-replies-{id(self)}-{next(self.__worker_seq)}"
+        reply_socket = self.__context.socket(zmq.PULL)
+        reply_socket.bind(address)
+        topic = self.__cs[RESPONDER_TOPIC].encode()
+        local = threading.local()
+        senders: List[zmq.Socket] = []
+        senders_lock = threading.Lock()
+
+        def send_reply(envelope: List[bytes], fut: Future) -> None:
+            if fut.cancelled():
+                return
+            try:
+                frames = envelope + [topic, fut.result()]
+            except Exception as e:
+                logging.error("responder handler failed", exc_info=e)
+                frames = envelope + [b"", b"HANDLER ERROR"]
+            sender = getattr(local, "socket", None)
+            if sender is None:
+                sender = local.socket = self.__context.socket(zmq.PUSH)
+                sender.connect(address)
+                with senders_lock:
+                    senders.append(sender)
+            sender.send_multipart(frames)
+
+        executor = (ProcessPoolExecutor if self.__rep_processes else ThreadPoolExecutor)(max_workers=self.__rep_workers)
+        poller = zmq.Poller()
+        poller.register(router_socket, zmq.POLLIN)
+        poller.register(reply_socket, zmq.POLLIN)
+        poller.register(control_socket, zmq.POLLIN)
 
-    # subscriber socket gets popped out to separate thread but shares context with main thread (protected)
-    @log
-    def __poll_subscriber(self):
+        while True:
+            events = dict(poller.poll())
+            if control_socket in events:
+                break
+            if reply_socket in events:
+                while True:
+                    try:
+                        router_socket.send_multipart(reply_socket.recv_multipart(zmq.NOBLOCK))
+                    except zmq.Again:
+                        break
+            if router_socket in events:
+                frames = router_socket.recv_multipart()
+                # envelope is peer identity up to the empty delimiter frame sent by REQ peers
+                split = frames.index(b"") + 1 if b"" in frames else 1
+                envelope, body = frames[:split], frames[split:]
+                if len(body) != 2 or body[0] != topic:
+                    router_socket.send_multipart(envelope + [b"", b"TOPIC UNKNOWN"])
+                    continue
+                executor.submit(_respond, tuple(self.rep_handlers), body[1]) \
+                    .add_done_callback(functools.partial(send_reply, envelope))
+
+        executor.shutdown(wait=True, cancel_futures=True)
+        for sender in senders:
+            sender.close(linger=0)
+        reply_socket.close(linger=0)
+        _unbind(router_socket)
+        router_socket.close(linger=0)
+        control_socket.close()
+
+    # subscriber socket gets popped out to separate thread but shares context with main thread,
+    # broadcasts available are drained in batches between control socket checks. The dispatcher is read once
+    # per batch, a batch handed to a dispatcher is dispatched under the broadcast lock (protected)
+    @traced
+    def __poll_subscriber(self, control_socket: zmq.Socket):
         sub_socket = self.__context.socket(zmq.SUB)
         sub_socket.setsockopt(zmq.SUBSCRIBE, self.__cs[SUBSCRIBER_TOPIC].encode())
         sub_socket.connect(self.__cs[SUBSCRIBER])
+        poller = zmq.Poller()
+        poller.register(sub_socket, zmq.POLLIN)
+        poller.register(control_socket, zmq.POLLIN)
+        on_broadcast = self.__on_broadcast
+        broadcast_lock = self.__broadcast_lock
 
         while True:
-            msg = sub_socket.recv_multipart()[1]
-            if self.__stop_threads:
+            events = dict(poller.poll())
+            if control_socket in events:
                 break
-            else:
-                wm = WireMessage()
-                wm.ParseFromString(msg)
-                for f in self.sub_handlers:
-                    f(self.create_message(wm).build())
-
-        sub_socket.close()
+            self.__shutdown_retired_dispatchers()
+            dispatcher = self.__sub_dispatcher
+            with broadcast_lock if dispatcher is not None else _NO_LOCK:
+                for _ in range(1000):
+                    try:
+                        msg = sub_socket.recv_multipart(zmq.NOBLOCK)[1]
+                    except zmq.Again:
+                        break
+                    if self.__capture is not None:
+                        with self.__capture_lock:
+                            if self.__capture is not None:
+                                self.__capture.append(msg)
+                    on_broadcast(msg, dispatcher)
+
+        sub_socket.close(linger=0)
+        control_socket.close()
+
+    # filters, parses and hands serialized broadcast to subscriber handlers or dispatcher (protected)
+    def __on_broadcast(self, msg: bytes, dispatcher: Optional[Union[SubscriberDispatcher, ShardedDispatcher]]) -> None:
+        metrics = self.__metrics
+        metrics.broadcasts_received += 1
+        metrics.bytes_in += len(msg)
+        handlers = self.sub_handlers
+        if self.__sub_filters:
+            # filter on header before the full parse
+            hdr = WireHeader.parse(msg)
+            handlers = [f for f in handlers if f not in self.__sub_filters or self.__sub_filters[f].matches(hdr)]
+            if not handlers:
+                metrics.broadcasts_filtered += 1
+                return
+        start = time.perf_counter_ns()
+        if isinstance(dispatcher, ShardedDispatcher):
+            # raw broadcast is parsed by the shard worker process
+            if not dispatcher.dispatch(handlers, msg):
+                metrics.broadcasts_dropped += 1
+            metrics.handler_ns.record(time.perf_counter_ns() - start)
+            return
+        wm = WireMessage()
+        wm.ParseFromString(msg)
+        parsed = time.perf_counter_ns()
+        metrics.parse_ns.record(parsed - start)
+        if dispatcher is not None:
+            if not dispatcher.dispatch(handlers, wm):
+                metrics.broadcasts_dropped += 1
+        else:
+            for f in handlers:
+                f(self.create_message(wm).build())
+        metrics.handler_ns.record(time.perf_counter_ns() - parsed)
 
     # password hashing function, currently unused (protected)
-    @log
+    @traced
     def __hash_password(self, wm):
         pw_field = [field for field in wm.fields if field.tag == UFE_LOGIN_PW][0]
         pw = pw_field.sval
@@ -237,11 +673,11 @@ class UFEedClient:
         return wm
 
     # default handler function (protected)
-    @log
+    @traced
     def __pass(self):
         pass
 
-    @log
+    @traced
     def create_message(self, wm: WireMessage = None) -> Message.Builder:
         """Factory function to create a SysMessage or FIXMessage.
         
@@ -253,65 +689,148 @@ class UFEedClient:
         """
         return Message.Builder(wm)
 
-    @log
+    @traced
     def publish(self, msg: Message.Builder):
         """Publishes Messages to UFEedClient subscribers.
         
         Args:
             msg (Message.Builder): Message to be published.
         """
-        self.__pub_socket.send(self.__cs[PUBLISHER_TOPIC].encode(), zmq.SNDMORE)
-        self.__pub_socket.send(msg.wire_message.SerializeToString())
+        wms = msg.serialize()
+        self.__pub_socket.send_multipart((self.__pub_topic, wms))
+        self.__metrics.messages_published += 1
+        self.__metrics.bytes_out += len(wms)
+
+    @traced
+    def publish_many(self, msgs: Iterable[Message.Builder]) -> int:
+        """Publishes a batch of Messages to UFEedClient subscribers. All messages are serialised first,
+        then sent back to back as multipart frames with the pre-encoded topic.
+
+        Args:
+            msgs (Iterable[Message.Builder]): Messages to be published.
+
+        Returns:
+            int: number of published messages
+        """
+        frames = [msg.serialize() for msg in msgs]
+        topic = self.__pub_topic
+        send_multipart = self.__pub_socket.send_multipart
+        for wms in frames:
+            send_multipart((topic, wms), copy=False)
+        self.__metrics.messages_published += len(frames)
+        self.__metrics.bytes_out += sum(map(len, frames))
+        return len(frames)
+
+    # serializes request and appends session token if necessary, throws if no session token and not login attempt
+    # (protected)
+    def __prepare_request(self, msg: Message.Builder) -> bytes:
+        return self.__session.prepare_request(msg)
+
+    # updates session state from login/logout responses and calls REQ handlers (protected)
+    @traced
+    def __process_response(self, msg: Message.Builder, wm: WireMessage) -> Message:
+        return self.__session.process_response(msg, wm, self.req_handlers)
 
     # handles REQ/REP, autopopulates session token if necessary, throws if no session token and not login attempt
-    @log
-    def request(self, msg: Message.Builder) -> Message:
+    @traced
+    def request(self, msg: Message.Builder, timeout: Optional[float] = None) -> Message:
         """Handles request/response loop for Messages sent to and received from the UFEGW.
         
         Args:
             msg (Message.Builder): Message to be sent via request.
+            timeout (float, optional): seconds to wait for the response, defaults to request_timeout.
         
         Raises:
             LookupError: If there is an attempt to make a request before a login session ID has been established
                          a LookupError will be thrown.
+            TimeoutError: If there is no response within timeout. The REQ socket is reset, so following requests
+                          are not affected by the abandoned one.
         
         Returns:
             Message: Message received via response.
         """
+        wm = self.__request_response(self.__prepare_request(msg), self.request_timeout if timeout is None else timeout)
+        return self.__process_response(msg, wm)
+
+    @traced
+    def request_async(self, msg: Message.Builder, timeout: Optional[float] = None) -> Future:
+        """Sends a pipelined request to the UFEGW without waiting for the response.
+        Requests are sent over a DEALER socket and stamped with a unique WireMessage seq. If the client was created
+        with echo_seq=True, any number of requests can be in flight at once and responses are correlated by seq,
+        responses without a matching seq are discarded and counted as request errors. Otherwise requests are sent
+        one at a time in submission order, as the UFEGW does not echo seq, and each response belongs to the
+        single request in flight. The future may be cancelled until its response arrives.
 
-        # have we already logged in?
-        if self.__session_id and msg.service_id != UFE_CMD_LOGOUT:
-            # avoid msg.add_fields() for speed - (could also hardcode location and type)
-            msg.add_field(UFE_SESSION_TOKEN, self.__session_id, Location.fl_system)
-            wm = self.__request_response(msg.wire_message)
+        Args:
+            msg (Message.Builder): Message to be sent via request.
+            timeout (float, optional): seconds from submission to wait for the response, defaults to request_timeout.
+                                       The future fails with TimeoutError when it elapses. A timed out or cancelled
+                                       request in flight resets the DEALER socket, other requests in flight then fail
+                                       with ConnectionResetError.
 
-        # well ok, is this a login attempt?
-        elif msg.service_id == UFE_CMD_LOGIN:
-            # wm = self.__hash_password(wm)
-            wm = self.__request_response(msg.wire_message)
-            session_field = [field for field in wm.fields if field.tag == UFE_SESSION_TOKEN]
-            if session_field:
-                self.__session_id = uuid.UUID(bytes=session_field[0].sval)
+        Raises:
+            LookupError: If there is an attempt to make a request before a login session ID has been established
+                         a LookupError will be thrown.
 
-        # logging out?
-        elif msg.service_id == UFE_CMD_LOGOUT:
-            msg.add_field(UFE_SESSION_TOKEN, self.__session_id, Location.fl_system)
-            wm = self.__request_response(msg.wire_message)
-            logged_off = [field for field in wm.fields if field.tag == UFE_RESPONSE_CODE]
-            if logged_off and logged_off[0].ival == LOGOFF_SUCCESSFUL:
-                self.__session_id = None
+        Returns:
+            Future: future resolved with the Message received via response.
+        """
+        return self.__dealer_request(msg, self.__prepare_request(msg), self.request_timeout if timeout is None else timeout)
 
-        # neither?
-        else:
-            raise LookupError('No session token found - you must log on before making a request.')
+    def stats(self, reset: bool = False) -> Dict[str, object]:
+        """Returns snapshot of client counters, gauges and latency histograms.
 
-        # send REP WireMessage to REQ handler function
-        msg = self.create_message(wm).build()
-        for f in self.req_handlers:
-            f(msg)
-        return msg
+        Args:
+            reset (bool): reset counters and histograms after taking the snapshot
 
-    @log
+        Returns:
+            dict: counters (requests_sent, replies_received, request_errors, broadcasts_received,
+                  broadcasts_filtered, broadcasts_dropped, messages_published, bytes_in, bytes_out),
+                  gauges (requests_in_flight, dispatcher_queue_depth) and histograms in nanoseconds
+                  (request_rtt_ns, parse_ns, handler_ns) with count, sum, min, mean, p50, p90, p99, p999, max
+        """
+        snapshot = self.__metrics.snapshot()
+        if reset:
+            self.__metrics.reset()
+        return snapshot
+
+    @traced
+    def start_metrics_server(self, port: int = 0, host: str = "127.0.0.1") -> MetricsServer:
+        """Starts local HTTP endpoint serving stats() in Prometheus text format. It is stopped by stop().
+
+        Args:
+            port (int): TCP port, 0 picks a free one, see MetricsServer.port
+            host (str): interface to listen on, local only by default
+
+        Returns:
+            MetricsServer: started server
+        """
+        if self.__metrics_server is None:
+            self.__metrics_server = MetricsServer(self.__metrics.prometheus, port, host)
+        return self.__metrics_server
+
+    @traced
+    def create_request_pool(self, size: int) -> RequestPool:
+        """Creates a thread-safe pool of REQ sockets that share this client's zmq.Context and session token.
+        Threads calling RequestPool.request() run their requests concurrently over free sockets, responses are
+        processed as by request() and recorded into stats(). The pool is closed when the client stops.
+
+        Args:
+            size (int): number of REQ sockets in the pool.
+
+        Returns:
+            RequestPool: request pool, see RequestPool.stats() for pool metrics. It may be closed before.
+        """
+        def connect() -> zmq.Socket:
+            sock = self.__context.socket(zmq.REQ)
+            sock.connect(self.__cs[REQUESTER])
+            return sock
+        pool = RequestPool(size, connect, self.__cs[REQUESTER_TOPIC].encode(), self.__prepare_request,
+                           self.__process_response, self.request_timeout, self.__metrics)
+        self.__request_pools = [p for p in self.__request_pools if not p.closed] + [pool]
+        return pool
+
+    @traced
     def start(self, sub_func, req_func, rep_func=None):
         """The start() function must be invoked in order for the UFEedClient to begin interaction with the UFEGW.
 
@@ -326,47 +845,173 @@ class UFEedClient:
             self.add_rep_handler(rep_func)
         self.__req_socket.connect(self.__cs[REQUESTER])  # start REQ
         self.__pub_socket.bind(self.__cs[PUBLISHER])  # start PUB
-        self.__sub_thread = threading.Thread(target=self.__poll_subscriber, daemon=True)  # SUB in daemon thread
-        self.__sub_thread.start()
+        self.__sub_thread, self.__sub_wake = self.__start_worker(self.__poll_subscriber)  # SUB in daemon thread
         self.started = True
 
-    @log
+    @traced
     def stop(self, do_not_send_logout = False) -> None:
         """ Stops UFEedClient and cleans up taken resources: sockets, threads, etc """
         self.__cleanup(do_not_send_logout)
         self.started = False
 
-    @log
+    @traced
     def __del__(self):
         self.stop()
 
-    @log
-    def add_sub_handler(self, sub_func: Callable[[Message], None]):
+    @traced
+    def add_sub_handler(self, sub_func: Callable[[Message], None], name=None, long_name=None, service_id=None,
+                        sub_service_id=None, msg_type=None):
+        """Adds subscriber Message handling function. Optional filters are checked against the broadcast header
+        before it is parsed, so broadcasts no handler is interested in are dropped cheaply.
+
+        Args:
+            sub_func (def()): The subscriber Message handling function.
+            name (str or collection of str, optional): accepted message names
+            long_name (str or collection of str, optional): accepted message long names
+            service_id (int or collection of int, optional): accepted service ids
+            sub_service_id (int or collection of int, optional): accepted subservice ids
+            msg_type (int or collection of int, optional): accepted MsgType values
+        """
+        flt = WireHeader.Filter(name, long_name, service_id, sub_service_id, msg_type)
+        if flt:
+            self.__sub_filters[sub_func] = flt
         self.sub_handlers.append(sub_func)
 
-    @log
+    @traced
+    def set_sub_dispatcher(self, dispatcher: Optional[Union[SubscriberDispatcher, ShardedDispatcher]]):
+        """Hands received broadcasts to a worker pool instead of running subscriber handlers on the subscriber thread.
+        A ShardedDispatcher is handed the broadcasts unparsed, so that parsing is done by its worker processes.
+        The client takes ownership of the dispatcher and shuts it down on stop(). May be called from subscriber
+        handlers. A replaced dispatcher is shut down, after its queued broadcasts are handled, once no broadcast is
+        being dispatched to it: right away if the client is not started, otherwise by the subscriber thread before
+        its next batch of broadcasts, or on stop().
+
+        Args:
+            dispatcher (SubscriberDispatcher or ShardedDispatcher): dispatcher to use, None to run handlers inline again
+        """
+        with self.__dispatcher_lock:
+            previous, self.__sub_dispatcher = self.__sub_dispatcher, dispatcher
+            if previous is not None and previous is not dispatcher:
+                self.__retired_dispatchers.append(previous)
+        if self.__sub_thread is None:
+            self.__shutdown_retired_dispatchers(blocking=False)  # a replay may be dispatching to it
+
+    # shuts down dispatchers replaced by set_sub_dispatcher(), taking the broadcast lock once ensures that no
+    # SUB thread batch or replayed broadcast is still dispatched to them (protected)
+    def __shutdown_retired_dispatchers(self, blocking: bool = True) -> None:
+        if not self.__retired_dispatchers or not self.__broadcast_lock.acquire(blocking):
+            return
+        with self.__dispatcher_lock:
+            retired, self.__retired_dispatchers = self.__retired_dispatchers, []
+        self.__broadcast_lock.release()
+        for dispatcher in retired:
+            dispatcher.shutdown()
+
+    @traced
+    def start_capture(self, path: str, segment_size: int = 64 << 20) -> CaptureWriter:
+        """Records every broadcast received by the subscriber, before filtering, with its nanosecond receive
+        timestamp to memory mapped segment files in path. Replaces a capture in progress.
+
+        Args:
+            path (str): capture directory, an existing capture is appended to
+            segment_size (int): preallocated segment file size in bytes
+
+        Returns:
+            CaptureWriter: capture writer, its records and bytes members count recorded broadcasts
+        """
+        capture = CaptureWriter(path, segment_size)
+        with self.__capture_lock:
+            capture, self.__capture = self.__capture, capture
+        if capture is not None:
+            capture.close()
+        return self.__capture
+
+    @traced
+    def stop_capture(self) -> None:
+        """Stops recording broadcasts and completes the capture files. Also done by stop()."""
+        with self.__capture_lock:
+            capture, self.__capture = self.__capture, None
+        if capture is not None:
+            capture.close()
+
+    @traced
+    def replay_capture(self, path: str, speed: Optional[float] = None, start_ns: Optional[int] = None,
+                       end_ns: Optional[int] = None) -> int:
+        """Feeds broadcasts recorded by start_capture() to the subscriber handlers on the calling thread, through
+        the same filters and dispatcher as received broadcasts. The client does not have to be started; if it is,
+        replayed broadcasts are interleaved with received ones and dispatched under the broadcast lock, so that the
+        dispatcher is never used from two threads at once. May be called from subscriber handlers.
+        See CaptureReader.publish() to replay through a PUB socket instead.
+
+        Args:
+            path (str): capture directory
+            speed (float, optional): 1.0 keeps recorded gaps, 2.0 replays twice as fast, None as fast as possible
+            start_ns (int, optional): skip broadcasts received before, in ns since epoch
+            end_ns (int, optional): stop at broadcasts received after, in ns since epoch
+
+        Returns:
+            int: number of replayed broadcasts
+        """
+        def on_broadcast(msg: bytes) -> None:
+            with self.__broadcast_lock:
+                dispatcher = self.__sub_dispatcher
+                if dispatcher is not None:
+                    self.__on_broadcast(msg, dispatcher)
+                    return
+            self.__on_broadcast(msg, None)  # handlers run inline, w/o the lock
+
+        replayed = CaptureReader(path).replay(on_broadcast, speed, start_ns, end_ns)
+        if self.__sub_thread is None:
+            self.__shutdown_retired_dispatchers()
+        return replayed
+
+    @traced
     def remove_sub_handler(self, sub_func: Callable[[Message], None]):
         self.sub_handlers.remove(sub_func)
+        if sub_func not in self.sub_handlers:
+            self.__sub_filters.pop(sub_func, None)
 
-    @log
+    @traced
     def add_req_handler(self, req_func: Callable[[Message], None]):
         self.req_handlers.append(req_func)
 
-    @log
+    @traced
     def remove_req_handler(self, req_func: Callable[[Message], None]):
         self.req_handlers.remove(req_func)
 
-    @log
+    @traced
     def add_rep_handler(self, rep_func: Callable[[Message], Message]):
         self.rep_handlers.append(rep_func)
         if len(self.rep_handlers) == 1:
-            self.__rep_thread = threading.Thread(target=self.__poll_responder, daemon=True)  # REP in daemon thread
-            self.__rep_thread.start()
+            self.__start_responder()
+
+    # starts REP or ROUTER responder in daemon thread (protected)
+    def __start_responder(self) -> None:
+        target = self.__poll_router if self.__rep_workers else self.__poll_responder
+        self.__rep_thread, self.__rep_wake = self.__start_worker(target)
 
-    @log
+    @traced
+    def set_rep_workers(self, workers: int, processes: bool = False):
+        """Sets how requests to the responder are served. With workers > 0 the responder binds a ROUTER socket and
+        handles requests concurrently on a pool of worker threads, or processes, replying to every peer as soon as
+        its request is handled. With workers == 0 (default) requests are served one at a time on a REP socket.
+        A running responder is restarted in the new mode.
+
+        Args:
+            workers (int): number of workers, 0 for the single threaded REP responder
+            processes (bool): run handlers in worker processes instead of threads, handlers must be picklable
+        """
+        if workers < 0:
+            raise ValueError(f"invalid number of responder workers {workers}")
+        self.__rep_workers = workers
+        self.__rep_processes = processes
+        if self.__rep_thread is not None:
+            self.__stop_worker(self.__rep_thread, self.__rep_wake)
+            self.__start_responder()
+
+    @traced
     def remove_rep_handler(self, rep_func: Callable[[Message], Message]):
         self.rep_handlers.remove(rep_func)
-        if len(self.rep_handlers) == 0 and self.__rep_thread is not None:
-            self.__stop_responder_thread = True
-            self.__rep_thread.join(1)
-            self.__rep_thread = None
+        if len(self.rep_handlers) == 0:
+            self.__stop_worker(self.__rep_thread, self.__rep_wake)
+            self.__rep_thread, self.__rep_wake = None, None
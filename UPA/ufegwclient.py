@@ -18,9 +18,18 @@
 # TECHNOLOGIES PTY LTD.
 #
 # --------------------------------------------------------------------------------------------
-from typing import Optional, List, Dict
+import glob
+import hashlib
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Optional, List, Dict, Iterable, Iterator, Tuple
 from uuid import UUID
 
+from google.protobuf.message import DecodeError
+
 from UPA import *
 
 
@@ -59,15 +68,21 @@ class UFEGWService:
             self.target_compid: str = msg[COMMON_TARGETCOMPID]
             self.sender_compid: str = msg[COMMON_SENDERCOMPID]
 
-    def __init__(self, msg: Message, uc: UFEedClient, session_token: UUID):
+    def __init__(self, msg: Message, uc: UFEedClient, session_token: UUID,
+                 dictionary_cache: Optional["UFEGWService.DictionaryCache"] = None, gateway: str = ""):
         """Initializes UFEGW service class
         :arg msg UFEed message to populate service status from
         :arg uc UFEedClient object to perform requests to
-        :arg session_token recent session token to set to UFEedClient requests"""
+        :arg session_token recent session token to set to UFEedClient requests
+        :arg dictionary_cache service dictionary cache, defaults to UFEGWService.dictionary_cache
+        :arg gateway UFEGW endpoint the service belongs to, keys its cached dictionary"""
         self.service_status: UFEGWService.Status = UFEGWService.Status(msg)
         # private members
         self._uc: UFEedClient = uc
         self._session_token: UUID = session_token
+        self._dictionary_cache: UFEGWService.DictionaryCache = \
+            dictionary_cache if dictionary_cache is not None else UFEGWService.dictionary_cache
+        self._gateway: str = gateway
 
     @property
     def service_id(self) -> int:
@@ -81,17 +96,20 @@ class UFEGWService:
         :returns subservice id"""
         return self.service_status.sub_service_id
 
-    def _request(self, cmd: int, long_name: str = None, tr: Callable[[Message.Builder], Message.Builder] = lambda m: m) -> (Message.Status, Message):
-        if self._session_token is None:
-            return Message.Status(NOT_LOGGED_IN), None
-        rep = self._uc.request(tr(
+    def _message(self, cmd: int, long_name: str = None, tr: Callable[[Message.Builder], Message.Builder] = lambda m: m) -> Message.Builder:
+        return tr(
             self._uc.create_message()
                 .set_long_name(long_name)
                 .set_type(MsgType.st_system)
                 .set_service_id(self.service_id)
                 .set_sub_service_id(self.sub_service_id)
                 .add_field(UFE_CMD, Message.Status(cmd))
-        ))
+        )
+
+    def _request(self, cmd: int, long_name: str = None, tr: Callable[[Message.Builder], Message.Builder] = lambda m: m) -> (Message.Status, Message):
+        if self._session_token is None:
+            return Message.Status(NOT_LOGGED_IN), None
+        rep = self._uc.request(self._message(cmd, long_name, tr))
         return rep[UFE_RESPONSE_CODE], rep
 
     def status(self, force_refresh: bool = False) -> (Message.Status, Optional[Status]):
@@ -197,14 +215,88 @@ class UFEGWService:
             for definition in groups[i][UFE_MESSAGE_DEFINITION_RECORDS]:
                 self.message_definitions[definition[UFE_FIX8_TAG]] = UFEGWService.MessageDef(definition)
 
-    def dictionary(self) -> (Message.Status, Optional[ServiceDictionary]):
-        """Requests service dictionary
+    class DictionaryCache:
+        """Service dictionary cache keyed by UFEGW endpoint, service ID and service version, optionally persisted
+        to a directory as serialized dictionary response WireMessages the dictionaries are rebuilt from"""
+        FILE_PREFIX = "ufegw-dictionary"
+
+        def __init__(self, path: Optional[str] = None):
+            """Creates service dictionary cache
+            :arg path directory to persist dictionaries to, None to keep dictionaries in memory only"""
+            self.path: Optional[str] = path
+            self._dictionaries: Dict[Tuple[str, int], "UFEGWService.ServiceDictionary"] = {}
+            self._lock = threading.Lock()
+
+        def _file(self, gateway: str, service_id: int, service_version) -> str:
+            gateway_id = hashlib.sha1(gateway.encode()).hexdigest()[:16]
+            return os.path.join(self.path, f"{UFEGWService.DictionaryCache.FILE_PREFIX}-{gateway_id}-{service_id}-{service_version}.wm")
+
+        def get(self, gateway: str, service_id: int, service_version) -> Optional["UFEGWService.ServiceDictionary"]:
+            """Gets cached service dictionary, loads it from disk if not cached in memory
+            :arg gateway UFEGW endpoint the service belongs to
+            :arg service_id service ID
+            :arg service_version service version the dictionary must match
+            :returns cached service dictionary or None if not found or version does not match"""
+            with self._lock:
+                dic = self._dictionaries.get((gateway, service_id))
+                if dic is not None and dic.service_version == service_version:
+                    return dic
+                if self.path is None:
+                    return None
+                try:
+                    with open(self._file(gateway, service_id, service_version), "rb") as f:
+                        wm = WireMessage()
+                        wm.ParseFromString(f.read())
+                    dic = UFEGWService.ServiceDictionary(Message(wm))
+                except (OSError, DecodeError, AssertionError, LookupError, TypeError):
+                    return None
+                if dic.service_version != service_version:
+                    return None
+                self._dictionaries[(gateway, service_id)] = dic
+                return dic
+
+        def put(self, gateway: str, service_id: int, msg: Message) -> "UFEGWService.ServiceDictionary":
+            """Caches service dictionary and drops dictionaries of other versions of the service
+            :arg gateway UFEGW endpoint the service belongs to
+            :arg service_id service ID
+            :arg msg UFEGW dictionary response to build the service dictionary from
+            :returns cached service dictionary"""
+            dic = UFEGWService.ServiceDictionary(msg)
+            with self._lock:
+                self._dictionaries[(gateway, service_id)] = dic
+                if self.path is None:
+                    return dic
+                os.makedirs(self.path, exist_ok=True)
+                file = self._file(gateway, service_id, dic.service_version)
+                for stale in glob.glob(self._file(gateway, service_id, "*")):
+                    if stale != file:
+                        os.remove(stale)
+                tmp = f"{file}.{os.getpid()}.tmp"
+                with open(tmp, "wb") as f:
+                    f.write(msg.wire_message.SerializeToString())
+                os.replace(tmp, file)
+                return dic
+
+        def clear(self):
+            """Clears in memory cache, persisted dictionaries are kept"""
+            with self._lock:
+                self._dictionaries.clear()
+
+    dictionary_cache: DictionaryCache = DictionaryCache()  # in memory cache of services created w/o UFEGWClient cache
+
+    def dictionary(self, force_refresh: bool = False) -> (Message.Status, Optional[ServiceDictionary]):
+        """Gets cached or requests service dictionary. Cached dictionary is used when its version matches
+        service version from the last service status update
+        :arg force_refresh request service dictionary from UFEGW if True
         :returns a pair of UFEGW status request and service dictionary"""
+        if not force_refresh:
+            dic = self._dictionary_cache.get(self._gateway, self.service_id, self.service_status.service_version)
+            if dic is not None:
+                return Message.Status(UFE_OK), dic
         status, rep = self._request(UFE_CMD_DICTIONARY, "dictionary request")
         if status.status != UFE_OK:
             return status, None
-        dic: UFEGWService.ServiceDictionary = UFEGWService.ServiceDictionary(rep)
-        return status, dic
+        return status, self._dictionary_cache.put(self._gateway, self.service_id, rep)
 
     class SessionCacheDirection:
         """Enum for UFEGW session cache request direction"""
@@ -219,16 +311,54 @@ class UFEGWService:
         :arg filter filter to filter out result messages
         :returns a pair of UFEGW request status and cached messages"""
         status, rep = self._request(UFE_CMD_SESSION_CACHE, "session cache request",
-                                    tr=lambda m:
-                                    m.add_field(UFE_CACHE_DIRECTION, direction)
-                                    .add_field(UFE_CACHE_SEQUENCE_BEGIN, begin_seqnum)
-                                    .add_field(UFE_CACHE_SEQUENCE_END, end_seqnum)
-                                    .add_field(UFE_LOG_FILTER, filter)
-                                    )
+                                    tr=self._session_cache_tr(direction, begin_seqnum, end_seqnum, filter))
         if status.status != UFE_OK:
             return status, None
         return status, rep[UFE_CACHE_MESSAGES]
 
+    @staticmethod
+    def _session_cache_tr(direction: int, begin_seqnum: int, end_seqnum: int, filter: str) -> Callable[[Message.Builder], Message.Builder]:
+        return lambda m: m.add_field(UFE_CACHE_DIRECTION, direction) \
+            .add_field(UFE_CACHE_SEQUENCE_BEGIN, begin_seqnum) \
+            .add_field(UFE_CACHE_SEQUENCE_END, end_seqnum) \
+            .add_field(UFE_LOG_FILTER, filter)
+
+    class SessionCacheError(Exception):
+        """Raised by iter_session_cache when UFEGW rejects a session cache page request"""
+        def __init__(self, status: Message.Status, begin_seqnum: int, end_seqnum: int):
+            super().__init__(f"session cache request [{begin_seqnum}, {end_seqnum}] failed with {status}")
+            self.status: Message.Status = status
+
+    def iter_session_cache(self, direction: int, begin_seqnum: int = 1, end_seqnum: int = 0, page_size: int = 1000,
+                           filter: str = "") -> Iterator[Message]:
+        """Generator that requests service session cache page by page and yields cached messages,
+        so that only one page of messages is held in memory at a time
+        :arg direction a value from SessionCacheDirection to define cache direction to request
+        :arg begin_seqnum begin sequence number
+        :arg end_seqnum end sequence number, 0 to read up to the last sent/received sequence number at the time of call
+        :arg page_size number of sequence numbers to request at once
+        :arg filter filter to filter out result messages
+        :returns generator of cached messages
+        :raises SessionCacheError if UFEGW rejects a request"""
+        if page_size <= 0:
+            raise ValueError(f"invalid page size {page_size}")
+        if end_seqnum == 0:
+            status, send_recv = self.send_recv()
+            if status.status != UFE_OK:
+                raise UFEGWService.SessionCacheError(status, begin_seqnum, end_seqnum)
+            next_seqnum = send_recv.recv_seqnum if direction == UFEGWService.SessionCacheDirection.INBOUND else send_recv.send_seqnum
+            end_seqnum = (next_seqnum or 1) - 1
+        seqnum = begin_seqnum
+        while seqnum <= end_seqnum:
+            page_end = min(seqnum + page_size - 1, end_seqnum)
+            status, msgs = self.session_cache(direction, seqnum, page_end, filter)
+            if status.status != UFE_OK:
+                raise UFEGWService.SessionCacheError(status, seqnum, page_end)
+            if msgs is not None:
+                yield from msgs
+            msgs = None
+            seqnum = page_end + 1
+
     class SendRecv:
         """Sender and receiver seqnunce numbers"""
         def __init__(self, send_seqnum: Optional[int], recv_seqnum: Optional[int]):
@@ -467,10 +597,13 @@ class UFEGWConfigList:
 
 class UFEGWClient:
     """UFEGW Client class that covers most of UFEGW requests"""
-    def __init__(self, connection_string_dict=None):
+    def __init__(self, connection_string_dict=None, dictionary_cache_dir: Optional[str] = None):
         """Creates UFEGW client class
-        :arg connection_string_dict connection strings to pass to UFEedClient ctor"""
+        :arg connection_string_dict connection strings to pass to UFEedClient ctor
+        :arg dictionary_cache_dir directory to persist service dictionaries to, see UFEGWService.DictionaryCache"""
         self._connection_string = connection_string_dict
+        self._gateway: str = (connection_string_dict or {}).get(REQUESTER, REQUESTER_DEFAULT)
+        self._dictionary_cache = UFEGWService.DictionaryCache(dictionary_cache_dir)
         self._uc: UFEedClient = UFEedClient(self._connection_string)
         self._session_token: Optional[UUID] = None
         self._services: {int, UFEGWService} = None
@@ -568,7 +701,8 @@ class UFEGWClient:
         service_records: [Message] = rep[UFE_SERVICE_RECORDS]
         if service_records is not None:
             for service_record in service_records:
-                service: UFEGWService = UFEGWService(service_record, self._uc, self._session_token)
+                service: UFEGWService = UFEGWService(service_record, self._uc, self._session_token,
+                                                     self._dictionary_cache, self._gateway)
                 self._services[service.service_id * 1000000 + service.sub_service_id] = service
         return status, self._services
 
@@ -579,6 +713,87 @@ class UFEGWClient:
         :returns found UFEGWService object or None if not found"""
         return self._services.get(service_id * 1000000 + sub_service_id, None)
 
+    class RecoveryProgress:
+        """Session cache recovery progress passed to recover_session_caches progress callback"""
+        def __init__(self, total_services: int):
+            self.total_services: int = total_services
+            self.completed_services: int = 0
+            self.failed_services: int = 0
+            self.messages: int = 0
+            self.errors: Dict[int, Exception] = {}  # service key -> exception of request failed without response
+            self.start_time: float = time.monotonic()
+
+        @property
+        def elapsed(self) -> float:
+            """Property that gets seconds elapsed since recovery start"""
+            return time.monotonic() - self.start_time
+
+        @property
+        def throughput(self) -> float:
+            """Property that gets recovered messages per second"""
+            elapsed = self.elapsed
+            return self.messages / elapsed if elapsed > 0 else 0.0
+
+        def __str__(self):
+            return f"{self.completed_services}/{self.total_services} services ({self.failed_services} failed), " \
+                   f"{self.messages} messages in {self.elapsed:.3f}s ({self.throughput:.0f} msg/s)"
+
+    def recover_session_caches(self, direction: int, services: Optional[Iterable[UFEGWService]] = None, begin_seqnum: int = 1,
+                               end_seqnum: int = 0, filter: str = "", max_in_flight: int = 8,
+                               progress: Callable[[RecoveryProgress], None] = None) \
+            -> (Message.Status, Optional[Dict[int, Tuple[Message.Status, Optional[List[Message]]]]]):
+        """Requests session caches of many services at once. Requests are sent over a pool of max_in_flight REQ
+        sockets, so up to max_in_flight services are recovered concurrently by UFEGW workers and every response
+        is received on the socket of its request
+        :arg direction a value from UFEGWService.SessionCacheDirection to define cache direction to request
+        :arg services services to recover, all services from service_list() if None
+        :arg begin_seqnum begin sequence number
+        :arg end_seqnum end sequence number
+        :arg filter filter to filter out result messages
+        :arg max_in_flight maximum number of outstanding session cache requests
+        :arg progress optional function called with RecoveryProgress after each service is recovered
+        :returns a pair of UFEGW request status and dictionary {service key: (service request status, cached messages)},
+        service keys are the same as in service_list(). A service whose request failed without response, e.g. timed
+        out, has UFE_SERVER_GONE status and its exception in RecoveryProgress.errors"""
+        if self._session_token is None:
+            return Message.Status(NOT_LOGGED_IN), None
+        if services is None:
+            status, service_dict = self.service_list()
+            if status.status != UFE_OK:
+                return status, None
+            services = service_dict.values()
+        pending = deque(services)
+        state = UFEGWClient.RecoveryProgress(len(pending))
+        in_flight: Dict[Future, int] = {}
+        results: Dict[int, Tuple[Message.Status, Optional[List[Message]]]] = {}
+        tr = UFEGWService._session_cache_tr(direction, begin_seqnum, end_seqnum, filter)
+        with self._uc.create_request_pool(max_in_flight) as pool, ThreadPoolExecutor(max_in_flight) as executor:
+            while pending or in_flight:
+                while pending and len(in_flight) < max_in_flight:
+                    service: UFEGWService = pending.popleft()
+                    fut = executor.submit(pool.request, service._message(UFE_CMD_SESSION_CACHE, "session cache request", tr))
+                    in_flight[fut] = service.service_id * 1000000 + service.sub_service_id
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    key = in_flight.pop(fut)
+                    try:
+                        rep: Message = fut.result()
+                    except Exception as e:
+                        state.errors[key] = e
+                        status, msgs = Message.Status(UFE_SERVER_GONE), None
+                    else:
+                        status = rep[UFE_RESPONSE_CODE]
+                        msgs = rep[UFE_CACHE_MESSAGES] if status.status == UFE_OK else None
+                    results[key] = (status, msgs)
+                    state.completed_services += 1
+                    if msgs is None:
+                        state.failed_services += 1
+                    else:
+                        state.messages += len(msgs)
+                    if progress is not None:
+                        progress(state)
+        return Message.Status(UFE_OK), results
+
     class SystemStatus:
         """System status class"""
         def __init__(self, msg: Message):
@@ -672,9 +887,10 @@ class UFEGWClient:
         """Not implemented"""
         ...
 
-    def add_sub_handler(self, sub_func: Callable[[Message], None]):
-        """Adds PUB/SUB handler"""
-        self._uc.add_sub_handler(sub_func)
+    def add_sub_handler(self, sub_func: Callable[[Message], None], **filters):
+        """Adds PUB/SUB handler
+        :arg filters optional header filters, see UFEedClient.add_sub_handler"""
+        self._uc.add_sub_handler(sub_func, **filters)
 
     def remove_sub_handler(self, sub_func: Callable[[Message], None]):
         """Removes PUB/SUB handler"""
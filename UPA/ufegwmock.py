@@ -0,0 +1,430 @@
+# --------------------------------------------------------------------------------------------
+#    ____                      __      ____
+#   /\  _`\   __             /'_ `\   /\  _`\
+#   \ \ \L\_\/\_\    __  _  /\ \L\ \  \ \ \L\ \ _ __    ___
+#    \ \  _\/\/\ \  /\ \/'\ \/_> _ <_  \ \ ,__//\`'__\ / __`\
+#     \ \ \/  \ \ \ \/>  </   /\ \L\ \  \ \ \/ \ \ \/ /\ \L\ \
+#      \ \_\   \ \_\ /\_/\_\  \ \____/   \ \_\  \ \_\ \ \____/
+#       \/_/    \/_/ \//\/_/   \/___/     \/_/   \/_/  \/___/
+#
+#                     Universal FIX Engine
+#
+# Copyright (C) 2017-19 Fix8 Market Technologies Pty Ltd (ABN 29 167 027 198)
+# All Rights Reserved. [http://www.fix8mt.com] <heretohelp@fix8mt.com>
+#
+# THIS FILE IS PROPRIETARY AND  CONFIDENTIAL. NO PART OF THIS FILE MAY BE REPRODUCED,  STORED
+# IN A RETRIEVAL SYSTEM,  OR TRANSMITTED, IN ANY FORM OR ANY MEANS,  ELECTRONIC, PHOTOSTATIC,
+# RECORDED OR OTHERWISE, WITHOUT THE PRIOR AND  EXPRESS WRITTEN  PERMISSION  OF  FIX8  MARKET
+# TECHNOLOGIES PTY LTD.
+#
+# --------------------------------------------------------------------------------------------
+import argparse
+import itertools
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import zmq
+
+from UPA import FIX50SP2_Fields as fix50
+from UPA.consts import *
+from UPA.message import *
+from UPA.ufeedclient import _unbind
+
+
+class MockUFEGW:
+    """
+    Local stand-in for the UFEGW to test, load test and benchmark UFEedClient and UFEGWClient without network or
+    licensed gateway. It plays the UFEGW side of the four socket protocol: answers requests of any number of
+    clients (REQ or pipelined DEALER) on a ROUTER socket bound to their REQUESTER endpoint, publishes broadcasts
+    on a PUB socket bound to their SUBSCRIBER endpoint, subscribes to client PUBLISHER endpoints and sends
+    requests to client RESPONDER endpoints.
+    Login, logout, service list, service status, system status, last send/recv sequence numbers and session
+    cache requests are implemented, other commands are answered with INVALID_CMD. Session caches and the
+    broadcast stream consist of synthetic ExecutionReports. Like the UFEGW, responses do not echo request seq
+    unless echo_seq is set.
+    Sample:
+        with MockUFEGW() as gw:
+            gw.start_broadcast(rate=10000, count=100000)
+            client = UFEGWClient()
+            client.start(sub_func=on_broadcast, req_func=lambda msg: None)
+            client.logon("webuser", "pass")
+    """
+
+    class Service:
+        """ Mock FIX service, its session caches hold next_send_seq - 1 outbound and next_recv_seq - 1 inbound
+            synthetic ExecutionReports """
+        def __init__(self, service_id: int, name: str, sub_service_id: int = 0, fix_variant: str = "FIX50SP2",
+                     next_send_seq: int = 1, next_recv_seq: int = 1):
+            self.service_id = service_id
+            self.sub_service_id = sub_service_id
+            self.name = name
+            self.fix_variant = fix_variant
+            self.next_send_seq = next_send_seq
+            self.next_recv_seq = next_recv_seq
+
+        @property
+        def key(self) -> Tuple[int, int]:
+            return self.service_id, self.sub_service_id
+
+        def add_record(self, msg: Message.Builder) -> Message.Builder:
+            """ Adds service status fields to message """
+            return msg.add_field(UFE_SERVICE_ID, self.service_id) \
+                .add_field(UFE_SUBSERVICE_ID, self.sub_service_id) \
+                .add_field(UFE_SERVICE_NAME, self.name) \
+                .add_field(UFE_SERVICE_TAG, f"{self.name}:{self.service_id}") \
+                .add_field(UFE_SERVICE_STATUS, 1) \
+                .add_field(UFE_SERVICE_STATUS_STRING, "established") \
+                .add_field(UFE_SERVICE_VERSION, 1) \
+                .add_field(UFE_SERVICE_FIX_VARIANT, self.fix_variant) \
+                .add_field(UFE_SERVICE_FIX_DESC, self.fix_variant) \
+                .add_field(UFE_SERVICE_SENT, self.next_send_seq - 1) \
+                .add_field(UFE_SERVICE_RECEIVED, self.next_recv_seq - 1) \
+                .add_field(UFE_NEXT_FIX_SEND_SEQ, self.next_send_seq) \
+                .add_field(UFE_NEXT_FIX_RECV_SEQ, self.next_recv_seq)
+
+    SYMBOLS = ("BHP", "RIO", "CBA", "NAB", "WBC", "ANZ", "CSL", "WES", "TLS", "WOW")
+
+    def __init__(self, publisher: str = "tcp://*:55745", responder: str = "tcp://*:55746",
+                 client_publishers: Sequence[str] = (), client_responder: Optional[str] = None,
+                 services: Optional[Iterable["MockUFEGW.Service"]] = None, users: Optional[Dict[str, str]] = None,
+                 on_client_publish: Optional[Callable[[Message], None]] = None, echo_seq: bool = False):
+        """ Creates mock gateway, start() binds its sockets
+            Args:
+                publisher (str): endpoint to publish broadcasts on, clients' SUBSCRIBER
+                responder (str): endpoint to answer requests on, clients' REQUESTER
+                client_publishers (Sequence[str]): client PUBLISHER endpoints to subscribe to
+                client_responder (str, optional): client RESPONDER endpoint for request_client()
+                services (Iterable[MockUFEGW.Service], optional): services, defaults to two FIX50SP2 sessions
+                users (Dict[str, str], optional): login id to password, None accepts any login
+                on_client_publish (Callable[[Message], None], optional): called with messages clients publish
+                echo_seq (bool): copy request seq to responses, which the UFEGW does not do
+        """
+        self._endpoints = (publisher, responder)
+        self._client_publishers = tuple(client_publishers)
+        self._client_responder = client_responder
+        if services is None:
+            services = (MockUFEGW.Service(1, "EXEC_VENUE"), MockUFEGW.Service(2, "MARKET_DATA"))
+        self.services: Dict[Tuple[int, int], MockUFEGW.Service] = {s.key: s for s in services}
+        self._users = users
+        self._echo_seq = echo_seq
+        self._on_client_publish = on_client_publish
+        self._sessions: Dict[uuid.UUID, str] = {}
+        self._handlers: Dict[int, Callable[[Message, Message.Builder], int]] = {
+            UFE_CMD_LOGIN: self._login, UFE_CMD_LOGOUT: self._logout, UFE_CMD_SERVICE_LIST: self._service_list,
+            UFE_CMD_SERVICE_STATUS: self._service_status, UFE_CMD_SYSTEM_STATUS: self._system_status,
+            UFE_CMD_GET_SEND_RECV: self._send_recv, UFE_CMD_SESSION_CACHE: self._session_cache}
+        self._context: Optional[zmq.Context] = None
+        self._pub_socket: Optional[zmq.Socket] = None
+        self._wake: Optional[zmq.Socket] = None
+        self._thread: Optional[threading.Thread] = None
+        self._broadcast_thread: Optional[threading.Thread] = None
+        self._broadcast_stop = threading.Event()
+        self._lock = threading.Lock()
+        self._started_ns = 0
+        self._requests = 0
+        self._broadcasts = 0
+        self._client_messages = 0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self) -> None:
+        """ Binds and connects sockets and starts serving requests """
+        if self._thread is not None:
+            return
+        self._context = zmq.Context()
+        self._pub_socket = self._context.socket(zmq.PUB)
+        self._pub_socket.set_hwm(0)
+        self._pub_socket.bind(self._endpoints[0])
+        router_socket = self._context.socket(zmq.ROUTER)
+        router_socket.bind(self._endpoints[1])
+        sub_socket = self._context.socket(zmq.SUB)
+        sub_socket.setsockopt(zmq.SUBSCRIBE, PUBLISHER_TOPIC_DEFAULT.encode())
+        for endpoint in self._client_publishers:
+            sub_socket.connect(endpoint)
+        control_socket = self._context.socket(zmq.PULL)
+        control_socket.bind(f"inproc://ufegwmock-control-{id(self)}")
+        self._wake = self._context.socket(zmq.PUSH)
+        self._wake.connect(f"inproc://ufegwmock-control-{id(self)}")
+        self._started_ns = time.time_ns()
+        self._thread = threading.Thread(target=self._serve, args=(router_socket, sub_socket, control_socket), daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """ Stops broadcasting and serving requests, unbinds and closes sockets """
+        if self._thread is None:
+            return
+        self.stop_broadcast()
+        self._wake.send(b"")
+        self._thread.join()
+        self._wake.close(linger=0)
+        _unbind(self._pub_socket)
+        self._pub_socket.close(linger=0)
+        self._context.term()
+        self._thread = self._wake = self._pub_socket = self._context = None
+
+    # serves requests and client publications until woken up by stop() (protected)
+    def _serve(self, router_socket: zmq.Socket, sub_socket: zmq.Socket, control_socket: zmq.Socket) -> None:
+        topic = REQUESTER_TOPIC_DEFAULT.encode()
+        poller = zmq.Poller()
+        poller.register(router_socket, zmq.POLLIN)
+        poller.register(sub_socket, zmq.POLLIN)
+        poller.register(control_socket, zmq.POLLIN)
+        while True:
+            events = dict(poller.poll())
+            if control_socket in events:
+                break
+            if router_socket in events:
+                frames = router_socket.recv_multipart()
+                # envelope is peer identity up to the empty delimiter frame
+                split = frames.index(b"") + 1 if b"" in frames else 1
+                envelope, body = frames[:split], frames[split:]
+                if len(body) != 2 or body[0] != topic:
+                    router_socket.send_multipart(envelope + [b"", b"TOPIC UNKNOWN"])
+                    continue
+                wm = WireMessage()
+                wm.ParseFromString(body[1])
+                router_socket.send_multipart(envelope + [topic, self.respond(wm).serialize()])
+            if sub_socket in events:
+                wm = WireMessage()
+                wm.ParseFromString(sub_socket.recv_multipart()[1])
+                with self._lock:
+                    self._client_messages += 1
+                if self._on_client_publish is not None:
+                    self._on_client_publish(Message(wm))
+        _unbind(router_socket)
+        for sock in (router_socket, sub_socket, control_socket):
+            sock.close(linger=0)
+
+    def respond(self, wm: WireMessage) -> Message.Builder:
+        """ Builds response to request as the UFEGW would
+            Args:
+                wm (WireMessage): request
+            Returns:
+                Message.Builder: response
+        """
+        req = Message(wm)
+        cmd = req[UFE_CMD]
+        cmd = cmd.status if isinstance(cmd, Message.Status) else cmd or wm.service_id
+        rep = SysMessage.Builder() \
+            .set_type(MsgType.st_response) \
+            .set_service_id(wm.service_id) \
+            .set_sub_service_id(wm.subservice_id) \
+            .set_seq(wm.seq if self._echo_seq else 0) \
+            .add_field(UFE_CMD_RESPONSE, cmd)
+        with self._lock:
+            self._requests += 1
+            if cmd != UFE_CMD_LOGIN and req[UFE_SESSION_TOKEN] not in self._sessions:
+                code = NOT_LOGGED_IN
+            elif cmd in self._handlers:
+                code = self._handlers[cmd](req, rep)
+            else:
+                code = INVALID_CMD
+        return rep.add_field(UFE_RESPONSE_CODE, Message.Status(code))
+
+    def _login(self, req: Message, rep: Message.Builder) -> int:
+        login_id, login_pw = req[UFE_LOGIN_ID], req[UFE_LOGIN_PW]
+        if self._users is not None:
+            if login_id not in self._users:
+                return UNKNOWN_USER
+            if self._users[login_id] != login_pw:
+                return INVALID_PASSWORD
+        token = uuid.uuid4()
+        self._sessions[token] = login_id
+        rep.add_field(UFE_SESSION_TOKEN, token, Location.fl_system)
+        return LOGIN_ACCEPTED
+
+    def _logout(self, req: Message, rep: Message.Builder) -> int:
+        self._sessions.pop(req[UFE_SESSION_TOKEN], None)
+        return LOGOFF_SUCCESSFUL
+
+    def _service_list(self, req: Message, rep: Message.Builder) -> int:
+        rep.add_group(UFE_SERVICE_RECORDS, Message.Builder.GroupRef(), lambda m, grp:
+                      [service.add_record(m.add_group_item(grp)) for service in self.services.values()])
+        return UFE_OK
+
+    # returns service addressed by request or None (protected)
+    def _service(self, req: Message) -> Optional["MockUFEGW.Service"]:
+        return self.services.get((req.service_id, req.sub_service_id))
+
+    def _service_status(self, req: Message, rep: Message.Builder) -> int:
+        service = self._service(req)
+        if service is None:
+            return UNKNOWN_SERVICE
+        service.add_record(rep)
+        return UFE_OK
+
+    def _system_status(self, req: Message, rep: Message.Builder) -> int:
+        rep.add_field(UFE_TOTAL_SENT, sum(s.next_send_seq - 1 for s in self.services.values())) \
+            .add_field(UFE_TOTAL_RECEIVED, sum(s.next_recv_seq - 1 for s in self.services.values())) \
+            .add_field(UFE_RESP_SEQ, self._requests) \
+            .add_field(UFE_RECV_SEQ, self._requests) \
+            .add_field(UFE_BRD_SEQ, self._broadcasts) \
+            .add_field(UFE_WORKERS, 1) \
+            .add_field(UFE_INSTANCE_NAME, "ufegwmock") \
+            .add_field(UFE_FIX8PRO_VERSION, "mock") \
+            .add_field(UFE_TOTAL_SESSIONS, len(self.services)) \
+            .add_field(UFE_ACTIVE_SESSIONS, len(self.services))
+        return UFE_OK
+
+    def _send_recv(self, req: Message, rep: Message.Builder) -> int:
+        service = self._service(req)
+        if service is None:
+            return UNKNOWN_SERVICE
+        rep.add_field(UFE_NEXT_FIX_SEND_SEQ, service.next_send_seq).add_field(UFE_NEXT_FIX_RECV_SEQ, service.next_recv_seq)
+        return UFE_OK
+
+    def _session_cache(self, req: Message, rep: Message.Builder) -> int:
+        service = self._service(req)
+        if service is None:
+            return UNKNOWN_SERVICE
+        direction = req[UFE_CACHE_DIRECTION]
+        if direction not in (1, 2):  # UFEGWService.SessionCacheDirection INBOUND, OUTBOUND
+            return INVALID_DIRECTION
+        last = (service.next_recv_seq if direction == 1 else service.next_send_seq) - 1
+        begin, end = req[UFE_CACHE_SEQUENCE_BEGIN] or 0, req[UFE_CACHE_SEQUENCE_END] or 0
+        if begin < 1 or (end and end < begin):
+            return INVALID_SEQUENCE
+        end = last if not end else min(end, last)
+        if begin <= end:
+            rep.add_group(UFE_CACHE_MESSAGES, Message.Builder.GroupRef(), lambda m, grp:
+                          [self.execution_report(seq, service.service_id, m.add_group_item(grp))
+                           for seq in range(begin, end + 1)])
+        return UFE_OK
+
+    @staticmethod
+    def execution_report(seq: int, service_id: int = 1, msg: Optional[Message.Builder] = None) -> Message.Builder:
+        """ Builds synthetic partial fill ExecutionReport, its content is derived from seq
+            Args:
+                seq (int): message sequence number
+                service_id (int): service ID of the message
+                msg (Message.Builder, optional): builder to fill, e.g. group item, new FIXMessage by default
+            Returns:
+                Message.Builder: filled ExecutionReport
+        """
+        msg = FIXMessage.Builder() if msg is None else msg
+        order = seq // 4
+        qty = 100 * (1 + order % 10)
+        cum_qty = min(qty, 25 * (1 + seq % 4))
+        return msg.set_long_name("ExecutionReport") \
+            .set_name(fix50.MsgType.EXECUTIONREPORT) \
+            .set_type(MsgType.st_fixmsg) \
+            .set_service_id(service_id) \
+            .set_seq(seq) \
+            .add_field(fix50.MsgSeqNum.tag, seq, Location.fl_header) \
+            .add_field(fix50.OrderID.tag, f"O{order}") \
+            .add_field(fix50.ClOrdID.tag, f"C{order}") \
+            .add_field(fix50.ExecID.tag, f"E{seq}") \
+            .add_field(fix50.ExecType.tag, fix50.ExecType.TRADE) \
+            .add_field(fix50.OrdStatus.tag, fix50.OrdStatus.FILLED if cum_qty == qty else fix50.OrdStatus.PARTIALLY_FILLED) \
+            .add_field(fix50.Symbol.tag, MockUFEGW.SYMBOLS[order % len(MockUFEGW.SYMBOLS)]) \
+            .add_field(fix50.Side.tag, fix50.Side.BUY if order % 2 else fix50.Side.SELL) \
+            .add_field(fix50.OrderQty.tag, float(qty)) \
+            .add_field(fix50.LastQty.tag, 25.) \
+            .add_field(fix50.LastPx.tag, 10. + order % 100 / 100) \
+            .add_field(fix50.LeavesQty.tag, float(qty - cum_qty)) \
+            .add_field(fix50.CumQty.tag, float(cum_qty)) \
+            .add_field(fix50.AvgPx.tag, 10. + order % 100 / 100)
+
+    def start_broadcast(self, rate: float = 0, count: Optional[int] = None, service_id: int = 1) -> threading.Thread:
+        """ Starts publishing synthetic ExecutionReports of a service from a background thread, they are also
+            appended to its outbound session cache
+            Args:
+                rate (float): messages per second, 0 publishes as fast as possible
+                count (int, optional): number of messages, None publishes until stop_broadcast()
+                service_id (int): service to publish for
+            Returns:
+                threading.Thread: broadcasting thread, joins when count messages are published
+        """
+        if self._pub_socket is None:
+            raise ConnectionError("mock gateway is not started")
+        self.stop_broadcast()
+        service = self.services[(service_id, 0)]
+        self._broadcast_stop.clear()
+        self._broadcast_thread = threading.Thread(target=self._broadcast, args=(service, rate, count), daemon=True)
+        self._broadcast_thread.start()
+        return self._broadcast_thread
+
+    def stop_broadcast(self) -> None:
+        """ Stops publishing and waits for the broadcasting thread """
+        if self._broadcast_thread is not None:
+            self._broadcast_stop.set()
+            self._broadcast_thread.join()
+            self._broadcast_thread = None
+
+    # publishes ExecutionReports paced to rate, the achievable rate is bound by message build time (protected)
+    def _broadcast(self, service: "MockUFEGW.Service", rate: float, count: Optional[int]) -> None:
+        topic = SUBSCRIBER_TOPIC_DEFAULT.encode()
+        start = time.perf_counter()
+        for i in (range(count) if count is not None else itertools.count()):
+            if self._broadcast_stop.is_set():
+                break
+            with self._lock:
+                seq = service.next_send_seq
+                service.next_send_seq += 1
+                self._broadcasts += 1
+            # build before waiting so that build time does not add up to the pacing
+            data = self.execution_report(seq, service.service_id).serialize()
+            if rate:
+                ahead = start + i / rate - time.perf_counter()
+                if ahead > 0.0005:
+                    time.sleep(ahead)
+            self._pub_socket.send_multipart((topic, data))
+
+    def request_client(self, msg: Message.Builder, timeout: float = 5.) -> Message:
+        """ Sends request to the client RESPONDER endpoint as the UFEGW would
+            Args:
+                msg (Message.Builder): request
+                timeout (float): seconds to wait for the response
+            Returns:
+                Message: response
+            Raises:
+                TimeoutError: if there is no response within timeout
+        """
+        if self._client_responder is None:
+            raise ValueError("no client responder endpoint")
+        req_socket = self._context.socket(zmq.REQ)
+        try:
+            req_socket.connect(self._client_responder)
+            req_socket.send_multipart((RESPONDER_TOPIC_DEFAULT.encode(), msg.serialize()))
+            if not req_socket.poll(int(timeout * 1000)):
+                raise TimeoutError(f"no response within {timeout}s")
+            wm = WireMessage()
+            wm.ParseFromString(req_socket.recv_multipart()[-1])
+            return Message(wm)
+        finally:
+            req_socket.close(linger=0)
+
+    def stats(self) -> Dict[str, int]:
+        """ Returns: requests answered, broadcasts published, client messages received and logged in sessions """
+        with self._lock:
+            return {"requests": self._requests, "broadcasts": self._broadcasts,
+                    "client_messages": self._client_messages, "sessions": len(self._sessions)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Runs mock UFEGW serving UFEedClient requests and broadcasting "
+                                                 "synthetic ExecutionReports until interrupted.")
+    parser.add_argument("--publisher", default="tcp://*:55745", help="broadcast endpoint to bind")
+    parser.add_argument("--responder", default="tcp://*:55746", help="request endpoint to bind")
+    parser.add_argument("--rate", type=float, default=0, help="ExecutionReports per second, 0 to not broadcast")
+    args = parser.parse_args()
+    with MockUFEGW(args.publisher, args.responder) as gw:
+        if args.rate:
+            gw.start_broadcast(args.rate)
+        try:
+            while True:
+                time.sleep(5)
+                print(gw.stats())
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
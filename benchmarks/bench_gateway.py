@@ -0,0 +1,65 @@
+# --------------------------------------------------------------------------------------------
+#    ____                      __      ____
+#   /\  _`\   __             /'_ `\   /\  _`\
+#   \ \ \L\_\/\_\    __  _  /\ \L\ \  \ \ \L\ \ _ __    ___
+#    \ \  _\/\/\ \  /\ \/'\ \/_> _ <_  \ \ ,__//\`'__\ / __`\
+#     \ \ \/  \ \ \ \/>  </   /\ \L\ \  \ \ \/ \ \ \/ /\ \L\ \
+#      \ \_\   \ \_\ /\_/\_\  \ \____/   \ \_\  \ \_\ \ \____/
+#       \/_/    \/_/ \//\/_/   \/___/     \/_/   \/_/  \/___/
+#
+#                     Universal FIX Engine
+#
+# Copyright (C) 2017-19 Fix8 Market Technologies Pty Ltd (ABN 29 167 027 198)
+# All Rights Reserved. [http://www.fix8mt.com] <heretohelp@fix8mt.com>
+#
+# THIS FILE IS PROPRIETARY AND  CONFIDENTIAL. NO PART OF THIS FILE MAY BE REPRODUCED,  STORED
+# IN A RETRIEVAL SYSTEM,  OR TRANSMITTED, IN ANY FORM OR ANY MEANS,  ELECTRONIC, PHOTOSTATIC,
+# RECORDED OR OTHERWISE, WITHOUT THE PRIOR AND  EXPRESS WRITTEN  PERMISSION  OF  FIX8  MARKET
+# TECHNOLOGIES PTY LTD.
+#
+# --------------------------------------------------------------------------------------------
+import os
+import tempfile
+from typing import Callable, List, Tuple
+
+from UPA import *
+from UPA.ufegwclient import UFEGWClient
+from UPA.ufegwmock import MockUFEGW
+from bench_message import build_nos
+
+
+def benchmarks(rate: float = 20000) -> Tuple[List[Tuple[str, Callable[[], object]]], Callable[[], None]]:
+    """UFEedClient and UFEGWClient request benchmarks against MockUFEGW over ipc transport, measured while the
+    client subscriber receives a broadcast stream
+    :arg rate ExecutionReports per second the mock gateway broadcasts while benchmarks run, 0 for no broadcasts
+    :returns list of (name, operation) and cleanup function"""
+    tmp = tempfile.mkdtemp(prefix="ufeed-bench-")
+    endpoints = {name: f"ipc://{os.path.join(tmp, name)}" for name in (SUBSCRIBER, REQUESTER, PUBLISHER, RESPONDER)}
+    gw = MockUFEGW(endpoints[SUBSCRIBER], endpoints[REQUESTER])
+    gw.start()
+    received = [0]
+    client = UFEGWClient(endpoints)
+    client.start(sub_func=lambda msg: received.__setitem__(0, received[0] + 1), req_func=lambda msg: None)
+    client.logon("webuser", "pass")
+    uc = client.ufeed_client
+    nos = build_nos()
+    if rate:
+        gw.start_broadcast(rate)
+
+    def ufeedclient_request():
+        return uc.request(nos)[UFE_RESPONSE_CODE]
+
+    def ufeedclient_request_async():
+        return uc.request_async(nos).result()[UFE_RESPONSE_CODE]
+
+    def ufegwclient_system_status():
+        return client.system_status()[1].brd_seq
+
+    def cleanup():
+        gw.stop_broadcast()
+        client.stop()
+        gw.stop()
+
+    suffix = f"_{rate:g}" if rate else ""
+    return [(f"gw_request{suffix}", ufeedclient_request), (f"gw_request_async{suffix}", ufeedclient_request_async),
+            (f"gw_system_status{suffix}", ufegwclient_system_status)], cleanup
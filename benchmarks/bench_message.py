@@ -0,0 +1,151 @@
+# --------------------------------------------------------------------------------------------
+#    ____                      __      ____
+#   /\  _`\   __             /'_ `\   /\  _`\
+#   \ \ \L\_\/\_\    __  _  /\ \L\ \  \ \ \L\ \ _ __    ___
+#    \ \  _\/\/\ \  /\ \/'\ \/_> _ <_  \ \ ,__//\`'__\ / __`\
+#     \ \ \/  \ \ \ \/>  </   /\ \L\ \  \ \ \/ \ \ \/ /\ \L\ \
+#      \ \_\   \ \_\ /\_/\_\  \ \____/   \ \_\  \ \_\ \ \____/
+#       \/_/    \/_/ \//\/_/   \/___/     \/_/   \/_/  \/___/
+#
+#                     Universal FIX Engine
+#
+# Copyright (C) 2017-19 Fix8 Market Technologies Pty Ltd (ABN 29 167 027 198)
+# All Rights Reserved. [http://www.fix8mt.com] <heretohelp@fix8mt.com>
+#
+# THIS FILE IS PROPRIETARY AND  CONFIDENTIAL. NO PART OF THIS FILE MAY BE REPRODUCED,  STORED
+# IN A RETRIEVAL SYSTEM,  OR TRANSMITTED, IN ANY FORM OR ANY MEANS,  ELECTRONIC, PHOTOSTATIC,
+# RECORDED OR OTHERWISE, WITHOUT THE PRIOR AND  EXPRESS WRITTEN  PERMISSION  OF  FIX8  MARKET
+# TECHNOLOGIES PTY LTD.
+#
+# --------------------------------------------------------------------------------------------
+from datetime import datetime
+from typing import Callable, List, Tuple
+
+from UPA import *
+
+fix50 = FIX50SP2_Fields
+
+
+def build_nos(cl_ord_id: str = "Ord01", now: datetime = datetime(2020, 1, 10, 15, 4, 58)) -> Message.Builder:
+    return FIXMessage.Builder() \
+        .set_long_name("NewOrderSingle") \
+        .set_name(fix50.MsgType.NEWORDERSINGLE) \
+        .set_service_id(6) \
+        .add_field(fix50.ClOrdID.tag, cl_ord_id) \
+        .add_field(fix50.Symbol.tag, "BHP") \
+        .add_field(fix50.Side.tag, fix50.Side.BUY) \
+        .add_field(fix50.TransactTime.tag, now) \
+        .add_field(fix50.OrderQty.tag, 100) \
+        .add_field(fix50.OrdType.tag, fix50.OrdType.LIMIT) \
+        .add_field(fix50.Price.tag, 10.25) \
+        .add_field(fix50.TimeInForce.tag, fix50.TimeInForce.DAY) \
+        .add_field(fix50.Account.tag, "ACC1") \
+        .add_field(fix50.ExecInst.tag, fix50.ExecInst.ALL_OR_NONE)
+
+
+def build_nos_fields(cl_ord_id: str = "Ord01", now: datetime = datetime(2020, 1, 10, 15, 4, 58)) -> Message.Builder:
+    return FIXMessage.Builder() \
+        .set_long_name("NewOrderSingle") \
+        .set_name(fix50.MsgType.NEWORDERSINGLE) \
+        .set_service_id(6) \
+        .add_fields([(fix50.ClOrdID.tag, cl_ord_id),
+                     (fix50.Symbol.tag, "BHP"),
+                     (fix50.Side.tag, fix50.Side.BUY),
+                     (fix50.TransactTime.tag, now),
+                     (fix50.OrderQty.tag, 100),
+                     (fix50.OrdType.tag, fix50.OrdType.LIMIT),
+                     (fix50.Price.tag, 10.25),
+                     (fix50.TimeInForce.tag, fix50.TimeInForce.DAY),
+                     (fix50.Account.tag, "ACC1"),
+                     (fix50.ExecInst.tag, fix50.ExecInst.ALL_OR_NONE)])
+
+
+def build_execution_report(seq: int = 2889) -> Message.Builder:
+    """ExecutionReport shaped as broadcast by UFEGW: header, ~20 body fields and a parties group"""
+    now = datetime(2020, 1, 10, 15, 4, 58)
+    g = Message.Builder.GroupRef()
+    return FIXMessage.Builder() \
+        .set_long_name("ExecutionReport") \
+        .set_name(fix50.MsgType.EXECUTIONREPORT) \
+        .set_service_id(6) \
+        .set_seq(seq) \
+        .add_fields([(fix50.MsgType.tag, fix50.MsgType.EXECUTIONREPORT, Location.fl_header),
+                     (fix50.MsgSeqNum.tag, 602, Location.fl_header),
+                     (fix50.SendingTime.tag, now, Location.fl_header),
+                     (fix50.OrderID.tag, "ord2"),
+                     (fix50.ClOrdID.tag, "Ord01"),
+                     (fix50.ExecID.tag, "exec7"),
+                     (fix50.ExecType.tag, fix50.ExecType.TRADE),
+                     (fix50.OrdStatus.tag, fix50.OrdStatus.PARTIALLY_FILLED),
+                     (fix50.Symbol.tag, "ALLSYM:BHP"),
+                     (fix50.Side.tag, fix50.Side.BUY),
+                     (fix50.OrderQty.tag, 100),
+                     (fix50.Price.tag, 10.25),
+                     (fix50.LastQty.tag, 40),
+                     (fix50.LastPx.tag, 10.24),
+                     (fix50.LeavesQty.tag, 60),
+                     (fix50.CumQty.tag, 40),
+                     (fix50.AvgPx.tag, 10.24),
+                     (fix50.TransactTime.tag, now),
+                     (fix50.Account.tag, "ACC1"),
+                     (fix50.Text.tag, "partial fill")]) \
+        .add_group(fix50.NoPartyIDs.tag, g, lambda m, grp:
+                   [m.add_group_item(grp)
+                        .set_long_name("NoPartyIDs")
+                        .set_seq(i)
+                        .add_field(fix50.PartyID.tag, f"Party{i}")
+                        .add_field(fix50.PartyRole.tag, i) for i in range(1, 4)])
+
+
+def benchmarks() -> List[Tuple[str, Callable[[], object]]]:
+    """Returns: list of (name, operation) message hot path benchmarks"""
+    er_wm = build_execution_report().wire_message
+    er_data = er_wm.SerializeToString()
+    er_msg = Message(er_wm)
+    er_fields = list(er_msg.fields.values())
+    template = MessageTemplate(build_nos(), (fix50.ClOrdID.tag, fix50.Price.tag, fix50.OrderQty.tag))
+
+    def parse():
+        wm = WireMessage()
+        wm.ParseFromString(er_data)
+        return wm
+
+    def parse_remap():
+        msg = Message(parse())
+        return msg.fields, msg.groups
+
+    def field_values():
+        return [Message.field_value(fld) for fld in er_fields]
+
+    batch = [er_data] * 100
+    tags = (fix50.Symbol.tag, fix50.Side.tag, fix50.LastPx.tag, fix50.LastQty.tag, fix50.TransactTime.tag)
+
+    def columns_message():
+        columns = [[] for _ in tags]
+        for data in batch:
+            wm = WireMessage()
+            wm.ParseFromString(data)
+            msg = Message(wm)
+            for col, tag in zip(columns, tags):
+                col.append(msg[tag])
+        return columns
+
+    benches = []
+    try:
+        from UPA.columnar import BatchDecoder
+        decoder = BatchDecoder([BatchDecoder.Column(tag, kind) for tag, kind in zip(tags, (
+            BatchDecoder.STRING, BatchDecoder.STRING, BatchDecoder.FLOAT64, BatchDecoder.FLOAT64, BatchDecoder.DATETIME))])
+        benches = [("columns_message_er_x100", columns_message), ("columns_decode_batch_er_x100", lambda: decoder.decode(batch))]
+    except ImportError:  # numpy is not installed
+        pass
+
+    return [("build_nos_add_field", build_nos),
+            ("build_nos_add_fields", build_nos_fields),
+            ("build_er_add_group", build_execution_report),
+            ("template_stamp_nos", lambda: template.serialize("Ord02", 10.5, 200)),
+            ("serialize_er", er_wm.SerializeToString),
+            ("parse_er", parse),
+            ("parse_header_er", lambda: WireHeader.parse(er_data)),
+            ("parse_remap_er", parse_remap),
+            ("field_value_er", field_values),
+            ("print_wm_er", lambda: Message.Builder.print_wm(er_wm))] + benches
@@ -0,0 +1,116 @@
+# --------------------------------------------------------------------------------------------
+#    ____                      __      ____
+#   /\  _`\   __             /'_ `\   /\  _`\
+#   \ \ \L\_\/\_\    __  _  /\ \L\ \  \ \ \L\ \ _ __    ___
+#    \ \  _\/\/\ \  /\ \/'\ \/_> _ <_  \ \ ,__//\`'__\ / __`\
+#     \ \ \/  \ \ \ \/>  </   /\ \L\ \  \ \ \/ \ \ \/ /\ \L\ \
+#      \ \_\   \ \_\ /\_/\_\  \ \____/   \ \_\  \ \_\ \ \____/
+#       \/_/    \/_/ \//\/_/   \/___/     \/_/   \/_/  \/___/
+#
+#                     Universal FIX Engine
+#
+# Copyright (C) 2017-19 Fix8 Market Technologies Pty Ltd (ABN 29 167 027 198)
+# All Rights Reserved. [http://www.fix8mt.com] <heretohelp@fix8mt.com>
+#
+# THIS FILE IS PROPRIETARY AND  CONFIDENTIAL. NO PART OF THIS FILE MAY BE REPRODUCED,  STORED
+# IN A RETRIEVAL SYSTEM,  OR TRANSMITTED, IN ANY FORM OR ANY MEANS,  ELECTRONIC, PHOTOSTATIC,
+# RECORDED OR OTHERWISE, WITHOUT THE PRIOR AND  EXPRESS WRITTEN  PERMISSION  OF  FIX8  MARKET
+# TECHNOLOGIES PTY LTD.
+#
+# --------------------------------------------------------------------------------------------
+import os
+import tempfile
+import threading
+from typing import Callable, List, Tuple
+
+import zmq
+
+from UPA import *
+from bench_message import build_execution_report, build_nos
+
+
+class _Echo:
+    """In-process peer: REP echoes requests, SUB forwards broadcasts back over PUSH"""
+    def __init__(self, ctx: zmq.Context, rep_endpoint: str, pub_endpoint: str, back_endpoint: str):
+        self._rep = ctx.socket(zmq.REP)
+        self._rep.bind(rep_endpoint)
+        self._sub = ctx.socket(zmq.SUB)
+        self._sub.setsockopt(zmq.SUBSCRIBE, b"")
+        self._sub.connect(pub_endpoint)
+        self._back = ctx.socket(zmq.PUSH)
+        self._back.connect(back_endpoint)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        poller = zmq.Poller()
+        poller.register(self._rep, zmq.POLLIN)
+        poller.register(self._sub, zmq.POLLIN)
+        while True:
+            events = dict(poller.poll())
+            if self._rep in events:
+                frames = self._rep.recv_multipart()
+                self._rep.send_multipart(frames)
+                if len(frames) == 1:
+                    break
+            if self._sub in events:
+                frames = self._sub.recv_multipart()
+                wm = WireMessage()
+                wm.ParseFromString(frames[1])
+                self._back.send(frames[1])
+        for s in (self._rep, self._sub, self._back):
+            s.close(linger=0)
+
+    def join(self):
+        self._thread.join()
+
+
+def benchmarks(transport: str = "inproc") -> Tuple[List[Tuple[str, Callable[[], object]]], Callable[[], None]]:
+    """Round-trip benchmarks over inproc or ipc transport
+    :arg transport "inproc" or "ipc"
+    :returns list of (name, operation) and cleanup function"""
+    ctx = zmq.Context()
+    if transport == "inproc":
+        endpoints = [f"inproc://bench-{name}" for name in ("rep", "pub", "back")]
+    else:
+        tmp = tempfile.mkdtemp(prefix="ufeed-bench-")
+        endpoints = [f"ipc://{os.path.join(tmp, name)}" for name in ("rep", "pub", "back")]
+    back = ctx.socket(zmq.PULL)
+    back.bind(endpoints[2])
+    pub = ctx.socket(zmq.PUB)
+    pub.bind(endpoints[1])
+    echo = _Echo(ctx, *endpoints)
+    req = ctx.socket(zmq.REQ)
+    req.connect(endpoints[0])
+    topic = REQUESTER_TOPIC_DEFAULT.encode()
+    nos = build_nos()
+    er = build_execution_report()
+
+    def req_rep():
+        req.send_multipart((topic, nos.serialize()))
+        wm = WireMessage()
+        wm.ParseFromString(req.recv_multipart()[1])
+        return Message(wm)[COMMON_CLORDID]
+
+    def pub_sub():
+        pub.send_multipart((topic, er.serialize()))
+        wm = WireMessage()
+        wm.ParseFromString(back.recv())
+        return Message(wm)[COMMON_CLORDID]
+
+    # wait for the slow joining subscriber
+    while back.poll(0) == 0:
+        pub.send_multipart((topic, er.serialize()))
+        back.poll(10)
+    while back.poll(10):
+        back.recv()
+
+    def cleanup():
+        req.send_multipart((b"",))
+        req.recv_multipart()
+        echo.join()
+        for s in (req, pub, back):
+            s.close(linger=0)
+        ctx.term()
+
+    return [(f"req_rep_nos_{transport}", req_rep), (f"pub_sub_er_{transport}", pub_sub)], cleanup
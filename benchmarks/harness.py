@@ -0,0 +1,78 @@
+# --------------------------------------------------------------------------------------------
+#    ____                      __      ____
+#   /\  _`\   __             /'_ `\   /\  _`\
+#   \ \ \L\_\/\_\    __  _  /\ \L\ \  \ \ \L\ \ _ __    ___
+#    \ \  _\/\/\ \  /\ \/'\ \/_> _ <_  \ \ ,__//\`'__\ / __`\
+#     \ \ \/  \ \ \ \/>  </   /\ \L\ \  \ \ \/ \ \ \/ /\ \L\ \
+#      \ \_\   \ \_\ /\_/\_\  \ \____/   \ \_\  \ \_\ \ \____/
+#       \/_/    \/_/ \//\/_/   \/___/     \/_/   \/_/  \/___/
+#
+#                     Universal FIX Engine
+#
+# Copyright (C) 2017-19 Fix8 Market Technologies Pty Ltd (ABN 29 167 027 198)
+# All Rights Reserved. [http://www.fix8mt.com] <heretohelp@fix8mt.com>
+#
+# THIS FILE IS PROPRIETARY AND  CONFIDENTIAL. NO PART OF THIS FILE MAY BE REPRODUCED,  STORED
+# IN A RETRIEVAL SYSTEM,  OR TRANSMITTED, IN ANY FORM OR ANY MEANS,  ELECTRONIC, PHOTOSTATIC,
+# RECORDED OR OTHERWISE, WITHOUT THE PRIOR AND  EXPRESS WRITTEN  PERMISSION  OF  FIX8  MARKET
+# TECHNOLOGIES PTY LTD.
+#
+# --------------------------------------------------------------------------------------------
+import time
+from typing import Callable, List, Sequence
+
+
+class Result:
+    """Latency percentiles of a single benchmark, in nanoseconds per operation"""
+    def __init__(self, name: str, samples: List[int]):
+        samples.sort()
+        n = len(samples)
+        self.name: str = name
+        self.number: int = n
+        self.mean: float = sum(samples) / n
+        self.p50: int = samples[n // 2]
+        self.p90: int = samples[min(n - 1, n * 90 // 100)]
+        self.p99: int = samples[min(n - 1, n * 99 // 100)]
+        self.max: int = samples[-1]
+
+    def as_dict(self) -> dict:
+        return dict(self.__dict__)
+
+
+def measure(name: str, fn: Callable[[], object], number: int = 10000, warmup: int = 1000) -> Result:
+    """Times every call of fn individually
+    :arg name benchmark name
+    :arg fn operation to measure
+    :arg number number of measured calls
+    :arg warmup number of calls before measurement
+    :returns percentiles of call latency"""
+    for _ in range(warmup):
+        fn()
+    timer = time.perf_counter_ns
+    samples = [0] * number
+    for i in range(number):
+        start = timer()
+        fn()
+        samples[i] = timer() - start
+    return Result(name, samples)
+
+
+def format_results(results: Sequence[Result]) -> str:
+    """Formats results as a table, latencies in microseconds"""
+    lines = [f"{'benchmark':<32} {'n':>8} {'mean':>10} {'p50':>10} {'p90':>10} {'p99':>10} {'max':>10}"]
+    for r in results:
+        lines.append(f"{r.name:<32} {r.number:>8} {r.mean / 1000:>10.2f} {r.p50 / 1000:>10.2f} {r.p90 / 1000:>10.2f} "
+                     f"{r.p99 / 1000:>10.2f} {r.max / 1000:>10.2f}")
+    return "\n".join(lines)
+
+
+def format_comparison(base: Sequence[dict], other: Sequence[dict], base_name: str, other_name: str) -> str:
+    """Formats p50 latencies of two runs side by side, latencies in microseconds"""
+    others = {r["name"]: r for r in other}
+    lines = [f"{'benchmark':<32} {base_name + ' p50':>14} {other_name + ' p50':>14} {'speedup':>8}"]
+    for r in base:
+        o = others.get(r["name"])
+        if o is None:
+            continue
+        lines.append(f"{r['name']:<32} {r['p50'] / 1000:>14.2f} {o['p50'] / 1000:>14.2f} {r['p50'] / max(o['p50'], 1):>7.2f}x")
+    return "\n".join(lines)
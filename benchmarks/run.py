@@ -0,0 +1,100 @@
+# --------------------------------------------------------------------------------------------
+#    ____                      __      ____
+#   /\  _`\   __             /'_ `\   /\  _`\
+#   \ \ \L\_\/\_\    __  _  /\ \L\ \  \ \ \L\ \ _ __    ___
+#    \ \  _\/\/\ \  /\ \/'\ \/_> _ <_  \ \ ,__//\`'__\ / __`\
+#     \ \ \/  \ \ \ \/>  </   /\ \L\ \  \ \ \/ \ \ \/ /\ \L\ \
+#      \ \_\   \ \_\ /\_/\_\  \ \____/   \ \_\  \ \_\ \ \____/
+#       \/_/    \/_/ \//\/_/   \/___/     \/_/   \/_/  \/___/
+#
+#                     Universal FIX Engine
+#
+# Copyright (C) 2017-19 Fix8 Market Technologies Pty Ltd (ABN 29 167 027 198)
+# All Rights Reserved. [http://www.fix8mt.com] <heretohelp@fix8mt.com>
+#
+# THIS FILE IS PROPRIETARY AND  CONFIDENTIAL. NO PART OF THIS FILE MAY BE REPRODUCED,  STORED
+# IN A RETRIEVAL SYSTEM,  OR TRANSMITTED, IN ANY FORM OR ANY MEANS,  ELECTRONIC, PHOTOSTATIC,
+# RECORDED OR OTHERWISE, WITHOUT THE PRIOR AND  EXPRESS WRITTEN  PERMISSION  OF  FIX8  MARKET
+# TECHNOLOGIES PTY LTD.
+#
+# --------------------------------------------------------------------------------------------
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+CYTHON_DIR = os.path.join(ROOT_DIR, ".build")
+
+
+def run(args) -> list:
+    """Runs benchmarks against UPA found in args.path"""
+    sys.path[:0] = [args.path, BENCH_DIR]
+    from harness import measure
+    import bench_message
+    results = []
+    for name, fn in bench_message.benchmarks():
+        if args.filter in name:
+            results.append(measure(name, fn, args.number, args.warmup))
+    if not args.no_transport:
+        import bench_transport
+        for transport in args.transport:
+            benches, cleanup = bench_transport.benchmarks(transport)
+            try:
+                for name, fn in benches:
+                    if args.filter in name:
+                        results.append(measure(name, fn, args.number, args.warmup))
+            finally:
+                cleanup()
+    if not args.no_gateway:
+        import bench_gateway
+        benches, cleanup = bench_gateway.benchmarks(args.rate)
+        try:
+            for name, fn in benches:
+                if args.filter in name:
+                    results.append(measure(name, fn, args.number, args.warmup))
+        finally:
+            cleanup()
+    return results
+
+
+def run_subprocess(args, path: str) -> list:
+    cmd = [sys.executable, os.path.abspath(__file__), "--json", "--path", path, "--number", str(args.number),
+           "--warmup", str(args.warmup), "--filter", args.filter, "--rate", str(args.rate), "--transport", *args.transport]
+    if args.no_transport:
+        cmd.append("--no-transport")
+    if args.no_gateway:
+        cmd.append("--no-gateway")
+    return json.loads(subprocess.check_output(cmd, cwd=ROOT_DIR))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Runs UPA hot path benchmarks.")
+    parser.add_argument("--path", default=ROOT_DIR, help="directory containing UPA package to benchmark")
+    parser.add_argument("--number", type=int, default=10000, help="measured calls per benchmark")
+    parser.add_argument("--warmup", type=int, default=1000, help="warmup calls per benchmark")
+    parser.add_argument("--filter", default="", help="run only benchmarks containing this substring")
+    parser.add_argument("--transport", nargs="+", default=["inproc", "ipc"], choices=["inproc", "ipc"],
+                        help="transports for round-trip benchmarks")
+    parser.add_argument("--no-transport", action="store_true", help="skip round-trip benchmarks")
+    parser.add_argument("--no-gateway", action="store_true", help="skip UFEedClient/UFEGWClient benchmarks against MockUFEGW")
+    parser.add_argument("--rate", type=float, default=2000, help="MockUFEGW broadcast rate during gateway benchmarks, msg/s")
+    parser.add_argument("--compare", action="store_true",
+                        help=f"compare pure Python against Cython build in {CYTHON_DIR} (see build.py)")
+    parser.add_argument("--json", action="store_true", help="print results as json")
+    args = parser.parse_args()
+    if args.compare:
+        if not os.path.isdir(os.path.join(CYTHON_DIR, "UPA")):
+            sys.exit(f"Cython build not found in {CYTHON_DIR}, run build.py first")
+        sys.path.insert(0, BENCH_DIR)
+        from harness import format_comparison
+        print(format_comparison(run_subprocess(args, ROOT_DIR), run_subprocess(args, CYTHON_DIR), "python", "cython"))
+    else:
+        results = run(args)
+        if args.json:
+            print(json.dumps([r.as_dict() for r in results]))
+        else:
+            from harness import format_results
+            print(format_results(results))
@@ -27,7 +27,7 @@ import glob
 
 class Builder:
     BUILD_TMP = ".build"
-    FILES = ("consts", "message", "ufeapi_pb2", "ufeedclient", "ufegwclient")
+    FILES = ("consts", "fields", "message", "template", "capture", "dispatcher", "requestpool", "tracing", "metrics", "ufeapi_pb2", "ufeedclient", "asyncufeedclient", "ufegwclient", "ufegwmock", "columnar")
     FIX_VERSIONS = ("40", "41", "42", "43", "44", "50", "50sp1", "50sp2")
 
     def __init__(self, ufeed_path):
@@ -23,7 +23,7 @@ from distutils.core import setup
 from distutils.extension import Extension
 from Cython.Build import cythonize
 
-FILES = ("consts", "message", "ufeapi_pb2", "ufeedclient", "ufegwclient")
+FILES = ("consts", "fields", "message", "template", "capture", "dispatcher", "requestpool", "tracing", "metrics", "ufeapi_pb2", "ufeedclient", "asyncufeedclient", "ufegwclient", "ufegwmock", "columnar")
 FIX_VERSIONS = ("40", "41", "42", "43", "44", "50", "50sp1", "50sp2")
 BUILD_TMP = ".build"
 os.chdir(BUILD_TMP)
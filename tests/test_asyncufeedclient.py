@@ -0,0 +1,259 @@
+# --------------------------------------------------------------------------------------------
+#    ____                      __      ____
+#   /\  _`\   __             /'_ `\   /\  _`\
+#   \ \ \L\_\/\_\    __  _  /\ \L\ \  \ \ \L\ \ _ __    ___
+#    \ \  _\/\/\ \  /\ \/'\ \/_> _ <_  \ \ ,__//\`'__\ / __`\
+#     \ \ \/  \ \ \ \/>  </   /\ \L\ \  \ \ \/ \ \ \/ /\ \L\ \
+#      \ \_\   \ \_\ /\_/\_\  \ \____/   \ \_\  \ \_\ \ \____/
+#       \/_/    \/_/ \//\/_/   \/___/     \/_/   \/_/  \/___/
+#
+#                     Universal FIX Engine
+#
+# Copyright (C) 2017-19 Fix8 Market Technologies Pty Ltd (ABN 29 167 027 198)
+# All Rights Reserved. [http://www.fix8mt.com] <heretohelp@fix8mt.com>
+#
+# THIS FILE IS PROPRIETARY AND  CONFIDENTIAL. NO PART OF THIS FILE MAY BE REPRODUCED,  STORED
+# IN A RETRIEVAL SYSTEM,  OR TRANSMITTED, IN ANY FORM OR ANY MEANS,  ELECTRONIC, PHOTOSTATIC,
+# RECORDED OR OTHERWISE, WITHOUT THE PRIOR AND  EXPRESS WRITTEN  PERMISSION  OF  FIX8  MARKET
+# TECHNOLOGIES PTY LTD.
+#
+# --------------------------------------------------------------------------------------------
+import asyncio
+from typing import Callable, List
+
+import pytest
+import zmq
+import zmq.asyncio
+
+from UPA import *
+from UPA.ufeedclient import _unbind
+
+# local connection strings: the client connects to its own REP and PUB sockets w/o external UFEGW app
+_local_conn_strs = {PUBLISHER: 'tcp://*:55767',
+                    SUBSCRIBER: 'tcp://127.0.0.1:55767',
+                    SUBSCRIBER_TOPIC: PUBLISHER_TOPIC_DEFAULT,
+                    RESPONDER: 'tcp://*:55768',
+                    REQUESTER: 'tcp://127.0.0.1:55768',
+                    REQUESTER_TOPIC: RESPONDER_TOPIC_DEFAULT}
+
+
+def generate_logon(uc: AsyncUFEedClient, user: str = "webuser", passw: str = "pass") -> Message.Builder:
+    return uc.create_message() \
+        .set_long_name("login") \
+        .set_type(MsgType.st_system) \
+        .set_service_id(UFE_CMD_LOGIN) \
+        .add_field(UFE_CMD, UFE_CMD_LOGIN) \
+        .add_field(UFE_LOGIN_ID, user) \
+        .add_field(UFE_LOGIN_PW, passw)
+
+
+@pytest.mark.timeout(20)
+@pytest.mark.parametrize("echo_seq", [False, True])
+def test_local_async_req_rep(echo_seq):
+    async def reflect_request(msg: Message) -> Message:
+        await asyncio.sleep(0)
+        return msg
+
+    async def run():
+        async with AsyncUFEedClient(_local_conn_strs, echo_seq=echo_seq) as uc:
+            uc.add_rep_handler(reflect_request)
+            msgs = [generate_logon(uc, user=f"user{i}") for i in range(50)]
+            reps = await asyncio.gather(*[uc.request(msg) for msg in msgs])
+            for msg, rep in zip(msgs, reps):
+                assert msg.seq == 0 and rep.seq != 0
+                msg.seq = rep.seq
+                assert str(msg.build()) == str(rep)
+
+    asyncio.run(run())
+
+
+@pytest.mark.timeout(20)
+def test_local_async_pub_sub():
+    async def run():
+        async with AsyncUFEedClient(_local_conn_strs) as uc:
+            msg = uc.create_message().set_long_name("Test").set_type(MsgType.st_system).set_service_id(1)
+
+            async def first_broadcast():
+                async for m in uc.subscribe():
+                    return m
+
+            task = asyncio.ensure_future(first_broadcast())
+            # first X messages will be skipped due to subscription setup process
+            while not task.done():
+                await uc.publish(msg)
+                await asyncio.sleep(0.01)
+            assert str(msg.build()) == str(task.result())
+
+    asyncio.run(run())
+
+
+@pytest.mark.timeout(20)
+def test_local_async_request_timeout():
+    async def slow_reflect_request(msg: Message) -> Message:
+        if msg[UFE_LOGIN_ID] == "stall":
+            await asyncio.sleep(0.5)
+        return msg
+
+    async def run():
+        async with AsyncUFEedClient(_local_conn_strs, request_timeout=0.1) as uc:
+            uc.add_rep_handler(slow_reflect_request)
+            with pytest.raises(asyncio.TimeoutError):
+                await uc.request(generate_logon(uc, user="stall"))
+            # late response of the timed out request is discarded
+            rep = await uc.request(generate_logon(uc, user="user1"), timeout=5)
+            assert rep[UFE_LOGIN_ID] == "user1"
+
+    asyncio.run(run())
+
+
+@pytest.mark.timeout(20)
+def test_local_async_restart():
+    async def reflect_request(msg: Message) -> Message:
+        return msg
+
+    async def run():
+        uc = AsyncUFEedClient(_local_conn_strs, request_timeout=5)
+        with pytest.raises(ConnectionError):
+            await uc.request(generate_logon(uc))
+        for user in ("user1", "user2"):  # stop() terminates the context, start() makes a new one
+            await uc.start(reflect_request)
+            try:
+                rep = await uc.request(generate_logon(uc, user=user))
+                assert rep[UFE_LOGIN_ID] == user
+            finally:
+                await uc.stop(do_not_send_logout=True)
+                uc.remove_rep_handler(reflect_request)
+
+    asyncio.run(run())
+
+
+class _AsyncScriptedGateway:
+    """Fake UFEGW requester endpoint on the event loop: collects the requests available within 20ms and replies
+    as reply(requests) returns, a list of (request envelope, serialized response) in sending order"""
+    def __init__(self, endpoint: str, reply: Callable[[List[tuple]], List[tuple]]):
+        self._ctx = zmq.asyncio.Context.instance()
+        self._router = self._ctx.socket(zmq.ROUTER)
+        self._router.bind(endpoint)
+        self._reply = reply
+        self.batches: List[int] = []
+        self._task = asyncio.ensure_future(self._run())
+
+    async def _run(self):
+        while True:
+            requests = [await self._router.recv_multipart()]
+            while await self._router.poll(20):
+                requests.append(await self._router.recv_multipart())
+            self.batches.append(len(requests))
+            parsed = []
+            for frames in requests:
+                wm = WireMessage()
+                wm.ParseFromString(frames[-1])
+                parsed.append((frames[:-1], wm))
+            for envelope, data in self._reply(parsed):
+                await self._router.send_multipart(envelope + [data])
+
+    async def close(self):
+        self._task.cancel()
+        await asyncio.wait((self._task,))
+        _unbind(zmq.Socket(zmq.Context.shadow(self._ctx), shadow=self._router.underlying))
+        self._router.close(linger=0)
+
+
+def _login_id(wm: WireMessage) -> str:
+    return next(field.sval.decode() for field in wm.fields if field.tag == UFE_LOGIN_ID)
+
+
+def _without_seq(wm: WireMessage) -> bytes:
+    wm.seq = 0
+    return wm.SerializeToString()
+
+
+@pytest.mark.timeout(20)
+def test_local_async_request_correlation(tmp_path):
+    endpoint = f"ipc://{tmp_path}/gw"
+    conn_strs = {REQUESTER: endpoint, PUBLISHER: f"ipc://{tmp_path}/pub"}
+
+    def reply(requests):
+        return [(envelope, b"\xff\xff" if _login_id(wm) == "malformed" else _without_seq(wm))
+                for envelope, wm in requests]
+
+    async def run():
+        gw = _AsyncScriptedGateway(endpoint, reply)
+        try:
+            # gateway does not echo seq: requests are sent one at a time
+            async with AsyncUFEedClient(conn_strs, request_timeout=5) as uc:
+                users = ["user1", "user2", "malformed", "user3", "user4"]
+                reps = await asyncio.gather(*[uc.request(generate_logon(uc, user=user)) for user in users],
+                                            return_exceptions=True)
+                for user, rep in zip(users, reps):
+                    if user == "malformed":
+                        assert isinstance(rep, Exception)
+                    else:
+                        assert rep[UFE_LOGIN_ID] == user
+                assert max(gw.batches) == 1
+        finally:
+            await gw.close()
+
+        # gateway echoes seq and replies in reverse order: requests are pipelined and correlated by seq
+        gw = _AsyncScriptedGateway(endpoint, lambda requests: [(envelope, wm.SerializeToString())
+                                                               for envelope, wm in reversed(requests)])
+        try:
+            async with AsyncUFEedClient(conn_strs, request_timeout=5, echo_seq=True) as uc:
+                users = [f"user{i}" for i in range(10)]
+                reps = await asyncio.gather(*[uc.request(generate_logon(uc, user=user)) for user in users])
+                assert [rep[UFE_LOGIN_ID] for rep in reps] == users
+                assert max(gw.batches) > 1
+        finally:
+            await gw.close()
+
+    asyncio.run(run())
+
+
+@pytest.mark.timeout(20)
+def test_local_async_request_lost_response(tmp_path):
+    endpoint = f"ipc://{tmp_path}/gw"
+    conn_strs = {REQUESTER: endpoint, PUBLISHER: f"ipc://{tmp_path}/pub"}
+
+    async def run():
+        # non echoing gateway drops the reply to the "lost" request
+        gw = _AsyncScriptedGateway(endpoint, lambda requests: [(envelope, _without_seq(wm))
+                                                               for envelope, wm in requests
+                                                               if _login_id(wm) != "lost"])
+        try:
+            async with AsyncUFEedClient(conn_strs, request_timeout=5) as uc:
+                lost = asyncio.ensure_future(uc.request(generate_logon(uc, user="lost"), timeout=0.3))
+                await asyncio.sleep(0)
+                others = [asyncio.ensure_future(uc.request(generate_logon(uc, user=user)))
+                          for user in ("user1", "user2")]
+                with pytest.raises(asyncio.TimeoutError):
+                    await lost
+                # queued requests are sent over the reset DEALER socket and get their own responses
+                assert [(await rep)[UFE_LOGIN_ID] for rep in others] == ["user1", "user2"]
+
+                # cancelled request in flight resets the DEALER socket too
+                cancelled = asyncio.ensure_future(uc.request(generate_logon(uc, user="lost")))
+                await asyncio.sleep(0.1)
+                cancelled.cancel()
+                rep = await uc.request(generate_logon(uc, user="user3"))
+                assert rep[UFE_LOGIN_ID] == "user3"
+        finally:
+            await gw.close()
+
+    asyncio.run(run())
+
+
+@pytest.mark.timeout(20)
+def test_local_async_rep_handler_restart():
+    async def run():
+        async with AsyncUFEedClient(_local_conn_strs, request_timeout=5) as uc:
+            handler = lambda msg: msg
+            uc.add_rep_handler(handler)
+            for user in ("user1", "user2", "user3"):
+                # responder task rebinds the REP endpoint after the previous one released it
+                uc.remove_rep_handler(handler)
+                uc.add_rep_handler(handler)
+                await asyncio.sleep(0.3)  # DEALER reconnects to the new REP socket
+                rep = await uc.request(generate_logon(uc, user=user))
+                assert rep[UFE_LOGIN_ID] == user
+
+    asyncio.run(run())
@@ -0,0 +1,91 @@
+# --------------------------------------------------------------------------------------------
+#    ____                      __      ____
+#   /\  _`\   __             /'_ `\   /\  _`\
+#   \ \ \L\_\/\_\    __  _  /\ \L\ \  \ \ \L\ \ _ __    ___
+#    \ \  _\/\/\ \  /\ \/'\ \/_> _ <_  \ \ ,__//\`'__\ / __`\
+#     \ \ \/  \ \ \ \/>  </   /\ \L\ \  \ \ \/ \ \ \/ /\ \L\ \
+#      \ \_\   \ \_\ /\_/\_\  \ \____/   \ \_\  \ \_\ \ \____/
+#       \/_/    \/_/ \//\/_/   \/___/     \/_/   \/_/  \/___/
+#
+#                     Universal FIX Engine
+#
+# Copyright (C) 2017-19 Fix8 Market Technologies Pty Ltd (ABN 29 167 027 198)
+# All Rights Reserved. [http://www.fix8mt.com] <heretohelp@fix8mt.com>
+#
+# THIS FILE IS PROPRIETARY AND  CONFIDENTIAL. NO PART OF THIS FILE MAY BE REPRODUCED,  STORED
+# IN A RETRIEVAL SYSTEM,  OR TRANSMITTED, IN ANY FORM OR ANY MEANS,  ELECTRONIC, PHOTOSTATIC,
+# RECORDED OR OTHERWISE, WITHOUT THE PRIOR AND  EXPRESS WRITTEN  PERMISSION  OF  FIX8  MARKET
+# TECHNOLOGIES PTY LTD.
+#
+# --------------------------------------------------------------------------------------------
+import os
+import time
+
+import pytest
+
+import UPA.capture
+from UPA import *
+
+
+def _frames(count: int) -> [bytes]:
+    return [Message.Builder().set_seq(seq).set_service_id(seq % 3).serialize() for seq in range(1, count + 1)]
+
+
+def test_capture_write_read(tmp_path):
+    frames = _frames(100)
+    with CaptureWriter(str(tmp_path), segment_size=512) as capture:
+        for i, frame in enumerate(frames):
+            capture.append(frame, timestamp_ns=1000 * (i + 1))
+        assert capture.records == 100 and capture.bytes == sum(map(len, frames))
+    assert len([f for f in os.listdir(tmp_path) if f.endswith(".seg")]) > 1
+    reader = CaptureReader(str(tmp_path))
+    assert len(reader) == 100
+    assert list(reader.records()) == [(1000 * (i + 1), frame) for i, frame in enumerate(frames)]
+    assert [ts for ts, _ in reader.records(start_ns=50500, end_ns=60000)] == list(range(51000, 60001, 1000))
+    assert list(reader.records(start_ns=10 ** 9)) == []
+
+    # appending to an existing capture adds segments
+    with CaptureWriter(str(tmp_path), segment_size=512) as capture:
+        capture.append(frames[0], timestamp_ns=10 ** 6)
+    assert list(CaptureReader(str(tmp_path)).records(start_ns=10 ** 6)) == [(10 ** 6, frames[0])]
+
+
+def test_capture_read_while_writing(tmp_path, monkeypatch):
+    capture = CaptureWriter(str(tmp_path))
+    for frame in _frames(10):
+        capture.append(frame)
+    capture.flush()
+    assert len(list(CaptureReader(str(tmp_path)).records())) == 10
+
+    # record is not visible to readers until its timestamp, written last, is set
+    class _Interrupted:
+        size = 8
+
+        @staticmethod
+        def pack_into(*args):
+            raise InterruptedError()
+
+    with monkeypatch.context() as m:
+        m.setattr(UPA.capture, "_TIMESTAMP", _Interrupted)
+        with pytest.raises(InterruptedError):
+            capture.append(_frames(11)[-1])
+    capture.flush()
+    assert len(list(CaptureReader(str(tmp_path)).records())) == 10
+    capture.close()
+    with pytest.raises(ValueError):
+        capture.append(b"")
+
+
+def test_capture_replay_speed(tmp_path):
+    with CaptureWriter(str(tmp_path)) as capture:
+        for i, frame in enumerate(_frames(5)):
+            capture.append(frame, timestamp_ns=(i + 1) * 50_000_000)
+    replayed = []
+    reader = CaptureReader(str(tmp_path))
+    start = time.perf_counter()
+    assert reader.replay(replayed.append, speed=2.0) == 5
+    assert 0.09 < time.perf_counter() - start < 1.0  # 200ms recorded at twice the speed
+    assert [WireHeader.parse(frame).seq for frame in replayed] == [1, 2, 3, 4, 5]
+    start = time.perf_counter()
+    assert reader.replay(replayed.append) == 5
+    assert time.perf_counter() - start < 0.05
@@ -0,0 +1,133 @@
+# --------------------------------------------------------------------------------------------
+#    ____                      __      ____
+#   /\  _`\   __             /'_ `\   /\  _`\
+#   \ \ \L\_\/\_\    __  _  /\ \L\ \  \ \ \L\ \ _ __    ___
+#    \ \  _\/\/\ \  /\ \/'\ \/_> _ <_  \ \ ,__//\`'__\ / __`\
+#     \ \ \/  \ \ \ \/>  </   /\ \L\ \  \ \ \/ \ \ \/ /\ \L\ \
+#      \ \_\   \ \_\ /\_/\_\  \ \____/   \ \_\  \ \_\ \ \____/
+#       \/_/    \/_/ \//\/_/   \/___/     \/_/   \/_/  \/___/
+#
+#                     Universal FIX Engine
+#
+# Copyright (C) 2017-19 Fix8 Market Technologies Pty Ltd (ABN 29 167 027 198)
+# All Rights Reserved. [http://www.fix8mt.com] <heretohelp@fix8mt.com>
+#
+# THIS FILE IS PROPRIETARY AND  CONFIDENTIAL. NO PART OF THIS FILE MAY BE REPRODUCED,  STORED
+# IN A RETRIEVAL SYSTEM,  OR TRANSMITTED, IN ANY FORM OR ANY MEANS,  ELECTRONIC, PHOTOSTATIC,
+# RECORDED OR OTHERWISE, WITHOUT THE PRIOR AND  EXPRESS WRITTEN  PERMISSION  OF  FIX8  MARKET
+# TECHNOLOGIES PTY LTD.
+#
+# --------------------------------------------------------------------------------------------
+import uuid
+from datetime import datetime
+
+import pytest
+
+from UPA import *
+from UPA import FIX50SP2_Fields as fix50
+
+np = pytest.importorskip("numpy")
+from UPA.columnar import BatchDecoder  # noqa: E402
+
+
+def _frames() -> [bytes]:
+    frames = []
+    for seq in range(1, 6):
+        msg = FIXMessage.Builder().set_long_name("ExecutionReport").set_seq(seq) \
+            .add_field(fix50.Symbol.tag, f"SYM{seq}") \
+            .add_field(fix50.LastPx.tag, 10. + seq / 4) \
+            .add_field(fix50.LastQty.tag, seq * 100) \
+            .add_field(fix50.TransactTime.tag, datetime(2020, 1, 10, 15, 4, seq)) \
+            .add_field(fix50.PossDupFlag.tag, seq % 2 == 0) \
+            .add_field(UFE_SESSION_TOKEN, uuid.UUID(int=seq), Location.fl_system)
+        if seq != 3:
+            msg.add_field(fix50.Price.tag, -seq)
+        msg.add_group(fix50.NoPartyIDs.tag, Message.Builder.GroupRef(), lambda m, grp:
+                      m.add_group_item(grp).add_field(fix50.Symbol.tag, "IN_GROUP"))
+        frames.append(msg.serialize())
+    frames.append(SysMessage.Builder().set_long_name("heartbeat").add_field(fix50.Symbol.tag, "SYS").serialize())
+    return frames
+
+
+def test_batch_decode_columns():
+    C = BatchDecoder.Column
+    decoder = BatchDecoder([C(fix50.Symbol.tag, BatchDecoder.STRING, "symbol"),
+                            C(fix50.Symbol.tag, BatchDecoder.BYTES, "symbol_bytes"),
+                            C(fix50.LastPx.tag, BatchDecoder.FLOAT64, "px"),
+                            C(fix50.LastQty.tag, BatchDecoder.FLOAT64, "qty"),
+                            C(fix50.LastQty.tag, BatchDecoder.INT64, "qty_int"),
+                            C(fix50.Price.tag, BatchDecoder.INT64),
+                            C(fix50.TransactTime.tag, BatchDecoder.DATETIME, "time"),
+                            C(fix50.PossDupFlag.tag, BatchDecoder.BOOL, "dup"),
+                            C(UFE_SESSION_TOKEN, BatchDecoder.BYTES, "token")], header=("seq", "long_name"))
+    frames = _frames()
+    batch = decoder.decode(iter(frames))
+    assert len(batch) == 6
+    assert batch["symbol"].tolist() == ["SYM1", "SYM2", "SYM3", "SYM4", "SYM5", "SYS"]
+    assert batch["symbol_bytes"][0] == b"SYM1"
+    assert batch["px"].dtype == np.float64 and batch["px"][:5].tolist() == [10.25, 10.5, 10.75, 11., 11.25]
+    assert np.isnan(batch["px"][5]) and not batch.valid["px"][5]
+    assert batch["qty"].tolist()[:5] == [100., 200., 300., 400., 500.] and batch["qty_int"].dtype == np.int64
+    assert batch[str(fix50.Price.tag)].tolist() == [-1, -2, 0, -4, -5, 0]
+    assert batch.valid[str(fix50.Price.tag)].tolist() == [True, True, False, True, True, False]
+    assert batch["time"].dtype == np.dtype("datetime64[ns]")
+    assert batch["time"][1] == np.datetime64("2020-01-10T15:04:02")
+    assert np.isnat(batch["time"][5])
+    # proto3 omits false bools, present but default fields decode as defaults and are valid
+    assert batch["dup"].tolist() == [False, True, False, True, False, False]
+    assert batch["token"][4] == uuid.UUID(int=5).bytes
+    assert batch["seq"].tolist() == [1, 2, 3, 4, 5, 0]
+    assert batch["long_name"][5] == "heartbeat"
+
+    # columns match Message decoding
+    for i, data in enumerate(frames[:5]):
+        wm = WireMessage()
+        wm.ParseFromString(data)
+        msg = Message(wm)
+        assert (batch["symbol"][i], batch["px"][i]) == (msg[fix50.Symbol.tag], msg[fix50.LastPx.tag])
+
+
+def test_batch_decode_field_type_mismatch():
+    C = BatchDecoder.Column
+    decoder = BatchDecoder([C(fix50.LastPx.tag, BatchDecoder.INT64, "px_int"),
+                            C(fix50.Symbol.tag, BatchDecoder.FLOAT64, "symbol_float"),
+                            C(fix50.LastPx.tag, BatchDecoder.STRING, "px_str"),
+                            C(fix50.LastQty.tag, BatchDecoder.DATETIME, "qty_time"),
+                            C(fix50.Symbol.tag, BatchDecoder.BOOL, "symbol_bool")])
+    batch = decoder.decode(_frames()[:5])
+    # doubles are truncated to int, not replaced by their precision
+    assert batch["px_int"].tolist() == [10, 10, 10, 11, 11] and batch.valid["px_int"].all()
+    # fields of other types are invalid
+    assert np.isnan(batch["symbol_float"]).all() and not batch.valid["symbol_float"].any()
+    assert batch["px_str"].tolist() == [None] * 5 and not batch.valid["px_str"].any()
+    assert np.isnat(batch["qty_time"]).all() and not batch.valid["qty_time"].any()
+    assert not batch.valid["symbol_bool"].any()
+
+    nan = FIXMessage.Builder().add_field(fix50.LastPx.tag, float("nan")).serialize()
+    assert not decoder.decode([nan]).valid["px_int"][0]
+
+
+def test_batch_decode_filter_empty():
+    decoder = BatchDecoder([BatchDecoder.Column(fix50.Symbol.tag, BatchDecoder.STRING, "symbol")],
+                           filter=WireHeader.Filter(long_name="ExecutionReport"))
+    assert decoder.decode(_frames())["symbol"].tolist() == ["SYM1", "SYM2", "SYM3", "SYM4", "SYM5"]
+    batch = decoder.decode([])
+    assert len(batch) == 0 and batch["symbol"].shape == (0,) and batch.valid["symbol"].shape == (0,)
+    with pytest.raises(ValueError):
+        BatchDecoder.Column(1, "decimal")
+    with pytest.raises(ValueError):
+        BatchDecoder([BatchDecoder.Column(55, BatchDecoder.STRING, "seq")], header=("seq",))
+    with pytest.raises(ValueError):
+        BatchDecoder([], header=("fields",))
+
+
+def test_batch_to_arrow():
+    pa = pytest.importorskip("pyarrow")
+    decoder = BatchDecoder([BatchDecoder.Column(fix50.Symbol.tag, BatchDecoder.STRING, "symbol"),
+                            BatchDecoder.Column(fix50.Price.tag, BatchDecoder.INT64, "price"),
+                            BatchDecoder.Column(fix50.TransactTime.tag, BatchDecoder.DATETIME, "time")], header=("seq",))
+    table = decoder.decode(_frames()).to_arrow()
+    assert table.num_rows == 6 and table.column_names == ["symbol", "price", "time", "seq"]
+    assert table.schema.field("time").type == pa.timestamp("ns")
+    assert table.column("price").to_pylist() == [-1, -2, None, -4, -5, None]
+    assert table.column("seq").null_count == 0
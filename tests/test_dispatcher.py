@@ -0,0 +1,108 @@
+# --------------------------------------------------------------------------------------------
+#    ____                      __      ____
+#   /\  _`\   __             /'_ `\   /\  _`\
+#   \ \ \L\_\/\_\    __  _  /\ \L\ \  \ \ \L\ \ _ __    ___
+#    \ \  _\/\/\ \  /\ \/'\ \/_> _ <_  \ \ ,__//\`'__\ / __`\
+#     \ \ \/  \ \ \ \/>  </   /\ \L\ \  \ \ \/ \ \ \/ /\ \L\ \
+#      \ \_\   \ \_\ /\_/\_\  \ \____/   \ \_\  \ \_\ \ \____/
+#       \/_/    \/_/ \//\/_/   \/___/     \/_/   \/_/  \/___/
+#
+#                     Universal FIX Engine
+#
+# Copyright (C) 2017-19 Fix8 Market Technologies Pty Ltd (ABN 29 167 027 198)
+# All Rights Reserved. [http://www.fix8mt.com] <heretohelp@fix8mt.com>
+#
+# THIS FILE IS PROPRIETARY AND  CONFIDENTIAL. NO PART OF THIS FILE MAY BE REPRODUCED,  STORED
+# IN A RETRIEVAL SYSTEM,  OR TRANSMITTED, IN ANY FORM OR ANY MEANS,  ELECTRONIC, PHOTOSTATIC,
+# RECORDED OR OTHERWISE, WITHOUT THE PRIOR AND  EXPRESS WRITTEN  PERMISSION  OF  FIX8  MARKET
+# TECHNOLOGIES PTY LTD.
+#
+# --------------------------------------------------------------------------------------------
+import os
+import threading
+import time
+
+import pytest
+import zmq
+
+from UPA import *
+
+
+def _make_wm(service_id: int, seq: int) -> WireMessage:
+    return Message.Builder().set_service_id(service_id).set_seq(seq).wire_message
+
+
+@pytest.mark.timeout(20)
+def test_dispatcher_per_key_ordering():
+    received: {int, [int]} = {}
+    lock = threading.Lock()
+
+    def handler(msg: Message):
+        time.sleep(0.0001)
+        with lock:
+            received.setdefault(msg.service_id, []).append(msg.seq)
+
+    dispatcher = SubscriberDispatcher(workers=4, queue_size=10)
+    for seq in range(1, 201):
+        assert dispatcher.dispatch([handler], _make_wm(seq % 8, seq))
+    dispatcher.shutdown()
+    stats = dispatcher.stats()
+    assert stats["dispatched"] == 200 and stats["dropped"] == 0 and stats["errors"] == 0
+    assert stats["max_queue_depth"] <= 10
+    assert sorted(received.keys()) == list(range(8))
+    for service_id, seqs in received.items():
+        assert seqs == sorted(seqs) and len(seqs) == 25
+
+
+@pytest.mark.timeout(20)
+def test_dispatcher_drop_when_full():
+    release = threading.Event()
+    dispatcher = SubscriberDispatcher(workers=1, queue_size=2, block=False)
+    dispatched = [dispatcher.dispatch([lambda msg: release.wait()], _make_wm(1, seq)) for seq in range(1, 11)]
+    release.set()
+    dispatcher.shutdown()
+    stats = dispatcher.stats()
+    assert stats["dropped"] == dispatched.count(False) and stats["dropped"] >= 7
+    assert stats["dispatched"] + stats["dropped"] == 10
+
+
+class _ShardRecorder:
+    """ Picklable subscriber handler reporting (pid, symbol, seq) of handled messages back to the test process """
+    def __init__(self, endpoint: str):
+        self._endpoint = endpoint
+        self._socket = None
+
+    def __getstate__(self):
+        return {"_endpoint": self._endpoint, "_socket": None}
+
+    def __call__(self, msg: Message):
+        if self._socket is None:
+            self._socket = zmq.Context.instance().socket(zmq.PUSH)
+            self._socket.connect(self._endpoint)
+        self._socket.send_pyobj((os.getpid(), msg[55], msg.seq))
+
+
+@pytest.mark.timeout(60)
+def test_sharded_dispatcher_per_key_ordering():
+    pull_socket = zmq.Context.instance().socket(zmq.PULL)
+    port = pull_socket.bind_to_random_port("tcp://127.0.0.1")
+    recorder = _ShardRecorder(f"tcp://127.0.0.1:{port}")
+    unpicklable = lambda msg: None
+    dispatcher = ShardedDispatcher(workers=3, key=ShardedDispatcher.by_tag(55))
+    try:
+        for seq in range(1, 121):
+            msg = Message.Builder().set_seq(seq).add_field(55, f"SYM{seq % 6}")
+            assert dispatcher.dispatch([recorder, unpicklable], msg.serialize())
+        received = [pull_socket.recv_pyobj() for _ in range(120)]
+    finally:
+        dispatcher.shutdown()
+        pull_socket.close(linger=0)
+    stats = dispatcher.stats()
+    assert stats["dispatched"] == 120 and stats["dropped"] == 0 and stats["errors"] == 1  # unpicklable
+    symbols: {str, [int]} = {}
+    for pid, symbol, seq in received:
+        symbols.setdefault((symbol, pid), []).append(seq)
+    # every symbol is handled by a single worker in order
+    assert sorted(symbol for symbol, pid in symbols) == [f"SYM{i}" for i in range(6)]
+    for seqs in symbols.values():
+        assert seqs == sorted(seqs) and len(seqs) == 20
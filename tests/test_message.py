@@ -131,3 +131,119 @@ def test_message():
     assert len(gg1[1].fields) == 2 and gg1[1].seq == 3
     assert len(gg2[0].fields) == 1 and gg1[0].seq == 1
     assert len(gg2[0].groups) == 1
+
+
+@pytest.mark.timeout(20)
+def test_message_lazy_remap():
+    wm = FIXMessage.Builder() \
+        .set_long_name("ExecutionReport") \
+        .set_name(fix50.MsgType.EXECUTIONREPORT) \
+        .set_service_id(6) \
+        .add_field(fix50.ClOrdID.tag, "123") \
+        .add_group(fix50.NoPartyIDs.tag, Message.Builder.GroupRef(), lambda m, grp:
+                   m.add_group_item(grp).add_field(fix50.PartyID.tag, "Party1")) \
+        .wire_message
+    wm2 = WireMessage()
+    wm2.ParseFromString(wm.SerializeToString())
+    msg = Message(wm2)
+    assert msg.long_name == "ExecutionReport" and msg.service_id == 6
+    assert msg._mapped is None
+    assert msg[fix50.ClOrdID.tag] == "123"
+    assert len(msg.fields) == 1 and len(msg.groups) == 1
+    # fields and groups are published together by a single assignment
+    assert (msg.fields, msg.groups) == msg._mapped
+    assert msg[fix50.NoPartyIDs.tag][0][fix50.PartyID.tag] == "Party1"
+
+
+@pytest.mark.timeout(20)
+def test_wire_header():
+    wm = FIXMessage.Builder() \
+        .set_name(fix50.MsgType.EXECUTIONREPORT) \
+        .set_long_name("ExecutionReport") \
+        .set_seq(2889) \
+        .set_service_id(-6) \
+        .set_sub_service_id(70000) \
+        .add_field(fix50.ClOrdID.tag, "123") \
+        .wire_message
+    hdr = WireHeader.parse(wm.SerializeToString())
+    assert hdr.name == wm.name and hdr.long_name == wm.longname and hdr.seq == wm.seq
+    assert hdr.type == MsgType.st_fixmsg and hdr.service_id == -6 and hdr.sub_service_id == 70000
+    assert WireHeader.Filter(long_name="ExecutionReport", service_id=(-6, 7)).matches(hdr)
+    assert not WireHeader.Filter(long_name="ExecutionReport", msg_type=MsgType.st_system).matches(hdr)
+    assert not WireHeader.Filter()
+    empty = WireHeader.parse(WireMessage().SerializeToString())
+    assert empty.name == "" and empty.service_id == 0
+
+
+@pytest.mark.timeout(20)
+def test_message_custom_encoder_decoder():
+    from decimal import Decimal
+
+    class Qty(float):
+        pass
+
+    def encode_decimal(fld: UFEField, val: Decimal, precision: int):
+        fld.sval = str(val).encode()
+        fld.type = FieldType.ft_string
+
+    Message.Builder.register_encoder(Decimal, encode_decimal)
+    msg = FIXMessage.Builder() \
+        .add_field(fix50.Price.tag, Decimal("111.22")) \
+        .add_field(fix50.OrderQty.tag, Qty(33.5)) \
+        .build()
+    assert msg[fix50.Price.tag] == "111.22"
+    assert msg[fix50.OrderQty.tag] == 33.5 and msg.fields[fix50.OrderQty.tag].type == FieldType.ft_double
+
+    default_decoder = Message._decoders[FieldType.ft_string]
+    Message.register_decoder(FieldType.ft_string, lambda fld: Decimal(fld.sval.decode('utf-8')))
+    try:
+        assert msg[fix50.Price.tag] == Decimal("111.22")
+    finally:
+        Message.register_decoder(FieldType.ft_string, default_decoder)
+        del Message.Builder._encoders[Decimal]
+
+
+def test_lazy_fix_fields():
+    import subprocess
+    import sys
+    code = "import sys\n" \
+           "from UPA import *\n" \
+           "loaded = lambda: sorted(m for m in sys.modules if m.startswith('UPA.ufe_py_fields_'))\n" \
+           "assert loaded() == [], loaded()\n" \
+           "assert FIX44_Fields.Side.BUY == '1' and FIX44_Fields.Side.tag == 54\n" \
+           "assert loaded() == ['UPA.ufe_py_fields_fix44'], loaded()\n" \
+           "assert 'Side' in dir(FIX44_Fields)\n"
+    subprocess.run([sys.executable, "-c", code], check=True)
+    with pytest.raises(AttributeError):
+        FIX50SP2_Fields.NoSuchField
+
+
+def test_fix_field_dictionary():
+    assert fix50.Side.tag == 54 and fix50.Side.BUY == "1" and fix50.Side.type == "CHAR"
+    assert fix50.tag_name(54) == "Side" and fix50.name_tag("Side") == 54
+    assert fix50.value_name(54, "1") == "BUY" and fix50.Side.value_name("2") == "SELL"
+    assert fix50.value_name(54, "?") is None and fix50.tag_name(999999) is None
+    assert fix50.field(54) is fix50.field("Side")
+    assert 54 in fix50 and "Side" in fix50 and "NoSuchField" not in fix50
+    assert fix50.PartyRole.values["EXECUTING_FIRM"] == 1
+    with pytest.raises(AttributeError):
+        fix50.Side.NO_SUCH_VALUE
+
+    msg = FIXMessage.Builder().add_field(fix50.Side.tag, fix50.Side.BUY).build()
+    assert "54 Side (body): 1 (BUY)" in msg.print(fix50)
+    assert "54 (body): 1\n" in msg.print()
+
+
+def test_wire_header_field_value():
+    msg = FIXMessage.Builder().set_service_id(3).add_field(11, "CL1").add_field(38, 100).add_field(44, 1.5) \
+        .add_field(54, True).add_field(60, -5)
+    grp = Message.Builder.GroupRef()
+    msg.add_group(78, grp, lambda m, g: m.add_group_item(g).add_field(79, "ACC"))
+    data = msg.serialize()
+    assert WireHeader.field_value(data, 11) == b"CL1"
+    assert WireHeader.field_value(data, 38) == 100
+    assert WireHeader.field_value(data, 44) == 1.5
+    assert WireHeader.field_value(data, 54) == 1
+    assert WireHeader.field_value(data, 60) == -5
+    assert WireHeader.field_value(data, 79) is None  # nested in group
+    assert WireHeader.field_value(data, 55) is None
@@ -0,0 +1,82 @@
+# --------------------------------------------------------------------------------------------
+#    ____                      __      ____
+#   /\  _`\   __             /'_ `\   /\  _`\
+#   \ \ \L\_\/\_\    __  _  /\ \L\ \  \ \ \L\ \ _ __    ___
+#    \ \  _\/\/\ \  /\ \/'\ \/_> _ <_  \ \ ,__//\`'__\ / __`\
+#     \ \ \/  \ \ \ \/>  </   /\ \L\ \  \ \ \/ \ \ \/ /\ \L\ \
+#      \ \_\   \ \_\ /\_/\_\  \ \____/   \ \_\  \ \_\ \ \____/
+#       \/_/    \/_/ \//\/_/   \/___/     \/_/   \/_/  \/___/
+#
+#                     Universal FIX Engine
+#
+# Copyright (C) 2017-19 Fix8 Market Technologies Pty Ltd (ABN 29 167 027 198)
+# All Rights Reserved. [http://www.fix8mt.com] <heretohelp@fix8mt.com>
+#
+# THIS FILE IS PROPRIETARY AND  CONFIDENTIAL. NO PART OF THIS FILE MAY BE REPRODUCED,  STORED
+# IN A RETRIEVAL SYSTEM,  OR TRANSMITTED, IN ANY FORM OR ANY MEANS,  ELECTRONIC, PHOTOSTATIC,
+# RECORDED OR OTHERWISE, WITHOUT THE PRIOR AND  EXPRESS WRITTEN  PERMISSION  OF  FIX8  MARKET
+# TECHNOLOGIES PTY LTD.
+#
+# --------------------------------------------------------------------------------------------
+import pytest
+
+from UPA import *
+fix50 = FIX50SP2_Fields
+
+
+def _nos(cl_ord_id: str, price: float, qty: int, now: datetime, poss_dup: bool = False) -> Message.Builder:
+    return FIXMessage.Builder() \
+        .set_long_name("NewOrderSingle") \
+        .set_name(fix50.MsgType.NEWORDERSINGLE) \
+        .set_service_id(6) \
+        .add_field(fix50.ClOrdID.tag, cl_ord_id) \
+        .add_field(fix50.Symbol.tag, "BHP") \
+        .add_field(fix50.Price.tag, price, precision=4) \
+        .add_field(fix50.OrderQty.tag, qty) \
+        .add_field(fix50.Side.tag, fix50.Side.BUY) \
+        .add_field(fix50.TransactTime.tag, now) \
+        .add_field(fix50.PossDupFlag.tag, poss_dup) \
+        .add_field(UFE_STATUS_CODE, Message.Status(UFE_OK), Location.fl_system)
+
+
+@pytest.mark.timeout(20)
+def test_template_stamp():
+    now = datetime.now()
+    tmpl = MessageTemplate(_nos("", 0., 0, now),
+                           (fix50.Price.tag, fix50.ClOrdID.tag, fix50.OrderQty.tag, fix50.TransactTime.tag, fix50.PossDupFlag.tag))
+    for i, price in enumerate((111.22, -1.5, 0.)):
+        stamp = tmpl.stamp(price, f"Ord{i}", i * 10 - 10, now, i % 2 == 1)
+        assert stamp.service_id == 6
+        expected = _nos(f"Ord{i}", price, i * 10 - 10, now, i % 2 == 1).build()
+        msg = stamp.build()
+        assert str(msg) == str(expected)
+        assert msg[fix50.Price.tag] == price and msg.fields[fix50.Price.tag].ival == 4
+        assert msg[fix50.TransactTime.tag] == now
+        assert msg[UFE_STATUS_CODE] == Message.Status(UFE_OK)
+
+
+@pytest.mark.timeout(20)
+def test_template_serialize_matches_builder():
+    now = datetime.now()
+    tmpl = MessageTemplate(_nos("", 1., 1, now), (fix50.ClOrdID.tag, fix50.Price.tag, fix50.OrderQty.tag))
+    wm = WireMessage()
+    wm.ParseFromString(tmpl.serialize("Ord1", 10.25, 100))
+    assert wm == _nos("Ord1", 10.25, 100, now).wire_message
+    stamp = tmpl.stamp("Ord2", 10.5, 200).add_field(fix50.Account.tag, "ACC1")
+    assert stamp.build()[fix50.Account.tag] == "ACC1" and stamp.build()[fix50.ClOrdID.tag] == "Ord2"
+    with pytest.raises(KeyError):
+        MessageTemplate(_nos("", 1., 1, now), (fix50.Account.tag,))
+    with pytest.raises(ValueError):
+        MessageTemplate(_nos("", 1., 1, now), (fix50.ClOrdID.tag, fix50.ClOrdID.tag))
+
+
+@pytest.mark.timeout(20)
+def test_template_value_count():
+    tmpl = MessageTemplate(_nos("", 1., 1, datetime.now()), (fix50.ClOrdID.tag, fix50.OrderQty.tag))
+    # missing values would drop variable fields, extra values would be ignored
+    with pytest.raises(ValueError):
+        tmpl.stamp("Ord1")
+    with pytest.raises(ValueError):
+        tmpl.stamp("Ord1", 1, 2, 3)
+    with pytest.raises(ValueError):
+        tmpl.serialize()
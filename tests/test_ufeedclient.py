@@ -21,16 +21,22 @@
 from typing import Optional
 
 import pytest
+import zmq
 
 from UPA import *
+from UPA.ufeedclient import _unbind
+import logging
 import re
 import time
+import threading
+import urllib.request
 
 
 class Env:
     def __init__(self, conn_strs):
         # SETUP / TESTING
-        self._uc = UFEedClient(conn_strs)
+        # the client responds to itself by reflecting requests, so request seq is echoed
+        self._uc = UFEedClient(conn_strs, echo_seq=True)
 
         # setup capture list to capture subscriber messages
         self._capture: [Message] = []
@@ -133,3 +139,489 @@ def test_local_load_pub_sub():
     time.sleep(1)
     assert len(_local_env.captured_messages) >= len(msgs) - len(msgs) * 0.1 # possible loss of fist X messages
 
+
+
+@pytest.mark.usefixtures('local_env_setup', scope='session')
+@pytest.mark.timeout(20)
+def test_local_req_rep_async():
+    uc = _local_env.ufeedclient
+    msgs = [_local_env.generate_logon(user=f"user{i}") for i in range(100)]
+    futures = [uc.request_async(msg) for msg in msgs]
+    seqs = set()
+    for msg, fut in zip(msgs, futures):
+        msg_rep = fut.result(timeout=5)
+        assert msg_rep[UFE_LOGIN_ID] == msg.build()[UFE_LOGIN_ID]
+        assert msg.seq == 0 and msg_rep.seq not in seqs
+        seqs.add(msg_rep.seq)
+
+
+@pytest.mark.usefixtures('local_env_setup', scope='session')
+@pytest.mark.timeout(20)
+def test_local_request_pool():
+    uc = _local_env.ufeedclient
+    pool = uc.create_request_pool(4)
+    uc.stats(reset=True)
+    errors = []
+
+    def worker(i):
+        for j in range(25):
+            msg = _local_env.generate_logon(user=f"user{i}-{j}")
+            if pool.request(msg, timeout=5)[UFE_LOGIN_ID] != f"user{i}-{j}":
+                errors.append((i, j))
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    stats = pool.stats()
+    assert stats["size"] == 4 and stats["requests"] == 200 and stats["errors"] == 0
+    assert 1 <= stats["max_in_use"] <= 4 and stats["in_use"] == 0
+    assert 0.0 < stats["utilisation"] <= 1.0
+    # pool round trips are recorded into the client metrics
+    stats = uc.stats()
+    assert stats["requests_sent"] == 200 and stats["replies_received"] == 200 and stats["request_errors"] == 0
+    assert stats["request_rtt_ns"]["count"] == 200
+    with urllib.request.urlopen(f"http://127.0.0.1:{uc.start_metrics_server().port}/metrics", timeout=5) as rsp:
+        assert "ufeedclient_requests_sent_total 200\n" in rsp.read().decode()
+    pool.close()
+    assert pool.in_use == 0
+    with pytest.raises(ConnectionAbortedError):
+        pool.request(_local_env.generate_logon())
+
+
+@pytest.mark.usefixtures('local_env_setup', scope='session')
+@pytest.mark.timeout(20)
+def test_local_pub_sub_filter():
+    uc = _local_env.ufeedclient
+    filtered: [Message] = []
+    uc.add_sub_handler(filtered.append, long_name="Test", service_id=(2, 3))
+    msgs = [uc.create_message().set_long_name("Test").set_type(MsgType.st_system).set_service_id(i % 4) for i in range(4)]
+    # first X message will be skipped due to subscription setup process
+    while len(filtered) < 10:
+        for msg in msgs:
+            uc.publish(msg)
+        time.sleep(0.001)
+    assert all(msg.service_id in (2, 3) for msg in filtered)
+    assert any(msg.service_id not in (2, 3) for msg in _local_env.captured_messages)
+    uc.remove_sub_handler(filtered.append)
+
+
+@pytest.mark.usefixtures('local_env_setup', scope='session')
+@pytest.mark.timeout(20)
+def test_local_publish_many():
+    uc = _local_env.ufeedclient
+    _local_env.captured_messages.clear()
+    msgs = [uc.create_message().set_long_name("Test").set_type(MsgType.st_system).set_service_id(i) for i in range(1, 11)]
+    # first X batches will be skipped due to subscription setup process
+    while len(_local_env.captured_messages) == 0:
+        assert uc.publish_many(msgs) == len(msgs)
+        time.sleep(0.01)
+    time.sleep(0.1)
+    assert str(msgs[-1].build()) == str(_local_env.captured_messages[-1])
+
+
+@pytest.mark.usefixtures('local_env_setup', scope='session')
+@pytest.mark.timeout(20)
+def test_local_pub_sub_dispatcher():
+    uc = _local_env.ufeedclient
+    dispatcher = SubscriberDispatcher(workers=2)
+    uc.set_sub_dispatcher(dispatcher)
+    _local_env.captured_messages.clear()
+    msg = uc.create_message().set_long_name("Test").set_type(MsgType.st_system).set_service_id(1)
+    # first X message will be skipped due to subscription setup process
+    while len(_local_env.captured_messages) == 0:
+        uc.publish(msg)
+        time.sleep(0.001)
+    assert dispatcher.stats()["dispatched"] > 0
+    assert str(msg.build()) == str(_local_env.captured_messages[0])
+
+    # replaced dispatcher is shut down once the subscriber thread no longer uses it
+    dispatched = dispatcher.stats()["dispatched"]
+    shutdown, shutdowns = dispatcher.shutdown, []
+    dispatcher.shutdown = lambda: shutdowns.append(shutdown())
+    uc.set_sub_dispatcher(SubscriberDispatcher(workers=2))
+    while not shutdowns:  # by the subscriber thread before its next batch
+        uc.publish(msg)
+        time.sleep(0.01)
+    assert dispatcher.stats()["dispatched"] == dispatched
+
+
+class _RecordingDispatcher(SubscriberDispatcher):
+    """SubscriberDispatcher recording the threads that ran handlers and its shutdown"""
+    def __init__(self):
+        super().__init__(workers=1)
+        self.shut_down = threading.Event()
+
+    def shutdown(self) -> None:
+        super().shutdown()
+        self.shut_down.set()
+
+
+@pytest.mark.timeout(20)
+def test_local_sub_handler_swaps_dispatcher(tmp_path):
+    pub = f"ipc://{tmp_path}/pub"
+    uc = UFEedClient({PUBLISHER: pub, PUBLISHER_TOPIC: "swap", SUBSCRIBER: pub, SUBSCRIBER_TOPIC: "swap",
+                      REQUESTER: f"ipc://{tmp_path}/gw"})
+    first, second = _RecordingDispatcher(), _RecordingDispatcher()
+    threads = []
+
+    def handler(msg: Message):
+        threads.append(threading.current_thread())
+        # inline on the subscriber thread, then on the worker of the first dispatcher
+        if len(threads) == 1:
+            uc.set_sub_dispatcher(first)
+        elif len(threads) == 2:
+            uc.set_sub_dispatcher(second)
+
+    uc.start(sub_func=handler, req_func=lambda m: None)
+    try:
+        msg = uc.create_message().set_long_name("Test").set_type(MsgType.st_system).set_service_id(1)
+        while not first.shut_down.is_set() or len(threads) < 4:
+            uc.publish(msg)
+            time.sleep(0.01)
+        assert len(set(threads[:3])) == 3 and not second.shut_down.is_set()
+    finally:
+        uc.stop(do_not_send_logout=True)
+    assert second.shut_down.is_set()
+
+
+@pytest.mark.usefixtures('local_env_setup', scope='session')
+@pytest.mark.timeout(20)
+def test_local_session_token_injection():
+    uc = _local_env.ufeedclient
+    token = uuid.UUID("ed391284-bb68-4e14-a786-3eb0387694d9")
+    # reflected login carries the session token back
+    uc.request(_local_env.generate_logon().add_field(UFE_SESSION_TOKEN, token, Location.fl_system))
+    msg = uc.create_message().set_long_name("Test").set_type(MsgType.st_system).set_service_id(1).add_field(UFE_CMD, 1)
+    for i in range(3):
+        msg_rep = uc.request(msg)
+        assert len(msg.wire_message.fields) == 1
+        assert [f.tag for f in msg_rep.wire_message.fields] == [UFE_CMD, UFE_SESSION_TOKEN]
+        assert msg_rep[UFE_SESSION_TOKEN] == token
+    logout = uc.create_message().set_long_name("logout").set_type(MsgType.st_system).set_service_id(UFE_CMD_LOGOUT) \
+        .add_field(UFE_RESPONSE_CODE, Message.Status(LOGOFF_SUCCESSFUL))
+    assert uc.request(logout)[UFE_SESSION_TOKEN] == token
+    with pytest.raises(LookupError):
+        uc.request(msg)
+
+
+class _StallingGateway:
+    """Fake UFEGW requester endpoint: echoes requests except logins of user 'stall'"""
+    def __init__(self, endpoint: str):
+        self._ctx = zmq.Context.instance()
+        self._router = self._ctx.socket(zmq.ROUTER)
+        self._router.bind(endpoint)
+        self._stop = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop:
+            if not self._router.poll(50):
+                continue
+            frames = self._router.recv_multipart()
+            wm = WireMessage()
+            wm.ParseFromString(frames[-1])
+            if Message(wm)[UFE_LOGIN_ID] != "stall":
+                self._router.send_multipart(frames)
+
+    def close(self):
+        self._stop = True
+        self._thread.join()
+        self._router.close(linger=0)
+
+
+@pytest.mark.timeout(30)
+def test_local_request_timeout_cancel():
+    gw = _StallingGateway("tcp://127.0.0.1:55772")
+    uc = UFEedClient({PUBLISHER: "tcp://*:55771", SUBSCRIBER: "tcp://127.0.0.1:55771",
+                      REQUESTER: "tcp://127.0.0.1:55772", RESPONDER: "tcp://*:55773"}, request_timeout=0.2, echo_seq=True)
+    uc.start(sub_func=lambda m: None, req_func=lambda m: None)
+    login = lambda user: uc.create_message().set_service_id(UFE_CMD_LOGIN).add_field(UFE_LOGIN_ID, user)
+    try:
+        # synchronous request times out and the REQ socket is reset for the following requests
+        with pytest.raises(TimeoutError):
+            uc.request(login("stall"))
+        assert uc.request(login("user1"))[UFE_LOGIN_ID] == "user1"
+        assert uc.request(login("user2"), timeout=5)[UFE_LOGIN_ID] == "user2"
+
+        # a pipelined request in flight that times out or is cancelled resets the DEALER socket,
+        # requests in flight along with it fail and the following ones are not affected
+        stalled = uc.request_async(login("stall"))
+        abandoned = uc.request_async(login("stall"), timeout=10)
+        with pytest.raises(TimeoutError):
+            stalled.result(timeout=5)
+        with pytest.raises(ConnectionResetError):
+            abandoned.result(timeout=5)
+        assert uc.request_async(login("user3")).result(timeout=5)[UFE_LOGIN_ID] == "user3"
+        cancelled = uc.request_async(login("stall"), timeout=10)
+        assert cancelled.cancel()
+        assert uc.request_async(login("user4")).result(timeout=5)[UFE_LOGIN_ID] == "user4"
+        assert cancelled.cancelled() and uc.stats()["requests_in_flight"] == 0
+
+        # request pool uses the client default timeout and replaces timed out sockets
+        pool = uc.create_request_pool(2)
+        with pytest.raises(TimeoutError):
+            pool.request(login("stall"))
+        assert pool.request(login("user5"))[UFE_LOGIN_ID] == "user5"
+        assert pool.stats()["timeouts"] == 1 and pool.stats()["errors"] == 0
+    finally:
+        uc.stop(do_not_send_logout=True)
+        gw.close()
+
+
+class _ScriptedGateway:
+    """Fake UFEGW requester endpoint: collects the requests available within 20ms and replies to them as
+    reply(requests) returns, a list of (request envelope, serialized response) in sending order"""
+    def __init__(self, endpoint: str, reply: Callable[[List[tuple]], List[tuple]]):
+        self._ctx = zmq.Context.instance()
+        self._router = self._ctx.socket(zmq.ROUTER)
+        self._router.bind(endpoint)
+        self._reply = reply
+        self.batches: List[int] = []
+        self._stop = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop:
+            if not self._router.poll(50):
+                continue
+            requests = []
+            while self._router.poll(20):
+                frames = self._router.recv_multipart()
+                wm = WireMessage()
+                wm.ParseFromString(frames[-1])
+                requests.append((frames[:-1], wm))
+            self.batches.append(len(requests))
+            for envelope, data in self._reply(requests):
+                self._router.send_multipart(envelope + [data])
+
+    def close(self):
+        self._stop = True
+        self._thread.join()
+        _unbind(self._router)
+        self._router.close(linger=0)
+
+
+def _without_seq(wm: WireMessage) -> bytes:
+    wm.seq = 0
+    return wm.SerializeToString()
+
+
+@pytest.mark.timeout(30)
+def test_local_request_async_correlation(tmp_path):
+    login = lambda user: SysMessage.Builder().set_service_id(UFE_CMD_LOGIN).add_field(UFE_LOGIN_ID, user)
+    endpoint = f"ipc://{tmp_path}/gw"
+    conn_strs = {PUBLISHER: f"ipc://{tmp_path}/pub", SUBSCRIBER: f"ipc://{tmp_path}/pub", REQUESTER: endpoint}
+
+    # without echoed seq requests go one at a time, so responses in any order can not be misassigned
+    gw = _ScriptedGateway(endpoint, lambda reqs: [(env, _without_seq(wm)) for env, wm in reversed(reqs)])
+    uc = UFEedClient(conn_strs)
+    uc.start(sub_func=lambda m: None, req_func=lambda m: None)
+    try:
+        futs = [uc.request_async(login(f"user{i}"), timeout=5) for i in range(5)]
+        assert [fut.result()[UFE_LOGIN_ID] for fut in futs] == [f"user{i}" for i in range(5)]
+        assert set(gw.batches) == {1}
+    finally:
+        uc.stop(do_not_send_logout=True)
+        gw.close()
+
+    # echoed seq pipelines requests, responses are correlated in any order, unmatched and malformed ones discarded
+    def reply(reqs):
+        out = []
+        for env, wm in reversed(reqs):
+            user = Message(wm)[UFE_LOGIN_ID]
+            out.append((env, b"\xff\xff" if user == "malformed" else _without_seq(wm) if user == "unmatched"
+                        else wm.SerializeToString()))
+        return out
+
+    gw = _ScriptedGateway(endpoint, reply)
+    uc = UFEedClient(conn_strs, echo_seq=True)
+    uc.start(sub_func=lambda m: None, req_func=lambda m: None)
+    try:
+        futs = [uc.request_async(login(f"user{i}"), timeout=5) for i in range(5)]
+        assert [fut.result()[UFE_LOGIN_ID] for fut in futs] == [f"user{i}" for i in range(5)]
+        assert max(gw.batches) > 1
+        for user in ("malformed", "unmatched"):
+            with pytest.raises(TimeoutError):
+                uc.request_async(login(user), timeout=0.3).result(timeout=5)
+        # the DEALER thread survives discarded responses
+        assert uc.request_async(login("user5"), timeout=5).result()[UFE_LOGIN_ID] == "user5"
+        assert uc.stats()["request_errors"] == 4  # 2 discarded responses, 2 timeouts
+    finally:
+        uc.stop(do_not_send_logout=True)
+        gw.close()
+
+
+@pytest.mark.timeout(30)
+def test_local_request_async_lost_response(tmp_path):
+    login = lambda user: SysMessage.Builder().set_service_id(UFE_CMD_LOGIN).add_field(UFE_LOGIN_ID, user)
+    # UFEGW like peer that does not echo seq and loses the response to user1
+    gw = _ScriptedGateway(f"ipc://{tmp_path}/gw", lambda reqs: [(env, _without_seq(wm)) for env, wm in reqs
+                                                                 if Message(wm)[UFE_LOGIN_ID] != "user1"])
+    uc = UFEedClient({PUBLISHER: f"ipc://{tmp_path}/pub", SUBSCRIBER: f"ipc://{tmp_path}/pub",
+                      REQUESTER: f"ipc://{tmp_path}/gw"})
+    uc.start(sub_func=lambda m: None, req_func=lambda m: None)
+    try:
+        # requests wait for the one in flight, timeouts count from submission
+        futs = [uc.request_async(login(f"user{i}"), timeout=0.3 if i == 1 else 5) for i in range(5)]
+        with pytest.raises(TimeoutError):
+            futs[1].result(timeout=5)
+        # the lost response neither shifts later responses nor leaves the timed out request pending
+        assert [futs[i].result(timeout=5)[UFE_LOGIN_ID] for i in (0, 2, 3, 4)] == ["user0", "user2", "user3", "user4"]
+        assert uc.stats()["requests_in_flight"] == 0
+    finally:
+        uc.stop(do_not_send_logout=True)
+        gw.close()
+
+
+@pytest.mark.timeout(20)
+def test_local_fast_stop():
+    conn_strs = {PUBLISHER: "tcp://*:55774", SUBSCRIBER: "tcp://127.0.0.1:55774",
+                 REQUESTER: "tcp://127.0.0.1:55775", RESPONDER: "tcp://*:55775"}
+    for _ in range(3):
+        uc = UFEedClient(conn_strs)
+        uc.start(sub_func=lambda msg: None, req_func=lambda msg: None, rep_func=lambda msg: msg)
+        start = time.perf_counter()
+        uc.stop(do_not_send_logout=True)
+        # worker threads are woken through inproc control sockets, endpoints are released on return
+        assert time.perf_counter() - start < 0.5
+
+
+@pytest.mark.usefixtures('local_env_setup', scope='session')
+@pytest.mark.timeout(20)
+def test_local_tracing():
+    uc = _local_env.ufeedclient
+    tracer.reset()
+    uc.request(_local_env.generate_logon())
+    assert tracer.stats() == {}
+    tracer.configure(Tracer.STATS, sample_rate=2)
+    try:
+        for _ in range(4):
+            uc.request(_local_env.generate_logon())
+        uc.request_async(_local_env.generate_logon()).result(5)
+        stats = tracer.stats()
+        assert stats["UFEedClient.request"]["calls"] == 4 and stats["UFEedClient.request"]["sampled"] == 2
+        assert stats["UFEedClient.request.round_trip"]["sampled"] == 2
+        assert 0 < stats["UFEedClient.request.round_trip"]["min_ns"] <= stats["UFEedClient.request"]["max_ns"]
+        assert stats["UFEedClient.request_async.round_trip"]["calls"] == 1
+        assert "UFEedClient.request.round_trip" in tracer.report()
+        with pytest.raises(ValueError):
+            tracer.configure("verbose")
+    finally:
+        tracer.configure(Tracer.OFF, sample_rate=1)
+        tracer.reset()
+
+
+@pytest.mark.usefixtures('local_env_setup', scope='session')
+@pytest.mark.timeout(20)
+def test_local_tracing_log(caplog):
+    uc = _local_env.ufeedclient
+    tracer.configure(Tracer.LOG, sample_rate=2)
+    try:
+        with caplog.at_level(logging.INFO, logger="UPA"):
+            for _ in range(2):
+                uc.request(_local_env.generate_logon())
+        # unsampled calls are logged too
+        assert [r.getMessage() for r in caplog.records].count("UFEedClient.request START") == 2
+        assert tracer.stats()["UFEedClient.request"]["sampled"] == 1
+    finally:
+        tracer.configure(Tracer.OFF, sample_rate=1)
+        tracer.reset()
+
+
+@pytest.mark.usefixtures('local_env_setup', scope='session')
+@pytest.mark.timeout(20)
+def test_local_stats():
+    uc = _local_env.ufeedclient
+    uc.stats(reset=True)
+    for _ in range(3):
+        uc.request(_local_env.generate_logon())
+    uc.request_async(_local_env.generate_logon()).result(5)
+    _local_env.captured_messages.clear()
+    while not _local_env.captured_messages:
+        uc.publish(uc.create_message().set_long_name("Test").set_type(MsgType.st_system))
+        time.sleep(0.01)
+    stats = uc.stats()
+    assert stats["requests_sent"] == 4 and stats["replies_received"] == 4 and stats["request_errors"] == 0
+    assert stats["request_rtt_ns"]["count"] == 4
+    assert 0 < stats["request_rtt_ns"]["min"] <= stats["request_rtt_ns"]["p50"] <= stats["request_rtt_ns"]["max"]
+    assert stats["messages_published"] >= stats["broadcasts_received"] >= 1
+    assert stats["parse_ns"]["count"] >= 1 and stats["handler_ns"]["count"] >= 1
+    assert stats["bytes_in"] > 0 and stats["bytes_out"] > 0 and stats["requests_in_flight"] == 0
+
+    server = uc.start_metrics_server()
+    assert uc.start_metrics_server() is server
+    with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics", timeout=5) as rsp:
+        text = rsp.read().decode()
+    assert "ufeedclient_requests_sent_total 4" in text
+    assert 'ufeedclient_request_rtt_seconds{quantile="0.99"}' in text
+    assert "ufeedclient_request_rtt_seconds_count 4" in text
+
+
+def test_histogram():
+    hist = Histogram()
+    for value in range(1, 100001):
+        hist.record(value)
+    assert hist.count == 100000 and hist.min == 1 and hist.max == 100000
+    for q in (50, 90, 99, 99.9):
+        assert abs(hist.percentile(q) - 1000 * q) <= 0.07 * 1000 * q
+    assert hist.percentile(100) == 100000
+    hist.reset()
+    assert hist.snapshot()["p99"] == 0
+
+
+@pytest.mark.usefixtures('local_env_setup', scope='session')
+@pytest.mark.timeout(20)
+def test_local_router_responder():
+    uc = _local_env.ufeedclient
+
+    def slow_reflect(msg: Message) -> Message:
+        time.sleep(0.2)
+        return msg
+
+    uc.add_rep_handler(slow_reflect)
+    uc.set_rep_workers(8)
+    try:
+        msgs = [_local_env.generate_logon(user=f"user{i}") for i in range(8)]
+        start = time.perf_counter()
+        futs = [uc.request_async(msg, timeout=5) for msg in msgs]
+        assert [fut.result()[UFE_LOGIN_ID] for fut in futs] == [f"user{i}" for i in range(8)]
+        # requests are handled concurrently, one at a time would take 1.6s
+        assert time.perf_counter() - start < 1.0
+        assert uc.request(msgs[0], timeout=5)[UFE_LOGIN_ID] == "user0"
+    finally:
+        uc.remove_rep_handler(slow_reflect)
+        uc.set_rep_workers(0)
+    assert uc.request(msgs[1], timeout=5)[UFE_LOGIN_ID] == "user1"
+
+
+@pytest.mark.usefixtures('local_env_setup', scope='session')
+@pytest.mark.timeout(20)
+def test_local_capture_replay(tmp_path):
+    uc = _local_env.ufeedclient
+    capture = uc.start_capture(str(tmp_path))
+    msgs = [uc.create_message().set_long_name("Test").set_type(MsgType.st_system).set_seq(i) for i in range(1, 11)]
+    _local_env.captured_messages.clear()
+    # first X messages will be skipped due to subscription setup process
+    while not _local_env.captured_messages:
+        uc.publish(msgs[0])
+        time.sleep(0.01)
+    for msg in msgs[1:]:
+        uc.publish(msg)
+    while _local_env.captured_messages[-1].seq != 10:
+        time.sleep(0.01)
+    uc.stop_capture()
+    received = [msg.seq for msg in _local_env.captured_messages]
+    assert capture.records == len(received)
+
+    replayed = []
+    uc.add_sub_handler(replayed.append, long_name="Test")
+    try:
+        assert uc.replay_capture(str(tmp_path)) == capture.records
+    finally:
+        uc.remove_sub_handler(replayed.append)
+    assert [msg.seq for msg in replayed] == received
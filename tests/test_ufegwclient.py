@@ -470,6 +470,185 @@ def test_ufegw_service_dictionary():
         # todo: add comparison to FIX XML dict here
 
 
+class _DictionaryUFEedClient:
+    """Stub UFEedClient answering dictionary requests without UFEGW"""
+    def __init__(self, version: int):
+        self.version = version
+        self.requests = 0
+
+    def create_message(self) -> Message.Builder:
+        return SysMessage.Builder()
+
+    def request(self, msg: Message.Builder) -> Message:
+        self.requests += 1
+        rep = SysMessage.Builder() \
+            .add_field(UFE_RESPONSE_CODE, Message.Status(UFE_OK)) \
+            .add_field(UFE_SERVICE_FIX_VARIANT, "FIX50SP2") \
+            .add_field(UFE_SERVICE_FIX_DESC, "FIX 5.0 SP2") \
+            .add_field(UFE_SERVICE_VERSION, self.version)
+        records = Message.Builder.GroupRef()
+        rep.add_group(UFE_FIELD_DEFINITION_RECORDS, records)
+        fields = Message.Builder.GroupRef()
+        rep.add_group_item(records).add_group(UFE_FIELD_DEFINITION_RECORDS, fields, lambda m, grp:
+            m.add_group_item(grp).set_name("field_definition")
+                .add_field(UFE_FIX8_TAG, 54).add_field(UFE_FIX8_TAG_STRING, "Side"))
+        messages = Message.Builder.GroupRef()
+        rep.add_group_item(records).add_group(UFE_MESSAGE_DEFINITION_RECORDS, messages, lambda m, grp:
+            m.add_group_item(grp).set_name("message_definition")
+                .add_field(UFE_FIX8_TAG, "D").add_field(UFE_FIX8_TAG_STRING, "NewOrderSingle")
+                .add_group(UFE_MESSAGE_DEFINITION_RECORDS, Message.Builder.GroupRef(), lambda m1, grp1:
+                    m1.add_group_item(grp1).add_field(UFE_FIX8_TAG, 54).add_field(UFE_FIX8_FLAG, 1)))
+        return rep.build()
+
+
+def test_ufegw_service_dictionary_cache(tmp_path):
+    cache = UFEGWService.DictionaryCache(str(tmp_path))
+    uc = _DictionaryUFEedClient(version=1)
+    record = SysMessage.Builder().add_field(UFE_SERVICE_ID, 5).add_field(UFE_SUBSERVICE_ID, 0) \
+        .add_field(UFE_SERVICE_VERSION, 1).build()
+    service = UFEGWService(record, uc, "token", cache, "tcp://gw1:55746")
+    status, dic = service.dictionary()
+    assert status.status == UFE_OK and uc.requests == 1
+    assert dic.field_definitions[54].tag_string == "Side"
+    assert dic.message_definitions["D"].message_definition_records[54].flag == 1
+    assert service.dictionary()[1] is dic and uc.requests == 1
+
+    # dictionary is persisted as the serialized dictionary response
+    files = list(tmp_path.iterdir())
+    assert len(files) == 1 and files[0].name.endswith("-5-1.wm")
+    wm = WireMessage()
+    wm.ParseFromString(files[0].read_bytes())
+    assert Message(wm)[UFE_SERVICE_VERSION] == 1
+
+    # new process: dictionary rebuilt from disk
+    cache.clear()
+    status, dic1 = service.dictionary()
+    assert status.status == UFE_OK and uc.requests == 1
+    assert dic1 is not dic and dic1.field_definitions[54].tag_string == "Side"
+
+    # the same service of another UFEGW does not share the dictionary, neither in memory nor on disk
+    other = UFEGWService(record, uc, "token", cache, "tcp://gw2:55746")
+    other.dictionary()
+    assert uc.requests == 2 and len(list(tmp_path.iterdir())) == 2
+
+    # service version changed: dictionary requested again, stale version dropped
+    uc.version = 2
+    service.service_status.service_version = 2
+    status, dic2 = service.dictionary()
+    assert uc.requests == 3 and dic2.service_version == 2
+    assert sorted(f.name[-7:] for f in tmp_path.iterdir()) == ["-5-1.wm", "-5-2.wm"]
+    service.dictionary(force_refresh=True)
+    assert uc.requests == 4
+
+    # corrupted file is ignored
+    cache.clear()
+    for f in tmp_path.iterdir():
+        f.write_bytes(b"\xff\xff")
+    assert cache.get("tcp://gw1:55746", 5, 2) is None
+
+    # dictionary cache is per client, the default cache is left intact
+    client = UFEGWClient({REQUESTER: "tcp://gw1:55746"}, dictionary_cache_dir=str(tmp_path))
+    assert client._dictionary_cache.path == str(tmp_path) and UFEGWService.dictionary_cache.path is None
+
+
+class _SessionCacheUFEedClient:
+    """Stub UFEedClient answering send/recv and session cache requests without UFEGW"""
+    def __init__(self, last_seqnum: int):
+        self.last_seqnum = last_seqnum
+        self.pages = []
+
+    def create_message(self) -> Message.Builder:
+        return SysMessage.Builder()
+
+    def request(self, msg: Message.Builder) -> Message:
+        req = msg.build()
+        rep = SysMessage.Builder().add_field(UFE_RESPONSE_CODE, Message.Status(UFE_OK))
+        if req[UFE_CMD] == Message.Status(UFE_CMD_GET_SEND_RECV):
+            return rep.add_field(UFE_NEXT_FIX_SEND_SEQ, 1).add_field(UFE_NEXT_FIX_RECV_SEQ, self.last_seqnum + 1).build()
+        begin, end = req[UFE_CACHE_SEQUENCE_BEGIN], req[UFE_CACHE_SEQUENCE_END]
+        if begin < 1:
+            return SysMessage.Builder().add_field(UFE_RESPONSE_CODE, Message.Status(INVALID_SEQUENCE)).build()
+        self.pages.append((begin, end))
+        return rep.add_group(UFE_CACHE_MESSAGES, Message.Builder.GroupRef(), lambda m, grp:
+            [m.add_group_item(grp).add_field(COMMON_MSGSEQNUM, seq) for seq in range(begin, end + 1)]).build()
+
+
+def test_ufegw_service_iter_session_cache():
+    uc = _SessionCacheUFEedClient(last_seqnum=25)
+    record = SysMessage.Builder().add_field(UFE_SERVICE_ID, 9).add_field(UFE_SUBSERVICE_ID, 0).build()
+    service = UFEGWService(record, uc, session_token="token")
+    inbound = UFEGWService.SessionCacheDirection.INBOUND
+
+    msgs = service.iter_session_cache(inbound, page_size=10)
+    assert uc.pages == []
+    assert [m[COMMON_MSGSEQNUM] for m in msgs] == list(range(1, 26))
+    assert uc.pages == [(1, 10), (11, 20), (21, 25)]
+
+    uc.pages.clear()
+    assert [m[COMMON_MSGSEQNUM] for m in service.iter_session_cache(inbound, 5, 12, page_size=4)] == list(range(5, 13))
+    assert uc.pages == [(5, 8), (9, 12)]
+    assert list(service.iter_session_cache(UFEGWService.SessionCacheDirection.OUTBOUND)) == []
+
+    with pytest.raises(UFEGWService.SessionCacheError) as e:
+        next(service.iter_session_cache(inbound, begin_seqnum=0))
+    assert e.value.status.status == INVALID_SEQUENCE
+    with pytest.raises(ValueError):
+        next(service.iter_session_cache(inbound, page_size=0))
+
+
+def test_ufegw_recover_session_caches():
+    class PooledUFEedClient(_SessionCacheUFEedClient):
+        started = False
+
+        def __init__(self):
+            super().__init__(last_seqnum=0)
+            self.in_flight = self.max_in_flight = 0
+            self.lock = threading.Lock()
+            self.closed = False
+
+        def create_request_pool(self, size: int):
+            return self
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc_val, exc_tb):
+            self.closed = True
+
+        def request(self, msg: Message.Builder) -> Message:
+            with self.lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            service_id = msg.build().wire_message.service_id
+            sleep(0.01 * (service_id % 3))
+            with self.lock:
+                self.in_flight -= 1
+            if service_id == 4:
+                return SysMessage.Builder().add_field(UFE_RESPONSE_CODE, Message.Status(INVALID_SEQUENCE)).build()
+            if service_id == 6:
+                raise TimeoutError("no response")
+            return super().request(msg)
+
+    client = UFEGWClient()
+    uc = PooledUFEedClient()
+    client._uc, client._session_token = uc, "token"
+    services = [UFEGWService(SysMessage.Builder().add_field(UFE_SERVICE_ID, i).add_field(UFE_SUBSERVICE_ID, 0).build(),
+                             uc, "token") for i in range(1, 11)]
+    reports = []
+    status, results = client.recover_session_caches(UFEGWService.SessionCacheDirection.INBOUND, services,
+                                                    begin_seqnum=1, end_seqnum=3, max_in_flight=3,
+                                                    progress=lambda p: reports.append((p.completed_services, p.errors)))
+    assert status.status == UFE_OK
+    assert uc.max_in_flight == 3 and uc.closed
+    assert sorted(results) == [i * 1000000 for i in range(1, 11)]
+    assert results[4000000][0].status == INVALID_SEQUENCE and results[4000000][1] is None
+    # a failed request does not abort the recovery of the other services
+    assert results[6000000][0].status == UFE_SERVER_GONE and results[6000000][1] is None
+    assert isinstance(reports[-1][1][6000000], TimeoutError)
+    assert [m[COMMON_MSGSEQNUM] for m in results[5000000][1]] == [1, 2, 3]
+    assert [completed for completed, _ in reports] == list(range(1, 11))
+
+
 def create_invalid_service() -> UFEGWService:
     uc = _ufegw_env.ufegw_client.ufeed_client
     service_record: Message.Builder = uc.create_message().add_field(UFE_SERVICE_ID, 99).add_field(UFE_SUBSERVICE_ID, 888).add_field(
@@ -0,0 +1,139 @@
+# --------------------------------------------------------------------------------------------
+#    ____                      __      ____
+#   /\  _`\   __             /'_ `\   /\  _`\
+#   \ \ \L\_\/\_\    __  _  /\ \L\ \  \ \ \L\ \ _ __    ___
+#    \ \  _\/\/\ \  /\ \/'\ \/_> _ <_  \ \ ,__//\`'__\ / __`\
+#     \ \ \/  \ \ \ \/>  </   /\ \L\ \  \ \ \/ \ \ \/ /\ \L\ \
+#      \ \_\   \ \_\ /\_/\_\  \ \____/   \ \_\  \ \_\ \ \____/
+#       \/_/    \/_/ \//\/_/   \/___/     \/_/   \/_/  \/___/
+#
+#                     Universal FIX Engine
+#
+# Copyright (C) 2017-19 Fix8 Market Technologies Pty Ltd (ABN 29 167 027 198)
+# All Rights Reserved. [http://www.fix8mt.com] <heretohelp@fix8mt.com>
+#
+# THIS FILE IS PROPRIETARY AND  CONFIDENTIAL. NO PART OF THIS FILE MAY BE REPRODUCED,  STORED
+# IN A RETRIEVAL SYSTEM,  OR TRANSMITTED, IN ANY FORM OR ANY MEANS,  ELECTRONIC, PHOTOSTATIC,
+# RECORDED OR OTHERWISE, WITHOUT THE PRIOR AND  EXPRESS WRITTEN  PERMISSION  OF  FIX8  MARKET
+# TECHNOLOGIES PTY LTD.
+#
+# --------------------------------------------------------------------------------------------
+import queue
+import time
+
+import pytest
+
+from UPA.ufegwclient import *
+from UPA.ufegwmock import MockUFEGW
+
+
+@pytest.fixture
+def mock_gw(tmp_path):
+    endpoints = {name: f"ipc://{tmp_path}/{name}" for name in (SUBSCRIBER, REQUESTER, PUBLISHER, RESPONDER)}
+    broadcasts, published = queue.Queue(), queue.Queue()
+    gw = MockUFEGW(endpoints[SUBSCRIBER], endpoints[REQUESTER], client_publishers=[endpoints[PUBLISHER]],
+                   client_responder=endpoints[RESPONDER], users={"webuser": "pass"}, on_client_publish=published.put)
+    gw.start()
+    client = UFEGWClient(endpoints)
+    client.start(sub_func=broadcasts.put, req_func=lambda msg: None,
+                 rep_func=lambda msg: FIXMessage.Builder().set_long_name("ack").set_seq(msg.seq))
+    yield gw, client, broadcasts, published
+    client.stop()
+    gw.stop()
+
+
+def test_mock_gw_logon_status(mock_gw):
+    gw, client, _, _ = mock_gw
+    rep = gw.respond(SysMessage.Builder().add_field(UFE_CMD, Message.Status(UFE_CMD_SYSTEM_STATUS)).wire_message)
+    assert rep.build()[UFE_RESPONSE_CODE].status == NOT_LOGGED_IN
+    assert client.logon("webuser", "wrong")[0].status == INVALID_PASSWORD
+    assert client.logon("nobody", "pass")[0].status == UNKNOWN_USER
+    status, token = client.logon("webuser", "pass")
+    assert status.status == LOGIN_ACCEPTED and token is not None
+    status, system_status = client.system_status()
+    assert status.status == UFE_OK and system_status.instance_name == "ufegwmock" and system_status.total_sessions == 2
+    status, services = client.service_list()
+    assert status.status == UFE_OK and len(services) == 2
+    service = client.service(2, 0)
+    status, service_status = service.status(force_refresh=True)
+    assert status.status == UFE_OK and service_status.service_name == "MARKET_DATA"
+    assert service.start().status == INVALID_CMD
+    assert gw.stats()["sessions"] == 1
+    assert client.logout().status == LOGOFF_SUCCESSFUL
+    assert gw.stats()["sessions"] == 0
+
+
+def test_mock_gw_broadcast_session_cache(mock_gw):
+    gw, client, broadcasts, _ = mock_gw
+    client.logon("webuser", "pass")
+    client.service_list()
+    service = client.service(1, 0)
+    assert service.send_recv()[1].send_seqnum == 1
+    time.sleep(0.2)  # slow joiner
+    start = time.perf_counter()
+    gw.start_broadcast(rate=500, count=100).join()
+    assert time.perf_counter() - start > 0.18  # paced to 500 msg/s
+    received = [broadcasts.get(timeout=5) for _ in range(100)]
+    assert [msg.seq for msg in received] == list(range(1, 101))
+    assert received[0].long_name == "ExecutionReport" and received[0][COMMON_SYMBOL] in MockUFEGW.SYMBOLS
+    assert service.send_recv()[1].send_seqnum == 101
+    outbound = UFEGWService.SessionCacheDirection.OUTBOUND
+    cached = list(service.iter_session_cache(outbound, page_size=30))
+    assert [msg[COMMON_MSGSEQNUM] for msg in cached] == list(range(1, 101))
+    assert cached[41][COMMON_EXECID] == received[41][COMMON_EXECID]
+    assert list(service.iter_session_cache(UFEGWService.SessionCacheDirection.INBOUND)) == []
+    assert service.session_cache(3)[0].status == INVALID_DIRECTION
+    assert service.session_cache(outbound, begin_seqnum=0)[0].status == INVALID_SEQUENCE
+
+
+def test_mock_gw_client_publisher_responder(mock_gw):
+    gw, client, _, published = mock_gw
+    time.sleep(0.2)  # slow joiner
+    client.ufeed_client.publish(FIXMessage.Builder().set_long_name("NewOrderSingle").set_seq(7))
+    assert published.get(timeout=5).seq == 7
+    rep = gw.request_client(FIXMessage.Builder().set_long_name("ping").set_seq(9))
+    assert rep.long_name == "ack" and rep.seq == 9
+    assert gw.stats()["client_messages"] == 1
+
+
+@pytest.mark.parametrize("echo_seq", [False, True])
+def test_mock_gw_request_async(tmp_path, echo_seq):
+    endpoints = {name: f"ipc://{tmp_path}/{name}" for name in (SUBSCRIBER, REQUESTER, PUBLISHER, RESPONDER)}
+    services = [MockUFEGW.Service(service_id, f"S{service_id}") for service_id in range(1, 11)]
+    status = lambda service_id: SysMessage.Builder().set_service_id(service_id) \
+        .add_field(UFE_CMD, Message.Status(UFE_CMD_SERVICE_STATUS))
+    login = SysMessage.Builder().set_service_id(UFE_CMD_LOGIN).add_field(UFE_CMD, Message.Status(UFE_CMD_LOGIN))
+    with MockUFEGW(endpoints[SUBSCRIBER], endpoints[REQUESTER], services=services, echo_seq=echo_seq):
+        uc = UFEedClient(endpoints, echo_seq=echo_seq)
+        uc.start(sub_func=lambda msg: None, req_func=lambda msg: None)
+        try:
+            assert uc.request_async(login, timeout=5).result()[UFE_RESPONSE_CODE].status == LOGIN_ACCEPTED
+            futs = [uc.request_async(status(service_id), timeout=5) for service_id in range(1, 11)] * 3
+            assert [fut.result()[UFE_SERVICE_NAME] for fut in futs] == [f"S{i}" for i in range(1, 11)] * 3
+        finally:
+            uc.stop(do_not_send_logout=True)
+        if not echo_seq:
+            # responses of a gateway that does not echo seq match no pipelined request
+            uc = UFEedClient(endpoints, echo_seq=True)
+            uc.start(sub_func=lambda msg: None, req_func=lambda msg: None)
+            try:
+                with pytest.raises(TimeoutError):
+                    uc.request_async(login, timeout=0.3).result()
+                assert uc.stats()["request_errors"] == 2  # discarded response and timeout
+            finally:
+                uc.stop(do_not_send_logout=True)
+
+
+def test_mock_gw_recover_session_caches(mock_gw):
+    gw, client, broadcasts, _ = mock_gw
+    for service in gw.services.values():
+        service.next_send_seq = 10 * service.service_id + 1
+    client.logon("webuser", "pass")
+    client.service_list()
+    # the mock does not echo request seq, as the UFEGW
+    status, results = client.recover_session_caches(UFEGWService.SessionCacheDirection.OUTBOUND, max_in_flight=2)
+    assert status.status == UFE_OK
+    for service_id in (1, 2):
+        cached = results[service_id * 1000000][1]
+        assert [msg[COMMON_MSGSEQNUM] for msg in cached] == list(range(1, 10 * service_id + 1))
+        assert {msg.service_id for msg in cached} == {service_id}